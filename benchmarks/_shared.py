@@ -0,0 +1,45 @@
+"""
+Fixtures shared by the benchmark scripts.
+
+The scripts run as ``python benchmarks/<script>.py``, which puts this directory on
+``sys.path``, so they import this module as ``_shared``.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+KEYS: dict[str, Callable[[], Any]] = {
+    "ed25519": ed25519.Ed25519PrivateKey.generate,
+    "p256": lambda: ec.generate_private_key(ec.SECP256R1()),
+    "secp256k1": lambda: ec.generate_private_key(ec.SECP256K1()),
+    "rsa2048": lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "rsa3072": lambda: rsa.generate_private_key(public_exponent=65537, key_size=3072),
+    "rsa4096": lambda: rsa.generate_private_key(public_exponent=65537, key_size=4096),
+}
+"""Private key generators by algorithm name."""
+
+CHALLENGE: Any = {"challenge": "Y2hhbGxlbmdlLWZvci1iZW5jaG1hcmtpbmc", "challengeIdentifier": "ch-1"}
+"""User action challenge signed by the signer benchmarks."""
+
+
+class StaticSigner:
+    """Signer returning a fixed assertion, so only SDK overhead is measured."""
+
+    def sign(self, challenge: Any) -> dict[str, Any]:
+        return {"kind": "Key", "credentialAssertion": {"credId": "cr-1", "clientData": "x", "signature": "y"}}
+
+
+def generate_pem(algorithm: str) -> str:
+    """Return a fresh unencrypted PKCS#8 PEM private key of one of the KEYS algorithms."""
+    return (
+        KEYS[algorithm]()
+        .private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        .decode()
+    )
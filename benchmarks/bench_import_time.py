@@ -0,0 +1,218 @@
+"""
+Cold-start import time and memory benchmark.
+
+Each scenario runs in a fresh interpreter, so it measures what a short-lived worker or
+serverless handler pays on every cold start. The report covers:
+
+- the median wall time of several runs of each scenario;
+- the ``-X importtime`` breakdown of constructing a client, as the slowest modules and
+  the total self time per top-level package;
+- RSS and tracemalloc-traced memory after each scenario;
+- the size of the ``Literal`` unions of the generated types modules (e.g. the network
+  unions of ``wallets/types.py`` and the event kinds of ``webhooks/types.py``).
+
+With ``--budget`` the results are checked against a JSON budget file (see
+``import_budget.json``) and the script exits non-zero when any figure exceeds its
+budget, so it can guard against regressions in CI. ``--max-import-ms`` checks a
+plain ``import dfns_sdk`` alone.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs N] [--top N] [--budget FILE] [--json FILE]
+        [--max-import-ms MS]
+"""
+
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+SCENARIOS = {
+    "import dfns_sdk": "import dfns_sdk",
+    "construct DfnsClient": (
+        "from dfns_sdk import DfnsClient, DfnsClientConfig\nDfnsClient(DfnsClientConfig(auth_token='t'))"
+    ),
+    "first domain (wallets)": (
+        "from dfns_sdk import DfnsClient, DfnsClientConfig\nDfnsClient(DfnsClientConfig(auth_token='t')).wallets"
+    ),
+    "all domains": (
+        "from dfns_sdk import DfnsClient, DfnsClientConfig\n"
+        "import dfns_sdk.generated as g\n"
+        "c = DfnsClient(DfnsClientConfig(auth_token='t'))\n"
+        "[getattr(c, name) for name in ('address_watches', 'auth', 'keys', 'policies', 'signers', 'wallets')]\n"
+        "[getattr(g, name) for name in g.__all__]"
+    ),
+}
+
+TIMER = "import time\n_start = time.perf_counter()\n{code}\nprint((time.perf_counter() - _start) * 1000)\n"
+
+# tracemalloc is started before the scenario, so it traces everything the import allocates.
+MEMORY = """import json, sys, tracemalloc
+tracemalloc.start()
+def rss_kib():
+    try:
+        with open("/proc/self/statm") as statm:
+            import os
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+before = rss_kib()
+{code}
+current, peak = tracemalloc.get_traced_memory()
+after = rss_kib()
+print(json.dumps({{"rss_kib": after, "rss_growth_kib": after - before, "traced_kib": current // 1024,
+                  "traced_peak_kib": peak // 1024}}))
+"""
+
+GENERATED = Path(__file__).resolve().parent.parent / "dfns_sdk" / "generated"
+
+
+def _run(code: str) -> float:
+    result = subprocess.run([sys.executable, "-c", TIMER.format(code=code)], capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+def _memory(code: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-c", MEMORY.format(code=code)], capture_output=True, text=True, check=True
+    )
+    stats: dict[str, int] = json.loads(result.stdout)
+    return stats
+
+
+def _importtime(code: str) -> list[tuple[str, int, int]]:
+    """Return (module, self us, cumulative us) of every module imported by the code."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def _literal_unions(path: Path) -> list[tuple[str, int]]:
+    """Return (location, member count) of every Literal annotation in a module."""
+    unions = []
+    for node in ast.walk(ast.parse(path.read_text())):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for statement in node.body:
+            if not isinstance(statement, ast.AnnAssign) or not isinstance(statement.target, ast.Name):
+                continue
+            for sub in ast.walk(statement.annotation):
+                if isinstance(sub, ast.Subscript) and isinstance(sub.value, ast.Name) and sub.value.id == "Literal":
+                    size = len(sub.slice.elts) if isinstance(sub.slice, ast.Tuple) else 1
+                    unions.append((f"{node.name}.{statement.target.id}", size))
+    return unions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7, help="interpreter runs per scenario")
+    parser.add_argument("--top", type=int, default=15, help="slowest modules listed from -X importtime")
+    parser.add_argument("--budget", metavar="FILE", help="JSON budget file to check the results against")
+    parser.add_argument("--json", metavar="FILE", help="write the results as JSON")
+    parser.add_argument("--max-import-ms", type=float, default=None, help="budget for 'import dfns_sdk'")
+    args = parser.parse_args()
+
+    print("Wall time (median of fresh interpreters):")
+    medians = {}
+    for name, code in SCENARIOS.items():
+        medians[name] = statistics.median(_run(code) for _ in range(args.runs))
+        print(f"  {name:<24} {medians[name]:8.1f} ms")
+
+    print("\nMemory after each scenario:")
+    memory = {}
+    for name, code in SCENARIOS.items():
+        memory[name] = _memory(code)
+        stats = memory[name]
+        print(
+            f"  {name:<24} RSS {stats['rss_kib']:8d} KiB (+{stats['rss_growth_kib']} KiB)"
+            f"   traced {stats['traced_kib']:7d} KiB   traced peak {stats['traced_peak_kib']:7d} KiB"
+        )
+
+    modules = _importtime(SCENARIOS["construct DfnsClient"])
+    print(f"\nSlowest imports of 'construct DfnsClient' (-X importtime, top {args.top}):")
+    print(f"  {'module':<48} {'self ms':>8} {'cumulative ms':>14}")
+    for module, self_us, cumulative_us in sorted(modules, key=lambda entry: -entry[1])[: args.top]:
+        print(f"  {module:<48} {self_us / 1000:8.2f} {cumulative_us / 1000:14.2f}")
+    packages: dict[str, int] = {}
+    for module, self_us, _ in modules:
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    print(
+        "  self time per package:",
+        ", ".join(f"{p} {us / 1000:.1f} ms" for p, us in sorted(packages.items(), key=lambda entry: -entry[1])[:8]),
+    )
+
+    print("\nLiteral unions of the generated types modules:")
+    literals = {}
+    for path in sorted(GENERATED.glob("*/types.py")):
+        unions = _literal_unions(path)
+        if not unions:
+            continue
+        largest = max(unions, key=lambda entry: entry[1])
+        literals[path.parent.name] = {
+            "unions": len(unions),
+            "members": sum(size for _, size in unions),
+            "largest": largest[1],
+            "largest_at": largest[0],
+        }
+    for domain, stats in sorted(literals.items(), key=lambda entry: -entry[1]["members"]):
+        print(
+            f"  {domain:<16} {stats['unions']:4d} unions {stats['members']:6d} members"
+            f"   largest {stats['largest']:4d} ({stats['largest_at']})"
+        )
+
+    results: dict[str, Any] = {
+        "wall_ms": medians,
+        "memory": memory,
+        "import_self_ms": {package: us / 1000 for package, us in packages.items()},
+        "literals": literals,
+    }
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+
+    failures = []
+    if args.max_import_ms is not None and medians["import dfns_sdk"] > args.max_import_ms:
+        failures.append(f"import dfns_sdk takes {medians['import dfns_sdk']:.1f} ms (budget {args.max_import_ms} ms)")
+    if args.budget:
+        failures.extend(_check_budget(results, json.loads(Path(args.budget).read_text())))
+    for failure in failures:
+        print(f"over budget: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def _check_budget(results: dict[str, Any], budget: dict[str, Any]) -> list[str]:
+    """Compare the results with a budget file; return a description of every exceeded budget."""
+    failures = []
+    for scenario, limit in budget.get("wall_ms", {}).items():
+        value = results["wall_ms"][scenario]
+        if value > limit:
+            failures.append(f"{scenario} takes {value:.1f} ms (budget {limit} ms)")
+    for scenario, limits in budget.get("memory", {}).items():
+        for key, limit in limits.items():
+            value = results["memory"][scenario][key]
+            if value > limit:
+                failures.append(f"{scenario} {key} is {value} KiB (budget {limit} KiB)")
+    for domain, limits in budget.get("literals", {}).items():
+        for key, limit in limits.items():
+            value = results["literals"].get(domain, {}).get(key, 0)
+            if value > limit:
+                failures.append(f"{domain}/types.py Literal {key} is {value} (budget {limit})")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+KeySigner latency and throughput per key algorithm and size.
+
+For each algorithm a fresh key is generated and the same challenge is signed
+repeatedly. The report breaks ``KeySigner.sign`` down into:
+
+- the client data JSON encoding (``json.dumps``);
+- the raw signature (``KeySigner._sign_bytes``);
+- the base64url encoding of the client data and the signature.
+
+It also reports the full ``sign`` on one thread, and the full ``sign`` shared by
+``--threads`` threads. That second figure shows how far the algorithm scales
+before the GIL limits it; use PooledKeySigner beyond that (see
+bench_pooled_signer.py).
+
+Usage:
+    python benchmarks/bench_key_signer.py [--algorithms ed25519 p256 ...] [--signatures N]
+        [--threads N] [--json FILE]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import cryptography
+from _shared import CHALLENGE, KEYS, generate_pem
+
+from dfns_sdk.auth import KeySigner, base64url_encode
+
+
+def _latencies(call: Callable[[], Any], count: int) -> list[float]:
+    """Per-call wall times in seconds, after a short warm-up."""
+    for _ in range(min(count, 20)):
+        call()
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _stats(latencies: list[float]) -> dict[str, float]:
+    latencies = sorted(latencies)
+    return {
+        "p50_us": round(statistics.median(latencies) * 1e6, 2),
+        "p99_us": round(latencies[max(0, -(-len(latencies) * 99 // 100) - 1)] * 1e6, 2),
+        "per_second": round(len(latencies) / sum(latencies), 1),
+    }
+
+
+def _threaded_rate(sign: Callable[[Any], Any], count: int, threads: int) -> float:
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(sign, [CHALLENGE] * threads))
+        start = time.perf_counter()
+        list(pool.map(sign, [CHALLENGE] * count))
+        return round(count / (time.perf_counter() - start), 1)
+
+
+def _measure(algorithm: str, count: int, threads: int) -> dict[str, Any]:
+    signer = KeySigner("cr-bench", generate_pem(algorithm))
+    client_data = {"type": "key.get", "challenge": CHALLENGE["challenge"], "origin": signer.app_origin}
+    client_data_bytes = json.dumps(client_data, separators=(",", ":")).encode()
+    signature = signer._sign_bytes(client_data_bytes)
+
+    def encode() -> None:
+        base64url_encode(client_data_bytes)
+        base64url_encode(signature)
+
+    return {
+        "algorithm": algorithm,
+        "signature_bytes": len(signature),
+        "client_data_json": _stats(_latencies(lambda: json.dumps(client_data, separators=(",", ":")), count)),
+        "raw_signature": _stats(_latencies(lambda: signer._sign_bytes(client_data_bytes), count)),
+        "base64url": _stats(_latencies(encode, count)),
+        "sign": _stats(_latencies(lambda: signer.sign(CHALLENGE), count)),
+        "threads": threads,
+        "threaded_per_second": _threaded_rate(signer.sign, count, threads),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--algorithms", nargs="+", choices=list(KEYS), default=list(KEYS))
+    parser.add_argument("--signatures", type=int, default=500, help="signatures per measurement")
+    parser.add_argument("--threads", type=int, default=max(2, os.cpu_count() or 1))
+    parser.add_argument("--json", metavar="FILE", help="write the results as JSON")
+    args = parser.parse_args()
+
+    print(f"{args.signatures} signatures per measurement, {args.threads} threads ({os.cpu_count()} CPUs)")
+    print(
+        f"{'algorithm':<10} {'sig B':>5} {'json us':>8} {'raw p50 us':>11} {'raw p99 us':>11} {'b64 us':>7}"
+        f" {'sign p50 us':>12} {'sign/s':>9} {'threaded/s':>11} {'envelope':>9}"
+    )
+    results = []
+    for algorithm in args.algorithms:
+        row = _measure(algorithm, args.signatures, args.threads)
+        results.append(row)
+        sign, raw = row["sign"], row["raw_signature"]
+        envelope = 1 - raw["p50_us"] / sign["p50_us"]
+        print(
+            f"{algorithm:<10} {row['signature_bytes']:>5} {row['client_data_json']['p50_us']:>8.2f}"
+            f" {raw['p50_us']:>11.1f} {raw['p99_us']:>11.1f} {row['base64url']['p50_us']:>7.2f}"
+            f" {sign['p50_us']:>12.1f} {sign['per_second']:>9.1f} {row['threaded_per_second']:>11.1f} {envelope:>9.1%}"
+        )
+
+    if args.json:
+        environment = {
+            "python": platform.python_version(),
+            "cryptography": cryptography.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "signatures": args.signatures,
+        }
+        with open(args.json, "w") as file:
+            json.dump({"environment": environment, "results": results}, file, indent=2)
+            file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
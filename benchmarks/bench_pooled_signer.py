@@ -0,0 +1,52 @@
+"""
+Signatures per second of PooledKeySigner against KeySigner.
+
+A fresh key of the chosen algorithm is generated, then the same number of challenges
+is signed by a KeySigner on one thread, by a KeySigner shared by ``--workers``
+threads, and by a PooledKeySigner with ``--workers`` processes fed by as many threads.
+Gains from the pool require that many free CPU cores.
+
+Usage:
+    python benchmarks/bench_pooled_signer.py [--algorithm rsa4096] [--workers N] [--signatures N]
+"""
+
+import argparse
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from _shared import CHALLENGE, KEYS, generate_pem
+
+from dfns_sdk.auth import KeySigner, PooledKeySigner
+
+
+def _rate(sign: Callable[[Any], Any], signatures: int, threads: int) -> float:
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        # Warm up (starts pool workers and loads their keys).
+        list(pool.map(sign, [CHALLENGE] * threads))
+        start = time.perf_counter()
+        list(pool.map(sign, [CHALLENGE] * signatures))
+        return signatures / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--algorithm", choices=sorted(KEYS), default="rsa4096")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--signatures", type=int, default=500)
+    args = parser.parse_args()
+
+    pem = generate_pem(args.algorithm)
+    signer = KeySigner("cr-bench", pem)
+    print(f"{args.algorithm}, {args.signatures} signatures, {args.workers} workers ({os.cpu_count()} CPUs)")
+    print(f"{'KeySigner, 1 thread':<36} {_rate(signer.sign, args.signatures, 1):10.1f} sig/s")
+    print(f"{f'KeySigner, {args.workers} threads':<36} {_rate(signer.sign, args.signatures, args.workers):10.1f} sig/s")
+    with PooledKeySigner("cr-bench", pem, max_workers=args.workers) as pooled:
+        rate = _rate(pooled.sign, args.signatures, args.workers)
+        print(f"{f'PooledKeySigner, {args.workers} processes':<36} {rate:10.1f} sig/s")
+
+
+if __name__ == "__main__":
+    main()
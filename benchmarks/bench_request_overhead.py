@@ -0,0 +1,91 @@
+"""
+Per-call client overhead microbenchmark.
+
+Calls a few representative operations against an in-process ``httpx.MockTransport``,
+so the numbers isolate the SDK's own work (URL and header building, body encoding,
+response decoding) from the network. A bare httpx client on the same transport is
+measured as the floor.
+
+Usage:
+    python benchmarks/bench_request_overhead.py [--calls N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from _shared import StaticSigner
+
+from dfns_sdk import ConnectionConfig, DfnsClient, DfnsClientConfig
+
+BASE_URL = "https://api.test.dfns"
+WALLET = b'{"id":"wa-1","network":"Ethereum","status":"Active","address":"0x00"}'
+RESPONSES = {
+    "/auth/action/init": b'{"challengeIdentifier":"ch-1","challenge":"Y2g","allowCredentials":{"key":[]}}',
+    "/auth/action": b'{"userAction":"ua-token"}',
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    content = RESPONSES.get(request.url.path, WALLET)
+    return httpx.Response(200, content=content, headers={"Content-Type": "application/json"})
+
+
+def _measure(name: str, call: Callable[[], Any], calls: int) -> None:
+    for _ in range(min(calls, 1000)):
+        call()
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    for _ in range(1000):
+        call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_call = elapsed / calls * 1e6
+    allocated = max(peak - before, 0) / 1024
+    print(f"{name:<28} {per_call:9.1f} us/call   peak {allocated:8.1f} KiB / 1000 calls")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000, help="calls per scenario")
+    args = parser.parse_args()
+
+    transport = httpx.MockTransport(_handler)
+    raw = httpx.Client(base_url=BASE_URL, transport=transport)
+    client = DfnsClient(
+        DfnsClientConfig(
+            auth_token="token",
+            base_url=BASE_URL,
+            signer=StaticSigner(),  # type: ignore[arg-type]
+            connection=ConnectionConfig(transport=transport),
+        )
+    )
+    http = client._http
+
+    scenarios: dict[str, Callable[[], Any]] = {
+        "httpx (floor)": lambda: raw.get("/wallets/wa-1").json(),
+        "request() generic path": lambda: http.request("GET", "/wallets/{walletId}", path_params={"walletId": "wa-1"}),
+        "wallets.get_wallet": lambda: client.wallets.get_wallet("wa-1"),
+        "wallets.list_wallets": lambda: client.wallets.list_wallets({"limit": 10}),
+        "wallets.tag_wallet (signed)": lambda: client.wallets.tag_wallet("wa-1", {"tags": ["a", "b"]}),
+    }
+    for name, call in scenarios.items():
+        _measure(name, call, args.calls)
+
+    client.close()
+    raw.close()
+
+
+if __name__ == "__main__":
+    main()
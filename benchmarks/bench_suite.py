@@ -0,0 +1,310 @@
+"""
+Offline benchmark suite for the SDK transport, user action signing and pagination paths.
+
+Every scenario runs against an in-process ``httpx.MockTransport`` serving canned
+responses, so no network is involved and results are comparable between runs on
+the same machine. ``--latency-ms`` adds a simulated server latency, which makes the
+concurrency levels meaningful: sync clients are driven by that many threads, async
+clients by that many tasks on one event loop.
+
+Scenarios:
+    list_wallets      GET /wallets, one page
+    create_wallet     signed POST /wallets (challenge, signature and request calls)
+    submit_output     signed multipart POST /key-stores/{storeId}/onchain-sign/output
+    scan_wallets      iter_wallets over every page of a paginated listing
+
+Results are printed as a table and, with ``--json``, written as JSON. With
+``--baseline`` the run is compared with an earlier JSON file and the script exits
+non-zero when a scenario lost more than ``--tolerance`` of its throughput.
+
+Usage:
+    python benchmarks/bench_suite.py [--calls N] [--concurrency 1,8,32] [--latency-ms MS]
+        [--only SCENARIO ...] [--json FILE] [--baseline FILE] [--tolerance 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Any
+
+import httpx
+from _shared import StaticSigner
+
+from dfns_sdk import AsyncDfnsClient, ConnectionConfig, DfnsClient, DfnsClientConfig
+
+BASE_URL = "https://api.test.dfns"
+PAGE_SIZE = 100
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _wallet(index: int) -> dict[str, Any]:
+    return {
+        "id": f"wa-{index:08d}",
+        "network": "EthereumSepolia",
+        "status": "Active",
+        "address": f"0x{index:040x}",
+        "signingKey": {"id": f"key-{index:08d}", "scheme": "ECDSA", "curve": "secp256k1"},
+        "dateCreated": "2024-01-01T00:00:00.000Z",
+        "tags": [],
+    }
+
+
+def _pages(pages: int) -> dict[str | None, bytes]:
+    """Encoded pages of a wallet listing, keyed by the pagination token that requests them."""
+    encoded: dict[str | None, bytes] = {}
+    for page in range(pages):
+        body: dict[str, Any] = {"items": [_wallet(page * PAGE_SIZE + i) for i in range(PAGE_SIZE)]}
+        if page + 1 < pages:
+            body["nextPageToken"] = f"p{page + 1}"
+        encoded[f"p{page}" if page else None] = json.dumps(body).encode()
+    return encoded
+
+
+class _Api:
+    """Canned responses of the routes used by the scenarios."""
+
+    def __init__(self, pages: int):
+        self.pages = _pages(pages)
+        self.challenge = json.dumps(
+            {"challengeIdentifier": "ch-1", "challenge": "Y2hhbGxlbmdl", "allowCredentials": {"key": []}}
+        ).encode()
+        self.user_action = b'{"userAction":"ua-token"}'
+        self.wallet = json.dumps(_wallet(0)).encode()
+        self.output = b'{"id":"op-1","status":"Submitted"}'
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/auth/action/init":
+            content = self.challenge
+        elif path == "/auth/action":
+            content = self.user_action
+        elif path == "/wallets" and request.method == "GET":
+            content = self.pages.get(request.url.params.get("paginationToken"), self.pages[None])
+        elif path == "/wallets":
+            content = self.wallet
+        else:
+            content = self.output
+        return httpx.Response(200, content=content, headers=JSON_HEADERS)
+
+    def transport(self, latency: float) -> httpx.MockTransport:
+        if not latency:
+            return httpx.MockTransport(self.respond)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            time.sleep(latency)
+            return self.respond(request)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self, latency: float) -> httpx.MockTransport:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if latency:
+                await asyncio.sleep(latency)
+            return self.respond(request)
+
+        return httpx.MockTransport(handler)
+
+
+def _config(transport: httpx.MockTransport) -> DfnsClientConfig:
+    return DfnsClientConfig(
+        auth_token="token",
+        base_url=BASE_URL,
+        signer=StaticSigner(),  # type: ignore[arg-type]
+        connection=ConnectionConfig(transport=transport),
+    )
+
+
+def _sync_scenarios(client: DfnsClient, upload: bytes) -> dict[str, Callable[[], Any]]:
+    return {
+        "list_wallets": lambda: client.wallets.list_wallets({"limit": PAGE_SIZE}),
+        "create_wallet": lambda: client.wallets.create_wallet({"network": "EthereumSepolia"}),
+        "submit_output": lambda: client.signers.submit_onchain_sign_output("ks-1", {}, upload),
+        "scan_wallets": lambda: sum(1 for _ in client.wallets.iter_wallets(page_size=PAGE_SIZE)),
+    }
+
+
+def _async_scenarios(client: AsyncDfnsClient, upload: bytes) -> dict[str, Callable[[], Awaitable[Any]]]:
+    async def scan() -> int:
+        return sum([1 async for _ in client.wallets.aiter_wallets(page_size=PAGE_SIZE)])
+
+    return {
+        "list_wallets": lambda: client.wallets.list_wallets({"limit": PAGE_SIZE}),
+        "create_wallet": lambda: client.wallets.create_wallet({"network": "EthereumSepolia"}),
+        "submit_output": lambda: client.signers.submit_onchain_sign_output("ks-1", {}, upload),
+        "scan_wallets": scan,
+    }
+
+
+def _result(scenario: str, mode: str, concurrency: int, elapsed: float, latencies: list[float]) -> dict[str, Any]:
+    latencies.sort()
+    return {
+        "scenario": scenario,
+        "client": mode,
+        "concurrency": concurrency,
+        "calls": len(latencies),
+        "seconds": round(elapsed, 6),
+        "ops_per_second": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(statistics.median(latencies) * 1000, 4),
+        "p99_ms": round(latencies[max(0, -(-len(latencies) * 99 // 100) - 1)] * 1000, 4),
+    }
+
+
+def _run_sync(call: Callable[[], Any], calls: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def timed(_: int) -> None:
+        start = time.perf_counter()
+        call()
+        duration = time.perf_counter() - start
+        with lock:
+            latencies.append(duration)
+
+    for _ in range(min(calls, 50)):
+        call()
+    if concurrency == 1:
+        start = time.perf_counter()
+        for index in range(calls):
+            timed(index)
+        return time.perf_counter() - start, latencies
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        list(pool.map(timed, range(calls)))
+        return time.perf_counter() - start, latencies
+
+
+async def _run_async(call: Callable[[], Awaitable[Any]], calls: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    remaining = calls
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+    for _ in range(min(calls, 50)):
+        await call()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+def _calls(scenario: str, args: argparse.Namespace) -> int:
+    """Calls of a scenario; a pagination scan makes one request per page."""
+    if scenario == "scan_wallets":
+        return max(1, args.calls // args.pages)
+    return args.calls
+
+
+def _environment(args: argparse.Namespace) -> dict[str, Any]:
+    try:
+        version = metadata.version("dfns_sdk")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "dfns_sdk": version,
+        "httpx": httpx.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "latency_ms": args.latency_ms,
+        "pages": args.pages,
+        "upload_kib": args.upload_kib,
+    }
+
+
+def _compare(results: list[dict[str, Any]], baseline_path: str, tolerance: float) -> bool:
+    """Print throughput changes against a baseline; return False if any scenario regressed."""
+    with open(baseline_path) as file:
+        baseline = {
+            (row["scenario"], row["client"], row["concurrency"]): row["ops_per_second"]
+            for row in json.load(file)["results"]
+        }
+    ok = True
+    print(f"\nAgainst {baseline_path} (tolerance {tolerance:.0%}):")
+    for row in results:
+        before = baseline.get((row["scenario"], row["client"], row["concurrency"]))
+        if not before:
+            continue
+        change = row["ops_per_second"] / before - 1
+        regressed = change < -tolerance
+        ok = ok and not regressed
+        label = f"{row['scenario']} [{row['client']} x{row['concurrency']}]"
+        print(f"  {label:<36} {change:+8.1%}{'   REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000, help="calls per scenario and concurrency level")
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated concurrency levels")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated server latency per request")
+    parser.add_argument("--pages", type=int, default=10, help=f"pages of {PAGE_SIZE} wallets scanned by scan_wallets")
+    parser.add_argument("--upload-kib", type=int, default=64, help="file size uploaded by submit_output")
+    parser.add_argument("--only", nargs="+", metavar="SCENARIO", help="run only these scenarios")
+    parser.add_argument("--clients", default="sync,async", help="comma-separated client kinds to run")
+    parser.add_argument("--json", metavar="FILE", help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="JSON results of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="throughput loss reported as a regression")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    modes = args.clients.split(",")
+    latency = args.latency_ms / 1000
+    upload = os.urandom(args.upload_kib * 1024)
+    api = _Api(args.pages)
+    results: list[dict[str, Any]] = []
+
+    def report(row: dict[str, Any]) -> None:
+        results.append(row)
+        label = f"{row['scenario']} [{row['client']} x{row['concurrency']}]"
+        rate, p50, p99 = row["ops_per_second"], row["p50_ms"], row["p99_ms"]
+        print(f"{label:<36} {rate:10.1f} ops/s   p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+
+    if "sync" in modes:
+        with DfnsClient(_config(api.transport(latency))) as client:
+            for name, call in _sync_scenarios(client, upload).items():
+                if args.only and name not in args.only:
+                    continue
+                for level in levels:
+                    elapsed, latencies = _run_sync(call, _calls(name, args), level)
+                    report(_result(name, "sync", level, elapsed, latencies))
+
+    if "async" in modes:
+
+        async def run_async() -> None:
+            async with AsyncDfnsClient(_config(api.async_transport(latency))) as client:
+                for name, call in _async_scenarios(client, upload).items():
+                    if args.only and name not in args.only:
+                        continue
+                    for level in levels:
+                        elapsed, latencies = await _run_async(call, _calls(name, args), level)
+                        report(_result(name, "async", level, elapsed, latencies))
+
+        asyncio.run(run_async())
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump({"environment": _environment(args), "results": results}, file, indent=2)
+            file.write("\n")
+    if args.baseline and not _compare(results, args.baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,119 @@
 """Dfns Python SDK - Auto-generated from OpenAPI specification."""
 
-from .auth import KeySigner, Signer
-from .base_auth_api import (
-    BaseAuthApi,
-    SignUserActionChallengeRequest,
-    UserActionChallengeResponse,
+from typing import TYPE_CHECKING, Any
+
+from ._internal.lazy import load_attribute
+from .codec import JsonCodec, MsgspecCodec, OrjsonCodec, StdlibJsonCodec
+from .types import (
+    BatchResult,
+    ConnectionConfig,
+    DfnsClientConfig,
+    DfnsDelegatedClientConfig,
+    DfnsError,
+    PhaseTiming,
+    RequestEvent,
+    RequestHooks,
+    RetryPolicy,
 )
-from .client import DfnsClient
-from .delegated_client import DfnsDelegatedClient
-from .types import DfnsClientConfig, DfnsDelegatedClientConfig, DfnsError
+
+if TYPE_CHECKING:
+    from ._internal.metrics import MetricsCollector
+    from ._internal.timing import LatencyRecorder
+    from .async_client import AsyncDfnsClient
+    from .async_delegated_client import AsyncDfnsDelegatedClient
+    from .auth import AsyncSigner, KeySigner, PooledKeySigner, Signer
+    from .base_auth_api import (
+        AsyncBaseAuthApi,
+        BaseAuthApi,
+        PreparedAction,
+        SignUserActionChallengeRequest,
+        UserActionChallengeResponse,
+    )
+    from .cassette import RecordingTransport, ReplayTransport
+    from .challenge_store import (
+        InMemoryChallengeStore,
+        PendingChallenge,
+        PendingChallengeStore,
+        SQLiteChallengeStore,
+    )
+    from .client import DfnsClient
+    from .delegated_client import DfnsDelegatedClient
+    from .simulator import DfnsSimulator
+    from .tracing import OpenTelemetryTracing, Tracing
+
+# Clients and signers pull in httpx, cryptography and the generated domain modules,
+# so they are imported on first access rather than with the package.
+_EXPORTS = {
+    "DfnsClient": ".client",
+    "AsyncDfnsClient": ".async_client",
+    "DfnsDelegatedClient": ".delegated_client",
+    "AsyncDfnsDelegatedClient": ".async_delegated_client",
+    "Signer": ".auth",
+    "AsyncSigner": ".auth",
+    "KeySigner": ".auth",
+    "PooledKeySigner": ".auth",
+    "BaseAuthApi": ".base_auth_api",
+    "AsyncBaseAuthApi": ".base_auth_api",
+    "UserActionChallengeResponse": ".base_auth_api",
+    "PreparedAction": ".base_auth_api",
+    "SignUserActionChallengeRequest": ".base_auth_api",
+    "LatencyRecorder": "._internal.timing",
+    "MetricsCollector": "._internal.metrics",
+    "PendingChallenge": ".challenge_store",
+    "PendingChallengeStore": ".challenge_store",
+    "InMemoryChallengeStore": ".challenge_store",
+    "SQLiteChallengeStore": ".challenge_store",
+    "Tracing": ".tracing",
+    "OpenTelemetryTracing": ".tracing",
+    "DfnsSimulator": ".simulator",
+    "RecordingTransport": ".cassette",
+    "ReplayTransport": ".cassette",
+}
 
 __all__ = [
     "DfnsClient",
+    "AsyncDfnsClient",
     "DfnsDelegatedClient",
+    "AsyncDfnsDelegatedClient",
     "DfnsClientConfig",
     "DfnsDelegatedClientConfig",
+    "ConnectionConfig",
+    "RetryPolicy",
     "DfnsError",
+    "BatchResult",
+    "PhaseTiming",
+    "RequestEvent",
+    "RequestHooks",
+    "LatencyRecorder",
+    "MetricsCollector",
+    "Tracing",
+    "OpenTelemetryTracing",
     "Signer",
+    "AsyncSigner",
     "KeySigner",
+    "PooledKeySigner",
+    "JsonCodec",
+    "StdlibJsonCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
     "BaseAuthApi",
+    "AsyncBaseAuthApi",
     "UserActionChallengeResponse",
+    "PreparedAction",
     "SignUserActionChallengeRequest",
+    "PendingChallenge",
+    "PendingChallengeStore",
+    "InMemoryChallengeStore",
+    "SQLiteChallengeStore",
+    "DfnsSimulator",
+    "RecordingTransport",
+    "ReplayTransport",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
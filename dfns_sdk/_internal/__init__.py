@@ -1,5 +1,23 @@
 """Internal modules."""
 
-from .http_client import AsyncHttpClient, HttpClient
+from typing import TYPE_CHECKING, Any
+
+from .lazy import load_attribute
+
+if TYPE_CHECKING:
+    from .http_client import AsyncHttpClient, HttpClient
+
+_EXPORTS = {
+    "HttpClient": ".http_client",
+    "AsyncHttpClient": ".http_client",
+}
 
 __all__ = ["HttpClient", "AsyncHttpClient"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,121 @@
+"""Bounded-concurrency execution of operation batches."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+from dfns_sdk.types import BatchResult
+
+T = TypeVar("T")
+
+Arguments = Sequence[Any] | Mapping[str, Any]
+"""Positional (sequence) or keyword (mapping) arguments of a batched operation."""
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+
+def bind_init(operation: Callable[..., T], arguments: Arguments) -> Callable[[], T]:
+    """Bind the arguments of a delegated ``*_init`` call."""
+    if isinstance(arguments, Mapping):
+        return partial(operation, **arguments)
+    return partial(operation, *arguments)
+
+
+def bind_complete(
+    operation: Callable[..., Any], arguments: Arguments, signed_challenge: Any, prepared: Any = None
+) -> Callable[[], Any]:
+    """
+    Bind the ``*_complete`` call matching a delegated ``*_init`` call.
+
+    The completion is looked up by name on the same sub-client and takes the init
+    arguments followed by the signed challenge, and the init result as ``prepared`` when
+    given so the challenged payload is sent without encoding the body again. Without a
+    signed challenge (e.g. the challenge failed or was not signed) the bound call fails
+    with ValueError.
+
+    Raises:
+        ValueError: If ``operation`` is not a bound ``*_init`` method.
+    """
+    name = getattr(operation, "__name__", "")
+    owner = getattr(operation, "__self__", None)
+    if owner is None or not name.endswith("_init"):
+        raise ValueError(f"{name or operation!r} is not a delegated *_init method")
+    complete = getattr(owner, name.removesuffix("_init") + "_complete")
+    if signed_challenge is None:
+
+        def unsigned() -> Any:
+            raise ValueError(f"No signed challenge for {name}")
+
+        return unsigned
+    options = {} if prepared is None else {"prepared": prepared}
+    if isinstance(arguments, Mapping):
+        return partial(complete, **arguments, signed_challenge=signed_challenge, **options)
+    return partial(complete, *arguments, signed_challenge, **options)
+
+
+def run_batch(operations: Iterable[Callable[[], T]], max_concurrency: int) -> list[BatchResult[T]]:
+    """
+    Run operations on a pool of at most ``max_concurrency`` threads.
+
+    Each operation runs its whole chain (for a signed request: challenge, signature,
+    token exchange and request) on its own thread, so every phase of different
+    operations overlaps while the number of in-flight operations stays bounded.
+
+    Args:
+        operations: Zero-argument callables, e.g. ``functools.partial`` of client methods.
+        max_concurrency: Maximum number of operations running at once.
+
+    Returns:
+        One result per operation, in submission order. Exceptions are captured per item.
+    """
+    _check_concurrency(max_concurrency)
+    calls = list(operations)
+    results = [BatchResult[T](index) for index in range(len(calls))]
+    if not calls:
+        return results
+
+    def run(index: int) -> None:
+        try:
+            results[index].value = calls[index]()
+        except Exception as exc:
+            results[index].error = exc
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(calls)), thread_name_prefix="dfns-batch") as pool:
+        for _ in pool.map(run, range(len(calls))):
+            pass
+    return results
+
+
+async def arun_batch(
+    operations: Iterable[Callable[[], Awaitable[T]]],
+    max_concurrency: int,
+) -> list[BatchResult[T]]:
+    """
+    Run coroutine operations with at most ``max_concurrency`` in flight.
+
+    Args:
+        operations: Zero-argument callables returning awaitables.
+        max_concurrency: Maximum number of operations running at once.
+
+    Returns:
+        One result per operation, in submission order. Exceptions are captured per item.
+    """
+    _check_concurrency(max_concurrency)
+    calls = list(operations)
+    results = [BatchResult[T](index) for index in range(len(calls))]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(index: int) -> None:
+        async with semaphore:
+            try:
+                results[index].value = await calls[index]()
+            except Exception as exc:
+                results[index].error = exc
+
+    await asyncio.gather(*(run(index) for index in range(len(calls))))
+    return results
@@ -0,0 +1,99 @@
+"""Precompiled API endpoint descriptors."""
+
+import importlib
+import re
+from functools import lru_cache
+from typing import Any
+
+_PARAM = re.compile(r"\{(\w+)\}")
+
+
+class Endpoint:
+    """
+    Descriptor of one API operation, compiled once at import time.
+
+    Example:
+        >>> endpoint = Endpoint("webhooks.get_webhook", "GET", "/webhooks/{webhookId}")
+        >>> endpoint.resolve("wh-1")
+        '/webhooks/wh-1'
+    """
+
+    __slots__ = ("operation", "method", "path", "params", "requires_signature", "response_type", "_template")
+
+    def __init__(
+        self,
+        operation: str,
+        method: str,
+        path: str,
+        requires_signature: bool = False,
+        response_type: str | None = None,
+    ):
+        """
+        Initialize the endpoint.
+
+        Args:
+            operation: Operation name, ``<domain>.<method>`` (e.g. "wallets.transfer_asset").
+            method: HTTP method.
+            path: Path template (e.g. "/wallets/{walletId}/transfers").
+            requires_signature: Whether the operation requires user action signing.
+            response_type: Name of the response type in the domain's types module.
+        """
+        if not path.startswith("/") or path.startswith("//"):
+            raise ValueError("request path must be root-relative")
+        self.operation = operation
+        self.method = method
+        self.path = path
+        self.params = tuple(_PARAM.findall(path))
+        self.requires_signature = requires_signature
+        self.response_type = response_type
+        self._template = _PARAM.sub("{}", path) if self.params else None
+
+    def resolve(self, *args: Any) -> str:
+        """Substitute path parameter values, in template order, into the path."""
+        if self._template is None:
+            return self.path
+        return self._template.format(*args)
+
+    def path_args(self, path: str) -> tuple[str, ...] | None:
+        """Return the path parameter values of a resolved path, or None if it does not match the template."""
+        if self._template is None:
+            return () if path == self.path else None
+        match = _path_pattern(self.path).fullmatch(path)
+        return match.groups() if match else None
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.operation!r}, {self.method!r}, {self.path!r})"
+
+
+@lru_cache(maxsize=256)
+def _path_pattern(path: str) -> "re.Pattern[str]":
+    """Compile a regular expression matching the resolved paths of a path template."""
+    return re.compile(
+        "".join(re.escape(part) if i % 2 == 0 else "([^/]+)" for i, part in enumerate(_PARAM.split(path)))
+    )
+
+
+@lru_cache(maxsize=256)
+def find_endpoint(operation: str) -> Endpoint | None:
+    """Return the generated endpoint of an operation name (e.g. "wallets.transfer_asset"), if any."""
+    domain = operation.partition(".")[0]
+    if not domain.isidentifier():
+        return None
+    try:
+        module = importlib.import_module(f"dfns_sdk.generated.{domain}.endpoints")
+    except ImportError:
+        return None
+    for value in vars(module).values():
+        if isinstance(value, Endpoint) and value.operation == operation:
+            return value
+    return None
+
+
+@lru_cache(maxsize=512)
+def adhoc_endpoint(method: str, path: str, requires_signature: bool = False) -> Endpoint:
+    """Compile (and cache) an endpoint for a request made by method and path template."""
+    return Endpoint(f"{method} {path}", method, path, requires_signature)
+
+
+USER_ACTION_CHALLENGE = Endpoint("auth.create_user_action_challenge", "POST", "/auth/action/init")
+USER_ACTION_SIGNATURE = Endpoint("auth.create_user_action_signature", "POST", "/auth/action")
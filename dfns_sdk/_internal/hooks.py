@@ -0,0 +1,97 @@
+"""Dispatch of request lifecycle hooks."""
+
+import time
+from dataclasses import replace
+
+import httpx
+
+from dfns_sdk.types import RequestEvent, RequestHooks
+
+from .endpoint import Endpoint
+
+
+class ExchangeEvents:
+    """Builds the events of one HTTP exchange and passes them to the registered hooks."""
+
+    __slots__ = ("_hooks", "_event", "_start")
+
+    def __init__(self, hooks: RequestHooks, event: RequestEvent):
+        self._hooks = hooks
+        self._event = event
+        for callback in hooks.before_request:
+            callback(event)
+        self._start = time.perf_counter()
+
+    def response(self, response: httpx.Response, stream: bool) -> None:
+        """Report a received response (and an error, for HTTP error statuses)."""
+        if stream:
+            length = response.headers.get("Content-Length")
+            size = int(length) if length is not None else None
+        else:
+            size = len(response.content)
+        event = replace(
+            self._event,
+            status_code=response.status_code,
+            response_bytes=size,
+            duration=time.perf_counter() - self._start,
+        )
+        self._event = event
+        for callback in self._hooks.after_response:
+            callback(event)
+        if response.status_code >= 400:
+            for callback in self._hooks.on_error:
+                callback(event)
+
+    def error(self, error: BaseException) -> None:
+        """Report a transport error."""
+        self._event = replace(self._event, error=error, duration=time.perf_counter() - self._start)
+        for callback in self._hooks.on_error:
+            callback(self._event)
+
+    def retry(self, delay: float) -> None:
+        """Report that the exchange is about to be retried."""
+        event = replace(self._event, retry_delay=delay)
+        for callback in self._hooks.on_retry:
+            callback(event)
+
+
+class _NullEvents:
+    """Stand-in for ExchangeEvents when no hook is registered."""
+
+    __slots__ = ()
+
+    def response(self, response: httpx.Response, stream: bool) -> None:
+        return None
+
+    def error(self, error: BaseException) -> None:
+        return None
+
+    def retry(self, delay: float) -> None:
+        return None
+
+
+_NULL_EVENTS = _NullEvents()
+
+
+def observe_exchange(
+    hooks: RequestHooks,
+    request: httpx.Request,
+    endpoint: Endpoint,
+    operation: str,
+    phase: str,
+    attempt: int,
+) -> ExchangeEvents | _NullEvents:
+    """Start reporting an exchange, or return a shared no-op reporter if no hook is registered."""
+    if not hooks:
+        return _NULL_EVENTS
+    length = request.headers.get("Content-Length")
+    event = RequestEvent(
+        operation=operation,
+        method=request.method,
+        path=endpoint.path,
+        phase=phase,
+        attempt=attempt,
+        user_action=phase != "request" or "X-DFNS-USERACTION" in request.headers,
+        request_bytes=int(length) if length is not None else 0,
+    )
+    return ExchangeEvents(hooks, event)
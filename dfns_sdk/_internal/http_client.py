@@ -1,14 +1,26 @@
 """HTTP client for making API requests."""
 
+import asyncio
 import hashlib
-import json
-from collections.abc import Mapping
-from typing import Any, cast
+import time
+from collections.abc import AsyncIterator, Collection, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlencode, urlsplit, urlunsplit
 
 import httpx
 
-from dfns_sdk.types import DfnsClientConfig, DfnsDelegatedClientConfig, DfnsError
+from dfns_sdk.codec import StdlibJsonCodec
+from dfns_sdk.types import ConnectionConfig, DfnsClientConfig, DfnsDelegatedClientConfig, DfnsError
+
+from .endpoint import USER_ACTION_CHALLENGE, USER_ACTION_SIGNATURE, Endpoint, adhoc_endpoint
+from .hooks import observe_exchange
+from .retry import RetryRequest, is_idempotent, retry_delay
+from .streaming import JsonItemStream
+from .timing import cpu_timed, time_phase
+from .tracing import trace_exchange, trace_operation, trace_sign
+
+if TYPE_CHECKING:
+    from dfns_sdk.base_auth_api import PreparedAction
 
 
 def _normalize_base_url(base_url: str) -> str:
@@ -25,6 +37,37 @@ def _normalize_base_url(base_url: str) -> str:
     return urlunsplit((parsed.scheme, parsed.netloc, normalized_path, "", ""))
 
 
+def _client_options(connection: ConnectionConfig, asynchronous: bool) -> dict[str, Any]:
+    """Translate connection settings into httpx client keyword arguments."""
+    phase_timeouts = {
+        "connect": connection.connect_timeout,
+        "read": connection.read_timeout,
+        "write": connection.write_timeout,
+        "pool": connection.pool_timeout,
+    }
+    options: dict[str, Any] = {
+        "timeout": httpx.Timeout(
+            connection.timeout,
+            **{phase: value for phase, value in phase_timeouts.items() if value is not None},
+        ),
+        "limits": httpx.Limits(
+            max_connections=connection.max_connections,
+            max_keepalive_connections=connection.max_keepalive_connections,
+            keepalive_expiry=connection.keepalive_expiry,
+        ),
+        "http2": connection.http2,
+    }
+    if connection.transport is not None:
+        expected = httpx.AsyncBaseTransport if asynchronous else httpx.BaseTransport
+        if not isinstance(connection.transport, expected):
+            client, kind = ("AsyncDfnsClient", "an async") if asynchronous else ("DfnsClient", "a sync")
+            raise TypeError(
+                f"{client} requires {kind} transport (httpx.{expected.__name__}), got {connection.transport!r}"
+            )
+        options["transport"] = connection.transport
+    return options
+
+
 class HttpClient:
     """HTTP client for Dfns API requests."""
 
@@ -33,21 +76,36 @@ class HttpClient:
         self._base_url = _normalize_base_url(config.base_url)
         self._client = httpx.Client(
             base_url=self._base_url,
-            timeout=30.0,
+            **_client_options(config.connection, asynchronous=False),
         )
+        self._retry = config.retry
+        self.on_phase = config.on_phase
+        self.hooks = config.hooks
+        self.tracing = config.tracing
+        self._codec = config.json_codec or StdlibJsonCodec()
+        self._headers: dict[str, str] = {}
+        self._headers_token: str | None = None
 
     def _build_headers(self, user_action_token: str | None = None) -> dict[str, str]:
-        """Build request headers."""
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.config.auth_token}",
-            **self.config.headers,
-        }
+        """
+        Build request headers.
+
+        The static headers are built once and shared by every request (httpx copies them
+        into the request), and only rebuilt when the auth token is replaced. The returned
+        dict must not be mutated.
+        """
+        if self._headers_token != self.config.auth_token:
+            self._headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.config.auth_token}",
+                **self.config.headers,
+            }
+            self._headers_token = self.config.auth_token
 
         if user_action_token:
-            headers["X-DFNS-USERACTION"] = user_action_token
+            return {**self._headers, "X-DFNS-USERACTION": user_action_token}
 
-        return headers
+        return self._headers
 
     def _build_url(
         self,
@@ -59,11 +117,15 @@ class HttpClient:
         if not path.startswith("/") or path.startswith("//"):
             raise ValueError("request path must be root-relative")
 
-        url = f"{self._base_url}/{path.removeprefix('/')}"
-
         if path_params:
             for key, value in path_params.items():
-                url = url.replace(f"{{{key}}}", str(value))
+                path = path.replace(f"{{{key}}}", str(value))
+
+        return self._resolve_url(path, query_params)
+
+    def _resolve_url(self, path: str, query_params: Mapping[str, Any] | None = None) -> str:
+        """Build the full URL from a root-relative path with its parameters already substituted."""
+        url = self._base_url + path
 
         if query_params:
             filtered_params = {k: v for k, v in query_params.items() if v is not None}
@@ -76,14 +138,14 @@ class HttpClient:
         """Handle API response and raise errors if needed."""
         if response.status_code >= 400:
             try:
-                error_data = response.json()
+                error_data = self._codec.loads(response.content)
                 raise DfnsError(
                     message=error_data.get("message", "Unknown error"),
                     status_code=response.status_code,
                     error_code=error_data.get("error"),
                     details=error_data.get("details"),
                 )
-            except json.JSONDecodeError:
+            except ValueError:
                 raise DfnsError(
                     message=response.text or "Unknown error",
                     status_code=response.status_code,
@@ -92,13 +154,65 @@ class HttpClient:
         if response.status_code == 204 or not response.content:
             return None
 
-        return response.json()
+        return self._codec.loads(response.content)
+
+    def _exchange(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        *,
+        idempotent: bool,
+        attempt: int,
+        endpoint: Endpoint,
+        operation: str | None = None,
+        phase: str = "request",
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a single request, raising RetryRequest if the retry policy wants it repeated.
+
+        Once the policy gives up, the last response is returned (or the last transport
+        error re-raised) so the caller surfaces it as usual. With ``stream`` the response
+        body is left unread for the caller to consume and close. Each call is reported to
+        the ``on_phase`` hook as one attempt of ``phase``, to the request hooks and to tracing.
+        The request carries the endpoint's path template in its ``dfns_path_template``
+        extension, for transports that match requests by endpoint.
+        """
+        operation = operation or endpoint.operation
+        with time_phase(self.on_phase, operation, phase, attempt) as timer:
+            request = self._client.build_request(method=method, url=url, headers=headers, **kwargs)
+            request.extensions["dfns_path_template"] = endpoint.path
+            with trace_exchange(self.tracing, request, endpoint, operation, phase, attempt) as span:
+                events = observe_exchange(self.hooks, request, endpoint, operation, phase, attempt)
+                try:
+                    response = self._client.send(request, stream=stream)
+                except httpx.TransportError as exc:
+                    events.error(exc)
+                    delay = retry_delay(self._retry, attempt, idempotent=idempotent, error=exc)
+                    if delay is None:
+                        raise
+                    events.retry(delay)
+                    raise RetryRequest(delay) from exc
+                timer.status_code = response.status_code
+                events.response(response, stream)
+                span.response(response)
+
+                delay = retry_delay(self._retry, attempt, idempotent=idempotent, response=response)
+                if delay is not None:
+                    events.retry(delay)
+                    response.close()
+                    raise RetryRequest(delay)
+        return response
 
     def _get_user_action_token(
         self,
         method: str,
         path: str,
-        body: Any = None,
+        payload: str = "",
+        attempt: int = 1,
+        operation: str = "",
     ) -> str:
         """
         Get a user action token by creating and signing a challenge.
@@ -106,7 +220,9 @@ class HttpClient:
         Args:
             method: HTTP method.
             path: Request path.
-            body: Request body.
+            payload: The serialized request body, exactly as it is sent.
+            attempt: The attempt of the signed request this token is obtained for.
+            operation: The operation the token is for, as reported to the ``on_phase`` hook.
 
         Returns:
             The user action token to include in the request header.
@@ -121,25 +237,41 @@ class HttpClient:
                 status_code=None,
                 error_code="SIGNER_REQUIRED",
             )
+        if not hasattr(signer, "sign"):
+            raise DfnsError(
+                message="The configured signer only supports async signing. Use AsyncDfnsClient.",
+                status_code=None,
+                error_code="SIGNER_NOT_SYNC",
+            )
 
         # Step 1: Create user action challenge
         challenge_body = {
-            "userActionPayload": json.dumps(body, separators=(",", ":")) if body else "",
+            "userActionPayload": payload,
             "userActionHttpMethod": method,
             "userActionHttpPath": path,
             "userActionServerKind": "Api",
         }
 
-        challenge_response = self._client.request(
-            method="POST",
-            url=self._build_url("/auth/action/init"),
-            headers=self._build_headers(),
-            json=challenge_body,
+        # Creating and exchanging a challenge has no side effect on the target resource,
+        # so any transient failure restarts the whole chain from a fresh challenge.
+        challenge_response = self._exchange(
+            "POST",
+            self._resolve_url(USER_ACTION_CHALLENGE.path),
+            self._build_headers(),
+            idempotent=True,
+            attempt=attempt,
+            endpoint=USER_ACTION_CHALLENGE,
+            operation=operation,
+            phase="challenge",
+            content=self._codec.dumps(challenge_body),
         )
         challenge = self._handle_response(challenge_response)
 
-        # Step 2: Sign the challenge
-        assertion = signer.sign(challenge)
+        # Step 2: Sign the challenge. Signers that also provide ``asign``, such as PooledKeySigner,
+        # sign outside this thread, so its CPU time would not cover the signature.
+        in_thread = not hasattr(signer, "asign")
+        with time_phase(self.on_phase, operation, "sign", attempt, cpu=in_thread), trace_sign(self.tracing, operation):
+            assertion = signer.sign(challenge)
 
         # Step 3: Submit signed challenge to get user action token
         signature_body = {
@@ -147,11 +279,16 @@ class HttpClient:
             "firstFactor": assertion,
         }
 
-        signature_response = self._client.request(
-            method="POST",
-            url=self._build_url("/auth/action"),
-            headers=self._build_headers(),
-            json=signature_body,
+        signature_response = self._exchange(
+            "POST",
+            self._resolve_url(USER_ACTION_SIGNATURE.path),
+            self._build_headers(),
+            idempotent=True,
+            attempt=attempt,
+            endpoint=USER_ACTION_SIGNATURE,
+            operation=operation,
+            phase="signature",
+            content=self._codec.dumps(signature_body),
         )
         result = self._handle_response(signature_response)
 
@@ -167,52 +304,116 @@ class HttpClient:
         requires_signature: bool = False,
         file: bytes | None = None,
     ) -> Any:
-        """Make an HTTP request to the API."""
-        url = self._build_url(path, path_params, query_params)
+        """
+        Make an HTTP request to the API.
 
-        # Use the path with params substituted for signing
-        signing_path = path
+        Generic entry point taking a path template and a mapping of path parameters.
+        Generated clients call precompiled endpoints through call() instead.
+        """
+        endpoint = adhoc_endpoint(method, path, requires_signature)
         if path_params:
             for key, value in path_params.items():
-                signing_path = signing_path.replace(f"{{{key}}}", str(value))
+                path = path.replace(f"{{{key}}}", str(value))
+        return self._send(endpoint, path, query_params, body, file)
 
-        # Multipart upload: send the JSON body (plus the file checksum the API
-        # expects) as the "data" part and the bytes as the "file" part. The signed
-        # payload is the "data" object so it matches what is transmitted.
-        if file is not None:
-            data = dict(body) if body else {}
-            data["fileChecksum"] = hashlib.sha256(file).hexdigest()
-            user_action_token = None
-            if requires_signature:
-                user_action_token = self._get_user_action_token(method, signing_path, data)
-            # Let httpx set the multipart Content-Type (with boundary); the default
-            # JSON content type from _build_headers would otherwise mislabel the body.
-            headers = self._build_headers(user_action_token)
-            headers.pop("Content-Type", None)
-            response = self._client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data={"data": json.dumps(data, separators=(",", ":"))},
-                files={"file": ("upload.bin", file)},
-            )
-            return self._handle_response(response)
-
-        # Get user action token if required
-        user_action_token = None
-        if requires_signature:
-            user_action_token = self._get_user_action_token(method, signing_path, body)
+    def call(
+        self,
+        endpoint: Endpoint,
+        *path_args: Any,
+        query_params: Mapping[str, Any] | None = None,
+        body: Any = None,
+        file: bytes | None = None,
+        phase: str = "request",
+        operation: str | None = None,
+    ) -> Any:
+        """
+        Make an HTTP request to a precompiled endpoint.
 
-        headers = self._build_headers(user_action_token)
+        Args:
+            endpoint: The endpoint to call.
+            *path_args: Path parameter values, in the order they appear in the path.
+            query_params: Query parameters.
+            body: Request body.
+            file: File bytes, sent as a multipart upload.
+            phase: Phase name reported to the ``on_phase`` hook.
+            operation: Operation name reported to the ``on_phase`` hook (defaults to the endpoint's).
 
-        response = self._client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=body if body is not None else None,
-        )
+        Returns:
+            The API response.
+        """
+        return self._send(endpoint, endpoint.resolve(*path_args), query_params, body, file, phase, operation)
 
-        return self._handle_response(response)
+    def _send(
+        self,
+        endpoint: Endpoint,
+        path: str,
+        query_params: Mapping[str, Any] | None,
+        body: Any,
+        file: bytes | None,
+        phase: str = "request",
+        operation: str | None = None,
+    ) -> Any:
+        """Send a request to an endpoint whose path parameters are already substituted."""
+        method = endpoint.method
+        operation = operation or endpoint.operation
+        requires_signature = endpoint.requires_signature
+        url = self._resolve_url(path, query_params)
+
+        # The body is serialized exactly once: the same bytes are signed as the user
+        # action payload and sent on the wire, including on every retry.
+        content: bytes | None
+        send_kwargs: dict[str, Any]
+        if file is not None:
+            # Multipart upload: send the JSON body (plus the file checksum the API
+            # expects) as the "data" part and the bytes as the "file" part. The signed
+            # payload is the "data" object so it matches what is transmitted.
+            data = dict(body) if body else {}
+            data["fileChecksum"] = hashlib.sha256(file).hexdigest()
+            content = self._codec.dumps(data)
+            send_kwargs = {"data": {"data": content}, "files": {"file": ("upload.bin", file)}}
+        else:
+            content = self._codec.dumps(body) if body is not None else None
+            send_kwargs = {"content": content}
+
+        # Empty bodies are signed as an empty payload.
+        payload = ""
+        if requires_signature and content is not None and (body or file is not None):
+            payload = content.decode("utf-8")
+
+        # A signed request is retried as a whole: every attempt obtains a fresh user
+        # action token, since a token may already have been consumed by the server.
+        idempotent = is_idempotent(self._retry, method, requires_signature)
+        attempt = 1
+        with trace_operation(self.tracing, operation, endpoint, phase):
+            while True:
+                try:
+                    user_action_token = None
+                    if requires_signature:
+                        user_action_token = self._get_user_action_token(method, path, payload, attempt, operation)
+
+                    headers = self._build_headers(user_action_token)
+                    if file is not None:
+                        # Let httpx set the multipart Content-Type (with boundary); the default
+                        # JSON content type from _build_headers would otherwise mislabel the body.
+                        headers = {key: value for key, value in headers.items() if key != "Content-Type"}
+
+                    response = self._exchange(
+                        method,
+                        url,
+                        headers,
+                        idempotent=idempotent,
+                        attempt=attempt,
+                        endpoint=endpoint,
+                        operation=operation,
+                        phase=phase,
+                        **send_kwargs,
+                    )
+                except RetryRequest as retry:
+                    time.sleep(retry.delay)
+                    attempt += 1
+                    continue
+
+                return self._handle_response(response)
 
     def request_with_user_action(
         self,
@@ -222,6 +423,7 @@ class HttpClient:
         query_params: Mapping[str, Any] | None = None,
         body: Any = None,
         user_action: str = "",
+        content: bytes | None = None,
     ) -> Any:
         """
         Make an HTTP request with a pre-signed user action token.
@@ -235,21 +437,156 @@ class HttpClient:
             query_params: Query parameters.
             body: Request body.
             user_action: Pre-signed user action token.
+            content: Pre-serialized request body, sent as is instead of encoding ``body``.
+                Pass the exact bytes the user action payload was created from.
+
+        Returns:
+            The API response.
+        """
+        endpoint = adhoc_endpoint(method, path)
+        if path_params:
+            for key, value in path_params.items():
+                path = path.replace(f"{{{key}}}", str(value))
+        return self._send_with_user_action(endpoint, path, query_params, body, user_action, content)
+
+    def call_with_user_action(
+        self,
+        endpoint: Endpoint,
+        *path_args: Any,
+        query_params: Mapping[str, Any] | None = None,
+        body: Any = None,
+        user_action: str = "",
+        content: bytes | None = None,
+        prepared: "PreparedAction | None" = None,
+    ) -> Any:
+        """
+        Call a precompiled endpoint with a pre-signed user action token.
+
+        Args:
+            endpoint: The endpoint to call.
+            *path_args: Path parameter values, in the order they appear in the path.
+            query_params: Query parameters.
+            body: Request body.
+            user_action: Pre-signed user action token.
+            content: Pre-serialized request body, sent as is instead of encoding ``body``.
+            prepared: The delegated action this request completes; its payload is sent as is.
 
         Returns:
             The API response.
+
+        Raises:
+            ValueError: If ``prepared`` was created for another request.
         """
-        url = self._build_url(path, path_params, query_params)
+        path = endpoint.resolve(*path_args)
+        if prepared is not None:
+            content = prepared.content_for(endpoint.method, path)
+        return self._send_with_user_action(endpoint, path, query_params, body, user_action, content)
+
+    def _send_with_user_action(
+        self,
+        endpoint: Endpoint,
+        path: str,
+        query_params: Mapping[str, Any] | None,
+        body: Any,
+        user_action: str,
+        content: bytes | None,
+    ) -> Any:
+        """Send a request with a pre-signed user action token to a resolved endpoint path."""
+        method = endpoint.method
+        operation = endpoint.operation
+        url = self._resolve_url(path, query_params)
         headers = self._build_headers(user_action if user_action else None)
+        if content is None and body is not None:
+            content = self._codec.dumps(body)
+
+        # The token was signed externally and cannot be renewed here, so only failures that
+        # provably never reached the server are retried once a user action is attached.
+        idempotent = is_idempotent(self._retry, method, bool(user_action))
+        attempt = 1
+        with trace_operation(self.tracing, operation, endpoint):
+            while True:
+                try:
+                    response = self._exchange(
+                        method,
+                        url,
+                        headers,
+                        idempotent=idempotent,
+                        attempt=attempt,
+                        endpoint=endpoint,
+                        content=content,
+                    )
+                except RetryRequest as retry:
+                    time.sleep(retry.delay)
+                    attempt += 1
+                    continue
+
+                return self._handle_response(response)
+
+    def stream_items(
+        self,
+        endpoint: Endpoint,
+        *path_args: Any,
+        query_params: Mapping[str, Any] | None = None,
+        items_key: str = "items",
+        fields: Collection[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        """
+        Make an HTTP request and yield the elements of a JSON array field as they are decoded.
 
-        response = self._client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=body if body is not None else None,
-        )
+        The body is read incrementally, so memory stays proportional to one element
+        rather than the whole response.
+
+        Args:
+            endpoint: The endpoint to call.
+            *path_args: Path parameter values, in the order they appear in the path.
+            query_params: Query parameters.
+            items_key: Name of the top-level array field to stream.
+            fields: Keys to keep on each element (None keeps every key).
+            metadata: Optional dict receiving the other top-level fields (e.g. nextPageToken).
 
-        return self._handle_response(response)
+        Returns:
+            An iterator over the decoded elements.
+        """
+        method = endpoint.method
+        url = self._resolve_url(endpoint.resolve(*path_args), query_params)
+        headers = self._build_headers()
+        idempotent = is_idempotent(self._retry, method, False)
+        attempt = 1
+        while True:
+            try:
+                response = self._exchange(
+                    method,
+                    url,
+                    headers,
+                    idempotent=idempotent,
+                    attempt=attempt,
+                    endpoint=endpoint,
+                    stream=True,
+                )
+            except RetryRequest as retry:
+                time.sleep(retry.delay)
+                attempt += 1
+                continue
+            break
+
+        try:
+            if response.status_code >= 400:
+                response.read()
+                self._handle_response(response)
+            stream = JsonItemStream(items_key, fields)
+            for chunk in response.iter_text():
+                yield from stream.feed(chunk)
+            yield from stream.close()
+        finally:
+            response.close()
+
+        if metadata is not None:
+            metadata.update(stream.metadata)
+
+    def encode(self, body: Any) -> bytes:
+        """Serialize a request body with the configured JSON codec."""
+        return self._codec.dumps(body)
 
     def close(self) -> None:
         """Close the HTTP client."""
@@ -265,26 +602,41 @@ class HttpClient:
 class AsyncHttpClient:
     """Async HTTP client for Dfns API requests."""
 
-    def __init__(self, config: DfnsClientConfig):
+    def __init__(self, config: "DfnsClientConfig | DfnsDelegatedClientConfig"):
         self.config = config
         self._base_url = _normalize_base_url(config.base_url)
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
-            timeout=30.0,
+            **_client_options(config.connection, asynchronous=True),
         )
+        self._retry = config.retry
+        self.on_phase = config.on_phase
+        self.hooks = config.hooks
+        self.tracing = config.tracing
+        self._codec = config.json_codec or StdlibJsonCodec()
+        self._headers: dict[str, str] = {}
+        self._headers_token: str | None = None
 
     def _build_headers(self, user_action_token: str | None = None) -> dict[str, str]:
-        """Build request headers."""
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.config.auth_token}",
-            **self.config.headers,
-        }
+        """
+        Build request headers.
+
+        The static headers are built once and shared by every request (httpx copies them
+        into the request), and only rebuilt when the auth token is replaced. The returned
+        dict must not be mutated.
+        """
+        if self._headers_token != self.config.auth_token:
+            self._headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.config.auth_token}",
+                **self.config.headers,
+            }
+            self._headers_token = self.config.auth_token
 
         if user_action_token:
-            headers["X-DFNS-USERACTION"] = user_action_token
+            return {**self._headers, "X-DFNS-USERACTION": user_action_token}
 
-        return headers
+        return self._headers
 
     def _build_url(
         self,
@@ -296,11 +648,15 @@ class AsyncHttpClient:
         if not path.startswith("/") or path.startswith("//"):
             raise ValueError("request path must be root-relative")
 
-        url = f"{self._base_url}/{path.removeprefix('/')}"
-
         if path_params:
             for key, value in path_params.items():
-                url = url.replace(f"{{{key}}}", str(value))
+                path = path.replace(f"{{{key}}}", str(value))
+
+        return self._resolve_url(path, query_params)
+
+    def _resolve_url(self, path: str, query_params: Mapping[str, Any] | None = None) -> str:
+        """Build the full URL from a root-relative path with its parameters already substituted."""
+        url = self._base_url + path
 
         if query_params:
             filtered_params = {k: v for k, v in query_params.items() if v is not None}
@@ -313,14 +669,14 @@ class AsyncHttpClient:
         """Handle API response and raise errors if needed."""
         if response.status_code >= 400:
             try:
-                error_data = response.json()
+                error_data = self._codec.loads(response.content)
                 raise DfnsError(
                     message=error_data.get("message", "Unknown error"),
                     status_code=response.status_code,
                     error_code=error_data.get("error"),
                     details=error_data.get("details"),
                 )
-            except json.JSONDecodeError:
+            except ValueError:
                 raise DfnsError(
                     message=response.text or "Unknown error",
                     status_code=response.status_code,
@@ -329,13 +685,65 @@ class AsyncHttpClient:
         if response.status_code == 204 or not response.content:
             return None
 
-        return response.json()
+        return self._codec.loads(response.content)
+
+    async def _exchange(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        *,
+        idempotent: bool,
+        attempt: int,
+        endpoint: Endpoint,
+        operation: str | None = None,
+        phase: str = "request",
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a single request, raising RetryRequest if the retry policy wants it repeated.
+
+        Once the policy gives up, the last response is returned (or the last transport
+        error re-raised) so the caller surfaces it as usual. With ``stream`` the response
+        body is left unread for the caller to consume and close. Each call is reported to
+        the ``on_phase`` hook as one attempt of ``phase``, to the request hooks and to tracing.
+        The request carries the endpoint's path template in its ``dfns_path_template``
+        extension, for transports that match requests by endpoint.
+        """
+        operation = operation or endpoint.operation
+        with time_phase(self.on_phase, operation, phase, attempt) as timer:
+            request = self._client.build_request(method=method, url=url, headers=headers, **kwargs)
+            request.extensions["dfns_path_template"] = endpoint.path
+            with trace_exchange(self.tracing, request, endpoint, operation, phase, attempt) as span:
+                events = observe_exchange(self.hooks, request, endpoint, operation, phase, attempt)
+                try:
+                    response = await self._client.send(request, stream=stream)
+                except httpx.TransportError as exc:
+                    events.error(exc)
+                    delay = retry_delay(self._retry, attempt, idempotent=idempotent, error=exc)
+                    if delay is None:
+                        raise
+                    events.retry(delay)
+                    raise RetryRequest(delay) from exc
+                timer.status_code = response.status_code
+                events.response(response, stream)
+                span.response(response)
+
+                delay = retry_delay(self._retry, attempt, idempotent=idempotent, response=response)
+                if delay is not None:
+                    events.retry(delay)
+                    await response.aclose()
+                    raise RetryRequest(delay)
+        return response
 
     async def _get_user_action_token(
         self,
         method: str,
         path: str,
-        body: Any = None,
+        payload: str = "",
+        attempt: int = 1,
+        operation: str = "",
     ) -> str:
         """
         Get a user action token by creating and signing a challenge.
@@ -343,7 +751,9 @@ class AsyncHttpClient:
         Args:
             method: HTTP method.
             path: Request path.
-            body: Request body.
+            payload: The serialized request body, exactly as it is sent.
+            attempt: The attempt of the signed request this token is obtained for.
+            operation: The operation the token is for, as reported to the ``on_phase`` hook.
 
         Returns:
             The user action token to include in the request header.
@@ -361,22 +771,36 @@ class AsyncHttpClient:
 
         # Step 1: Create user action challenge
         challenge_body = {
-            "userActionPayload": json.dumps(body, separators=(",", ":")) if body else "",
+            "userActionPayload": payload,
             "userActionHttpMethod": method,
             "userActionHttpPath": path,
             "userActionServerKind": "Api",
         }
 
-        challenge_response = await self._client.request(
-            method="POST",
-            url=self._build_url("/auth/action/init"),
-            headers=self._build_headers(),
-            json=challenge_body,
+        # Creating and exchanging a challenge has no side effect on the target resource,
+        # so any transient failure restarts the whole chain from a fresh challenge.
+        challenge_response = await self._exchange(
+            "POST",
+            self._resolve_url(USER_ACTION_CHALLENGE.path),
+            self._build_headers(),
+            idempotent=True,
+            attempt=attempt,
+            endpoint=USER_ACTION_CHALLENGE,
+            operation=operation,
+            phase="challenge",
+            content=self._codec.dumps(challenge_body),
         )
         challenge = self._handle_response(challenge_response)
 
-        # Step 2: Sign the challenge
-        assertion = signer.sign(challenge)
+        # Step 2: Sign the challenge without blocking the event loop: await an AsyncSigner,
+        # otherwise run the sync signer on the loop's default executor.
+        asign = getattr(signer, "asign", None)
+        with time_phase(self.on_phase, operation, "sign", attempt) as timer, trace_sign(self.tracing, operation):
+            if asign is not None:
+                assertion = await asign(challenge)
+            else:
+                loop = asyncio.get_running_loop()
+                assertion, timer.cpu_time = await loop.run_in_executor(None, cpu_timed, signer.sign, challenge)
 
         # Step 3: Submit signed challenge to get user action token
         signature_body = {
@@ -384,11 +808,16 @@ class AsyncHttpClient:
             "firstFactor": assertion,
         }
 
-        signature_response = await self._client.request(
-            method="POST",
-            url=self._build_url("/auth/action"),
-            headers=self._build_headers(),
-            json=signature_body,
+        signature_response = await self._exchange(
+            "POST",
+            self._resolve_url(USER_ACTION_SIGNATURE.path),
+            self._build_headers(),
+            idempotent=True,
+            attempt=attempt,
+            endpoint=USER_ACTION_SIGNATURE,
+            operation=operation,
+            phase="signature",
+            content=self._codec.dumps(signature_body),
         )
         result = self._handle_response(signature_response)
 
@@ -404,52 +833,291 @@ class AsyncHttpClient:
         requires_signature: bool = False,
         file: bytes | None = None,
     ) -> Any:
-        """Make an async HTTP request to the API."""
-        url = self._build_url(path, path_params, query_params)
+        """
+        Make an async HTTP request to the API.
 
-        # Use the path with params substituted for signing
-        signing_path = path
+        Generic entry point taking a path template and a mapping of path parameters.
+        Generated clients call precompiled endpoints through call() instead.
+        """
+        endpoint = adhoc_endpoint(method, path, requires_signature)
         if path_params:
             for key, value in path_params.items():
-                signing_path = signing_path.replace(f"{{{key}}}", str(value))
+                path = path.replace(f"{{{key}}}", str(value))
+        return await self._send(endpoint, path, query_params, body, file)
+
+    async def call(
+        self,
+        endpoint: Endpoint,
+        *path_args: Any,
+        query_params: Mapping[str, Any] | None = None,
+        body: Any = None,
+        file: bytes | None = None,
+        phase: str = "request",
+        operation: str | None = None,
+    ) -> Any:
+        """
+        Make an async HTTP request to a precompiled endpoint.
+
+        Args:
+            endpoint: The endpoint to call.
+            *path_args: Path parameter values, in the order they appear in the path.
+            query_params: Query parameters.
+            body: Request body.
+            file: File bytes, sent as a multipart upload.
+            phase: Phase name reported to the ``on_phase`` hook.
+            operation: Operation name reported to the ``on_phase`` hook (defaults to the endpoint's).
+
+        Returns:
+            The API response.
+        """
+        return await self._send(endpoint, endpoint.resolve(*path_args), query_params, body, file, phase, operation)
 
-        # Multipart upload: send the JSON body (plus the file checksum the API
-        # expects) as the "data" part and the bytes as the "file" part. The signed
-        # payload is the "data" object so it matches what is transmitted.
+    async def _send(
+        self,
+        endpoint: Endpoint,
+        path: str,
+        query_params: Mapping[str, Any] | None,
+        body: Any,
+        file: bytes | None,
+        phase: str = "request",
+        operation: str | None = None,
+    ) -> Any:
+        """Send a request to an endpoint whose path parameters are already substituted."""
+        method = endpoint.method
+        operation = operation or endpoint.operation
+        requires_signature = endpoint.requires_signature
+        url = self._resolve_url(path, query_params)
+
+        # The body is serialized exactly once: the same bytes are signed as the user
+        # action payload and sent on the wire, including on every retry.
+        content: bytes | None
+        send_kwargs: dict[str, Any]
         if file is not None:
+            # Multipart upload: send the JSON body (plus the file checksum the API
+            # expects) as the "data" part and the bytes as the "file" part. The signed
+            # payload is the "data" object so it matches what is transmitted.
             data = dict(body) if body else {}
             data["fileChecksum"] = hashlib.sha256(file).hexdigest()
-            user_action_token = None
-            if requires_signature:
-                user_action_token = await self._get_user_action_token(method, signing_path, data)
-            # Let httpx set the multipart Content-Type (with boundary); the default
-            # JSON content type from _build_headers would otherwise mislabel the body.
-            headers = self._build_headers(user_action_token)
-            headers.pop("Content-Type", None)
-            response = await self._client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data={"data": json.dumps(data, separators=(",", ":"))},
-                files={"file": ("upload.bin", file)},
-            )
-            return self._handle_response(response)
+            content = self._codec.dumps(data)
+            send_kwargs = {"data": {"data": content}, "files": {"file": ("upload.bin", file)}}
+        else:
+            content = self._codec.dumps(body) if body is not None else None
+            send_kwargs = {"content": content}
+
+        # Empty bodies are signed as an empty payload.
+        payload = ""
+        if requires_signature and content is not None and (body or file is not None):
+            payload = content.decode("utf-8")
+
+        # A signed request is retried as a whole: every attempt obtains a fresh user
+        # action token, since a token may already have been consumed by the server.
+        idempotent = is_idempotent(self._retry, method, requires_signature)
+        attempt = 1
+        with trace_operation(self.tracing, operation, endpoint, phase):
+            while True:
+                try:
+                    user_action_token = None
+                    if requires_signature:
+                        user_action_token = await self._get_user_action_token(method, path, payload, attempt, operation)
+
+                    headers = self._build_headers(user_action_token)
+                    if file is not None:
+                        # Let httpx set the multipart Content-Type (with boundary); the default
+                        # JSON content type from _build_headers would otherwise mislabel the body.
+                        headers = {key: value for key, value in headers.items() if key != "Content-Type"}
+
+                    response = await self._exchange(
+                        method,
+                        url,
+                        headers,
+                        idempotent=idempotent,
+                        attempt=attempt,
+                        endpoint=endpoint,
+                        operation=operation,
+                        phase=phase,
+                        **send_kwargs,
+                    )
+                except RetryRequest as retry:
+                    await asyncio.sleep(retry.delay)
+                    attempt += 1
+                    continue
+
+                return self._handle_response(response)
+
+    async def request_with_user_action(
+        self,
+        method: str,
+        path: str,
+        path_params: Mapping[str, Any] | None = None,
+        query_params: Mapping[str, Any] | None = None,
+        body: Any = None,
+        user_action: str = "",
+        content: bytes | None = None,
+    ) -> Any:
+        """
+        Make an async HTTP request with a pre-signed user action token.
+
+        This method is used by delegated clients where signing is handled externally.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+            path_params: Path parameters to substitute.
+            query_params: Query parameters.
+            body: Request body.
+            user_action: Pre-signed user action token.
+            content: Pre-serialized request body, sent as is instead of encoding ``body``.
+                Pass the exact bytes the user action payload was created from.
 
-        # Get user action token if required
-        user_action_token = None
-        if requires_signature:
-            user_action_token = await self._get_user_action_token(method, signing_path, body)
+        Returns:
+            The API response.
+        """
+        endpoint = adhoc_endpoint(method, path)
+        if path_params:
+            for key, value in path_params.items():
+                path = path.replace(f"{{{key}}}", str(value))
+        return await self._send_with_user_action(endpoint, path, query_params, body, user_action, content)
 
-        headers = self._build_headers(user_action_token)
+    async def call_with_user_action(
+        self,
+        endpoint: Endpoint,
+        *path_args: Any,
+        query_params: Mapping[str, Any] | None = None,
+        body: Any = None,
+        user_action: str = "",
+        content: bytes | None = None,
+        prepared: "PreparedAction | None" = None,
+    ) -> Any:
+        """
+        Call a precompiled endpoint asynchronously with a pre-signed user action token.
 
-        response = await self._client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=body if body is not None else None,
-        )
+        Args:
+            endpoint: The endpoint to call.
+            *path_args: Path parameter values, in the order they appear in the path.
+            query_params: Query parameters.
+            body: Request body.
+            user_action: Pre-signed user action token.
+            content: Pre-serialized request body, sent as is instead of encoding ``body``.
+            prepared: The delegated action this request completes; its payload is sent as is.
 
-        return self._handle_response(response)
+        Returns:
+            The API response.
+
+        Raises:
+            ValueError: If ``prepared`` was created for another request.
+        """
+        path = endpoint.resolve(*path_args)
+        if prepared is not None:
+            content = prepared.content_for(endpoint.method, path)
+        return await self._send_with_user_action(endpoint, path, query_params, body, user_action, content)
+
+    async def _send_with_user_action(
+        self,
+        endpoint: Endpoint,
+        path: str,
+        query_params: Mapping[str, Any] | None,
+        body: Any,
+        user_action: str,
+        content: bytes | None,
+    ) -> Any:
+        """Send a request with a pre-signed user action token to a resolved endpoint path."""
+        method = endpoint.method
+        operation = endpoint.operation
+        url = self._resolve_url(path, query_params)
+        headers = self._build_headers(user_action if user_action else None)
+        if content is None and body is not None:
+            content = self._codec.dumps(body)
+
+        # The token was signed externally and cannot be renewed here, so only failures that
+        # provably never reached the server are retried once a user action is attached.
+        idempotent = is_idempotent(self._retry, method, bool(user_action))
+        attempt = 1
+        with trace_operation(self.tracing, operation, endpoint):
+            while True:
+                try:
+                    response = await self._exchange(
+                        method,
+                        url,
+                        headers,
+                        idempotent=idempotent,
+                        attempt=attempt,
+                        endpoint=endpoint,
+                        content=content,
+                    )
+                except RetryRequest as retry:
+                    await asyncio.sleep(retry.delay)
+                    attempt += 1
+                    continue
+
+                return self._handle_response(response)
+
+    async def stream_items(
+        self,
+        endpoint: Endpoint,
+        *path_args: Any,
+        query_params: Mapping[str, Any] | None = None,
+        items_key: str = "items",
+        fields: Collection[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Make an async HTTP request and yield the elements of a JSON array field as they are decoded.
+
+        The body is read incrementally, so memory stays proportional to one element
+        rather than the whole response.
+
+        Args:
+            endpoint: The endpoint to call.
+            *path_args: Path parameter values, in the order they appear in the path.
+            query_params: Query parameters.
+            items_key: Name of the top-level array field to stream.
+            fields: Keys to keep on each element (None keeps every key).
+            metadata: Optional dict receiving the other top-level fields (e.g. nextPageToken).
+
+        Returns:
+            An async iterator over the decoded elements.
+        """
+        method = endpoint.method
+        url = self._resolve_url(endpoint.resolve(*path_args), query_params)
+        headers = self._build_headers()
+        idempotent = is_idempotent(self._retry, method, False)
+        attempt = 1
+        while True:
+            try:
+                response = await self._exchange(
+                    method,
+                    url,
+                    headers,
+                    idempotent=idempotent,
+                    attempt=attempt,
+                    endpoint=endpoint,
+                    stream=True,
+                )
+            except RetryRequest as retry:
+                await asyncio.sleep(retry.delay)
+                attempt += 1
+                continue
+            break
+
+        try:
+            if response.status_code >= 400:
+                await response.aread()
+                self._handle_response(response)
+            stream = JsonItemStream(items_key, fields)
+            async for chunk in response.aiter_text():
+                for item in stream.feed(chunk):
+                    yield item
+            for item in stream.close():
+                yield item
+        finally:
+            await response.aclose()
+
+        if metadata is not None:
+            metadata.update(stream.metadata)
+
+    def encode(self, body: Any) -> bytes:
+        """Serialize a request body with the configured JSON codec."""
+        return self._codec.dumps(body)
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -0,0 +1,79 @@
+"""Lazy loading of domain modules and clients."""
+
+import importlib
+from collections.abc import Mapping
+from typing import Any, Generic, TypeVar, overload
+
+T = TypeVar("T")
+
+
+def load_attribute(package: str, exports: Mapping[str, str], name: str, namespace: dict[str, Any]) -> Any:
+    """
+    Import a lazily exported attribute of a package (PEP 562 ``__getattr__``).
+
+    The value is cached in the package namespace, so the import only happens once.
+
+    Args:
+        package: Name of the package being accessed.
+        exports: Maps each exported name to the relative module defining it. A name
+            mapped to the module of the same name (``"types": ".types"``) exports the
+            module itself.
+        name: The attribute being accessed.
+        namespace: The package's ``globals()``.
+
+    Returns:
+        The exported value.
+
+    Raises:
+        AttributeError: If the package does not export ``name``.
+    """
+    module_name = exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, package)
+    value = module if module_name == f".{name}" else getattr(module, name)
+    namespace[name] = value
+    return value
+
+
+class SubClient(Generic[T]):
+    """
+    Descriptor constructing a domain client on first access.
+
+    The domain module is imported, and the client built around the owner's ``_http``
+    transport, the first time the attribute is read. The client is then stored in the
+    instance ``__dict__``, so later reads are plain attribute lookups.
+
+    Example:
+        >>> class Client:
+        ...     wallets: SubClient["WalletsClient"] = SubClient("dfns_sdk.generated.wallets.client", "WalletsClient")
+    """
+
+    def __init__(self, module: str, name: str):
+        """
+        Initialize the descriptor.
+
+        Args:
+            module: Absolute name of the module defining the client class.
+            name: Name of the client class.
+        """
+        self._module = module
+        self._name = name
+        self._attr = name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "SubClient[T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> T: ...
+
+    def __get__(self, instance: object | None, owner: type) -> "T | SubClient[T]":
+        if instance is None:
+            return self
+        client_class = getattr(importlib.import_module(self._module), self._name)
+        client: T = client_class(instance._http)  # type: ignore[attr-defined]
+        instance.__dict__[self._attr] = client
+        return client
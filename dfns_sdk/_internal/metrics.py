@@ -0,0 +1,241 @@
+"""Per-operation request metrics with Prometheus text exposition."""
+
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+
+from dfns_sdk.types import RequestEvent, RequestHooks
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+"""Default latency histogram bucket bounds in seconds (the Prometheus client defaults)."""
+
+
+def _status_class(event: RequestEvent) -> str:
+    """Status class label of an exchange: "2xx", "4xx", ... or "error" for transport errors."""
+    if event.status_code is None:
+        return "error"
+    return f"{event.status_code // 100}xx"
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsCollector:
+    """
+    Collects latency histograms and request, error, retry and byte counters of every HTTP exchange.
+
+    Series are keyed by operation (e.g. ``wallets.transfer_asset``) and phase ("challenge",
+    "signature" or "request"), so the user action sub-calls of a signed operation are kept
+    apart from the request itself; request counts are further split by status class.
+    Histograms have fixed buckets, so memory only grows with the number of operations used.
+
+    Install the collector on the request hooks of a client configuration and export with
+    ``prometheus()`` or read ``snapshot()`` at runtime.
+
+    Example:
+        >>> from dfns_sdk import DfnsClientConfig, MetricsCollector
+        >>> metrics = MetricsCollector()
+        >>> config = DfnsClientConfig(auth_token="your-token")
+        >>> metrics.install(config.hooks)
+        >>> ...
+        >>> metrics.snapshot()["wallets.list_wallets"]["request"]["p99"]
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        percentiles: tuple[float, ...] = (50, 90, 99),
+        namespace: str = "dfns_sdk",
+    ):
+        """
+        Initialize the collector.
+
+        Args:
+            buckets: Upper bounds in seconds of the latency histogram buckets.
+            percentiles: Percentiles estimated by snapshot(), e.g. 99 as "p99".
+            namespace: Prefix of the exported metric names.
+
+        Raises:
+            ValueError: If buckets are empty or not increasing, or a percentile is outside (0, 100].
+        """
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError("buckets must be a non-empty increasing sequence")
+        if any(not 0 < percent <= 100 for percent in percentiles):
+            raise ValueError("percentiles must be in (0, 100]")
+        self._buckets = tuple(buckets)
+        self._bounds = [repr(float(bound)) for bound in buckets]
+        self._percentiles = percentiles
+        self._namespace = namespace
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], _Series] = {}
+
+    def install(self, hooks: RequestHooks) -> None:
+        """
+        Register the collector on request hooks.
+
+        Args:
+            hooks: The hooks of a client configuration.
+        """
+        hooks.register("after_response", self._on_response)
+        hooks.register("on_error", self._on_error)
+        hooks.register("on_retry", self._on_retry)
+
+    def _get(self, event: RequestEvent) -> "_Series":
+        key = (event.operation, event.phase)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(len(self._buckets))
+        return series
+
+    def _observe(self, event: RequestEvent) -> None:
+        series = self._get(event)
+        status_class = _status_class(event)
+        series.requests[status_class] = series.requests.get(status_class, 0) + 1
+        series.request_bytes += event.request_bytes
+        if event.response_bytes is not None:
+            series.response_bytes += event.response_bytes
+        if event.duration is not None:
+            series.counts[bisect_left(self._buckets, event.duration)] += 1
+            series.total += 1
+            series.sum += event.duration
+
+    def _on_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._observe(event)
+
+    def _on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            if event.status_code is None:
+                # Transport errors have no response event, so they are counted here.
+                self._observe(event)
+            self._get(event).errors += 1
+
+    def _on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._get(event).retries += 1
+
+    def _copies(self) -> list[tuple[tuple[str, str], "_Series"]]:
+        with self._lock:
+            return [(key, self._series[key].copy()) for key in sorted(self._series)]
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, float | dict[str, int]]]]:
+        """
+        Return the current metrics.
+
+        Returns:
+            ``{operation: {phase: stats}}``, where stats holds ``requests`` (a count per
+            status class), ``errors``, ``retries``, ``request_bytes``, ``response_bytes``,
+            ``count`` and ``sum`` of the latency histogram (in seconds) and one ``pNN``
+            estimate per percentile, interpolated within the histogram buckets.
+        """
+        result: dict[str, dict[str, dict[str, float | dict[str, int]]]] = {}
+        for (operation, phase), series in self._copies():
+            stats: dict[str, float | dict[str, int]] = {
+                "requests": dict(sorted(series.requests.items())),
+                "errors": series.errors,
+                "retries": series.retries,
+                "request_bytes": series.request_bytes,
+                "response_bytes": series.response_bytes,
+                "count": series.total,
+                "sum": series.sum,
+            }
+            for percent in self._percentiles:
+                stats[f"p{percent:g}"] = self._quantile(series, percent / 100)
+            result.setdefault(operation, {})[phase] = stats
+        return result
+
+    def _quantile(self, series: "_Series", quantile: float) -> float:
+        """Estimate a quantile like Prometheus' histogram_quantile (0.0 for an empty histogram)."""
+        if not series.total:
+            return 0.0
+        rank = quantile * series.total
+        cumulative = 0
+        for index, count in enumerate(series.counts):
+            if count and cumulative + count >= rank:
+                if index == len(self._buckets):
+                    return self._buckets[-1]
+                lower = self._buckets[index - 1] if index else 0.0
+                return lower + (self._buckets[index] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self._buckets[-1]
+
+    def prometheus(self) -> str:
+        """
+        Return the metrics in the Prometheus text exposition format.
+
+        Returns:
+            The exposition, ready to be served on a ``/metrics`` endpoint.
+        """
+        name = self._namespace
+        histogram = f"{name}_request_duration_seconds"
+        duration: list[str] = []
+        requests: list[str] = []
+        errors: list[str] = []
+        retries: list[str] = []
+        request_bytes: list[str] = []
+        response_bytes: list[str] = []
+        for (operation, phase), series in self._copies():
+            labels = f'operation="{_label_value(operation)}",phase="{_label_value(phase)}"'
+            cumulative = 0
+            for index, bound in enumerate(self._bounds):
+                cumulative += series.counts[index]
+                duration.append(f'{histogram}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            duration.append(f'{histogram}_bucket{{{labels},le="+Inf"}} {series.total}')
+            duration.append(f"{histogram}_sum{{{labels}}} {series.sum!r}")
+            duration.append(f"{histogram}_count{{{labels}}} {series.total}")
+            for status_class, count in sorted(series.requests.items()):
+                requests.append(f'{name}_requests_total{{{labels},status_class="{status_class}"}} {count}')
+            errors.append(f"{name}_request_errors_total{{{labels}}} {series.errors}")
+            retries.append(f"{name}_request_retries_total{{{labels}}} {series.retries}")
+            request_bytes.append(f"{name}_request_bytes_total{{{labels}}} {series.request_bytes}")
+            response_bytes.append(f"{name}_response_bytes_total{{{labels}}} {series.response_bytes}")
+
+        families = (
+            ("request_duration_seconds", "histogram", "Duration of Dfns API HTTP exchanges.", duration),
+            ("requests_total", "counter", "Dfns API HTTP exchanges by status class.", requests),
+            ("request_errors_total", "counter", "Dfns API transport errors and HTTP error responses.", errors),
+            ("request_retries_total", "counter", "Dfns API HTTP exchanges retried.", retries),
+            ("request_bytes_total", "counter", "Bytes of Dfns API request bodies.", request_bytes),
+            ("response_bytes_total", "counter", "Bytes of Dfns API response bodies.", response_bytes),
+        )
+        lines: list[str] = []
+        for metric, kind, help_text, samples in families:
+            lines.append(f"# HELP {name}_{metric} {help_text}")
+            lines.append(f"# TYPE {name}_{metric} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Discard all collected metrics."""
+        with self._lock:
+            self._series.clear()
+
+
+class _Series:
+    """Histogram and counters of one operation and phase."""
+
+    __slots__ = ("counts", "total", "sum", "requests", "errors", "retries", "request_bytes", "response_bytes")
+
+    def __init__(self, buckets: int):
+        # One count per bucket, plus the +Inf bucket.
+        self.counts = [0] * (buckets + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.requests: dict[str, int] = {}
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def copy(self) -> "_Series":
+        copy = _Series(0)
+        copy.counts = list(self.counts)
+        copy.total = self.total
+        copy.sum = self.sum
+        copy.requests = dict(self.requests)
+        copy.errors = self.errors
+        copy.retries = self.retries
+        copy.request_bytes = self.request_bytes
+        copy.response_bytes = self.response_bytes
+        return copy
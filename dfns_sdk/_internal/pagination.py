@@ -0,0 +1,166 @@
+"""Pagination helpers for list endpoints."""
+
+import asyncio
+import contextvars
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+
+def _next_page_token(page: Any) -> str | None:
+    """Read the pagination token of the next page, if any."""
+    if not isinstance(page, Mapping):
+        return None
+    token = page.get("nextPageToken") or page.get("next_page_token")
+    return token if isinstance(token, str) else None
+
+
+def _page_items(page: Any) -> list[Any]:
+    """Read the items of a page."""
+    items = page.get("items") if isinstance(page, Mapping) else None
+    return items if isinstance(items, list) else []
+
+
+def _page_query(query: Mapping[str, Any] | None, page_size: int | None, token: str | None) -> dict[str, Any]:
+    """Build the query of a page from the caller's query, page size hint and cursor."""
+    page_query = dict(query or {})
+    if page_size is not None:
+        page_query["limit"] = page_size
+    # The API expects camelCase query names; a later page replaces the caller's starting cursor.
+    start = page_query.pop("pagination_token", None)
+    token = start if token is None else token
+    if token is not None:
+        page_query["paginationToken"] = token
+    return page_query
+
+
+def iter_items(
+    fetch: Callable[[Any], Any],
+    query: Mapping[str, Any] | None = None,
+    page_size: int | None = None,
+) -> Iterator[Any]:
+    """
+    Iterate over the items of every page of a paginated list endpoint.
+
+    The next page is fetched on a background thread while the caller consumes the
+    current one, so at most two pages are held in memory at any time. Each fetch runs in
+    a copy of the caller's context, so context variables such as the active trace span
+    carry over to the page requests.
+
+    Args:
+        fetch: Function fetching one page for a query.
+        query: Query parameters of the first page.
+        page_size: Number of items requested per page.
+
+    Returns:
+        An iterator over the items of all pages.
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="dfns-pagination") as executor:
+        pending: Future[Any] | None = executor.submit(
+            contextvars.copy_context().run, fetch, _page_query(query, page_size, None)
+        )
+        token: str | None = None
+        try:
+            while pending is not None:
+                page = pending.result()
+                previous, token = token, _next_page_token(page)
+                pending = None
+                if token is not None and token != previous:
+                    pending = executor.submit(
+                        contextvars.copy_context().run, fetch, _page_query(query, page_size, token)
+                    )
+                yield from _page_items(page)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+async def aiter_items(
+    fetch: Callable[[Any], Awaitable[Any]],
+    query: Mapping[str, Any] | None = None,
+    page_size: int | None = None,
+) -> AsyncIterator[Any]:
+    """
+    Asynchronously iterate over the items of every page of a paginated list endpoint.
+
+    The next page is requested in a background task while the caller consumes the
+    current one, so at most two pages are held in memory at any time.
+
+    Args:
+        fetch: Coroutine function fetching one page for a query.
+        query: Query parameters of the first page.
+        page_size: Number of items requested per page.
+
+    Returns:
+        An async iterator over the items of all pages.
+    """
+    pending: asyncio.Future[Any] | None = asyncio.ensure_future(fetch(_page_query(query, page_size, None)))
+    token: str | None = None
+    try:
+        while pending is not None:
+            page = await pending
+            previous, token = token, _next_page_token(page)
+            pending = None
+            if token is not None and token != previous:
+                pending = asyncio.ensure_future(fetch(_page_query(query, page_size, token)))
+            for item in _page_items(page):
+                yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def iter_streamed_items(
+    stream_page: Callable[[dict[str, Any], dict[str, Any]], Iterator[Any]],
+    query: Mapping[str, Any] | None = None,
+    page_size: int | None = None,
+) -> Iterator[Any]:
+    """
+    Iterate over the items of every page of a paginated list endpoint, decoding each page incrementally.
+
+    The next page token usually follows the items in the body, so pages are fetched
+    one after the other once the current page is fully consumed.
+
+    Args:
+        stream_page: Function streaming the items of one page for a query, filling the
+            given metadata dict with the other top-level fields of the page.
+        query: Query parameters of the first page.
+        page_size: Number of items requested per page.
+
+    Returns:
+        An iterator over the items of all pages.
+    """
+    token: str | None = None
+    while True:
+        metadata: dict[str, Any] = {}
+        yield from stream_page(_page_query(query, page_size, token), metadata)
+        previous, token = token, _next_page_token(metadata)
+        if token is None or token == previous:
+            return
+
+
+async def aiter_streamed_items(
+    stream_page: Callable[[dict[str, Any], dict[str, Any]], AsyncIterator[Any]],
+    query: Mapping[str, Any] | None = None,
+    page_size: int | None = None,
+) -> AsyncIterator[Any]:
+    """
+    Asynchronously iterate over the items of every page of a paginated list endpoint, decoding each page incrementally.
+
+    Args:
+        stream_page: Function streaming the items of one page for a query, filling the
+            given metadata dict with the other top-level fields of the page.
+        query: Query parameters of the first page.
+        page_size: Number of items requested per page.
+
+    Returns:
+        An async iterator over the items of all pages.
+    """
+    token: str | None = None
+    while True:
+        metadata: dict[str, Any] = {}
+        async for item in stream_page(_page_query(query, page_size, token), metadata):
+            yield item
+        previous, token = token, _next_page_token(metadata)
+        if token is None or token == previous:
+            return
@@ -0,0 +1,90 @@
+"""Retry decisions and backoff computation for the HTTP transport."""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from dfns_sdk.types import RetryPolicy
+
+# Failures raised before any byte of the request reached the server: retrying them can
+# never duplicate an action, whatever the method or user action involved.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryRequest(Exception):
+    """Raised by a transport stage to restart the request after ``delay`` seconds."""
+
+    def __init__(self, delay: float):
+        super().__init__(delay)
+        self.delay = delay
+
+
+def is_idempotent(policy: RetryPolicy | None, method: str, user_action: bool) -> bool:
+    """Whether a request may be repeated on any transient failure without side effects."""
+    return policy is not None and not user_action and method in policy.idempotent_methods
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(policy: RetryPolicy, attempt: int) -> float:
+    """Exponential backoff delay with jitter before retrying after ``attempt``."""
+    delay = min(policy.backoff_max, policy.backoff_initial * 2.0 ** (attempt - 1))
+    return delay * (1.0 - policy.jitter * random.random())
+
+
+def retry_delay(
+    policy: RetryPolicy | None,
+    attempt: int,
+    *,
+    idempotent: bool,
+    response: httpx.Response | None = None,
+    error: Exception | None = None,
+) -> float | None:
+    """
+    Decide whether a failed attempt should be retried.
+
+    Args:
+        policy: The retry policy, or None when retries are disabled.
+        attempt: The 1-based number of the attempt that just failed.
+        idempotent: Whether repeating the request can never duplicate an action.
+        response: The response received, if any.
+        error: The transport error raised, if any.
+
+    Returns:
+        The delay in seconds before the next attempt, or None to not retry.
+    """
+    if policy is None or attempt >= policy.max_attempts:
+        return None
+
+    if error is not None:
+        if not isinstance(error, _NOT_SENT_ERRORS) and not (idempotent and isinstance(error, httpx.TransportError)):
+            return None
+        return backoff_delay(policy, attempt)
+
+    if response is None or response.status_code not in policy.retry_statuses:
+        return None
+    if not idempotent and response.status_code != 429:
+        return None
+
+    if policy.respect_retry_after:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after if retry_after <= policy.max_retry_after else None
+    return backoff_delay(policy, attempt)
@@ -0,0 +1,175 @@
+"""Incremental decoding of large JSON list responses."""
+
+import json
+import re
+from collections.abc import Collection
+from typing import Any, NoReturn
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+# Characters that can continue a number, e.g. a chunk ending on "1." or "1e".
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+
+# Parser states.
+_OBJECT_START = 0
+_KEY = 1
+_COLON = 2
+_VALUE = 3
+_ARRAY_START = 4
+_ARRAY_VALUE = 5
+_ARRAY_NEXT = 6
+_OBJECT_NEXT = 7
+_DONE = 8
+
+
+class JsonItemStream:
+    """
+    Incremental parser yielding the elements of one array field of a JSON object.
+
+    Text is fed in arbitrary chunks; every element of the ``items_key`` array is returned
+    as soon as it is complete, so only one element needs to be held in memory at a time.
+    Other top-level fields (e.g. ``nextPageToken``) are collected into ``metadata``.
+
+    Example:
+        >>> stream = JsonItemStream(fields=["id"])
+        >>> stream.feed('{"items": [{"id": "wa-1", "net') + stream.feed('work": "Bitcoin"}]}')
+        [{'id': 'wa-1'}]
+    """
+
+    def __init__(self, items_key: str = "items", fields: Collection[str] | None = None):
+        """
+        Initialize the stream.
+
+        Args:
+            items_key: Name of the top-level array field whose elements are yielded.
+            fields: Keys to keep on each element (None keeps every key).
+        """
+        self.items_key = items_key
+        self.fields = fields
+        self.metadata: dict[str, Any] = {}
+        self._buffer = ""
+        self._state = _OBJECT_START
+        self._key = ""
+
+    def feed(self, chunk: str) -> list[Any]:
+        """
+        Feed the next chunk of text.
+
+        Args:
+            chunk: The next chunk of the response body.
+
+        Returns:
+            The array elements completed by this chunk.
+        """
+        self._buffer += chunk
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """
+        Signal the end of the body and return any remaining elements.
+
+        Raises:
+            json.JSONDecodeError: If the body is not a complete JSON object.
+        """
+        items = self._parse(final=True)
+        if self._state != _DONE:
+            raise json.JSONDecodeError("Unexpected end of JSON body", self._buffer, len(self._buffer))
+        return items
+
+    def _project(self, item: Any) -> Any:
+        if self.fields is None or not isinstance(item, dict):
+            return item
+        return {key: item[key] for key in self.fields if key in item}
+
+    def _decode(self, pos: int, final: bool) -> tuple[Any, int] | None:
+        """Decode one value at ``pos``, or return None if more input is needed."""
+        try:
+            value, end = _DECODER.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        if not final:
+            # A number or literal ending exactly at the end of the buffer may be truncated.
+            if end == len(self._buffer):
+                return None
+            # raw_decode stops a number at the first character it cannot extend it with, so
+            # "1." or "1e" at the end of a chunk decodes as 1; wait for the rest of the number.
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if is_number and _NUMBER_TAIL.match(self._buffer, end):
+                return None
+        return value, end
+
+    def _expect(self, pos: int, char: str) -> NoReturn:
+        raise json.JSONDecodeError(f"Expecting {char!r}", self._buffer, pos)
+
+    def _parse(self, final: bool) -> list[Any]:
+        items: list[Any] = []
+        buffer = self._buffer
+        length = len(buffer)
+        pos = 0
+        while True:
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if self._state == _DONE or pos == length:
+                break
+            char = buffer[pos]
+
+            if self._state == _OBJECT_START:
+                if char != "{":
+                    self._expect(pos, "{")
+                pos += 1
+                self._state = _KEY
+            elif self._state in (_KEY, _OBJECT_NEXT):
+                if char == "}":
+                    pos += 1
+                    self._state = _DONE
+                elif self._state == _OBJECT_NEXT:
+                    if char != ",":
+                        self._expect(pos, ",")
+                    pos += 1
+                    self._state = _KEY
+                else:
+                    decoded = self._decode(pos, final)
+                    if decoded is None:
+                        break
+                    self._key, pos = decoded
+                    self._state = _COLON
+            elif self._state == _COLON:
+                if char != ":":
+                    self._expect(pos, ":")
+                pos += 1
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                if self._key == self.items_key and char == "[":
+                    pos += 1
+                    self._state = _ARRAY_START
+                else:
+                    decoded = self._decode(pos, final)
+                    if decoded is None:
+                        break
+                    self.metadata[self._key], pos = decoded
+                    self._state = _OBJECT_NEXT
+            elif self._state in (_ARRAY_START, _ARRAY_VALUE):
+                if char == "]" and self._state == _ARRAY_START:
+                    pos += 1
+                    self._state = _OBJECT_NEXT
+                else:
+                    decoded = self._decode(pos, final)
+                    if decoded is None:
+                        break
+                    item, pos = decoded
+                    items.append(self._project(item))
+                    self._state = _ARRAY_NEXT
+            elif self._state == _ARRAY_NEXT:
+                if char == "]":
+                    pos += 1
+                    self._state = _OBJECT_NEXT
+                else:
+                    if char != ",":
+                        self._expect(pos, ",")
+                    pos += 1
+                    self._state = _ARRAY_VALUE
+
+        self._buffer = buffer[pos:]
+        return items
@@ -0,0 +1,202 @@
+"""Per-phase timing of requests and of the user action signing pipeline."""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from dfns_sdk.types import PhaseTiming
+
+T = TypeVar("T")
+
+PhaseHook = Callable[[PhaseTiming], None]
+"""Callback receiving the timing of each completed phase."""
+
+
+class PhaseTimer:
+    """
+    Context manager timing one phase and reporting it to a hook on exit.
+
+    The phase fails if it raises or if ``status_code`` is set to an HTTP error status.
+    With ``cpu=True`` the CPU time of the current thread is measured as well; callers
+    running the work elsewhere can set ``cpu_time`` themselves.
+    """
+
+    __slots__ = ("_hook", "_operation", "_phase", "_attempt", "_cpu", "_start", "_cpu_start", "status_code", "cpu_time")
+
+    def __init__(self, hook: PhaseHook, operation: str, phase: str, attempt: int = 1, cpu: bool = False):
+        self._hook = hook
+        self._operation = operation
+        self._phase = phase
+        self._attempt = attempt
+        self._cpu = cpu
+        self._start = 0.0
+        self._cpu_start = 0.0
+        self.status_code: int | None = None
+        self.cpu_time: float | None = None
+
+    def __enter__(self) -> "PhaseTimer":
+        if self._cpu:
+            self._cpu_start = time.thread_time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        duration = time.perf_counter() - self._start
+        if self._cpu:
+            self.cpu_time = time.thread_time() - self._cpu_start
+        failed = exc_type is not None or (self.status_code is not None and self.status_code >= 400)
+        self._hook(
+            PhaseTiming(
+                operation=self._operation,
+                phase=self._phase,
+                status="error" if failed else "ok",
+                duration=duration,
+                cpu_time=self.cpu_time,
+                attempt=self._attempt,
+                status_code=self.status_code,
+            )
+        )
+
+
+class _NullTimer:
+    """Stand-in for PhaseTimer when no hook is installed; ignores everything."""
+
+    __slots__ = ()
+
+    status_code: int | None
+    cpu_time: float | None
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        return None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def time_phase(
+    hook: PhaseHook | None, operation: str, phase: str, attempt: int = 1, cpu: bool = False
+) -> PhaseTimer | _NullTimer:
+    """Return a timer for a phase, or a shared no-op timer if there is no hook."""
+    if hook is None:
+        return _NULL_TIMER
+    return PhaseTimer(hook, operation, phase, attempt, cpu)
+
+
+def cpu_timed(function: Callable[[Any], T], argument: Any) -> tuple[T, float]:
+    """Call a function and return its result with the CPU time it used on this thread."""
+    start = time.thread_time()
+    result = function(argument)
+    return result, time.thread_time() - start
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """Nearest-rank percentile of a sorted, non-empty list."""
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+class LatencyRecorder:
+    """
+    Aggregates phase timings into per-operation, per-phase percentiles.
+
+    Install an instance as the ``on_phase`` hook and read ``snapshot()`` at runtime.
+    Counts cover every timing received; percentiles are computed over the most
+    recent ``window`` timings of each operation and phase.
+
+    Example:
+        >>> from dfns_sdk import DfnsClientConfig, LatencyRecorder
+        >>> recorder = LatencyRecorder()
+        >>> config = DfnsClientConfig(auth_token="your-token", signer=signer, on_phase=recorder)
+        >>> ...
+        >>> recorder.snapshot()["wallets.transfer_asset"]["sign"]["p99"]
+    """
+
+    def __init__(self, window: int = 1024, percentiles: tuple[float, ...] = (50, 90, 99)):
+        """
+        Initialize the recorder.
+
+        Args:
+            window: Number of recent timings kept per operation and phase.
+            percentiles: Percentiles reported by snapshot(), e.g. 99 as "p99".
+
+        Raises:
+            ValueError: If window is below 1 or a percentile is outside (0, 100].
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if any(not 0 < percent <= 100 for percent in percentiles):
+            raise ValueError("percentiles must be in (0, 100]")
+        self._window = window
+        self._percentiles = percentiles
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], _Series] = {}
+
+    def __call__(self, timing: PhaseTiming) -> None:
+        """Record a phase timing."""
+        key = (timing.operation, timing.phase)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(self._window)
+            series.add(timing)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Return the current statistics.
+
+        Returns:
+            ``{operation: {phase: stats}}``, where stats holds ``count``, ``errors``,
+            ``max`` and one ``pNN`` entry per percentile (durations in seconds), plus
+            ``cpu_pNN`` entries for phases reporting CPU time (e.g. "sign").
+        """
+        with self._lock:
+            copies = {
+                key: (series.count, series.errors, list(series.durations), list(series.cpu_times))
+                for key, series in self._series.items()
+            }
+        result: dict[str, dict[str, dict[str, float]]] = {}
+        for (operation, phase), (count, errors, durations, cpu_times) in copies.items():
+            stats: dict[str, float] = {"count": count, "errors": errors}
+            durations.sort()
+            stats["max"] = durations[-1]
+            for percent in self._percentiles:
+                stats[f"p{percent:g}"] = _percentile(durations, percent)
+            if cpu_times:
+                cpu_times.sort()
+                for percent in self._percentiles:
+                    stats[f"cpu_p{percent:g}"] = _percentile(cpu_times, percent)
+            result.setdefault(operation, {})[phase] = stats
+        return result
+
+    def reset(self) -> None:
+        """Discard all recorded timings."""
+        with self._lock:
+            self._series.clear()
+
+
+class _Series:
+    """Counters and recent samples of one operation and phase."""
+
+    __slots__ = ("count", "errors", "durations", "cpu_times")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.errors = 0
+        self.durations: deque[float] = deque(maxlen=window)
+        self.cpu_times: deque[float] = deque(maxlen=window)
+
+    def add(self, timing: PhaseTiming) -> None:
+        self.count += 1
+        if timing.status != "ok":
+            self.errors += 1
+        self.durations.append(timing.duration)
+        if timing.cpu_time is not None:
+            self.cpu_times.append(timing.cpu_time)
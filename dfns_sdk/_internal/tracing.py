@@ -0,0 +1,60 @@
+"""Dispatch of spans to the configured tracing backend."""
+
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .endpoint import Endpoint
+
+if TYPE_CHECKING:
+    from dfns_sdk.tracing import ExchangeSpan, Tracing
+
+
+class _NullExchangeSpan:
+    """Stand-in for an exchange span when tracing is disabled."""
+
+    __slots__ = ()
+
+    def response(self, response: httpx.Response) -> None:
+        return None
+
+
+_NULL_SPAN: AbstractContextManager[Any] = nullcontext()
+_NULL_EXCHANGE: "AbstractContextManager[ExchangeSpan]" = nullcontext(_NullExchangeSpan())
+
+
+def trace_operation(
+    tracing: "Tracing | None", operation: str, endpoint: Endpoint, phase: str = "request"
+) -> AbstractContextManager[Any]:
+    """
+    Trace an operation, or return a shared no-op context if tracing is disabled.
+
+    Only the request phase opens an operation span. The challenge and signature requests
+    made on behalf of a delegated operation are traced as exchanges alone, as in the
+    signed flow, rather than as extra spans named after the operation.
+    """
+    if tracing is None or phase != "request":
+        return _NULL_SPAN
+    return tracing.operation(operation, endpoint.method, endpoint.path)
+
+
+def trace_exchange(
+    tracing: "Tracing | None",
+    request: httpx.Request,
+    endpoint: Endpoint,
+    operation: str,
+    phase: str,
+    attempt: int,
+) -> "AbstractContextManager[ExchangeSpan]":
+    """Trace an HTTP exchange, or return a shared no-op context if tracing is disabled."""
+    if tracing is None:
+        return _NULL_EXCHANGE
+    return tracing.exchange(request, operation, endpoint.path, phase, attempt)
+
+
+def trace_sign(tracing: "Tracing | None", operation: str) -> AbstractContextManager[Any]:
+    """Trace challenge signing, or return a shared no-op context if tracing is disabled."""
+    if tracing is None:
+        return _NULL_SPAN
+    return tracing.sign(operation)
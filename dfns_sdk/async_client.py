@@ -0,0 +1,138 @@
+"""Async Dfns client."""
+
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from ._internal import AsyncHttpClient
+from ._internal.batch import arun_batch
+from ._internal.lazy import SubClient
+from .types import BatchResult, DfnsClientConfig
+
+T = TypeVar("T")
+
+if TYPE_CHECKING:
+    from .generated.address_watches.async_client import AsyncAddressWatchesClient
+    from .generated.agreements.async_client import AsyncAgreementsClient
+    from .generated.allocations.async_client import AsyncAllocationsClient
+    from .generated.auth.async_client import AsyncAuthClient
+    from .generated.exchanges.async_client import AsyncExchangesClient
+    from .generated.fee_sponsors.async_client import AsyncFeeSponsorsClient
+    from .generated.keys.async_client import AsyncKeysClient
+    from .generated.networks.async_client import AsyncNetworksClient
+    from .generated.payins.async_client import AsyncPayinsClient
+    from .generated.payouts.async_client import AsyncPayoutsClient
+    from .generated.permissions.async_client import AsyncPermissionsClient
+    from .generated.policies.async_client import AsyncPoliciesClient
+    from .generated.signers.async_client import AsyncSignersClient
+    from .generated.staking.async_client import AsyncStakingClient
+    from .generated.swaps.async_client import AsyncSwapsClient
+    from .generated.vaults.async_client import AsyncVaultsClient
+    from .generated.wallets.async_client import AsyncWalletsClient
+    from .generated.webhooks.async_client import AsyncWebhooksClient
+
+
+class AsyncDfnsClient:
+    """
+    Async client for the Dfns API.
+
+    This client mirrors DfnsClient with awaitable sub-client methods, so a single event
+    loop can drive many in-flight requests over one connection pool.
+
+    Example:
+        >>> from dfns_sdk import AsyncDfnsClient, DfnsClientConfig
+        >>> config = DfnsClientConfig(auth_token="your-token")
+        >>> async with AsyncDfnsClient(config) as client:
+        ...     wallets = await client.wallets.list_wallets()
+    """
+
+    address_watches: SubClient["AsyncAddressWatchesClient"] = SubClient(
+        "dfns_sdk.generated.address_watches.async_client", "AsyncAddressWatchesClient"
+    )
+    agreements: SubClient["AsyncAgreementsClient"] = SubClient(
+        "dfns_sdk.generated.agreements.async_client", "AsyncAgreementsClient"
+    )
+    allocations: SubClient["AsyncAllocationsClient"] = SubClient(
+        "dfns_sdk.generated.allocations.async_client", "AsyncAllocationsClient"
+    )
+    auth: SubClient["AsyncAuthClient"] = SubClient("dfns_sdk.generated.auth.async_client", "AsyncAuthClient")
+    exchanges: SubClient["AsyncExchangesClient"] = SubClient(
+        "dfns_sdk.generated.exchanges.async_client", "AsyncExchangesClient"
+    )
+    fee_sponsors: SubClient["AsyncFeeSponsorsClient"] = SubClient(
+        "dfns_sdk.generated.fee_sponsors.async_client", "AsyncFeeSponsorsClient"
+    )
+    keys: SubClient["AsyncKeysClient"] = SubClient("dfns_sdk.generated.keys.async_client", "AsyncKeysClient")
+    networks: SubClient["AsyncNetworksClient"] = SubClient(
+        "dfns_sdk.generated.networks.async_client", "AsyncNetworksClient"
+    )
+    payins: SubClient["AsyncPayinsClient"] = SubClient("dfns_sdk.generated.payins.async_client", "AsyncPayinsClient")
+    payouts: SubClient["AsyncPayoutsClient"] = SubClient(
+        "dfns_sdk.generated.payouts.async_client", "AsyncPayoutsClient"
+    )
+    permissions: SubClient["AsyncPermissionsClient"] = SubClient(
+        "dfns_sdk.generated.permissions.async_client", "AsyncPermissionsClient"
+    )
+    policies: SubClient["AsyncPoliciesClient"] = SubClient(
+        "dfns_sdk.generated.policies.async_client", "AsyncPoliciesClient"
+    )
+    signers: SubClient["AsyncSignersClient"] = SubClient(
+        "dfns_sdk.generated.signers.async_client", "AsyncSignersClient"
+    )
+    staking: SubClient["AsyncStakingClient"] = SubClient(
+        "dfns_sdk.generated.staking.async_client", "AsyncStakingClient"
+    )
+    swaps: SubClient["AsyncSwapsClient"] = SubClient("dfns_sdk.generated.swaps.async_client", "AsyncSwapsClient")
+    vaults: SubClient["AsyncVaultsClient"] = SubClient("dfns_sdk.generated.vaults.async_client", "AsyncVaultsClient")
+    wallets: SubClient["AsyncWalletsClient"] = SubClient(
+        "dfns_sdk.generated.wallets.async_client", "AsyncWalletsClient"
+    )
+    webhooks: SubClient["AsyncWebhooksClient"] = SubClient(
+        "dfns_sdk.generated.webhooks.async_client", "AsyncWebhooksClient"
+    )
+
+    def __init__(self, config: DfnsClientConfig):
+        """
+        Initialize the async Dfns client.
+
+        Args:
+            config: Client configuration.
+        """
+        self._config = config
+        self._http = AsyncHttpClient(config)
+
+    async def batch(
+        self, operations: Iterable[Callable[[], Awaitable[T]]], max_concurrency: int = 10
+    ) -> list[BatchResult[T]]:
+        """
+        Run many operations, typically signed requests, concurrently.
+
+        Up to ``max_concurrency`` operations are in flight at once, so challenges,
+        signatures, token exchanges and requests of different items overlap. A failed
+        item does not stop the others.
+
+        Args:
+            operations: Zero-argument callables returning awaitables, e.g. ``functools.partial``
+                of sub-client methods.
+            max_concurrency: Maximum number of operations in flight.
+
+        Returns:
+            One result per operation, in submission order.
+
+        Example:
+            >>> from functools import partial
+            >>> results = await client.batch(
+            ...     [partial(client.wallets.transfer_asset, wallet_id, body) for body in transfers],
+            ...     max_concurrency=16,
+            ... )
+        """
+        return await arun_batch(operations, max_concurrency)
+
+    async def close(self) -> None:
+        """Close the client and release resources."""
+        await self._http.close()
+
+    async def __aenter__(self) -> "AsyncDfnsClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
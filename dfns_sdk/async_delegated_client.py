@@ -0,0 +1,232 @@
+"""Async delegated Dfns client for external signing orchestration."""
+
+import asyncio
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from ._internal import AsyncHttpClient
+from ._internal.batch import Arguments, arun_batch, bind_complete, bind_init
+from ._internal.lazy import SubClient
+from .base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from .challenge_store import pending_endpoint, take_pending_challenge
+from .types import BatchResult, DfnsDelegatedClientConfig
+
+if TYPE_CHECKING:
+    from .generated.address_watches.async_delegated_client import AsyncDelegatedAddressWatchesClient
+    from .generated.agreements.async_delegated_client import AsyncDelegatedAgreementsClient
+    from .generated.allocations.async_delegated_client import AsyncDelegatedAllocationsClient
+    from .generated.auth.async_delegated_client import AsyncDelegatedAuthClient
+    from .generated.exchanges.async_delegated_client import AsyncDelegatedExchangesClient
+    from .generated.fee_sponsors.async_delegated_client import AsyncDelegatedFeeSponsorsClient
+    from .generated.keys.async_delegated_client import AsyncDelegatedKeysClient
+    from .generated.networks.async_delegated_client import AsyncDelegatedNetworksClient
+    from .generated.payins.async_delegated_client import AsyncDelegatedPayinsClient
+    from .generated.payouts.async_delegated_client import AsyncDelegatedPayoutsClient
+    from .generated.permissions.async_delegated_client import AsyncDelegatedPermissionsClient
+    from .generated.policies.async_delegated_client import AsyncDelegatedPoliciesClient
+    from .generated.signers.async_delegated_client import AsyncDelegatedSignersClient
+    from .generated.staking.async_delegated_client import AsyncDelegatedStakingClient
+    from .generated.swaps.async_delegated_client import AsyncDelegatedSwapsClient
+    from .generated.vaults.async_delegated_client import AsyncDelegatedVaultsClient
+    from .generated.wallets.async_delegated_client import AsyncDelegatedWalletsClient
+    from .generated.webhooks.async_delegated_client import AsyncDelegatedWebhooksClient
+
+
+class AsyncDfnsDelegatedClient:
+    """
+    Async delegated client for the Dfns API.
+
+    This client mirrors DfnsDelegatedClient with awaitable *_init() and *_complete()
+    method pairs, so an async signing orchestrator can keep many challenges in flight.
+
+    Example:
+        >>> from dfns_sdk import AsyncDfnsDelegatedClient, DfnsDelegatedClientConfig
+        >>> config = DfnsDelegatedClientConfig(auth_token="service-account-token")
+        >>> async with AsyncDfnsDelegatedClient(config) as client:
+        ...     # Step 1: Initialize action (get challenge)
+        ...     challenge = await client.wallets.create_wallet_init(body={"network": "EthereumSepolia"})
+        ...
+        ...     # Step 2: Sign externally (your signing system)
+        ...     signed = await your_external_signer.sign(challenge)
+        ...
+        ...     # Step 3: Complete action with signed challenge
+        ...     wallet = await client.wallets.create_wallet_complete(
+        ...         body={"network": "EthereumSepolia"},
+        ...         signed_challenge={
+        ...             "challengeIdentifier": challenge["challengeIdentifier"],
+        ...             "firstFactor": signed,
+        ...         },
+        ...         prepared=challenge,
+        ...     )
+    """
+
+    address_watches: SubClient["AsyncDelegatedAddressWatchesClient"] = SubClient(
+        "dfns_sdk.generated.address_watches.async_delegated_client", "AsyncDelegatedAddressWatchesClient"
+    )
+    agreements: SubClient["AsyncDelegatedAgreementsClient"] = SubClient(
+        "dfns_sdk.generated.agreements.async_delegated_client", "AsyncDelegatedAgreementsClient"
+    )
+    allocations: SubClient["AsyncDelegatedAllocationsClient"] = SubClient(
+        "dfns_sdk.generated.allocations.async_delegated_client", "AsyncDelegatedAllocationsClient"
+    )
+    auth: SubClient["AsyncDelegatedAuthClient"] = SubClient(
+        "dfns_sdk.generated.auth.async_delegated_client", "AsyncDelegatedAuthClient"
+    )
+    exchanges: SubClient["AsyncDelegatedExchangesClient"] = SubClient(
+        "dfns_sdk.generated.exchanges.async_delegated_client", "AsyncDelegatedExchangesClient"
+    )
+    fee_sponsors: SubClient["AsyncDelegatedFeeSponsorsClient"] = SubClient(
+        "dfns_sdk.generated.fee_sponsors.async_delegated_client", "AsyncDelegatedFeeSponsorsClient"
+    )
+    keys: SubClient["AsyncDelegatedKeysClient"] = SubClient(
+        "dfns_sdk.generated.keys.async_delegated_client", "AsyncDelegatedKeysClient"
+    )
+    networks: SubClient["AsyncDelegatedNetworksClient"] = SubClient(
+        "dfns_sdk.generated.networks.async_delegated_client", "AsyncDelegatedNetworksClient"
+    )
+    payins: SubClient["AsyncDelegatedPayinsClient"] = SubClient(
+        "dfns_sdk.generated.payins.async_delegated_client", "AsyncDelegatedPayinsClient"
+    )
+    payouts: SubClient["AsyncDelegatedPayoutsClient"] = SubClient(
+        "dfns_sdk.generated.payouts.async_delegated_client", "AsyncDelegatedPayoutsClient"
+    )
+    permissions: SubClient["AsyncDelegatedPermissionsClient"] = SubClient(
+        "dfns_sdk.generated.permissions.async_delegated_client", "AsyncDelegatedPermissionsClient"
+    )
+    policies: SubClient["AsyncDelegatedPoliciesClient"] = SubClient(
+        "dfns_sdk.generated.policies.async_delegated_client", "AsyncDelegatedPoliciesClient"
+    )
+    signers: SubClient["AsyncDelegatedSignersClient"] = SubClient(
+        "dfns_sdk.generated.signers.async_delegated_client", "AsyncDelegatedSignersClient"
+    )
+    staking: SubClient["AsyncDelegatedStakingClient"] = SubClient(
+        "dfns_sdk.generated.staking.async_delegated_client", "AsyncDelegatedStakingClient"
+    )
+    swaps: SubClient["AsyncDelegatedSwapsClient"] = SubClient(
+        "dfns_sdk.generated.swaps.async_delegated_client", "AsyncDelegatedSwapsClient"
+    )
+    vaults: SubClient["AsyncDelegatedVaultsClient"] = SubClient(
+        "dfns_sdk.generated.vaults.async_delegated_client", "AsyncDelegatedVaultsClient"
+    )
+    wallets: SubClient["AsyncDelegatedWalletsClient"] = SubClient(
+        "dfns_sdk.generated.wallets.async_delegated_client", "AsyncDelegatedWalletsClient"
+    )
+    webhooks: SubClient["AsyncDelegatedWebhooksClient"] = SubClient(
+        "dfns_sdk.generated.webhooks.async_delegated_client", "AsyncDelegatedWebhooksClient"
+    )
+
+    def __init__(self, config: DfnsDelegatedClientConfig):
+        """
+        Initialize the async delegated Dfns client.
+
+        Args:
+            config: Client configuration (no signer required).
+        """
+        self._config = config
+        self._http = AsyncHttpClient(config)
+
+    async def init_batch(
+        self,
+        operations: Iterable[tuple[Callable[..., Any], Arguments]],
+        max_concurrency: int = 10,
+    ) -> list[BatchResult[PreparedAction]]:
+        """
+        Create the challenges of many operations concurrently.
+
+        Args:
+            operations: ``(init_method, arguments)`` pairs, where ``init_method`` is a
+                sub-client ``*_init`` method and ``arguments`` its positional arguments
+                (a sequence) or keyword arguments (a mapping).
+            max_concurrency: Maximum number of challenge requests in flight.
+
+        Returns:
+            One result per operation, in submission order, holding its challenge.
+
+        Example:
+            >>> operations = [(client.payouts.create_payout_init, {"body": body}) for body in payouts]
+            >>> challenges = await client.init_batch(operations)
+            >>> signed = your_hsm.sign_all([c.value for c in challenges if c.ok])
+        """
+        return await arun_batch(
+            (bind_init(operation, arguments) for operation, arguments in operations), max_concurrency
+        )
+
+    async def complete_batch(
+        self,
+        operations: Sequence[tuple[Callable[..., Any], Arguments]],
+        signed_challenges: Sequence[SignUserActionChallengeRequest | None],
+        challenges: Sequence[BatchResult[PreparedAction]] | None = None,
+        max_concurrency: int = 10,
+    ) -> list[BatchResult[Any]]:
+        """
+        Complete many operations concurrently with their signed challenges.
+
+        Each item exchanges its signed challenge for a user action token and sends the
+        request, with at most ``max_concurrency`` items in flight.
+
+        Args:
+            operations: The same ``(init_method, arguments)`` pairs passed to init_batch();
+                the matching ``*_complete`` method is called with the same arguments.
+            signed_challenges: The signed challenge of each operation, in the same order
+                (None for operations to skip, which then fail with ValueError).
+            challenges: The results of init_batch(), in the same order. Each prepared
+                action is passed to its ``*_complete`` method, so the exact challenged
+                payload is sent without encoding the body again.
+            max_concurrency: Maximum number of operations in flight.
+
+        Returns:
+            One result per operation, in submission order, holding its API response.
+
+        Raises:
+            ValueError: If the sequences differ in length.
+        """
+        if len(operations) != len(signed_challenges) or (challenges is not None and len(challenges) != len(operations)):
+            raise ValueError("operations, signed_challenges and challenges must have the same length")
+        prepared = [challenge.value for challenge in challenges] if challenges is not None else [None] * len(operations)
+        calls = [
+            bind_complete(operation, arguments, signed, action)
+            for (operation, arguments), signed, action in zip(operations, signed_challenges, prepared, strict=True)
+        ]
+        return await arun_batch(calls, max_concurrency)
+
+    async def complete_by_challenge_id(self, signed_challenge: SignUserActionChallengeRequest) -> Any:
+        """
+        Complete an action from its signed challenge alone.
+
+        The operation, method, path and payload recorded by the ``*_init`` call are read
+        back from the configured ``challenge_store``, so any worker sharing the store can
+        finish the action. Each challenge can be completed once.
+
+        Args:
+            signed_challenge: The signed challenge, including its challengeIdentifier.
+
+        Returns:
+            The API response.
+
+        Raises:
+            DfnsError: If no store is configured, or the challenge is unknown or expired.
+        """
+        store = self._config.challenge_store
+        # Stores may block on disk I/O (SQLiteChallengeStore), so keep them off the event loop.
+        entry = await asyncio.to_thread(take_pending_challenge, store, signed_challenge["challengeIdentifier"])
+        endpoint, path_args = pending_endpoint(entry)
+        try:
+            result = await AsyncBaseAuthApi.sign_user_action_challenge(self._http, signed_challenge, endpoint.operation)
+        except Exception:
+            # The action itself was not sent, so keep it completable.
+            if store is not None:
+                await asyncio.to_thread(store.put, entry)
+            raise
+        return await self._http.call_with_user_action(
+            endpoint, *path_args, user_action=result["userAction"], content=entry.payload or None
+        )
+
+    async def close(self) -> None:
+        """Close the client and release resources."""
+        await self._http.close()
+
+    async def __aenter__(self) -> "AsyncDfnsDelegatedClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
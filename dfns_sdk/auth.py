@@ -1,7 +1,10 @@
 """Authentication utilities for the Dfns SDK."""
 
+import asyncio
 import base64
 import json
+import multiprocessing.context
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Protocol, TypedDict
 
 from cryptography.hazmat.primitives import hashes, serialization
@@ -42,6 +45,28 @@ class Signer(Protocol):
         ...
 
 
+class AsyncSigner(Protocol):
+    """
+    Protocol for signers with an awaitable signing call (e.g. a remote KMS or HSM).
+
+    AsyncDfnsClient awaits ``asign`` when the configured signer provides it; a plain
+    Signer is run on the event loop's default executor instead, so a slow signature
+    never blocks other in-flight requests.
+    """
+
+    async def asign(self, challenge: UserActionChallenge) -> CredentialAssertion:
+        """
+        Sign a user action challenge.
+
+        Args:
+            challenge: The challenge from the server.
+
+        Returns:
+            The credential assertion to submit to the server.
+        """
+        ...
+
+
 def base64url_encode(data: bytes) -> str:
     """Encode bytes to base64url string without padding."""
     return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
@@ -135,3 +160,106 @@ class KeySigner:
             )
         else:
             raise ValueError(f"Unsupported private key type: {type(self._private_key).__name__}")
+
+
+# Per-process KeySigner of a PooledKeySigner worker, created once by the pool initializer.
+_worker_signer: KeySigner | None = None
+
+
+def _init_worker(credential_id: str, private_key: str, app_origin: str) -> None:
+    global _worker_signer
+    _worker_signer = KeySigner(credential_id, private_key, app_origin)
+
+
+def _sign_in_worker(challenge: UserActionChallenge) -> CredentialAssertion:
+    if _worker_signer is None:
+        raise RuntimeError("PooledKeySigner worker was not initialized")
+    return _worker_signer.sign(challenge)
+
+
+class PooledKeySigner:
+    """
+    KeySigner that signs on a pool of worker processes.
+
+    Each worker loads the private key once, when it starts, so signatures scale across
+    CPU cores instead of being serialized by the GIL. Throughput only improves when
+    several challenges are signed at once, e.g. from ``DfnsClient.batch()`` threads or
+    concurrent ``AsyncDfnsClient`` requests; ``asign`` lets the async client await a
+    signature without occupying a thread.
+
+    Example:
+        >>> from dfns_sdk import DfnsClientConfig
+        >>> from dfns_sdk.auth import PooledKeySigner
+        >>> signer = PooledKeySigner(
+        ...     credential_id="cr-xxx-xxx",
+        ...     private_key=open("private_key.pem").read(),
+        ...     max_workers=4,
+        ... )
+        >>> config = DfnsClientConfig(auth_token="your-token", signer=signer)
+    """
+
+    def __init__(
+        self,
+        credential_id: str,
+        private_key: str,
+        app_origin: str = "https://app.dfns.io",
+        max_workers: int | None = None,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ):
+        """
+        Initialize the pooled key signer.
+
+        Args:
+            credential_id: The credential ID (cr-xxx-xxx format).
+            private_key: The private key in PEM format.
+            app_origin: The application origin for the client data.
+            max_workers: Number of worker processes (defaults to the number of CPUs).
+            mp_context: Multiprocessing context used to start the workers.
+
+        Raises:
+            ValueError: If the private key cannot be loaded.
+        """
+        # Load the key here too, so an invalid key fails now rather than in every worker.
+        KeySigner(credential_id, private_key, app_origin)
+        self.credential_id = credential_id
+        self.app_origin = app_origin
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(credential_id, private_key, app_origin),
+        )
+
+    def sign(self, challenge: UserActionChallenge) -> CredentialAssertion:
+        """
+        Sign a user action challenge on a worker process.
+
+        Args:
+            challenge: The challenge from the server.
+
+        Returns:
+            The credential assertion to submit to the server.
+        """
+        return self._executor.submit(_sign_in_worker, challenge).result()
+
+    async def asign(self, challenge: UserActionChallenge) -> CredentialAssertion:
+        """
+        Sign a user action challenge on a worker process without blocking the event loop.
+
+        Args:
+            challenge: The challenge from the server.
+
+        Returns:
+            The credential assertion to submit to the server.
+        """
+        return await asyncio.wrap_future(self._executor.submit(_sign_in_worker, challenge))
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown()
+
+    def __enter__(self) -> "PooledKeySigner":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
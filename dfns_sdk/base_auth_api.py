@@ -1,8 +1,13 @@
 """Base authentication API for delegated client operations."""
 
+import asyncio
+import time
+from collections.abc import Mapping
 from typing import Any, TypedDict, cast
 
-from ._internal import HttpClient
+from ._internal import AsyncHttpClient, HttpClient
+from ._internal.endpoint import USER_ACTION_CHALLENGE, USER_ACTION_SIGNATURE, Endpoint
+from .challenge_store import PendingChallenge
 
 
 class AllowCredential(TypedDict):
@@ -41,6 +46,63 @@ class SignUserActionChallengeRequest(TypedDict, total=False):
     secondFactor: dict[str, Any]
 
 
+class PreparedAction(dict[str, Any]):
+    """
+    Challenge of a delegated action, together with the request it was created for.
+
+    Returned by the delegated ``*_init`` methods. The object is the challenge response
+    mapping, so it can be handed to the external signer as is, and also carries the
+    method, resolved path and serialized payload. Passing it to the matching
+    ``*_complete`` sends exactly the challenged bytes without encoding the body again.
+
+    Attributes:
+        method: HTTP method of the action.
+        path: Request path of the action, with path parameters substituted.
+        payload: The serialized request body the challenge was created for (empty for no body).
+    """
+
+    def __init__(self, challenge: Mapping[str, Any], method: str, path: str, payload: bytes):
+        super().__init__(challenge)
+        self.method = method
+        self.path = path
+        self.payload = payload
+
+    def content_for(self, method: str, path: str) -> bytes | None:
+        """
+        Return the payload to send for a request, checking it is the prepared one.
+
+        Args:
+            method: HTTP method of the request being completed.
+            path: Resolved path of the request being completed.
+
+        Returns:
+            The prepared payload, or None if the action has no body.
+
+        Raises:
+            ValueError: If the action was prepared for another request.
+        """
+        if (method, path) != (self.method, self.path):
+            raise ValueError(f"Action prepared for {self.method} {self.path} cannot complete {method} {path}")
+        return self.payload or None
+
+
+def _save_pending_challenge(
+    http_client: HttpClient | AsyncHttpClient,
+    challenge: UserActionChallengeResponse,
+    method: str,
+    path: str,
+    payload: str,
+    operation: str | None,
+) -> None:
+    """Record a created challenge in the configured challenge store, if any."""
+    store = getattr(http_client.config, "challenge_store", None)
+    if store is None:
+        return
+    ttl = getattr(http_client.config, "challenge_ttl", 300.0)
+    expires_at = time.time() + ttl
+    store.put(PendingChallenge(challenge["challengeIdentifier"], method, path, payload.encode(), expires_at, operation))
+
+
 class BaseAuthApi:
     """
     Helper class for delegated client user action signing.
@@ -78,6 +140,7 @@ class BaseAuthApi:
         user_action_http_path: str,
         user_action_payload: str,
         user_action_server_kind: str = "Api",
+        operation: str | None = None,
     ) -> UserActionChallengeResponse:
         """
         Create a user action challenge for signing.
@@ -88,27 +151,33 @@ class BaseAuthApi:
             user_action_http_path: The path of the action endpoint.
             user_action_payload: The JSON-serialized request body.
             user_action_server_kind: The server kind (default: "Api").
+            operation: The operation of the action, as reported to the ``on_phase`` hook.
 
         Returns:
             The challenge response containing the challenge to sign.
         """
-        response = http_client.request(
-            method="POST",
-            path="/auth/action/init",
+        response = http_client.call(
+            USER_ACTION_CHALLENGE,
+            phase="challenge",
+            operation=operation,
             body={
                 "userActionHttpMethod": user_action_http_method,
                 "userActionHttpPath": user_action_http_path,
                 "userActionPayload": user_action_payload,
                 "userActionServerKind": user_action_server_kind,
             },
-            requires_signature=False,
         )
-        return cast(UserActionChallengeResponse, response)
+        challenge = cast(UserActionChallengeResponse, response)
+        _save_pending_challenge(
+            http_client, challenge, user_action_http_method, user_action_http_path, user_action_payload, operation
+        )
+        return challenge
 
     @staticmethod
     def sign_user_action_challenge(
         http_client: HttpClient,
         signed_challenge: SignUserActionChallengeRequest,
+        operation: str | None = None,
     ) -> dict[str, Any]:
         """
         Complete user action signing with a signed challenge.
@@ -117,14 +186,150 @@ class BaseAuthApi:
             http_client: The HTTP client to use.
             signed_challenge: The signed challenge containing challengeIdentifier
                 and firstFactor (and optional secondFactor).
+            operation: The operation of the action, as reported to the ``on_phase`` hook.
 
         Returns:
             Dictionary containing the userAction token.
         """
-        response = http_client.request(
-            method="POST",
-            path="/auth/action",
-            body=signed_challenge,
-            requires_signature=False,
+        response = http_client.call(
+            USER_ACTION_SIGNATURE, body=signed_challenge, phase="signature", operation=operation
         )
         return cast(dict[str, Any], response)
+
+    @staticmethod
+    def prepare_user_action(http_client: HttpClient, endpoint: Endpoint, path: str, body: Any = None) -> PreparedAction:
+        """
+        Serialize a request body once and create the user action challenge for it.
+
+        Args:
+            http_client: The HTTP client to use.
+            endpoint: The endpoint of the action.
+            path: The resolved path of the action endpoint.
+            body: The request body (None or empty for no body).
+
+        Returns:
+            The challenge, with the method, path and payload to complete it with.
+        """
+        payload = http_client.encode(body) if body else b""
+        challenge = BaseAuthApi.create_user_action_challenge(
+            http_client, endpoint.method, path, payload.decode("utf-8"), operation=endpoint.operation
+        )
+        return PreparedAction(challenge, endpoint.method, path, payload)
+
+
+class AsyncBaseAuthApi:
+    """
+    Async helper class for delegated client user action signing.
+
+    Mirrors BaseAuthApi on top of AsyncHttpClient, so challenge creation and completion
+    can be awaited without tying up a thread per pending challenge.
+
+    Example:
+        >>> challenge = await AsyncBaseAuthApi.create_user_action_challenge(
+        ...     http_client,
+        ...     user_action_http_method="POST",
+        ...     user_action_http_path="/wallets",
+        ...     user_action_payload='{"network":"EthereumSepolia"}',
+        ... )
+        >>> signed = await your_external_signer.sign(challenge)
+        >>> result = await AsyncBaseAuthApi.sign_user_action_challenge(
+        ...     http_client,
+        ...     signed_challenge={
+        ...         "challengeIdentifier": challenge["challengeIdentifier"],
+        ...         "firstFactor": signed,
+        ...     },
+        ... )
+    """
+
+    @staticmethod
+    async def create_user_action_challenge(
+        http_client: AsyncHttpClient,
+        user_action_http_method: str,
+        user_action_http_path: str,
+        user_action_payload: str,
+        user_action_server_kind: str = "Api",
+        operation: str | None = None,
+    ) -> UserActionChallengeResponse:
+        """
+        Create a user action challenge for signing.
+
+        Args:
+            http_client: The async HTTP client to use.
+            user_action_http_method: The HTTP method of the action (GET, POST, etc.).
+            user_action_http_path: The path of the action endpoint.
+            user_action_payload: The JSON-serialized request body.
+            user_action_server_kind: The server kind (default: "Api").
+            operation: The operation of the action, as reported to the ``on_phase`` hook.
+
+        Returns:
+            The challenge response containing the challenge to sign.
+        """
+        response = await http_client.call(
+            USER_ACTION_CHALLENGE,
+            phase="challenge",
+            operation=operation,
+            body={
+                "userActionHttpMethod": user_action_http_method,
+                "userActionHttpPath": user_action_http_path,
+                "userActionPayload": user_action_payload,
+                "userActionServerKind": user_action_server_kind,
+            },
+        )
+        challenge = cast(UserActionChallengeResponse, response)
+        if getattr(http_client.config, "challenge_store", None) is not None:
+            # Stores may block on disk I/O (SQLiteChallengeStore), so keep them off the event loop.
+            await asyncio.to_thread(
+                _save_pending_challenge,
+                http_client,
+                challenge,
+                user_action_http_method,
+                user_action_http_path,
+                user_action_payload,
+                operation,
+            )
+        return challenge
+
+    @staticmethod
+    async def sign_user_action_challenge(
+        http_client: AsyncHttpClient,
+        signed_challenge: SignUserActionChallengeRequest,
+        operation: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Complete user action signing with a signed challenge.
+
+        Args:
+            http_client: The async HTTP client to use.
+            signed_challenge: The signed challenge containing challengeIdentifier
+                and firstFactor (and optional secondFactor).
+            operation: The operation of the action, as reported to the ``on_phase`` hook.
+
+        Returns:
+            Dictionary containing the userAction token.
+        """
+        response = await http_client.call(
+            USER_ACTION_SIGNATURE, body=signed_challenge, phase="signature", operation=operation
+        )
+        return cast(dict[str, Any], response)
+
+    @staticmethod
+    async def prepare_user_action(
+        http_client: AsyncHttpClient, endpoint: Endpoint, path: str, body: Any = None
+    ) -> PreparedAction:
+        """
+        Serialize a request body once and create the user action challenge for it.
+
+        Args:
+            http_client: The async HTTP client to use.
+            endpoint: The endpoint of the action.
+            path: The resolved path of the action endpoint.
+            body: The request body (None or empty for no body).
+
+        Returns:
+            The challenge, with the method, path and payload to complete it with.
+        """
+        payload = http_client.encode(body) if body else b""
+        challenge = await AsyncBaseAuthApi.create_user_action_challenge(
+            http_client, endpoint.method, path, payload.decode("utf-8"), operation=endpoint.operation
+        )
+        return PreparedAction(challenge, endpoint.method, path, payload)
@@ -0,0 +1,291 @@
+"""Record and replay HTTP exchanges with cassette files."""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Collection
+from typing import IO, Any
+from urllib.parse import urlencode
+
+import httpx
+
+from .types import DfnsError
+
+PATH_TEMPLATE = "dfns_path_template"
+"""Request extension in which the clients pass the endpoint path template."""
+
+VOLATILE_FIELDS = frozenset({"firstFactor", "secondFactor"})
+"""Body fields left out of request matching by default: signed assertions differ on every run."""
+
+# Headers describing the recorded encoding of a body, which no longer applies once decoded.
+_ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def _template(request: httpx.Request) -> str:
+    template = request.extensions.get(PATH_TEMPLATE)
+    return template if isinstance(template, str) else request.url.path
+
+
+def canonical_query(request: httpx.Request) -> str:
+    """Return the query of a request with its parameters sorted, so their order is ignored."""
+    return urlencode(sorted(request.url.params.multi_items()))
+
+
+def _key(request: httpx.Request, ignore_fields: Collection[str]) -> tuple[str, str, str, str]:
+    """Return the match key of a request: method, path template, canonical query and body digest."""
+    return request.method, _template(request), canonical_query(request), canonical_body(request, ignore_fields)
+
+
+def _canonical(value: Any) -> Any:
+    """Parse JSON documents nested in strings, such as the user action payload, so key order is ignored."""
+    if isinstance(value, str) and value[:1] in ("{", "["):
+        try:
+            return _canonical(json.loads(value))
+        except ValueError:
+            return value
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    return value
+
+
+def canonical_body(request: httpx.Request, ignore_fields: Collection[str] = VOLATILE_FIELDS) -> str:
+    """
+    Return a digest of a request body that is stable across runs.
+
+    JSON bodies, and JSON documents nested in their strings, are compared with sorted keys
+    and without the ``ignore_fields`` of their top-level object; multipart bodies without
+    their random boundary.
+
+    Args:
+        request: A request whose body has been read.
+        ignore_fields: Top-level JSON fields left out of the comparison.
+
+    Returns:
+        The hex SHA-256 digest of the canonical body ("" for an empty body).
+    """
+    content = request.content
+    if not content:
+        return ""
+    content_type = request.headers.get("Content-Type", "")
+    if "json" in content_type:
+        try:
+            body = json.loads(content)
+        except ValueError:
+            pass
+        else:
+            if isinstance(body, dict):
+                body = {key: value for key, value in body.items() if key not in ignore_fields}
+            content = json.dumps(_canonical(body), sort_keys=True, separators=(",", ":")).encode()
+    elif content_type.startswith("multipart/") and "boundary=" in content_type:
+        content = content.replace(content_type.split("boundary=", 1)[1].encode(), b"")
+    return hashlib.sha256(content).hexdigest()
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    httpx transport recording every exchange to a cassette file, for ReplayTransport.
+
+    Requests go through ``transport`` (a default httpx transport if omitted). Each exchange
+    is appended to the cassette as one JSON line as soon as it completes: the method, path
+    template, canonical query and body digest used for matching, the response and its
+    elapsed time. Cassettes whose name ends with ``.gz`` are gzip-compressed.
+
+    Example:
+        >>> from dfns_sdk import ConnectionConfig, DfnsClient, DfnsClientConfig
+        >>> from dfns_sdk.cassette import RecordingTransport
+        >>> with RecordingTransport("session.jsonl.gz") as recorder:
+        ...     client = DfnsClient(
+        ...         DfnsClientConfig(
+        ...             auth_token="your-token", signer=signer, connection=ConnectionConfig(transport=recorder)
+        ...         )
+        ...     )
+        ...     client.wallets.transfer_asset(wallet_id, {"kind": "Native", "to": "0x...", "amount": "1"})
+    """
+
+    def __init__(
+        self,
+        path: str,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        ignore_fields: Collection[str] = VOLATILE_FIELDS,
+    ):
+        """
+        Initialize the recorder; an existing cassette is overwritten.
+
+        Args:
+            path: The cassette file.
+            transport: The transport sending the requests (an ``httpx.HTTPTransport``
+                for sync clients or ``httpx.AsyncHTTPTransport`` for async clients by default).
+            ignore_fields: Top-level JSON body fields left out of the recorded match key.
+        """
+        self._transport = transport
+        self._ignore_fields = ignore_fields
+        self._lock = threading.Lock()
+        self._file: IO[str] = gzip.open(path, "wt") if path.endswith(".gz") else open(path, "w")  # noqa: SIM115
+
+    def _record(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> httpx.Response:
+        """Write an exchange to the cassette and return the response with its decoded body."""
+        headers = [(name, value) for name, value in response.headers.items() if name not in _ENCODING_HEADERS]
+        content = response.content
+        try:
+            body: dict[str, str] = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(content).decode("ascii")}
+        method, template, query, digest = _key(request, self._ignore_fields)
+        entry = {
+            "method": method,
+            "template": template,
+            "query": query,
+            "body": digest,
+            "url": str(request.url),
+            "status": response.status_code,
+            "headers": headers,
+            "response": body,
+            "elapsed": round(elapsed, 6),
+        }
+        line = json.dumps(entry, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+        return httpx.Response(response.status_code, headers=headers, content=content, extensions=response.extensions)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        if not isinstance(self._transport, httpx.BaseTransport):
+            raise TypeError("RecordingTransport wraps an async transport; use it with AsyncDfnsClient")
+        request.read()
+        start = time.perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self._record(request, response, time.perf_counter() - start)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        if not isinstance(self._transport, httpx.AsyncBaseTransport):
+            raise TypeError("RecordingTransport wraps a sync transport; use it with DfnsClient")
+        await request.aread()
+        start = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return self._record(request, response, time.perf_counter() - start)
+
+    def close(self) -> None:
+        """Close the cassette and the wrapped transport."""
+        with self._lock:
+            self._file.close()
+        if isinstance(self._transport, httpx.BaseTransport):
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        """Close the cassette and the wrapped transport."""
+        with self._lock:
+            self._file.close()
+        if isinstance(self._transport, httpx.AsyncBaseTransport):
+            await self._transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    httpx transport answering requests from a cassette written by RecordingTransport.
+
+    A request is matched by method, path template, query parameters (in any order) and
+    canonical body. Unsigned requests therefore replay even when IDs in their path differ
+    from the recording. Signed ones do not: their challenge request carries the resolved
+    path and payload of the action. Requests with the same match key are answered in the
+    order they were recorded, which replays multi-step flows such as the user action
+    challenge, signature and request calls. List pages replay by their pagination token,
+    which the recorded responses hand back.
+
+    Example:
+        >>> from dfns_sdk import ConnectionConfig, DfnsClient, DfnsClientConfig
+        >>> from dfns_sdk.cassette import ReplayTransport
+        >>> replay = ReplayTransport("session.jsonl.gz", latency_scale=1.0, repeat=True)
+        >>> client = DfnsClient(
+        ...     DfnsClientConfig(auth_token="any-token", signer=signer, connection=ConnectionConfig(transport=replay))
+        ... )
+    """
+
+    def __init__(
+        self,
+        path: str,
+        latency_scale: float | None = None,
+        repeat: bool = False,
+        ignore_fields: Collection[str] = VOLATILE_FIELDS,
+    ):
+        """
+        Load a cassette.
+
+        Args:
+            path: The cassette file (gzip-compressed if its name ends with ``.gz``).
+            latency_scale: Factor applied to the recorded elapsed times before answering
+                (1.0 replays the original timing, 0.5 twice as fast); None answers at once.
+            repeat: Start again from the first recorded response of a match key once all
+                of them were replayed, instead of failing.
+            ignore_fields: Top-level JSON body fields left out of matching.
+        """
+        self.latency_scale = latency_scale
+        self.repeat = repeat
+        self._ignore_fields = ignore_fields
+        self._lock = threading.Lock()
+        self._recorded: dict[tuple[str, str, str, str], list[dict[str, Any]]] = {}
+        with gzip.open(path, "rt") if path.endswith(".gz") else open(path) as file:
+            for line in file:
+                if line.strip():
+                    entry = json.loads(line)
+                    key = (entry["method"], entry["template"], entry["query"], entry["body"])
+                    self._recorded.setdefault(key, []).append(entry)
+        self._pending = {key: deque(entries) for key, entries in self._recorded.items()}
+
+    def _match(self, request: httpx.Request) -> tuple[float, httpx.Response]:
+        """Return the delay and the response of the next recorded exchange matching a request."""
+        key = _key(request, self._ignore_fields)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None and not pending and self.repeat:
+                pending.extend(self._recorded[key])
+            entry = pending.popleft() if pending else None
+        if entry is None:
+            raise DfnsError(
+                message=f"No recorded response left for {request.method} {request.url.path} with this query and body",
+                status_code=None,
+                error_code="CASSETTE_NO_MATCH",
+            )
+        recorded = entry["response"]
+        content = recorded["text"].encode("utf-8") if "text" in recorded else base64.b64decode(recorded["base64"])
+        response = httpx.Response(entry["status"], headers=entry["headers"], content=content)
+        delay = entry["elapsed"] * self.latency_scale if self.latency_scale is not None else 0.0
+        return delay, response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        delay, response = self._match(request)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        delay, response = self._match(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
+
+    @property
+    def remaining(self) -> int:
+        """Number of recorded exchanges not replayed yet."""
+        with self._lock:
+            return sum(len(pending) for pending in self._pending.values())
@@ -0,0 +1,231 @@
+"""Stores for pending delegated user action challenges."""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Protocol
+
+from ._internal.endpoint import Endpoint, find_endpoint
+from .types import DfnsError
+
+
+@dataclass(frozen=True)
+class PendingChallenge:
+    """A user action challenge created by a delegated ``*_init`` call and not yet completed."""
+
+    challenge_identifier: str
+    """The ``challengeIdentifier`` returned by the challenge request."""
+
+    method: str
+    """HTTP method of the action."""
+
+    path: str
+    """Request path of the action, with path parameters substituted."""
+
+    payload: bytes
+    """The serialized request body the challenge was created for (empty for no body)."""
+
+    expires_at: float
+    """Unix time after which the entry is discarded."""
+
+    operation: str | None = None
+    """Operation name of the action's endpoint (e.g. "wallets.transfer_asset"), if known."""
+
+
+class PendingChallengeStore(Protocol):
+    """
+    Protocol for stores of pending challenges, keyed by challenge identifier.
+
+    A shared store lets ``complete_by_challenge_id`` run on any worker, not only on the
+    one that created the challenge.
+    """
+
+    def put(self, entry: PendingChallenge) -> None:
+        """
+        Save a pending challenge, replacing any entry with the same identifier.
+
+        Args:
+            entry: The pending challenge.
+        """
+        ...
+
+    def pop(self, challenge_identifier: str) -> PendingChallenge | None:
+        """
+        Atomically remove and return a pending challenge.
+
+        Only one caller can take a given entry, so an action is completed at most once.
+
+        Args:
+            challenge_identifier: The challenge identifier.
+
+        Returns:
+            The entry, or None if it is unknown or expired.
+        """
+        ...
+
+    def evict_expired(self) -> int:
+        """
+        Remove expired entries.
+
+        Returns:
+            The number of entries removed.
+        """
+        ...
+
+
+class InMemoryChallengeStore:
+    """Thread-safe pending challenge store local to the current process."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, PendingChallenge] = {}
+        self._lock = threading.Lock()
+
+    def put(self, entry: PendingChallenge) -> None:
+        """Save a pending challenge, evicting expired entries."""
+        with self._lock:
+            self._evict(time.time())
+            self._entries[entry.challenge_identifier] = entry
+
+    def pop(self, challenge_identifier: str) -> PendingChallenge | None:
+        """Atomically remove and return a pending challenge, if it has not expired."""
+        with self._lock:
+            entry = self._entries.pop(challenge_identifier, None)
+        if entry is None or entry.expires_at <= time.time():
+            return None
+        return entry
+
+    def evict_expired(self) -> int:
+        """Remove expired entries."""
+        with self._lock:
+            return self._evict(time.time())
+
+    def _evict(self, now: float) -> int:
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteChallengeStore:
+    """
+    Pending challenge store backed by a SQLite database file.
+
+    Every process opening the same file shares the pending challenges, so a challenge
+    created by one worker can be completed by another. Requires SQLite 3.35 or later.
+
+    Example:
+        >>> from dfns_sdk import DfnsDelegatedClientConfig
+        >>> from dfns_sdk.challenge_store import SQLiteChallengeStore
+        >>> config = DfnsDelegatedClientConfig(
+        ...     auth_token="service-account-token",
+        ...     challenge_store=SQLiteChallengeStore("/var/lib/app/challenges.db"),
+        ... )
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        """
+        Initialize the store, creating its table if needed.
+
+        Args:
+            path: Path of the database file (":memory:" for a private in-memory database).
+            timeout: Seconds to wait for a lock held by another connection.
+        """
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pending_challenges ("
+                "challenge_identifier TEXT PRIMARY KEY, method TEXT NOT NULL, path TEXT NOT NULL, "
+                "payload BLOB NOT NULL, expires_at REAL NOT NULL, operation TEXT)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS pending_challenges_expiry ON pending_challenges (expires_at)"
+            )
+
+    def put(self, entry: PendingChallenge) -> None:
+        """Save a pending challenge, evicting expired entries."""
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute("DELETE FROM pending_challenges WHERE expires_at <= ?", (time.time(),))
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO pending_challenges "
+                    "(challenge_identifier, method, path, payload, expires_at, operation) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        entry.challenge_identifier,
+                        entry.method,
+                        entry.path,
+                        entry.payload,
+                        entry.expires_at,
+                        entry.operation,
+                    ),
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def pop(self, challenge_identifier: str) -> PendingChallenge | None:
+        """Atomically remove and return a pending challenge, if it has not expired."""
+        with self._lock:
+            row = self._connection.execute(
+                "DELETE FROM pending_challenges WHERE challenge_identifier = ? "
+                "RETURNING challenge_identifier, method, path, payload, expires_at, operation",
+                (challenge_identifier,),
+            ).fetchone()
+        if row is None or row[4] <= time.time():
+            return None
+        return PendingChallenge(row[0], row[1], row[2], bytes(row[3]), row[4], row[5])
+
+    def evict_expired(self) -> int:
+        """Remove expired entries."""
+        with self._lock:
+            cursor = self._connection.execute("DELETE FROM pending_challenges WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+def take_pending_challenge(store: PendingChallengeStore | None, challenge_identifier: str) -> PendingChallenge:
+    """
+    Remove and return the pending challenge to complete.
+
+    Raises:
+        DfnsError: If no store is configured, or the challenge is unknown or expired.
+    """
+    if store is None:
+        raise DfnsError(
+            message="A challenge_store must be configured in DfnsDelegatedClientConfig.",
+            error_code="CHALLENGE_STORE_REQUIRED",
+        )
+    entry = store.pop(challenge_identifier)
+    if entry is None:
+        raise DfnsError(
+            message=f"Unknown or expired challenge: {challenge_identifier}",
+            error_code="CHALLENGE_NOT_FOUND",
+        )
+    return entry
+
+
+def pending_endpoint(entry: PendingChallenge) -> tuple[Endpoint, tuple[str, ...]]:
+    """
+    Return the endpoint to complete a pending challenge with, and its path parameter values.
+
+    Challenges created by the generated ``*_init`` methods complete through their precompiled
+    endpoint, so they are timed, traced and metered under their operation and path template.
+    Others (e.g. created by calling BaseAuthApi directly) are sent to the recorded path under
+    one generic operation.
+    """
+    endpoint = find_endpoint(entry.operation) if entry.operation else None
+    if endpoint is not None and endpoint.method == entry.method:
+        path_args = endpoint.path_args(entry.path)
+        if path_args is not None:
+            return endpoint, path_args
+    return Endpoint("delegated.complete_by_challenge_id", entry.method, entry.path, requires_signature=True), ()
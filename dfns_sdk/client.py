@@ -1,27 +1,34 @@
 """Main Dfns client."""
 
-from typing import Any
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from ._internal import HttpClient
-from .generated.address_watches import AddressWatchesClient
-from .generated.agreements import AgreementsClient
-from .generated.allocations import AllocationsClient
-from .generated.auth import AuthClient
-from .generated.exchanges import ExchangesClient
-from .generated.fee_sponsors import FeeSponsorsClient
-from .generated.keys import KeysClient
-from .generated.networks import NetworksClient
-from .generated.payins import PayinsClient
-from .generated.payouts import PayoutsClient
-from .generated.permissions import PermissionsClient
-from .generated.policies import PoliciesClient
-from .generated.signers import SignersClient
-from .generated.staking import StakingClient
-from .generated.swaps import SwapsClient
-from .generated.vaults import VaultsClient
-from .generated.wallets import WalletsClient
-from .generated.webhooks import WebhooksClient
-from .types import DfnsClientConfig
+from ._internal.batch import run_batch
+from ._internal.lazy import SubClient
+from .types import BatchResult, DfnsClientConfig
+
+T = TypeVar("T")
+
+if TYPE_CHECKING:
+    from .generated.address_watches.client import AddressWatchesClient
+    from .generated.agreements.client import AgreementsClient
+    from .generated.allocations.client import AllocationsClient
+    from .generated.auth.client import AuthClient
+    from .generated.exchanges.client import ExchangesClient
+    from .generated.fee_sponsors.client import FeeSponsorsClient
+    from .generated.keys.client import KeysClient
+    from .generated.networks.client import NetworksClient
+    from .generated.payins.client import PayinsClient
+    from .generated.payouts.client import PayoutsClient
+    from .generated.permissions.client import PermissionsClient
+    from .generated.policies.client import PoliciesClient
+    from .generated.signers.client import SignersClient
+    from .generated.staking.client import StakingClient
+    from .generated.swaps.client import SwapsClient
+    from .generated.vaults.client import VaultsClient
+    from .generated.wallets.client import WalletsClient
+    from .generated.webhooks.client import WebhooksClient
 
 
 class DfnsClient:
@@ -37,24 +44,32 @@ class DfnsClient:
         >>> wallets = client.wallets.list_wallets()
     """
 
-    address_watches: AddressWatchesClient
-    agreements: AgreementsClient
-    allocations: AllocationsClient
-    auth: AuthClient
-    exchanges: ExchangesClient
-    fee_sponsors: FeeSponsorsClient
-    keys: KeysClient
-    networks: NetworksClient
-    payins: PayinsClient
-    payouts: PayoutsClient
-    permissions: PermissionsClient
-    policies: PoliciesClient
-    signers: SignersClient
-    staking: StakingClient
-    swaps: SwapsClient
-    vaults: VaultsClient
-    wallets: WalletsClient
-    webhooks: WebhooksClient
+    address_watches: SubClient["AddressWatchesClient"] = SubClient(
+        "dfns_sdk.generated.address_watches.client", "AddressWatchesClient"
+    )
+    agreements: SubClient["AgreementsClient"] = SubClient("dfns_sdk.generated.agreements.client", "AgreementsClient")
+    allocations: SubClient["AllocationsClient"] = SubClient(
+        "dfns_sdk.generated.allocations.client", "AllocationsClient"
+    )
+    auth: SubClient["AuthClient"] = SubClient("dfns_sdk.generated.auth.client", "AuthClient")
+    exchanges: SubClient["ExchangesClient"] = SubClient("dfns_sdk.generated.exchanges.client", "ExchangesClient")
+    fee_sponsors: SubClient["FeeSponsorsClient"] = SubClient(
+        "dfns_sdk.generated.fee_sponsors.client", "FeeSponsorsClient"
+    )
+    keys: SubClient["KeysClient"] = SubClient("dfns_sdk.generated.keys.client", "KeysClient")
+    networks: SubClient["NetworksClient"] = SubClient("dfns_sdk.generated.networks.client", "NetworksClient")
+    payins: SubClient["PayinsClient"] = SubClient("dfns_sdk.generated.payins.client", "PayinsClient")
+    payouts: SubClient["PayoutsClient"] = SubClient("dfns_sdk.generated.payouts.client", "PayoutsClient")
+    permissions: SubClient["PermissionsClient"] = SubClient(
+        "dfns_sdk.generated.permissions.client", "PermissionsClient"
+    )
+    policies: SubClient["PoliciesClient"] = SubClient("dfns_sdk.generated.policies.client", "PoliciesClient")
+    signers: SubClient["SignersClient"] = SubClient("dfns_sdk.generated.signers.client", "SignersClient")
+    staking: SubClient["StakingClient"] = SubClient("dfns_sdk.generated.staking.client", "StakingClient")
+    swaps: SubClient["SwapsClient"] = SubClient("dfns_sdk.generated.swaps.client", "SwapsClient")
+    vaults: SubClient["VaultsClient"] = SubClient("dfns_sdk.generated.vaults.client", "VaultsClient")
+    wallets: SubClient["WalletsClient"] = SubClient("dfns_sdk.generated.wallets.client", "WalletsClient")
+    webhooks: SubClient["WebhooksClient"] = SubClient("dfns_sdk.generated.webhooks.client", "WebhooksClient")
 
     def __init__(self, config: DfnsClientConfig):
         """
@@ -65,24 +80,33 @@ class DfnsClient:
         """
         self._config = config
         self._http = HttpClient(config)
-        self.address_watches = AddressWatchesClient(self._http)
-        self.agreements = AgreementsClient(self._http)
-        self.allocations = AllocationsClient(self._http)
-        self.auth = AuthClient(self._http)
-        self.exchanges = ExchangesClient(self._http)
-        self.fee_sponsors = FeeSponsorsClient(self._http)
-        self.keys = KeysClient(self._http)
-        self.networks = NetworksClient(self._http)
-        self.payins = PayinsClient(self._http)
-        self.payouts = PayoutsClient(self._http)
-        self.permissions = PermissionsClient(self._http)
-        self.policies = PoliciesClient(self._http)
-        self.signers = SignersClient(self._http)
-        self.staking = StakingClient(self._http)
-        self.swaps = SwapsClient(self._http)
-        self.vaults = VaultsClient(self._http)
-        self.wallets = WalletsClient(self._http)
-        self.webhooks = WebhooksClient(self._http)
+
+    def batch(self, operations: Iterable[Callable[[], T]], max_concurrency: int = 10) -> list[BatchResult[T]]:
+        """
+        Run many operations, typically signed requests, concurrently.
+
+        Each signed request takes three round trips plus a local signature before the
+        request itself; running them one after another makes a batch cost several
+        round trips per item. Here up to ``max_concurrency`` operations run at once,
+        so challenges, signatures, token exchanges and requests of different items
+        overlap. A failed item does not stop the others.
+
+        Args:
+            operations: Zero-argument callables, e.g. ``functools.partial`` of sub-client methods.
+            max_concurrency: Maximum number of operations in flight.
+
+        Returns:
+            One result per operation, in submission order.
+
+        Example:
+            >>> from functools import partial
+            >>> results = client.batch(
+            ...     [partial(client.wallets.transfer_asset, wallet_id, body) for body in transfers],
+            ...     max_concurrency=16,
+            ... )
+            >>> failed = [result for result in results if not result.ok]
+        """
+        return run_batch(operations, max_concurrency)
 
     def close(self) -> None:
         """Close the client and release resources."""
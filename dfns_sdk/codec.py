@@ -0,0 +1,103 @@
+"""JSON codecs for request and response bodies."""
+
+import json
+from typing import Any, Protocol, cast
+
+
+class JsonCodec(Protocol):
+    """Protocol for encoding request bodies and decoding response bodies."""
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode a value as compact UTF-8 JSON.
+
+        Args:
+            obj: The value to encode.
+
+        Returns:
+            The encoded JSON bytes.
+        """
+        ...
+
+    def loads(self, data: bytes | str) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: The JSON document.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+        """
+        ...
+
+
+class StdlibJsonCodec:
+    """JSON codec backed by the standard library ``json`` module (the default)."""
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """
+    JSON codec backed by orjson.
+
+    Requires the ``orjson`` package (``pip install dfns_sdk[orjson]``).
+
+    Example:
+        >>> from dfns_sdk import DfnsClientConfig
+        >>> from dfns_sdk.codec import OrjsonCodec
+        >>> config = DfnsClientConfig(auth_token="your-token", json_codec=OrjsonCodec())
+    """
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as exc:
+            raise ImportError("OrjsonCodec requires orjson: pip install dfns_sdk[orjson]") from exc
+        self._orjson: Any = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON."""
+        return cast(bytes, self._orjson.dumps(obj))
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec:
+    """
+    JSON codec backed by msgspec.
+
+    Requires the ``msgspec`` package (``pip install dfns_sdk[msgspec]``).
+    """
+
+    def __init__(self) -> None:
+        try:
+            import msgspec
+        except ImportError as exc:
+            raise ImportError("MsgspecCodec requires msgspec: pip install dfns_sdk[msgspec]") from exc
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON."""
+        return cast(bytes, self._encoder.encode(obj))
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            raise ValueError(str(exc)) from exc
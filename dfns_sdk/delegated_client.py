@@ -1,27 +1,34 @@
 """Delegated Dfns client for external signing orchestration."""
 
-from typing import Any
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any
 
 from ._internal import HttpClient
-from .generated.address_watches import DelegatedAddressWatchesClient
-from .generated.agreements import DelegatedAgreementsClient
-from .generated.allocations import DelegatedAllocationsClient
-from .generated.auth import DelegatedAuthClient
-from .generated.exchanges import DelegatedExchangesClient
-from .generated.fee_sponsors import DelegatedFeeSponsorsClient
-from .generated.keys import DelegatedKeysClient
-from .generated.networks import DelegatedNetworksClient
-from .generated.payins import DelegatedPayinsClient
-from .generated.payouts import DelegatedPayoutsClient
-from .generated.permissions import DelegatedPermissionsClient
-from .generated.policies import DelegatedPoliciesClient
-from .generated.signers import DelegatedSignersClient
-from .generated.staking import DelegatedStakingClient
-from .generated.swaps import DelegatedSwapsClient
-from .generated.vaults import DelegatedVaultsClient
-from .generated.wallets import DelegatedWalletsClient
-from .generated.webhooks import DelegatedWebhooksClient
-from .types import DfnsDelegatedClientConfig
+from ._internal.batch import Arguments, bind_complete, bind_init, run_batch
+from ._internal.lazy import SubClient
+from .base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from .challenge_store import pending_endpoint, take_pending_challenge
+from .types import BatchResult, DfnsDelegatedClientConfig
+
+if TYPE_CHECKING:
+    from .generated.address_watches.delegated_client import DelegatedAddressWatchesClient
+    from .generated.agreements.delegated_client import DelegatedAgreementsClient
+    from .generated.allocations.delegated_client import DelegatedAllocationsClient
+    from .generated.auth.delegated_client import DelegatedAuthClient
+    from .generated.exchanges.delegated_client import DelegatedExchangesClient
+    from .generated.fee_sponsors.delegated_client import DelegatedFeeSponsorsClient
+    from .generated.keys.delegated_client import DelegatedKeysClient
+    from .generated.networks.delegated_client import DelegatedNetworksClient
+    from .generated.payins.delegated_client import DelegatedPayinsClient
+    from .generated.payouts.delegated_client import DelegatedPayoutsClient
+    from .generated.permissions.delegated_client import DelegatedPermissionsClient
+    from .generated.policies.delegated_client import DelegatedPoliciesClient
+    from .generated.signers.delegated_client import DelegatedSignersClient
+    from .generated.staking.delegated_client import DelegatedStakingClient
+    from .generated.swaps.delegated_client import DelegatedSwapsClient
+    from .generated.vaults.delegated_client import DelegatedVaultsClient
+    from .generated.wallets.delegated_client import DelegatedWalletsClient
+    from .generated.webhooks.delegated_client import DelegatedWebhooksClient
 
 
 class DfnsDelegatedClient:
@@ -50,27 +57,64 @@ class DfnsDelegatedClient:
         ...         "challengeIdentifier": challenge["challengeIdentifier"],
         ...         "firstFactor": signed,
         ...     },
+        ...     prepared=challenge,  # send exactly the challenged payload
         ... )
     """
 
-    address_watches: DelegatedAddressWatchesClient
-    agreements: DelegatedAgreementsClient
-    allocations: DelegatedAllocationsClient
-    auth: DelegatedAuthClient
-    exchanges: DelegatedExchangesClient
-    fee_sponsors: DelegatedFeeSponsorsClient
-    keys: DelegatedKeysClient
-    networks: DelegatedNetworksClient
-    payins: DelegatedPayinsClient
-    payouts: DelegatedPayoutsClient
-    permissions: DelegatedPermissionsClient
-    policies: DelegatedPoliciesClient
-    signers: DelegatedSignersClient
-    staking: DelegatedStakingClient
-    swaps: DelegatedSwapsClient
-    vaults: DelegatedVaultsClient
-    wallets: DelegatedWalletsClient
-    webhooks: DelegatedWebhooksClient
+    address_watches: SubClient["DelegatedAddressWatchesClient"] = SubClient(
+        "dfns_sdk.generated.address_watches.delegated_client", "DelegatedAddressWatchesClient"
+    )
+    agreements: SubClient["DelegatedAgreementsClient"] = SubClient(
+        "dfns_sdk.generated.agreements.delegated_client", "DelegatedAgreementsClient"
+    )
+    allocations: SubClient["DelegatedAllocationsClient"] = SubClient(
+        "dfns_sdk.generated.allocations.delegated_client", "DelegatedAllocationsClient"
+    )
+    auth: SubClient["DelegatedAuthClient"] = SubClient(
+        "dfns_sdk.generated.auth.delegated_client", "DelegatedAuthClient"
+    )
+    exchanges: SubClient["DelegatedExchangesClient"] = SubClient(
+        "dfns_sdk.generated.exchanges.delegated_client", "DelegatedExchangesClient"
+    )
+    fee_sponsors: SubClient["DelegatedFeeSponsorsClient"] = SubClient(
+        "dfns_sdk.generated.fee_sponsors.delegated_client", "DelegatedFeeSponsorsClient"
+    )
+    keys: SubClient["DelegatedKeysClient"] = SubClient(
+        "dfns_sdk.generated.keys.delegated_client", "DelegatedKeysClient"
+    )
+    networks: SubClient["DelegatedNetworksClient"] = SubClient(
+        "dfns_sdk.generated.networks.delegated_client", "DelegatedNetworksClient"
+    )
+    payins: SubClient["DelegatedPayinsClient"] = SubClient(
+        "dfns_sdk.generated.payins.delegated_client", "DelegatedPayinsClient"
+    )
+    payouts: SubClient["DelegatedPayoutsClient"] = SubClient(
+        "dfns_sdk.generated.payouts.delegated_client", "DelegatedPayoutsClient"
+    )
+    permissions: SubClient["DelegatedPermissionsClient"] = SubClient(
+        "dfns_sdk.generated.permissions.delegated_client", "DelegatedPermissionsClient"
+    )
+    policies: SubClient["DelegatedPoliciesClient"] = SubClient(
+        "dfns_sdk.generated.policies.delegated_client", "DelegatedPoliciesClient"
+    )
+    signers: SubClient["DelegatedSignersClient"] = SubClient(
+        "dfns_sdk.generated.signers.delegated_client", "DelegatedSignersClient"
+    )
+    staking: SubClient["DelegatedStakingClient"] = SubClient(
+        "dfns_sdk.generated.staking.delegated_client", "DelegatedStakingClient"
+    )
+    swaps: SubClient["DelegatedSwapsClient"] = SubClient(
+        "dfns_sdk.generated.swaps.delegated_client", "DelegatedSwapsClient"
+    )
+    vaults: SubClient["DelegatedVaultsClient"] = SubClient(
+        "dfns_sdk.generated.vaults.delegated_client", "DelegatedVaultsClient"
+    )
+    wallets: SubClient["DelegatedWalletsClient"] = SubClient(
+        "dfns_sdk.generated.wallets.delegated_client", "DelegatedWalletsClient"
+    )
+    webhooks: SubClient["DelegatedWebhooksClient"] = SubClient(
+        "dfns_sdk.generated.webhooks.delegated_client", "DelegatedWebhooksClient"
+    )
 
     def __init__(self, config: DfnsDelegatedClientConfig):
         """
@@ -81,24 +125,100 @@ class DfnsDelegatedClient:
         """
         self._config = config
         self._http = HttpClient(config)
-        self.address_watches = DelegatedAddressWatchesClient(self._http)
-        self.agreements = DelegatedAgreementsClient(self._http)
-        self.allocations = DelegatedAllocationsClient(self._http)
-        self.auth = DelegatedAuthClient(self._http)
-        self.exchanges = DelegatedExchangesClient(self._http)
-        self.fee_sponsors = DelegatedFeeSponsorsClient(self._http)
-        self.keys = DelegatedKeysClient(self._http)
-        self.networks = DelegatedNetworksClient(self._http)
-        self.payins = DelegatedPayinsClient(self._http)
-        self.payouts = DelegatedPayoutsClient(self._http)
-        self.permissions = DelegatedPermissionsClient(self._http)
-        self.policies = DelegatedPoliciesClient(self._http)
-        self.signers = DelegatedSignersClient(self._http)
-        self.staking = DelegatedStakingClient(self._http)
-        self.swaps = DelegatedSwapsClient(self._http)
-        self.vaults = DelegatedVaultsClient(self._http)
-        self.wallets = DelegatedWalletsClient(self._http)
-        self.webhooks = DelegatedWebhooksClient(self._http)
+
+    def init_batch(
+        self,
+        operations: Iterable[tuple[Callable[..., Any], Arguments]],
+        max_concurrency: int = 10,
+    ) -> list[BatchResult[PreparedAction]]:
+        """
+        Create the challenges of many operations concurrently.
+
+        Args:
+            operations: ``(init_method, arguments)`` pairs, where ``init_method`` is a
+                sub-client ``*_init`` method and ``arguments`` its positional arguments
+                (a sequence) or keyword arguments (a mapping).
+            max_concurrency: Maximum number of challenge requests in flight.
+
+        Returns:
+            One result per operation, in submission order, holding its challenge.
+
+        Example:
+            >>> operations = [(client.payouts.create_payout_init, {"body": body}) for body in payouts]
+            >>> challenges = client.init_batch(operations)
+            >>> signed = your_hsm.sign_all([c.value for c in challenges if c.ok])
+        """
+        calls = [bind_init(operation, arguments) for operation, arguments in operations]
+        return run_batch(calls, max_concurrency)
+
+    def complete_batch(
+        self,
+        operations: Sequence[tuple[Callable[..., Any], Arguments]],
+        signed_challenges: Sequence[SignUserActionChallengeRequest | None],
+        challenges: Sequence[BatchResult[PreparedAction]] | None = None,
+        max_concurrency: int = 10,
+    ) -> list[BatchResult[Any]]:
+        """
+        Complete many operations concurrently with their signed challenges.
+
+        Each item exchanges its signed challenge for a user action token and sends the
+        request, with at most ``max_concurrency`` items in flight.
+
+        Args:
+            operations: The same ``(init_method, arguments)`` pairs passed to init_batch();
+                the matching ``*_complete`` method is called with the same arguments.
+            signed_challenges: The signed challenge of each operation, in the same order
+                (None for operations to skip, which then fail with ValueError).
+            challenges: The results of init_batch(), in the same order. Each prepared
+                action is passed to its ``*_complete`` method, so the exact challenged
+                payload is sent without encoding the body again.
+            max_concurrency: Maximum number of operations in flight.
+
+        Returns:
+            One result per operation, in submission order, holding its API response.
+
+        Raises:
+            ValueError: If the sequences differ in length.
+        """
+        if len(operations) != len(signed_challenges) or (challenges is not None and len(challenges) != len(operations)):
+            raise ValueError("operations, signed_challenges and challenges must have the same length")
+        prepared = [challenge.value for challenge in challenges] if challenges is not None else [None] * len(operations)
+        calls = [
+            bind_complete(operation, arguments, signed, action)
+            for (operation, arguments), signed, action in zip(operations, signed_challenges, prepared, strict=True)
+        ]
+        return run_batch(calls, max_concurrency)
+
+    def complete_by_challenge_id(self, signed_challenge: SignUserActionChallengeRequest) -> Any:
+        """
+        Complete an action from its signed challenge alone.
+
+        The operation, method, path and payload recorded by the ``*_init`` call are read
+        back from the configured ``challenge_store``, so any worker sharing the store can
+        finish the action. Each challenge can be completed once.
+
+        Args:
+            signed_challenge: The signed challenge, including its challengeIdentifier.
+
+        Returns:
+            The API response.
+
+        Raises:
+            DfnsError: If no store is configured, or the challenge is unknown or expired.
+        """
+        store = self._config.challenge_store
+        entry = take_pending_challenge(store, signed_challenge["challengeIdentifier"])
+        endpoint, path_args = pending_endpoint(entry)
+        try:
+            result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge, endpoint.operation)
+        except Exception:
+            # The action itself was not sent, so keep it completable.
+            if store is not None:
+                store.put(entry)
+            raise
+        return self._http.call_with_user_action(
+            endpoint, *path_args, user_action=result["userAction"], content=entry.payload or None
+        )
 
     def close(self) -> None:
         """Close the client and release resources."""
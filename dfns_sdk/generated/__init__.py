@@ -1,59 +1,213 @@
 """Generated domain clients."""
 
-from .address_watches import AddressWatchesClient, DelegatedAddressWatchesClient
-from .agreements import AgreementsClient, DelegatedAgreementsClient
-from .allocations import AllocationsClient, DelegatedAllocationsClient
-from .auth import AuthClient, DelegatedAuthClient
-from .exchanges import DelegatedExchangesClient, ExchangesClient
-from .fee_sponsors import DelegatedFeeSponsorsClient, FeeSponsorsClient
-from .keys import DelegatedKeysClient, KeysClient
-from .networks import DelegatedNetworksClient, NetworksClient
-from .payins import DelegatedPayinsClient, PayinsClient
-from .payouts import DelegatedPayoutsClient, PayoutsClient
-from .permissions import DelegatedPermissionsClient, PermissionsClient
-from .policies import DelegatedPoliciesClient, PoliciesClient
-from .signers import DelegatedSignersClient, SignersClient
-from .staking import DelegatedStakingClient, StakingClient
-from .swaps import DelegatedSwapsClient, SwapsClient
-from .vaults import DelegatedVaultsClient, VaultsClient
-from .wallets import DelegatedWalletsClient, WalletsClient
-from .webhooks import DelegatedWebhooksClient, WebhooksClient
+from typing import TYPE_CHECKING, Any
+
+from .._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from .address_watches import (
+        AddressWatchesClient,
+        AsyncAddressWatchesClient,
+        AsyncDelegatedAddressWatchesClient,
+        DelegatedAddressWatchesClient,
+    )
+    from .agreements import (
+        AgreementsClient,
+        AsyncAgreementsClient,
+        AsyncDelegatedAgreementsClient,
+        DelegatedAgreementsClient,
+    )
+    from .allocations import (
+        AllocationsClient,
+        AsyncAllocationsClient,
+        AsyncDelegatedAllocationsClient,
+        DelegatedAllocationsClient,
+    )
+    from .auth import AsyncAuthClient, AsyncDelegatedAuthClient, AuthClient, DelegatedAuthClient
+    from .exchanges import (
+        AsyncDelegatedExchangesClient,
+        AsyncExchangesClient,
+        DelegatedExchangesClient,
+        ExchangesClient,
+    )
+    from .fee_sponsors import (
+        AsyncDelegatedFeeSponsorsClient,
+        AsyncFeeSponsorsClient,
+        DelegatedFeeSponsorsClient,
+        FeeSponsorsClient,
+    )
+    from .keys import AsyncDelegatedKeysClient, AsyncKeysClient, DelegatedKeysClient, KeysClient
+    from .networks import AsyncDelegatedNetworksClient, AsyncNetworksClient, DelegatedNetworksClient, NetworksClient
+    from .payins import AsyncDelegatedPayinsClient, AsyncPayinsClient, DelegatedPayinsClient, PayinsClient
+    from .payouts import AsyncDelegatedPayoutsClient, AsyncPayoutsClient, DelegatedPayoutsClient, PayoutsClient
+    from .permissions import (
+        AsyncDelegatedPermissionsClient,
+        AsyncPermissionsClient,
+        DelegatedPermissionsClient,
+        PermissionsClient,
+    )
+    from .policies import AsyncDelegatedPoliciesClient, AsyncPoliciesClient, DelegatedPoliciesClient, PoliciesClient
+    from .signers import AsyncDelegatedSignersClient, AsyncSignersClient, DelegatedSignersClient, SignersClient
+    from .staking import AsyncDelegatedStakingClient, AsyncStakingClient, DelegatedStakingClient, StakingClient
+    from .swaps import AsyncDelegatedSwapsClient, AsyncSwapsClient, DelegatedSwapsClient, SwapsClient
+    from .vaults import AsyncDelegatedVaultsClient, AsyncVaultsClient, DelegatedVaultsClient, VaultsClient
+    from .wallets import AsyncDelegatedWalletsClient, AsyncWalletsClient, DelegatedWalletsClient, WalletsClient
+    from .webhooks import AsyncDelegatedWebhooksClient, AsyncWebhooksClient, DelegatedWebhooksClient, WebhooksClient
+
+_EXPORTS = {
+    "AddressWatchesClient": ".address_watches",
+    "DelegatedAddressWatchesClient": ".address_watches",
+    "AsyncAddressWatchesClient": ".address_watches",
+    "AsyncDelegatedAddressWatchesClient": ".address_watches",
+    "AgreementsClient": ".agreements",
+    "DelegatedAgreementsClient": ".agreements",
+    "AsyncAgreementsClient": ".agreements",
+    "AsyncDelegatedAgreementsClient": ".agreements",
+    "AllocationsClient": ".allocations",
+    "DelegatedAllocationsClient": ".allocations",
+    "AsyncAllocationsClient": ".allocations",
+    "AsyncDelegatedAllocationsClient": ".allocations",
+    "AuthClient": ".auth",
+    "DelegatedAuthClient": ".auth",
+    "AsyncAuthClient": ".auth",
+    "AsyncDelegatedAuthClient": ".auth",
+    "ExchangesClient": ".exchanges",
+    "DelegatedExchangesClient": ".exchanges",
+    "AsyncExchangesClient": ".exchanges",
+    "AsyncDelegatedExchangesClient": ".exchanges",
+    "FeeSponsorsClient": ".fee_sponsors",
+    "DelegatedFeeSponsorsClient": ".fee_sponsors",
+    "AsyncFeeSponsorsClient": ".fee_sponsors",
+    "AsyncDelegatedFeeSponsorsClient": ".fee_sponsors",
+    "KeysClient": ".keys",
+    "DelegatedKeysClient": ".keys",
+    "AsyncKeysClient": ".keys",
+    "AsyncDelegatedKeysClient": ".keys",
+    "NetworksClient": ".networks",
+    "DelegatedNetworksClient": ".networks",
+    "AsyncNetworksClient": ".networks",
+    "AsyncDelegatedNetworksClient": ".networks",
+    "PayinsClient": ".payins",
+    "DelegatedPayinsClient": ".payins",
+    "AsyncPayinsClient": ".payins",
+    "AsyncDelegatedPayinsClient": ".payins",
+    "PayoutsClient": ".payouts",
+    "DelegatedPayoutsClient": ".payouts",
+    "AsyncPayoutsClient": ".payouts",
+    "AsyncDelegatedPayoutsClient": ".payouts",
+    "PermissionsClient": ".permissions",
+    "DelegatedPermissionsClient": ".permissions",
+    "AsyncPermissionsClient": ".permissions",
+    "AsyncDelegatedPermissionsClient": ".permissions",
+    "PoliciesClient": ".policies",
+    "DelegatedPoliciesClient": ".policies",
+    "AsyncPoliciesClient": ".policies",
+    "AsyncDelegatedPoliciesClient": ".policies",
+    "SignersClient": ".signers",
+    "DelegatedSignersClient": ".signers",
+    "AsyncSignersClient": ".signers",
+    "AsyncDelegatedSignersClient": ".signers",
+    "StakingClient": ".staking",
+    "DelegatedStakingClient": ".staking",
+    "AsyncStakingClient": ".staking",
+    "AsyncDelegatedStakingClient": ".staking",
+    "SwapsClient": ".swaps",
+    "DelegatedSwapsClient": ".swaps",
+    "AsyncSwapsClient": ".swaps",
+    "AsyncDelegatedSwapsClient": ".swaps",
+    "VaultsClient": ".vaults",
+    "DelegatedVaultsClient": ".vaults",
+    "AsyncVaultsClient": ".vaults",
+    "AsyncDelegatedVaultsClient": ".vaults",
+    "WalletsClient": ".wallets",
+    "DelegatedWalletsClient": ".wallets",
+    "AsyncWalletsClient": ".wallets",
+    "AsyncDelegatedWalletsClient": ".wallets",
+    "WebhooksClient": ".webhooks",
+    "DelegatedWebhooksClient": ".webhooks",
+    "AsyncWebhooksClient": ".webhooks",
+    "AsyncDelegatedWebhooksClient": ".webhooks",
+}
 
 __all__ = [
     "AddressWatchesClient",
     "DelegatedAddressWatchesClient",
+    "AsyncAddressWatchesClient",
+    "AsyncDelegatedAddressWatchesClient",
     "AgreementsClient",
     "DelegatedAgreementsClient",
+    "AsyncAgreementsClient",
+    "AsyncDelegatedAgreementsClient",
     "AllocationsClient",
     "DelegatedAllocationsClient",
+    "AsyncAllocationsClient",
+    "AsyncDelegatedAllocationsClient",
     "AuthClient",
     "DelegatedAuthClient",
+    "AsyncAuthClient",
+    "AsyncDelegatedAuthClient",
     "ExchangesClient",
     "DelegatedExchangesClient",
+    "AsyncExchangesClient",
+    "AsyncDelegatedExchangesClient",
     "FeeSponsorsClient",
     "DelegatedFeeSponsorsClient",
+    "AsyncFeeSponsorsClient",
+    "AsyncDelegatedFeeSponsorsClient",
     "KeysClient",
     "DelegatedKeysClient",
+    "AsyncKeysClient",
+    "AsyncDelegatedKeysClient",
     "NetworksClient",
     "DelegatedNetworksClient",
+    "AsyncNetworksClient",
+    "AsyncDelegatedNetworksClient",
     "PayinsClient",
     "DelegatedPayinsClient",
+    "AsyncPayinsClient",
+    "AsyncDelegatedPayinsClient",
     "PayoutsClient",
     "DelegatedPayoutsClient",
+    "AsyncPayoutsClient",
+    "AsyncDelegatedPayoutsClient",
     "PermissionsClient",
     "DelegatedPermissionsClient",
+    "AsyncPermissionsClient",
+    "AsyncDelegatedPermissionsClient",
     "PoliciesClient",
     "DelegatedPoliciesClient",
+    "AsyncPoliciesClient",
+    "AsyncDelegatedPoliciesClient",
     "SignersClient",
     "DelegatedSignersClient",
+    "AsyncSignersClient",
+    "AsyncDelegatedSignersClient",
     "StakingClient",
     "DelegatedStakingClient",
+    "AsyncStakingClient",
+    "AsyncDelegatedStakingClient",
     "SwapsClient",
     "DelegatedSwapsClient",
+    "AsyncSwapsClient",
+    "AsyncDelegatedSwapsClient",
     "VaultsClient",
     "DelegatedVaultsClient",
+    "AsyncVaultsClient",
+    "AsyncDelegatedVaultsClient",
     "WalletsClient",
     "DelegatedWalletsClient",
+    "AsyncWalletsClient",
+    "AsyncDelegatedWalletsClient",
     "WebhooksClient",
     "DelegatedWebhooksClient",
+    "AsyncWebhooksClient",
+    "AsyncDelegatedWebhooksClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
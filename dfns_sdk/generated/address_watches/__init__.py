@@ -1,7 +1,36 @@
 """AddressWatches domain module."""
 
-from . import types
-from .client import AddressWatchesClient
-from .delegated_client import DelegatedAddressWatchesClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["AddressWatchesClient", "DelegatedAddressWatchesClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncAddressWatchesClient
+    from .async_delegated_client import AsyncDelegatedAddressWatchesClient
+    from .client import AddressWatchesClient
+    from .delegated_client import DelegatedAddressWatchesClient
+
+_EXPORTS = {
+    "AddressWatchesClient": ".client",
+    "DelegatedAddressWatchesClient": ".delegated_client",
+    "AsyncAddressWatchesClient": ".async_client",
+    "AsyncDelegatedAddressWatchesClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = [
+    "AddressWatchesClient",
+    "DelegatedAddressWatchesClient",
+    "AsyncAddressWatchesClient",
+    "AsyncDelegatedAddressWatchesClient",
+    "types",
+]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,220 @@
+"""Async client for the address_watches domain."""
+
+from collections.abc import AsyncIterator, Collection
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items, aiter_streamed_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncAddressWatchesClient:
+    """Async client for address_watches operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_address_watches(
+        self, query: T.ListAddressWatchesQuery | None = None
+    ) -> T.ListAddressWatchesResponse:
+        """
+        List Address Watches.
+
+        Retrieves the list of address watches in your organization. Pagination is supported via limit and paginationToken parameters.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListAddressWatchesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ADDRESS_WATCHES, query_params=query)
+        return cast(T.ListAddressWatchesResponse, response)
+
+    def aiter_address_watches(
+        self, query: T.ListAddressWatchesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListAddressWatchesItem]:
+        """
+        Iterate over List Address Watches.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListAddressWatchesItem]: The items of every page.
+        """
+        return aiter_items(self.list_address_watches, query, page_size)
+
+    async def create_address_watch(self, body: T.CreateAddressWatchRequest) -> T.CreateAddressWatchResponse:
+        """
+                Create Address Watch.
+
+                Registers an on chain address to watch. An address watch is not controlled by Dfns: it holds no key, it cannot sign or move funds. The indexer matches on chain activity touching the address and sends the corresponding webhooks.
+
+        The address must already exist on chain and is normalized to the form the indexer matches on (lowercase for EVM networks). Only networks that support address watches are accepted. A given address can only be watched once per network within an organization while the watch is Active.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateAddressWatchResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_ADDRESS_WATCH, body=body)
+        return cast(T.CreateAddressWatchResponse, response)
+
+    async def get_address_watch(self, address_watch_id: str) -> T.GetAddressWatchResponse:
+        """
+        Get Address Watch.
+
+        Retrieves an address watch by its ID.
+
+        Args:
+            address_watch_id: The address watch to retrieve.
+
+        Returns:
+            T.GetAddressWatchResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_ADDRESS_WATCH, address_watch_id)
+        return cast(T.GetAddressWatchResponse, response)
+
+    async def get_address_watch_assets(
+        self, address_watch_id: str, query: T.GetAddressWatchAssetsQuery | None = None
+    ) -> T.GetAddressWatchAssetsResponse:
+        """
+        Get Address Watch Assets.
+
+        Retrieves the list of assets held by the address watch, as tracked by the indexer. Balances are tracked from the moment the watch is created.
+
+        Args:
+            address_watch_id: The address watch to retrieve the assets of.
+            query: Query parameters.
+
+        Returns:
+            T.GetAddressWatchAssetsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_ADDRESS_WATCH_ASSETS, address_watch_id, query_params=query)
+        return cast(T.GetAddressWatchAssetsResponse, response)
+
+    async def get_address_watch_blockchain_events(
+        self, address_watch_id: str, query: T.GetAddressWatchBlockchainEventsQuery | None = None
+    ) -> T.GetAddressWatchBlockchainEventsResponse:
+        """
+                Get Address Watch Blockchain Events.
+
+                Retrieves a list of decoded blockchain events indexed for the specified address watch.
+
+        Blockchain events are not value transfers: asset and token transfers are listed by
+        [Get Address Watch History](https://docs.dfns.co/api-reference/address-watches/get-address-watch-history) instead.
+        Events from the same transaction share the same `txHash` across both lists.
+
+        Items are sorted by descending block number; within one block the item order is not the on-chain
+        order. `index` is the block scoped log index as a decimal string: sort by `blockNumber` and the
+        numeric value of `index` to recover the on-chain order. Webhook delivery is at-least-once and
+        unordered; use `id` to deduplicate.
+
+                Args:
+                    address_watch_id: Address watch you want to get the blockchain events from.
+                    query: Query parameters.
+
+                Returns:
+                    T.GetAddressWatchBlockchainEventsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_ADDRESS_WATCH_BLOCKCHAIN_EVENTS, address_watch_id, query_params=query)
+        return cast(T.GetAddressWatchBlockchainEventsResponse, response)
+
+    def aiter_address_watch_blockchain_events(
+        self,
+        address_watch_id: str,
+        query: T.GetAddressWatchBlockchainEventsQuery | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[T.GetAddressWatchBlockchainEventsItem]:
+        """
+        Iterate over Get Address Watch Blockchain Events.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            address_watch_id: Address watch you want to get the blockchain events from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.GetAddressWatchBlockchainEventsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.get_address_watch_blockchain_events(address_watch_id, q), query, page_size)
+
+    async def get_address_watch_history(
+        self, address_watch_id: str, query: T.GetAddressWatchHistoryQuery | None = None
+    ) -> T.GetAddressWatchHistoryResponse:
+        """
+                Get Address Watch History.
+
+                Retrieves the list of indexed on chain activities for the specified address watch.
+
+        The list reflects the indexed on chain activity from the moment the watch was created. Events from before the watch are not backfilled.
+
+                Args:
+                    address_watch_id: Address watch you want to get the history from.
+                    query: Query parameters.
+
+                Returns:
+                    T.GetAddressWatchHistoryResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_ADDRESS_WATCH_HISTORY, address_watch_id, query_params=query)
+        return cast(T.GetAddressWatchHistoryResponse, response)
+
+    def aiter_address_watch_history(
+        self, address_watch_id: str, query: T.GetAddressWatchHistoryQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.GetAddressWatchHistoryItem]:
+        """
+        Iterate over Get Address Watch History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            address_watch_id: Address watch you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.GetAddressWatchHistoryItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.get_address_watch_history(address_watch_id, q), query, page_size)
+
+    def astream_address_watch_history(
+        self,
+        address_watch_id: str,
+        query: T.GetAddressWatchHistoryQuery | None = None,
+        page_size: int | None = None,
+        fields: Collection[str] | None = None,
+    ) -> AsyncIterator[T.GetAddressWatchHistoryItem]:
+        """
+        Stream Get Address Watch History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            address_watch_id: Address watch you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            AsyncIterator[T.GetAddressWatchHistoryItem]: The decoded items.
+        """
+        return aiter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.GET_ADDRESS_WATCH_HISTORY,
+                address_watch_id,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
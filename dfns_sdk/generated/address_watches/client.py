@@ -1,8 +1,11 @@
 """Client for the address_watches domain."""
 
+from collections.abc import Collection, Iterator
 from typing import cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items, iter_streamed_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,16 +27,26 @@ class AddressWatchesClient:
         Returns:
             T.ListAddressWatchesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/address-watches",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ADDRESS_WATCHES, query_params=query)
         return cast(T.ListAddressWatchesResponse, response)
 
+    def iter_address_watches(
+        self, query: T.ListAddressWatchesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListAddressWatchesItem]:
+        """
+        Iterate over List Address Watches.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListAddressWatchesItem]: The items of every page.
+        """
+        return iter_items(self.list_address_watches, query, page_size)
+
     def create_address_watch(self, body: T.CreateAddressWatchRequest) -> T.CreateAddressWatchResponse:
         """
                 Create Address Watch.
@@ -48,14 +61,7 @@ class AddressWatchesClient:
                 Returns:
                     T.CreateAddressWatchResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/address-watches",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_ADDRESS_WATCH, body=body)
         return cast(T.CreateAddressWatchResponse, response)
 
     def get_address_watch(self, address_watch_id: str) -> T.GetAddressWatchResponse:
@@ -70,14 +76,7 @@ class AddressWatchesClient:
         Returns:
             T.GetAddressWatchResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/address-watches/{addressWatchId}",
-            path_params={"addressWatchId": address_watch_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ADDRESS_WATCH, address_watch_id)
         return cast(T.GetAddressWatchResponse, response)
 
     def get_address_watch_assets(
@@ -95,14 +94,7 @@ class AddressWatchesClient:
         Returns:
             T.GetAddressWatchAssetsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/address-watches/{addressWatchId}/assets",
-            path_params={"addressWatchId": address_watch_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ADDRESS_WATCH_ASSETS, address_watch_id, query_params=query)
         return cast(T.GetAddressWatchAssetsResponse, response)
 
     def get_address_watch_blockchain_events(
@@ -129,16 +121,30 @@ class AddressWatchesClient:
                 Returns:
                     T.GetAddressWatchBlockchainEventsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/address-watches/{addressWatchId}/blockchain-events",
-            path_params={"addressWatchId": address_watch_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ADDRESS_WATCH_BLOCKCHAIN_EVENTS, address_watch_id, query_params=query)
         return cast(T.GetAddressWatchBlockchainEventsResponse, response)
 
+    def iter_address_watch_blockchain_events(
+        self,
+        address_watch_id: str,
+        query: T.GetAddressWatchBlockchainEventsQuery | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[T.GetAddressWatchBlockchainEventsItem]:
+        """
+        Iterate over Get Address Watch Blockchain Events.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            address_watch_id: Address watch you want to get the blockchain events from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.GetAddressWatchBlockchainEventsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.get_address_watch_blockchain_events(address_watch_id, q), query, page_size)
+
     def get_address_watch_history(
         self, address_watch_id: str, query: T.GetAddressWatchHistoryQuery | None = None
     ) -> T.GetAddressWatchHistoryResponse:
@@ -156,12 +162,57 @@ class AddressWatchesClient:
                 Returns:
                     T.GetAddressWatchHistoryResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/address-watches/{addressWatchId}/history",
-            path_params={"addressWatchId": address_watch_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ADDRESS_WATCH_HISTORY, address_watch_id, query_params=query)
         return cast(T.GetAddressWatchHistoryResponse, response)
+
+    def iter_address_watch_history(
+        self, address_watch_id: str, query: T.GetAddressWatchHistoryQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.GetAddressWatchHistoryItem]:
+        """
+        Iterate over Get Address Watch History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            address_watch_id: Address watch you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.GetAddressWatchHistoryItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.get_address_watch_history(address_watch_id, q), query, page_size)
+
+    def stream_address_watch_history(
+        self,
+        address_watch_id: str,
+        query: T.GetAddressWatchHistoryQuery | None = None,
+        page_size: int | None = None,
+        fields: Collection[str] | None = None,
+    ) -> Iterator[T.GetAddressWatchHistoryItem]:
+        """
+        Stream Get Address Watch History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            address_watch_id: Address watch you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            Iterator[T.GetAddressWatchHistoryItem]: The decoded items.
+        """
+        return iter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.GET_ADDRESS_WATCH_HISTORY,
+                address_watch_id,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
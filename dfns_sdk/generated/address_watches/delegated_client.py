@@ -1,10 +1,12 @@
 """Delegated client for the address_watches domain."""
 
-import json
+from collections.abc import Collection, Iterator
 from typing import cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items, iter_streamed_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,27 @@ class DelegatedAddressWatchesClient:
         Returns:
             T.ListAddressWatchesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/address-watches",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ADDRESS_WATCHES, query_params=query)
         return cast(T.ListAddressWatchesResponse, response)
 
-    def create_address_watch_init(self, body: T.CreateAddressWatchRequest) -> UserActionChallengeResponse:
+    def iter_address_watches(
+        self, query: T.ListAddressWatchesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListAddressWatchesItem]:
+        """
+        Iterate over List Address Watches.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListAddressWatchesItem]: The items of every page.
+        """
+        return iter_items(self.list_address_watches, query, page_size)
+
+    def create_address_watch_init(self, body: T.CreateAddressWatchRequest) -> PreparedAction:
         """
         Initialize Create Address Watch.
 
@@ -51,20 +63,15 @@ class DelegatedAddressWatchesClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/address-watches"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_ADDRESS_WATCH, E.CREATE_ADDRESS_WATCH.path, body)
 
     def create_address_watch_complete(
-        self, body: T.CreateAddressWatchRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateAddressWatchRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateAddressWatchResponse:
         """
         Complete Create Address Watch.
@@ -74,20 +81,19 @@ class DelegatedAddressWatchesClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_address_watch_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateAddressWatchResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ADDRESS_WATCH.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/address-watches",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_ADDRESS_WATCH, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateAddressWatchResponse, response)
 
@@ -103,14 +109,7 @@ class DelegatedAddressWatchesClient:
         Returns:
             T.GetAddressWatchResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/address-watches/{addressWatchId}",
-            path_params={"addressWatchId": address_watch_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ADDRESS_WATCH, address_watch_id)
         return cast(T.GetAddressWatchResponse, response)
 
     def get_address_watch_assets(
@@ -128,14 +127,7 @@ class DelegatedAddressWatchesClient:
         Returns:
             T.GetAddressWatchAssetsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/address-watches/{addressWatchId}/assets",
-            path_params={"addressWatchId": address_watch_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ADDRESS_WATCH_ASSETS, address_watch_id, query_params=query)
         return cast(T.GetAddressWatchAssetsResponse, response)
 
     def get_address_watch_blockchain_events(
@@ -162,16 +154,30 @@ class DelegatedAddressWatchesClient:
                 Returns:
                     T.GetAddressWatchBlockchainEventsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/address-watches/{addressWatchId}/blockchain-events",
-            path_params={"addressWatchId": address_watch_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ADDRESS_WATCH_BLOCKCHAIN_EVENTS, address_watch_id, query_params=query)
         return cast(T.GetAddressWatchBlockchainEventsResponse, response)
 
+    def iter_address_watch_blockchain_events(
+        self,
+        address_watch_id: str,
+        query: T.GetAddressWatchBlockchainEventsQuery | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[T.GetAddressWatchBlockchainEventsItem]:
+        """
+        Iterate over Get Address Watch Blockchain Events.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            address_watch_id: Address watch you want to get the blockchain events from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.GetAddressWatchBlockchainEventsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.get_address_watch_blockchain_events(address_watch_id, q), query, page_size)
+
     def get_address_watch_history(
         self, address_watch_id: str, query: T.GetAddressWatchHistoryQuery | None = None
     ) -> T.GetAddressWatchHistoryResponse:
@@ -189,12 +195,57 @@ class DelegatedAddressWatchesClient:
                 Returns:
                     T.GetAddressWatchHistoryResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/address-watches/{addressWatchId}/history",
-            path_params={"addressWatchId": address_watch_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ADDRESS_WATCH_HISTORY, address_watch_id, query_params=query)
         return cast(T.GetAddressWatchHistoryResponse, response)
+
+    def iter_address_watch_history(
+        self, address_watch_id: str, query: T.GetAddressWatchHistoryQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.GetAddressWatchHistoryItem]:
+        """
+        Iterate over Get Address Watch History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            address_watch_id: Address watch you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.GetAddressWatchHistoryItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.get_address_watch_history(address_watch_id, q), query, page_size)
+
+    def stream_address_watch_history(
+        self,
+        address_watch_id: str,
+        query: T.GetAddressWatchHistoryQuery | None = None,
+        page_size: int | None = None,
+        fields: Collection[str] | None = None,
+    ) -> Iterator[T.GetAddressWatchHistoryItem]:
+        """
+        Stream Get Address Watch History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            address_watch_id: Address watch you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            Iterator[T.GetAddressWatchHistoryItem]: The decoded items.
+        """
+        return iter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.GET_ADDRESS_WATCH_HISTORY,
+                address_watch_id,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
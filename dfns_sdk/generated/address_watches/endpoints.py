@@ -0,0 +1,38 @@
+"""Endpoint registry for the address_watches domain."""
+
+from ..._internal.endpoint import Endpoint
+
+LIST_ADDRESS_WATCHES = Endpoint(
+    "address_watches.list_address_watches", "GET", "/address-watches", response_type="ListAddressWatchesResponse"
+)
+CREATE_ADDRESS_WATCH = Endpoint(
+    "address_watches.create_address_watch",
+    "POST",
+    "/address-watches",
+    requires_signature=True,
+    response_type="CreateAddressWatchResponse",
+)
+GET_ADDRESS_WATCH = Endpoint(
+    "address_watches.get_address_watch",
+    "GET",
+    "/address-watches/{addressWatchId}",
+    response_type="GetAddressWatchResponse",
+)
+GET_ADDRESS_WATCH_ASSETS = Endpoint(
+    "address_watches.get_address_watch_assets",
+    "GET",
+    "/address-watches/{addressWatchId}/assets",
+    response_type="GetAddressWatchAssetsResponse",
+)
+GET_ADDRESS_WATCH_BLOCKCHAIN_EVENTS = Endpoint(
+    "address_watches.get_address_watch_blockchain_events",
+    "GET",
+    "/address-watches/{addressWatchId}/blockchain-events",
+    response_type="GetAddressWatchBlockchainEventsResponse",
+)
+GET_ADDRESS_WATCH_HISTORY = Endpoint(
+    "address_watches.get_address_watch_history",
+    "GET",
+    "/address-watches/{addressWatchId}/history",
+    response_type="GetAddressWatchHistoryResponse",
+)
@@ -4,11 +4,14 @@ from typing import Any, Literal, TypedDict
 
 from typing_extensions import NotRequired
 
+ListAddressWatchesItem = dict[str, Any]
+"""Item of a listAddressWatches page."""
+
 
 class ListAddressWatchesResponse(TypedDict, total=False):
     """listAddressWatches response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListAddressWatchesItem]
     next_page_token: NotRequired[str]
 
 
@@ -243,10 +246,14 @@ class GetAddressWatchAssetsQuery(TypedDict, total=False):
     net_worth: NotRequired[Literal["true"]]
 
 
+GetAddressWatchBlockchainEventsItem = dict[str, Any]
+"""Item of a getAddressWatchBlockchainEvents page."""
+
+
 class GetAddressWatchBlockchainEventsResponse(TypedDict, total=False):
     """getAddressWatchBlockchainEvents response."""
 
-    items: list[dict[str, Any]]
+    items: list[GetAddressWatchBlockchainEventsItem]
     next_page_token: NotRequired[str]
     address_watch_id: str
     network: Literal[
@@ -319,10 +326,14 @@ class GetAddressWatchBlockchainEventsQuery(TypedDict, total=False):
     tx_hash: NotRequired[str]
 
 
+GetAddressWatchHistoryItem = dict[str, Any]
+"""Item of a getAddressWatchHistory page."""
+
+
 class GetAddressWatchHistoryResponse(TypedDict, total=False):
     """getAddressWatchHistory response."""
 
-    items: list[dict[str, Any]]
+    items: list[GetAddressWatchHistoryItem]
     next_page_token: NotRequired[str]
     address_watch_id: str
     network: Literal[
@@ -1,7 +1,36 @@
 """Agreements domain module."""
 
-from . import types
-from .client import AgreementsClient
-from .delegated_client import DelegatedAgreementsClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["AgreementsClient", "DelegatedAgreementsClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncAgreementsClient
+    from .async_delegated_client import AsyncDelegatedAgreementsClient
+    from .client import AgreementsClient
+    from .delegated_client import DelegatedAgreementsClient
+
+_EXPORTS = {
+    "AgreementsClient": ".client",
+    "DelegatedAgreementsClient": ".delegated_client",
+    "AsyncAgreementsClient": ".async_client",
+    "AsyncDelegatedAgreementsClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = [
+    "AgreementsClient",
+    "DelegatedAgreementsClient",
+    "AsyncAgreementsClient",
+    "AsyncDelegatedAgreementsClient",
+    "types",
+]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
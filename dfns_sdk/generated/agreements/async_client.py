@@ -0,0 +1,46 @@
+"""Async client for the agreements domain."""
+
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncAgreementsClient:
+    """Async client for agreements operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def get_latest_unaccepted_agreement(
+        self, query: T.GetLatestUnacceptedAgreementQuery
+    ) -> T.GetLatestUnacceptedAgreementResponse:
+        """
+        Get Latest Unaccepted Agreement.
+
+        Get the latest unaccepted agreement for a specific agreement type
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.GetLatestUnacceptedAgreementResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_LATEST_UNACCEPTED_AGREEMENT, query_params=query)
+        return cast(T.GetLatestUnacceptedAgreementResponse, response)
+
+    async def record_agreement_acceptance(self, agreement_id: str) -> T.RecordAgreementAcceptanceResponse:
+        """
+        Record Agreement Acceptance.
+
+        Record the acceptance of a specific agreement by its ID
+
+        Args:
+            agreement_id: ID of the agreement to accept.
+
+        Returns:
+            T.RecordAgreementAcceptanceResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.RECORD_AGREEMENT_ACCEPTANCE, agreement_id)
+        return cast(T.RecordAgreementAcceptanceResponse, response)
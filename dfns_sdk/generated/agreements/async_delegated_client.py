@@ -0,0 +1,83 @@
+"""Async delegated client for the agreements domain."""
+
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedAgreementsClient:
+    """
+    Async delegated client for agreements operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def get_latest_unaccepted_agreement(
+        self, query: T.GetLatestUnacceptedAgreementQuery
+    ) -> T.GetLatestUnacceptedAgreementResponse:
+        """
+        Get Latest Unaccepted Agreement.
+
+        Get the latest unaccepted agreement for a specific agreement type
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.GetLatestUnacceptedAgreementResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_LATEST_UNACCEPTED_AGREEMENT, query_params=query)
+        return cast(T.GetLatestUnacceptedAgreementResponse, response)
+
+    async def record_agreement_acceptance_init(self, agreement_id: str) -> PreparedAction:
+        """
+        Initialize Record Agreement Acceptance.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            agreement_id: ID of the agreement to accept.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.RECORD_AGREEMENT_ACCEPTANCE, E.RECORD_AGREEMENT_ACCEPTANCE.resolve(agreement_id)
+        )
+
+    async def record_agreement_acceptance_complete(
+        self,
+        agreement_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.RecordAgreementAcceptanceResponse:
+        """
+        Complete Record Agreement Acceptance.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            agreement_id: ID of the agreement to accept.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of record_agreement_acceptance_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.RecordAgreementAcceptanceResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.RECORD_AGREEMENT_ACCEPTANCE.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.RECORD_AGREEMENT_ACCEPTANCE, agreement_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.RecordAgreementAcceptanceResponse, response)
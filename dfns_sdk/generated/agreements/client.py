@@ -3,6 +3,7 @@
 from typing import cast
 
 from ..._internal import HttpClient
+from . import endpoints as E
 from . import types as T
 
 
@@ -26,14 +27,7 @@ class AgreementsClient:
         Returns:
             T.GetLatestUnacceptedAgreementResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/agreements/latest-unaccepted",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_LATEST_UNACCEPTED_AGREEMENT, query_params=query)
         return cast(T.GetLatestUnacceptedAgreementResponse, response)
 
     def record_agreement_acceptance(self, agreement_id: str) -> T.RecordAgreementAcceptanceResponse:
@@ -48,12 +42,5 @@ class AgreementsClient:
         Returns:
             T.RecordAgreementAcceptanceResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/agreements/{agreementId}/accept",
-            path_params={"agreementId": agreement_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.RECORD_AGREEMENT_ACCEPTANCE, agreement_id)
         return cast(T.RecordAgreementAcceptanceResponse, response)
@@ -3,7 +3,8 @@
 from typing import cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -32,17 +33,10 @@ class DelegatedAgreementsClient:
         Returns:
             T.GetLatestUnacceptedAgreementResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/agreements/latest-unaccepted",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_LATEST_UNACCEPTED_AGREEMENT, query_params=query)
         return cast(T.GetLatestUnacceptedAgreementResponse, response)
 
-    def record_agreement_acceptance_init(self, agreement_id: str) -> UserActionChallengeResponse:
+    def record_agreement_acceptance_init(self, agreement_id: str) -> PreparedAction:
         """
         Initialize Record Agreement Acceptance.
 
@@ -52,21 +46,17 @@ class DelegatedAgreementsClient:
             agreement_id: ID of the agreement to accept.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/agreements/{agreementId}/accept"
-        path = path.replace("{agreementId}", str(agreement_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.RECORD_AGREEMENT_ACCEPTANCE, E.RECORD_AGREEMENT_ACCEPTANCE.resolve(agreement_id)
         )
 
     def record_agreement_acceptance_complete(
-        self, agreement_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        agreement_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.RecordAgreementAcceptanceResponse:
         """
         Complete Record Agreement Acceptance.
@@ -76,19 +66,18 @@ class DelegatedAgreementsClient:
         Args:
             agreement_id: ID of the agreement to accept.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of record_agreement_acceptance_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.RecordAgreementAcceptanceResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.RECORD_AGREEMENT_ACCEPTANCE.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/agreements/{agreementId}/accept",
-            path_params={"agreementId": agreement_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.RECORD_AGREEMENT_ACCEPTANCE, agreement_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.RecordAgreementAcceptanceResponse, response)
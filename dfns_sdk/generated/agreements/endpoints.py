@@ -0,0 +1,17 @@
+"""Endpoint registry for the agreements domain."""
+
+from ..._internal.endpoint import Endpoint
+
+GET_LATEST_UNACCEPTED_AGREEMENT = Endpoint(
+    "agreements.get_latest_unaccepted_agreement",
+    "GET",
+    "/agreements/latest-unaccepted",
+    response_type="GetLatestUnacceptedAgreementResponse",
+)
+RECORD_AGREEMENT_ACCEPTANCE = Endpoint(
+    "agreements.record_agreement_acceptance",
+    "POST",
+    "/agreements/{agreementId}/accept",
+    requires_signature=True,
+    response_type="RecordAgreementAcceptanceResponse",
+)
@@ -1,7 +1,36 @@
 """Allocations domain module."""
 
-from . import types
-from .client import AllocationsClient
-from .delegated_client import DelegatedAllocationsClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["AllocationsClient", "DelegatedAllocationsClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncAllocationsClient
+    from .async_delegated_client import AsyncDelegatedAllocationsClient
+    from .client import AllocationsClient
+    from .delegated_client import DelegatedAllocationsClient
+
+_EXPORTS = {
+    "AllocationsClient": ".client",
+    "DelegatedAllocationsClient": ".delegated_client",
+    "AsyncAllocationsClient": ".async_client",
+    "AsyncDelegatedAllocationsClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = [
+    "AllocationsClient",
+    "DelegatedAllocationsClient",
+    "AsyncAllocationsClient",
+    "AsyncDelegatedAllocationsClient",
+    "types",
+]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,212 @@
+"""Async delegated client for the allocations domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedAllocationsClient:
+    """
+    Async delegated client for allocations operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_allocations(self, query: T.ListAllocationsQuery | None = None) -> T.ListAllocationsResponse:
+        """
+        List Allocations.
+
+        Lists the allocations of your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListAllocationsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ALLOCATIONS, query_params=query)
+        return cast(T.ListAllocationsResponse, response)
+
+    def aiter_allocations(
+        self, query: T.ListAllocationsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListAllocationsItem]:
+        """
+        Iterate over List Allocations.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListAllocationsItem]: The items of every page.
+        """
+        return aiter_items(self.list_allocations, query, page_size)
+
+    async def create_allocation_init(self, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Create Allocation.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_ALLOCATION, E.CREATE_ALLOCATION.path, body
+        )
+
+    async def create_allocation_complete(
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateAllocationResponse:
+        """
+        Complete Create Allocation.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_allocation_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateAllocationResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ALLOCATION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_ALLOCATION, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateAllocationResponse, response)
+
+    async def list_allocation_actions(
+        self, allocation_id: str, query: T.ListAllocationActionsQuery | None = None
+    ) -> T.ListAllocationActionsResponse:
+        """
+        List Allocation Actions.
+
+        Retrieve the list of actions for a specific allocation.
+
+        Args:
+            allocation_id: Unique identifier for the allocation investment.
+            query: Query parameters.
+
+        Returns:
+            T.ListAllocationActionsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ALLOCATION_ACTIONS, allocation_id, query_params=query)
+        return cast(T.ListAllocationActionsResponse, response)
+
+    def aiter_allocation_actions(
+        self, allocation_id: str, query: T.ListAllocationActionsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListAllocationActionsItem]:
+        """
+        Iterate over List Allocation Actions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            allocation_id: Unique identifier for the allocation investment.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListAllocationActionsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_allocation_actions(allocation_id, q), query, page_size)
+
+    async def create_allocation_action_init(self, allocation_id: str, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Create Allocation Action.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            allocation_id: Unique identifier for the allocation investment.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_ALLOCATION_ACTION, E.CREATE_ALLOCATION_ACTION.resolve(allocation_id), body
+        )
+
+    async def create_allocation_action_complete(
+        self,
+        allocation_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateAllocationActionResponse:
+        """
+        Complete Create Allocation Action.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            allocation_id: Unique identifier for the allocation investment.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_allocation_action_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateAllocationActionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ALLOCATION_ACTION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_ALLOCATION_ACTION, allocation_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateAllocationActionResponse, response)
+
+    async def get_allocation(self, allocation_id: str) -> T.GetAllocationResponse:
+        """
+        Get Allocation.
+
+        Retrieve the details of a specific allocation.
+
+        Args:
+            allocation_id: Unique identifier for the allocation investment.
+
+        Returns:
+            T.GetAllocationResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_ALLOCATION, allocation_id)
+        return cast(T.GetAllocationResponse, response)
+
+    async def get_allocations_info(self) -> T.GetAllocationsInfoResponse:
+        """
+        Get Allocations Info.
+
+        Retrieve the current reward rate (APY) for each supported allocation protocol.
+
+        Returns:
+            T.GetAllocationsInfoResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_ALLOCATIONS_INFO)
+        return cast(T.GetAllocationsInfoResponse, response)
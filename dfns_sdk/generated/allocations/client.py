@@ -1,8 +1,11 @@
 """Client for the allocations domain."""
 
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,16 +27,26 @@ class AllocationsClient:
         Returns:
             T.ListAllocationsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/allocations",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ALLOCATIONS, query_params=query)
         return cast(T.ListAllocationsResponse, response)
 
+    def iter_allocations(
+        self, query: T.ListAllocationsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListAllocationsItem]:
+        """
+        Iterate over List Allocations.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListAllocationsItem]: The items of every page.
+        """
+        return iter_items(self.list_allocations, query, page_size)
+
     def create_allocation(self, body: dict[str, Any]) -> T.CreateAllocationResponse:
         """
                 Create Allocation.
@@ -67,14 +80,7 @@ class AllocationsClient:
                 Returns:
                     T.CreateAllocationResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/allocations",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_ALLOCATION, body=body)
         return cast(T.CreateAllocationResponse, response)
 
     def list_allocation_actions(
@@ -92,16 +98,27 @@ class AllocationsClient:
         Returns:
             T.ListAllocationActionsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/allocations/{allocationId}/actions",
-            path_params={"allocationId": allocation_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ALLOCATION_ACTIONS, allocation_id, query_params=query)
         return cast(T.ListAllocationActionsResponse, response)
 
+    def iter_allocation_actions(
+        self, allocation_id: str, query: T.ListAllocationActionsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListAllocationActionsItem]:
+        """
+        Iterate over List Allocation Actions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            allocation_id: Unique identifier for the allocation investment.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListAllocationActionsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_allocation_actions(allocation_id, q), query, page_size)
+
     def create_allocation_action(self, allocation_id: str, body: dict[str, Any]) -> T.CreateAllocationActionResponse:
         """
         Create Allocation Action.
@@ -115,14 +132,7 @@ class AllocationsClient:
         Returns:
             T.CreateAllocationActionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/allocations/{allocationId}/actions",
-            path_params={"allocationId": allocation_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_ALLOCATION_ACTION, allocation_id, body=body)
         return cast(T.CreateAllocationActionResponse, response)
 
     def get_allocation(self, allocation_id: str) -> T.GetAllocationResponse:
@@ -137,14 +147,7 @@ class AllocationsClient:
         Returns:
             T.GetAllocationResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/allocations/{allocationId}",
-            path_params={"allocationId": allocation_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ALLOCATION, allocation_id)
         return cast(T.GetAllocationResponse, response)
 
     def get_allocations_info(self) -> T.GetAllocationsInfoResponse:
@@ -156,12 +159,5 @@ class AllocationsClient:
         Returns:
             T.GetAllocationsInfoResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/allocations/info",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ALLOCATIONS_INFO)
         return cast(T.GetAllocationsInfoResponse, response)
@@ -1,10 +1,12 @@
 """Delegated client for the allocations domain."""
 
-import json
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,27 @@ class DelegatedAllocationsClient:
         Returns:
             T.ListAllocationsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/allocations",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ALLOCATIONS, query_params=query)
         return cast(T.ListAllocationsResponse, response)
 
-    def create_allocation_init(self, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def iter_allocations(
+        self, query: T.ListAllocationsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListAllocationsItem]:
+        """
+        Iterate over List Allocations.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListAllocationsItem]: The items of every page.
+        """
+        return iter_items(self.list_allocations, query, page_size)
+
+    def create_allocation_init(self, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Create Allocation.
 
@@ -51,20 +63,15 @@ class DelegatedAllocationsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/allocations"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_ALLOCATION, E.CREATE_ALLOCATION.path, body)
 
     def create_allocation_complete(
-        self, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateAllocationResponse:
         """
         Complete Create Allocation.
@@ -74,20 +81,19 @@ class DelegatedAllocationsClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_allocation_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateAllocationResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ALLOCATION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/allocations",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_ALLOCATION, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateAllocationResponse, response)
 
@@ -106,17 +112,28 @@ class DelegatedAllocationsClient:
         Returns:
             T.ListAllocationActionsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/allocations/{allocationId}/actions",
-            path_params={"allocationId": allocation_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ALLOCATION_ACTIONS, allocation_id, query_params=query)
         return cast(T.ListAllocationActionsResponse, response)
 
-    def create_allocation_action_init(self, allocation_id: str, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def iter_allocation_actions(
+        self, allocation_id: str, query: T.ListAllocationActionsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListAllocationActionsItem]:
+        """
+        Iterate over List Allocation Actions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            allocation_id: Unique identifier for the allocation investment.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListAllocationActionsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_allocation_actions(allocation_id, q), query, page_size)
+
+    def create_allocation_action_init(self, allocation_id: str, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Create Allocation Action.
 
@@ -127,21 +144,18 @@ class DelegatedAllocationsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/allocations/{allocationId}/actions"
-        path = path.replace("{allocationId}", str(allocation_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_ALLOCATION_ACTION, E.CREATE_ALLOCATION_ACTION.resolve(allocation_id), body
         )
 
     def create_allocation_action_complete(
-        self, allocation_id: str, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        allocation_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateAllocationActionResponse:
         """
         Complete Create Allocation Action.
@@ -152,20 +166,19 @@ class DelegatedAllocationsClient:
             allocation_id: Unique identifier for the allocation investment.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_allocation_action_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateAllocationActionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ALLOCATION_ACTION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/allocations/{allocationId}/actions",
-            path_params={"allocationId": allocation_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_ALLOCATION_ACTION, allocation_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateAllocationActionResponse, response)
 
@@ -181,14 +194,7 @@ class DelegatedAllocationsClient:
         Returns:
             T.GetAllocationResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/allocations/{allocationId}",
-            path_params={"allocationId": allocation_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ALLOCATION, allocation_id)
         return cast(T.GetAllocationResponse, response)
 
     def get_allocations_info(self) -> T.GetAllocationsInfoResponse:
@@ -200,12 +206,5 @@ class DelegatedAllocationsClient:
         Returns:
             T.GetAllocationsInfoResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/allocations/info",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_ALLOCATIONS_INFO)
         return cast(T.GetAllocationsInfoResponse, response)
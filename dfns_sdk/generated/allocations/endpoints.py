@@ -0,0 +1,33 @@
+"""Endpoint registry for the allocations domain."""
+
+from ..._internal.endpoint import Endpoint
+
+LIST_ALLOCATIONS = Endpoint(
+    "allocations.list_allocations", "GET", "/allocations", response_type="ListAllocationsResponse"
+)
+CREATE_ALLOCATION = Endpoint(
+    "allocations.create_allocation",
+    "POST",
+    "/allocations",
+    requires_signature=True,
+    response_type="CreateAllocationResponse",
+)
+LIST_ALLOCATION_ACTIONS = Endpoint(
+    "allocations.list_allocation_actions",
+    "GET",
+    "/allocations/{allocationId}/actions",
+    response_type="ListAllocationActionsResponse",
+)
+CREATE_ALLOCATION_ACTION = Endpoint(
+    "allocations.create_allocation_action",
+    "POST",
+    "/allocations/{allocationId}/actions",
+    requires_signature=True,
+    response_type="CreateAllocationActionResponse",
+)
+GET_ALLOCATION = Endpoint(
+    "allocations.get_allocation", "GET", "/allocations/{allocationId}", response_type="GetAllocationResponse"
+)
+GET_ALLOCATIONS_INFO = Endpoint(
+    "allocations.get_allocations_info", "GET", "/allocations/info", response_type="GetAllocationsInfoResponse"
+)
@@ -4,11 +4,14 @@ from typing import Any, Literal, TypedDict
 
 from typing_extensions import NotRequired
 
+ListAllocationsItem = dict[str, Any]
+"""Item of a listAllocations page."""
+
 
 class ListAllocationsResponse(TypedDict, total=False):
     """listAllocations response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListAllocationsItem]
     next_page_token: NotRequired[str]
 
 
@@ -40,10 +43,14 @@ class CreateAllocationResponse(TypedDict, total=False):
     actions: list[dict[str, Any]]
 
 
+ListAllocationActionsItem = dict[str, Any]
+"""Item of a listAllocationActions page."""
+
+
 class ListAllocationActionsResponse(TypedDict, total=False):
     """listAllocationActions response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListAllocationActionsItem]
     next_page_token: NotRequired[str]
 
 
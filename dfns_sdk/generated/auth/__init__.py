@@ -1,7 +1,30 @@
 """Auth domain module."""
 
-from . import types
-from .client import AuthClient
-from .delegated_client import DelegatedAuthClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["AuthClient", "DelegatedAuthClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncAuthClient
+    from .async_delegated_client import AsyncDelegatedAuthClient
+    from .client import AuthClient
+    from .delegated_client import DelegatedAuthClient
+
+_EXPORTS = {
+    "AuthClient": ".client",
+    "DelegatedAuthClient": ".delegated_client",
+    "AsyncAuthClient": ".async_client",
+    "AsyncDelegatedAuthClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["AuthClient", "DelegatedAuthClient", "AsyncAuthClient", "AsyncDelegatedAuthClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,1034 @@
+"""Async client for the auth domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from typing_extensions import deprecated
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncAuthClient:
+    """Async client for auth operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def create_user_action_signature(
+        self, body: T.CreateUserActionSignatureRequest
+    ) -> T.CreateUserActionSignatureResponse:
+        """
+                Create User Action Signature.
+
+                Completes the user action signing process and provides a signing token that can be used to verify the user intended to perform the action.
+
+        This is the first step of the [User Action Signing flow](https://docs.dfns.co/api-reference/auth/signing-flows).
+
+        The type of credentials used to sign the action is determined by the `kind` field in the nested objects (`firstFactor` and `secondFactor`). Supported credential kinds are:
+        * `Fido2`: User action is signed by a user's signing device using `WebAuthn`.
+        * `Key`: User action is signed by a user's, or token's, private key.
+        * `PasswordProtectedKey`: Login challenge is signed by the decrypted user's private key that was sent during [Create User Action Signature Challenge](https://docs.dfns.co/api-reference/auth/create-user-action-challenge) step.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateUserActionSignatureResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_USER_ACTION_SIGNATURE, body=body)
+        return cast(T.CreateUserActionSignatureResponse, response)
+
+    async def create_user_action_challenge(
+        self, body: T.CreateUserActionChallengeRequest
+    ) -> T.CreateUserActionChallengeResponse:
+        """
+              Create User Action Challenge.
+
+              Starts a user action signing session, returning a challenge that will be used to verify the user's intent to perform an action.
+
+        This is the first step of the [User Action Signing flow](https://docs.dfns.co/api-reference/auth/signing-flows).
+
+              Args:
+                  body: Request body.
+
+              Returns:
+                  T.CreateUserActionChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_USER_ACTION_CHALLENGE, body=body)
+        return cast(T.CreateUserActionChallengeResponse, response)
+
+    async def list_audit_logs(self, query: T.ListAuditLogsQuery) -> None:
+        """
+                List Audit Logs.
+
+                Gets all signature events which have occurred in the over the timeframe. The time range is unbounded, but the export is capped at 100,000 rows. When the result is truncated, the `X-Dfns-Result-Truncated: true` response header is set and a trailing `# TRUNCATED ...` line is appended to the CSV; narrow the time range to retrieve all data.
+
+        StartTime and EndTime are URL-encoded UTC ISO timestamps:
+        `startTime=2025-08-29T02%3A46%3A40Z`
+        `endTime=2025-09-01T02%3A46%3A40Z`
+
+        An additional optional query parameter, `userId` can be specified to filter down events to a particular user. The API will return results found in CSV format.
+
+
+        Dfns maintains a script which can be used for audit log signature validation: [WebAuthn Signature Verifier](https://github.com/dfns/example-scripts/tree/m/python/utils)
+
+                Args:
+                    query: Query parameters.
+        """  # noqa: E501
+        await self._http.call(E.LIST_AUDIT_LOGS, query_params=query)
+
+    async def get_audit_log(self, id: str) -> T.GetAuditLogResponse:
+        """
+                Get Audit Log.
+
+                Gets detailed information for a particular audit log. Specifically, the API returns the action performed, as well as the `firstFactorCredential` in which you will find the signature information required to validate it.
+
+        Dfns maintains a script which can be used for audit log signature validation: [WebAuthn Signature Verifier](https://github.com/dfns/example-scripts/tree/m/python/utils)
+
+                Args:
+                    id: Log id you need information about.
+
+                Returns:
+                    T.GetAuditLogResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_AUDIT_LOG, id)
+        return cast(T.GetAuditLogResponse, response)
+
+    @deprecated("This endpoint is deprecated.")
+    async def list_applications(self) -> T.ListApplicationsResponse:
+        """
+              List Applications.
+
+              <Warning>
+        Applications are deprecated and will be removed in a future release. See details [here](https://docs.dfns.co/deprecation/applications-deprecation).
+        </Warning>
+
+              Returns:
+                  T.ListApplicationsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_APPLICATIONS)
+        return cast(T.ListApplicationsResponse, response)
+
+    @deprecated("This endpoint is deprecated.")
+    async def get_application(self, app_id: str) -> T.GetApplicationResponse:
+        """
+              Get Application.
+
+              <Warning>
+        Applications are deprecated and will be removed in a future release. See details [here](https://docs.dfns.co/deprecation/applications-deprecation).
+        </Warning>
+
+              Args:
+                  app_id: ID of the application (deprecated).
+
+              Returns:
+                  T.GetApplicationResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_APPLICATION, app_id)
+        return cast(T.GetApplicationResponse, response)
+
+    async def list_credentials(self) -> T.ListCredentialsResponse:
+        """
+        List Credentials.
+
+        List all credentials for a user.
+
+        Returns:
+            T.ListCredentialsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_CREDENTIALS)
+        return cast(T.ListCredentialsResponse, response)
+
+    async def create_credential(self, body: dict[str, Any]) -> T.CreateCredentialResponse:
+        """
+                Create Credential.
+
+                Part of the flow [Create Credential Regular flow](https://docs.dfns.co/api-reference/auth/credentials#regular-flow).
+
+        Adds a new credential to a user's account. See [Credential Kinds](https://docs.dfns.co/api-reference/auth/credentials#credential-kinds) for all supported credential types.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateCredentialResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_CREDENTIAL, body=body)
+        return cast(T.CreateCredentialResponse, response)
+
+    async def create_credential_challenge(self, body: T.CreateCredentialChallengeRequest) -> dict[str, Any]:
+        """
+              Create Credential Challenge.
+
+              Part of the flow [Create Credential Regular flow](https://docs.dfns.co/api-reference/auth/credentials#regular-flow).
+
+        Starts a create user credential session, returning a challenge that will be used to verify the user's identity.
+
+              Args:
+                  body: Request body.
+
+              Returns:
+                  dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_CREDENTIAL_CHALLENGE, body=body)
+        return cast(dict[str, Any], response)
+
+    async def activate_credential(self, body: T.ActivateCredentialRequest) -> T.ActivateCredentialResponse:
+        """
+        Activate Credential.
+
+        Activates a credential that was previously deactivated. If the credential is already activated no action is taken.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.ActivateCredentialResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ACTIVATE_CREDENTIAL, body=body)
+        return cast(T.ActivateCredentialResponse, response)
+
+    async def delete_credential(self, credential_uuid: str) -> T.DeleteCredentialResponse:
+        """
+        Delete Credential.
+
+        Delete a specific credential.
+
+        Args:
+            credential_uuid: Path parameter.
+
+        Returns:
+            T.DeleteCredentialResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_CREDENTIAL, credential_uuid)
+        return cast(T.DeleteCredentialResponse, response)
+
+    async def deactivate_credential(self, body: T.DeactivateCredentialRequest) -> T.DeactivateCredentialResponse:
+        """
+        Deactivate Credential.
+
+        Deactivates a credential that was previously active. If the credential is already deactivated no action is taken.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.DeactivateCredentialResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DEACTIVATE_CREDENTIAL, body=body)
+        return cast(T.DeactivateCredentialResponse, response)
+
+    async def create_credential_code(self, body: T.CreateCredentialCodeRequest) -> T.CreateCredentialCodeResponse:
+        """
+                Create Credential Code.
+
+                Part of the [Create Credential With Code flow](https://docs.dfns.co/api-reference/auth/credentials#create-credential-with-code-flow).
+
+        Creates a one-time-code that can then be used to create a new credential from a place you don't have access to one of your existing credential.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateCredentialCodeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_CREDENTIAL_CODE, body=body)
+        return cast(T.CreateCredentialCodeResponse, response)
+
+    async def create_credential_challenge_with_code(
+        self, body: T.CreateCredentialChallengeWithCodeRequest
+    ) -> dict[str, Any]:
+        """
+                Create Credential Challenge With Code.
+
+                Part of the flow [Create Credential With Code](https://docs.dfns.co/api-reference/auth/credentials#create-credential-with-code-flow).
+
+        Creates a credential challenge using a one time code-time-code. This challenge must then be signed by the new credential, before finalizing the flow.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_CREDENTIAL_CHALLENGE_WITH_CODE, body=body)
+        return cast(dict[str, Any], response)
+
+    async def create_credential_with_code(self, body: dict[str, Any]) -> T.CreateCredentialWithCodeResponse:
+        """
+                Create Credential With Code.
+
+                Finalizes the flow [Create Credential With Code](https://docs.dfns.co/api-reference/auth/credentials#create-credential-with-code-flow).
+
+        Adds a new credential to a user's account. This endpoint is similar to the [Create Credential](https://docs.dfns.co/api-reference/auth/create-credential) endpoint, except:
+        * it does not need the user to be authenticated
+        * it does not need user action signing
+        * it will only work with the challenge gotten from the [Create Credential Challenge With Code](https://docs.dfns.co/api-reference/auth/create-credential-challenge-with-code) endpoint
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateCredentialWithCodeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_CREDENTIAL_WITH_CODE, body=body)
+        return cast(T.CreateCredentialWithCodeResponse, response)
+
+    async def create_login_challenge(self, body: T.CreateLoginChallengeRequest) -> T.CreateLoginChallengeResponse:
+        """
+                Create Login Challenge.
+
+                Start a user login session, returning a challenge that will be used to verify the user's identity.
+
+        If the user has a credential of kind `PasswordProtectedKey` a temporary one time code needs to be passed in the `loginCode` field.
+
+        If the user has at least one discoverable WebAuthn credential, `username` is optional (username-less flow).
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateLoginChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_LOGIN_CHALLENGE, body=body)
+        return cast(T.CreateLoginChallengeResponse, response)
+
+    async def delegated_login(self, body: T.DelegatedLoginRequest) -> T.DelegatedLoginResponse:
+        """
+                Delegated Login.
+
+                <Warning>
+        Only a [Service Account](https://docs.dfns.co/api-reference/auth/service-accounts) can use this endpoint.
+        </Warning>
+
+        Logs a user into an organization without the user's credentials.
+
+        If you want to use your own authentication system, while still using `Delegated Signing`, you can use this endpoint to authenticate a user without needing the user's credentials.
+
+        The user authentication token can be used for read operations within the Dfns API, however, write operations will still require the user to sign the action.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.DelegatedLoginResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELEGATED_LOGIN, body=body)
+        return cast(T.DelegatedLoginResponse, response)
+
+    async def complete_user_login(self, body: T.CompleteUserLoginRequest) -> dict[str, Any]:
+        """
+                Complete User Login.
+
+                Completes the login process and provides the authenticated user with their authentication token.
+
+        The type of credentials used to login is determined by the `kind` field in the nested objects (`firstFactor` and `secondFactor`). Supported credential kinds are:
+        * `Fido2`: Login challenge is signed by a user's signing device using `WebAuthn`.
+        * `Key`: Login challenge is signed by a user's private key.
+        * `PasswordProtectedKey`: Login challenge is signed by the decrypted user's private key that was sent during the [Create Login Challenge](https://docs.dfns.co/api-reference/auth/create-login-challenge) step.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.COMPLETE_USER_LOGIN, body=body)
+        return cast(dict[str, Any], response)
+
+    async def logout(self, body: T.LogoutRequest) -> T.LogoutResponse:
+        """
+        Logout.
+
+        Completes the user logout process.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.LogoutResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LOGOUT, body=body)
+        return cast(T.LogoutResponse, response)
+
+    async def complete_oidc_login(self, body: T.CompleteOidcLoginRequest) -> dict[str, Any]:
+        """
+        Complete OIDC Login.
+
+        Completes the OIDC login process by exchanging the authorization code obtained from the identity provider. If the verified user has no active first-factor credential yet, it returns a registration challenge to complete via [Complete User Registration](/api-reference/auth/complete-user-registration); otherwise it returns the user's authentication token.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.COMPLETE_OIDC_LOGIN, body=body)
+        return cast(dict[str, Any], response)
+
+    async def initiate_oidc_login(self, body: T.InitiateOidcLoginRequest) -> T.InitiateOidcLoginResponse:
+        """
+        Initiate OIDC Login.
+
+        Initialize the OIDC login process by returning the identity provider authorization URL to redirect the user to.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.InitiateOidcLoginResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.INITIATE_OIDC_LOGIN, body=body)
+        return cast(T.InitiateOidcLoginResponse, response)
+
+    async def send_login_code(self, body: T.SendLoginCodeRequest) -> T.SendLoginCodeResponse:
+        """
+                Send Login Code.
+
+                Sends a temporary one time code to the user that can be used during login flow.
+
+        If the user has a credential of kind `PasswordProtectedKey` a temporary one time code needs to be passed in the `loginCode` field. That's because the [Create Login Challenge](https://docs.dfns.co/api-reference/auth/create-login-challenge) is unauthenticated and returns the encrypted private key of the user. So we need a first step to verify the identity of the user to prevent anybody from fetching the encrypted private key and trying to brute force it offline.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.SendLoginCodeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SEND_LOGIN_CODE, body=body)
+        return cast(T.SendLoginCodeResponse, response)
+
+    async def social_login(self, body: T.SocialLoginRequest) -> T.SocialLoginResponse:
+        """
+        Social Login.
+
+        Logs a user in with a JWT id token issued by a social login provider and provides the authenticated user with their authentication token.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.SocialLoginResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SOCIAL_LOGIN, body=body)
+        return cast(T.SocialLoginResponse, response)
+
+    async def complete_sso_login(self, body: T.CompleteSsoLoginRequest) -> T.CompleteSsoLoginResponse:
+        """
+        Complete SSO Login.
+
+        Completes the SSO login process by exchanging the authorization code obtained from the identity provider for the user's authentication token.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CompleteSsoLoginResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.COMPLETE_SSO_LOGIN, body=body)
+        return cast(T.CompleteSsoLoginResponse, response)
+
+    async def initiate_sso_login(self, body: T.InitiateSsoLoginRequest) -> T.InitiateSsoLoginResponse:
+        """
+        Initiate SSO Login.
+
+        Initialize the login process with SSO by returning the IdP URL to call.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.InitiateSsoLoginResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.INITIATE_SSO_LOGIN, body=body)
+        return cast(T.InitiateSsoLoginResponse, response)
+
+    async def exchange_access_token(self, body: T.ExchangeAccessTokenRequest) -> T.ExchangeAccessTokenResponse:
+        """
+        Exchange Access Token.
+
+        Only for TenantUsers - Exchanges the current user access token, for an org-bound or tenant-bound token. The user must have access to the target org / tenant. The new access token expiration won't exceed the current token's one.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.ExchangeAccessTokenResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.EXCHANGE_ACCESS_TOKEN, body=body)
+        return cast(T.ExchangeAccessTokenResponse, response)
+
+    async def list_personal_access_tokens(self) -> T.ListPersonalAccessTokensResponse:
+        """
+        List Personal Access Tokens.
+
+        Retrieve the list of your Personal Access Tokens.
+
+        Returns:
+            T.ListPersonalAccessTokensResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PERSONAL_ACCESS_TOKENS)
+        return cast(T.ListPersonalAccessTokensResponse, response)
+
+    async def create_personal_access_token(
+        self, body: T.CreatePersonalAccessTokenRequest
+    ) -> T.CreatePersonalAccessTokenResponse:
+        """
+        Create Personal Access Token.
+
+        Create a new Personal Access Token for the caller.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreatePersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_PERSONAL_ACCESS_TOKEN, body=body)
+        return cast(T.CreatePersonalAccessTokenResponse, response)
+
+    async def get_personal_access_token(self, token_id: str) -> T.GetPersonalAccessTokenResponse:
+        """
+        Get Personal Access Token.
+
+        Retrieve a specific Personal Access Token.
+
+        Args:
+            token_id: Token id.
+
+        Returns:
+            T.GetPersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_PERSONAL_ACCESS_TOKEN, token_id)
+        return cast(T.GetPersonalAccessTokenResponse, response)
+
+    async def update_personal_access_token(
+        self, token_id: str, body: T.UpdatePersonalAccessTokenRequest
+    ) -> T.UpdatePersonalAccessTokenResponse:
+        """
+        Update Personal Access Token.
+
+        Update a specific Personal Access Token.
+
+        Args:
+            token_id: Token id.
+            body: Request body.
+
+        Returns:
+            T.UpdatePersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UPDATE_PERSONAL_ACCESS_TOKEN, token_id, body=body)
+        return cast(T.UpdatePersonalAccessTokenResponse, response)
+
+    async def delete_personal_access_token(self, token_id: str) -> T.DeletePersonalAccessTokenResponse:
+        """
+        Delete Personal Access Token.
+
+        Delete a specific Personal Access Token.
+
+        Args:
+            token_id: Token id.
+
+        Returns:
+            T.DeletePersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_PERSONAL_ACCESS_TOKEN, token_id)
+        return cast(T.DeletePersonalAccessTokenResponse, response)
+
+    async def activate_personal_access_token(self, token_id: str) -> T.ActivatePersonalAccessTokenResponse:
+        """
+        Activate Personal Access Token.
+
+        Activate a specific Personal Access Token.
+
+        Args:
+            token_id: Token id.
+
+        Returns:
+            T.ActivatePersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ACTIVATE_PERSONAL_ACCESS_TOKEN, token_id)
+        return cast(T.ActivatePersonalAccessTokenResponse, response)
+
+    async def deactivate_personal_access_token(self, token_id: str) -> T.DeactivatePersonalAccessTokenResponse:
+        """
+        Deactivate Personal Access Token.
+
+        Deactivates a personal access token that was previously active. If the token is already deactivated no action is taken.
+
+        Args:
+            token_id: Token id.
+
+        Returns:
+            T.DeactivatePersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DEACTIVATE_PERSONAL_ACCESS_TOKEN, token_id)
+        return cast(T.DeactivatePersonalAccessTokenResponse, response)
+
+    async def create_delegated_recovery_challenge(
+        self, body: T.CreateDelegatedRecoveryChallengeRequest
+    ) -> T.CreateDelegatedRecoveryChallengeResponse:
+        """
+                Create Delegated Recovery Challenge.
+
+                <Warning>
+        Only a [Service Account](https://docs.dfns.co/api-reference/auth/service-accounts) can use this endpoint.
+        </Warning>
+
+        Starts a recovery session for an end user under your brand, without sending a Dfns recovery email. Call this after you have verified the user's identity with your own auth system.
+
+        The response returns a recovery challenge. Pass it to your frontend so the user can decrypt their recovery credential and sign, then call [Recover User](https://docs.dfns.co/api-reference/auth/recover-user) to complete the recovery and register fresh credentials.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateDelegatedRecoveryChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_DELEGATED_RECOVERY_CHALLENGE, body=body)
+        return cast(T.CreateDelegatedRecoveryChallengeResponse, response)
+
+    async def recover_user(self, body: T.RecoverUserRequest) -> T.RecoverUserResponse:
+        """
+                Recover User.
+
+                Recovers a user, using a recovery credential. After successfully recovering the user, all of the user's previous credentials and personal access tokens will be invalidated.
+
+        This flow requires cryptographic validation of newly created credential(s) using a recovery credential. The `recovery.credentialAssertion.clientData` field's challenge must be the _base64url-encoded_ representation of the `newCredential` object.
+
+        The process is as follows:
+
+        1. Construct the `newCredential` object, using the challenge obtained from either the [Create Recovery Challenge](https://docs.dfns.co/api-reference/auth/create-recovery-challenge) or [Create Delegated Recovery Challenge](https://docs.dfns.co/api-reference/auth/create-delegated-recovery-challenge) endpoints.
+        2. Serialize the `newCredential` object to JSON and then base64url-encode the resulting JSON string. This _base64url-encoded_ string will serve as the challenge for the `recovery.credentialAssertion` object.
+        3. Construct the `recovery.credentialAssertion` object, using the _base64url-encoded_ string generated in step 2 as its challenge.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.RecoverUserResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.RECOVER_USER, body=body)
+        return cast(T.RecoverUserResponse, response)
+
+    async def create_recovery_challenge(
+        self, body: T.CreateRecoveryChallengeRequest
+    ) -> T.CreateRecoveryChallengeResponse:
+        """
+        Create Recovery Challenge.
+
+        Starts a user recovery session, returning a challenge that will be used to verify the user's identity.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateRecoveryChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_RECOVERY_CHALLENGE, body=body)
+        return cast(T.CreateRecoveryChallengeResponse, response)
+
+    async def send_recovery_code_email(self, body: T.SendRecoveryCodeEmailRequest) -> T.SendRecoveryCodeEmailResponse:
+        """
+        Send Recovery Code Email.
+
+        Send the user a recovery verification code. This code is used as a second factor to verify the user initiated the recovery request.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.SendRecoveryCodeEmailResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SEND_RECOVERY_CODE_EMAIL, body=body)
+        return cast(T.SendRecoveryCodeEmailResponse, response)
+
+    async def create_delegated_registration_challenge(
+        self, body: T.CreateDelegatedRegistrationChallengeRequest
+    ) -> T.CreateDelegatedRegistrationChallengeResponse:
+        """
+                Create Delegated Registration Challenge.
+
+                <Warning>
+        Only a [Service Account](https://docs.dfns.co/api-reference/auth/service-accounts) can use this endpoint.
+        </Warning>
+
+        Registers a new End User in your organization and returns a registration challenge, without sending a Dfns registration email. Use this when your application owns the authentication system and you want delegated signing under your brand.
+
+        The response includes:
+        1. A new `EndUser` attached to your organization.
+        2. A registration challenge plus a `temporaryAuthenticationToken` to authenticate the next call.
+
+        Pass the challenge to your frontend so the user can create a passkey, then call [Complete User Registration](https://docs.dfns.co/api-reference/auth/complete-user-registration) or [Complete End User Registration with Wallets](https://docs.dfns.co/api-reference/auth/complete-end-user-registration-with-wallets) with that challenge signed.
+
+        Bundle a `recoveryCredential` in the completion call alongside the first passkey. All credentials in that call sign the same challenge returned here. See [Implement end-user recovery](https://docs.dfns.co/guides/developers/end-user-recovery).
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateDelegatedRegistrationChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_DELEGATED_REGISTRATION_CHALLENGE, body=body)
+        return cast(T.CreateDelegatedRegistrationChallengeResponse, response)
+
+    async def create_registration_challenge(
+        self, body: T.CreateRegistrationChallengeRequest
+    ) -> T.CreateRegistrationChallengeResponse:
+        """
+        Create Registration Challenge.
+
+        Starts a user registration session. It returns a challenge that will need to be signed by a passkey and used to perform the step [Complete User Registration](/api-reference/auth/complete-user-registration)
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateRegistrationChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_REGISTRATION_CHALLENGE, body=body)
+        return cast(T.CreateRegistrationChallengeResponse, response)
+
+    async def create_social_registration_challenge(
+        self, body: T.CreateSocialRegistrationChallengeRequest
+    ) -> T.CreateSocialRegistrationChallengeResponse:
+        """
+        Create Social Registration Challenge.
+
+        Starts an end-user registration session by passing a JWT obtained by an IdP. It returns a challenge that will need to be signed by a passkey and used to perform [Complete End User Registration with Wallets](/api-reference/auth/complete-end-user-registration-with-wallets).
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateSocialRegistrationChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_SOCIAL_REGISTRATION_CHALLENGE, body=body)
+        return cast(T.CreateSocialRegistrationChallengeResponse, response)
+
+    async def complete_user_registration(
+        self, body: T.CompleteUserRegistrationRequest
+    ) -> T.CompleteUserRegistrationResponse:
+        """
+                Complete User Registration.
+
+                Completes the user registration process and creates the user's initial credentials.
+
+        All credentials submitted in this call (`firstFactorCredential`, `secondFactorCredential`, `recoveryCredential`) sign the same challenge returned by the registration init endpoint ([Create Registration Challenge](https://docs.dfns.co/api-reference/auth/create-registration-challenge), [Create Delegated Registration Challenge](https://docs.dfns.co/api-reference/auth/create-delegated-registration-challenge), or [Create Social Registration Challenge](https://docs.dfns.co/api-reference/auth/create-social-registration-challenge)).
+
+        Always include a `recoveryCredential` for end users. Without one, a user who loses their device cannot recover access and you must initiate a delegated recovery manually. See [Implement end-user recovery](https://docs.dfns.co/guides/developers/end-user-recovery).
+
+        The type of credentials being registered is determined by the `credentialKind` field in the nested objects (`firstFactorCredential` , `secondFactorCredential` and `recoveryCredential`). Supported credential kinds are:
+        * `Fido2`: User action is signed by a user's signing device using `WebAuthn`.
+        * `Key`: User action is signed by a user's, or token's, private key.
+        * `PasswordProtectedKey`: User action is signed by a user's, or token's, private key. The encrypted version of the private key is stored by Dfns and returns during the signing flow for the user to decrypt it.
+        * `RecoveryKey` : Similar to `PasswordProtectedKey`, but this credential can only be used to recover an account not to sign an action or login. Once this credential is used all the other user's credentials are invalidated.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CompleteUserRegistrationResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.COMPLETE_USER_REGISTRATION, body=body)
+        return cast(T.CompleteUserRegistrationResponse, response)
+
+    async def complete_end_user_registration_with_wallets(
+        self, body: T.CompleteEndUserRegistrationWithWalletsRequest
+    ) -> T.CompleteEndUserRegistrationWithWalletsResponse:
+        """
+                Complete End User Registration with Wallets.
+
+                Completes the end user registration process and creates the user's initial credentials along with delegated wallets for the new end user.
+
+        All credentials submitted in this call (`firstFactorCredential`, `secondFactorCredential`, `recoveryCredential`) sign the same challenge returned by the registration init endpoint ([Create Delegated Registration Challenge](https://docs.dfns.co/api-reference/auth/create-delegated-registration-challenge) or [Create Social Registration Challenge](https://docs.dfns.co/api-reference/auth/create-social-registration-challenge)).
+
+        Always include a `recoveryCredential` for end users. Without one, a user who loses their device cannot recover access and you must initiate a delegated recovery manually. See [Implement end-user recovery](https://docs.dfns.co/guides/developers/end-user-recovery).
+
+        The type of credentials being registered is determined by the `credentialKind` field in the nested objects (`firstFactorCredential` , `secondFactorCredential` and `recoveryCredential`). Supported credential kinds are:
+        * `Fido2`: User action is signed by a user's signing device using `WebAuthn`.
+        * `Key`: User action is signed by a user's, or token's, private key.
+        * `PasswordProtectedKey`: User action is signed by a user's, or token's, private key. The encrypted version of the private key is stored by Dfns and returns during the signing flow for the user to decrypt it.
+        * `RecoveryKey`: Similar to `PasswordProtectedKey`, but this credential can only be used to recover an account, not to sign an action or login. Once this credential is used, all the other user's credentials are invalidated.
+
+        The number of delegated wallets created and the wallet types are determined by the `wallets` specifications. The end user is automatically assigned `ManagedDefaultEndUserAccess` managed permission that grants the end user full access to the wallets.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CompleteEndUserRegistrationWithWalletsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.COMPLETE_END_USER_REGISTRATION_WITH_WALLETS, body=body)
+        return cast(T.CompleteEndUserRegistrationWithWalletsResponse, response)
+
+    async def resend_registration_code(self, body: T.ResendRegistrationCodeRequest) -> T.ResendRegistrationCodeResponse:
+        """
+        Resend Registration Code.
+
+        Sends the user a new registration code. The previous registration code will be marked invalid. If the user has already completed their registration no action will be taken.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.ResendRegistrationCodeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.RESEND_REGISTRATION_CODE, body=body)
+        return cast(T.ResendRegistrationCodeResponse, response)
+
+    async def list_service_accounts(self) -> T.ListServiceAccountsResponse:
+        """
+        List Service Accounts.
+
+        List all Service Accounts in your organization.
+
+        Returns:
+            T.ListServiceAccountsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_SERVICE_ACCOUNTS)
+        return cast(T.ListServiceAccountsResponse, response)
+
+    async def create_service_account(self, body: T.CreateServiceAccountRequest) -> T.CreateServiceAccountResponse:
+        """
+        Create Service Account.
+
+        Create a new Service Account for your organization.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateServiceAccountResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_SERVICE_ACCOUNT, body=body)
+        return cast(T.CreateServiceAccountResponse, response)
+
+    async def get_service_account(self, service_account_id: str) -> T.GetServiceAccountResponse:
+        """
+        Get Service Account.
+
+        Get information about a specific Service Account.
+
+        Args:
+            service_account_id: ID of the service account.
+
+        Returns:
+            T.GetServiceAccountResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_SERVICE_ACCOUNT, service_account_id)
+        return cast(T.GetServiceAccountResponse, response)
+
+    async def update_service_account(
+        self, service_account_id: str, body: T.UpdateServiceAccountRequest
+    ) -> T.UpdateServiceAccountResponse:
+        """
+        Update Service Account.
+
+        Update a specific Service Account.
+
+        Args:
+            service_account_id: ID of the service account.
+            body: Request body.
+
+        Returns:
+            T.UpdateServiceAccountResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UPDATE_SERVICE_ACCOUNT, service_account_id, body=body)
+        return cast(T.UpdateServiceAccountResponse, response)
+
+    async def delete_service_account(
+        self, service_account_id: str, query: T.DeleteServiceAccountQuery | None = None
+    ) -> T.DeleteServiceAccountResponse:
+        """
+        Delete Service Account.
+
+        Delete a specific Service Account.
+
+        Args:
+            service_account_id: ID of the service account.
+            query: Query parameters.
+
+        Returns:
+            T.DeleteServiceAccountResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_SERVICE_ACCOUNT, service_account_id, query_params=query)
+        return cast(T.DeleteServiceAccountResponse, response)
+
+    async def activate_service_account(self, service_account_id: str) -> T.ActivateServiceAccountResponse:
+        """
+        Activate Service Account.
+
+        Activate a specific Service Account.
+
+        Args:
+            service_account_id: ID of the service account.
+
+        Returns:
+            T.ActivateServiceAccountResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ACTIVATE_SERVICE_ACCOUNT, service_account_id)
+        return cast(T.ActivateServiceAccountResponse, response)
+
+    async def deactivate_service_account(
+        self, service_account_id: str, body: T.DeactivateServiceAccountRequest
+    ) -> T.DeactivateServiceAccountResponse:
+        """
+        Deactivate Service Account.
+
+        Deactivate a specific Service Account.
+
+        Args:
+            service_account_id: ID of the service account.
+            body: Request body.
+
+        Returns:
+            T.DeactivateServiceAccountResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DEACTIVATE_SERVICE_ACCOUNT, service_account_id, body=body)
+        return cast(T.DeactivateServiceAccountResponse, response)
+
+    async def activate_user(self, user_id: str) -> T.ActivateUserResponse:
+        """
+        Activate User.
+
+        Activate a specific User.
+
+        Args:
+            user_id: User id.
+
+        Returns:
+            T.ActivateUserResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ACTIVATE_USER, user_id)
+        return cast(T.ActivateUserResponse, response)
+
+    async def deactivate_user(self, user_id: str) -> T.DeactivateUserResponse:
+        """
+        Deactivate User.
+
+        Deactivate a specific User.
+
+        Args:
+            user_id: User id.
+
+        Returns:
+            T.DeactivateUserResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DEACTIVATE_USER, user_id)
+        return cast(T.DeactivateUserResponse, response)
+
+    async def get_user(self, user_id: str) -> T.GetUserResponse:
+        """
+        Get User.
+
+        Retrieve information about a specific User.
+
+        Args:
+            user_id: User id.
+
+        Returns:
+            T.GetUserResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_USER, user_id)
+        return cast(T.GetUserResponse, response)
+
+    async def update_user(self, user_id: str, body: T.UpdateUserRequest) -> T.UpdateUserResponse:
+        """
+        Update User.
+
+        Update a specific User.
+
+        Args:
+            user_id: User id.
+            body: Request body.
+
+        Returns:
+            T.UpdateUserResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UPDATE_USER, user_id, body=body)
+        return cast(T.UpdateUserResponse, response)
+
+    async def delete_user(self, user_id: str) -> T.DeleteUserResponse:
+        """
+        Delete User.
+
+        Delete a specific User.
+
+        Args:
+            user_id: User id.
+
+        Returns:
+            T.DeleteUserResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_USER, user_id)
+        return cast(T.DeleteUserResponse, response)
+
+    async def list_users(self, query: T.ListUsersQuery | None = None) -> T.ListUsersResponse:
+        """
+        List Users.
+
+        List all Users in your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListUsersResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_USERS, query_params=query)
+        return cast(T.ListUsersResponse, response)
+
+    def aiter_users(
+        self, query: T.ListUsersQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListUsersItem]:
+        """
+        Iterate over List Users.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListUsersItem]: The items of every page.
+        """
+        return aiter_items(self.list_users, query, page_size)
+
+    async def create_user(self, body: T.CreateUserRequest) -> T.CreateUserResponse:
+        """
+              Create User.
+
+              Invite a new user in the caller's org. This will create the user and send a registration email to the created User's email, with a registration code, and pointing him to complete his registration on Dfns Dashboard. The user is created without any permissions.
+
+        <Note>If you want the created User to not know about about Dfns, and don't want him to
+        receive the registration email from Dfns, you should rather use the Delegated Registration
+        endpoint.</Note>
+
+              Args:
+                  body: Request body.
+
+              Returns:
+                  T.CreateUserResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_USER, body=body)
+        return cast(T.CreateUserResponse, response)
+
+    async def invite_tenant_user(self, body: T.InviteTenantUserRequest) -> T.InviteTenantUserResponse:
+        """
+        Invite Tenant User.
+
+        Invite an existing Tenant User in the caller's org. The invited Tenant User starts without any permissions within the org.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.InviteTenantUserResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.INVITE_TENANT_USER, body=body)
+        return cast(T.InviteTenantUserResponse, response)
@@ -0,0 +1,1746 @@
+"""Async delegated client for the auth domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from typing_extensions import deprecated
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedAuthClient:
+    """
+    Async delegated client for auth operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def create_user_action_signature(
+        self, body: T.CreateUserActionSignatureRequest
+    ) -> T.CreateUserActionSignatureResponse:
+        """
+                Create User Action Signature.
+
+                Completes the user action signing process and provides a signing token that can be used to verify the user intended to perform the action.
+
+        This is the first step of the [User Action Signing flow](https://docs.dfns.co/api-reference/auth/signing-flows).
+
+        The type of credentials used to sign the action is determined by the `kind` field in the nested objects (`firstFactor` and `secondFactor`). Supported credential kinds are:
+        * `Fido2`: User action is signed by a user's signing device using `WebAuthn`.
+        * `Key`: User action is signed by a user's, or token's, private key.
+        * `PasswordProtectedKey`: Login challenge is signed by the decrypted user's private key that was sent during [Create User Action Signature Challenge](https://docs.dfns.co/api-reference/auth/create-user-action-challenge) step.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateUserActionSignatureResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_USER_ACTION_SIGNATURE, body=body)
+        return cast(T.CreateUserActionSignatureResponse, response)
+
+    async def create_user_action_challenge(
+        self, body: T.CreateUserActionChallengeRequest
+    ) -> T.CreateUserActionChallengeResponse:
+        """
+              Create User Action Challenge.
+
+              Starts a user action signing session, returning a challenge that will be used to verify the user's intent to perform an action.
+
+        This is the first step of the [User Action Signing flow](https://docs.dfns.co/api-reference/auth/signing-flows).
+
+              Args:
+                  body: Request body.
+
+              Returns:
+                  T.CreateUserActionChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_USER_ACTION_CHALLENGE, body=body)
+        return cast(T.CreateUserActionChallengeResponse, response)
+
+    async def list_audit_logs(self, query: T.ListAuditLogsQuery) -> None:
+        """
+                List Audit Logs.
+
+                Gets all signature events which have occurred in the over the timeframe. The time range is unbounded, but the export is capped at 100,000 rows. When the result is truncated, the `X-Dfns-Result-Truncated: true` response header is set and a trailing `# TRUNCATED ...` line is appended to the CSV; narrow the time range to retrieve all data.
+
+        StartTime and EndTime are URL-encoded UTC ISO timestamps:
+        `startTime=2025-08-29T02%3A46%3A40Z`
+        `endTime=2025-09-01T02%3A46%3A40Z`
+
+        An additional optional query parameter, `userId` can be specified to filter down events to a particular user. The API will return results found in CSV format.
+
+
+        Dfns maintains a script which can be used for audit log signature validation: [WebAuthn Signature Verifier](https://github.com/dfns/example-scripts/tree/m/python/utils)
+
+                Args:
+                    query: Query parameters.
+        """  # noqa: E501
+        await self._http.call(E.LIST_AUDIT_LOGS, query_params=query)
+
+    async def get_audit_log(self, id: str) -> T.GetAuditLogResponse:
+        """
+                Get Audit Log.
+
+                Gets detailed information for a particular audit log. Specifically, the API returns the action performed, as well as the `firstFactorCredential` in which you will find the signature information required to validate it.
+
+        Dfns maintains a script which can be used for audit log signature validation: [WebAuthn Signature Verifier](https://github.com/dfns/example-scripts/tree/m/python/utils)
+
+                Args:
+                    id: Log id you need information about.
+
+                Returns:
+                    T.GetAuditLogResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_AUDIT_LOG, id)
+        return cast(T.GetAuditLogResponse, response)
+
+    @deprecated("This endpoint is deprecated.")
+    async def list_applications(self) -> T.ListApplicationsResponse:
+        """
+              List Applications.
+
+              <Warning>
+        Applications are deprecated and will be removed in a future release. See details [here](https://docs.dfns.co/deprecation/applications-deprecation).
+        </Warning>
+
+              Returns:
+                  T.ListApplicationsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_APPLICATIONS)
+        return cast(T.ListApplicationsResponse, response)
+
+    @deprecated("This endpoint is deprecated.")
+    async def get_application(self, app_id: str) -> T.GetApplicationResponse:
+        """
+              Get Application.
+
+              <Warning>
+        Applications are deprecated and will be removed in a future release. See details [here](https://docs.dfns.co/deprecation/applications-deprecation).
+        </Warning>
+
+              Args:
+                  app_id: ID of the application (deprecated).
+
+              Returns:
+                  T.GetApplicationResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_APPLICATION, app_id)
+        return cast(T.GetApplicationResponse, response)
+
+    async def list_credentials(self) -> T.ListCredentialsResponse:
+        """
+        List Credentials.
+
+        List all credentials for a user.
+
+        Returns:
+            T.ListCredentialsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_CREDENTIALS)
+        return cast(T.ListCredentialsResponse, response)
+
+    async def create_credential_init(self, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Create Credential.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_CREDENTIAL, E.CREATE_CREDENTIAL.path, body
+        )
+
+    async def create_credential_complete(
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateCredentialResponse:
+        """
+        Complete Create Credential.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_credential_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateCredentialResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_CREDENTIAL.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_CREDENTIAL, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateCredentialResponse, response)
+
+    async def create_credential_challenge(self, body: T.CreateCredentialChallengeRequest) -> dict[str, Any]:
+        """
+              Create Credential Challenge.
+
+              Part of the flow [Create Credential Regular flow](https://docs.dfns.co/api-reference/auth/credentials#regular-flow).
+
+        Starts a create user credential session, returning a challenge that will be used to verify the user's identity.
+
+              Args:
+                  body: Request body.
+
+              Returns:
+                  dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_CREDENTIAL_CHALLENGE, body=body)
+        return cast(dict[str, Any], response)
+
+    async def activate_credential_init(self, body: T.ActivateCredentialRequest) -> PreparedAction:
+        """
+        Initialize Activate Credential.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.ACTIVATE_CREDENTIAL, E.ACTIVATE_CREDENTIAL.path, body
+        )
+
+    async def activate_credential_complete(
+        self,
+        body: T.ActivateCredentialRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.ActivateCredentialResponse:
+        """
+        Complete Activate Credential.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_credential_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ActivateCredentialResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_CREDENTIAL.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ACTIVATE_CREDENTIAL, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ActivateCredentialResponse, response)
+
+    async def delete_credential_init(self, credential_uuid: str) -> PreparedAction:
+        """
+        Initialize Delete Credential.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            credential_uuid: Path parameter.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_CREDENTIAL, E.DELETE_CREDENTIAL.resolve(credential_uuid)
+        )
+
+    async def delete_credential_complete(
+        self,
+        credential_uuid: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.DeleteCredentialResponse:
+        """
+        Complete Delete Credential.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            credential_uuid: Path parameter.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_credential_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeleteCredentialResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_CREDENTIAL.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_CREDENTIAL, credential_uuid, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeleteCredentialResponse, response)
+
+    async def deactivate_credential_init(self, body: T.DeactivateCredentialRequest) -> PreparedAction:
+        """
+        Initialize Deactivate Credential.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DEACTIVATE_CREDENTIAL, E.DEACTIVATE_CREDENTIAL.path, body
+        )
+
+    async def deactivate_credential_complete(
+        self,
+        body: T.DeactivateCredentialRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.DeactivateCredentialResponse:
+        """
+        Complete Deactivate Credential.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of deactivate_credential_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeactivateCredentialResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DEACTIVATE_CREDENTIAL.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DEACTIVATE_CREDENTIAL, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeactivateCredentialResponse, response)
+
+    async def create_credential_code_init(self, body: T.CreateCredentialCodeRequest) -> PreparedAction:
+        """
+        Initialize Create Credential Code.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_CREDENTIAL_CODE, E.CREATE_CREDENTIAL_CODE.path, body
+        )
+
+    async def create_credential_code_complete(
+        self,
+        body: T.CreateCredentialCodeRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateCredentialCodeResponse:
+        """
+        Complete Create Credential Code.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_credential_code_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateCredentialCodeResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_CREDENTIAL_CODE.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_CREDENTIAL_CODE, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateCredentialCodeResponse, response)
+
+    async def create_credential_challenge_with_code(
+        self, body: T.CreateCredentialChallengeWithCodeRequest
+    ) -> dict[str, Any]:
+        """
+                Create Credential Challenge With Code.
+
+                Part of the flow [Create Credential With Code](https://docs.dfns.co/api-reference/auth/credentials#create-credential-with-code-flow).
+
+        Creates a credential challenge using a one time code-time-code. This challenge must then be signed by the new credential, before finalizing the flow.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_CREDENTIAL_CHALLENGE_WITH_CODE, body=body)
+        return cast(dict[str, Any], response)
+
+    async def create_credential_with_code(self, body: dict[str, Any]) -> T.CreateCredentialWithCodeResponse:
+        """
+                Create Credential With Code.
+
+                Finalizes the flow [Create Credential With Code](https://docs.dfns.co/api-reference/auth/credentials#create-credential-with-code-flow).
+
+        Adds a new credential to a user's account. This endpoint is similar to the [Create Credential](https://docs.dfns.co/api-reference/auth/create-credential) endpoint, except:
+        * it does not need the user to be authenticated
+        * it does not need user action signing
+        * it will only work with the challenge gotten from the [Create Credential Challenge With Code](https://docs.dfns.co/api-reference/auth/create-credential-challenge-with-code) endpoint
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateCredentialWithCodeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_CREDENTIAL_WITH_CODE, body=body)
+        return cast(T.CreateCredentialWithCodeResponse, response)
+
+    async def create_login_challenge(self, body: T.CreateLoginChallengeRequest) -> T.CreateLoginChallengeResponse:
+        """
+                Create Login Challenge.
+
+                Start a user login session, returning a challenge that will be used to verify the user's identity.
+
+        If the user has a credential of kind `PasswordProtectedKey` a temporary one time code needs to be passed in the `loginCode` field.
+
+        If the user has at least one discoverable WebAuthn credential, `username` is optional (username-less flow).
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CreateLoginChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_LOGIN_CHALLENGE, body=body)
+        return cast(T.CreateLoginChallengeResponse, response)
+
+    async def delegated_login_init(self, body: T.DelegatedLoginRequest) -> PreparedAction:
+        """
+        Initialize Delegated Login.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.DELEGATED_LOGIN, E.DELEGATED_LOGIN.path, body)
+
+    async def delegated_login_complete(
+        self,
+        body: T.DelegatedLoginRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.DelegatedLoginResponse:
+        """
+        Complete Delegated Login.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delegated_login_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DelegatedLoginResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELEGATED_LOGIN.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELEGATED_LOGIN, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DelegatedLoginResponse, response)
+
+    async def complete_user_login(self, body: T.CompleteUserLoginRequest) -> dict[str, Any]:
+        """
+                Complete User Login.
+
+                Completes the login process and provides the authenticated user with their authentication token.
+
+        The type of credentials used to login is determined by the `kind` field in the nested objects (`firstFactor` and `secondFactor`). Supported credential kinds are:
+        * `Fido2`: Login challenge is signed by a user's signing device using `WebAuthn`.
+        * `Key`: Login challenge is signed by a user's private key.
+        * `PasswordProtectedKey`: Login challenge is signed by the decrypted user's private key that was sent during the [Create Login Challenge](https://docs.dfns.co/api-reference/auth/create-login-challenge) step.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.COMPLETE_USER_LOGIN, body=body)
+        return cast(dict[str, Any], response)
+
+    async def logout(self, body: T.LogoutRequest) -> T.LogoutResponse:
+        """
+        Logout.
+
+        Completes the user logout process.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.LogoutResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LOGOUT, body=body)
+        return cast(T.LogoutResponse, response)
+
+    async def complete_oidc_login(self, body: T.CompleteOidcLoginRequest) -> dict[str, Any]:
+        """
+        Complete OIDC Login.
+
+        Completes the OIDC login process by exchanging the authorization code obtained from the identity provider. If the verified user has no active first-factor credential yet, it returns a registration challenge to complete via [Complete User Registration](/api-reference/auth/complete-user-registration); otherwise it returns the user's authentication token.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.COMPLETE_OIDC_LOGIN, body=body)
+        return cast(dict[str, Any], response)
+
+    async def initiate_oidc_login(self, body: T.InitiateOidcLoginRequest) -> T.InitiateOidcLoginResponse:
+        """
+        Initiate OIDC Login.
+
+        Initialize the OIDC login process by returning the identity provider authorization URL to redirect the user to.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.InitiateOidcLoginResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.INITIATE_OIDC_LOGIN, body=body)
+        return cast(T.InitiateOidcLoginResponse, response)
+
+    async def send_login_code(self, body: T.SendLoginCodeRequest) -> T.SendLoginCodeResponse:
+        """
+                Send Login Code.
+
+                Sends a temporary one time code to the user that can be used during login flow.
+
+        If the user has a credential of kind `PasswordProtectedKey` a temporary one time code needs to be passed in the `loginCode` field. That's because the [Create Login Challenge](https://docs.dfns.co/api-reference/auth/create-login-challenge) is unauthenticated and returns the encrypted private key of the user. So we need a first step to verify the identity of the user to prevent anybody from fetching the encrypted private key and trying to brute force it offline.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.SendLoginCodeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SEND_LOGIN_CODE, body=body)
+        return cast(T.SendLoginCodeResponse, response)
+
+    async def social_login(self, body: T.SocialLoginRequest) -> T.SocialLoginResponse:
+        """
+        Social Login.
+
+        Logs a user in with a JWT id token issued by a social login provider and provides the authenticated user with their authentication token.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.SocialLoginResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SOCIAL_LOGIN, body=body)
+        return cast(T.SocialLoginResponse, response)
+
+    async def complete_sso_login(self, body: T.CompleteSsoLoginRequest) -> T.CompleteSsoLoginResponse:
+        """
+        Complete SSO Login.
+
+        Completes the SSO login process by exchanging the authorization code obtained from the identity provider for the user's authentication token.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CompleteSsoLoginResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.COMPLETE_SSO_LOGIN, body=body)
+        return cast(T.CompleteSsoLoginResponse, response)
+
+    async def initiate_sso_login(self, body: T.InitiateSsoLoginRequest) -> T.InitiateSsoLoginResponse:
+        """
+        Initiate SSO Login.
+
+        Initialize the login process with SSO by returning the IdP URL to call.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.InitiateSsoLoginResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.INITIATE_SSO_LOGIN, body=body)
+        return cast(T.InitiateSsoLoginResponse, response)
+
+    async def exchange_access_token(self, body: T.ExchangeAccessTokenRequest) -> T.ExchangeAccessTokenResponse:
+        """
+        Exchange Access Token.
+
+        Only for TenantUsers - Exchanges the current user access token, for an org-bound or tenant-bound token. The user must have access to the target org / tenant. The new access token expiration won't exceed the current token's one.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.ExchangeAccessTokenResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.EXCHANGE_ACCESS_TOKEN, body=body)
+        return cast(T.ExchangeAccessTokenResponse, response)
+
+    async def list_personal_access_tokens(self) -> T.ListPersonalAccessTokensResponse:
+        """
+        List Personal Access Tokens.
+
+        Retrieve the list of your Personal Access Tokens.
+
+        Returns:
+            T.ListPersonalAccessTokensResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PERSONAL_ACCESS_TOKENS)
+        return cast(T.ListPersonalAccessTokensResponse, response)
+
+    async def create_personal_access_token_init(self, body: T.CreatePersonalAccessTokenRequest) -> PreparedAction:
+        """
+        Initialize Create Personal Access Token.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_PERSONAL_ACCESS_TOKEN, E.CREATE_PERSONAL_ACCESS_TOKEN.path, body
+        )
+
+    async def create_personal_access_token_complete(
+        self,
+        body: T.CreatePersonalAccessTokenRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreatePersonalAccessTokenResponse:
+        """
+        Complete Create Personal Access Token.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_personal_access_token_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreatePersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PERSONAL_ACCESS_TOKEN.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_PERSONAL_ACCESS_TOKEN, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreatePersonalAccessTokenResponse, response)
+
+    async def get_personal_access_token(self, token_id: str) -> T.GetPersonalAccessTokenResponse:
+        """
+        Get Personal Access Token.
+
+        Retrieve a specific Personal Access Token.
+
+        Args:
+            token_id: Token id.
+
+        Returns:
+            T.GetPersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_PERSONAL_ACCESS_TOKEN, token_id)
+        return cast(T.GetPersonalAccessTokenResponse, response)
+
+    async def update_personal_access_token_init(
+        self, token_id: str, body: T.UpdatePersonalAccessTokenRequest
+    ) -> PreparedAction:
+        """
+        Initialize Update Personal Access Token.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            token_id: Token id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_PERSONAL_ACCESS_TOKEN, E.UPDATE_PERSONAL_ACCESS_TOKEN.resolve(token_id), body
+        )
+
+    async def update_personal_access_token_complete(
+        self,
+        token_id: str,
+        body: T.UpdatePersonalAccessTokenRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UpdatePersonalAccessTokenResponse:
+        """
+        Complete Update Personal Access Token.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            token_id: Token id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_personal_access_token_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UpdatePersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_PERSONAL_ACCESS_TOKEN.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UPDATE_PERSONAL_ACCESS_TOKEN, token_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.UpdatePersonalAccessTokenResponse, response)
+
+    async def delete_personal_access_token_init(self, token_id: str) -> PreparedAction:
+        """
+        Initialize Delete Personal Access Token.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            token_id: Token id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_PERSONAL_ACCESS_TOKEN, E.DELETE_PERSONAL_ACCESS_TOKEN.resolve(token_id)
+        )
+
+    async def delete_personal_access_token_complete(
+        self, token_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.DeletePersonalAccessTokenResponse:
+        """
+        Complete Delete Personal Access Token.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            token_id: Token id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_personal_access_token_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeletePersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_PERSONAL_ACCESS_TOKEN.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_PERSONAL_ACCESS_TOKEN, token_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeletePersonalAccessTokenResponse, response)
+
+    async def activate_personal_access_token_init(self, token_id: str) -> PreparedAction:
+        """
+        Initialize Activate Personal Access Token.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            token_id: Token id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.ACTIVATE_PERSONAL_ACCESS_TOKEN, E.ACTIVATE_PERSONAL_ACCESS_TOKEN.resolve(token_id)
+        )
+
+    async def activate_personal_access_token_complete(
+        self, token_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.ActivatePersonalAccessTokenResponse:
+        """
+        Complete Activate Personal Access Token.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            token_id: Token id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_personal_access_token_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ActivatePersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_PERSONAL_ACCESS_TOKEN.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ACTIVATE_PERSONAL_ACCESS_TOKEN, token_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ActivatePersonalAccessTokenResponse, response)
+
+    async def deactivate_personal_access_token_init(self, token_id: str) -> PreparedAction:
+        """
+        Initialize Deactivate Personal Access Token.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            token_id: Token id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DEACTIVATE_PERSONAL_ACCESS_TOKEN, E.DEACTIVATE_PERSONAL_ACCESS_TOKEN.resolve(token_id)
+        )
+
+    async def deactivate_personal_access_token_complete(
+        self, token_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.DeactivatePersonalAccessTokenResponse:
+        """
+        Complete Deactivate Personal Access Token.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            token_id: Token id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of deactivate_personal_access_token_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeactivatePersonalAccessTokenResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DEACTIVATE_PERSONAL_ACCESS_TOKEN.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DEACTIVATE_PERSONAL_ACCESS_TOKEN, token_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeactivatePersonalAccessTokenResponse, response)
+
+    async def create_delegated_recovery_challenge_init(
+        self, body: T.CreateDelegatedRecoveryChallengeRequest
+    ) -> PreparedAction:
+        """
+        Initialize Create Delegated Recovery Challenge.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_DELEGATED_RECOVERY_CHALLENGE, E.CREATE_DELEGATED_RECOVERY_CHALLENGE.path, body
+        )
+
+    async def create_delegated_recovery_challenge_complete(
+        self,
+        body: T.CreateDelegatedRecoveryChallengeRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateDelegatedRecoveryChallengeResponse:
+        """
+        Complete Create Delegated Recovery Challenge.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_delegated_recovery_challenge_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateDelegatedRecoveryChallengeResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_DELEGATED_RECOVERY_CHALLENGE.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_DELEGATED_RECOVERY_CHALLENGE, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateDelegatedRecoveryChallengeResponse, response)
+
+    async def recover_user(self, body: T.RecoverUserRequest) -> T.RecoverUserResponse:
+        """
+                Recover User.
+
+                Recovers a user, using a recovery credential. After successfully recovering the user, all of the user's previous credentials and personal access tokens will be invalidated.
+
+        This flow requires cryptographic validation of newly created credential(s) using a recovery credential. The `recovery.credentialAssertion.clientData` field's challenge must be the _base64url-encoded_ representation of the `newCredential` object.
+
+        The process is as follows:
+
+        1. Construct the `newCredential` object, using the challenge obtained from either the [Create Recovery Challenge](https://docs.dfns.co/api-reference/auth/create-recovery-challenge) or [Create Delegated Recovery Challenge](https://docs.dfns.co/api-reference/auth/create-delegated-recovery-challenge) endpoints.
+        2. Serialize the `newCredential` object to JSON and then base64url-encode the resulting JSON string. This _base64url-encoded_ string will serve as the challenge for the `recovery.credentialAssertion` object.
+        3. Construct the `recovery.credentialAssertion` object, using the _base64url-encoded_ string generated in step 2 as its challenge.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.RecoverUserResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.RECOVER_USER, body=body)
+        return cast(T.RecoverUserResponse, response)
+
+    async def create_recovery_challenge(
+        self, body: T.CreateRecoveryChallengeRequest
+    ) -> T.CreateRecoveryChallengeResponse:
+        """
+        Create Recovery Challenge.
+
+        Starts a user recovery session, returning a challenge that will be used to verify the user's identity.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateRecoveryChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_RECOVERY_CHALLENGE, body=body)
+        return cast(T.CreateRecoveryChallengeResponse, response)
+
+    async def send_recovery_code_email(self, body: T.SendRecoveryCodeEmailRequest) -> T.SendRecoveryCodeEmailResponse:
+        """
+        Send Recovery Code Email.
+
+        Send the user a recovery verification code. This code is used as a second factor to verify the user initiated the recovery request.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.SendRecoveryCodeEmailResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SEND_RECOVERY_CODE_EMAIL, body=body)
+        return cast(T.SendRecoveryCodeEmailResponse, response)
+
+    async def create_delegated_registration_challenge_init(
+        self, body: T.CreateDelegatedRegistrationChallengeRequest
+    ) -> PreparedAction:
+        """
+        Initialize Create Delegated Registration Challenge.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http,
+            E.CREATE_DELEGATED_REGISTRATION_CHALLENGE,
+            E.CREATE_DELEGATED_REGISTRATION_CHALLENGE.path,
+            body,
+        )
+
+    async def create_delegated_registration_challenge_complete(
+        self,
+        body: T.CreateDelegatedRegistrationChallengeRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateDelegatedRegistrationChallengeResponse:
+        """
+        Complete Create Delegated Registration Challenge.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_delegated_registration_challenge_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateDelegatedRegistrationChallengeResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_DELEGATED_REGISTRATION_CHALLENGE.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_DELEGATED_REGISTRATION_CHALLENGE, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateDelegatedRegistrationChallengeResponse, response)
+
+    async def create_registration_challenge(
+        self, body: T.CreateRegistrationChallengeRequest
+    ) -> T.CreateRegistrationChallengeResponse:
+        """
+        Create Registration Challenge.
+
+        Starts a user registration session. It returns a challenge that will need to be signed by a passkey and used to perform the step [Complete User Registration](/api-reference/auth/complete-user-registration)
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateRegistrationChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_REGISTRATION_CHALLENGE, body=body)
+        return cast(T.CreateRegistrationChallengeResponse, response)
+
+    async def create_social_registration_challenge(
+        self, body: T.CreateSocialRegistrationChallengeRequest
+    ) -> T.CreateSocialRegistrationChallengeResponse:
+        """
+        Create Social Registration Challenge.
+
+        Starts an end-user registration session by passing a JWT obtained by an IdP. It returns a challenge that will need to be signed by a passkey and used to perform [Complete End User Registration with Wallets](/api-reference/auth/complete-end-user-registration-with-wallets).
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateSocialRegistrationChallengeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_SOCIAL_REGISTRATION_CHALLENGE, body=body)
+        return cast(T.CreateSocialRegistrationChallengeResponse, response)
+
+    async def complete_user_registration(
+        self, body: T.CompleteUserRegistrationRequest
+    ) -> T.CompleteUserRegistrationResponse:
+        """
+                Complete User Registration.
+
+                Completes the user registration process and creates the user's initial credentials.
+
+        All credentials submitted in this call (`firstFactorCredential`, `secondFactorCredential`, `recoveryCredential`) sign the same challenge returned by the registration init endpoint ([Create Registration Challenge](https://docs.dfns.co/api-reference/auth/create-registration-challenge), [Create Delegated Registration Challenge](https://docs.dfns.co/api-reference/auth/create-delegated-registration-challenge), or [Create Social Registration Challenge](https://docs.dfns.co/api-reference/auth/create-social-registration-challenge)).
+
+        Always include a `recoveryCredential` for end users. Without one, a user who loses their device cannot recover access and you must initiate a delegated recovery manually. See [Implement end-user recovery](https://docs.dfns.co/guides/developers/end-user-recovery).
+
+        The type of credentials being registered is determined by the `credentialKind` field in the nested objects (`firstFactorCredential` , `secondFactorCredential` and `recoveryCredential`). Supported credential kinds are:
+        * `Fido2`: User action is signed by a user's signing device using `WebAuthn`.
+        * `Key`: User action is signed by a user's, or token's, private key.
+        * `PasswordProtectedKey`: User action is signed by a user's, or token's, private key. The encrypted version of the private key is stored by Dfns and returns during the signing flow for the user to decrypt it.
+        * `RecoveryKey` : Similar to `PasswordProtectedKey`, but this credential can only be used to recover an account not to sign an action or login. Once this credential is used all the other user's credentials are invalidated.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CompleteUserRegistrationResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.COMPLETE_USER_REGISTRATION, body=body)
+        return cast(T.CompleteUserRegistrationResponse, response)
+
+    async def complete_end_user_registration_with_wallets(
+        self, body: T.CompleteEndUserRegistrationWithWalletsRequest
+    ) -> T.CompleteEndUserRegistrationWithWalletsResponse:
+        """
+                Complete End User Registration with Wallets.
+
+                Completes the end user registration process and creates the user's initial credentials along with delegated wallets for the new end user.
+
+        All credentials submitted in this call (`firstFactorCredential`, `secondFactorCredential`, `recoveryCredential`) sign the same challenge returned by the registration init endpoint ([Create Delegated Registration Challenge](https://docs.dfns.co/api-reference/auth/create-delegated-registration-challenge) or [Create Social Registration Challenge](https://docs.dfns.co/api-reference/auth/create-social-registration-challenge)).
+
+        Always include a `recoveryCredential` for end users. Without one, a user who loses their device cannot recover access and you must initiate a delegated recovery manually. See [Implement end-user recovery](https://docs.dfns.co/guides/developers/end-user-recovery).
+
+        The type of credentials being registered is determined by the `credentialKind` field in the nested objects (`firstFactorCredential` , `secondFactorCredential` and `recoveryCredential`). Supported credential kinds are:
+        * `Fido2`: User action is signed by a user's signing device using `WebAuthn`.
+        * `Key`: User action is signed by a user's, or token's, private key.
+        * `PasswordProtectedKey`: User action is signed by a user's, or token's, private key. The encrypted version of the private key is stored by Dfns and returns during the signing flow for the user to decrypt it.
+        * `RecoveryKey`: Similar to `PasswordProtectedKey`, but this credential can only be used to recover an account, not to sign an action or login. Once this credential is used, all the other user's credentials are invalidated.
+
+        The number of delegated wallets created and the wallet types are determined by the `wallets` specifications. The end user is automatically assigned `ManagedDefaultEndUserAccess` managed permission that grants the end user full access to the wallets.
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.CompleteEndUserRegistrationWithWalletsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.COMPLETE_END_USER_REGISTRATION_WITH_WALLETS, body=body)
+        return cast(T.CompleteEndUserRegistrationWithWalletsResponse, response)
+
+    async def resend_registration_code(self, body: T.ResendRegistrationCodeRequest) -> T.ResendRegistrationCodeResponse:
+        """
+        Resend Registration Code.
+
+        Sends the user a new registration code. The previous registration code will be marked invalid. If the user has already completed their registration no action will be taken.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.ResendRegistrationCodeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.RESEND_REGISTRATION_CODE, body=body)
+        return cast(T.ResendRegistrationCodeResponse, response)
+
+    async def list_service_accounts(self) -> T.ListServiceAccountsResponse:
+        """
+        List Service Accounts.
+
+        List all Service Accounts in your organization.
+
+        Returns:
+            T.ListServiceAccountsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_SERVICE_ACCOUNTS)
+        return cast(T.ListServiceAccountsResponse, response)
+
+    async def create_service_account_init(self, body: T.CreateServiceAccountRequest) -> PreparedAction:
+        """
+        Initialize Create Service Account.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_SERVICE_ACCOUNT, E.CREATE_SERVICE_ACCOUNT.path, body
+        )
+
+    async def create_service_account_complete(
+        self,
+        body: T.CreateServiceAccountRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateServiceAccountResponse:
+        """
+        Complete Create Service Account.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_service_account_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateServiceAccountResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_SERVICE_ACCOUNT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_SERVICE_ACCOUNT, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateServiceAccountResponse, response)
+
+    async def get_service_account(self, service_account_id: str) -> T.GetServiceAccountResponse:
+        """
+        Get Service Account.
+
+        Get information about a specific Service Account.
+
+        Args:
+            service_account_id: ID of the service account.
+
+        Returns:
+            T.GetServiceAccountResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_SERVICE_ACCOUNT, service_account_id)
+        return cast(T.GetServiceAccountResponse, response)
+
+    async def update_service_account_init(
+        self, service_account_id: str, body: T.UpdateServiceAccountRequest
+    ) -> PreparedAction:
+        """
+        Initialize Update Service Account.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            service_account_id: ID of the service account.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_SERVICE_ACCOUNT, E.UPDATE_SERVICE_ACCOUNT.resolve(service_account_id), body
+        )
+
+    async def update_service_account_complete(
+        self,
+        service_account_id: str,
+        body: T.UpdateServiceAccountRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UpdateServiceAccountResponse:
+        """
+        Complete Update Service Account.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            service_account_id: ID of the service account.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_service_account_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UpdateServiceAccountResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_SERVICE_ACCOUNT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UPDATE_SERVICE_ACCOUNT, service_account_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.UpdateServiceAccountResponse, response)
+
+    async def delete_service_account_init(
+        self, service_account_id: str, query: T.DeleteServiceAccountQuery | None = None
+    ) -> PreparedAction:
+        """
+        Initialize Delete Service Account.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            service_account_id: ID of the service account.
+            query: Query parameters.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_SERVICE_ACCOUNT, E.DELETE_SERVICE_ACCOUNT.resolve(service_account_id)
+        )
+
+    async def delete_service_account_complete(
+        self,
+        service_account_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        query: T.DeleteServiceAccountQuery | None = None,
+        prepared: PreparedAction | None = None,
+    ) -> T.DeleteServiceAccountResponse:
+        """
+        Complete Delete Service Account.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            service_account_id: ID of the service account.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_service_account_init(); its payload is sent as is instead of
+                encoding the body again.
+            query: Query parameters.
+
+        Returns:
+            T.DeleteServiceAccountResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_SERVICE_ACCOUNT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_SERVICE_ACCOUNT,
+            service_account_id,
+            query_params=query,
+            user_action=user_action_token,
+            prepared=prepared,
+        )
+        return cast(T.DeleteServiceAccountResponse, response)
+
+    async def activate_service_account_init(self, service_account_id: str) -> PreparedAction:
+        """
+        Initialize Activate Service Account.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            service_account_id: ID of the service account.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.ACTIVATE_SERVICE_ACCOUNT, E.ACTIVATE_SERVICE_ACCOUNT.resolve(service_account_id)
+        )
+
+    async def activate_service_account_complete(
+        self,
+        service_account_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.ActivateServiceAccountResponse:
+        """
+        Complete Activate Service Account.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            service_account_id: ID of the service account.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_service_account_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ActivateServiceAccountResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_SERVICE_ACCOUNT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ACTIVATE_SERVICE_ACCOUNT, service_account_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ActivateServiceAccountResponse, response)
+
+    async def deactivate_service_account_init(
+        self, service_account_id: str, body: T.DeactivateServiceAccountRequest
+    ) -> PreparedAction:
+        """
+        Initialize Deactivate Service Account.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            service_account_id: ID of the service account.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http,
+            E.DEACTIVATE_SERVICE_ACCOUNT,
+            E.DEACTIVATE_SERVICE_ACCOUNT.resolve(service_account_id),
+            body,
+        )
+
+    async def deactivate_service_account_complete(
+        self,
+        service_account_id: str,
+        body: T.DeactivateServiceAccountRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.DeactivateServiceAccountResponse:
+        """
+        Complete Deactivate Service Account.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            service_account_id: ID of the service account.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of deactivate_service_account_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeactivateServiceAccountResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DEACTIVATE_SERVICE_ACCOUNT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DEACTIVATE_SERVICE_ACCOUNT,
+            service_account_id,
+            body=body,
+            user_action=user_action_token,
+            prepared=prepared,
+        )
+        return cast(T.DeactivateServiceAccountResponse, response)
+
+    async def activate_user_init(self, user_id: str) -> PreparedAction:
+        """
+        Initialize Activate User.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            user_id: User id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.ACTIVATE_USER, E.ACTIVATE_USER.resolve(user_id))
+
+    async def activate_user_complete(
+        self, user_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.ActivateUserResponse:
+        """
+        Complete Activate User.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            user_id: User id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_user_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ActivateUserResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_USER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ACTIVATE_USER, user_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ActivateUserResponse, response)
+
+    async def deactivate_user_init(self, user_id: str) -> PreparedAction:
+        """
+        Initialize Deactivate User.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            user_id: User id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DEACTIVATE_USER, E.DEACTIVATE_USER.resolve(user_id)
+        )
+
+    async def deactivate_user_complete(
+        self, user_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.DeactivateUserResponse:
+        """
+        Complete Deactivate User.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            user_id: User id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of deactivate_user_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeactivateUserResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DEACTIVATE_USER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DEACTIVATE_USER, user_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeactivateUserResponse, response)
+
+    async def get_user(self, user_id: str) -> T.GetUserResponse:
+        """
+        Get User.
+
+        Retrieve information about a specific User.
+
+        Args:
+            user_id: User id.
+
+        Returns:
+            T.GetUserResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_USER, user_id)
+        return cast(T.GetUserResponse, response)
+
+    async def update_user_init(self, user_id: str, body: T.UpdateUserRequest) -> PreparedAction:
+        """
+        Initialize Update User.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            user_id: User id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_USER, E.UPDATE_USER.resolve(user_id), body
+        )
+
+    async def update_user_complete(
+        self,
+        user_id: str,
+        body: T.UpdateUserRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UpdateUserResponse:
+        """
+        Complete Update User.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            user_id: User id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_user_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UpdateUserResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_USER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UPDATE_USER, user_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.UpdateUserResponse, response)
+
+    async def delete_user_init(self, user_id: str) -> PreparedAction:
+        """
+        Initialize Delete User.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            user_id: User id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.DELETE_USER, E.DELETE_USER.resolve(user_id))
+
+    async def delete_user_complete(
+        self, user_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.DeleteUserResponse:
+        """
+        Complete Delete User.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            user_id: User id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_user_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeleteUserResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_USER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_USER, user_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeleteUserResponse, response)
+
+    async def list_users(self, query: T.ListUsersQuery | None = None) -> T.ListUsersResponse:
+        """
+        List Users.
+
+        List all Users in your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListUsersResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_USERS, query_params=query)
+        return cast(T.ListUsersResponse, response)
+
+    def aiter_users(
+        self, query: T.ListUsersQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListUsersItem]:
+        """
+        Iterate over List Users.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListUsersItem]: The items of every page.
+        """
+        return aiter_items(self.list_users, query, page_size)
+
+    async def create_user_init(self, body: T.CreateUserRequest) -> PreparedAction:
+        """
+        Initialize Create User.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.CREATE_USER, E.CREATE_USER.path, body)
+
+    async def create_user_complete(
+        self,
+        body: T.CreateUserRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateUserResponse:
+        """
+        Complete Create User.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_user_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateUserResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_USER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_USER, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateUserResponse, response)
+
+    async def invite_tenant_user_init(self, body: T.InviteTenantUserRequest) -> PreparedAction:
+        """
+        Initialize Invite Tenant User.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.INVITE_TENANT_USER, E.INVITE_TENANT_USER.path, body
+        )
+
+    async def invite_tenant_user_complete(
+        self,
+        body: T.InviteTenantUserRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.InviteTenantUserResponse:
+        """
+        Complete Invite Tenant User.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of invite_tenant_user_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.InviteTenantUserResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.INVITE_TENANT_USER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.INVITE_TENANT_USER, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.InviteTenantUserResponse, response)
@@ -1,10 +1,13 @@
 """Client for the auth domain."""
 
+from collections.abc import Iterator
 from typing import Any, cast
 
 from typing_extensions import deprecated
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -35,14 +38,7 @@ class AuthClient:
                 Returns:
                     T.CreateUserActionSignatureResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/action",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_USER_ACTION_SIGNATURE, body=body)
         return cast(T.CreateUserActionSignatureResponse, response)
 
     def create_user_action_challenge(
@@ -61,14 +57,7 @@ class AuthClient:
               Returns:
                   T.CreateUserActionChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/action/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_USER_ACTION_CHALLENGE, body=body)
         return cast(T.CreateUserActionChallengeResponse, response)
 
     def list_audit_logs(self, query: T.ListAuditLogsQuery) -> None:
@@ -89,14 +78,7 @@ class AuthClient:
                 Args:
                     query: Query parameters.
         """  # noqa: E501
-        self._http.request(
-            method="GET",
-            path="/auth/action/logs",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        self._http.call(E.LIST_AUDIT_LOGS, query_params=query)
 
     def get_audit_log(self, id: str) -> T.GetAuditLogResponse:
         """
@@ -112,14 +94,7 @@ class AuthClient:
                 Returns:
                     T.GetAuditLogResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/action/logs/{id}",
-            path_params={"id": id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_AUDIT_LOG, id)
         return cast(T.GetAuditLogResponse, response)
 
     @deprecated("This endpoint is deprecated.")
@@ -134,14 +109,7 @@ class AuthClient:
               Returns:
                   T.ListApplicationsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/apps",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_APPLICATIONS)
         return cast(T.ListApplicationsResponse, response)
 
     @deprecated("This endpoint is deprecated.")
@@ -159,14 +127,7 @@ class AuthClient:
               Returns:
                   T.GetApplicationResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/apps/{appId}",
-            path_params={"appId": app_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_APPLICATION, app_id)
         return cast(T.GetApplicationResponse, response)
 
     def list_credentials(self) -> T.ListCredentialsResponse:
@@ -178,14 +139,7 @@ class AuthClient:
         Returns:
             T.ListCredentialsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/credentials",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_CREDENTIALS)
         return cast(T.ListCredentialsResponse, response)
 
     def create_credential(self, body: dict[str, Any]) -> T.CreateCredentialResponse:
@@ -202,14 +156,7 @@ class AuthClient:
                 Returns:
                     T.CreateCredentialResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/credentials",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_CREDENTIAL, body=body)
         return cast(T.CreateCredentialResponse, response)
 
     def create_credential_challenge(self, body: T.CreateCredentialChallengeRequest) -> dict[str, Any]:
@@ -226,14 +173,7 @@ class AuthClient:
               Returns:
                   dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/credentials/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_CREDENTIAL_CHALLENGE, body=body)
         return cast(dict[str, Any], response)
 
     def activate_credential(self, body: T.ActivateCredentialRequest) -> T.ActivateCredentialResponse:
@@ -248,14 +188,7 @@ class AuthClient:
         Returns:
             T.ActivateCredentialResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/credentials/activate",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ACTIVATE_CREDENTIAL, body=body)
         return cast(T.ActivateCredentialResponse, response)
 
     def delete_credential(self, credential_uuid: str) -> T.DeleteCredentialResponse:
@@ -270,14 +203,7 @@ class AuthClient:
         Returns:
             T.DeleteCredentialResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/auth/credentials/{credentialUuid}",
-            path_params={"credentialUuid": credential_uuid},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_CREDENTIAL, credential_uuid)
         return cast(T.DeleteCredentialResponse, response)
 
     def deactivate_credential(self, body: T.DeactivateCredentialRequest) -> T.DeactivateCredentialResponse:
@@ -292,14 +218,7 @@ class AuthClient:
         Returns:
             T.DeactivateCredentialResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/credentials/deactivate",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DEACTIVATE_CREDENTIAL, body=body)
         return cast(T.DeactivateCredentialResponse, response)
 
     def create_credential_code(self, body: T.CreateCredentialCodeRequest) -> T.CreateCredentialCodeResponse:
@@ -316,14 +235,7 @@ class AuthClient:
                 Returns:
                     T.CreateCredentialCodeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/credentials/code",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_CREDENTIAL_CODE, body=body)
         return cast(T.CreateCredentialCodeResponse, response)
 
     def create_credential_challenge_with_code(self, body: T.CreateCredentialChallengeWithCodeRequest) -> dict[str, Any]:
@@ -340,14 +252,7 @@ class AuthClient:
                 Returns:
                     dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/credentials/code/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_CREDENTIAL_CHALLENGE_WITH_CODE, body=body)
         return cast(dict[str, Any], response)
 
     def create_credential_with_code(self, body: dict[str, Any]) -> T.CreateCredentialWithCodeResponse:
@@ -367,14 +272,7 @@ class AuthClient:
                 Returns:
                     T.CreateCredentialWithCodeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/credentials/code/verify",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_CREDENTIAL_WITH_CODE, body=body)
         return cast(T.CreateCredentialWithCodeResponse, response)
 
     def create_login_challenge(self, body: T.CreateLoginChallengeRequest) -> T.CreateLoginChallengeResponse:
@@ -393,14 +291,7 @@ class AuthClient:
                 Returns:
                     T.CreateLoginChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_LOGIN_CHALLENGE, body=body)
         return cast(T.CreateLoginChallengeResponse, response)
 
     def delegated_login(self, body: T.DelegatedLoginRequest) -> T.DelegatedLoginResponse:
@@ -423,14 +314,7 @@ class AuthClient:
                 Returns:
                     T.DelegatedLoginResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/delegated",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELEGATED_LOGIN, body=body)
         return cast(T.DelegatedLoginResponse, response)
 
     def complete_user_login(self, body: T.CompleteUserLoginRequest) -> dict[str, Any]:
@@ -450,14 +334,7 @@ class AuthClient:
                 Returns:
                     dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.COMPLETE_USER_LOGIN, body=body)
         return cast(dict[str, Any], response)
 
     def logout(self, body: T.LogoutRequest) -> T.LogoutResponse:
@@ -472,14 +349,7 @@ class AuthClient:
         Returns:
             T.LogoutResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/logout",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LOGOUT, body=body)
         return cast(T.LogoutResponse, response)
 
     def complete_oidc_login(self, body: T.CompleteOidcLoginRequest) -> dict[str, Any]:
@@ -494,14 +364,7 @@ class AuthClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/oidc",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.COMPLETE_OIDC_LOGIN, body=body)
         return cast(dict[str, Any], response)
 
     def initiate_oidc_login(self, body: T.InitiateOidcLoginRequest) -> T.InitiateOidcLoginResponse:
@@ -516,14 +379,7 @@ class AuthClient:
         Returns:
             T.InitiateOidcLoginResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/oidc/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.INITIATE_OIDC_LOGIN, body=body)
         return cast(T.InitiateOidcLoginResponse, response)
 
     def send_login_code(self, body: T.SendLoginCodeRequest) -> T.SendLoginCodeResponse:
@@ -540,14 +396,7 @@ class AuthClient:
                 Returns:
                     T.SendLoginCodeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/code",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.SEND_LOGIN_CODE, body=body)
         return cast(T.SendLoginCodeResponse, response)
 
     def social_login(self, body: T.SocialLoginRequest) -> T.SocialLoginResponse:
@@ -562,14 +411,7 @@ class AuthClient:
         Returns:
             T.SocialLoginResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/social",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.SOCIAL_LOGIN, body=body)
         return cast(T.SocialLoginResponse, response)
 
     def complete_sso_login(self, body: T.CompleteSsoLoginRequest) -> T.CompleteSsoLoginResponse:
@@ -584,14 +426,7 @@ class AuthClient:
         Returns:
             T.CompleteSsoLoginResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/sso",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.COMPLETE_SSO_LOGIN, body=body)
         return cast(T.CompleteSsoLoginResponse, response)
 
     def initiate_sso_login(self, body: T.InitiateSsoLoginRequest) -> T.InitiateSsoLoginResponse:
@@ -606,14 +441,7 @@ class AuthClient:
         Returns:
             T.InitiateSsoLoginResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/sso/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.INITIATE_SSO_LOGIN, body=body)
         return cast(T.InitiateSsoLoginResponse, response)
 
     def exchange_access_token(self, body: T.ExchangeAccessTokenRequest) -> T.ExchangeAccessTokenResponse:
@@ -628,14 +456,7 @@ class AuthClient:
         Returns:
             T.ExchangeAccessTokenResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/tokens",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.EXCHANGE_ACCESS_TOKEN, body=body)
         return cast(T.ExchangeAccessTokenResponse, response)
 
     def list_personal_access_tokens(self) -> T.ListPersonalAccessTokensResponse:
@@ -647,14 +468,7 @@ class AuthClient:
         Returns:
             T.ListPersonalAccessTokensResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/pats",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PERSONAL_ACCESS_TOKENS)
         return cast(T.ListPersonalAccessTokensResponse, response)
 
     def create_personal_access_token(
@@ -671,14 +485,7 @@ class AuthClient:
         Returns:
             T.CreatePersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/pats",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_PERSONAL_ACCESS_TOKEN, body=body)
         return cast(T.CreatePersonalAccessTokenResponse, response)
 
     def get_personal_access_token(self, token_id: str) -> T.GetPersonalAccessTokenResponse:
@@ -693,14 +500,7 @@ class AuthClient:
         Returns:
             T.GetPersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/pats/{tokenId}",
-            path_params={"tokenId": token_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_PERSONAL_ACCESS_TOKEN, token_id)
         return cast(T.GetPersonalAccessTokenResponse, response)
 
     def update_personal_access_token(
@@ -718,14 +518,7 @@ class AuthClient:
         Returns:
             T.UpdatePersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/pats/{tokenId}",
-            path_params={"tokenId": token_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UPDATE_PERSONAL_ACCESS_TOKEN, token_id, body=body)
         return cast(T.UpdatePersonalAccessTokenResponse, response)
 
     def delete_personal_access_token(self, token_id: str) -> T.DeletePersonalAccessTokenResponse:
@@ -740,14 +533,7 @@ class AuthClient:
         Returns:
             T.DeletePersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/auth/pats/{tokenId}",
-            path_params={"tokenId": token_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_PERSONAL_ACCESS_TOKEN, token_id)
         return cast(T.DeletePersonalAccessTokenResponse, response)
 
     def activate_personal_access_token(self, token_id: str) -> T.ActivatePersonalAccessTokenResponse:
@@ -762,14 +548,7 @@ class AuthClient:
         Returns:
             T.ActivatePersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/pats/{tokenId}/activate",
-            path_params={"tokenId": token_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ACTIVATE_PERSONAL_ACCESS_TOKEN, token_id)
         return cast(T.ActivatePersonalAccessTokenResponse, response)
 
     def deactivate_personal_access_token(self, token_id: str) -> T.DeactivatePersonalAccessTokenResponse:
@@ -784,14 +563,7 @@ class AuthClient:
         Returns:
             T.DeactivatePersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/pats/{tokenId}/deactivate",
-            path_params={"tokenId": token_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DEACTIVATE_PERSONAL_ACCESS_TOKEN, token_id)
         return cast(T.DeactivatePersonalAccessTokenResponse, response)
 
     def create_delegated_recovery_challenge(
@@ -814,14 +586,7 @@ class AuthClient:
                 Returns:
                     T.CreateDelegatedRecoveryChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/recover/user/delegated",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_DELEGATED_RECOVERY_CHALLENGE, body=body)
         return cast(T.CreateDelegatedRecoveryChallengeResponse, response)
 
     def recover_user(self, body: T.RecoverUserRequest) -> T.RecoverUserResponse:
@@ -844,14 +609,7 @@ class AuthClient:
                 Returns:
                     T.RecoverUserResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/recover/user",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.RECOVER_USER, body=body)
         return cast(T.RecoverUserResponse, response)
 
     def create_recovery_challenge(self, body: T.CreateRecoveryChallengeRequest) -> T.CreateRecoveryChallengeResponse:
@@ -866,14 +624,7 @@ class AuthClient:
         Returns:
             T.CreateRecoveryChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/recover/user/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_RECOVERY_CHALLENGE, body=body)
         return cast(T.CreateRecoveryChallengeResponse, response)
 
     def send_recovery_code_email(self, body: T.SendRecoveryCodeEmailRequest) -> T.SendRecoveryCodeEmailResponse:
@@ -888,14 +639,7 @@ class AuthClient:
         Returns:
             T.SendRecoveryCodeEmailResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/recover/user/code",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.SEND_RECOVERY_CODE_EMAIL, body=body)
         return cast(T.SendRecoveryCodeEmailResponse, response)
 
     def create_delegated_registration_challenge(
@@ -924,14 +668,7 @@ class AuthClient:
                 Returns:
                     T.CreateDelegatedRegistrationChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/registration/delegated",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_DELEGATED_REGISTRATION_CHALLENGE, body=body)
         return cast(T.CreateDelegatedRegistrationChallengeResponse, response)
 
     def create_registration_challenge(
@@ -948,14 +685,7 @@ class AuthClient:
         Returns:
             T.CreateRegistrationChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/registration/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_REGISTRATION_CHALLENGE, body=body)
         return cast(T.CreateRegistrationChallengeResponse, response)
 
     def create_social_registration_challenge(
@@ -972,14 +702,7 @@ class AuthClient:
         Returns:
             T.CreateSocialRegistrationChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/registration/social",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_SOCIAL_REGISTRATION_CHALLENGE, body=body)
         return cast(T.CreateSocialRegistrationChallengeResponse, response)
 
     def complete_user_registration(self, body: T.CompleteUserRegistrationRequest) -> T.CompleteUserRegistrationResponse:
@@ -1004,14 +727,7 @@ class AuthClient:
                 Returns:
                     T.CompleteUserRegistrationResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/registration",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.COMPLETE_USER_REGISTRATION, body=body)
         return cast(T.CompleteUserRegistrationResponse, response)
 
     def complete_end_user_registration_with_wallets(
@@ -1040,14 +756,7 @@ class AuthClient:
                 Returns:
                     T.CompleteEndUserRegistrationWithWalletsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/registration/enduser",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.COMPLETE_END_USER_REGISTRATION_WITH_WALLETS, body=body)
         return cast(T.CompleteEndUserRegistrationWithWalletsResponse, response)
 
     def resend_registration_code(self, body: T.ResendRegistrationCodeRequest) -> T.ResendRegistrationCodeResponse:
@@ -1062,14 +771,7 @@ class AuthClient:
         Returns:
             T.ResendRegistrationCodeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/registration/code",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.RESEND_REGISTRATION_CODE, body=body)
         return cast(T.ResendRegistrationCodeResponse, response)
 
     def list_service_accounts(self) -> T.ListServiceAccountsResponse:
@@ -1081,14 +783,7 @@ class AuthClient:
         Returns:
             T.ListServiceAccountsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/service-accounts",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_SERVICE_ACCOUNTS)
         return cast(T.ListServiceAccountsResponse, response)
 
     def create_service_account(self, body: T.CreateServiceAccountRequest) -> T.CreateServiceAccountResponse:
@@ -1103,14 +798,7 @@ class AuthClient:
         Returns:
             T.CreateServiceAccountResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/service-accounts",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_SERVICE_ACCOUNT, body=body)
         return cast(T.CreateServiceAccountResponse, response)
 
     def get_service_account(self, service_account_id: str) -> T.GetServiceAccountResponse:
@@ -1125,14 +813,7 @@ class AuthClient:
         Returns:
             T.GetServiceAccountResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/service-accounts/{serviceAccountId}",
-            path_params={"serviceAccountId": service_account_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_SERVICE_ACCOUNT, service_account_id)
         return cast(T.GetServiceAccountResponse, response)
 
     def update_service_account(
@@ -1150,14 +831,7 @@ class AuthClient:
         Returns:
             T.UpdateServiceAccountResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/service-accounts/{serviceAccountId}",
-            path_params={"serviceAccountId": service_account_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UPDATE_SERVICE_ACCOUNT, service_account_id, body=body)
         return cast(T.UpdateServiceAccountResponse, response)
 
     def delete_service_account(
@@ -1175,14 +849,7 @@ class AuthClient:
         Returns:
             T.DeleteServiceAccountResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/auth/service-accounts/{serviceAccountId}",
-            path_params={"serviceAccountId": service_account_id},
-            query_params=query,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_SERVICE_ACCOUNT, service_account_id, query_params=query)
         return cast(T.DeleteServiceAccountResponse, response)
 
     def activate_service_account(self, service_account_id: str) -> T.ActivateServiceAccountResponse:
@@ -1197,14 +864,7 @@ class AuthClient:
         Returns:
             T.ActivateServiceAccountResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/service-accounts/{serviceAccountId}/activate",
-            path_params={"serviceAccountId": service_account_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ACTIVATE_SERVICE_ACCOUNT, service_account_id)
         return cast(T.ActivateServiceAccountResponse, response)
 
     def deactivate_service_account(
@@ -1222,14 +882,7 @@ class AuthClient:
         Returns:
             T.DeactivateServiceAccountResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/service-accounts/{serviceAccountId}/deactivate",
-            path_params={"serviceAccountId": service_account_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DEACTIVATE_SERVICE_ACCOUNT, service_account_id, body=body)
         return cast(T.DeactivateServiceAccountResponse, response)
 
     def activate_user(self, user_id: str) -> T.ActivateUserResponse:
@@ -1244,14 +897,7 @@ class AuthClient:
         Returns:
             T.ActivateUserResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/users/{userId}/activate",
-            path_params={"userId": user_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ACTIVATE_USER, user_id)
         return cast(T.ActivateUserResponse, response)
 
     def deactivate_user(self, user_id: str) -> T.DeactivateUserResponse:
@@ -1266,14 +912,7 @@ class AuthClient:
         Returns:
             T.DeactivateUserResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/users/{userId}/deactivate",
-            path_params={"userId": user_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DEACTIVATE_USER, user_id)
         return cast(T.DeactivateUserResponse, response)
 
     def get_user(self, user_id: str) -> T.GetUserResponse:
@@ -1288,14 +927,7 @@ class AuthClient:
         Returns:
             T.GetUserResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/users/{userId}",
-            path_params={"userId": user_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_USER, user_id)
         return cast(T.GetUserResponse, response)
 
     def update_user(self, user_id: str, body: T.UpdateUserRequest) -> T.UpdateUserResponse:
@@ -1311,14 +943,7 @@ class AuthClient:
         Returns:
             T.UpdateUserResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/users/{userId}",
-            path_params={"userId": user_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UPDATE_USER, user_id, body=body)
         return cast(T.UpdateUserResponse, response)
 
     def delete_user(self, user_id: str) -> T.DeleteUserResponse:
@@ -1333,14 +958,7 @@ class AuthClient:
         Returns:
             T.DeleteUserResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/auth/users/{userId}",
-            path_params={"userId": user_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_USER, user_id)
         return cast(T.DeleteUserResponse, response)
 
     def list_users(self, query: T.ListUsersQuery | None = None) -> T.ListUsersResponse:
@@ -1355,16 +973,26 @@ class AuthClient:
         Returns:
             T.ListUsersResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/users",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_USERS, query_params=query)
         return cast(T.ListUsersResponse, response)
 
+    def iter_users(
+        self, query: T.ListUsersQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListUsersItem]:
+        """
+        Iterate over List Users.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListUsersItem]: The items of every page.
+        """
+        return iter_items(self.list_users, query, page_size)
+
     def create_user(self, body: T.CreateUserRequest) -> T.CreateUserResponse:
         """
               Create User.
@@ -1381,14 +1009,7 @@ class AuthClient:
               Returns:
                   T.CreateUserResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/users",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_USER, body=body)
         return cast(T.CreateUserResponse, response)
 
     def invite_tenant_user(self, body: T.InviteTenantUserRequest) -> T.InviteTenantUserResponse:
@@ -1403,12 +1024,5 @@ class AuthClient:
         Returns:
             T.InviteTenantUserResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/users/invite",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.INVITE_TENANT_USER, body=body)
         return cast(T.InviteTenantUserResponse, response)
@@ -1,12 +1,14 @@
 """Delegated client for the auth domain."""
 
-import json
+from collections.abc import Iterator
 from typing import Any, cast
 
 from typing_extensions import deprecated
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -42,14 +44,7 @@ class DelegatedAuthClient:
                 Returns:
                     T.CreateUserActionSignatureResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/action",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_USER_ACTION_SIGNATURE, body=body)
         return cast(T.CreateUserActionSignatureResponse, response)
 
     def create_user_action_challenge(
@@ -68,14 +63,7 @@ class DelegatedAuthClient:
               Returns:
                   T.CreateUserActionChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/action/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_USER_ACTION_CHALLENGE, body=body)
         return cast(T.CreateUserActionChallengeResponse, response)
 
     def list_audit_logs(self, query: T.ListAuditLogsQuery) -> None:
@@ -96,14 +84,7 @@ class DelegatedAuthClient:
                 Args:
                     query: Query parameters.
         """  # noqa: E501
-        self._http.request(
-            method="GET",
-            path="/auth/action/logs",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        self._http.call(E.LIST_AUDIT_LOGS, query_params=query)
 
     def get_audit_log(self, id: str) -> T.GetAuditLogResponse:
         """
@@ -119,14 +100,7 @@ class DelegatedAuthClient:
                 Returns:
                     T.GetAuditLogResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/action/logs/{id}",
-            path_params={"id": id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_AUDIT_LOG, id)
         return cast(T.GetAuditLogResponse, response)
 
     @deprecated("This endpoint is deprecated.")
@@ -141,14 +115,7 @@ class DelegatedAuthClient:
               Returns:
                   T.ListApplicationsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/apps",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_APPLICATIONS)
         return cast(T.ListApplicationsResponse, response)
 
     @deprecated("This endpoint is deprecated.")
@@ -166,14 +133,7 @@ class DelegatedAuthClient:
               Returns:
                   T.GetApplicationResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/apps/{appId}",
-            path_params={"appId": app_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_APPLICATION, app_id)
         return cast(T.GetApplicationResponse, response)
 
     def list_credentials(self) -> T.ListCredentialsResponse:
@@ -185,17 +145,10 @@ class DelegatedAuthClient:
         Returns:
             T.ListCredentialsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/credentials",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_CREDENTIALS)
         return cast(T.ListCredentialsResponse, response)
 
-    def create_credential_init(self, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def create_credential_init(self, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Create Credential.
 
@@ -205,20 +158,15 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/credentials"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_CREDENTIAL, E.CREATE_CREDENTIAL.path, body)
 
     def create_credential_complete(
-        self, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateCredentialResponse:
         """
         Complete Create Credential.
@@ -228,20 +176,19 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_credential_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateCredentialResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_CREDENTIAL.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/auth/credentials",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_CREDENTIAL, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateCredentialResponse, response)
 
@@ -259,17 +206,10 @@ class DelegatedAuthClient:
               Returns:
                   dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/credentials/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_CREDENTIAL_CHALLENGE, body=body)
         return cast(dict[str, Any], response)
 
-    def activate_credential_init(self, body: T.ActivateCredentialRequest) -> UserActionChallengeResponse:
+    def activate_credential_init(self, body: T.ActivateCredentialRequest) -> PreparedAction:
         """
         Initialize Activate Credential.
 
@@ -279,20 +219,15 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/credentials/activate"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.ACTIVATE_CREDENTIAL, E.ACTIVATE_CREDENTIAL.path, body)
 
     def activate_credential_complete(
-        self, body: T.ActivateCredentialRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.ActivateCredentialRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.ActivateCredentialResponse:
         """
         Complete Activate Credential.
@@ -302,24 +237,23 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_credential_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ActivateCredentialResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_CREDENTIAL.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/credentials/activate",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ACTIVATE_CREDENTIAL, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ActivateCredentialResponse, response)
 
-    def delete_credential_init(self, credential_uuid: str) -> UserActionChallengeResponse:
+    def delete_credential_init(self, credential_uuid: str) -> PreparedAction:
         """
         Initialize Delete Credential.
 
@@ -329,21 +263,17 @@ class DelegatedAuthClient:
             credential_uuid: Path parameter.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/credentials/{credentialUuid}"
-        path = path.replace("{credentialUuid}", str(credential_uuid))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_CREDENTIAL, E.DELETE_CREDENTIAL.resolve(credential_uuid)
         )
 
     def delete_credential_complete(
-        self, credential_uuid: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        credential_uuid: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.DeleteCredentialResponse:
         """
         Complete Delete Credential.
@@ -353,24 +283,23 @@ class DelegatedAuthClient:
         Args:
             credential_uuid: Path parameter.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_credential_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeleteCredentialResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_CREDENTIAL.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/auth/credentials/{credentialUuid}",
-            path_params={"credentialUuid": credential_uuid},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELETE_CREDENTIAL, credential_uuid, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeleteCredentialResponse, response)
 
-    def deactivate_credential_init(self, body: T.DeactivateCredentialRequest) -> UserActionChallengeResponse:
+    def deactivate_credential_init(self, body: T.DeactivateCredentialRequest) -> PreparedAction:
         """
         Initialize Deactivate Credential.
 
@@ -380,20 +309,15 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/credentials/deactivate"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.DEACTIVATE_CREDENTIAL, E.DEACTIVATE_CREDENTIAL.path, body)
 
     def deactivate_credential_complete(
-        self, body: T.DeactivateCredentialRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.DeactivateCredentialRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.DeactivateCredentialResponse:
         """
         Complete Deactivate Credential.
@@ -403,24 +327,23 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of deactivate_credential_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeactivateCredentialResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DEACTIVATE_CREDENTIAL.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/credentials/deactivate",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DEACTIVATE_CREDENTIAL, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeactivateCredentialResponse, response)
 
-    def create_credential_code_init(self, body: T.CreateCredentialCodeRequest) -> UserActionChallengeResponse:
+    def create_credential_code_init(self, body: T.CreateCredentialCodeRequest) -> PreparedAction:
         """
         Initialize Create Credential Code.
 
@@ -430,20 +353,17 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/credentials/code"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_CREDENTIAL_CODE, E.CREATE_CREDENTIAL_CODE.path, body
         )
 
     def create_credential_code_complete(
-        self, body: T.CreateCredentialCodeRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateCredentialCodeRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateCredentialCodeResponse:
         """
         Complete Create Credential Code.
@@ -453,20 +373,19 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_credential_code_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateCredentialCodeResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_CREDENTIAL_CODE.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/auth/credentials/code",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_CREDENTIAL_CODE, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateCredentialCodeResponse, response)
 
@@ -484,14 +403,7 @@ class DelegatedAuthClient:
                 Returns:
                     dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/credentials/code/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_CREDENTIAL_CHALLENGE_WITH_CODE, body=body)
         return cast(dict[str, Any], response)
 
     def create_credential_with_code(self, body: dict[str, Any]) -> T.CreateCredentialWithCodeResponse:
@@ -511,14 +423,7 @@ class DelegatedAuthClient:
                 Returns:
                     T.CreateCredentialWithCodeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/credentials/code/verify",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_CREDENTIAL_WITH_CODE, body=body)
         return cast(T.CreateCredentialWithCodeResponse, response)
 
     def create_login_challenge(self, body: T.CreateLoginChallengeRequest) -> T.CreateLoginChallengeResponse:
@@ -537,17 +442,10 @@ class DelegatedAuthClient:
                 Returns:
                     T.CreateLoginChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_LOGIN_CHALLENGE, body=body)
         return cast(T.CreateLoginChallengeResponse, response)
 
-    def delegated_login_init(self, body: T.DelegatedLoginRequest) -> UserActionChallengeResponse:
+    def delegated_login_init(self, body: T.DelegatedLoginRequest) -> PreparedAction:
         """
         Initialize Delegated Login.
 
@@ -557,20 +455,15 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/login/delegated"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.DELEGATED_LOGIN, E.DELEGATED_LOGIN.path, body)
 
     def delegated_login_complete(
-        self, body: T.DelegatedLoginRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.DelegatedLoginRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.DelegatedLoginResponse:
         """
         Complete Delegated Login.
@@ -580,20 +473,19 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delegated_login_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DelegatedLoginResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELEGATED_LOGIN.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/auth/login/delegated",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELEGATED_LOGIN, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DelegatedLoginResponse, response)
 
@@ -614,14 +506,7 @@ class DelegatedAuthClient:
                 Returns:
                     dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.COMPLETE_USER_LOGIN, body=body)
         return cast(dict[str, Any], response)
 
     def logout(self, body: T.LogoutRequest) -> T.LogoutResponse:
@@ -636,14 +521,7 @@ class DelegatedAuthClient:
         Returns:
             T.LogoutResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/logout",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LOGOUT, body=body)
         return cast(T.LogoutResponse, response)
 
     def complete_oidc_login(self, body: T.CompleteOidcLoginRequest) -> dict[str, Any]:
@@ -658,14 +536,7 @@ class DelegatedAuthClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/oidc",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.COMPLETE_OIDC_LOGIN, body=body)
         return cast(dict[str, Any], response)
 
     def initiate_oidc_login(self, body: T.InitiateOidcLoginRequest) -> T.InitiateOidcLoginResponse:
@@ -680,14 +551,7 @@ class DelegatedAuthClient:
         Returns:
             T.InitiateOidcLoginResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/oidc/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.INITIATE_OIDC_LOGIN, body=body)
         return cast(T.InitiateOidcLoginResponse, response)
 
     def send_login_code(self, body: T.SendLoginCodeRequest) -> T.SendLoginCodeResponse:
@@ -704,14 +568,7 @@ class DelegatedAuthClient:
                 Returns:
                     T.SendLoginCodeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/code",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.SEND_LOGIN_CODE, body=body)
         return cast(T.SendLoginCodeResponse, response)
 
     def social_login(self, body: T.SocialLoginRequest) -> T.SocialLoginResponse:
@@ -726,14 +583,7 @@ class DelegatedAuthClient:
         Returns:
             T.SocialLoginResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/social",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.SOCIAL_LOGIN, body=body)
         return cast(T.SocialLoginResponse, response)
 
     def complete_sso_login(self, body: T.CompleteSsoLoginRequest) -> T.CompleteSsoLoginResponse:
@@ -748,14 +598,7 @@ class DelegatedAuthClient:
         Returns:
             T.CompleteSsoLoginResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/sso",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.COMPLETE_SSO_LOGIN, body=body)
         return cast(T.CompleteSsoLoginResponse, response)
 
     def initiate_sso_login(self, body: T.InitiateSsoLoginRequest) -> T.InitiateSsoLoginResponse:
@@ -770,14 +613,7 @@ class DelegatedAuthClient:
         Returns:
             T.InitiateSsoLoginResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/login/sso/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.INITIATE_SSO_LOGIN, body=body)
         return cast(T.InitiateSsoLoginResponse, response)
 
     def exchange_access_token(self, body: T.ExchangeAccessTokenRequest) -> T.ExchangeAccessTokenResponse:
@@ -792,14 +628,7 @@ class DelegatedAuthClient:
         Returns:
             T.ExchangeAccessTokenResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/tokens",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.EXCHANGE_ACCESS_TOKEN, body=body)
         return cast(T.ExchangeAccessTokenResponse, response)
 
     def list_personal_access_tokens(self) -> T.ListPersonalAccessTokensResponse:
@@ -811,19 +640,10 @@ class DelegatedAuthClient:
         Returns:
             T.ListPersonalAccessTokensResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/pats",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PERSONAL_ACCESS_TOKENS)
         return cast(T.ListPersonalAccessTokensResponse, response)
 
-    def create_personal_access_token_init(
-        self, body: T.CreatePersonalAccessTokenRequest
-    ) -> UserActionChallengeResponse:
+    def create_personal_access_token_init(self, body: T.CreatePersonalAccessTokenRequest) -> PreparedAction:
         """
         Initialize Create Personal Access Token.
 
@@ -833,20 +653,17 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/pats"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_PERSONAL_ACCESS_TOKEN, E.CREATE_PERSONAL_ACCESS_TOKEN.path, body
         )
 
     def create_personal_access_token_complete(
-        self, body: T.CreatePersonalAccessTokenRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreatePersonalAccessTokenRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreatePersonalAccessTokenResponse:
         """
         Complete Create Personal Access Token.
@@ -856,20 +673,19 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_personal_access_token_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreatePersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PERSONAL_ACCESS_TOKEN.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/auth/pats",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_PERSONAL_ACCESS_TOKEN, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreatePersonalAccessTokenResponse, response)
 
@@ -885,19 +701,12 @@ class DelegatedAuthClient:
         Returns:
             T.GetPersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/pats/{tokenId}",
-            path_params={"tokenId": token_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_PERSONAL_ACCESS_TOKEN, token_id)
         return cast(T.GetPersonalAccessTokenResponse, response)
 
     def update_personal_access_token_init(
         self, token_id: str, body: T.UpdatePersonalAccessTokenRequest
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Update Personal Access Token.
 
@@ -908,21 +717,18 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/pats/{tokenId}"
-        path = path.replace("{tokenId}", str(token_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_PERSONAL_ACCESS_TOKEN, E.UPDATE_PERSONAL_ACCESS_TOKEN.resolve(token_id), body
         )
 
     def update_personal_access_token_complete(
-        self, token_id: str, body: T.UpdatePersonalAccessTokenRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        token_id: str,
+        body: T.UpdatePersonalAccessTokenRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UpdatePersonalAccessTokenResponse:
         """
         Complete Update Personal Access Token.
@@ -933,24 +739,23 @@ class DelegatedAuthClient:
             token_id: Token id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_personal_access_token_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UpdatePersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_PERSONAL_ACCESS_TOKEN.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/pats/{tokenId}",
-            path_params={"tokenId": token_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UPDATE_PERSONAL_ACCESS_TOKEN, token_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.UpdatePersonalAccessTokenResponse, response)
 
-    def delete_personal_access_token_init(self, token_id: str) -> UserActionChallengeResponse:
+    def delete_personal_access_token_init(self, token_id: str) -> PreparedAction:
         """
         Initialize Delete Personal Access Token.
 
@@ -960,21 +765,14 @@ class DelegatedAuthClient:
             token_id: Token id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/pats/{tokenId}"
-        path = path.replace("{tokenId}", str(token_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_PERSONAL_ACCESS_TOKEN, E.DELETE_PERSONAL_ACCESS_TOKEN.resolve(token_id)
         )
 
     def delete_personal_access_token_complete(
-        self, token_id: str, signed_challenge: SignUserActionChallengeRequest
+        self, token_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
     ) -> T.DeletePersonalAccessTokenResponse:
         """
         Complete Delete Personal Access Token.
@@ -984,24 +782,23 @@ class DelegatedAuthClient:
         Args:
             token_id: Token id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_personal_access_token_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeletePersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_PERSONAL_ACCESS_TOKEN.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/auth/pats/{tokenId}",
-            path_params={"tokenId": token_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELETE_PERSONAL_ACCESS_TOKEN, token_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeletePersonalAccessTokenResponse, response)
 
-    def activate_personal_access_token_init(self, token_id: str) -> UserActionChallengeResponse:
+    def activate_personal_access_token_init(self, token_id: str) -> PreparedAction:
         """
         Initialize Activate Personal Access Token.
 
@@ -1011,21 +808,14 @@ class DelegatedAuthClient:
             token_id: Token id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/pats/{tokenId}/activate"
-        path = path.replace("{tokenId}", str(token_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.ACTIVATE_PERSONAL_ACCESS_TOKEN, E.ACTIVATE_PERSONAL_ACCESS_TOKEN.resolve(token_id)
         )
 
     def activate_personal_access_token_complete(
-        self, token_id: str, signed_challenge: SignUserActionChallengeRequest
+        self, token_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
     ) -> T.ActivatePersonalAccessTokenResponse:
         """
         Complete Activate Personal Access Token.
@@ -1035,24 +825,23 @@ class DelegatedAuthClient:
         Args:
             token_id: Token id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_personal_access_token_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ActivatePersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_PERSONAL_ACCESS_TOKEN.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/pats/{tokenId}/activate",
-            path_params={"tokenId": token_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ACTIVATE_PERSONAL_ACCESS_TOKEN, token_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ActivatePersonalAccessTokenResponse, response)
 
-    def deactivate_personal_access_token_init(self, token_id: str) -> UserActionChallengeResponse:
+    def deactivate_personal_access_token_init(self, token_id: str) -> PreparedAction:
         """
         Initialize Deactivate Personal Access Token.
 
@@ -1062,21 +851,14 @@ class DelegatedAuthClient:
             token_id: Token id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/pats/{tokenId}/deactivate"
-        path = path.replace("{tokenId}", str(token_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.DEACTIVATE_PERSONAL_ACCESS_TOKEN, E.DEACTIVATE_PERSONAL_ACCESS_TOKEN.resolve(token_id)
         )
 
     def deactivate_personal_access_token_complete(
-        self, token_id: str, signed_challenge: SignUserActionChallengeRequest
+        self, token_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
     ) -> T.DeactivatePersonalAccessTokenResponse:
         """
         Complete Deactivate Personal Access Token.
@@ -1086,26 +868,25 @@ class DelegatedAuthClient:
         Args:
             token_id: Token id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of deactivate_personal_access_token_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeactivatePersonalAccessTokenResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DEACTIVATE_PERSONAL_ACCESS_TOKEN.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/pats/{tokenId}/deactivate",
-            path_params={"tokenId": token_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DEACTIVATE_PERSONAL_ACCESS_TOKEN, token_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeactivatePersonalAccessTokenResponse, response)
 
     def create_delegated_recovery_challenge_init(
         self, body: T.CreateDelegatedRecoveryChallengeRequest
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Create Delegated Recovery Challenge.
 
@@ -1115,20 +896,17 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/recover/user/delegated"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_DELEGATED_RECOVERY_CHALLENGE, E.CREATE_DELEGATED_RECOVERY_CHALLENGE.path, body
         )
 
     def create_delegated_recovery_challenge_complete(
-        self, body: T.CreateDelegatedRecoveryChallengeRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateDelegatedRecoveryChallengeRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateDelegatedRecoveryChallengeResponse:
         """
         Complete Create Delegated Recovery Challenge.
@@ -1138,20 +916,19 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_delegated_recovery_challenge_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateDelegatedRecoveryChallengeResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_DELEGATED_RECOVERY_CHALLENGE.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/auth/recover/user/delegated",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_DELEGATED_RECOVERY_CHALLENGE, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateDelegatedRecoveryChallengeResponse, response)
 
@@ -1175,14 +952,7 @@ class DelegatedAuthClient:
                 Returns:
                     T.RecoverUserResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/recover/user",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.RECOVER_USER, body=body)
         return cast(T.RecoverUserResponse, response)
 
     def create_recovery_challenge(self, body: T.CreateRecoveryChallengeRequest) -> T.CreateRecoveryChallengeResponse:
@@ -1197,14 +967,7 @@ class DelegatedAuthClient:
         Returns:
             T.CreateRecoveryChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/recover/user/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_RECOVERY_CHALLENGE, body=body)
         return cast(T.CreateRecoveryChallengeResponse, response)
 
     def send_recovery_code_email(self, body: T.SendRecoveryCodeEmailRequest) -> T.SendRecoveryCodeEmailResponse:
@@ -1219,19 +982,12 @@ class DelegatedAuthClient:
         Returns:
             T.SendRecoveryCodeEmailResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/recover/user/code",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.SEND_RECOVERY_CODE_EMAIL, body=body)
         return cast(T.SendRecoveryCodeEmailResponse, response)
 
     def create_delegated_registration_challenge_init(
         self, body: T.CreateDelegatedRegistrationChallengeRequest
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Create Delegated Registration Challenge.
 
@@ -1241,20 +997,20 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/registration/delegated"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
+        return BaseAuthApi.prepare_user_action(
             self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+            E.CREATE_DELEGATED_REGISTRATION_CHALLENGE,
+            E.CREATE_DELEGATED_REGISTRATION_CHALLENGE.path,
+            body,
         )
 
     def create_delegated_registration_challenge_complete(
-        self, body: T.CreateDelegatedRegistrationChallengeRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateDelegatedRegistrationChallengeRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateDelegatedRegistrationChallengeResponse:
         """
         Complete Create Delegated Registration Challenge.
@@ -1264,20 +1020,19 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_delegated_registration_challenge_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateDelegatedRegistrationChallengeResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_DELEGATED_REGISTRATION_CHALLENGE.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/auth/registration/delegated",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_DELEGATED_REGISTRATION_CHALLENGE, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateDelegatedRegistrationChallengeResponse, response)
 
@@ -1295,14 +1050,7 @@ class DelegatedAuthClient:
         Returns:
             T.CreateRegistrationChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/registration/init",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_REGISTRATION_CHALLENGE, body=body)
         return cast(T.CreateRegistrationChallengeResponse, response)
 
     def create_social_registration_challenge(
@@ -1319,14 +1067,7 @@ class DelegatedAuthClient:
         Returns:
             T.CreateSocialRegistrationChallengeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/registration/social",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CREATE_SOCIAL_REGISTRATION_CHALLENGE, body=body)
         return cast(T.CreateSocialRegistrationChallengeResponse, response)
 
     def complete_user_registration(self, body: T.CompleteUserRegistrationRequest) -> T.CompleteUserRegistrationResponse:
@@ -1351,14 +1092,7 @@ class DelegatedAuthClient:
                 Returns:
                     T.CompleteUserRegistrationResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/registration",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.COMPLETE_USER_REGISTRATION, body=body)
         return cast(T.CompleteUserRegistrationResponse, response)
 
     def complete_end_user_registration_with_wallets(
@@ -1387,14 +1121,7 @@ class DelegatedAuthClient:
                 Returns:
                     T.CompleteEndUserRegistrationWithWalletsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/auth/registration/enduser",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.COMPLETE_END_USER_REGISTRATION_WITH_WALLETS, body=body)
         return cast(T.CompleteEndUserRegistrationWithWalletsResponse, response)
 
     def resend_registration_code(self, body: T.ResendRegistrationCodeRequest) -> T.ResendRegistrationCodeResponse:
@@ -1409,14 +1136,7 @@ class DelegatedAuthClient:
         Returns:
             T.ResendRegistrationCodeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/auth/registration/code",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.RESEND_REGISTRATION_CODE, body=body)
         return cast(T.ResendRegistrationCodeResponse, response)
 
     def list_service_accounts(self) -> T.ListServiceAccountsResponse:
@@ -1428,17 +1148,10 @@ class DelegatedAuthClient:
         Returns:
             T.ListServiceAccountsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/service-accounts",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_SERVICE_ACCOUNTS)
         return cast(T.ListServiceAccountsResponse, response)
 
-    def create_service_account_init(self, body: T.CreateServiceAccountRequest) -> UserActionChallengeResponse:
+    def create_service_account_init(self, body: T.CreateServiceAccountRequest) -> PreparedAction:
         """
         Initialize Create Service Account.
 
@@ -1448,20 +1161,17 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/service-accounts"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_SERVICE_ACCOUNT, E.CREATE_SERVICE_ACCOUNT.path, body
         )
 
     def create_service_account_complete(
-        self, body: T.CreateServiceAccountRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateServiceAccountRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateServiceAccountResponse:
         """
         Complete Create Service Account.
@@ -1471,20 +1181,19 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_service_account_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateServiceAccountResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_SERVICE_ACCOUNT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/auth/service-accounts",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_SERVICE_ACCOUNT, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateServiceAccountResponse, response)
 
@@ -1500,19 +1209,12 @@ class DelegatedAuthClient:
         Returns:
             T.GetServiceAccountResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/service-accounts/{serviceAccountId}",
-            path_params={"serviceAccountId": service_account_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_SERVICE_ACCOUNT, service_account_id)
         return cast(T.GetServiceAccountResponse, response)
 
     def update_service_account_init(
         self, service_account_id: str, body: T.UpdateServiceAccountRequest
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Update Service Account.
 
@@ -1523,17 +1225,10 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/service-accounts/{serviceAccountId}"
-        path = path.replace("{serviceAccountId}", str(service_account_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_SERVICE_ACCOUNT, E.UPDATE_SERVICE_ACCOUNT.resolve(service_account_id), body
         )
 
     def update_service_account_complete(
@@ -1541,6 +1236,7 @@ class DelegatedAuthClient:
         service_account_id: str,
         body: T.UpdateServiceAccountRequest,
         signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UpdateServiceAccountResponse:
         """
         Complete Update Service Account.
@@ -1551,26 +1247,25 @@ class DelegatedAuthClient:
             service_account_id: ID of the service account.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_service_account_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UpdateServiceAccountResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_SERVICE_ACCOUNT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/service-accounts/{serviceAccountId}",
-            path_params={"serviceAccountId": service_account_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UPDATE_SERVICE_ACCOUNT, service_account_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.UpdateServiceAccountResponse, response)
 
     def delete_service_account_init(
         self, service_account_id: str, query: T.DeleteServiceAccountQuery | None = None
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Delete Service Account.
 
@@ -1581,17 +1276,10 @@ class DelegatedAuthClient:
             query: Query parameters.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/service-accounts/{serviceAccountId}"
-        path = path.replace("{serviceAccountId}", str(service_account_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_SERVICE_ACCOUNT, E.DELETE_SERVICE_ACCOUNT.resolve(service_account_id)
         )
 
     def delete_service_account_complete(
@@ -1599,6 +1287,7 @@ class DelegatedAuthClient:
         service_account_id: str,
         signed_challenge: SignUserActionChallengeRequest,
         query: T.DeleteServiceAccountQuery | None = None,
+        prepared: PreparedAction | None = None,
     ) -> T.DeleteServiceAccountResponse:
         """
         Complete Delete Service Account.
@@ -1608,25 +1297,28 @@ class DelegatedAuthClient:
         Args:
             service_account_id: ID of the service account.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_service_account_init(); its payload is sent as is instead of
+                encoding the body again.
             query: Query parameters.
 
         Returns:
             T.DeleteServiceAccountResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_SERVICE_ACCOUNT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/auth/service-accounts/{serviceAccountId}",
-            path_params={"serviceAccountId": service_account_id},
+        response = self._http.call_with_user_action(
+            E.DELETE_SERVICE_ACCOUNT,
+            service_account_id,
             query_params=query,
-            body=None,
             user_action=user_action_token,
+            prepared=prepared,
         )
         return cast(T.DeleteServiceAccountResponse, response)
 
-    def activate_service_account_init(self, service_account_id: str) -> UserActionChallengeResponse:
+    def activate_service_account_init(self, service_account_id: str) -> PreparedAction:
         """
         Initialize Activate Service Account.
 
@@ -1636,21 +1328,17 @@ class DelegatedAuthClient:
             service_account_id: ID of the service account.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/service-accounts/{serviceAccountId}/activate"
-        path = path.replace("{serviceAccountId}", str(service_account_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.ACTIVATE_SERVICE_ACCOUNT, E.ACTIVATE_SERVICE_ACCOUNT.resolve(service_account_id)
         )
 
     def activate_service_account_complete(
-        self, service_account_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        service_account_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.ActivateServiceAccountResponse:
         """
         Complete Activate Service Account.
@@ -1660,26 +1348,25 @@ class DelegatedAuthClient:
         Args:
             service_account_id: ID of the service account.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_service_account_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ActivateServiceAccountResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_SERVICE_ACCOUNT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/service-accounts/{serviceAccountId}/activate",
-            path_params={"serviceAccountId": service_account_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ACTIVATE_SERVICE_ACCOUNT, service_account_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ActivateServiceAccountResponse, response)
 
     def deactivate_service_account_init(
         self, service_account_id: str, body: T.DeactivateServiceAccountRequest
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Deactivate Service Account.
 
@@ -1690,17 +1377,13 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/service-accounts/{serviceAccountId}/deactivate"
-        path = path.replace("{serviceAccountId}", str(service_account_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
+        return BaseAuthApi.prepare_user_action(
             self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+            E.DEACTIVATE_SERVICE_ACCOUNT,
+            E.DEACTIVATE_SERVICE_ACCOUNT.resolve(service_account_id),
+            body,
         )
 
     def deactivate_service_account_complete(
@@ -1708,6 +1391,7 @@ class DelegatedAuthClient:
         service_account_id: str,
         body: T.DeactivateServiceAccountRequest,
         signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.DeactivateServiceAccountResponse:
         """
         Complete Deactivate Service Account.
@@ -1718,24 +1402,27 @@ class DelegatedAuthClient:
             service_account_id: ID of the service account.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of deactivate_service_account_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeactivateServiceAccountResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DEACTIVATE_SERVICE_ACCOUNT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/service-accounts/{serviceAccountId}/deactivate",
-            path_params={"serviceAccountId": service_account_id},
-            query_params=None,
+        response = self._http.call_with_user_action(
+            E.DEACTIVATE_SERVICE_ACCOUNT,
+            service_account_id,
             body=body,
             user_action=user_action_token,
+            prepared=prepared,
         )
         return cast(T.DeactivateServiceAccountResponse, response)
 
-    def activate_user_init(self, user_id: str) -> UserActionChallengeResponse:
+    def activate_user_init(self, user_id: str) -> PreparedAction:
         """
         Initialize Activate User.
 
@@ -1745,21 +1432,12 @@ class DelegatedAuthClient:
             user_id: User id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/users/{userId}/activate"
-        path = path.replace("{userId}", str(user_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.ACTIVATE_USER, E.ACTIVATE_USER.resolve(user_id))
 
     def activate_user_complete(
-        self, user_id: str, signed_challenge: SignUserActionChallengeRequest
+        self, user_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
     ) -> T.ActivateUserResponse:
         """
         Complete Activate User.
@@ -1769,24 +1447,23 @@ class DelegatedAuthClient:
         Args:
             user_id: User id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_user_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ActivateUserResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_USER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/users/{userId}/activate",
-            path_params={"userId": user_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ACTIVATE_USER, user_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ActivateUserResponse, response)
 
-    def deactivate_user_init(self, user_id: str) -> UserActionChallengeResponse:
+    def deactivate_user_init(self, user_id: str) -> PreparedAction:
         """
         Initialize Deactivate User.
 
@@ -1796,21 +1473,12 @@ class DelegatedAuthClient:
             user_id: User id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/users/{userId}/deactivate"
-        path = path.replace("{userId}", str(user_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.DEACTIVATE_USER, E.DEACTIVATE_USER.resolve(user_id))
 
     def deactivate_user_complete(
-        self, user_id: str, signed_challenge: SignUserActionChallengeRequest
+        self, user_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
     ) -> T.DeactivateUserResponse:
         """
         Complete Deactivate User.
@@ -1820,20 +1488,19 @@ class DelegatedAuthClient:
         Args:
             user_id: User id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of deactivate_user_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeactivateUserResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DEACTIVATE_USER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/users/{userId}/deactivate",
-            path_params={"userId": user_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DEACTIVATE_USER, user_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeactivateUserResponse, response)
 
@@ -1849,17 +1516,10 @@ class DelegatedAuthClient:
         Returns:
             T.GetUserResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/users/{userId}",
-            path_params={"userId": user_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_USER, user_id)
         return cast(T.GetUserResponse, response)
 
-    def update_user_init(self, user_id: str, body: T.UpdateUserRequest) -> UserActionChallengeResponse:
+    def update_user_init(self, user_id: str, body: T.UpdateUserRequest) -> PreparedAction:
         """
         Initialize Update User.
 
@@ -1870,21 +1530,16 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/users/{userId}"
-        path = path.replace("{userId}", str(user_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.UPDATE_USER, E.UPDATE_USER.resolve(user_id), body)
 
     def update_user_complete(
-        self, user_id: str, body: T.UpdateUserRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        user_id: str,
+        body: T.UpdateUserRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UpdateUserResponse:
         """
         Complete Update User.
@@ -1895,24 +1550,23 @@ class DelegatedAuthClient:
             user_id: User id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_user_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UpdateUserResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_USER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/auth/users/{userId}",
-            path_params={"userId": user_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UPDATE_USER, user_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.UpdateUserResponse, response)
 
-    def delete_user_init(self, user_id: str) -> UserActionChallengeResponse:
+    def delete_user_init(self, user_id: str) -> PreparedAction:
         """
         Initialize Delete User.
 
@@ -1922,21 +1576,12 @@ class DelegatedAuthClient:
             user_id: User id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/users/{userId}"
-        path = path.replace("{userId}", str(user_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.DELETE_USER, E.DELETE_USER.resolve(user_id))
 
     def delete_user_complete(
-        self, user_id: str, signed_challenge: SignUserActionChallengeRequest
+        self, user_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
     ) -> T.DeleteUserResponse:
         """
         Complete Delete User.
@@ -1946,20 +1591,19 @@ class DelegatedAuthClient:
         Args:
             user_id: User id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_user_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeleteUserResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_USER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/auth/users/{userId}",
-            path_params={"userId": user_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELETE_USER, user_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeleteUserResponse, response)
 
@@ -1975,17 +1619,27 @@ class DelegatedAuthClient:
         Returns:
             T.ListUsersResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/auth/users",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_USERS, query_params=query)
         return cast(T.ListUsersResponse, response)
 
-    def create_user_init(self, body: T.CreateUserRequest) -> UserActionChallengeResponse:
+    def iter_users(
+        self, query: T.ListUsersQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListUsersItem]:
+        """
+        Iterate over List Users.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListUsersItem]: The items of every page.
+        """
+        return iter_items(self.list_users, query, page_size)
+
+    def create_user_init(self, body: T.CreateUserRequest) -> PreparedAction:
         """
         Initialize Create User.
 
@@ -1995,20 +1649,15 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/users"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_USER, E.CREATE_USER.path, body)
 
     def create_user_complete(
-        self, body: T.CreateUserRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateUserRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateUserResponse:
         """
         Complete Create User.
@@ -2018,24 +1667,23 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_user_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateUserResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_USER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/auth/users",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_USER, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateUserResponse, response)
 
-    def invite_tenant_user_init(self, body: T.InviteTenantUserRequest) -> UserActionChallengeResponse:
+    def invite_tenant_user_init(self, body: T.InviteTenantUserRequest) -> PreparedAction:
         """
         Initialize Invite Tenant User.
 
@@ -2045,20 +1693,15 @@ class DelegatedAuthClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/auth/users/invite"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.INVITE_TENANT_USER, E.INVITE_TENANT_USER.path, body)
 
     def invite_tenant_user_complete(
-        self, body: T.InviteTenantUserRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.InviteTenantUserRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.InviteTenantUserResponse:
         """
         Complete Invite Tenant User.
@@ -2068,19 +1711,18 @@ class DelegatedAuthClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of invite_tenant_user_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.InviteTenantUserResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.INVITE_TENANT_USER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/auth/users/invite",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.INVITE_TENANT_USER, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.InviteTenantUserResponse, response)
@@ -0,0 +1,251 @@
+"""Endpoint registry for the auth domain."""
+
+from ..._internal.endpoint import Endpoint
+
+CREATE_USER_ACTION_SIGNATURE = Endpoint(
+    "auth.create_user_action_signature", "POST", "/auth/action", response_type="CreateUserActionSignatureResponse"
+)
+CREATE_USER_ACTION_CHALLENGE = Endpoint(
+    "auth.create_user_action_challenge", "POST", "/auth/action/init", response_type="CreateUserActionChallengeResponse"
+)
+LIST_AUDIT_LOGS = Endpoint("auth.list_audit_logs", "GET", "/auth/action/logs")
+GET_AUDIT_LOG = Endpoint("auth.get_audit_log", "GET", "/auth/action/logs/{id}", response_type="GetAuditLogResponse")
+LIST_APPLICATIONS = Endpoint("auth.list_applications", "GET", "/auth/apps", response_type="ListApplicationsResponse")
+GET_APPLICATION = Endpoint("auth.get_application", "GET", "/auth/apps/{appId}", response_type="GetApplicationResponse")
+LIST_CREDENTIALS = Endpoint(
+    "auth.list_credentials", "GET", "/auth/credentials", response_type="ListCredentialsResponse"
+)
+CREATE_CREDENTIAL = Endpoint(
+    "auth.create_credential",
+    "POST",
+    "/auth/credentials",
+    requires_signature=True,
+    response_type="CreateCredentialResponse",
+)
+CREATE_CREDENTIAL_CHALLENGE = Endpoint("auth.create_credential_challenge", "POST", "/auth/credentials/init")
+ACTIVATE_CREDENTIAL = Endpoint(
+    "auth.activate_credential",
+    "PUT",
+    "/auth/credentials/activate",
+    requires_signature=True,
+    response_type="ActivateCredentialResponse",
+)
+DELETE_CREDENTIAL = Endpoint(
+    "auth.delete_credential",
+    "DELETE",
+    "/auth/credentials/{credentialUuid}",
+    requires_signature=True,
+    response_type="DeleteCredentialResponse",
+)
+DEACTIVATE_CREDENTIAL = Endpoint(
+    "auth.deactivate_credential",
+    "PUT",
+    "/auth/credentials/deactivate",
+    requires_signature=True,
+    response_type="DeactivateCredentialResponse",
+)
+CREATE_CREDENTIAL_CODE = Endpoint(
+    "auth.create_credential_code",
+    "POST",
+    "/auth/credentials/code",
+    requires_signature=True,
+    response_type="CreateCredentialCodeResponse",
+)
+CREATE_CREDENTIAL_CHALLENGE_WITH_CODE = Endpoint(
+    "auth.create_credential_challenge_with_code", "POST", "/auth/credentials/code/init"
+)
+CREATE_CREDENTIAL_WITH_CODE = Endpoint(
+    "auth.create_credential_with_code",
+    "POST",
+    "/auth/credentials/code/verify",
+    response_type="CreateCredentialWithCodeResponse",
+)
+CREATE_LOGIN_CHALLENGE = Endpoint(
+    "auth.create_login_challenge", "POST", "/auth/login/init", response_type="CreateLoginChallengeResponse"
+)
+DELEGATED_LOGIN = Endpoint(
+    "auth.delegated_login",
+    "POST",
+    "/auth/login/delegated",
+    requires_signature=True,
+    response_type="DelegatedLoginResponse",
+)
+COMPLETE_USER_LOGIN = Endpoint("auth.complete_user_login", "POST", "/auth/login")
+LOGOUT = Endpoint("auth.logout", "PUT", "/auth/logout", response_type="LogoutResponse")
+COMPLETE_OIDC_LOGIN = Endpoint("auth.complete_oidc_login", "POST", "/auth/login/oidc")
+INITIATE_OIDC_LOGIN = Endpoint(
+    "auth.initiate_oidc_login", "POST", "/auth/login/oidc/init", response_type="InitiateOidcLoginResponse"
+)
+SEND_LOGIN_CODE = Endpoint("auth.send_login_code", "POST", "/auth/login/code", response_type="SendLoginCodeResponse")
+SOCIAL_LOGIN = Endpoint("auth.social_login", "POST", "/auth/login/social", response_type="SocialLoginResponse")
+COMPLETE_SSO_LOGIN = Endpoint(
+    "auth.complete_sso_login", "POST", "/auth/login/sso", response_type="CompleteSsoLoginResponse"
+)
+INITIATE_SSO_LOGIN = Endpoint(
+    "auth.initiate_sso_login", "POST", "/auth/login/sso/init", response_type="InitiateSsoLoginResponse"
+)
+EXCHANGE_ACCESS_TOKEN = Endpoint(
+    "auth.exchange_access_token", "POST", "/auth/tokens", response_type="ExchangeAccessTokenResponse"
+)
+LIST_PERSONAL_ACCESS_TOKENS = Endpoint(
+    "auth.list_personal_access_tokens", "GET", "/auth/pats", response_type="ListPersonalAccessTokensResponse"
+)
+CREATE_PERSONAL_ACCESS_TOKEN = Endpoint(
+    "auth.create_personal_access_token",
+    "POST",
+    "/auth/pats",
+    requires_signature=True,
+    response_type="CreatePersonalAccessTokenResponse",
+)
+GET_PERSONAL_ACCESS_TOKEN = Endpoint(
+    "auth.get_personal_access_token", "GET", "/auth/pats/{tokenId}", response_type="GetPersonalAccessTokenResponse"
+)
+UPDATE_PERSONAL_ACCESS_TOKEN = Endpoint(
+    "auth.update_personal_access_token",
+    "PUT",
+    "/auth/pats/{tokenId}",
+    requires_signature=True,
+    response_type="UpdatePersonalAccessTokenResponse",
+)
+DELETE_PERSONAL_ACCESS_TOKEN = Endpoint(
+    "auth.delete_personal_access_token",
+    "DELETE",
+    "/auth/pats/{tokenId}",
+    requires_signature=True,
+    response_type="DeletePersonalAccessTokenResponse",
+)
+ACTIVATE_PERSONAL_ACCESS_TOKEN = Endpoint(
+    "auth.activate_personal_access_token",
+    "PUT",
+    "/auth/pats/{tokenId}/activate",
+    requires_signature=True,
+    response_type="ActivatePersonalAccessTokenResponse",
+)
+DEACTIVATE_PERSONAL_ACCESS_TOKEN = Endpoint(
+    "auth.deactivate_personal_access_token",
+    "PUT",
+    "/auth/pats/{tokenId}/deactivate",
+    requires_signature=True,
+    response_type="DeactivatePersonalAccessTokenResponse",
+)
+CREATE_DELEGATED_RECOVERY_CHALLENGE = Endpoint(
+    "auth.create_delegated_recovery_challenge",
+    "POST",
+    "/auth/recover/user/delegated",
+    requires_signature=True,
+    response_type="CreateDelegatedRecoveryChallengeResponse",
+)
+RECOVER_USER = Endpoint("auth.recover_user", "POST", "/auth/recover/user", response_type="RecoverUserResponse")
+CREATE_RECOVERY_CHALLENGE = Endpoint(
+    "auth.create_recovery_challenge", "POST", "/auth/recover/user/init", response_type="CreateRecoveryChallengeResponse"
+)
+SEND_RECOVERY_CODE_EMAIL = Endpoint(
+    "auth.send_recovery_code_email", "POST", "/auth/recover/user/code", response_type="SendRecoveryCodeEmailResponse"
+)
+CREATE_DELEGATED_REGISTRATION_CHALLENGE = Endpoint(
+    "auth.create_delegated_registration_challenge",
+    "POST",
+    "/auth/registration/delegated",
+    requires_signature=True,
+    response_type="CreateDelegatedRegistrationChallengeResponse",
+)
+CREATE_REGISTRATION_CHALLENGE = Endpoint(
+    "auth.create_registration_challenge",
+    "POST",
+    "/auth/registration/init",
+    response_type="CreateRegistrationChallengeResponse",
+)
+CREATE_SOCIAL_REGISTRATION_CHALLENGE = Endpoint(
+    "auth.create_social_registration_challenge",
+    "POST",
+    "/auth/registration/social",
+    response_type="CreateSocialRegistrationChallengeResponse",
+)
+COMPLETE_USER_REGISTRATION = Endpoint(
+    "auth.complete_user_registration", "POST", "/auth/registration", response_type="CompleteUserRegistrationResponse"
+)
+COMPLETE_END_USER_REGISTRATION_WITH_WALLETS = Endpoint(
+    "auth.complete_end_user_registration_with_wallets",
+    "POST",
+    "/auth/registration/enduser",
+    response_type="CompleteEndUserRegistrationWithWalletsResponse",
+)
+RESEND_REGISTRATION_CODE = Endpoint(
+    "auth.resend_registration_code", "PUT", "/auth/registration/code", response_type="ResendRegistrationCodeResponse"
+)
+LIST_SERVICE_ACCOUNTS = Endpoint(
+    "auth.list_service_accounts", "GET", "/auth/service-accounts", response_type="ListServiceAccountsResponse"
+)
+CREATE_SERVICE_ACCOUNT = Endpoint(
+    "auth.create_service_account",
+    "POST",
+    "/auth/service-accounts",
+    requires_signature=True,
+    response_type="CreateServiceAccountResponse",
+)
+GET_SERVICE_ACCOUNT = Endpoint(
+    "auth.get_service_account",
+    "GET",
+    "/auth/service-accounts/{serviceAccountId}",
+    response_type="GetServiceAccountResponse",
+)
+UPDATE_SERVICE_ACCOUNT = Endpoint(
+    "auth.update_service_account",
+    "PUT",
+    "/auth/service-accounts/{serviceAccountId}",
+    requires_signature=True,
+    response_type="UpdateServiceAccountResponse",
+)
+DELETE_SERVICE_ACCOUNT = Endpoint(
+    "auth.delete_service_account",
+    "DELETE",
+    "/auth/service-accounts/{serviceAccountId}",
+    requires_signature=True,
+    response_type="DeleteServiceAccountResponse",
+)
+ACTIVATE_SERVICE_ACCOUNT = Endpoint(
+    "auth.activate_service_account",
+    "PUT",
+    "/auth/service-accounts/{serviceAccountId}/activate",
+    requires_signature=True,
+    response_type="ActivateServiceAccountResponse",
+)
+DEACTIVATE_SERVICE_ACCOUNT = Endpoint(
+    "auth.deactivate_service_account",
+    "PUT",
+    "/auth/service-accounts/{serviceAccountId}/deactivate",
+    requires_signature=True,
+    response_type="DeactivateServiceAccountResponse",
+)
+ACTIVATE_USER = Endpoint(
+    "auth.activate_user",
+    "PUT",
+    "/auth/users/{userId}/activate",
+    requires_signature=True,
+    response_type="ActivateUserResponse",
+)
+DEACTIVATE_USER = Endpoint(
+    "auth.deactivate_user",
+    "PUT",
+    "/auth/users/{userId}/deactivate",
+    requires_signature=True,
+    response_type="DeactivateUserResponse",
+)
+GET_USER = Endpoint("auth.get_user", "GET", "/auth/users/{userId}", response_type="GetUserResponse")
+UPDATE_USER = Endpoint(
+    "auth.update_user", "PUT", "/auth/users/{userId}", requires_signature=True, response_type="UpdateUserResponse"
+)
+DELETE_USER = Endpoint(
+    "auth.delete_user", "DELETE", "/auth/users/{userId}", requires_signature=True, response_type="DeleteUserResponse"
+)
+LIST_USERS = Endpoint("auth.list_users", "GET", "/auth/users", response_type="ListUsersResponse")
+CREATE_USER = Endpoint(
+    "auth.create_user", "POST", "/auth/users", requires_signature=True, response_type="CreateUserResponse"
+)
+INVITE_TENANT_USER = Endpoint(
+    "auth.invite_tenant_user",
+    "POST",
+    "/auth/users/invite",
+    requires_signature=True,
+    response_type="InviteTenantUserResponse",
+)
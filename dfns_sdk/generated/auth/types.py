@@ -807,10 +807,14 @@ class DeleteUserResponse(TypedDict, total=False):
     permission_assignments: list[dict[str, Any]]
 
 
+ListUsersItem = dict[str, Any]
+"""Item of a listUsers page."""
+
+
 class ListUsersResponse(TypedDict, total=False):
     """listUsers response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListUsersItem]
     next_page_token: NotRequired[str]
 
 
@@ -1,7 +1,36 @@
 """Exchanges domain module."""
 
-from . import types
-from .client import ExchangesClient
-from .delegated_client import DelegatedExchangesClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["ExchangesClient", "DelegatedExchangesClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncExchangesClient
+    from .async_delegated_client import AsyncDelegatedExchangesClient
+    from .client import ExchangesClient
+    from .delegated_client import DelegatedExchangesClient
+
+_EXPORTS = {
+    "ExchangesClient": ".client",
+    "DelegatedExchangesClient": ".delegated_client",
+    "AsyncExchangesClient": ".async_client",
+    "AsyncDelegatedExchangesClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = [
+    "ExchangesClient",
+    "DelegatedExchangesClient",
+    "AsyncExchangesClient",
+    "AsyncDelegatedExchangesClient",
+    "types",
+]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,226 @@
+"""Async client for the exchanges domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncExchangesClient:
+    """Async client for exchanges operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def get_exchange(self, exchange_id: str) -> T.GetExchangeResponse:
+        """
+        Get Exchange.
+
+        Retrieve the details of a specific exchange integration configuration.
+
+        Args:
+            exchange_id: Path parameter.
+
+        Returns:
+            T.GetExchangeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_EXCHANGE, exchange_id)
+        return cast(T.GetExchangeResponse, response)
+
+    async def delete_exchange(self, exchange_id: str) -> T.DeleteExchangeResponse:
+        """
+        Delete Exchange.
+
+        Delete the exchange configuration from your organization.
+
+        Args:
+            exchange_id: Path parameter.
+
+        Returns:
+            T.DeleteExchangeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_EXCHANGE, exchange_id)
+        return cast(T.DeleteExchangeResponse, response)
+
+    async def list_exchanges(self, query: T.ListExchangesQuery | None = None) -> T.ListExchangesResponse:
+        """
+        List Exchanges.
+
+        List all configured exchange integrations.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListExchangesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_EXCHANGES, query_params=query)
+        return cast(T.ListExchangesResponse, response)
+
+    def aiter_exchanges(
+        self, query: T.ListExchangesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListExchangesItem]:
+        """
+        Iterate over List Exchanges.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListExchangesItem]: The items of every page.
+        """
+        return aiter_items(self.list_exchanges, query, page_size)
+
+    async def create_exchange(self, body: T.CreateExchangeRequest) -> T.CreateExchangeResponse:
+        """
+        Create Exchange.
+
+        Link your organization with a cryptocurrency exchange.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateExchangeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_EXCHANGE, body=body)
+        return cast(T.CreateExchangeResponse, response)
+
+    async def list_accounts(self, exchange_id: str, query: T.ListAccountsQuery | None = None) -> T.ListAccountsResponse:
+        """
+        List Accounts.
+
+        Get a list of accounts for a specific exchange.
+
+        Args:
+            exchange_id: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.ListAccountsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ACCOUNTS, exchange_id, query_params=query)
+        return cast(T.ListAccountsResponse, response)
+
+    def aiter_accounts(
+        self, exchange_id: str, query: T.ListAccountsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListAccountsItem]:
+        """
+        Iterate over List Accounts.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            exchange_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListAccountsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_accounts(exchange_id, q), query, page_size)
+
+    async def list_account_assets(
+        self, exchange_id: str, account_id: str, query: T.ListAccountAssetsQuery | None = None
+    ) -> T.ListAccountAssetsResponse:
+        """
+        List Account Assets.
+
+        Retrieve the list of assets for a specific account on a specific exchange.
+
+        Args:
+            exchange_id: Path parameter.
+            account_id: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.ListAccountAssetsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ACCOUNT_ASSETS, exchange_id, account_id, query_params=query)
+        return cast(T.ListAccountAssetsResponse, response)
+
+    def aiter_account_assets(
+        self,
+        exchange_id: str,
+        account_id: str,
+        query: T.ListAccountAssetsQuery | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[T.ListAccountAssetsItem]:
+        """
+        Iterate over List Account Assets.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            exchange_id: Path parameter.
+            account_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListAccountAssetsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_account_assets(exchange_id, account_id, q), query, page_size)
+
+    async def list_asset_withdrawal_networks(
+        self, exchange_id: str, account_id: str, asset: str
+    ) -> list[dict[str, Any]]:
+        """
+        List Asset Withdrawal Networks.
+
+        Lists the networks to which the given asset can be withdrawn from an exchange account.
+
+        Args:
+            exchange_id: Path parameter.
+            account_id: Path parameter.
+            asset: Path parameter.
+
+        Returns:
+            list[dict[str, Any]]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ASSET_WITHDRAWAL_NETWORKS, exchange_id, account_id, asset)
+        return cast(list[dict[str, Any]], response)
+
+    async def create_exchange_deposit(
+        self, exchange_id: str, account_id: str, body: dict[str, Any]
+    ) -> T.CreateExchangeDepositResponse:
+        """
+        Create Exchange Deposit.
+
+        Creates a new exchange deposit transaction.
+
+        Args:
+            exchange_id: The exchange id obtained from the Create Exchange endpoint. Ex: `ex-1f04s-lqc9q-xxxxxxxxxxxxxxxx`
+            account_id: Unique identifier for the account like "spot"
+            body: Request body.
+
+        Returns:
+            T.CreateExchangeDepositResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_EXCHANGE_DEPOSIT, exchange_id, account_id, body=body)
+        return cast(T.CreateExchangeDepositResponse, response)
+
+    async def create_exchange_withdrawal(
+        self, exchange_id: str, account_id: str, body: dict[str, Any]
+    ) -> T.CreateExchangeWithdrawalResponse:
+        """
+        Create Exchange Withdrawal.
+
+        Creates a new exchange withdrawal transaction.
+
+        Args:
+            exchange_id: The exchange id obtained from the Create Exchange endpoint. Ex: `ex-1f04s-lqc9q-xxxxxxxxxxxxxxxx`
+            account_id: Unique identifier for the account like "spot"
+            body: Request body.
+
+        Returns:
+            T.CreateExchangeWithdrawalResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_EXCHANGE_WITHDRAWAL, exchange_id, account_id, body=body)
+        return cast(T.CreateExchangeWithdrawalResponse, response)
@@ -0,0 +1,375 @@
+"""Async delegated client for the exchanges domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedExchangesClient:
+    """
+    Async delegated client for exchanges operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def get_exchange(self, exchange_id: str) -> T.GetExchangeResponse:
+        """
+        Get Exchange.
+
+        Retrieve the details of a specific exchange integration configuration.
+
+        Args:
+            exchange_id: Path parameter.
+
+        Returns:
+            T.GetExchangeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_EXCHANGE, exchange_id)
+        return cast(T.GetExchangeResponse, response)
+
+    async def delete_exchange_init(self, exchange_id: str) -> PreparedAction:
+        """
+        Initialize Delete Exchange.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            exchange_id: Path parameter.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_EXCHANGE, E.DELETE_EXCHANGE.resolve(exchange_id)
+        )
+
+    async def delete_exchange_complete(
+        self, exchange_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.DeleteExchangeResponse:
+        """
+        Complete Delete Exchange.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            exchange_id: Path parameter.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_exchange_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeleteExchangeResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_EXCHANGE.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_EXCHANGE, exchange_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeleteExchangeResponse, response)
+
+    async def list_exchanges(self, query: T.ListExchangesQuery | None = None) -> T.ListExchangesResponse:
+        """
+        List Exchanges.
+
+        List all configured exchange integrations.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListExchangesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_EXCHANGES, query_params=query)
+        return cast(T.ListExchangesResponse, response)
+
+    def aiter_exchanges(
+        self, query: T.ListExchangesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListExchangesItem]:
+        """
+        Iterate over List Exchanges.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListExchangesItem]: The items of every page.
+        """
+        return aiter_items(self.list_exchanges, query, page_size)
+
+    async def create_exchange_init(self, body: T.CreateExchangeRequest) -> PreparedAction:
+        """
+        Initialize Create Exchange.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.CREATE_EXCHANGE, E.CREATE_EXCHANGE.path, body)
+
+    async def create_exchange_complete(
+        self,
+        body: T.CreateExchangeRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateExchangeResponse:
+        """
+        Complete Create Exchange.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_exchange_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateExchangeResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_EXCHANGE.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_EXCHANGE, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateExchangeResponse, response)
+
+    async def list_accounts(self, exchange_id: str, query: T.ListAccountsQuery | None = None) -> T.ListAccountsResponse:
+        """
+        List Accounts.
+
+        Get a list of accounts for a specific exchange.
+
+        Args:
+            exchange_id: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.ListAccountsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ACCOUNTS, exchange_id, query_params=query)
+        return cast(T.ListAccountsResponse, response)
+
+    def aiter_accounts(
+        self, exchange_id: str, query: T.ListAccountsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListAccountsItem]:
+        """
+        Iterate over List Accounts.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            exchange_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListAccountsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_accounts(exchange_id, q), query, page_size)
+
+    async def list_account_assets(
+        self, exchange_id: str, account_id: str, query: T.ListAccountAssetsQuery | None = None
+    ) -> T.ListAccountAssetsResponse:
+        """
+        List Account Assets.
+
+        Retrieve the list of assets for a specific account on a specific exchange.
+
+        Args:
+            exchange_id: Path parameter.
+            account_id: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.ListAccountAssetsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ACCOUNT_ASSETS, exchange_id, account_id, query_params=query)
+        return cast(T.ListAccountAssetsResponse, response)
+
+    def aiter_account_assets(
+        self,
+        exchange_id: str,
+        account_id: str,
+        query: T.ListAccountAssetsQuery | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[T.ListAccountAssetsItem]:
+        """
+        Iterate over List Account Assets.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            exchange_id: Path parameter.
+            account_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListAccountAssetsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_account_assets(exchange_id, account_id, q), query, page_size)
+
+    async def list_asset_withdrawal_networks(
+        self, exchange_id: str, account_id: str, asset: str
+    ) -> list[dict[str, Any]]:
+        """
+        List Asset Withdrawal Networks.
+
+        Lists the networks to which the given asset can be withdrawn from an exchange account.
+
+        Args:
+            exchange_id: Path parameter.
+            account_id: Path parameter.
+            asset: Path parameter.
+
+        Returns:
+            list[dict[str, Any]]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ASSET_WITHDRAWAL_NETWORKS, exchange_id, account_id, asset)
+        return cast(list[dict[str, Any]], response)
+
+    async def create_exchange_deposit_init(
+        self, exchange_id: str, account_id: str, body: dict[str, Any]
+    ) -> PreparedAction:
+        """
+        Initialize Create Exchange Deposit.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            exchange_id: The exchange id obtained from the Create Exchange endpoint. Ex: `ex-1f04s-lqc9q-xxxxxxxxxxxxxxxx`
+            account_id: Unique identifier for the account like "spot"
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http,
+            E.CREATE_EXCHANGE_DEPOSIT,
+            E.CREATE_EXCHANGE_DEPOSIT.resolve(exchange_id, account_id),
+            body,
+        )
+
+    async def create_exchange_deposit_complete(
+        self,
+        exchange_id: str,
+        account_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateExchangeDepositResponse:
+        """
+        Complete Create Exchange Deposit.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            exchange_id: The exchange id obtained from the Create Exchange endpoint. Ex: `ex-1f04s-lqc9q-xxxxxxxxxxxxxxxx`
+            account_id: Unique identifier for the account like "spot"
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_exchange_deposit_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateExchangeDepositResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_EXCHANGE_DEPOSIT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_EXCHANGE_DEPOSIT,
+            exchange_id,
+            account_id,
+            body=body,
+            user_action=user_action_token,
+            prepared=prepared,
+        )
+        return cast(T.CreateExchangeDepositResponse, response)
+
+    async def create_exchange_withdrawal_init(
+        self, exchange_id: str, account_id: str, body: dict[str, Any]
+    ) -> PreparedAction:
+        """
+        Initialize Create Exchange Withdrawal.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            exchange_id: The exchange id obtained from the Create Exchange endpoint. Ex: `ex-1f04s-lqc9q-xxxxxxxxxxxxxxxx`
+            account_id: Unique identifier for the account like "spot"
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http,
+            E.CREATE_EXCHANGE_WITHDRAWAL,
+            E.CREATE_EXCHANGE_WITHDRAWAL.resolve(exchange_id, account_id),
+            body,
+        )
+
+    async def create_exchange_withdrawal_complete(
+        self,
+        exchange_id: str,
+        account_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateExchangeWithdrawalResponse:
+        """
+        Complete Create Exchange Withdrawal.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            exchange_id: The exchange id obtained from the Create Exchange endpoint. Ex: `ex-1f04s-lqc9q-xxxxxxxxxxxxxxxx`
+            account_id: Unique identifier for the account like "spot"
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_exchange_withdrawal_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateExchangeWithdrawalResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_EXCHANGE_WITHDRAWAL.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_EXCHANGE_WITHDRAWAL,
+            exchange_id,
+            account_id,
+            body=body,
+            user_action=user_action_token,
+            prepared=prepared,
+        )
+        return cast(T.CreateExchangeWithdrawalResponse, response)
@@ -1,8 +1,11 @@
 """Client for the exchanges domain."""
 
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,14 +27,7 @@ class ExchangesClient:
         Returns:
             T.GetExchangeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/exchanges/{exchangeId}",
-            path_params={"exchangeId": exchange_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_EXCHANGE, exchange_id)
         return cast(T.GetExchangeResponse, response)
 
     def delete_exchange(self, exchange_id: str) -> T.DeleteExchangeResponse:
@@ -46,14 +42,7 @@ class ExchangesClient:
         Returns:
             T.DeleteExchangeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/exchanges/{exchangeId}",
-            path_params={"exchangeId": exchange_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_EXCHANGE, exchange_id)
         return cast(T.DeleteExchangeResponse, response)
 
     def list_exchanges(self, query: T.ListExchangesQuery | None = None) -> T.ListExchangesResponse:
@@ -68,16 +57,26 @@ class ExchangesClient:
         Returns:
             T.ListExchangesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/exchanges",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_EXCHANGES, query_params=query)
         return cast(T.ListExchangesResponse, response)
 
+    def iter_exchanges(
+        self, query: T.ListExchangesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListExchangesItem]:
+        """
+        Iterate over List Exchanges.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListExchangesItem]: The items of every page.
+        """
+        return iter_items(self.list_exchanges, query, page_size)
+
     def create_exchange(self, body: T.CreateExchangeRequest) -> T.CreateExchangeResponse:
         """
         Create Exchange.
@@ -90,14 +89,7 @@ class ExchangesClient:
         Returns:
             T.CreateExchangeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/exchanges",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_EXCHANGE, body=body)
         return cast(T.CreateExchangeResponse, response)
 
     def list_accounts(self, exchange_id: str, query: T.ListAccountsQuery | None = None) -> T.ListAccountsResponse:
@@ -113,16 +105,27 @@ class ExchangesClient:
         Returns:
             T.ListAccountsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/exchanges/{exchangeId}/accounts",
-            path_params={"exchangeId": exchange_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ACCOUNTS, exchange_id, query_params=query)
         return cast(T.ListAccountsResponse, response)
 
+    def iter_accounts(
+        self, exchange_id: str, query: T.ListAccountsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListAccountsItem]:
+        """
+        Iterate over List Accounts.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            exchange_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListAccountsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_accounts(exchange_id, q), query, page_size)
+
     def list_account_assets(
         self, exchange_id: str, account_id: str, query: T.ListAccountAssetsQuery | None = None
     ) -> T.ListAccountAssetsResponse:
@@ -139,16 +142,32 @@ class ExchangesClient:
         Returns:
             T.ListAccountAssetsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/exchanges/{exchangeId}/accounts/{accountId}/assets",
-            path_params={"exchangeId": exchange_id, "accountId": account_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ACCOUNT_ASSETS, exchange_id, account_id, query_params=query)
         return cast(T.ListAccountAssetsResponse, response)
 
+    def iter_account_assets(
+        self,
+        exchange_id: str,
+        account_id: str,
+        query: T.ListAccountAssetsQuery | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[T.ListAccountAssetsItem]:
+        """
+        Iterate over List Account Assets.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            exchange_id: Path parameter.
+            account_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListAccountAssetsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_account_assets(exchange_id, account_id, q), query, page_size)
+
     def list_asset_withdrawal_networks(self, exchange_id: str, account_id: str, asset: str) -> list[dict[str, Any]]:
         """
         List Asset Withdrawal Networks.
@@ -163,14 +182,7 @@ class ExchangesClient:
         Returns:
             list[dict[str, Any]]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/exchanges/{exchangeId}/accounts/{accountId}/assets/{asset}/withdrawal-networks",
-            path_params={"exchangeId": exchange_id, "accountId": account_id, "asset": asset},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ASSET_WITHDRAWAL_NETWORKS, exchange_id, account_id, asset)
         return cast(list[dict[str, Any]], response)
 
     def create_exchange_deposit(
@@ -189,14 +201,7 @@ class ExchangesClient:
         Returns:
             T.CreateExchangeDepositResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/exchanges/{exchangeId}/accounts/{accountId}/deposits",
-            path_params={"exchangeId": exchange_id, "accountId": account_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_EXCHANGE_DEPOSIT, exchange_id, account_id, body=body)
         return cast(T.CreateExchangeDepositResponse, response)
 
     def create_exchange_withdrawal(
@@ -215,12 +220,5 @@ class ExchangesClient:
         Returns:
             T.CreateExchangeWithdrawalResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/exchanges/{exchangeId}/accounts/{accountId}/withdrawals",
-            path_params={"exchangeId": exchange_id, "accountId": account_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_EXCHANGE_WITHDRAWAL, exchange_id, account_id, body=body)
         return cast(T.CreateExchangeWithdrawalResponse, response)
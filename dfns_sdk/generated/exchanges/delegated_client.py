@@ -1,10 +1,12 @@
 """Delegated client for the exchanges domain."""
 
-import json
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,10 @@ class DelegatedExchangesClient:
         Returns:
             T.GetExchangeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/exchanges/{exchangeId}",
-            path_params={"exchangeId": exchange_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_EXCHANGE, exchange_id)
         return cast(T.GetExchangeResponse, response)
 
-    def delete_exchange_init(self, exchange_id: str) -> UserActionChallengeResponse:
+    def delete_exchange_init(self, exchange_id: str) -> PreparedAction:
         """
         Initialize Delete Exchange.
 
@@ -51,21 +46,12 @@ class DelegatedExchangesClient:
             exchange_id: Path parameter.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/exchanges/{exchangeId}"
-        path = path.replace("{exchangeId}", str(exchange_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.DELETE_EXCHANGE, E.DELETE_EXCHANGE.resolve(exchange_id))
 
     def delete_exchange_complete(
-        self, exchange_id: str, signed_challenge: SignUserActionChallengeRequest
+        self, exchange_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
     ) -> T.DeleteExchangeResponse:
         """
         Complete Delete Exchange.
@@ -75,20 +61,19 @@ class DelegatedExchangesClient:
         Args:
             exchange_id: Path parameter.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_exchange_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeleteExchangeResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_EXCHANGE.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/exchanges/{exchangeId}",
-            path_params={"exchangeId": exchange_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELETE_EXCHANGE, exchange_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeleteExchangeResponse, response)
 
@@ -104,17 +89,27 @@ class DelegatedExchangesClient:
         Returns:
             T.ListExchangesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/exchanges",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_EXCHANGES, query_params=query)
         return cast(T.ListExchangesResponse, response)
 
-    def create_exchange_init(self, body: T.CreateExchangeRequest) -> UserActionChallengeResponse:
+    def iter_exchanges(
+        self, query: T.ListExchangesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListExchangesItem]:
+        """
+        Iterate over List Exchanges.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListExchangesItem]: The items of every page.
+        """
+        return iter_items(self.list_exchanges, query, page_size)
+
+    def create_exchange_init(self, body: T.CreateExchangeRequest) -> PreparedAction:
         """
         Initialize Create Exchange.
 
@@ -124,20 +119,15 @@ class DelegatedExchangesClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/exchanges"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_EXCHANGE, E.CREATE_EXCHANGE.path, body)
 
     def create_exchange_complete(
-        self, body: T.CreateExchangeRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateExchangeRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateExchangeResponse:
         """
         Complete Create Exchange.
@@ -147,20 +137,19 @@ class DelegatedExchangesClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_exchange_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateExchangeResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_EXCHANGE.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/exchanges",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_EXCHANGE, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateExchangeResponse, response)
 
@@ -177,16 +166,27 @@ class DelegatedExchangesClient:
         Returns:
             T.ListAccountsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/exchanges/{exchangeId}/accounts",
-            path_params={"exchangeId": exchange_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ACCOUNTS, exchange_id, query_params=query)
         return cast(T.ListAccountsResponse, response)
 
+    def iter_accounts(
+        self, exchange_id: str, query: T.ListAccountsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListAccountsItem]:
+        """
+        Iterate over List Accounts.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            exchange_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListAccountsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_accounts(exchange_id, q), query, page_size)
+
     def list_account_assets(
         self, exchange_id: str, account_id: str, query: T.ListAccountAssetsQuery | None = None
     ) -> T.ListAccountAssetsResponse:
@@ -203,16 +203,32 @@ class DelegatedExchangesClient:
         Returns:
             T.ListAccountAssetsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/exchanges/{exchangeId}/accounts/{accountId}/assets",
-            path_params={"exchangeId": exchange_id, "accountId": account_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ACCOUNT_ASSETS, exchange_id, account_id, query_params=query)
         return cast(T.ListAccountAssetsResponse, response)
 
+    def iter_account_assets(
+        self,
+        exchange_id: str,
+        account_id: str,
+        query: T.ListAccountAssetsQuery | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[T.ListAccountAssetsItem]:
+        """
+        Iterate over List Account Assets.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            exchange_id: Path parameter.
+            account_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListAccountAssetsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_account_assets(exchange_id, account_id, q), query, page_size)
+
     def list_asset_withdrawal_networks(self, exchange_id: str, account_id: str, asset: str) -> list[dict[str, Any]]:
         """
         List Asset Withdrawal Networks.
@@ -227,19 +243,10 @@ class DelegatedExchangesClient:
         Returns:
             list[dict[str, Any]]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/exchanges/{exchangeId}/accounts/{accountId}/assets/{asset}/withdrawal-networks",
-            path_params={"exchangeId": exchange_id, "accountId": account_id, "asset": asset},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ASSET_WITHDRAWAL_NETWORKS, exchange_id, account_id, asset)
         return cast(list[dict[str, Any]], response)
 
-    def create_exchange_deposit_init(
-        self, exchange_id: str, account_id: str, body: dict[str, Any]
-    ) -> UserActionChallengeResponse:
+    def create_exchange_deposit_init(self, exchange_id: str, account_id: str, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Create Exchange Deposit.
 
@@ -251,22 +258,22 @@ class DelegatedExchangesClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/exchanges/{exchangeId}/accounts/{accountId}/deposits"
-        path = path.replace("{exchangeId}", str(exchange_id))
-        path = path.replace("{accountId}", str(account_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
+        return BaseAuthApi.prepare_user_action(
             self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+            E.CREATE_EXCHANGE_DEPOSIT,
+            E.CREATE_EXCHANGE_DEPOSIT.resolve(exchange_id, account_id),
+            body,
         )
 
     def create_exchange_deposit_complete(
-        self, exchange_id: str, account_id: str, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        exchange_id: str,
+        account_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateExchangeDepositResponse:
         """
         Complete Create Exchange Deposit.
@@ -278,26 +285,30 @@ class DelegatedExchangesClient:
             account_id: Unique identifier for the account like "spot"
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_exchange_deposit_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateExchangeDepositResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_EXCHANGE_DEPOSIT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/exchanges/{exchangeId}/accounts/{accountId}/deposits",
-            path_params={"exchangeId": exchange_id, "accountId": account_id},
-            query_params=None,
+        response = self._http.call_with_user_action(
+            E.CREATE_EXCHANGE_DEPOSIT,
+            exchange_id,
+            account_id,
             body=body,
             user_action=user_action_token,
+            prepared=prepared,
         )
         return cast(T.CreateExchangeDepositResponse, response)
 
     def create_exchange_withdrawal_init(
         self, exchange_id: str, account_id: str, body: dict[str, Any]
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Create Exchange Withdrawal.
 
@@ -309,22 +320,22 @@ class DelegatedExchangesClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/exchanges/{exchangeId}/accounts/{accountId}/withdrawals"
-        path = path.replace("{exchangeId}", str(exchange_id))
-        path = path.replace("{accountId}", str(account_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
+        return BaseAuthApi.prepare_user_action(
             self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+            E.CREATE_EXCHANGE_WITHDRAWAL,
+            E.CREATE_EXCHANGE_WITHDRAWAL.resolve(exchange_id, account_id),
+            body,
         )
 
     def create_exchange_withdrawal_complete(
-        self, exchange_id: str, account_id: str, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        exchange_id: str,
+        account_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateExchangeWithdrawalResponse:
         """
         Complete Create Exchange Withdrawal.
@@ -336,19 +347,23 @@ class DelegatedExchangesClient:
             account_id: Unique identifier for the account like "spot"
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_exchange_withdrawal_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateExchangeWithdrawalResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_EXCHANGE_WITHDRAWAL.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/exchanges/{exchangeId}/accounts/{accountId}/withdrawals",
-            path_params={"exchangeId": exchange_id, "accountId": account_id},
-            query_params=None,
+        response = self._http.call_with_user_action(
+            E.CREATE_EXCHANGE_WITHDRAWAL,
+            exchange_id,
+            account_id,
             body=body,
             user_action=user_action_token,
+            prepared=prepared,
         )
         return cast(T.CreateExchangeWithdrawalResponse, response)
@@ -0,0 +1,44 @@
+"""Endpoint registry for the exchanges domain."""
+
+from ..._internal.endpoint import Endpoint
+
+GET_EXCHANGE = Endpoint("exchanges.get_exchange", "GET", "/exchanges/{exchangeId}", response_type="GetExchangeResponse")
+DELETE_EXCHANGE = Endpoint(
+    "exchanges.delete_exchange",
+    "DELETE",
+    "/exchanges/{exchangeId}",
+    requires_signature=True,
+    response_type="DeleteExchangeResponse",
+)
+LIST_EXCHANGES = Endpoint("exchanges.list_exchanges", "GET", "/exchanges", response_type="ListExchangesResponse")
+CREATE_EXCHANGE = Endpoint(
+    "exchanges.create_exchange", "POST", "/exchanges", requires_signature=True, response_type="CreateExchangeResponse"
+)
+LIST_ACCOUNTS = Endpoint(
+    "exchanges.list_accounts", "GET", "/exchanges/{exchangeId}/accounts", response_type="ListAccountsResponse"
+)
+LIST_ACCOUNT_ASSETS = Endpoint(
+    "exchanges.list_account_assets",
+    "GET",
+    "/exchanges/{exchangeId}/accounts/{accountId}/assets",
+    response_type="ListAccountAssetsResponse",
+)
+LIST_ASSET_WITHDRAWAL_NETWORKS = Endpoint(
+    "exchanges.list_asset_withdrawal_networks",
+    "GET",
+    "/exchanges/{exchangeId}/accounts/{accountId}/assets/{asset}/withdrawal-networks",
+)
+CREATE_EXCHANGE_DEPOSIT = Endpoint(
+    "exchanges.create_exchange_deposit",
+    "POST",
+    "/exchanges/{exchangeId}/accounts/{accountId}/deposits",
+    requires_signature=True,
+    response_type="CreateExchangeDepositResponse",
+)
+CREATE_EXCHANGE_WITHDRAWAL = Endpoint(
+    "exchanges.create_exchange_withdrawal",
+    "POST",
+    "/exchanges/{exchangeId}/accounts/{accountId}/withdrawals",
+    requires_signature=True,
+    response_type="CreateExchangeWithdrawalResponse",
+)
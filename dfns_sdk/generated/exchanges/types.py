@@ -20,10 +20,14 @@ class DeleteExchangeResponse(TypedDict, total=False):
     deleted: Literal[True]
 
 
+ListExchangesItem = dict[str, Any]
+"""Item of a listExchanges page."""
+
+
 class ListExchangesResponse(TypedDict, total=False):
     """listExchanges response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListExchangesItem]
     next_page_token: NotRequired[str]
 
 
@@ -52,10 +56,14 @@ class CreateExchangeResponse(TypedDict, total=False):
     date_created: str
 
 
+ListAccountsItem = dict[str, Any]
+"""Item of a listAccounts page."""
+
+
 class ListAccountsResponse(TypedDict, total=False):
     """listAccounts response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListAccountsItem]
     next_page_token: NotRequired[str]
 
 
@@ -66,10 +74,14 @@ class ListAccountsQuery(TypedDict, total=False):
     pagination_token: NotRequired[str]
 
 
+ListAccountAssetsItem = dict[str, Any]
+"""Item of a listAccountAssets page."""
+
+
 class ListAccountAssetsResponse(TypedDict, total=False):
     """listAccountAssets response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListAccountAssetsItem]
     next_page_token: NotRequired[str]
 
 
@@ -1,7 +1,36 @@
 """FeeSponsors domain module."""
 
-from . import types
-from .client import FeeSponsorsClient
-from .delegated_client import DelegatedFeeSponsorsClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["FeeSponsorsClient", "DelegatedFeeSponsorsClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncFeeSponsorsClient
+    from .async_delegated_client import AsyncDelegatedFeeSponsorsClient
+    from .client import FeeSponsorsClient
+    from .delegated_client import DelegatedFeeSponsorsClient
+
+_EXPORTS = {
+    "FeeSponsorsClient": ".client",
+    "DelegatedFeeSponsorsClient": ".delegated_client",
+    "AsyncFeeSponsorsClient": ".async_client",
+    "AsyncDelegatedFeeSponsorsClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = [
+    "FeeSponsorsClient",
+    "DelegatedFeeSponsorsClient",
+    "AsyncFeeSponsorsClient",
+    "AsyncDelegatedFeeSponsorsClient",
+    "types",
+]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
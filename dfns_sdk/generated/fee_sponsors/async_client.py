@@ -0,0 +1,159 @@
+"""Async client for the fee_sponsors domain."""
+
+from collections.abc import AsyncIterator
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncFeeSponsorsClient:
+    """Async client for fee_sponsors operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_fee_sponsors(self, query: T.ListFeeSponsorsQuery | None = None) -> T.ListFeeSponsorsResponse:
+        """
+        List Fee Sponsors.
+
+        Retrieves all Fee Sponsors configured in your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListFeeSponsorsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_FEE_SPONSORS, query_params=query)
+        return cast(T.ListFeeSponsorsResponse, response)
+
+    def aiter_fee_sponsors(
+        self, query: T.ListFeeSponsorsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListFeeSponsorsItem]:
+        """
+        Iterate over List Fee Sponsors.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListFeeSponsorsItem]: The items of every page.
+        """
+        return aiter_items(self.list_fee_sponsors, query, page_size)
+
+    async def create_fee_sponsor(self, body: T.CreateFeeSponsorRequest) -> T.CreateFeeSponsorResponse:
+        """
+        Create Fee Sponsor.
+
+        Creates a new `FeeSponsor` associated with a sponsor wallet. Returns a new fee sponsor entity with the `id` to be used when making a transfer.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateFeeSponsorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_FEE_SPONSOR, body=body)
+        return cast(T.CreateFeeSponsorResponse, response)
+
+    async def get_fee_sponsor(self, fee_sponsor_id: str) -> T.GetFeeSponsorResponse:
+        """
+        Get Fee Sponsor.
+
+        Retrieve a Fee Sponsor information by ID.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to retrieve.
+
+        Returns:
+            T.GetFeeSponsorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_FEE_SPONSOR, fee_sponsor_id)
+        return cast(T.GetFeeSponsorResponse, response)
+
+    async def delete_fee_sponsor(self, fee_sponsor_id: str) -> T.DeleteFeeSponsorResponse:
+        """
+        Delete Fee Sponsor.
+
+        Delete a Fee Sponsor. This action is irreversible. The fee sponsor won't be able to be used anymore when making a transfer.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to delete.
+
+        Returns:
+            T.DeleteFeeSponsorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_FEE_SPONSOR, fee_sponsor_id)
+        return cast(T.DeleteFeeSponsorResponse, response)
+
+    async def deactivate_fee_sponsor(self, fee_sponsor_id: str) -> T.DeactivateFeeSponsorResponse:
+        """
+        Deactivate Fee Sponsor.
+
+        Deactivate a Fee Sponsor: The fee sponsor won't be able to be used anymore when making a transfer.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to deactivate.
+
+        Returns:
+            T.DeactivateFeeSponsorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DEACTIVATE_FEE_SPONSOR, fee_sponsor_id)
+        return cast(T.DeactivateFeeSponsorResponse, response)
+
+    async def activate_fee_sponsor(self, fee_sponsor_id: str) -> T.ActivateFeeSponsorResponse:
+        """
+        Activate Fee Sponsor.
+
+        Activate a Fee Sponsor: The fee sponsor can be used when making a transfer.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to activate.
+
+        Returns:
+            T.ActivateFeeSponsorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ACTIVATE_FEE_SPONSOR, fee_sponsor_id)
+        return cast(T.ActivateFeeSponsorResponse, response)
+
+    async def list_sponsored_fees(
+        self, fee_sponsor_id: str, query: T.ListSponsoredFeesQuery | None = None
+    ) -> T.ListSponsoredFeesResponse:
+        """
+        List Sponsored Fees.
+
+        Retrieves all fees paid by the specific Fee Sponsor.
+
+        Args:
+            fee_sponsor_id: Fee Sponsor to retrieve the fees from.
+            query: Query parameters.
+
+        Returns:
+            T.ListSponsoredFeesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_SPONSORED_FEES, fee_sponsor_id, query_params=query)
+        return cast(T.ListSponsoredFeesResponse, response)
+
+    def aiter_sponsored_fees(
+        self, fee_sponsor_id: str, query: T.ListSponsoredFeesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListSponsoredFeesItem]:
+        """
+        Iterate over List Sponsored Fees.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            fee_sponsor_id: Fee Sponsor to retrieve the fees from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListSponsoredFeesItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_sponsored_fees(fee_sponsor_id, q), query, page_size)
@@ -0,0 +1,289 @@
+"""Async delegated client for the fee_sponsors domain."""
+
+from collections.abc import AsyncIterator
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedFeeSponsorsClient:
+    """
+    Async delegated client for fee_sponsors operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_fee_sponsors(self, query: T.ListFeeSponsorsQuery | None = None) -> T.ListFeeSponsorsResponse:
+        """
+        List Fee Sponsors.
+
+        Retrieves all Fee Sponsors configured in your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListFeeSponsorsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_FEE_SPONSORS, query_params=query)
+        return cast(T.ListFeeSponsorsResponse, response)
+
+    def aiter_fee_sponsors(
+        self, query: T.ListFeeSponsorsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListFeeSponsorsItem]:
+        """
+        Iterate over List Fee Sponsors.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListFeeSponsorsItem]: The items of every page.
+        """
+        return aiter_items(self.list_fee_sponsors, query, page_size)
+
+    async def create_fee_sponsor_init(self, body: T.CreateFeeSponsorRequest) -> PreparedAction:
+        """
+        Initialize Create Fee Sponsor.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_FEE_SPONSOR, E.CREATE_FEE_SPONSOR.path, body
+        )
+
+    async def create_fee_sponsor_complete(
+        self,
+        body: T.CreateFeeSponsorRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateFeeSponsorResponse:
+        """
+        Complete Create Fee Sponsor.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_fee_sponsor_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateFeeSponsorResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_FEE_SPONSOR.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_FEE_SPONSOR, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateFeeSponsorResponse, response)
+
+    async def get_fee_sponsor(self, fee_sponsor_id: str) -> T.GetFeeSponsorResponse:
+        """
+        Get Fee Sponsor.
+
+        Retrieve a Fee Sponsor information by ID.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to retrieve.
+
+        Returns:
+            T.GetFeeSponsorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_FEE_SPONSOR, fee_sponsor_id)
+        return cast(T.GetFeeSponsorResponse, response)
+
+    async def delete_fee_sponsor_init(self, fee_sponsor_id: str) -> PreparedAction:
+        """
+        Initialize Delete Fee Sponsor.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to delete.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_FEE_SPONSOR, E.DELETE_FEE_SPONSOR.resolve(fee_sponsor_id)
+        )
+
+    async def delete_fee_sponsor_complete(
+        self,
+        fee_sponsor_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.DeleteFeeSponsorResponse:
+        """
+        Complete Delete Fee Sponsor.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to delete.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_fee_sponsor_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeleteFeeSponsorResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_FEE_SPONSOR.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_FEE_SPONSOR, fee_sponsor_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeleteFeeSponsorResponse, response)
+
+    async def deactivate_fee_sponsor_init(self, fee_sponsor_id: str) -> PreparedAction:
+        """
+        Initialize Deactivate Fee Sponsor.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to deactivate.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DEACTIVATE_FEE_SPONSOR, E.DEACTIVATE_FEE_SPONSOR.resolve(fee_sponsor_id)
+        )
+
+    async def deactivate_fee_sponsor_complete(
+        self,
+        fee_sponsor_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.DeactivateFeeSponsorResponse:
+        """
+        Complete Deactivate Fee Sponsor.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to deactivate.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of deactivate_fee_sponsor_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeactivateFeeSponsorResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DEACTIVATE_FEE_SPONSOR.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DEACTIVATE_FEE_SPONSOR, fee_sponsor_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeactivateFeeSponsorResponse, response)
+
+    async def activate_fee_sponsor_init(self, fee_sponsor_id: str) -> PreparedAction:
+        """
+        Initialize Activate Fee Sponsor.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to activate.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.ACTIVATE_FEE_SPONSOR, E.ACTIVATE_FEE_SPONSOR.resolve(fee_sponsor_id)
+        )
+
+    async def activate_fee_sponsor_complete(
+        self,
+        fee_sponsor_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.ActivateFeeSponsorResponse:
+        """
+        Complete Activate Fee Sponsor.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            fee_sponsor_id: Which Fee Sponsor you wish to activate.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_fee_sponsor_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ActivateFeeSponsorResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_FEE_SPONSOR.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ACTIVATE_FEE_SPONSOR, fee_sponsor_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ActivateFeeSponsorResponse, response)
+
+    async def list_sponsored_fees(
+        self, fee_sponsor_id: str, query: T.ListSponsoredFeesQuery | None = None
+    ) -> T.ListSponsoredFeesResponse:
+        """
+        List Sponsored Fees.
+
+        Retrieves all fees paid by the specific Fee Sponsor.
+
+        Args:
+            fee_sponsor_id: Fee Sponsor to retrieve the fees from.
+            query: Query parameters.
+
+        Returns:
+            T.ListSponsoredFeesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_SPONSORED_FEES, fee_sponsor_id, query_params=query)
+        return cast(T.ListSponsoredFeesResponse, response)
+
+    def aiter_sponsored_fees(
+        self, fee_sponsor_id: str, query: T.ListSponsoredFeesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListSponsoredFeesItem]:
+        """
+        Iterate over List Sponsored Fees.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            fee_sponsor_id: Fee Sponsor to retrieve the fees from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListSponsoredFeesItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_sponsored_fees(fee_sponsor_id, q), query, page_size)
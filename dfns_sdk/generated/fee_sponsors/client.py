@@ -1,8 +1,11 @@
 """Client for the fee_sponsors domain."""
 
+from collections.abc import Iterator
 from typing import cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,16 +27,26 @@ class FeeSponsorsClient:
         Returns:
             T.ListFeeSponsorsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/fee-sponsors",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_FEE_SPONSORS, query_params=query)
         return cast(T.ListFeeSponsorsResponse, response)
 
+    def iter_fee_sponsors(
+        self, query: T.ListFeeSponsorsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListFeeSponsorsItem]:
+        """
+        Iterate over List Fee Sponsors.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListFeeSponsorsItem]: The items of every page.
+        """
+        return iter_items(self.list_fee_sponsors, query, page_size)
+
     def create_fee_sponsor(self, body: T.CreateFeeSponsorRequest) -> T.CreateFeeSponsorResponse:
         """
         Create Fee Sponsor.
@@ -46,14 +59,7 @@ class FeeSponsorsClient:
         Returns:
             T.CreateFeeSponsorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/fee-sponsors",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_FEE_SPONSOR, body=body)
         return cast(T.CreateFeeSponsorResponse, response)
 
     def get_fee_sponsor(self, fee_sponsor_id: str) -> T.GetFeeSponsorResponse:
@@ -68,14 +74,7 @@ class FeeSponsorsClient:
         Returns:
             T.GetFeeSponsorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/fee-sponsors/{feeSponsorId}",
-            path_params={"feeSponsorId": fee_sponsor_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_FEE_SPONSOR, fee_sponsor_id)
         return cast(T.GetFeeSponsorResponse, response)
 
     def delete_fee_sponsor(self, fee_sponsor_id: str) -> T.DeleteFeeSponsorResponse:
@@ -90,14 +89,7 @@ class FeeSponsorsClient:
         Returns:
             T.DeleteFeeSponsorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/fee-sponsors/{feeSponsorId}",
-            path_params={"feeSponsorId": fee_sponsor_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_FEE_SPONSOR, fee_sponsor_id)
         return cast(T.DeleteFeeSponsorResponse, response)
 
     def deactivate_fee_sponsor(self, fee_sponsor_id: str) -> T.DeactivateFeeSponsorResponse:
@@ -112,14 +104,7 @@ class FeeSponsorsClient:
         Returns:
             T.DeactivateFeeSponsorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/fee-sponsors/{feeSponsorId}/deactivate",
-            path_params={"feeSponsorId": fee_sponsor_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DEACTIVATE_FEE_SPONSOR, fee_sponsor_id)
         return cast(T.DeactivateFeeSponsorResponse, response)
 
     def activate_fee_sponsor(self, fee_sponsor_id: str) -> T.ActivateFeeSponsorResponse:
@@ -134,14 +119,7 @@ class FeeSponsorsClient:
         Returns:
             T.ActivateFeeSponsorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/fee-sponsors/{feeSponsorId}/activate",
-            path_params={"feeSponsorId": fee_sponsor_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ACTIVATE_FEE_SPONSOR, fee_sponsor_id)
         return cast(T.ActivateFeeSponsorResponse, response)
 
     def list_sponsored_fees(
@@ -159,12 +137,23 @@ class FeeSponsorsClient:
         Returns:
             T.ListSponsoredFeesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/fee-sponsors/{feeSponsorId}/fees",
-            path_params={"feeSponsorId": fee_sponsor_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_SPONSORED_FEES, fee_sponsor_id, query_params=query)
         return cast(T.ListSponsoredFeesResponse, response)
+
+    def iter_sponsored_fees(
+        self, fee_sponsor_id: str, query: T.ListSponsoredFeesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListSponsoredFeesItem]:
+        """
+        Iterate over List Sponsored Fees.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            fee_sponsor_id: Fee Sponsor to retrieve the fees from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListSponsoredFeesItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_sponsored_fees(fee_sponsor_id, q), query, page_size)
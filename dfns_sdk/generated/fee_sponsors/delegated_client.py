@@ -1,10 +1,12 @@
 """Delegated client for the fee_sponsors domain."""
 
-import json
+from collections.abc import Iterator
 from typing import cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,27 @@ class DelegatedFeeSponsorsClient:
         Returns:
             T.ListFeeSponsorsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/fee-sponsors",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_FEE_SPONSORS, query_params=query)
         return cast(T.ListFeeSponsorsResponse, response)
 
-    def create_fee_sponsor_init(self, body: T.CreateFeeSponsorRequest) -> UserActionChallengeResponse:
+    def iter_fee_sponsors(
+        self, query: T.ListFeeSponsorsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListFeeSponsorsItem]:
+        """
+        Iterate over List Fee Sponsors.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListFeeSponsorsItem]: The items of every page.
+        """
+        return iter_items(self.list_fee_sponsors, query, page_size)
+
+    def create_fee_sponsor_init(self, body: T.CreateFeeSponsorRequest) -> PreparedAction:
         """
         Initialize Create Fee Sponsor.
 
@@ -51,20 +63,15 @@ class DelegatedFeeSponsorsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/fee-sponsors"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_FEE_SPONSOR, E.CREATE_FEE_SPONSOR.path, body)
 
     def create_fee_sponsor_complete(
-        self, body: T.CreateFeeSponsorRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateFeeSponsorRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateFeeSponsorResponse:
         """
         Complete Create Fee Sponsor.
@@ -74,20 +81,19 @@ class DelegatedFeeSponsorsClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_fee_sponsor_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateFeeSponsorResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_FEE_SPONSOR.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/fee-sponsors",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_FEE_SPONSOR, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateFeeSponsorResponse, response)
 
@@ -103,17 +109,10 @@ class DelegatedFeeSponsorsClient:
         Returns:
             T.GetFeeSponsorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/fee-sponsors/{feeSponsorId}",
-            path_params={"feeSponsorId": fee_sponsor_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_FEE_SPONSOR, fee_sponsor_id)
         return cast(T.GetFeeSponsorResponse, response)
 
-    def delete_fee_sponsor_init(self, fee_sponsor_id: str) -> UserActionChallengeResponse:
+    def delete_fee_sponsor_init(self, fee_sponsor_id: str) -> PreparedAction:
         """
         Initialize Delete Fee Sponsor.
 
@@ -123,21 +122,17 @@ class DelegatedFeeSponsorsClient:
             fee_sponsor_id: Which Fee Sponsor you wish to delete.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/fee-sponsors/{feeSponsorId}"
-        path = path.replace("{feeSponsorId}", str(fee_sponsor_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_FEE_SPONSOR, E.DELETE_FEE_SPONSOR.resolve(fee_sponsor_id)
         )
 
     def delete_fee_sponsor_complete(
-        self, fee_sponsor_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        fee_sponsor_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.DeleteFeeSponsorResponse:
         """
         Complete Delete Fee Sponsor.
@@ -147,24 +142,23 @@ class DelegatedFeeSponsorsClient:
         Args:
             fee_sponsor_id: Which Fee Sponsor you wish to delete.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_fee_sponsor_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeleteFeeSponsorResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_FEE_SPONSOR.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/fee-sponsors/{feeSponsorId}",
-            path_params={"feeSponsorId": fee_sponsor_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELETE_FEE_SPONSOR, fee_sponsor_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeleteFeeSponsorResponse, response)
 
-    def deactivate_fee_sponsor_init(self, fee_sponsor_id: str) -> UserActionChallengeResponse:
+    def deactivate_fee_sponsor_init(self, fee_sponsor_id: str) -> PreparedAction:
         """
         Initialize Deactivate Fee Sponsor.
 
@@ -174,21 +168,17 @@ class DelegatedFeeSponsorsClient:
             fee_sponsor_id: Which Fee Sponsor you wish to deactivate.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/fee-sponsors/{feeSponsorId}/deactivate"
-        path = path.replace("{feeSponsorId}", str(fee_sponsor_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.DEACTIVATE_FEE_SPONSOR, E.DEACTIVATE_FEE_SPONSOR.resolve(fee_sponsor_id)
         )
 
     def deactivate_fee_sponsor_complete(
-        self, fee_sponsor_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        fee_sponsor_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.DeactivateFeeSponsorResponse:
         """
         Complete Deactivate Fee Sponsor.
@@ -198,24 +188,23 @@ class DelegatedFeeSponsorsClient:
         Args:
             fee_sponsor_id: Which Fee Sponsor you wish to deactivate.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of deactivate_fee_sponsor_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeactivateFeeSponsorResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DEACTIVATE_FEE_SPONSOR.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/fee-sponsors/{feeSponsorId}/deactivate",
-            path_params={"feeSponsorId": fee_sponsor_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DEACTIVATE_FEE_SPONSOR, fee_sponsor_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeactivateFeeSponsorResponse, response)
 
-    def activate_fee_sponsor_init(self, fee_sponsor_id: str) -> UserActionChallengeResponse:
+    def activate_fee_sponsor_init(self, fee_sponsor_id: str) -> PreparedAction:
         """
         Initialize Activate Fee Sponsor.
 
@@ -225,21 +214,17 @@ class DelegatedFeeSponsorsClient:
             fee_sponsor_id: Which Fee Sponsor you wish to activate.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/fee-sponsors/{feeSponsorId}/activate"
-        path = path.replace("{feeSponsorId}", str(fee_sponsor_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.ACTIVATE_FEE_SPONSOR, E.ACTIVATE_FEE_SPONSOR.resolve(fee_sponsor_id)
         )
 
     def activate_fee_sponsor_complete(
-        self, fee_sponsor_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        fee_sponsor_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.ActivateFeeSponsorResponse:
         """
         Complete Activate Fee Sponsor.
@@ -249,20 +234,19 @@ class DelegatedFeeSponsorsClient:
         Args:
             fee_sponsor_id: Which Fee Sponsor you wish to activate.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_fee_sponsor_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ActivateFeeSponsorResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_FEE_SPONSOR.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/fee-sponsors/{feeSponsorId}/activate",
-            path_params={"feeSponsorId": fee_sponsor_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ACTIVATE_FEE_SPONSOR, fee_sponsor_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ActivateFeeSponsorResponse, response)
 
@@ -281,12 +265,23 @@ class DelegatedFeeSponsorsClient:
         Returns:
             T.ListSponsoredFeesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/fee-sponsors/{feeSponsorId}/fees",
-            path_params={"feeSponsorId": fee_sponsor_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_SPONSORED_FEES, fee_sponsor_id, query_params=query)
         return cast(T.ListSponsoredFeesResponse, response)
+
+    def iter_sponsored_fees(
+        self, fee_sponsor_id: str, query: T.ListSponsoredFeesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListSponsoredFeesItem]:
+        """
+        Iterate over List Sponsored Fees.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            fee_sponsor_id: Fee Sponsor to retrieve the fees from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListSponsoredFeesItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_sponsored_fees(fee_sponsor_id, q), query, page_size)
@@ -0,0 +1,44 @@
+"""Endpoint registry for the fee_sponsors domain."""
+
+from ..._internal.endpoint import Endpoint
+
+LIST_FEE_SPONSORS = Endpoint(
+    "fee_sponsors.list_fee_sponsors", "GET", "/fee-sponsors", response_type="ListFeeSponsorsResponse"
+)
+CREATE_FEE_SPONSOR = Endpoint(
+    "fee_sponsors.create_fee_sponsor",
+    "POST",
+    "/fee-sponsors",
+    requires_signature=True,
+    response_type="CreateFeeSponsorResponse",
+)
+GET_FEE_SPONSOR = Endpoint(
+    "fee_sponsors.get_fee_sponsor", "GET", "/fee-sponsors/{feeSponsorId}", response_type="GetFeeSponsorResponse"
+)
+DELETE_FEE_SPONSOR = Endpoint(
+    "fee_sponsors.delete_fee_sponsor",
+    "DELETE",
+    "/fee-sponsors/{feeSponsorId}",
+    requires_signature=True,
+    response_type="DeleteFeeSponsorResponse",
+)
+DEACTIVATE_FEE_SPONSOR = Endpoint(
+    "fee_sponsors.deactivate_fee_sponsor",
+    "PUT",
+    "/fee-sponsors/{feeSponsorId}/deactivate",
+    requires_signature=True,
+    response_type="DeactivateFeeSponsorResponse",
+)
+ACTIVATE_FEE_SPONSOR = Endpoint(
+    "fee_sponsors.activate_fee_sponsor",
+    "PUT",
+    "/fee-sponsors/{feeSponsorId}/activate",
+    requires_signature=True,
+    response_type="ActivateFeeSponsorResponse",
+)
+LIST_SPONSORED_FEES = Endpoint(
+    "fee_sponsors.list_sponsored_fees",
+    "GET",
+    "/fee-sponsors/{feeSponsorId}/fees",
+    response_type="ListSponsoredFeesResponse",
+)
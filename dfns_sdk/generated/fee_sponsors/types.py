@@ -4,11 +4,14 @@ from typing import Any, Literal, TypedDict
 
 from typing_extensions import NotRequired
 
+ListFeeSponsorsItem = dict[str, Any]
+"""Item of a listFeeSponsors page."""
+
 
 class ListFeeSponsorsResponse(TypedDict, total=False):
     """listFeeSponsors response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListFeeSponsorsItem]
     next_page_token: NotRequired[str]
 
 
@@ -87,10 +90,14 @@ class ActivateFeeSponsorResponse(TypedDict, total=False):
     allow_end_user: NotRequired[bool]
 
 
+ListSponsoredFeesItem = dict[str, Any]
+"""Item of a listSponsoredFees page."""
+
+
 class ListSponsoredFeesResponse(TypedDict, total=False):
     """listSponsoredFees response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListSponsoredFeesItem]
     next_page_token: NotRequired[str]
 
 
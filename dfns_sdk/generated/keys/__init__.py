@@ -1,7 +1,30 @@
 """Keys domain module."""
 
-from . import types
-from .client import KeysClient
-from .delegated_client import DelegatedKeysClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["KeysClient", "DelegatedKeysClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncKeysClient
+    from .async_delegated_client import AsyncDelegatedKeysClient
+    from .client import KeysClient
+    from .delegated_client import DelegatedKeysClient
+
+_EXPORTS = {
+    "KeysClient": ".client",
+    "DelegatedKeysClient": ".delegated_client",
+    "AsyncKeysClient": ".async_client",
+    "AsyncDelegatedKeysClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["KeysClient", "DelegatedKeysClient", "AsyncKeysClient", "AsyncDelegatedKeysClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
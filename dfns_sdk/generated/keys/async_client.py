@@ -0,0 +1,278 @@
+"""Async client for the keys domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncKeysClient:
+    """Async client for keys operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_keys(self, query: T.ListKeysQuery | None = None) -> T.ListKeysResponse:
+        """
+        List Keys.
+
+        Retrieve all keys registered for your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListKeysResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_KEYS, query_params=query)
+        return cast(T.ListKeysResponse, response)
+
+    def aiter_keys(
+        self, query: T.ListKeysQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListKeysItem]:
+        """
+        Iterate over List Keys.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListKeysItem]: The items of every page.
+        """
+        return aiter_items(self.list_keys, query, page_size)
+
+    async def create_key(self, body: T.CreateKeyRequest) -> T.CreateKeyResponse:
+        """
+        Create Key.
+
+        Creates a key for the given scheme and curve. Returns the new key entity.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateKeyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_KEY, body=body)
+        return cast(T.CreateKeyResponse, response)
+
+    async def delegate_key(self, key_id: str, body: T.DelegateKeyRequest) -> T.DelegateKeyResponse:
+        """
+                Delegate Key.
+
+                <Warning>
+        Only keys created with "`delayDelegation: true`" can then be delegated to an end-user. It means you need to know ahead of time that you're creating a wallet meant to be delegated to an end-user later. This is a safety to prevent, for example, a treasury wallet from being unintentionally delegated to an end-user.
+        </Warning>
+
+        <Note>
+        When a key is delegated to an end user, all wallets using this key as the signing key are also automatically delegated to the same end user. Key and wallet ownerships are guaranteed to be always consistent.
+        </Note>
+
+        <Danger>
+        This operation is irreversible. The key ownership will be transferred to the end-user
+        </Danger>
+
+        In most cases, when you want to implement [Wallet Delegation](https://docs.dfns.co/guides/developers/delegated-wallets), simply create the wallet by directly delegating it to an end user, in which case it will the non-custodial from the start.  There are some rare cases, however, where the key or wallet must be created before the user has accessed to the system.  To accommodate this, we've added the ability to create a key or wallet in delay delegation mode, and then later delegate it (i.e.: transfer ownership of it) to an end user via this endpoint.
+
+                Args:
+                    key_id: The key to delegate. Must have been created with `delayDelegation: true`.
+                    body: Request body.
+
+                Returns:
+                    T.DelegateKeyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELEGATE_KEY, key_id, body=body)
+        return cast(T.DelegateKeyResponse, response)
+
+    async def get_key(self, key_id: str) -> T.GetKeyResponse:
+        """
+        Get Key.
+
+        Retrieves a key information by its ID.
+
+        Args:
+            key_id: The key to retrieve.
+
+        Returns:
+            T.GetKeyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_KEY, key_id)
+        return cast(T.GetKeyResponse, response)
+
+    async def update_key(self, key_id: str, body: T.UpdateKeyRequest) -> T.UpdateKeyResponse:
+        """
+        Update Key.
+
+        Updates the name of an existing key.
+
+        Args:
+            key_id: The key to update.
+            body: Request body.
+
+        Returns:
+            T.UpdateKeyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UPDATE_KEY, key_id, body=body)
+        return cast(T.UpdateKeyResponse, response)
+
+    async def delete_key(self, key_id: str) -> T.DeleteKeyResponse:
+        """
+        Delete Key.
+
+        Deletes the key and all wallets using this key. Once deleted, keys (and wallets) are not usable anymore, and won't count in your overall organisation wallet count.
+
+        Args:
+            key_id: The key to delete.
+
+        Returns:
+            T.DeleteKeyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_KEY, key_id)
+        return cast(T.DeleteKeyResponse, response)
+
+    async def derive_key(self, key_id: str, body: T.DeriveKeyRequest) -> T.DeriveKeyResponse:
+        """
+                Derive Key.
+
+                Dfns decentralized key management network supports threshold Diffie-Hellman protocol based on [GLOW20 paper](https://eprint.iacr.org/2020/096). You can use the DH protocol to derive output from a domain separation tag and a seed value. The derivation process is deterministic, i.e. the same Diffie-Hellman key and seed will lead to the same derived output. To ensure reproducibility, we use hash to curve [RFC9380](https://www.rfc-editor.org/rfc/rfc9380.html) and standard ciphersuite `secp256k1_XMD:SHA-256_SSWU_RO_`.
+
+        <Tip>
+        The seed doesn’t need to be secret. Without access to the DH key, it is not possible to do the derivation, even if the seed is known. Moreover, if both seed and derived output are known, it’s also not possible to do the derivation for another seed without having access to the DH key.
+        </Tip>
+
+        This endpoint only supports Diffie-Hellman keys. Regular threshold signature keys, like `ECDSA` or `EdDSA`, will not work. You can create a Diffie-Hellman key with the [Create Key](https://docs.dfns.co/api-reference/keys/create-key) endpoint using `scheme=DH` and `curve=secp256k1`.
+
+                Args:
+                    key_id: The Diffie-Hellman key to derive from. Must be a key created with `scheme=DH`.
+                    body: Request body.
+
+                Returns:
+                    T.DeriveKeyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DERIVE_KEY, key_id, body=body)
+        return cast(T.DeriveKeyResponse, response)
+
+    async def export_key(self, key_id: str, body: T.ExportKeyRequest) -> T.ExportKeyResponse:
+        """
+                Export Key.
+
+                Dfns secures private keys by generating them as MPC key shares in our decentralized key management network.  Our goal is to eliminate all single points of failure (SPOFs) associated with blockchain private keys.
+
+        In certain circumstances, however, customers require Dfns to export a private key. In this case, Dfns exposes the following endpoint which can be used in conjunction with our [export SDK](https://github.com/dfns/dfns-sdk-ts/tree/m/examples/sdk/export-wallet). Each signer returns its key share encrypted to an encryption key you provide; the full private key is reconstituted client-side and is never assembled on Dfns servers.
+
+        <Danger>
+        Once a key is exported and reconstituted, it becomes a single point of failure that Dfns can no longer protect: anyone who obtains it controls the wallet and its assets, and Dfns can not guarantee the security of transactions signed with it. You are solely responsible for the exported key's security — its storage, encryption, access controls, and protection against theft or misuse. Key export is not enabled by default; contact our support team to have it activated for your organization.
+        </Danger>
+
+                Args:
+                    key_id: The key to export.
+                    body: Request body.
+
+                Returns:
+                    T.ExportKeyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.EXPORT_KEY, key_id, body=body)
+        return cast(T.ExportKeyResponse, response)
+
+    async def list_signatures(
+        self, key_id: str, query: T.ListSignaturesQuery | None = None
+    ) -> T.ListSignaturesResponse:
+        """
+        List Signatures.
+
+        List all signature requests for a key.
+
+        Args:
+            key_id: The key to list signatures for.
+            query: Query parameters.
+
+        Returns:
+            T.ListSignaturesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_SIGNATURES, key_id, query_params=query)
+        return cast(T.ListSignaturesResponse, response)
+
+    def aiter_signatures(
+        self, key_id: str, query: T.ListSignaturesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListSignaturesItem]:
+        """
+        Iterate over List Signatures.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            key_id: The key to list signatures for.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListSignaturesItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_signatures(key_id, q), query, page_size)
+
+    async def generate_signature(self, key_id: str, body: dict[str, Any]) -> T.GenerateSignatureResponse:
+        """
+                Generate Signature.
+
+                Request to generate a signature with the key. **This process does not broadcast anything on-chain**, this is just an off-chain signature request.
+
+        Dfns is compatible with any blockchain that uses a supported [key format](https://docs.dfns.co/networks/supported-key-formats). If Dfns doesn't officially integrate with a blockchain, you can use hash signing to generate the signatures to interact with the chain.
+
+        <Note>
+        If you were using the deprecated `POST /wallets/{walletId}/signatures` endpoint, then you should now use this one. See the [deprecation notice](https://docs.dfns.co/deprecation/keys-and-multichain-migration-guide) to get more information about how to change your code. TL,DR: from a wallet you can obtain the key as `wallet.signingKey.id`.
+        </Note>
+
+                Args:
+                    key_id: The key to sign with.
+                    body: Request body.
+
+                Returns:
+                    T.GenerateSignatureResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GENERATE_SIGNATURE, key_id, body=body)
+        return cast(T.GenerateSignatureResponse, response)
+
+    async def get_signature(self, key_id: str, signature_id: str) -> T.GetSignatureResponse:
+        """
+        Get Signature.
+
+        Retrieve a signature request details.
+
+        Args:
+            key_id: The key that was used for signing.
+            signature_id: The signature request to retrieve.
+
+        Returns:
+            T.GetSignatureResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_SIGNATURE, key_id, signature_id)
+        return cast(T.GetSignatureResponse, response)
+
+    async def import_key(self, body: T.ImportKeyRequest) -> T.ImportKeyResponse:
+        """
+                Import Key.
+
+                Dfns secures private keys by generating them as MPC key shares in our decentralized key management network.  This happens by default when you create a [key](https://docs.dfns.co/api-reference/keys/create-key) or [wallet](https://docs.dfns.co/api-reference/wallets/create-wallet).
+
+        In some circumstances, however, you may need to import an existing private key into Dfns infrastructure, instead of creating a brand new wallet with Dfns and transfer funds to it. As an example, you might want to keep an existing wallet if its address is tied to a smart contract which you don't want to re-deploy.
+
+        In such a case, Dfns exposes this key import API endpoint, which can be used in conjunction with our [import SDK](https://github.com/dfns/dfns-sdk-ts/tree/m/examples/sdk/import-wallet).   Note this is intended to be used only to migrate wallets when first onboarding onto the Dfns platform.
+
+        <Danger>
+        Dfns can not guarantee the security of imported wallets, as we have no way to control who had access to the private key prior to import.  For this reason, this feature is restricted to Enterprise customers who have signed a contractual addendum limiting our liability for imported keys.  Please contact your sales representative for more information.
+        </Danger>
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.ImportKeyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.IMPORT_KEY, body=body)
+        return cast(T.ImportKeyResponse, response)
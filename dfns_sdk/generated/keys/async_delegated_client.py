@@ -0,0 +1,489 @@
+"""Async delegated client for the keys domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedKeysClient:
+    """
+    Async delegated client for keys operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_keys(self, query: T.ListKeysQuery | None = None) -> T.ListKeysResponse:
+        """
+        List Keys.
+
+        Retrieve all keys registered for your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListKeysResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_KEYS, query_params=query)
+        return cast(T.ListKeysResponse, response)
+
+    def aiter_keys(
+        self, query: T.ListKeysQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListKeysItem]:
+        """
+        Iterate over List Keys.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListKeysItem]: The items of every page.
+        """
+        return aiter_items(self.list_keys, query, page_size)
+
+    async def create_key_init(self, body: T.CreateKeyRequest) -> PreparedAction:
+        """
+        Initialize Create Key.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.CREATE_KEY, E.CREATE_KEY.path, body)
+
+    async def create_key_complete(
+        self,
+        body: T.CreateKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateKeyResponse:
+        """
+        Complete Create Key.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_key_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateKeyResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_KEY.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_KEY, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateKeyResponse, response)
+
+    async def delegate_key_init(self, key_id: str, body: T.DelegateKeyRequest) -> PreparedAction:
+        """
+        Initialize Delegate Key.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            key_id: The key to delegate. Must have been created with `delayDelegation: true`.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DELEGATE_KEY, E.DELEGATE_KEY.resolve(key_id), body
+        )
+
+    async def delegate_key_complete(
+        self,
+        key_id: str,
+        body: T.DelegateKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.DelegateKeyResponse:
+        """
+        Complete Delegate Key.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            key_id: The key to delegate. Must have been created with `delayDelegation: true`.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delegate_key_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DelegateKeyResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELEGATE_KEY.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELEGATE_KEY, key_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DelegateKeyResponse, response)
+
+    async def get_key(self, key_id: str) -> T.GetKeyResponse:
+        """
+        Get Key.
+
+        Retrieves a key information by its ID.
+
+        Args:
+            key_id: The key to retrieve.
+
+        Returns:
+            T.GetKeyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_KEY, key_id)
+        return cast(T.GetKeyResponse, response)
+
+    async def update_key_init(self, key_id: str, body: T.UpdateKeyRequest) -> PreparedAction:
+        """
+        Initialize Update Key.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            key_id: The key to update.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.UPDATE_KEY, E.UPDATE_KEY.resolve(key_id), body)
+
+    async def update_key_complete(
+        self,
+        key_id: str,
+        body: T.UpdateKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UpdateKeyResponse:
+        """
+        Complete Update Key.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            key_id: The key to update.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_key_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UpdateKeyResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_KEY.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UPDATE_KEY, key_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.UpdateKeyResponse, response)
+
+    async def delete_key_init(self, key_id: str) -> PreparedAction:
+        """
+        Initialize Delete Key.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            key_id: The key to delete.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.DELETE_KEY, E.DELETE_KEY.resolve(key_id))
+
+    async def delete_key_complete(
+        self, key_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.DeleteKeyResponse:
+        """
+        Complete Delete Key.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            key_id: The key to delete.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_key_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeleteKeyResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_KEY.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_KEY, key_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeleteKeyResponse, response)
+
+    async def derive_key_init(self, key_id: str, body: T.DeriveKeyRequest) -> PreparedAction:
+        """
+        Initialize Derive Key.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            key_id: The Diffie-Hellman key to derive from. Must be a key created with `scheme=DH`.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.DERIVE_KEY, E.DERIVE_KEY.resolve(key_id), body)
+
+    async def derive_key_complete(
+        self,
+        key_id: str,
+        body: T.DeriveKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.DeriveKeyResponse:
+        """
+        Complete Derive Key.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            key_id: The Diffie-Hellman key to derive from. Must be a key created with `scheme=DH`.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of derive_key_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeriveKeyResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DERIVE_KEY.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DERIVE_KEY, key_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeriveKeyResponse, response)
+
+    async def export_key_init(self, key_id: str, body: T.ExportKeyRequest) -> PreparedAction:
+        """
+        Initialize Export Key.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            key_id: The key to export.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.EXPORT_KEY, E.EXPORT_KEY.resolve(key_id), body)
+
+    async def export_key_complete(
+        self,
+        key_id: str,
+        body: T.ExportKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.ExportKeyResponse:
+        """
+        Complete Export Key.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            key_id: The key to export.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of export_key_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ExportKeyResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.EXPORT_KEY.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.EXPORT_KEY, key_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ExportKeyResponse, response)
+
+    async def list_signatures(
+        self, key_id: str, query: T.ListSignaturesQuery | None = None
+    ) -> T.ListSignaturesResponse:
+        """
+        List Signatures.
+
+        List all signature requests for a key.
+
+        Args:
+            key_id: The key to list signatures for.
+            query: Query parameters.
+
+        Returns:
+            T.ListSignaturesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_SIGNATURES, key_id, query_params=query)
+        return cast(T.ListSignaturesResponse, response)
+
+    def aiter_signatures(
+        self, key_id: str, query: T.ListSignaturesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListSignaturesItem]:
+        """
+        Iterate over List Signatures.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            key_id: The key to list signatures for.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListSignaturesItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_signatures(key_id, q), query, page_size)
+
+    async def generate_signature_init(self, key_id: str, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Generate Signature.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            key_id: The key to sign with.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.GENERATE_SIGNATURE, E.GENERATE_SIGNATURE.resolve(key_id), body
+        )
+
+    async def generate_signature_complete(
+        self,
+        key_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.GenerateSignatureResponse:
+        """
+        Complete Generate Signature.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            key_id: The key to sign with.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of generate_signature_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.GenerateSignatureResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.GENERATE_SIGNATURE.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.GENERATE_SIGNATURE, key_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.GenerateSignatureResponse, response)
+
+    async def get_signature(self, key_id: str, signature_id: str) -> T.GetSignatureResponse:
+        """
+        Get Signature.
+
+        Retrieve a signature request details.
+
+        Args:
+            key_id: The key that was used for signing.
+            signature_id: The signature request to retrieve.
+
+        Returns:
+            T.GetSignatureResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_SIGNATURE, key_id, signature_id)
+        return cast(T.GetSignatureResponse, response)
+
+    async def import_key_init(self, body: T.ImportKeyRequest) -> PreparedAction:
+        """
+        Initialize Import Key.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.IMPORT_KEY, E.IMPORT_KEY.path, body)
+
+    async def import_key_complete(
+        self,
+        body: T.ImportKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.ImportKeyResponse:
+        """
+        Complete Import Key.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of import_key_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ImportKeyResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.IMPORT_KEY.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.IMPORT_KEY, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ImportKeyResponse, response)
@@ -1,8 +1,11 @@
 """Client for the keys domain."""
 
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,16 +27,24 @@ class KeysClient:
         Returns:
             T.ListKeysResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/keys",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_KEYS, query_params=query)
         return cast(T.ListKeysResponse, response)
 
+    def iter_keys(self, query: T.ListKeysQuery | None = None, page_size: int | None = None) -> Iterator[T.ListKeysItem]:
+        """
+        Iterate over List Keys.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListKeysItem]: The items of every page.
+        """
+        return iter_items(self.list_keys, query, page_size)
+
     def create_key(self, body: T.CreateKeyRequest) -> T.CreateKeyResponse:
         """
         Create Key.
@@ -46,14 +57,7 @@ class KeysClient:
         Returns:
             T.CreateKeyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/keys",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_KEY, body=body)
         return cast(T.CreateKeyResponse, response)
 
     def delegate_key(self, key_id: str, body: T.DelegateKeyRequest) -> T.DelegateKeyResponse:
@@ -81,14 +85,7 @@ class KeysClient:
                 Returns:
                     T.DelegateKeyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/keys/{keyId}/delegate",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELEGATE_KEY, key_id, body=body)
         return cast(T.DelegateKeyResponse, response)
 
     def get_key(self, key_id: str) -> T.GetKeyResponse:
@@ -103,14 +100,7 @@ class KeysClient:
         Returns:
             T.GetKeyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/keys/{keyId}",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_KEY, key_id)
         return cast(T.GetKeyResponse, response)
 
     def update_key(self, key_id: str, body: T.UpdateKeyRequest) -> T.UpdateKeyResponse:
@@ -126,14 +116,7 @@ class KeysClient:
         Returns:
             T.UpdateKeyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/keys/{keyId}",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UPDATE_KEY, key_id, body=body)
         return cast(T.UpdateKeyResponse, response)
 
     def delete_key(self, key_id: str) -> T.DeleteKeyResponse:
@@ -148,14 +131,7 @@ class KeysClient:
         Returns:
             T.DeleteKeyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/keys/{keyId}",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_KEY, key_id)
         return cast(T.DeleteKeyResponse, response)
 
     def derive_key(self, key_id: str, body: T.DeriveKeyRequest) -> T.DeriveKeyResponse:
@@ -177,14 +153,7 @@ class KeysClient:
                 Returns:
                     T.DeriveKeyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/keys/{keyId}/derive",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DERIVE_KEY, key_id, body=body)
         return cast(T.DeriveKeyResponse, response)
 
     def export_key(self, key_id: str, body: T.ExportKeyRequest) -> T.ExportKeyResponse:
@@ -206,14 +175,7 @@ class KeysClient:
                 Returns:
                     T.ExportKeyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/keys/{keyId}/export",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.EXPORT_KEY, key_id, body=body)
         return cast(T.ExportKeyResponse, response)
 
     def list_signatures(self, key_id: str, query: T.ListSignaturesQuery | None = None) -> T.ListSignaturesResponse:
@@ -229,16 +191,27 @@ class KeysClient:
         Returns:
             T.ListSignaturesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/keys/{keyId}/signatures",
-            path_params={"keyId": key_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_SIGNATURES, key_id, query_params=query)
         return cast(T.ListSignaturesResponse, response)
 
+    def iter_signatures(
+        self, key_id: str, query: T.ListSignaturesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListSignaturesItem]:
+        """
+        Iterate over List Signatures.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            key_id: The key to list signatures for.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListSignaturesItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_signatures(key_id, q), query, page_size)
+
     def generate_signature(self, key_id: str, body: dict[str, Any]) -> T.GenerateSignatureResponse:
         """
                 Generate Signature.
@@ -258,14 +231,7 @@ class KeysClient:
                 Returns:
                     T.GenerateSignatureResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/keys/{keyId}/signatures",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.GENERATE_SIGNATURE, key_id, body=body)
         return cast(T.GenerateSignatureResponse, response)
 
     def get_signature(self, key_id: str, signature_id: str) -> T.GetSignatureResponse:
@@ -281,14 +247,7 @@ class KeysClient:
         Returns:
             T.GetSignatureResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/keys/{keyId}/signatures/{signatureId}",
-            path_params={"keyId": key_id, "signatureId": signature_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_SIGNATURE, key_id, signature_id)
         return cast(T.GetSignatureResponse, response)
 
     def import_key(self, body: T.ImportKeyRequest) -> T.ImportKeyResponse:
@@ -311,12 +270,5 @@ class KeysClient:
                 Returns:
                     T.ImportKeyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/keys/import",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.IMPORT_KEY, body=body)
         return cast(T.ImportKeyResponse, response)
@@ -1,10 +1,12 @@
 """Delegated client for the keys domain."""
 
-import json
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,25 @@ class DelegatedKeysClient:
         Returns:
             T.ListKeysResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/keys",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_KEYS, query_params=query)
         return cast(T.ListKeysResponse, response)
 
-    def create_key_init(self, body: T.CreateKeyRequest) -> UserActionChallengeResponse:
+    def iter_keys(self, query: T.ListKeysQuery | None = None, page_size: int | None = None) -> Iterator[T.ListKeysItem]:
+        """
+        Iterate over List Keys.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListKeysItem]: The items of every page.
+        """
+        return iter_items(self.list_keys, query, page_size)
+
+    def create_key_init(self, body: T.CreateKeyRequest) -> PreparedAction:
         """
         Initialize Create Key.
 
@@ -51,20 +61,15 @@ class DelegatedKeysClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/keys"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_KEY, E.CREATE_KEY.path, body)
 
     def create_key_complete(
-        self, body: T.CreateKeyRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateKeyResponse:
         """
         Complete Create Key.
@@ -74,24 +79,23 @@ class DelegatedKeysClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_key_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateKeyResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_KEY.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/keys",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_KEY, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateKeyResponse, response)
 
-    def delegate_key_init(self, key_id: str, body: T.DelegateKeyRequest) -> UserActionChallengeResponse:
+    def delegate_key_init(self, key_id: str, body: T.DelegateKeyRequest) -> PreparedAction:
         """
         Initialize Delegate Key.
 
@@ -102,21 +106,16 @@ class DelegatedKeysClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/keys/{keyId}/delegate"
-        path = path.replace("{keyId}", str(key_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.DELEGATE_KEY, E.DELEGATE_KEY.resolve(key_id), body)
 
     def delegate_key_complete(
-        self, key_id: str, body: T.DelegateKeyRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        key_id: str,
+        body: T.DelegateKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.DelegateKeyResponse:
         """
         Complete Delegate Key.
@@ -127,20 +126,19 @@ class DelegatedKeysClient:
             key_id: The key to delegate. Must have been created with `delayDelegation: true`.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delegate_key_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DelegateKeyResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELEGATE_KEY.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/keys/{keyId}/delegate",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELEGATE_KEY, key_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DelegateKeyResponse, response)
 
@@ -156,17 +154,10 @@ class DelegatedKeysClient:
         Returns:
             T.GetKeyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/keys/{keyId}",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_KEY, key_id)
         return cast(T.GetKeyResponse, response)
 
-    def update_key_init(self, key_id: str, body: T.UpdateKeyRequest) -> UserActionChallengeResponse:
+    def update_key_init(self, key_id: str, body: T.UpdateKeyRequest) -> PreparedAction:
         """
         Initialize Update Key.
 
@@ -177,21 +168,16 @@ class DelegatedKeysClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/keys/{keyId}"
-        path = path.replace("{keyId}", str(key_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.UPDATE_KEY, E.UPDATE_KEY.resolve(key_id), body)
 
     def update_key_complete(
-        self, key_id: str, body: T.UpdateKeyRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        key_id: str,
+        body: T.UpdateKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UpdateKeyResponse:
         """
         Complete Update Key.
@@ -202,24 +188,23 @@ class DelegatedKeysClient:
             key_id: The key to update.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_key_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UpdateKeyResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_KEY.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/keys/{keyId}",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UPDATE_KEY, key_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.UpdateKeyResponse, response)
 
-    def delete_key_init(self, key_id: str) -> UserActionChallengeResponse:
+    def delete_key_init(self, key_id: str) -> PreparedAction:
         """
         Initialize Delete Key.
 
@@ -229,20 +214,13 @@ class DelegatedKeysClient:
             key_id: The key to delete.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/keys/{keyId}"
-        path = path.replace("{keyId}", str(key_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.DELETE_KEY, E.DELETE_KEY.resolve(key_id))
 
-    def delete_key_complete(self, key_id: str, signed_challenge: SignUserActionChallengeRequest) -> T.DeleteKeyResponse:
+    def delete_key_complete(
+        self, key_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.DeleteKeyResponse:
         """
         Complete Delete Key.
 
@@ -251,24 +229,23 @@ class DelegatedKeysClient:
         Args:
             key_id: The key to delete.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_key_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeleteKeyResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_KEY.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/keys/{keyId}",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELETE_KEY, key_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeleteKeyResponse, response)
 
-    def derive_key_init(self, key_id: str, body: T.DeriveKeyRequest) -> UserActionChallengeResponse:
+    def derive_key_init(self, key_id: str, body: T.DeriveKeyRequest) -> PreparedAction:
         """
         Initialize Derive Key.
 
@@ -279,21 +256,16 @@ class DelegatedKeysClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/keys/{keyId}/derive"
-        path = path.replace("{keyId}", str(key_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.DERIVE_KEY, E.DERIVE_KEY.resolve(key_id), body)
 
     def derive_key_complete(
-        self, key_id: str, body: T.DeriveKeyRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        key_id: str,
+        body: T.DeriveKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.DeriveKeyResponse:
         """
         Complete Derive Key.
@@ -304,24 +276,23 @@ class DelegatedKeysClient:
             key_id: The Diffie-Hellman key to derive from. Must be a key created with `scheme=DH`.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of derive_key_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeriveKeyResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DERIVE_KEY.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/keys/{keyId}/derive",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DERIVE_KEY, key_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeriveKeyResponse, response)
 
-    def export_key_init(self, key_id: str, body: T.ExportKeyRequest) -> UserActionChallengeResponse:
+    def export_key_init(self, key_id: str, body: T.ExportKeyRequest) -> PreparedAction:
         """
         Initialize Export Key.
 
@@ -332,21 +303,16 @@ class DelegatedKeysClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/keys/{keyId}/export"
-        path = path.replace("{keyId}", str(key_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.EXPORT_KEY, E.EXPORT_KEY.resolve(key_id), body)
 
     def export_key_complete(
-        self, key_id: str, body: T.ExportKeyRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        key_id: str,
+        body: T.ExportKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.ExportKeyResponse:
         """
         Complete Export Key.
@@ -357,20 +323,19 @@ class DelegatedKeysClient:
             key_id: The key to export.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of export_key_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ExportKeyResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.EXPORT_KEY.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/keys/{keyId}/export",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.EXPORT_KEY, key_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ExportKeyResponse, response)
 
@@ -387,17 +352,28 @@ class DelegatedKeysClient:
         Returns:
             T.ListSignaturesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/keys/{keyId}/signatures",
-            path_params={"keyId": key_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_SIGNATURES, key_id, query_params=query)
         return cast(T.ListSignaturesResponse, response)
 
-    def generate_signature_init(self, key_id: str, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def iter_signatures(
+        self, key_id: str, query: T.ListSignaturesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListSignaturesItem]:
+        """
+        Iterate over List Signatures.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            key_id: The key to list signatures for.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListSignaturesItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_signatures(key_id, q), query, page_size)
+
+    def generate_signature_init(self, key_id: str, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Generate Signature.
 
@@ -408,21 +384,18 @@ class DelegatedKeysClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/keys/{keyId}/signatures"
-        path = path.replace("{keyId}", str(key_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.GENERATE_SIGNATURE, E.GENERATE_SIGNATURE.resolve(key_id), body
         )
 
     def generate_signature_complete(
-        self, key_id: str, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        key_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.GenerateSignatureResponse:
         """
         Complete Generate Signature.
@@ -433,20 +406,19 @@ class DelegatedKeysClient:
             key_id: The key to sign with.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of generate_signature_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.GenerateSignatureResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.GENERATE_SIGNATURE.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/keys/{keyId}/signatures",
-            path_params={"keyId": key_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.GENERATE_SIGNATURE, key_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.GenerateSignatureResponse, response)
 
@@ -463,17 +435,10 @@ class DelegatedKeysClient:
         Returns:
             T.GetSignatureResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/keys/{keyId}/signatures/{signatureId}",
-            path_params={"keyId": key_id, "signatureId": signature_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_SIGNATURE, key_id, signature_id)
         return cast(T.GetSignatureResponse, response)
 
-    def import_key_init(self, body: T.ImportKeyRequest) -> UserActionChallengeResponse:
+    def import_key_init(self, body: T.ImportKeyRequest) -> PreparedAction:
         """
         Initialize Import Key.
 
@@ -483,20 +448,15 @@ class DelegatedKeysClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/keys/import"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.IMPORT_KEY, E.IMPORT_KEY.path, body)
 
     def import_key_complete(
-        self, body: T.ImportKeyRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.ImportKeyRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.ImportKeyResponse:
         """
         Complete Import Key.
@@ -506,19 +466,18 @@ class DelegatedKeysClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of import_key_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ImportKeyResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.IMPORT_KEY.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/keys/import",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.IMPORT_KEY, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ImportKeyResponse, response)
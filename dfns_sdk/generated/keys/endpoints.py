@@ -0,0 +1,38 @@
+"""Endpoint registry for the keys domain."""
+
+from ..._internal.endpoint import Endpoint
+
+LIST_KEYS = Endpoint("keys.list_keys", "GET", "/keys", response_type="ListKeysResponse")
+CREATE_KEY = Endpoint("keys.create_key", "POST", "/keys", requires_signature=True, response_type="CreateKeyResponse")
+DELEGATE_KEY = Endpoint(
+    "keys.delegate_key", "POST", "/keys/{keyId}/delegate", requires_signature=True, response_type="DelegateKeyResponse"
+)
+GET_KEY = Endpoint("keys.get_key", "GET", "/keys/{keyId}", response_type="GetKeyResponse")
+UPDATE_KEY = Endpoint(
+    "keys.update_key", "PUT", "/keys/{keyId}", requires_signature=True, response_type="UpdateKeyResponse"
+)
+DELETE_KEY = Endpoint(
+    "keys.delete_key", "DELETE", "/keys/{keyId}", requires_signature=True, response_type="DeleteKeyResponse"
+)
+DERIVE_KEY = Endpoint(
+    "keys.derive_key", "POST", "/keys/{keyId}/derive", requires_signature=True, response_type="DeriveKeyResponse"
+)
+EXPORT_KEY = Endpoint(
+    "keys.export_key", "POST", "/keys/{keyId}/export", requires_signature=True, response_type="ExportKeyResponse"
+)
+LIST_SIGNATURES = Endpoint(
+    "keys.list_signatures", "GET", "/keys/{keyId}/signatures", response_type="ListSignaturesResponse"
+)
+GENERATE_SIGNATURE = Endpoint(
+    "keys.generate_signature",
+    "POST",
+    "/keys/{keyId}/signatures",
+    requires_signature=True,
+    response_type="GenerateSignatureResponse",
+)
+GET_SIGNATURE = Endpoint(
+    "keys.get_signature", "GET", "/keys/{keyId}/signatures/{signatureId}", response_type="GetSignatureResponse"
+)
+IMPORT_KEY = Endpoint(
+    "keys.import_key", "POST", "/keys/import", requires_signature=True, response_type="ImportKeyResponse"
+)
@@ -4,11 +4,14 @@ from typing import Any, Literal, TypedDict
 
 from typing_extensions import NotRequired
 
+ListKeysItem = dict[str, Any]
+"""Item of a listKeys page."""
+
 
 class ListKeysResponse(TypedDict, total=False):
     """listKeys response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListKeysItem]
     next_page_token: NotRequired[str]
 
 
@@ -160,10 +163,14 @@ class ExportKeyResponse(TypedDict, total=False):
     encrypted_key_shares: list[dict[str, Any]]
 
 
+ListSignaturesItem = dict[str, Any]
+"""Item of a listSignatures page."""
+
+
 class ListSignaturesResponse(TypedDict, total=False):
     """listSignatures response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListSignaturesItem]
     next_page_token: NotRequired[str]
     key_id: str
 
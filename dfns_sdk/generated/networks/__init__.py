@@ -1,7 +1,30 @@
 """Networks domain module."""
 
-from . import types
-from .client import NetworksClient
-from .delegated_client import DelegatedNetworksClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["NetworksClient", "DelegatedNetworksClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncNetworksClient
+    from .async_delegated_client import AsyncDelegatedNetworksClient
+    from .client import NetworksClient
+    from .delegated_client import DelegatedNetworksClient
+
+_EXPORTS = {
+    "NetworksClient": ".client",
+    "DelegatedNetworksClient": ".delegated_client",
+    "AsyncNetworksClient": ".async_client",
+    "AsyncDelegatedNetworksClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["NetworksClient", "DelegatedNetworksClient", "AsyncNetworksClient", "AsyncDelegatedNetworksClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,174 @@
+"""Async client for the networks domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, Literal, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncNetworksClient:
+    """Async client for networks operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def estimate_fees(self, query: T.EstimateFeesQuery) -> dict[str, Any]:
+        """
+        Estimate Fees.
+
+        Gets real-time fee details for a given network, allowing users to make decisions based on their preferences for transaction speed/priority. Three levels of priority will be displayed: `slow`, `standard`, `fast`.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ESTIMATE_FEES, query_params=query)
+        return cast(dict[str, Any], response)
+
+    async def call_function(self, network: str, body: T.CallFunctionRequest) -> dict[str, Any]:
+        """
+              Call Function.
+
+              Call a read-only function on a smart contract. In Solidity, these are functions with the state mutability set to `view`.
+
+        <Note>
+        Currently only works on EVM compatible chains.
+        </Note>
+
+              Args:
+                  network: Network name formatted in kebab case
+                  body: Request body.
+
+              Returns:
+                  dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CALL_FUNCTION, network, body=body)
+        return cast(dict[str, Any], response)
+
+    async def get_canton_validator(
+        self, network: Literal["canton", "canton-devnet", "canton-testnet"], validator_id: str
+    ) -> T.GetCantonValidatorResponse:
+        """
+        Get Canton Validator.
+
+        Return a configured Canton Validator in your organization.
+
+        Args:
+            network: Path parameter.
+            validator_id: Path parameter.
+
+        Returns:
+            T.GetCantonValidatorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_CANTON_VALIDATOR, network, validator_id)
+        return cast(T.GetCantonValidatorResponse, response)
+
+    async def update_canton_validator(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        validator_id: str,
+        body: T.UpdateCantonValidatorRequest,
+    ) -> T.UpdateCantonValidatorResponse:
+        """
+              Update Canton Validator.
+
+              Update an existing Canton Validator configuration.
+
+        Read details about the process [here](https://docs.dfns.co/networks/canton).
+
+              Args:
+                  network: Path parameter.
+                  validator_id: Path parameter.
+                  body: Request body.
+
+              Returns:
+                  T.UpdateCantonValidatorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UPDATE_CANTON_VALIDATOR, network, validator_id, body=body)
+        return cast(T.UpdateCantonValidatorResponse, response)
+
+    async def delete_canton_validator(
+        self, network: Literal["canton", "canton-devnet", "canton-testnet"], validator_id: str
+    ) -> T.DeleteCantonValidatorResponse:
+        """
+        Delete Canton Validator.
+
+        Delete a specific Canton Validator configuration.
+
+        Args:
+            network: Path parameter.
+            validator_id: Path parameter.
+
+        Returns:
+            T.DeleteCantonValidatorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_CANTON_VALIDATOR, network, validator_id)
+        return cast(T.DeleteCantonValidatorResponse, response)
+
+    async def list_canton_validators(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        query: T.ListCantonValidatorsQuery | None = None,
+    ) -> T.ListCantonValidatorsResponse:
+        """
+        List Canton Validators.
+
+        Retrieve the list of configured Canton Validators in your organization.
+
+        Args:
+            network: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.ListCantonValidatorsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_CANTON_VALIDATORS, network, query_params=query)
+        return cast(T.ListCantonValidatorsResponse, response)
+
+    def aiter_canton_validators(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        query: T.ListCantonValidatorsQuery | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[T.ListCantonValidatorsItem]:
+        """
+        Iterate over List Canton Validators.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            network: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListCantonValidatorsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_canton_validators(network, q), query, page_size)
+
+    async def create_canton_validator(
+        self, network: Literal["canton", "canton-devnet", "canton-testnet"], body: dict[str, Any]
+    ) -> T.CreateCantonValidatorResponse:
+        """
+              Create Canton Validator.
+
+              Link a Canton Validator to your organization. This is required in order to create wallets or interact with the Canton network.
+
+        The `Shared` option allows you to use a shared validator hosted by Dfns and get started in seconds, while the `Custom` option allows you to connect your own validator and ledger nodes using OAuth2 authentication.
+
+        Read details about the process [here](https://docs.dfns.co/networks/canton).
+
+              Args:
+                  network: Path parameter.
+                  body: Request body.
+
+              Returns:
+                  T.CreateCantonValidatorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_CANTON_VALIDATOR, network, body=body)
+        return cast(T.CreateCantonValidatorResponse, response)
@@ -0,0 +1,280 @@
+"""Async delegated client for the networks domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, Literal, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedNetworksClient:
+    """
+    Async delegated client for networks operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def estimate_fees(self, query: T.EstimateFeesQuery) -> dict[str, Any]:
+        """
+        Estimate Fees.
+
+        Gets real-time fee details for a given network, allowing users to make decisions based on their preferences for transaction speed/priority. Three levels of priority will be displayed: `slow`, `standard`, `fast`.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ESTIMATE_FEES, query_params=query)
+        return cast(dict[str, Any], response)
+
+    async def call_function(self, network: str, body: T.CallFunctionRequest) -> dict[str, Any]:
+        """
+              Call Function.
+
+              Call a read-only function on a smart contract. In Solidity, these are functions with the state mutability set to `view`.
+
+        <Note>
+        Currently only works on EVM compatible chains.
+        </Note>
+
+              Args:
+                  network: Network name formatted in kebab case
+                  body: Request body.
+
+              Returns:
+                  dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CALL_FUNCTION, network, body=body)
+        return cast(dict[str, Any], response)
+
+    async def get_canton_validator(
+        self, network: Literal["canton", "canton-devnet", "canton-testnet"], validator_id: str
+    ) -> T.GetCantonValidatorResponse:
+        """
+        Get Canton Validator.
+
+        Return a configured Canton Validator in your organization.
+
+        Args:
+            network: Path parameter.
+            validator_id: Path parameter.
+
+        Returns:
+            T.GetCantonValidatorResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_CANTON_VALIDATOR, network, validator_id)
+        return cast(T.GetCantonValidatorResponse, response)
+
+    async def update_canton_validator_init(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        validator_id: str,
+        body: T.UpdateCantonValidatorRequest,
+    ) -> PreparedAction:
+        """
+        Initialize Update Canton Validator.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            network: Path parameter.
+            validator_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_CANTON_VALIDATOR, E.UPDATE_CANTON_VALIDATOR.resolve(network, validator_id), body
+        )
+
+    async def update_canton_validator_complete(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        validator_id: str,
+        body: T.UpdateCantonValidatorRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UpdateCantonValidatorResponse:
+        """
+        Complete Update Canton Validator.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            network: Path parameter.
+            validator_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_canton_validator_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UpdateCantonValidatorResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_CANTON_VALIDATOR.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UPDATE_CANTON_VALIDATOR,
+            network,
+            validator_id,
+            body=body,
+            user_action=user_action_token,
+            prepared=prepared,
+        )
+        return cast(T.UpdateCantonValidatorResponse, response)
+
+    async def delete_canton_validator_init(
+        self, network: Literal["canton", "canton-devnet", "canton-testnet"], validator_id: str
+    ) -> PreparedAction:
+        """
+        Initialize Delete Canton Validator.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            network: Path parameter.
+            validator_id: Path parameter.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_CANTON_VALIDATOR, E.DELETE_CANTON_VALIDATOR.resolve(network, validator_id)
+        )
+
+    async def delete_canton_validator_complete(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        validator_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.DeleteCantonValidatorResponse:
+        """
+        Complete Delete Canton Validator.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            network: Path parameter.
+            validator_id: Path parameter.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_canton_validator_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeleteCantonValidatorResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_CANTON_VALIDATOR.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_CANTON_VALIDATOR, network, validator_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeleteCantonValidatorResponse, response)
+
+    async def list_canton_validators(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        query: T.ListCantonValidatorsQuery | None = None,
+    ) -> T.ListCantonValidatorsResponse:
+        """
+        List Canton Validators.
+
+        Retrieve the list of configured Canton Validators in your organization.
+
+        Args:
+            network: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.ListCantonValidatorsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_CANTON_VALIDATORS, network, query_params=query)
+        return cast(T.ListCantonValidatorsResponse, response)
+
+    def aiter_canton_validators(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        query: T.ListCantonValidatorsQuery | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[T.ListCantonValidatorsItem]:
+        """
+        Iterate over List Canton Validators.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            network: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListCantonValidatorsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_canton_validators(network, q), query, page_size)
+
+    async def create_canton_validator_init(
+        self, network: Literal["canton", "canton-devnet", "canton-testnet"], body: dict[str, Any]
+    ) -> PreparedAction:
+        """
+        Initialize Create Canton Validator.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            network: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_CANTON_VALIDATOR, E.CREATE_CANTON_VALIDATOR.resolve(network), body
+        )
+
+    async def create_canton_validator_complete(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateCantonValidatorResponse:
+        """
+        Complete Create Canton Validator.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            network: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_canton_validator_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateCantonValidatorResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_CANTON_VALIDATOR.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_CANTON_VALIDATOR, network, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateCantonValidatorResponse, response)
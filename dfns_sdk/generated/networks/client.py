@@ -1,8 +1,11 @@
 """Client for the networks domain."""
 
+from collections.abc import Iterator
 from typing import Any, Literal, cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,14 +27,7 @@ class NetworksClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/networks/fees",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.ESTIMATE_FEES, query_params=query)
         return cast(dict[str, Any], response)
 
     def call_function(self, network: str, body: T.CallFunctionRequest) -> dict[str, Any]:
@@ -51,14 +47,7 @@ class NetworksClient:
               Returns:
                   dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/networks/{network}/call-function",
-            path_params={"network": network},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CALL_FUNCTION, network, body=body)
         return cast(dict[str, Any], response)
 
     def get_canton_validator(
@@ -76,14 +65,7 @@ class NetworksClient:
         Returns:
             T.GetCantonValidatorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/networks/{network}/validators/{validatorId}",
-            path_params={"network": network, "validatorId": validator_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_CANTON_VALIDATOR, network, validator_id)
         return cast(T.GetCantonValidatorResponse, response)
 
     def update_canton_validator(
@@ -107,14 +89,7 @@ class NetworksClient:
               Returns:
                   T.UpdateCantonValidatorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/networks/{network}/validators/{validatorId}",
-            path_params={"network": network, "validatorId": validator_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UPDATE_CANTON_VALIDATOR, network, validator_id, body=body)
         return cast(T.UpdateCantonValidatorResponse, response)
 
     def delete_canton_validator(
@@ -132,14 +107,7 @@ class NetworksClient:
         Returns:
             T.DeleteCantonValidatorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/networks/{network}/validators/{validatorId}",
-            path_params={"network": network, "validatorId": validator_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_CANTON_VALIDATOR, network, validator_id)
         return cast(T.DeleteCantonValidatorResponse, response)
 
     def list_canton_validators(
@@ -159,16 +127,30 @@ class NetworksClient:
         Returns:
             T.ListCantonValidatorsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/networks/{network}/validators",
-            path_params={"network": network},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_CANTON_VALIDATORS, network, query_params=query)
         return cast(T.ListCantonValidatorsResponse, response)
 
+    def iter_canton_validators(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        query: T.ListCantonValidatorsQuery | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[T.ListCantonValidatorsItem]:
+        """
+        Iterate over List Canton Validators.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            network: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListCantonValidatorsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_canton_validators(network, q), query, page_size)
+
     def create_canton_validator(
         self, network: Literal["canton", "canton-devnet", "canton-testnet"], body: dict[str, Any]
     ) -> T.CreateCantonValidatorResponse:
@@ -188,12 +170,5 @@ class NetworksClient:
               Returns:
                   T.CreateCantonValidatorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/networks/{network}/validators",
-            path_params={"network": network},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_CANTON_VALIDATOR, network, body=body)
         return cast(T.CreateCantonValidatorResponse, response)
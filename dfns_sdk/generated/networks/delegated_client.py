@@ -1,10 +1,12 @@
 """Delegated client for the networks domain."""
 
-import json
+from collections.abc import Iterator
 from typing import Any, Literal, cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,14 +33,7 @@ class DelegatedNetworksClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/networks/fees",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.ESTIMATE_FEES, query_params=query)
         return cast(dict[str, Any], response)
 
     def call_function(self, network: str, body: T.CallFunctionRequest) -> dict[str, Any]:
@@ -58,14 +53,7 @@ class DelegatedNetworksClient:
               Returns:
                   dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/networks/{network}/call-function",
-            path_params={"network": network},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.CALL_FUNCTION, network, body=body)
         return cast(dict[str, Any], response)
 
     def get_canton_validator(
@@ -83,14 +71,7 @@ class DelegatedNetworksClient:
         Returns:
             T.GetCantonValidatorResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/networks/{network}/validators/{validatorId}",
-            path_params={"network": network, "validatorId": validator_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_CANTON_VALIDATOR, network, validator_id)
         return cast(T.GetCantonValidatorResponse, response)
 
     def update_canton_validator_init(
@@ -98,7 +79,7 @@ class DelegatedNetworksClient:
         network: Literal["canton", "canton-devnet", "canton-testnet"],
         validator_id: str,
         body: T.UpdateCantonValidatorRequest,
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Update Canton Validator.
 
@@ -110,18 +91,10 @@ class DelegatedNetworksClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/networks/{network}/validators/{validatorId}"
-        path = path.replace("{network}", str(network))
-        path = path.replace("{validatorId}", str(validator_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_CANTON_VALIDATOR, E.UPDATE_CANTON_VALIDATOR.resolve(network, validator_id), body
         )
 
     def update_canton_validator_complete(
@@ -130,6 +103,7 @@ class DelegatedNetworksClient:
         validator_id: str,
         body: T.UpdateCantonValidatorRequest,
         signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UpdateCantonValidatorResponse:
         """
         Complete Update Canton Validator.
@@ -141,26 +115,30 @@ class DelegatedNetworksClient:
             validator_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_canton_validator_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UpdateCantonValidatorResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_CANTON_VALIDATOR.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/networks/{network}/validators/{validatorId}",
-            path_params={"network": network, "validatorId": validator_id},
-            query_params=None,
+        response = self._http.call_with_user_action(
+            E.UPDATE_CANTON_VALIDATOR,
+            network,
+            validator_id,
             body=body,
             user_action=user_action_token,
+            prepared=prepared,
         )
         return cast(T.UpdateCantonValidatorResponse, response)
 
     def delete_canton_validator_init(
         self, network: Literal["canton", "canton-devnet", "canton-testnet"], validator_id: str
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Delete Canton Validator.
 
@@ -171,18 +149,10 @@ class DelegatedNetworksClient:
             validator_id: Path parameter.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/networks/{network}/validators/{validatorId}"
-        path = path.replace("{network}", str(network))
-        path = path.replace("{validatorId}", str(validator_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_CANTON_VALIDATOR, E.DELETE_CANTON_VALIDATOR.resolve(network, validator_id)
         )
 
     def delete_canton_validator_complete(
@@ -190,6 +160,7 @@ class DelegatedNetworksClient:
         network: Literal["canton", "canton-devnet", "canton-testnet"],
         validator_id: str,
         signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.DeleteCantonValidatorResponse:
         """
         Complete Delete Canton Validator.
@@ -200,20 +171,19 @@ class DelegatedNetworksClient:
             network: Path parameter.
             validator_id: Path parameter.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_canton_validator_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeleteCantonValidatorResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_CANTON_VALIDATOR.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/networks/{network}/validators/{validatorId}",
-            path_params={"network": network, "validatorId": validator_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELETE_CANTON_VALIDATOR, network, validator_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeleteCantonValidatorResponse, response)
 
@@ -234,19 +204,33 @@ class DelegatedNetworksClient:
         Returns:
             T.ListCantonValidatorsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/networks/{network}/validators",
-            path_params={"network": network},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_CANTON_VALIDATORS, network, query_params=query)
         return cast(T.ListCantonValidatorsResponse, response)
 
+    def iter_canton_validators(
+        self,
+        network: Literal["canton", "canton-devnet", "canton-testnet"],
+        query: T.ListCantonValidatorsQuery | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[T.ListCantonValidatorsItem]:
+        """
+        Iterate over List Canton Validators.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            network: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListCantonValidatorsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_canton_validators(network, q), query, page_size)
+
     def create_canton_validator_init(
         self, network: Literal["canton", "canton-devnet", "canton-testnet"], body: dict[str, Any]
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Create Canton Validator.
 
@@ -257,17 +241,10 @@ class DelegatedNetworksClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/networks/{network}/validators"
-        path = path.replace("{network}", str(network))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_CANTON_VALIDATOR, E.CREATE_CANTON_VALIDATOR.resolve(network), body
         )
 
     def create_canton_validator_complete(
@@ -275,6 +252,7 @@ class DelegatedNetworksClient:
         network: Literal["canton", "canton-devnet", "canton-testnet"],
         body: dict[str, Any],
         signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateCantonValidatorResponse:
         """
         Complete Create Canton Validator.
@@ -285,19 +263,18 @@ class DelegatedNetworksClient:
             network: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_canton_validator_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateCantonValidatorResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_CANTON_VALIDATOR.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/networks/{network}/validators",
-            path_params={"network": network},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_CANTON_VALIDATOR, network, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateCantonValidatorResponse, response)
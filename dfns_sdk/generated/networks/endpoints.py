@@ -0,0 +1,39 @@
+"""Endpoint registry for the networks domain."""
+
+from ..._internal.endpoint import Endpoint
+
+ESTIMATE_FEES = Endpoint("networks.estimate_fees", "GET", "/networks/fees")
+CALL_FUNCTION = Endpoint("networks.call_function", "POST", "/networks/{network}/call-function")
+GET_CANTON_VALIDATOR = Endpoint(
+    "networks.get_canton_validator",
+    "GET",
+    "/networks/{network}/validators/{validatorId}",
+    response_type="GetCantonValidatorResponse",
+)
+UPDATE_CANTON_VALIDATOR = Endpoint(
+    "networks.update_canton_validator",
+    "PUT",
+    "/networks/{network}/validators/{validatorId}",
+    requires_signature=True,
+    response_type="UpdateCantonValidatorResponse",
+)
+DELETE_CANTON_VALIDATOR = Endpoint(
+    "networks.delete_canton_validator",
+    "DELETE",
+    "/networks/{network}/validators/{validatorId}",
+    requires_signature=True,
+    response_type="DeleteCantonValidatorResponse",
+)
+LIST_CANTON_VALIDATORS = Endpoint(
+    "networks.list_canton_validators",
+    "GET",
+    "/networks/{network}/validators",
+    response_type="ListCantonValidatorsResponse",
+)
+CREATE_CANTON_VALIDATOR = Endpoint(
+    "networks.create_canton_validator",
+    "POST",
+    "/networks/{network}/validators",
+    requires_signature=True,
+    response_type="CreateCantonValidatorResponse",
+)
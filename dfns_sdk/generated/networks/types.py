@@ -127,10 +127,14 @@ class DeleteCantonValidatorResponse(TypedDict, total=False):
     party_hint: str
 
 
+ListCantonValidatorsItem = dict[str, Any]
+"""Item of a listCantonValidators page."""
+
+
 class ListCantonValidatorsResponse(TypedDict, total=False):
     """listCantonValidators response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListCantonValidatorsItem]
     next_page_token: NotRequired[str]
 
 
@@ -1,7 +1,30 @@
 """Payins domain module."""
 
-from . import types
-from .client import PayinsClient
-from .delegated_client import DelegatedPayinsClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["PayinsClient", "DelegatedPayinsClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncPayinsClient
+    from .async_delegated_client import AsyncDelegatedPayinsClient
+    from .client import PayinsClient
+    from .delegated_client import DelegatedPayinsClient
+
+_EXPORTS = {
+    "PayinsClient": ".client",
+    "DelegatedPayinsClient": ".delegated_client",
+    "AsyncPayinsClient": ".async_client",
+    "AsyncDelegatedPayinsClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["PayinsClient", "DelegatedPayinsClient", "AsyncPayinsClient", "AsyncDelegatedPayinsClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,126 @@
+"""Async client for the payins domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncPayinsClient:
+    """Async client for payins operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_payins(self, query: T.ListPayinsQuery | None = None) -> T.ListPayinsResponse:
+        """
+        List Payins.
+
+        List payins with optional filtering and pagination.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListPayinsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PAYINS, query_params=query)
+        return cast(T.ListPayinsResponse, response)
+
+    def aiter_payins(
+        self, query: T.ListPayinsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListPayinsItem]:
+        """
+        Iterate over List Payins.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListPayinsItem]: The items of every page.
+        """
+        return aiter_items(self.list_payins, query, page_size)
+
+    async def create_payin(self, body: dict[str, Any]) -> dict[str, Any]:
+        """
+        Create Payin.
+
+        Deliver stablecoin from the organisation's provider balance to a wallet on-chain.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_PAYIN, body=body)
+        return cast(dict[str, Any], response)
+
+    async def get_payin_recipient(self, query: T.GetPayinRecipientQuery) -> T.GetPayinRecipientResponse:
+        """
+        Get Payin Recipient.
+
+        Check whether a wallet's address is registered (and approved) as an payin recipient with the provider.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.GetPayinRecipientResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_PAYIN_RECIPIENT, query_params=query)
+        return cast(T.GetPayinRecipientResponse, response)
+
+    async def register_payin_recipient(self, body: dict[str, Any]) -> T.RegisterPayinRecipientResponse:
+        """
+            Register Payin Recipient.
+
+            Register a wallet's address as an payin recipient with the provider. The registration then needs
+        to be approved on the provider's side (for Circle Mint: by an administrator in the Mint Console)
+        before payins to that wallet can be created.
+
+            Args:
+                body: Request body.
+
+            Returns:
+                T.RegisterPayinRecipientResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.REGISTER_PAYIN_RECIPIENT, body=body)
+        return cast(T.RegisterPayinRecipientResponse, response)
+
+    async def get_payin_status(self, payin_id: str) -> dict[str, Any]:
+        """
+        Get Payin Status.
+
+        Retrieve the current status of an payin by its ID.
+
+        Args:
+            payin_id: Payin id.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_PAYIN_STATUS, payin_id)
+        return cast(dict[str, Any], response)
+
+    async def list_payin_balances(self, query: T.ListPayinBalancesQuery) -> T.ListPayinBalancesResponse:
+        """
+            List Payin Balances.
+
+            The organisation's available balance at the payin provider, one entry per currency —
+        the funds payins can deliver on-chain.
+
+            Args:
+                query: Query parameters.
+
+            Returns:
+                T.ListPayinBalancesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PAYIN_BALANCES, query_params=query)
+        return cast(T.ListPayinBalancesResponse, response)
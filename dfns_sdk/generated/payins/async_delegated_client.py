@@ -0,0 +1,190 @@
+"""Async delegated client for the payins domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedPayinsClient:
+    """
+    Async delegated client for payins operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_payins(self, query: T.ListPayinsQuery | None = None) -> T.ListPayinsResponse:
+        """
+        List Payins.
+
+        List payins with optional filtering and pagination.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListPayinsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PAYINS, query_params=query)
+        return cast(T.ListPayinsResponse, response)
+
+    def aiter_payins(
+        self, query: T.ListPayinsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListPayinsItem]:
+        """
+        Iterate over List Payins.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListPayinsItem]: The items of every page.
+        """
+        return aiter_items(self.list_payins, query, page_size)
+
+    async def create_payin_init(self, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Create Payin.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.CREATE_PAYIN, E.CREATE_PAYIN.path, body)
+
+    async def create_payin_complete(
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> dict[str, Any]:
+        """
+        Complete Create Payin.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_payin_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PAYIN.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_PAYIN, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(dict[str, Any], response)
+
+    async def get_payin_recipient(self, query: T.GetPayinRecipientQuery) -> T.GetPayinRecipientResponse:
+        """
+        Get Payin Recipient.
+
+        Check whether a wallet's address is registered (and approved) as an payin recipient with the provider.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.GetPayinRecipientResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_PAYIN_RECIPIENT, query_params=query)
+        return cast(T.GetPayinRecipientResponse, response)
+
+    async def register_payin_recipient_init(self, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Register Payin Recipient.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.REGISTER_PAYIN_RECIPIENT, E.REGISTER_PAYIN_RECIPIENT.path, body
+        )
+
+    async def register_payin_recipient_complete(
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.RegisterPayinRecipientResponse:
+        """
+        Complete Register Payin Recipient.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of register_payin_recipient_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.RegisterPayinRecipientResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.REGISTER_PAYIN_RECIPIENT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.REGISTER_PAYIN_RECIPIENT, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.RegisterPayinRecipientResponse, response)
+
+    async def get_payin_status(self, payin_id: str) -> dict[str, Any]:
+        """
+        Get Payin Status.
+
+        Retrieve the current status of an payin by its ID.
+
+        Args:
+            payin_id: Payin id.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_PAYIN_STATUS, payin_id)
+        return cast(dict[str, Any], response)
+
+    async def list_payin_balances(self, query: T.ListPayinBalancesQuery) -> T.ListPayinBalancesResponse:
+        """
+            List Payin Balances.
+
+            The organisation's available balance at the payin provider, one entry per currency —
+        the funds payins can deliver on-chain.
+
+            Args:
+                query: Query parameters.
+
+            Returns:
+                T.ListPayinBalancesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PAYIN_BALANCES, query_params=query)
+        return cast(T.ListPayinBalancesResponse, response)
@@ -1,8 +1,11 @@
 """Client for the payins domain."""
 
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,16 +27,26 @@ class PayinsClient:
         Returns:
             T.ListPayinsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payins",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PAYINS, query_params=query)
         return cast(T.ListPayinsResponse, response)
 
+    def iter_payins(
+        self, query: T.ListPayinsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListPayinsItem]:
+        """
+        Iterate over List Payins.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListPayinsItem]: The items of every page.
+        """
+        return iter_items(self.list_payins, query, page_size)
+
     def create_payin(self, body: dict[str, Any]) -> dict[str, Any]:
         """
         Create Payin.
@@ -46,14 +59,7 @@ class PayinsClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/payins",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_PAYIN, body=body)
         return cast(dict[str, Any], response)
 
     def get_payin_recipient(self, query: T.GetPayinRecipientQuery) -> T.GetPayinRecipientResponse:
@@ -68,14 +74,7 @@ class PayinsClient:
         Returns:
             T.GetPayinRecipientResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payins/recipients",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_PAYIN_RECIPIENT, query_params=query)
         return cast(T.GetPayinRecipientResponse, response)
 
     def register_payin_recipient(self, body: dict[str, Any]) -> T.RegisterPayinRecipientResponse:
@@ -92,14 +91,7 @@ class PayinsClient:
             Returns:
                 T.RegisterPayinRecipientResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/payins/recipients",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.REGISTER_PAYIN_RECIPIENT, body=body)
         return cast(T.RegisterPayinRecipientResponse, response)
 
     def get_payin_status(self, payin_id: str) -> dict[str, Any]:
@@ -114,14 +106,7 @@ class PayinsClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payins/{payinId}",
-            path_params={"payinId": payin_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_PAYIN_STATUS, payin_id)
         return cast(dict[str, Any], response)
 
     def list_payin_balances(self, query: T.ListPayinBalancesQuery) -> T.ListPayinBalancesResponse:
@@ -137,12 +122,5 @@ class PayinsClient:
             Returns:
                 T.ListPayinBalancesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payins/balances",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PAYIN_BALANCES, query_params=query)
         return cast(T.ListPayinBalancesResponse, response)
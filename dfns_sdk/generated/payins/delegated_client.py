@@ -1,10 +1,12 @@
 """Delegated client for the payins domain."""
 
-import json
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,27 @@ class DelegatedPayinsClient:
         Returns:
             T.ListPayinsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payins",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PAYINS, query_params=query)
         return cast(T.ListPayinsResponse, response)
 
-    def create_payin_init(self, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def iter_payins(
+        self, query: T.ListPayinsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListPayinsItem]:
+        """
+        Iterate over List Payins.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListPayinsItem]: The items of every page.
+        """
+        return iter_items(self.list_payins, query, page_size)
+
+    def create_payin_init(self, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Create Payin.
 
@@ -51,20 +63,15 @@ class DelegatedPayinsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/payins"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_PAYIN, E.CREATE_PAYIN.path, body)
 
     def create_payin_complete(
-        self, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> dict[str, Any]:
         """
         Complete Create Payin.
@@ -74,20 +81,19 @@ class DelegatedPayinsClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_payin_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PAYIN.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/payins",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_PAYIN, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(dict[str, Any], response)
 
@@ -103,17 +109,10 @@ class DelegatedPayinsClient:
         Returns:
             T.GetPayinRecipientResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payins/recipients",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_PAYIN_RECIPIENT, query_params=query)
         return cast(T.GetPayinRecipientResponse, response)
 
-    def register_payin_recipient_init(self, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def register_payin_recipient_init(self, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Register Payin Recipient.
 
@@ -123,20 +122,17 @@ class DelegatedPayinsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/payins/recipients"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.REGISTER_PAYIN_RECIPIENT, E.REGISTER_PAYIN_RECIPIENT.path, body
         )
 
     def register_payin_recipient_complete(
-        self, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.RegisterPayinRecipientResponse:
         """
         Complete Register Payin Recipient.
@@ -146,20 +142,19 @@ class DelegatedPayinsClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of register_payin_recipient_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.RegisterPayinRecipientResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.REGISTER_PAYIN_RECIPIENT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/payins/recipients",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.REGISTER_PAYIN_RECIPIENT, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.RegisterPayinRecipientResponse, response)
 
@@ -175,14 +170,7 @@ class DelegatedPayinsClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payins/{payinId}",
-            path_params={"payinId": payin_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_PAYIN_STATUS, payin_id)
         return cast(dict[str, Any], response)
 
     def list_payin_balances(self, query: T.ListPayinBalancesQuery) -> T.ListPayinBalancesResponse:
@@ -198,12 +186,5 @@ class DelegatedPayinsClient:
             Returns:
                 T.ListPayinBalancesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payins/balances",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PAYIN_BALANCES, query_params=query)
         return cast(T.ListPayinBalancesResponse, response)
@@ -0,0 +1,20 @@
+"""Endpoint registry for the payins domain."""
+
+from ..._internal.endpoint import Endpoint
+
+LIST_PAYINS = Endpoint("payins.list_payins", "GET", "/payins", response_type="ListPayinsResponse")
+CREATE_PAYIN = Endpoint("payins.create_payin", "POST", "/payins", requires_signature=True)
+GET_PAYIN_RECIPIENT = Endpoint(
+    "payins.get_payin_recipient", "GET", "/payins/recipients", response_type="GetPayinRecipientResponse"
+)
+REGISTER_PAYIN_RECIPIENT = Endpoint(
+    "payins.register_payin_recipient",
+    "POST",
+    "/payins/recipients",
+    requires_signature=True,
+    response_type="RegisterPayinRecipientResponse",
+)
+GET_PAYIN_STATUS = Endpoint("payins.get_payin_status", "GET", "/payins/{payinId}")
+LIST_PAYIN_BALANCES = Endpoint(
+    "payins.list_payin_balances", "GET", "/payins/balances", response_type="ListPayinBalancesResponse"
+)
@@ -4,11 +4,14 @@ from typing import Any, Literal, TypedDict
 
 from typing_extensions import NotRequired
 
+ListPayinsItem = dict[str, Any]
+"""Item of a listPayins page."""
+
 
 class ListPayinsResponse(TypedDict, total=False):
     """listPayins response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListPayinsItem]
     next_page_token: NotRequired[str]
 
 
@@ -1,7 +1,30 @@
 """Payouts domain module."""
 
-from . import types
-from .client import PayoutsClient
-from .delegated_client import DelegatedPayoutsClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["PayoutsClient", "DelegatedPayoutsClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncPayoutsClient
+    from .async_delegated_client import AsyncDelegatedPayoutsClient
+    from .client import PayoutsClient
+    from .delegated_client import DelegatedPayoutsClient
+
+_EXPORTS = {
+    "PayoutsClient": ".client",
+    "DelegatedPayoutsClient": ".delegated_client",
+    "AsyncPayoutsClient": ".async_client",
+    "AsyncDelegatedPayoutsClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["PayoutsClient", "DelegatedPayoutsClient", "AsyncPayoutsClient", "AsyncDelegatedPayoutsClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
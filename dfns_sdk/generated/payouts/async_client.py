@@ -0,0 +1,109 @@
+"""Async client for the payouts domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncPayoutsClient:
+    """Async client for payouts operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_payouts(self, query: T.ListPayoutsQuery | None = None) -> T.ListPayoutsResponse:
+        """
+        List Payouts.
+
+        List payouts with optional filtering and pagination.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListPayoutsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PAYOUTS, query_params=query)
+        return cast(T.ListPayoutsResponse, response)
+
+    def aiter_payouts(
+        self, query: T.ListPayoutsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListPayoutsItem]:
+        """
+        Iterate over List Payouts.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListPayoutsItem]: The items of every page.
+        """
+        return aiter_items(self.list_payouts, query, page_size)
+
+    async def create_payout(self, body: dict[str, Any]) -> dict[str, Any]:
+        """
+        Create Payout.
+
+        Create a new payout to convert crypto assets to fiat currency.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_PAYOUT, body=body)
+        return cast(dict[str, Any], response)
+
+    async def request_payout_quote(self, body: dict[str, Any]) -> T.RequestPayoutQuoteResponse:
+        """
+        Request Payout Quote.
+
+        Request a quote from a given provider for a payout. Returns estimated fiat amount and fees.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.RequestPayoutQuoteResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.REQUEST_PAYOUT_QUOTE, body=body)
+        return cast(T.RequestPayoutQuoteResponse, response)
+
+    async def get_payout_status(self, payout_id: str) -> dict[str, Any]:
+        """
+        Get Payout Status.
+
+        Retrieve the current status of a payout by its ID.
+
+        Args:
+            payout_id: Payout id.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_PAYOUT_STATUS, payout_id)
+        return cast(dict[str, Any], response)
+
+    async def create_payout_action(self, payout_id: str, body: dict[str, Any]) -> T.CreatePayoutActionResponse:
+        """
+        Create Payout Action.
+
+        Perform an action on a payout, such as confirming or canceling.
+
+        Args:
+            payout_id: Payout id.
+            body: Request body.
+
+        Returns:
+            T.CreatePayoutActionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_PAYOUT_ACTION, payout_id, body=body)
+        return cast(T.CreatePayoutActionResponse, response)
@@ -0,0 +1,177 @@
+"""Async delegated client for the payouts domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedPayoutsClient:
+    """
+    Async delegated client for payouts operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_payouts(self, query: T.ListPayoutsQuery | None = None) -> T.ListPayoutsResponse:
+        """
+        List Payouts.
+
+        List payouts with optional filtering and pagination.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListPayoutsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PAYOUTS, query_params=query)
+        return cast(T.ListPayoutsResponse, response)
+
+    def aiter_payouts(
+        self, query: T.ListPayoutsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListPayoutsItem]:
+        """
+        Iterate over List Payouts.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListPayoutsItem]: The items of every page.
+        """
+        return aiter_items(self.list_payouts, query, page_size)
+
+    async def create_payout_init(self, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Create Payout.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.CREATE_PAYOUT, E.CREATE_PAYOUT.path, body)
+
+    async def create_payout_complete(
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> dict[str, Any]:
+        """
+        Complete Create Payout.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_payout_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PAYOUT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_PAYOUT, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(dict[str, Any], response)
+
+    async def request_payout_quote(self, body: dict[str, Any]) -> T.RequestPayoutQuoteResponse:
+        """
+        Request Payout Quote.
+
+        Request a quote from a given provider for a payout. Returns estimated fiat amount and fees.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.RequestPayoutQuoteResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.REQUEST_PAYOUT_QUOTE, body=body)
+        return cast(T.RequestPayoutQuoteResponse, response)
+
+    async def get_payout_status(self, payout_id: str) -> dict[str, Any]:
+        """
+        Get Payout Status.
+
+        Retrieve the current status of a payout by its ID.
+
+        Args:
+            payout_id: Payout id.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_PAYOUT_STATUS, payout_id)
+        return cast(dict[str, Any], response)
+
+    async def create_payout_action_init(self, payout_id: str, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Create Payout Action.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            payout_id: Payout id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_PAYOUT_ACTION, E.CREATE_PAYOUT_ACTION.resolve(payout_id), body
+        )
+
+    async def create_payout_action_complete(
+        self,
+        payout_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreatePayoutActionResponse:
+        """
+        Complete Create Payout Action.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            payout_id: Payout id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_payout_action_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreatePayoutActionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PAYOUT_ACTION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_PAYOUT_ACTION, payout_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreatePayoutActionResponse, response)
@@ -1,8 +1,11 @@
 """Client for the payouts domain."""
 
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,16 +27,26 @@ class PayoutsClient:
         Returns:
             T.ListPayoutsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payouts",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PAYOUTS, query_params=query)
         return cast(T.ListPayoutsResponse, response)
 
+    def iter_payouts(
+        self, query: T.ListPayoutsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListPayoutsItem]:
+        """
+        Iterate over List Payouts.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListPayoutsItem]: The items of every page.
+        """
+        return iter_items(self.list_payouts, query, page_size)
+
     def create_payout(self, body: dict[str, Any]) -> dict[str, Any]:
         """
         Create Payout.
@@ -46,14 +59,7 @@ class PayoutsClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/payouts",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_PAYOUT, body=body)
         return cast(dict[str, Any], response)
 
     def request_payout_quote(self, body: dict[str, Any]) -> T.RequestPayoutQuoteResponse:
@@ -68,14 +74,7 @@ class PayoutsClient:
         Returns:
             T.RequestPayoutQuoteResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/payouts/quote",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.REQUEST_PAYOUT_QUOTE, body=body)
         return cast(T.RequestPayoutQuoteResponse, response)
 
     def get_payout_status(self, payout_id: str) -> dict[str, Any]:
@@ -90,14 +89,7 @@ class PayoutsClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payouts/{payoutId}",
-            path_params={"payoutId": payout_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_PAYOUT_STATUS, payout_id)
         return cast(dict[str, Any], response)
 
     def create_payout_action(self, payout_id: str, body: dict[str, Any]) -> T.CreatePayoutActionResponse:
@@ -113,12 +105,5 @@ class PayoutsClient:
         Returns:
             T.CreatePayoutActionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/payouts/{payoutId}/action",
-            path_params={"payoutId": payout_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_PAYOUT_ACTION, payout_id, body=body)
         return cast(T.CreatePayoutActionResponse, response)
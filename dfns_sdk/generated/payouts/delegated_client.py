@@ -1,10 +1,12 @@
 """Delegated client for the payouts domain."""
 
-import json
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,27 @@ class DelegatedPayoutsClient:
         Returns:
             T.ListPayoutsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payouts",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PAYOUTS, query_params=query)
         return cast(T.ListPayoutsResponse, response)
 
-    def create_payout_init(self, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def iter_payouts(
+        self, query: T.ListPayoutsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListPayoutsItem]:
+        """
+        Iterate over List Payouts.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListPayoutsItem]: The items of every page.
+        """
+        return iter_items(self.list_payouts, query, page_size)
+
+    def create_payout_init(self, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Create Payout.
 
@@ -51,20 +63,15 @@ class DelegatedPayoutsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/payouts"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_PAYOUT, E.CREATE_PAYOUT.path, body)
 
     def create_payout_complete(
-        self, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> dict[str, Any]:
         """
         Complete Create Payout.
@@ -74,20 +81,19 @@ class DelegatedPayoutsClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_payout_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PAYOUT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/payouts",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_PAYOUT, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(dict[str, Any], response)
 
@@ -103,14 +109,7 @@ class DelegatedPayoutsClient:
         Returns:
             T.RequestPayoutQuoteResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/payouts/quote",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.REQUEST_PAYOUT_QUOTE, body=body)
         return cast(T.RequestPayoutQuoteResponse, response)
 
     def get_payout_status(self, payout_id: str) -> dict[str, Any]:
@@ -125,17 +124,10 @@ class DelegatedPayoutsClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/payouts/{payoutId}",
-            path_params={"payoutId": payout_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_PAYOUT_STATUS, payout_id)
         return cast(dict[str, Any], response)
 
-    def create_payout_action_init(self, payout_id: str, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def create_payout_action_init(self, payout_id: str, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Create Payout Action.
 
@@ -146,21 +138,18 @@ class DelegatedPayoutsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/payouts/{payoutId}/action"
-        path = path.replace("{payoutId}", str(payout_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_PAYOUT_ACTION, E.CREATE_PAYOUT_ACTION.resolve(payout_id), body
         )
 
     def create_payout_action_complete(
-        self, payout_id: str, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        payout_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreatePayoutActionResponse:
         """
         Complete Create Payout Action.
@@ -171,19 +160,18 @@ class DelegatedPayoutsClient:
             payout_id: Payout id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_payout_action_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreatePayoutActionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PAYOUT_ACTION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/payouts/{payoutId}/action",
-            path_params={"payoutId": payout_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_PAYOUT_ACTION, payout_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreatePayoutActionResponse, response)
@@ -0,0 +1,17 @@
+"""Endpoint registry for the payouts domain."""
+
+from ..._internal.endpoint import Endpoint
+
+LIST_PAYOUTS = Endpoint("payouts.list_payouts", "GET", "/payouts", response_type="ListPayoutsResponse")
+CREATE_PAYOUT = Endpoint("payouts.create_payout", "POST", "/payouts", requires_signature=True)
+REQUEST_PAYOUT_QUOTE = Endpoint(
+    "payouts.request_payout_quote", "POST", "/payouts/quote", response_type="RequestPayoutQuoteResponse"
+)
+GET_PAYOUT_STATUS = Endpoint("payouts.get_payout_status", "GET", "/payouts/{payoutId}")
+CREATE_PAYOUT_ACTION = Endpoint(
+    "payouts.create_payout_action",
+    "POST",
+    "/payouts/{payoutId}/action",
+    requires_signature=True,
+    response_type="CreatePayoutActionResponse",
+)
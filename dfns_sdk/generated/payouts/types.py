@@ -4,11 +4,14 @@ from typing import Any, Literal, TypedDict
 
 from typing_extensions import NotRequired
 
+ListPayoutsItem = dict[str, Any]
+"""Item of a listPayouts page."""
+
 
 class ListPayoutsResponse(TypedDict, total=False):
     """listPayouts response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListPayoutsItem]
     next_page_token: NotRequired[str]
 
 
@@ -1,7 +1,36 @@
 """Permissions domain module."""
 
-from . import types
-from .client import PermissionsClient
-from .delegated_client import DelegatedPermissionsClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["PermissionsClient", "DelegatedPermissionsClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncPermissionsClient
+    from .async_delegated_client import AsyncDelegatedPermissionsClient
+    from .client import PermissionsClient
+    from .delegated_client import DelegatedPermissionsClient
+
+_EXPORTS = {
+    "PermissionsClient": ".client",
+    "DelegatedPermissionsClient": ".delegated_client",
+    "AsyncPermissionsClient": ".async_client",
+    "AsyncDelegatedPermissionsClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = [
+    "PermissionsClient",
+    "DelegatedPermissionsClient",
+    "AsyncPermissionsClient",
+    "AsyncDelegatedPermissionsClient",
+    "types",
+]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
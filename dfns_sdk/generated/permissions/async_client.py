@@ -0,0 +1,183 @@
+"""Async client for the permissions domain."""
+
+from collections.abc import AsyncIterator
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncPermissionsClient:
+    """Async client for permissions operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def archive_permission(
+        self, permission_id: str, body: T.ArchivePermissionRequest
+    ) -> T.ArchivePermissionResponse:
+        """
+        Archive Permission.
+
+        Archives or unarchives a permission (role). Archived permissions are effectively soft-deleted.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            body: Request body.
+
+        Returns:
+            T.ArchivePermissionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ARCHIVE_PERMISSION, permission_id, body=body)
+        return cast(T.ArchivePermissionResponse, response)
+
+    async def list_permission_assignments(
+        self, permission_id: str, query: T.ListPermissionAssignmentsQuery | None = None
+    ) -> T.ListPermissionAssignmentsResponse:
+        """
+        List Permission Assignments.
+
+        Lists all permission (role) assignments for a given permission.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            query: Query parameters.
+
+        Returns:
+            T.ListPermissionAssignmentsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PERMISSION_ASSIGNMENTS, permission_id, query_params=query)
+        return cast(T.ListPermissionAssignmentsResponse, response)
+
+    def aiter_permission_assignments(
+        self, permission_id: str, query: T.ListPermissionAssignmentsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListPermissionAssignmentsItem]:
+        """
+        Iterate over List Permission Assignments.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListPermissionAssignmentsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_permission_assignments(permission_id, q), query, page_size)
+
+    async def assign_permission(
+        self, permission_id: str, body: T.AssignPermissionRequest
+    ) -> T.AssignPermissionResponse:
+        """
+        Assign Permission.
+
+        Assigns a permission (role) to an identity (user, PAT or service account), granting it access to the operations defined in the permission. Returns the assignment on success (200), or a pending change request if approval is required (202).
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            body: Request body.
+
+        Returns:
+            T.AssignPermissionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ASSIGN_PERMISSION, permission_id, body=body)
+        return cast(T.AssignPermissionResponse, response)
+
+    async def list_permissions(self, query: T.ListPermissionsQuery | None = None) -> T.ListPermissionsResponse:
+        """
+        List Permissions.
+
+        Lists all permissions (roles) in the organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListPermissionsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PERMISSIONS, query_params=query)
+        return cast(T.ListPermissionsResponse, response)
+
+    def aiter_permissions(
+        self, query: T.ListPermissionsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListPermissionsItem]:
+        """
+        Iterate over List Permissions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListPermissionsItem]: The items of every page.
+        """
+        return aiter_items(self.list_permissions, query, page_size)
+
+    async def create_permission(self, body: T.CreatePermissionRequest) -> T.CreatePermissionResponse:
+        """
+        Create Permission.
+
+        Creates a new permission (also referred to as "role" in the dashboard) that grants access to the specified API operations.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreatePermissionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_PERMISSION, body=body)
+        return cast(T.CreatePermissionResponse, response)
+
+    async def revoke_permission(
+        self, permission_id: str, assignment_id: str, query: T.RevokePermissionQuery | None = None
+    ) -> None:
+        """
+        Revoke Permission.
+
+        Revokes a permission (role) assignment, removing the identity's access to the operations granted by the permission.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            assignment_id: ID of the permission assignment.
+            query: Query parameters.
+        """  # noqa: E501
+        await self._http.call(E.REVOKE_PERMISSION, permission_id, assignment_id, query_params=query)
+
+    async def get_permission(self, permission_id: str) -> T.GetPermissionResponse:
+        """
+        Get Permission.
+
+        Retrieves a permission (role) by ID, including any pending change request.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+
+        Returns:
+            T.GetPermissionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_PERMISSION, permission_id)
+        return cast(T.GetPermissionResponse, response)
+
+    async def update_permission(
+        self, permission_id: str, body: T.UpdatePermissionRequest
+    ) -> T.UpdatePermissionResponse:
+        """
+        Update Permission.
+
+        Updates the name or operations of an existing permission (role).
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            body: Request body.
+
+        Returns:
+            T.UpdatePermissionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UPDATE_PERMISSION, permission_id, body=body)
+        return cast(T.UpdatePermissionResponse, response)
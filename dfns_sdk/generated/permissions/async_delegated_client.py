@@ -0,0 +1,353 @@
+"""Async delegated client for the permissions domain."""
+
+from collections.abc import AsyncIterator
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedPermissionsClient:
+    """
+    Async delegated client for permissions operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def archive_permission_init(self, permission_id: str, body: T.ArchivePermissionRequest) -> PreparedAction:
+        """
+        Initialize Archive Permission.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.ARCHIVE_PERMISSION, E.ARCHIVE_PERMISSION.resolve(permission_id), body
+        )
+
+    async def archive_permission_complete(
+        self,
+        permission_id: str,
+        body: T.ArchivePermissionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.ArchivePermissionResponse:
+        """
+        Complete Archive Permission.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of archive_permission_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ArchivePermissionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ARCHIVE_PERMISSION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ARCHIVE_PERMISSION, permission_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ArchivePermissionResponse, response)
+
+    async def list_permission_assignments(
+        self, permission_id: str, query: T.ListPermissionAssignmentsQuery | None = None
+    ) -> T.ListPermissionAssignmentsResponse:
+        """
+        List Permission Assignments.
+
+        Lists all permission (role) assignments for a given permission.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            query: Query parameters.
+
+        Returns:
+            T.ListPermissionAssignmentsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PERMISSION_ASSIGNMENTS, permission_id, query_params=query)
+        return cast(T.ListPermissionAssignmentsResponse, response)
+
+    def aiter_permission_assignments(
+        self, permission_id: str, query: T.ListPermissionAssignmentsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListPermissionAssignmentsItem]:
+        """
+        Iterate over List Permission Assignments.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListPermissionAssignmentsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_permission_assignments(permission_id, q), query, page_size)
+
+    async def assign_permission_init(self, permission_id: str, body: T.AssignPermissionRequest) -> PreparedAction:
+        """
+        Initialize Assign Permission.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.ASSIGN_PERMISSION, E.ASSIGN_PERMISSION.resolve(permission_id), body
+        )
+
+    async def assign_permission_complete(
+        self,
+        permission_id: str,
+        body: T.AssignPermissionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.AssignPermissionResponse:
+        """
+        Complete Assign Permission.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of assign_permission_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.AssignPermissionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ASSIGN_PERMISSION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ASSIGN_PERMISSION, permission_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.AssignPermissionResponse, response)
+
+    async def list_permissions(self, query: T.ListPermissionsQuery | None = None) -> T.ListPermissionsResponse:
+        """
+        List Permissions.
+
+        Lists all permissions (roles) in the organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListPermissionsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_PERMISSIONS, query_params=query)
+        return cast(T.ListPermissionsResponse, response)
+
+    def aiter_permissions(
+        self, query: T.ListPermissionsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListPermissionsItem]:
+        """
+        Iterate over List Permissions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListPermissionsItem]: The items of every page.
+        """
+        return aiter_items(self.list_permissions, query, page_size)
+
+    async def create_permission_init(self, body: T.CreatePermissionRequest) -> PreparedAction:
+        """
+        Initialize Create Permission.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_PERMISSION, E.CREATE_PERMISSION.path, body
+        )
+
+    async def create_permission_complete(
+        self,
+        body: T.CreatePermissionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreatePermissionResponse:
+        """
+        Complete Create Permission.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_permission_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreatePermissionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PERMISSION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_PERMISSION, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreatePermissionResponse, response)
+
+    async def revoke_permission_init(
+        self, permission_id: str, assignment_id: str, query: T.RevokePermissionQuery | None = None
+    ) -> PreparedAction:
+        """
+        Initialize Revoke Permission.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            assignment_id: ID of the permission assignment.
+            query: Query parameters.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.REVOKE_PERMISSION, E.REVOKE_PERMISSION.resolve(permission_id, assignment_id)
+        )
+
+    async def revoke_permission_complete(
+        self,
+        permission_id: str,
+        assignment_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        query: T.RevokePermissionQuery | None = None,
+        prepared: PreparedAction | None = None,
+    ) -> None:
+        """
+        Complete Revoke Permission.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            assignment_id: ID of the permission assignment.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of revoke_permission_init(); its payload is sent as is instead of
+                encoding the body again.
+            query: Query parameters.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.REVOKE_PERMISSION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        await self._http.call_with_user_action(
+            E.REVOKE_PERMISSION,
+            permission_id,
+            assignment_id,
+            query_params=query,
+            user_action=user_action_token,
+            prepared=prepared,
+        )
+
+    async def get_permission(self, permission_id: str) -> T.GetPermissionResponse:
+        """
+        Get Permission.
+
+        Retrieves a permission (role) by ID, including any pending change request.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+
+        Returns:
+            T.GetPermissionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_PERMISSION, permission_id)
+        return cast(T.GetPermissionResponse, response)
+
+    async def update_permission_init(self, permission_id: str, body: T.UpdatePermissionRequest) -> PreparedAction:
+        """
+        Initialize Update Permission.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_PERMISSION, E.UPDATE_PERMISSION.resolve(permission_id), body
+        )
+
+    async def update_permission_complete(
+        self,
+        permission_id: str,
+        body: T.UpdatePermissionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UpdatePermissionResponse:
+        """
+        Complete Update Permission.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_permission_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UpdatePermissionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_PERMISSION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UPDATE_PERMISSION, permission_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.UpdatePermissionResponse, response)
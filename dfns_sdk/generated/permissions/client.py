@@ -1,8 +1,11 @@
 """Client for the permissions domain."""
 
+from collections.abc import Iterator
 from typing import cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -25,14 +28,7 @@ class PermissionsClient:
         Returns:
             T.ArchivePermissionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/permissions/{permissionId}/archive",
-            path_params={"permissionId": permission_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ARCHIVE_PERMISSION, permission_id, body=body)
         return cast(T.ArchivePermissionResponse, response)
 
     def list_permission_assignments(
@@ -50,16 +46,27 @@ class PermissionsClient:
         Returns:
             T.ListPermissionAssignmentsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/permissions/{permissionId}/assignments",
-            path_params={"permissionId": permission_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PERMISSION_ASSIGNMENTS, permission_id, query_params=query)
         return cast(T.ListPermissionAssignmentsResponse, response)
 
+    def iter_permission_assignments(
+        self, permission_id: str, query: T.ListPermissionAssignmentsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListPermissionAssignmentsItem]:
+        """
+        Iterate over List Permission Assignments.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListPermissionAssignmentsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_permission_assignments(permission_id, q), query, page_size)
+
     def assign_permission(self, permission_id: str, body: T.AssignPermissionRequest) -> T.AssignPermissionResponse:
         """
         Assign Permission.
@@ -73,14 +80,7 @@ class PermissionsClient:
         Returns:
             T.AssignPermissionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/permissions/{permissionId}/assignments",
-            path_params={"permissionId": permission_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ASSIGN_PERMISSION, permission_id, body=body)
         return cast(T.AssignPermissionResponse, response)
 
     def list_permissions(self, query: T.ListPermissionsQuery | None = None) -> T.ListPermissionsResponse:
@@ -95,16 +95,26 @@ class PermissionsClient:
         Returns:
             T.ListPermissionsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/permissions",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PERMISSIONS, query_params=query)
         return cast(T.ListPermissionsResponse, response)
 
+    def iter_permissions(
+        self, query: T.ListPermissionsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListPermissionsItem]:
+        """
+        Iterate over List Permissions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListPermissionsItem]: The items of every page.
+        """
+        return iter_items(self.list_permissions, query, page_size)
+
     def create_permission(self, body: T.CreatePermissionRequest) -> T.CreatePermissionResponse:
         """
         Create Permission.
@@ -117,14 +127,7 @@ class PermissionsClient:
         Returns:
             T.CreatePermissionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/permissions",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_PERMISSION, body=body)
         return cast(T.CreatePermissionResponse, response)
 
     def revoke_permission(
@@ -140,14 +143,7 @@ class PermissionsClient:
             assignment_id: ID of the permission assignment.
             query: Query parameters.
         """  # noqa: E501
-        self._http.request(
-            method="DELETE",
-            path="/permissions/{permissionId}/assignments/{assignmentId}",
-            path_params={"permissionId": permission_id, "assignmentId": assignment_id},
-            query_params=query,
-            body=None,
-            requires_signature=True,
-        )
+        self._http.call(E.REVOKE_PERMISSION, permission_id, assignment_id, query_params=query)
 
     def get_permission(self, permission_id: str) -> T.GetPermissionResponse:
         """
@@ -161,14 +157,7 @@ class PermissionsClient:
         Returns:
             T.GetPermissionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/permissions/{permissionId}",
-            path_params={"permissionId": permission_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_PERMISSION, permission_id)
         return cast(T.GetPermissionResponse, response)
 
     def update_permission(self, permission_id: str, body: T.UpdatePermissionRequest) -> T.UpdatePermissionResponse:
@@ -184,12 +173,5 @@ class PermissionsClient:
         Returns:
             T.UpdatePermissionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/permissions/{permissionId}",
-            path_params={"permissionId": permission_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UPDATE_PERMISSION, permission_id, body=body)
         return cast(T.UpdatePermissionResponse, response)
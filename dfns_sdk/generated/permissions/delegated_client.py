@@ -1,10 +1,12 @@
 """Delegated client for the permissions domain."""
 
-import json
+from collections.abc import Iterator
 from typing import cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -19,9 +21,7 @@ class DelegatedPermissionsClient:
     def __init__(self, http_client: HttpClient):
         self._http = http_client
 
-    def archive_permission_init(
-        self, permission_id: str, body: T.ArchivePermissionRequest
-    ) -> UserActionChallengeResponse:
+    def archive_permission_init(self, permission_id: str, body: T.ArchivePermissionRequest) -> PreparedAction:
         """
         Initialize Archive Permission.
 
@@ -32,21 +32,18 @@ class DelegatedPermissionsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/permissions/{permissionId}/archive"
-        path = path.replace("{permissionId}", str(permission_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.ARCHIVE_PERMISSION, E.ARCHIVE_PERMISSION.resolve(permission_id), body
         )
 
     def archive_permission_complete(
-        self, permission_id: str, body: T.ArchivePermissionRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        permission_id: str,
+        body: T.ArchivePermissionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.ArchivePermissionResponse:
         """
         Complete Archive Permission.
@@ -57,20 +54,19 @@ class DelegatedPermissionsClient:
             permission_id: ID of the permission (also referred to as "role" in the dashboard).
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of archive_permission_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ArchivePermissionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ARCHIVE_PERMISSION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/permissions/{permissionId}/archive",
-            path_params={"permissionId": permission_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ARCHIVE_PERMISSION, permission_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ArchivePermissionResponse, response)
 
@@ -89,19 +85,28 @@ class DelegatedPermissionsClient:
         Returns:
             T.ListPermissionAssignmentsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/permissions/{permissionId}/assignments",
-            path_params={"permissionId": permission_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PERMISSION_ASSIGNMENTS, permission_id, query_params=query)
         return cast(T.ListPermissionAssignmentsResponse, response)
 
-    def assign_permission_init(
-        self, permission_id: str, body: T.AssignPermissionRequest
-    ) -> UserActionChallengeResponse:
+    def iter_permission_assignments(
+        self, permission_id: str, query: T.ListPermissionAssignmentsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListPermissionAssignmentsItem]:
+        """
+        Iterate over List Permission Assignments.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            permission_id: ID of the permission (also referred to as "role" in the dashboard).
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListPermissionAssignmentsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_permission_assignments(permission_id, q), query, page_size)
+
+    def assign_permission_init(self, permission_id: str, body: T.AssignPermissionRequest) -> PreparedAction:
         """
         Initialize Assign Permission.
 
@@ -112,21 +117,18 @@ class DelegatedPermissionsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/permissions/{permissionId}/assignments"
-        path = path.replace("{permissionId}", str(permission_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.ASSIGN_PERMISSION, E.ASSIGN_PERMISSION.resolve(permission_id), body
         )
 
     def assign_permission_complete(
-        self, permission_id: str, body: T.AssignPermissionRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        permission_id: str,
+        body: T.AssignPermissionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.AssignPermissionResponse:
         """
         Complete Assign Permission.
@@ -137,20 +139,19 @@ class DelegatedPermissionsClient:
             permission_id: ID of the permission (also referred to as "role" in the dashboard).
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of assign_permission_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.AssignPermissionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ASSIGN_PERMISSION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/permissions/{permissionId}/assignments",
-            path_params={"permissionId": permission_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ASSIGN_PERMISSION, permission_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.AssignPermissionResponse, response)
 
@@ -166,17 +167,27 @@ class DelegatedPermissionsClient:
         Returns:
             T.ListPermissionsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/permissions",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_PERMISSIONS, query_params=query)
         return cast(T.ListPermissionsResponse, response)
 
-    def create_permission_init(self, body: T.CreatePermissionRequest) -> UserActionChallengeResponse:
+    def iter_permissions(
+        self, query: T.ListPermissionsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListPermissionsItem]:
+        """
+        Iterate over List Permissions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListPermissionsItem]: The items of every page.
+        """
+        return iter_items(self.list_permissions, query, page_size)
+
+    def create_permission_init(self, body: T.CreatePermissionRequest) -> PreparedAction:
         """
         Initialize Create Permission.
 
@@ -186,20 +197,15 @@ class DelegatedPermissionsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/permissions"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_PERMISSION, E.CREATE_PERMISSION.path, body)
 
     def create_permission_complete(
-        self, body: T.CreatePermissionRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreatePermissionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreatePermissionResponse:
         """
         Complete Create Permission.
@@ -209,26 +215,25 @@ class DelegatedPermissionsClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_permission_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreatePermissionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PERMISSION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/permissions",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_PERMISSION, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreatePermissionResponse, response)
 
     def revoke_permission_init(
         self, permission_id: str, assignment_id: str, query: T.RevokePermissionQuery | None = None
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Revoke Permission.
 
@@ -240,18 +245,10 @@ class DelegatedPermissionsClient:
             query: Query parameters.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/permissions/{permissionId}/assignments/{assignmentId}"
-        path = path.replace("{permissionId}", str(permission_id))
-        path = path.replace("{assignmentId}", str(assignment_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.REVOKE_PERMISSION, E.REVOKE_PERMISSION.resolve(permission_id, assignment_id)
         )
 
     def revoke_permission_complete(
@@ -260,6 +257,7 @@ class DelegatedPermissionsClient:
         assignment_id: str,
         signed_challenge: SignUserActionChallengeRequest,
         query: T.RevokePermissionQuery | None = None,
+        prepared: PreparedAction | None = None,
     ) -> None:
         """
         Complete Revoke Permission.
@@ -270,18 +268,22 @@ class DelegatedPermissionsClient:
             permission_id: ID of the permission (also referred to as "role" in the dashboard).
             assignment_id: ID of the permission assignment.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of revoke_permission_init(); its payload is sent as is instead of
+                encoding the body again.
             query: Query parameters.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.REVOKE_PERMISSION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        self._http.request_with_user_action(
-            method="DELETE",
-            path="/permissions/{permissionId}/assignments/{assignmentId}",
-            path_params={"permissionId": permission_id, "assignmentId": assignment_id},
+        self._http.call_with_user_action(
+            E.REVOKE_PERMISSION,
+            permission_id,
+            assignment_id,
             query_params=query,
-            body=None,
             user_action=user_action_token,
+            prepared=prepared,
         )
 
     def get_permission(self, permission_id: str) -> T.GetPermissionResponse:
@@ -296,19 +298,10 @@ class DelegatedPermissionsClient:
         Returns:
             T.GetPermissionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/permissions/{permissionId}",
-            path_params={"permissionId": permission_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_PERMISSION, permission_id)
         return cast(T.GetPermissionResponse, response)
 
-    def update_permission_init(
-        self, permission_id: str, body: T.UpdatePermissionRequest
-    ) -> UserActionChallengeResponse:
+    def update_permission_init(self, permission_id: str, body: T.UpdatePermissionRequest) -> PreparedAction:
         """
         Initialize Update Permission.
 
@@ -319,21 +312,18 @@ class DelegatedPermissionsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/permissions/{permissionId}"
-        path = path.replace("{permissionId}", str(permission_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_PERMISSION, E.UPDATE_PERMISSION.resolve(permission_id), body
         )
 
     def update_permission_complete(
-        self, permission_id: str, body: T.UpdatePermissionRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        permission_id: str,
+        body: T.UpdatePermissionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UpdatePermissionResponse:
         """
         Complete Update Permission.
@@ -344,19 +334,18 @@ class DelegatedPermissionsClient:
             permission_id: ID of the permission (also referred to as "role" in the dashboard).
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_permission_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UpdatePermissionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_PERMISSION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/permissions/{permissionId}",
-            path_params={"permissionId": permission_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UPDATE_PERMISSION, permission_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.UpdatePermissionResponse, response)
@@ -0,0 +1,50 @@
+"""Endpoint registry for the permissions domain."""
+
+from ..._internal.endpoint import Endpoint
+
+ARCHIVE_PERMISSION = Endpoint(
+    "permissions.archive_permission",
+    "PUT",
+    "/permissions/{permissionId}/archive",
+    requires_signature=True,
+    response_type="ArchivePermissionResponse",
+)
+LIST_PERMISSION_ASSIGNMENTS = Endpoint(
+    "permissions.list_permission_assignments",
+    "GET",
+    "/permissions/{permissionId}/assignments",
+    response_type="ListPermissionAssignmentsResponse",
+)
+ASSIGN_PERMISSION = Endpoint(
+    "permissions.assign_permission",
+    "POST",
+    "/permissions/{permissionId}/assignments",
+    requires_signature=True,
+    response_type="AssignPermissionResponse",
+)
+LIST_PERMISSIONS = Endpoint(
+    "permissions.list_permissions", "GET", "/permissions", response_type="ListPermissionsResponse"
+)
+CREATE_PERMISSION = Endpoint(
+    "permissions.create_permission",
+    "POST",
+    "/permissions",
+    requires_signature=True,
+    response_type="CreatePermissionResponse",
+)
+REVOKE_PERMISSION = Endpoint(
+    "permissions.revoke_permission",
+    "DELETE",
+    "/permissions/{permissionId}/assignments/{assignmentId}",
+    requires_signature=True,
+)
+GET_PERMISSION = Endpoint(
+    "permissions.get_permission", "GET", "/permissions/{permissionId}", response_type="GetPermissionResponse"
+)
+UPDATE_PERMISSION = Endpoint(
+    "permissions.update_permission",
+    "PUT",
+    "/permissions/{permissionId}",
+    requires_signature=True,
+    response_type="UpdatePermissionResponse",
+)
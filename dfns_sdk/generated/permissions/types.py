@@ -24,10 +24,14 @@ class ArchivePermissionResponse(TypedDict, total=False):
     date_updated: str
 
 
+ListPermissionAssignmentsItem = dict[str, Any]
+"""Item of a listPermissionAssignments page."""
+
+
 class ListPermissionAssignmentsResponse(TypedDict, total=False):
     """listPermissionAssignments response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListPermissionAssignmentsItem]
     next_page_token: NotRequired[str]
 
 
@@ -55,10 +59,14 @@ class AssignPermissionResponse(TypedDict, total=False):
     date_updated: str
 
 
+ListPermissionsItem = dict[str, Any]
+"""Item of a listPermissions page."""
+
+
 class ListPermissionsResponse(TypedDict, total=False):
     """listPermissions response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListPermissionsItem]
     next_page_token: NotRequired[str]
 
 
@@ -1,7 +1,30 @@
 """Policies domain module."""
 
-from . import types
-from .client import PoliciesClient
-from .delegated_client import DelegatedPoliciesClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["PoliciesClient", "DelegatedPoliciesClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncPoliciesClient
+    from .async_delegated_client import AsyncDelegatedPoliciesClient
+    from .client import PoliciesClient
+    from .delegated_client import DelegatedPoliciesClient
+
+_EXPORTS = {
+    "PoliciesClient": ".client",
+    "DelegatedPoliciesClient": ".delegated_client",
+    "AsyncPoliciesClient": ".async_client",
+    "AsyncDelegatedPoliciesClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["PoliciesClient", "DelegatedPoliciesClient", "AsyncPoliciesClient", "AsyncDelegatedPoliciesClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
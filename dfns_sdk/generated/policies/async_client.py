@@ -0,0 +1,178 @@
+"""Async client for the policies domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncPoliciesClient:
+    """Async client for policies operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def get_policy(self, policy_id: str) -> T.GetPolicyResponse:
+        """
+        Get Policy.
+
+        Retrieve information about a specific policy.
+
+        Args:
+            policy_id: Path parameter.
+
+        Returns:
+            T.GetPolicyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_POLICY, policy_id)
+        return cast(T.GetPolicyResponse, response)
+
+    async def update_policy(self, policy_id: str, body: dict[str, Any]) -> dict[str, Any]:
+        """
+        Update Policy.
+
+        Update an existing policy.
+
+        Args:
+            policy_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UPDATE_POLICY, policy_id, body=body)
+        return cast(dict[str, Any], response)
+
+    async def delete_policy(self, policy_id: str) -> dict[str, Any]:
+        """
+        Delete Policy.
+
+        Delete an existing policy.
+
+        Args:
+            policy_id: Path parameter.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_POLICY, policy_id)
+        return cast(dict[str, Any], response)
+
+    async def create_approval_decision(
+        self, approval_id: str, body: T.CreateApprovalDecisionRequest
+    ) -> T.CreateApprovalDecisionResponse:
+        """
+        Create Approval Decision.
+
+        Approve or Reject an Approval request.
+
+        Args:
+            approval_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            T.CreateApprovalDecisionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_APPROVAL_DECISION, approval_id, body=body)
+        return cast(T.CreateApprovalDecisionResponse, response)
+
+    async def list_policies(self, query: T.ListPoliciesQuery | None = None) -> T.ListPoliciesResponse:
+        """
+        List Policies.
+
+        Retrieve the list of policies on your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListPoliciesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_POLICIES, query_params=query)
+        return cast(T.ListPoliciesResponse, response)
+
+    def aiter_policies(
+        self, query: T.ListPoliciesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListPoliciesItem]:
+        """
+        Iterate over List Policies.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListPoliciesItem]: The items of every page.
+        """
+        return aiter_items(self.list_policies, query, page_size)
+
+    async def create_policy(self, body: dict[str, Any]) -> dict[str, Any]:
+        """
+              Create Policy.
+
+              Setup a new Policy for your organization.
+
+        Every policy requires a rule to be specified. Upon policy evaluation, the configuration specified in the rule will be used to determine whether the policy should trigger or not for a given activity.
+
+        By exposing controls on permissions and policies, Dfns enables the specification of an admin quorum to approve sensitive actions which could change system governance.   Note Dfns does not expose a separate "admin quorum" concept like some of our competitors - we simply enable this use case as another configuration of the policy engine itself.   This was chosen to promote flexibility as not every customer will have the same requirements around creating and managing admin quorums.
+
+              Args:
+                  body: Request body.
+
+              Returns:
+                  dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_POLICY, body=body)
+        return cast(dict[str, Any], response)
+
+    async def get_approval(self, approval_id: str) -> T.GetApprovalResponse:
+        """
+        Get Approval.
+
+        Retrieve information about a specific approval request.
+
+        Args:
+            approval_id: Path parameter.
+
+        Returns:
+            T.GetApprovalResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_APPROVAL, approval_id)
+        return cast(T.GetApprovalResponse, response)
+
+    async def list_approvals(self, query: T.ListApprovalsQuery | None = None) -> T.ListApprovalsResponse:
+        """
+        List Approvals.
+
+        Retrieve the list of pending approval requests.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListApprovalsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_APPROVALS, query_params=query)
+        return cast(T.ListApprovalsResponse, response)
+
+    def aiter_approvals(
+        self, query: T.ListApprovalsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListApprovalsItem]:
+        """
+        Iterate over List Approvals.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListApprovalsItem]: The items of every page.
+        """
+        return aiter_items(self.list_approvals, query, page_size)
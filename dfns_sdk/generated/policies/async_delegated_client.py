@@ -0,0 +1,303 @@
+"""Async delegated client for the policies domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedPoliciesClient:
+    """
+    Async delegated client for policies operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def get_policy(self, policy_id: str) -> T.GetPolicyResponse:
+        """
+        Get Policy.
+
+        Retrieve information about a specific policy.
+
+        Args:
+            policy_id: Path parameter.
+
+        Returns:
+            T.GetPolicyResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_POLICY, policy_id)
+        return cast(T.GetPolicyResponse, response)
+
+    async def update_policy_init(self, policy_id: str, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Update Policy.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            policy_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_POLICY, E.UPDATE_POLICY.resolve(policy_id), body
+        )
+
+    async def update_policy_complete(
+        self,
+        policy_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> dict[str, Any]:
+        """
+        Complete Update Policy.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            policy_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_policy_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_POLICY.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UPDATE_POLICY, policy_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(dict[str, Any], response)
+
+    async def delete_policy_init(self, policy_id: str) -> PreparedAction:
+        """
+        Initialize Delete Policy.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            policy_id: Path parameter.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_POLICY, E.DELETE_POLICY.resolve(policy_id)
+        )
+
+    async def delete_policy_complete(
+        self, policy_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> dict[str, Any]:
+        """
+        Complete Delete Policy.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            policy_id: Path parameter.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_policy_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_POLICY.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_POLICY, policy_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(dict[str, Any], response)
+
+    async def create_approval_decision_init(
+        self, approval_id: str, body: T.CreateApprovalDecisionRequest
+    ) -> PreparedAction:
+        """
+        Initialize Create Approval Decision.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            approval_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_APPROVAL_DECISION, E.CREATE_APPROVAL_DECISION.resolve(approval_id), body
+        )
+
+    async def create_approval_decision_complete(
+        self,
+        approval_id: str,
+        body: T.CreateApprovalDecisionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateApprovalDecisionResponse:
+        """
+        Complete Create Approval Decision.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            approval_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_approval_decision_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateApprovalDecisionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_APPROVAL_DECISION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_APPROVAL_DECISION, approval_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateApprovalDecisionResponse, response)
+
+    async def list_policies(self, query: T.ListPoliciesQuery | None = None) -> T.ListPoliciesResponse:
+        """
+        List Policies.
+
+        Retrieve the list of policies on your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListPoliciesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_POLICIES, query_params=query)
+        return cast(T.ListPoliciesResponse, response)
+
+    def aiter_policies(
+        self, query: T.ListPoliciesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListPoliciesItem]:
+        """
+        Iterate over List Policies.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListPoliciesItem]: The items of every page.
+        """
+        return aiter_items(self.list_policies, query, page_size)
+
+    async def create_policy_init(self, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Create Policy.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.CREATE_POLICY, E.CREATE_POLICY.path, body)
+
+    async def create_policy_complete(
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> dict[str, Any]:
+        """
+        Complete Create Policy.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_policy_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_POLICY.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_POLICY, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(dict[str, Any], response)
+
+    async def get_approval(self, approval_id: str) -> T.GetApprovalResponse:
+        """
+        Get Approval.
+
+        Retrieve information about a specific approval request.
+
+        Args:
+            approval_id: Path parameter.
+
+        Returns:
+            T.GetApprovalResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_APPROVAL, approval_id)
+        return cast(T.GetApprovalResponse, response)
+
+    async def list_approvals(self, query: T.ListApprovalsQuery | None = None) -> T.ListApprovalsResponse:
+        """
+        List Approvals.
+
+        Retrieve the list of pending approval requests.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListApprovalsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_APPROVALS, query_params=query)
+        return cast(T.ListApprovalsResponse, response)
+
+    def aiter_approvals(
+        self, query: T.ListApprovalsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListApprovalsItem]:
+        """
+        Iterate over List Approvals.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListApprovalsItem]: The items of every page.
+        """
+        return aiter_items(self.list_approvals, query, page_size)
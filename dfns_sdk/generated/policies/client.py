@@ -1,8 +1,11 @@
 """Client for the policies domain."""
 
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,14 +27,7 @@ class PoliciesClient:
         Returns:
             T.GetPolicyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/v2/policies/{policyId}",
-            path_params={"policyId": policy_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_POLICY, policy_id)
         return cast(T.GetPolicyResponse, response)
 
     def update_policy(self, policy_id: str, body: dict[str, Any]) -> dict[str, Any]:
@@ -47,14 +43,7 @@ class PoliciesClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/v2/policies/{policyId}",
-            path_params={"policyId": policy_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UPDATE_POLICY, policy_id, body=body)
         return cast(dict[str, Any], response)
 
     def delete_policy(self, policy_id: str) -> dict[str, Any]:
@@ -69,14 +58,7 @@ class PoliciesClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/v2/policies/{policyId}",
-            path_params={"policyId": policy_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_POLICY, policy_id)
         return cast(dict[str, Any], response)
 
     def create_approval_decision(
@@ -94,14 +76,7 @@ class PoliciesClient:
         Returns:
             T.CreateApprovalDecisionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/v2/policy-approvals/{approvalId}/decisions",
-            path_params={"approvalId": approval_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_APPROVAL_DECISION, approval_id, body=body)
         return cast(T.CreateApprovalDecisionResponse, response)
 
     def list_policies(self, query: T.ListPoliciesQuery | None = None) -> T.ListPoliciesResponse:
@@ -116,16 +91,26 @@ class PoliciesClient:
         Returns:
             T.ListPoliciesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/v2/policies",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_POLICIES, query_params=query)
         return cast(T.ListPoliciesResponse, response)
 
+    def iter_policies(
+        self, query: T.ListPoliciesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListPoliciesItem]:
+        """
+        Iterate over List Policies.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListPoliciesItem]: The items of every page.
+        """
+        return iter_items(self.list_policies, query, page_size)
+
     def create_policy(self, body: dict[str, Any]) -> dict[str, Any]:
         """
               Create Policy.
@@ -142,14 +127,7 @@ class PoliciesClient:
               Returns:
                   dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/v2/policies",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_POLICY, body=body)
         return cast(dict[str, Any], response)
 
     def get_approval(self, approval_id: str) -> T.GetApprovalResponse:
@@ -164,14 +142,7 @@ class PoliciesClient:
         Returns:
             T.GetApprovalResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/v2/policy-approvals/{approvalId}",
-            path_params={"approvalId": approval_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_APPROVAL, approval_id)
         return cast(T.GetApprovalResponse, response)
 
     def list_approvals(self, query: T.ListApprovalsQuery | None = None) -> T.ListApprovalsResponse:
@@ -186,12 +157,22 @@ class PoliciesClient:
         Returns:
             T.ListApprovalsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/v2/policy-approvals",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_APPROVALS, query_params=query)
         return cast(T.ListApprovalsResponse, response)
+
+    def iter_approvals(
+        self, query: T.ListApprovalsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListApprovalsItem]:
+        """
+        Iterate over List Approvals.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListApprovalsItem]: The items of every page.
+        """
+        return iter_items(self.list_approvals, query, page_size)
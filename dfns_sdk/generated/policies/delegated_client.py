@@ -1,10 +1,12 @@
 """Delegated client for the policies domain."""
 
-import json
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,10 @@ class DelegatedPoliciesClient:
         Returns:
             T.GetPolicyResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/v2/policies/{policyId}",
-            path_params={"policyId": policy_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_POLICY, policy_id)
         return cast(T.GetPolicyResponse, response)
 
-    def update_policy_init(self, policy_id: str, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def update_policy_init(self, policy_id: str, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Update Policy.
 
@@ -52,21 +47,16 @@ class DelegatedPoliciesClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/v2/policies/{policyId}"
-        path = path.replace("{policyId}", str(policy_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.UPDATE_POLICY, E.UPDATE_POLICY.resolve(policy_id), body)
 
     def update_policy_complete(
-        self, policy_id: str, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        policy_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> dict[str, Any]:
         """
         Complete Update Policy.
@@ -77,24 +67,23 @@ class DelegatedPoliciesClient:
             policy_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_policy_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_POLICY.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/v2/policies/{policyId}",
-            path_params={"policyId": policy_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UPDATE_POLICY, policy_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(dict[str, Any], response)
 
-    def delete_policy_init(self, policy_id: str) -> UserActionChallengeResponse:
+    def delete_policy_init(self, policy_id: str) -> PreparedAction:
         """
         Initialize Delete Policy.
 
@@ -104,21 +93,12 @@ class DelegatedPoliciesClient:
             policy_id: Path parameter.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/v2/policies/{policyId}"
-        path = path.replace("{policyId}", str(policy_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.DELETE_POLICY, E.DELETE_POLICY.resolve(policy_id))
 
     def delete_policy_complete(
-        self, policy_id: str, signed_challenge: SignUserActionChallengeRequest
+        self, policy_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
     ) -> dict[str, Any]:
         """
         Complete Delete Policy.
@@ -128,26 +108,23 @@ class DelegatedPoliciesClient:
         Args:
             policy_id: Path parameter.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_policy_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_POLICY.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/v2/policies/{policyId}",
-            path_params={"policyId": policy_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELETE_POLICY, policy_id, user_action=user_action_token, prepared=prepared
         )
         return cast(dict[str, Any], response)
 
-    def create_approval_decision_init(
-        self, approval_id: str, body: T.CreateApprovalDecisionRequest
-    ) -> UserActionChallengeResponse:
+    def create_approval_decision_init(self, approval_id: str, body: T.CreateApprovalDecisionRequest) -> PreparedAction:
         """
         Initialize Create Approval Decision.
 
@@ -158,21 +135,18 @@ class DelegatedPoliciesClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/v2/policy-approvals/{approvalId}/decisions"
-        path = path.replace("{approvalId}", str(approval_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_APPROVAL_DECISION, E.CREATE_APPROVAL_DECISION.resolve(approval_id), body
         )
 
     def create_approval_decision_complete(
-        self, approval_id: str, body: T.CreateApprovalDecisionRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        approval_id: str,
+        body: T.CreateApprovalDecisionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateApprovalDecisionResponse:
         """
         Complete Create Approval Decision.
@@ -183,20 +157,19 @@ class DelegatedPoliciesClient:
             approval_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_approval_decision_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateApprovalDecisionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_APPROVAL_DECISION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/v2/policy-approvals/{approvalId}/decisions",
-            path_params={"approvalId": approval_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_APPROVAL_DECISION, approval_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateApprovalDecisionResponse, response)
 
@@ -212,17 +185,27 @@ class DelegatedPoliciesClient:
         Returns:
             T.ListPoliciesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/v2/policies",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_POLICIES, query_params=query)
         return cast(T.ListPoliciesResponse, response)
 
-    def create_policy_init(self, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def iter_policies(
+        self, query: T.ListPoliciesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListPoliciesItem]:
+        """
+        Iterate over List Policies.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListPoliciesItem]: The items of every page.
+        """
+        return iter_items(self.list_policies, query, page_size)
+
+    def create_policy_init(self, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Create Policy.
 
@@ -232,20 +215,15 @@ class DelegatedPoliciesClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/v2/policies"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_POLICY, E.CREATE_POLICY.path, body)
 
     def create_policy_complete(
-        self, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> dict[str, Any]:
         """
         Complete Create Policy.
@@ -255,20 +233,19 @@ class DelegatedPoliciesClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_policy_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_POLICY.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/v2/policies",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_POLICY, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(dict[str, Any], response)
 
@@ -284,14 +261,7 @@ class DelegatedPoliciesClient:
         Returns:
             T.GetApprovalResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/v2/policy-approvals/{approvalId}",
-            path_params={"approvalId": approval_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_APPROVAL, approval_id)
         return cast(T.GetApprovalResponse, response)
 
     def list_approvals(self, query: T.ListApprovalsQuery | None = None) -> T.ListApprovalsResponse:
@@ -306,12 +276,22 @@ class DelegatedPoliciesClient:
         Returns:
             T.ListApprovalsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/v2/policy-approvals",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_APPROVALS, query_params=query)
         return cast(T.ListApprovalsResponse, response)
+
+    def iter_approvals(
+        self, query: T.ListApprovalsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListApprovalsItem]:
+        """
+        Iterate over List Approvals.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListApprovalsItem]: The items of every page.
+        """
+        return iter_items(self.list_approvals, query, page_size)
@@ -0,0 +1,22 @@
+"""Endpoint registry for the policies domain."""
+
+from ..._internal.endpoint import Endpoint
+
+GET_POLICY = Endpoint("policies.get_policy", "GET", "/v2/policies/{policyId}", response_type="GetPolicyResponse")
+UPDATE_POLICY = Endpoint("policies.update_policy", "PUT", "/v2/policies/{policyId}", requires_signature=True)
+DELETE_POLICY = Endpoint("policies.delete_policy", "DELETE", "/v2/policies/{policyId}", requires_signature=True)
+CREATE_APPROVAL_DECISION = Endpoint(
+    "policies.create_approval_decision",
+    "POST",
+    "/v2/policy-approvals/{approvalId}/decisions",
+    requires_signature=True,
+    response_type="CreateApprovalDecisionResponse",
+)
+LIST_POLICIES = Endpoint("policies.list_policies", "GET", "/v2/policies", response_type="ListPoliciesResponse")
+CREATE_POLICY = Endpoint("policies.create_policy", "POST", "/v2/policies", requires_signature=True)
+GET_APPROVAL = Endpoint(
+    "policies.get_approval", "GET", "/v2/policy-approvals/{approvalId}", response_type="GetApprovalResponse"
+)
+LIST_APPROVALS = Endpoint(
+    "policies.list_approvals", "GET", "/v2/policy-approvals", response_type="ListApprovalsResponse"
+)
@@ -33,10 +33,14 @@ class CreateApprovalDecisionResponse(TypedDict, total=False):
     decisions: list[dict[str, Any]]
 
 
+ListPoliciesItem = dict[str, Any]
+"""Item of a listPolicies page."""
+
+
 class ListPoliciesResponse(TypedDict, total=False):
     """listPolicies response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListPoliciesItem]
     next_page_token: NotRequired[str]
 
 
@@ -63,10 +67,14 @@ class GetApprovalResponse(TypedDict, total=False):
     decisions: list[dict[str, Any]]
 
 
+ListApprovalsItem = dict[str, Any]
+"""Item of a listApprovals page."""
+
+
 class ListApprovalsResponse(TypedDict, total=False):
     """listApprovals response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListApprovalsItem]
     next_page_token: NotRequired[str]
 
 
@@ -1,7 +1,30 @@
 """Signers domain module."""
 
-from . import types
-from .client import SignersClient
-from .delegated_client import DelegatedSignersClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["SignersClient", "DelegatedSignersClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncSignersClient
+    from .async_delegated_client import AsyncDelegatedSignersClient
+    from .client import SignersClient
+    from .delegated_client import DelegatedSignersClient
+
+_EXPORTS = {
+    "SignersClient": ".client",
+    "DelegatedSignersClient": ".delegated_client",
+    "AsyncSignersClient": ".async_client",
+    "AsyncDelegatedSignersClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["SignersClient", "DelegatedSignersClient", "AsyncSignersClient", "AsyncDelegatedSignersClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
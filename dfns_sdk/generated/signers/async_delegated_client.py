@@ -0,0 +1,549 @@
+"""Async delegated client for the signers domain."""
+
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedSignersClient:
+    """
+    Async delegated client for signers operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def cancel_fleet_operation_init(self, store_id: str, body: T.CancelFleetOperationRequest) -> PreparedAction:
+        """
+        Initialize Cancel Fleet Operation.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CANCEL_FLEET_OPERATION, E.CANCEL_FLEET_OPERATION.resolve(store_id), body
+        )
+
+    async def cancel_fleet_operation_complete(
+        self,
+        store_id: str,
+        body: T.CancelFleetOperationRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CancelFleetOperationResponse:
+        """
+        Complete Cancel Fleet Operation.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of cancel_fleet_operation_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CancelFleetOperationResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CANCEL_FLEET_OPERATION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CANCEL_FLEET_OPERATION, store_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CancelFleetOperationResponse, response)
+
+    async def create_add_mac_user_input_init(
+        self, store_id: str, body: T.CreateAddMacUserInputRequest
+    ) -> PreparedAction:
+        """
+        Initialize Create Add Mac User Input.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_ADD_MAC_USER_INPUT, E.CREATE_ADD_MAC_USER_INPUT.resolve(store_id), body
+        )
+
+    async def create_add_mac_user_input_complete(
+        self,
+        store_id: str,
+        body: T.CreateAddMacUserInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> None:
+        """
+        Complete Create Add Mac User Input.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_add_mac_user_input_init(); its payload is sent as is instead of
+                encoding the body again.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ADD_MAC_USER_INPUT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        await self._http.call_with_user_action(
+            E.CREATE_ADD_MAC_USER_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+
+    async def create_add_provisioner_input_init(
+        self, store_id: str, body: T.CreateAddProvisionerInputRequest
+    ) -> PreparedAction:
+        """
+        Initialize Create Add Provisioner Input.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_ADD_PROVISIONER_INPUT, E.CREATE_ADD_PROVISIONER_INPUT.resolve(store_id), body
+        )
+
+    async def create_add_provisioner_input_complete(
+        self,
+        store_id: str,
+        body: T.CreateAddProvisionerInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> None:
+        """
+        Complete Create Add Provisioner Input.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_add_provisioner_input_init(); its payload is sent as is instead of
+                encoding the body again.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ADD_PROVISIONER_INPUT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        await self._http.call_with_user_action(
+            E.CREATE_ADD_PROVISIONER_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+
+    async def create_clone_input_init(self, store_id: str, body: T.CreateCloneInputRequest) -> PreparedAction:
+        """
+        Initialize Create Clone Input.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_CLONE_INPUT, E.CREATE_CLONE_INPUT.resolve(store_id), body
+        )
+
+    async def create_clone_input_complete(
+        self,
+        store_id: str,
+        body: T.CreateCloneInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> None:
+        """
+        Complete Create Clone Input.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_clone_input_init(); its payload is sent as is instead of
+                encoding the body again.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_CLONE_INPUT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        await self._http.call_with_user_action(
+            E.CREATE_CLONE_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+
+    async def create_genesis_input_init(self, store_id: str, body: T.CreateGenesisInputRequest) -> PreparedAction:
+        """
+        Initialize Create Genesis Input.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_GENESIS_INPUT, E.CREATE_GENESIS_INPUT.resolve(store_id), body
+        )
+
+    async def create_genesis_input_complete(
+        self,
+        store_id: str,
+        body: T.CreateGenesisInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> None:
+        """
+        Complete Create Genesis Input.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_genesis_input_init(); its payload is sent as is instead of
+                encoding the body again.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_GENESIS_INPUT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        await self._http.call_with_user_action(
+            E.CREATE_GENESIS_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+
+    async def create_key_harvest_input_init(
+        self, store_id: str, body: T.CreateKeyHarvestInputRequest
+    ) -> PreparedAction:
+        """
+        Initialize Create Key Harvest Input.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_KEY_HARVEST_INPUT, E.CREATE_KEY_HARVEST_INPUT.resolve(store_id), body
+        )
+
+    async def create_key_harvest_input_complete(
+        self,
+        store_id: str,
+        body: T.CreateKeyHarvestInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> None:
+        """
+        Complete Create Key Harvest Input.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_key_harvest_input_init(); its payload is sent as is instead of
+                encoding the body again.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_KEY_HARVEST_INPUT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        await self._http.call_with_user_action(
+            E.CREATE_KEY_HARVEST_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+
+    async def create_onchain_sign_input_init(
+        self, store_id: str, body: T.CreateOnchainSignInputRequest
+    ) -> PreparedAction:
+        """
+        Initialize Create Onchain Sign Input.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_ONCHAIN_SIGN_INPUT, E.CREATE_ONCHAIN_SIGN_INPUT.resolve(store_id), body
+        )
+
+    async def create_onchain_sign_input_complete(
+        self,
+        store_id: str,
+        body: T.CreateOnchainSignInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> None:
+        """
+        Complete Create Onchain Sign Input.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_onchain_sign_input_init(); its payload is sent as is instead of
+                encoding the body again.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ONCHAIN_SIGN_INPUT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        await self._http.call_with_user_action(
+            E.CREATE_ONCHAIN_SIGN_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+
+    async def create_proof_of_control_input_init(
+        self, store_id: str, body: T.CreateProofOfControlInputRequest
+    ) -> PreparedAction:
+        """
+        Initialize Create Proof Of Control Input.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_PROOF_OF_CONTROL_INPUT, E.CREATE_PROOF_OF_CONTROL_INPUT.resolve(store_id), body
+        )
+
+    async def create_proof_of_control_input_complete(
+        self,
+        store_id: str,
+        body: T.CreateProofOfControlInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> None:
+        """
+        Complete Create Proof Of Control Input.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_proof_of_control_input_init(); its payload is sent as is instead of
+                encoding the body again.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PROOF_OF_CONTROL_INPUT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        await self._http.call_with_user_action(
+            E.CREATE_PROOF_OF_CONTROL_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+
+    async def list_key_stores(self) -> T.ListKeyStoresResponse:
+        """
+        List Key Stores.
+
+        Lists the key stores of your organization.
+
+        Returns:
+            T.ListKeyStoresResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_KEY_STORES)
+        return cast(T.ListKeyStoresResponse, response)
+
+    async def list_signers(self) -> T.ListSignersResponse:
+        """
+        List Signers.
+
+        Lists the signer clusters of your key store, including each signer's ID and encryption public key.
+
+        Returns:
+            T.ListSignersResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_SIGNERS)
+        return cast(T.ListSignersResponse, response)
+
+    async def submit_add_mac_user_output(
+        self, store_id: str, body: T.SubmitAddMacUserOutputRequest, file: bytes
+    ) -> T.SubmitAddMacUserOutputResponse:
+        """
+        Submit Add Mac User Output.
+
+        Submits the output archive produced by the offline signer fleet for an add-mac-user operation.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            file: The file bytes to upload.
+
+        Returns:
+            T.SubmitAddMacUserOutputResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SUBMIT_ADD_MAC_USER_OUTPUT, store_id, body=body, file=file)
+        return cast(T.SubmitAddMacUserOutputResponse, response)
+
+    async def submit_add_provisioner_output(
+        self, store_id: str, body: T.SubmitAddProvisionerOutputRequest, file: bytes
+    ) -> T.SubmitAddProvisionerOutputResponse:
+        """
+        Submit Add Provisioner Output.
+
+        Submits the output archive produced by the offline signer fleet for an add-provisioner operation.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            file: The file bytes to upload.
+
+        Returns:
+            T.SubmitAddProvisionerOutputResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SUBMIT_ADD_PROVISIONER_OUTPUT, store_id, body=body, file=file)
+        return cast(T.SubmitAddProvisionerOutputResponse, response)
+
+    async def submit_clone_output(
+        self, store_id: str, body: T.SubmitCloneOutputRequest, file: bytes
+    ) -> T.SubmitCloneOutputResponse:
+        """
+        Submit Clone Output.
+
+        Submits the output archive produced by the offline signer fleet for a clone operation.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            file: The file bytes to upload.
+
+        Returns:
+            T.SubmitCloneOutputResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SUBMIT_CLONE_OUTPUT, store_id, body=body, file=file)
+        return cast(T.SubmitCloneOutputResponse, response)
+
+    async def submit_genesis_output(
+        self, store_id: str, body: T.SubmitGenesisOutputRequest, file: bytes
+    ) -> T.SubmitGenesisOutputResponse:
+        """
+        Submit Genesis Output.
+
+        Submits the output archive produced by the offline signer fleet for a genesis operation.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            file: The file bytes to upload.
+
+        Returns:
+            T.SubmitGenesisOutputResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SUBMIT_GENESIS_OUTPUT, store_id, body=body, file=file)
+        return cast(T.SubmitGenesisOutputResponse, response)
+
+    async def submit_key_harvest_output(
+        self, store_id: str, body: T.SubmitKeyHarvestOutputRequest, file: bytes
+    ) -> T.SubmitKeyHarvestOutputResponse:
+        """
+        Submit Key Harvest Output.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            file: The file bytes to upload.
+
+        Returns:
+            T.SubmitKeyHarvestOutputResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SUBMIT_KEY_HARVEST_OUTPUT, store_id, body=body, file=file)
+        return cast(T.SubmitKeyHarvestOutputResponse, response)
+
+    async def submit_onchain_sign_output(
+        self, store_id: str, body: T.SubmitOnchainSignOutputRequest, file: bytes
+    ) -> T.SubmitOnchainSignOutputResponse:
+        """
+        Submit Onchain Sign Output.
+
+        Submits the output archive produced by the offline signer fleet for an onchain-sign operation.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            file: The file bytes to upload.
+
+        Returns:
+            T.SubmitOnchainSignOutputResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SUBMIT_ONCHAIN_SIGN_OUTPUT, store_id, body=body, file=file)
+        return cast(T.SubmitOnchainSignOutputResponse, response)
+
+    async def submit_proof_of_control_output(
+        self, store_id: str, body: T.SubmitProofOfControlOutputRequest, file: bytes
+    ) -> T.SubmitProofOfControlOutputResponse:
+        """
+        Submit Proof Of Control Output.
+
+        Submits the output archive produced by the offline signer fleet for a proof-of-control operation.
+
+        Args:
+            store_id: Path parameter.
+            body: Request body.
+            file: The file bytes to upload.
+
+        Returns:
+            T.SubmitProofOfControlOutputResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SUBMIT_PROOF_OF_CONTROL_OUTPUT, store_id, body=body, file=file)
+        return cast(T.SubmitProofOfControlOutputResponse, response)
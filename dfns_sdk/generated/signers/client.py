@@ -3,6 +3,7 @@
 from typing import cast
 
 from ..._internal import HttpClient
+from . import endpoints as E
 from . import types as T
 
 
@@ -25,14 +26,7 @@ class SignersClient:
         Returns:
             T.CancelFleetOperationResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/fleet-operations/cancel",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CANCEL_FLEET_OPERATION, store_id, body=body)
         return cast(T.CancelFleetOperationResponse, response)
 
     def create_add_mac_user_input(self, store_id: str, body: T.CreateAddMacUserInputRequest) -> None:
@@ -45,14 +39,7 @@ class SignersClient:
             store_id: Path parameter.
             body: Request body.
         """  # noqa: E501
-        self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/add-mac-user/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        self._http.call(E.CREATE_ADD_MAC_USER_INPUT, store_id, body=body)
 
     def create_add_provisioner_input(self, store_id: str, body: T.CreateAddProvisionerInputRequest) -> None:
         """
@@ -64,14 +51,7 @@ class SignersClient:
             store_id: Path parameter.
             body: Request body.
         """  # noqa: E501
-        self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/add-provisioner/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        self._http.call(E.CREATE_ADD_PROVISIONER_INPUT, store_id, body=body)
 
     def create_clone_input(self, store_id: str, body: T.CreateCloneInputRequest) -> None:
         """
@@ -83,14 +63,7 @@ class SignersClient:
             store_id: Path parameter.
             body: Request body.
         """  # noqa: E501
-        self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/clone/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        self._http.call(E.CREATE_CLONE_INPUT, store_id, body=body)
 
     def create_genesis_input(self, store_id: str, body: T.CreateGenesisInputRequest) -> None:
         """
@@ -102,14 +75,7 @@ class SignersClient:
             store_id: Path parameter.
             body: Request body.
         """  # noqa: E501
-        self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/genesis/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        self._http.call(E.CREATE_GENESIS_INPUT, store_id, body=body)
 
     def create_key_harvest_input(self, store_id: str, body: T.CreateKeyHarvestInputRequest) -> None:
         """
@@ -119,14 +85,7 @@ class SignersClient:
             store_id: Path parameter.
             body: Request body.
         """  # noqa: E501
-        self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/key-harvest/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        self._http.call(E.CREATE_KEY_HARVEST_INPUT, store_id, body=body)
 
     def create_onchain_sign_input(self, store_id: str, body: T.CreateOnchainSignInputRequest) -> None:
         """
@@ -138,14 +97,7 @@ class SignersClient:
             store_id: Path parameter.
             body: Request body.
         """  # noqa: E501
-        self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/onchain-sign/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        self._http.call(E.CREATE_ONCHAIN_SIGN_INPUT, store_id, body=body)
 
     def create_proof_of_control_input(self, store_id: str, body: T.CreateProofOfControlInputRequest) -> None:
         """
@@ -157,14 +109,7 @@ class SignersClient:
             store_id: Path parameter.
             body: Request body.
         """  # noqa: E501
-        self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/proof-of-control/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        self._http.call(E.CREATE_PROOF_OF_CONTROL_INPUT, store_id, body=body)
 
     def list_key_stores(self) -> T.ListKeyStoresResponse:
         """
@@ -175,14 +120,7 @@ class SignersClient:
         Returns:
             T.ListKeyStoresResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/key-stores",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_KEY_STORES)
         return cast(T.ListKeyStoresResponse, response)
 
     def list_signers(self) -> T.ListSignersResponse:
@@ -194,14 +132,7 @@ class SignersClient:
         Returns:
             T.ListSignersResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/signers",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_SIGNERS)
         return cast(T.ListSignersResponse, response)
 
     def submit_add_mac_user_output(
@@ -220,15 +151,7 @@ class SignersClient:
         Returns:
             T.SubmitAddMacUserOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/add-mac-user/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_ADD_MAC_USER_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitAddMacUserOutputResponse, response)
 
     def submit_add_provisioner_output(
@@ -247,15 +170,7 @@ class SignersClient:
         Returns:
             T.SubmitAddProvisionerOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/add-provisioner/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_ADD_PROVISIONER_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitAddProvisionerOutputResponse, response)
 
     def submit_clone_output(
@@ -274,15 +189,7 @@ class SignersClient:
         Returns:
             T.SubmitCloneOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/clone/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_CLONE_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitCloneOutputResponse, response)
 
     def submit_genesis_output(
@@ -301,15 +208,7 @@ class SignersClient:
         Returns:
             T.SubmitGenesisOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/genesis/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_GENESIS_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitGenesisOutputResponse, response)
 
     def submit_key_harvest_output(
@@ -326,15 +225,7 @@ class SignersClient:
         Returns:
             T.SubmitKeyHarvestOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/key-harvest/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_KEY_HARVEST_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitKeyHarvestOutputResponse, response)
 
     def submit_onchain_sign_output(
@@ -353,15 +244,7 @@ class SignersClient:
         Returns:
             T.SubmitOnchainSignOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/onchain-sign/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_ONCHAIN_SIGN_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitOnchainSignOutputResponse, response)
 
     def submit_proof_of_control_output(
@@ -380,13 +263,5 @@ class SignersClient:
         Returns:
             T.SubmitProofOfControlOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/proof-of-control/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_PROOF_OF_CONTROL_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitProofOfControlOutputResponse, response)
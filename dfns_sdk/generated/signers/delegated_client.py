@@ -1,10 +1,10 @@
 """Delegated client for the signers domain."""
 
-import json
 from typing import cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -19,9 +19,7 @@ class DelegatedSignersClient:
     def __init__(self, http_client: HttpClient):
         self._http = http_client
 
-    def cancel_fleet_operation_init(
-        self, store_id: str, body: T.CancelFleetOperationRequest
-    ) -> UserActionChallengeResponse:
+    def cancel_fleet_operation_init(self, store_id: str, body: T.CancelFleetOperationRequest) -> PreparedAction:
         """
         Initialize Cancel Fleet Operation.
 
@@ -32,21 +30,18 @@ class DelegatedSignersClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/key-stores/{storeId}/fleet-operations/cancel"
-        path = path.replace("{storeId}", str(store_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CANCEL_FLEET_OPERATION, E.CANCEL_FLEET_OPERATION.resolve(store_id), body
         )
 
     def cancel_fleet_operation_complete(
-        self, store_id: str, body: T.CancelFleetOperationRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        store_id: str,
+        body: T.CancelFleetOperationRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CancelFleetOperationResponse:
         """
         Complete Cancel Fleet Operation.
@@ -57,26 +52,23 @@ class DelegatedSignersClient:
             store_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of cancel_fleet_operation_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CancelFleetOperationResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CANCEL_FLEET_OPERATION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/key-stores/{storeId}/fleet-operations/cancel",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CANCEL_FLEET_OPERATION, store_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CancelFleetOperationResponse, response)
 
-    def create_add_mac_user_input_init(
-        self, store_id: str, body: T.CreateAddMacUserInputRequest
-    ) -> UserActionChallengeResponse:
+    def create_add_mac_user_input_init(self, store_id: str, body: T.CreateAddMacUserInputRequest) -> PreparedAction:
         """
         Initialize Create Add Mac User Input.
 
@@ -87,21 +79,18 @@ class DelegatedSignersClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/key-stores/{storeId}/add-mac-user/input"
-        path = path.replace("{storeId}", str(store_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_ADD_MAC_USER_INPUT, E.CREATE_ADD_MAC_USER_INPUT.resolve(store_id), body
         )
 
     def create_add_mac_user_input_complete(
-        self, store_id: str, body: T.CreateAddMacUserInputRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        store_id: str,
+        body: T.CreateAddMacUserInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> None:
         """
         Complete Create Add Mac User Input.
@@ -112,22 +101,21 @@ class DelegatedSignersClient:
             store_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_add_mac_user_input_init(); its payload is sent as is instead of
+                encoding the body again.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ADD_MAC_USER_INPUT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        self._http.request_with_user_action(
-            method="POST",
-            path="/key-stores/{storeId}/add-mac-user/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        self._http.call_with_user_action(
+            E.CREATE_ADD_MAC_USER_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
         )
 
     def create_add_provisioner_input_init(
         self, store_id: str, body: T.CreateAddProvisionerInputRequest
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Create Add Provisioner Input.
 
@@ -138,21 +126,18 @@ class DelegatedSignersClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/key-stores/{storeId}/add-provisioner/input"
-        path = path.replace("{storeId}", str(store_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_ADD_PROVISIONER_INPUT, E.CREATE_ADD_PROVISIONER_INPUT.resolve(store_id), body
         )
 
     def create_add_provisioner_input_complete(
-        self, store_id: str, body: T.CreateAddProvisionerInputRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        store_id: str,
+        body: T.CreateAddProvisionerInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> None:
         """
         Complete Create Add Provisioner Input.
@@ -163,20 +148,19 @@ class DelegatedSignersClient:
             store_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_add_provisioner_input_init(); its payload is sent as is instead of
+                encoding the body again.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ADD_PROVISIONER_INPUT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        self._http.request_with_user_action(
-            method="POST",
-            path="/key-stores/{storeId}/add-provisioner/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        self._http.call_with_user_action(
+            E.CREATE_ADD_PROVISIONER_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
         )
 
-    def create_clone_input_init(self, store_id: str, body: T.CreateCloneInputRequest) -> UserActionChallengeResponse:
+    def create_clone_input_init(self, store_id: str, body: T.CreateCloneInputRequest) -> PreparedAction:
         """
         Initialize Create Clone Input.
 
@@ -187,21 +171,18 @@ class DelegatedSignersClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/key-stores/{storeId}/clone/input"
-        path = path.replace("{storeId}", str(store_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_CLONE_INPUT, E.CREATE_CLONE_INPUT.resolve(store_id), body
         )
 
     def create_clone_input_complete(
-        self, store_id: str, body: T.CreateCloneInputRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        store_id: str,
+        body: T.CreateCloneInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> None:
         """
         Complete Create Clone Input.
@@ -212,22 +193,19 @@ class DelegatedSignersClient:
             store_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_clone_input_init(); its payload is sent as is instead of
+                encoding the body again.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_CLONE_INPUT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        self._http.request_with_user_action(
-            method="POST",
-            path="/key-stores/{storeId}/clone/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        self._http.call_with_user_action(
+            E.CREATE_CLONE_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
         )
 
-    def create_genesis_input_init(
-        self, store_id: str, body: T.CreateGenesisInputRequest
-    ) -> UserActionChallengeResponse:
+    def create_genesis_input_init(self, store_id: str, body: T.CreateGenesisInputRequest) -> PreparedAction:
         """
         Initialize Create Genesis Input.
 
@@ -238,21 +216,18 @@ class DelegatedSignersClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/key-stores/{storeId}/genesis/input"
-        path = path.replace("{storeId}", str(store_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_GENESIS_INPUT, E.CREATE_GENESIS_INPUT.resolve(store_id), body
         )
 
     def create_genesis_input_complete(
-        self, store_id: str, body: T.CreateGenesisInputRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        store_id: str,
+        body: T.CreateGenesisInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> None:
         """
         Complete Create Genesis Input.
@@ -263,22 +238,19 @@ class DelegatedSignersClient:
             store_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_genesis_input_init(); its payload is sent as is instead of
+                encoding the body again.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_GENESIS_INPUT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        self._http.request_with_user_action(
-            method="POST",
-            path="/key-stores/{storeId}/genesis/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        self._http.call_with_user_action(
+            E.CREATE_GENESIS_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
         )
 
-    def create_key_harvest_input_init(
-        self, store_id: str, body: T.CreateKeyHarvestInputRequest
-    ) -> UserActionChallengeResponse:
+    def create_key_harvest_input_init(self, store_id: str, body: T.CreateKeyHarvestInputRequest) -> PreparedAction:
         """
         Initialize Create Key Harvest Input.
 
@@ -289,21 +261,18 @@ class DelegatedSignersClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/key-stores/{storeId}/key-harvest/input"
-        path = path.replace("{storeId}", str(store_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_KEY_HARVEST_INPUT, E.CREATE_KEY_HARVEST_INPUT.resolve(store_id), body
         )
 
     def create_key_harvest_input_complete(
-        self, store_id: str, body: T.CreateKeyHarvestInputRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        store_id: str,
+        body: T.CreateKeyHarvestInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> None:
         """
         Complete Create Key Harvest Input.
@@ -314,22 +283,19 @@ class DelegatedSignersClient:
             store_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_key_harvest_input_init(); its payload is sent as is instead of
+                encoding the body again.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_KEY_HARVEST_INPUT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        self._http.request_with_user_action(
-            method="POST",
-            path="/key-stores/{storeId}/key-harvest/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        self._http.call_with_user_action(
+            E.CREATE_KEY_HARVEST_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
         )
 
-    def create_onchain_sign_input_init(
-        self, store_id: str, body: T.CreateOnchainSignInputRequest
-    ) -> UserActionChallengeResponse:
+    def create_onchain_sign_input_init(self, store_id: str, body: T.CreateOnchainSignInputRequest) -> PreparedAction:
         """
         Initialize Create Onchain Sign Input.
 
@@ -340,21 +306,18 @@ class DelegatedSignersClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/key-stores/{storeId}/onchain-sign/input"
-        path = path.replace("{storeId}", str(store_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_ONCHAIN_SIGN_INPUT, E.CREATE_ONCHAIN_SIGN_INPUT.resolve(store_id), body
         )
 
     def create_onchain_sign_input_complete(
-        self, store_id: str, body: T.CreateOnchainSignInputRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        store_id: str,
+        body: T.CreateOnchainSignInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> None:
         """
         Complete Create Onchain Sign Input.
@@ -365,22 +328,21 @@ class DelegatedSignersClient:
             store_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_onchain_sign_input_init(); its payload is sent as is instead of
+                encoding the body again.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_ONCHAIN_SIGN_INPUT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        self._http.request_with_user_action(
-            method="POST",
-            path="/key-stores/{storeId}/onchain-sign/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        self._http.call_with_user_action(
+            E.CREATE_ONCHAIN_SIGN_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
         )
 
     def create_proof_of_control_input_init(
         self, store_id: str, body: T.CreateProofOfControlInputRequest
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Create Proof Of Control Input.
 
@@ -391,21 +353,18 @@ class DelegatedSignersClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/key-stores/{storeId}/proof-of-control/input"
-        path = path.replace("{storeId}", str(store_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_PROOF_OF_CONTROL_INPUT, E.CREATE_PROOF_OF_CONTROL_INPUT.resolve(store_id), body
         )
 
     def create_proof_of_control_input_complete(
-        self, store_id: str, body: T.CreateProofOfControlInputRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        store_id: str,
+        body: T.CreateProofOfControlInputRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> None:
         """
         Complete Create Proof Of Control Input.
@@ -416,17 +375,16 @@ class DelegatedSignersClient:
             store_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_proof_of_control_input_init(); its payload is sent as is instead of
+                encoding the body again.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_PROOF_OF_CONTROL_INPUT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        self._http.request_with_user_action(
-            method="POST",
-            path="/key-stores/{storeId}/proof-of-control/input",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        self._http.call_with_user_action(
+            E.CREATE_PROOF_OF_CONTROL_INPUT, store_id, body=body, user_action=user_action_token, prepared=prepared
         )
 
     def list_key_stores(self) -> T.ListKeyStoresResponse:
@@ -438,14 +396,7 @@ class DelegatedSignersClient:
         Returns:
             T.ListKeyStoresResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/key-stores",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_KEY_STORES)
         return cast(T.ListKeyStoresResponse, response)
 
     def list_signers(self) -> T.ListSignersResponse:
@@ -457,14 +408,7 @@ class DelegatedSignersClient:
         Returns:
             T.ListSignersResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/signers",
-            path_params={},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_SIGNERS)
         return cast(T.ListSignersResponse, response)
 
     def submit_add_mac_user_output(
@@ -483,15 +427,7 @@ class DelegatedSignersClient:
         Returns:
             T.SubmitAddMacUserOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/add-mac-user/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_ADD_MAC_USER_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitAddMacUserOutputResponse, response)
 
     def submit_add_provisioner_output(
@@ -510,15 +446,7 @@ class DelegatedSignersClient:
         Returns:
             T.SubmitAddProvisionerOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/add-provisioner/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_ADD_PROVISIONER_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitAddProvisionerOutputResponse, response)
 
     def submit_clone_output(
@@ -537,15 +465,7 @@ class DelegatedSignersClient:
         Returns:
             T.SubmitCloneOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/clone/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_CLONE_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitCloneOutputResponse, response)
 
     def submit_genesis_output(
@@ -564,15 +484,7 @@ class DelegatedSignersClient:
         Returns:
             T.SubmitGenesisOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/genesis/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_GENESIS_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitGenesisOutputResponse, response)
 
     def submit_key_harvest_output(
@@ -589,15 +501,7 @@ class DelegatedSignersClient:
         Returns:
             T.SubmitKeyHarvestOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/key-harvest/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_KEY_HARVEST_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitKeyHarvestOutputResponse, response)
 
     def submit_onchain_sign_output(
@@ -616,15 +520,7 @@ class DelegatedSignersClient:
         Returns:
             T.SubmitOnchainSignOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/onchain-sign/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_ONCHAIN_SIGN_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitOnchainSignOutputResponse, response)
 
     def submit_proof_of_control_output(
@@ -643,13 +539,5 @@ class DelegatedSignersClient:
         Returns:
             T.SubmitProofOfControlOutputResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/key-stores/{storeId}/proof-of-control/output",
-            path_params={"storeId": store_id},
-            query_params=None,
-            body=body,
-            file=file,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SUBMIT_PROOF_OF_CONTROL_OUTPUT, store_id, body=body, file=file)
         return cast(T.SubmitProofOfControlOutputResponse, response)
@@ -0,0 +1,89 @@
+"""Endpoint registry for the signers domain."""
+
+from ..._internal.endpoint import Endpoint
+
+CANCEL_FLEET_OPERATION = Endpoint(
+    "signers.cancel_fleet_operation",
+    "POST",
+    "/key-stores/{storeId}/fleet-operations/cancel",
+    requires_signature=True,
+    response_type="CancelFleetOperationResponse",
+)
+CREATE_ADD_MAC_USER_INPUT = Endpoint(
+    "signers.create_add_mac_user_input", "POST", "/key-stores/{storeId}/add-mac-user/input", requires_signature=True
+)
+CREATE_ADD_PROVISIONER_INPUT = Endpoint(
+    "signers.create_add_provisioner_input",
+    "POST",
+    "/key-stores/{storeId}/add-provisioner/input",
+    requires_signature=True,
+)
+CREATE_CLONE_INPUT = Endpoint(
+    "signers.create_clone_input", "POST", "/key-stores/{storeId}/clone/input", requires_signature=True
+)
+CREATE_GENESIS_INPUT = Endpoint(
+    "signers.create_genesis_input", "POST", "/key-stores/{storeId}/genesis/input", requires_signature=True
+)
+CREATE_KEY_HARVEST_INPUT = Endpoint(
+    "signers.create_key_harvest_input", "POST", "/key-stores/{storeId}/key-harvest/input", requires_signature=True
+)
+CREATE_ONCHAIN_SIGN_INPUT = Endpoint(
+    "signers.create_onchain_sign_input", "POST", "/key-stores/{storeId}/onchain-sign/input", requires_signature=True
+)
+CREATE_PROOF_OF_CONTROL_INPUT = Endpoint(
+    "signers.create_proof_of_control_input",
+    "POST",
+    "/key-stores/{storeId}/proof-of-control/input",
+    requires_signature=True,
+)
+LIST_KEY_STORES = Endpoint("signers.list_key_stores", "GET", "/key-stores", response_type="ListKeyStoresResponse")
+LIST_SIGNERS = Endpoint("signers.list_signers", "GET", "/signers", response_type="ListSignersResponse")
+SUBMIT_ADD_MAC_USER_OUTPUT = Endpoint(
+    "signers.submit_add_mac_user_output",
+    "POST",
+    "/key-stores/{storeId}/add-mac-user/output",
+    requires_signature=True,
+    response_type="SubmitAddMacUserOutputResponse",
+)
+SUBMIT_ADD_PROVISIONER_OUTPUT = Endpoint(
+    "signers.submit_add_provisioner_output",
+    "POST",
+    "/key-stores/{storeId}/add-provisioner/output",
+    requires_signature=True,
+    response_type="SubmitAddProvisionerOutputResponse",
+)
+SUBMIT_CLONE_OUTPUT = Endpoint(
+    "signers.submit_clone_output",
+    "POST",
+    "/key-stores/{storeId}/clone/output",
+    requires_signature=True,
+    response_type="SubmitCloneOutputResponse",
+)
+SUBMIT_GENESIS_OUTPUT = Endpoint(
+    "signers.submit_genesis_output",
+    "POST",
+    "/key-stores/{storeId}/genesis/output",
+    requires_signature=True,
+    response_type="SubmitGenesisOutputResponse",
+)
+SUBMIT_KEY_HARVEST_OUTPUT = Endpoint(
+    "signers.submit_key_harvest_output",
+    "POST",
+    "/key-stores/{storeId}/key-harvest/output",
+    requires_signature=True,
+    response_type="SubmitKeyHarvestOutputResponse",
+)
+SUBMIT_ONCHAIN_SIGN_OUTPUT = Endpoint(
+    "signers.submit_onchain_sign_output",
+    "POST",
+    "/key-stores/{storeId}/onchain-sign/output",
+    requires_signature=True,
+    response_type="SubmitOnchainSignOutputResponse",
+)
+SUBMIT_PROOF_OF_CONTROL_OUTPUT = Endpoint(
+    "signers.submit_proof_of_control_output",
+    "POST",
+    "/key-stores/{storeId}/proof-of-control/output",
+    requires_signature=True,
+    response_type="SubmitProofOfControlOutputResponse",
+)
@@ -1,7 +1,30 @@
 """Staking domain module."""
 
-from . import types
-from .client import StakingClient
-from .delegated_client import DelegatedStakingClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["StakingClient", "DelegatedStakingClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncStakingClient
+    from .async_delegated_client import AsyncDelegatedStakingClient
+    from .client import StakingClient
+    from .delegated_client import DelegatedStakingClient
+
+_EXPORTS = {
+    "StakingClient": ".client",
+    "DelegatedStakingClient": ".delegated_client",
+    "AsyncStakingClient": ".async_client",
+    "AsyncDelegatedStakingClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["StakingClient", "DelegatedStakingClient", "AsyncStakingClient", "AsyncDelegatedStakingClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
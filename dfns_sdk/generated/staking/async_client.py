@@ -0,0 +1,146 @@
+"""Async client for the staking domain."""
+
+from collections.abc import AsyncIterator
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncStakingClient:
+    """Async client for staking operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_stakes(self, query: T.ListStakesQuery | None = None) -> T.ListStakesResponse:
+        """
+        List Stakes.
+
+        Retrieve the list of stakes.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListStakesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_STAKES, query_params=query)
+        return cast(T.ListStakesResponse, response)
+
+    def aiter_stakes(
+        self, query: T.ListStakesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListStakesItem]:
+        """
+        Iterate over List Stakes.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListStakesItem]: The items of every page.
+        """
+        return aiter_items(self.list_stakes, query, page_size)
+
+    async def create_stake(self, body: T.CreateStakeRequest) -> T.CreateStakeResponse:
+        """
+        Create Stake.
+
+        Create a new stake.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateStakeResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_STAKE, body=body)
+        return cast(T.CreateStakeResponse, response)
+
+    async def list_stake_actions(
+        self, stake_id: str, query: T.ListStakeActionsQuery | None = None
+    ) -> T.ListStakeActionsResponse:
+        """
+        List Stake Actions.
+
+        Retrieve the list of actions for a specific stake.
+
+        Args:
+            stake_id: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.ListStakeActionsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_STAKE_ACTIONS, stake_id, query_params=query)
+        return cast(T.ListStakeActionsResponse, response)
+
+    def aiter_stake_actions(
+        self, stake_id: str, query: T.ListStakeActionsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListStakeActionsItem]:
+        """
+        Iterate over List Stake Actions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            stake_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListStakeActionsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_stake_actions(stake_id, q), query, page_size)
+
+    async def create_stake_action(self, stake_id: str, body: T.CreateStakeActionRequest) -> T.CreateStakeActionResponse:
+        """
+        Create Stake Action.
+
+        Create a new action for an existing stake.
+
+        Args:
+            stake_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            T.CreateStakeActionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_STAKE_ACTION, stake_id, body=body)
+        return cast(T.CreateStakeActionResponse, response)
+
+    async def get_stakes(self, stake_id: str, query: T.GetStakesQuery | None = None) -> T.GetStakesResponse:
+        """
+        Get Stakes.
+
+        Retrieve the details of a specific stake.
+
+        Args:
+            stake_id: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.GetStakesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_STAKES, stake_id, query_params=query)
+        return cast(T.GetStakesResponse, response)
+
+    async def get_stake_rewards(self, stake_id: str) -> T.GetStakeRewardsResponse:
+        """
+        Get Stake Rewards.
+
+        Retrieves the rewards linked to a specific stake.
+
+        Args:
+            stake_id: Path parameter.
+
+        Returns:
+            T.GetStakeRewardsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_STAKE_REWARDS, stake_id)
+        return cast(T.GetStakeRewardsResponse, response)
@@ -0,0 +1,214 @@
+"""Async delegated client for the staking domain."""
+
+from collections.abc import AsyncIterator
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedStakingClient:
+    """
+    Async delegated client for staking operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_stakes(self, query: T.ListStakesQuery | None = None) -> T.ListStakesResponse:
+        """
+        List Stakes.
+
+        Retrieve the list of stakes.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListStakesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_STAKES, query_params=query)
+        return cast(T.ListStakesResponse, response)
+
+    def aiter_stakes(
+        self, query: T.ListStakesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListStakesItem]:
+        """
+        Iterate over List Stakes.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListStakesItem]: The items of every page.
+        """
+        return aiter_items(self.list_stakes, query, page_size)
+
+    async def create_stake_init(self, body: T.CreateStakeRequest) -> PreparedAction:
+        """
+        Initialize Create Stake.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.CREATE_STAKE, E.CREATE_STAKE.path, body)
+
+    async def create_stake_complete(
+        self,
+        body: T.CreateStakeRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateStakeResponse:
+        """
+        Complete Create Stake.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_stake_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateStakeResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_STAKE.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_STAKE, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateStakeResponse, response)
+
+    async def list_stake_actions(
+        self, stake_id: str, query: T.ListStakeActionsQuery | None = None
+    ) -> T.ListStakeActionsResponse:
+        """
+        List Stake Actions.
+
+        Retrieve the list of actions for a specific stake.
+
+        Args:
+            stake_id: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.ListStakeActionsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_STAKE_ACTIONS, stake_id, query_params=query)
+        return cast(T.ListStakeActionsResponse, response)
+
+    def aiter_stake_actions(
+        self, stake_id: str, query: T.ListStakeActionsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListStakeActionsItem]:
+        """
+        Iterate over List Stake Actions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            stake_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListStakeActionsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_stake_actions(stake_id, q), query, page_size)
+
+    async def create_stake_action_init(self, stake_id: str, body: T.CreateStakeActionRequest) -> PreparedAction:
+        """
+        Initialize Create Stake Action.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            stake_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_STAKE_ACTION, E.CREATE_STAKE_ACTION.resolve(stake_id), body
+        )
+
+    async def create_stake_action_complete(
+        self,
+        stake_id: str,
+        body: T.CreateStakeActionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateStakeActionResponse:
+        """
+        Complete Create Stake Action.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            stake_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_stake_action_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateStakeActionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_STAKE_ACTION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_STAKE_ACTION, stake_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateStakeActionResponse, response)
+
+    async def get_stakes(self, stake_id: str, query: T.GetStakesQuery | None = None) -> T.GetStakesResponse:
+        """
+        Get Stakes.
+
+        Retrieve the details of a specific stake.
+
+        Args:
+            stake_id: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.GetStakesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_STAKES, stake_id, query_params=query)
+        return cast(T.GetStakesResponse, response)
+
+    async def get_stake_rewards(self, stake_id: str) -> T.GetStakeRewardsResponse:
+        """
+        Get Stake Rewards.
+
+        Retrieves the rewards linked to a specific stake.
+
+        Args:
+            stake_id: Path parameter.
+
+        Returns:
+            T.GetStakeRewardsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_STAKE_REWARDS, stake_id)
+        return cast(T.GetStakeRewardsResponse, response)
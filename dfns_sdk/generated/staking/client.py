@@ -1,8 +1,11 @@
 """Client for the staking domain."""
 
+from collections.abc import Iterator
 from typing import cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,16 +27,26 @@ class StakingClient:
         Returns:
             T.ListStakesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/staking/stakes",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_STAKES, query_params=query)
         return cast(T.ListStakesResponse, response)
 
+    def iter_stakes(
+        self, query: T.ListStakesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListStakesItem]:
+        """
+        Iterate over List Stakes.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListStakesItem]: The items of every page.
+        """
+        return iter_items(self.list_stakes, query, page_size)
+
     def create_stake(self, body: T.CreateStakeRequest) -> T.CreateStakeResponse:
         """
         Create Stake.
@@ -46,14 +59,7 @@ class StakingClient:
         Returns:
             T.CreateStakeResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/staking/stakes",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_STAKE, body=body)
         return cast(T.CreateStakeResponse, response)
 
     def list_stake_actions(
@@ -71,16 +77,27 @@ class StakingClient:
         Returns:
             T.ListStakeActionsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/staking/stakes/{stakeId}/actions",
-            path_params={"stakeId": stake_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_STAKE_ACTIONS, stake_id, query_params=query)
         return cast(T.ListStakeActionsResponse, response)
 
+    def iter_stake_actions(
+        self, stake_id: str, query: T.ListStakeActionsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListStakeActionsItem]:
+        """
+        Iterate over List Stake Actions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            stake_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListStakeActionsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_stake_actions(stake_id, q), query, page_size)
+
     def create_stake_action(self, stake_id: str, body: T.CreateStakeActionRequest) -> T.CreateStakeActionResponse:
         """
         Create Stake Action.
@@ -94,14 +111,7 @@ class StakingClient:
         Returns:
             T.CreateStakeActionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/staking/stakes/{stakeId}/actions",
-            path_params={"stakeId": stake_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_STAKE_ACTION, stake_id, body=body)
         return cast(T.CreateStakeActionResponse, response)
 
     def get_stakes(self, stake_id: str, query: T.GetStakesQuery | None = None) -> T.GetStakesResponse:
@@ -117,14 +127,7 @@ class StakingClient:
         Returns:
             T.GetStakesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/staking/stakes/{stakeId}",
-            path_params={"stakeId": stake_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_STAKES, stake_id, query_params=query)
         return cast(T.GetStakesResponse, response)
 
     def get_stake_rewards(self, stake_id: str) -> T.GetStakeRewardsResponse:
@@ -139,12 +142,5 @@ class StakingClient:
         Returns:
             T.GetStakeRewardsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/staking/stakes/{stakeId}/rewards",
-            path_params={"stakeId": stake_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_STAKE_REWARDS, stake_id)
         return cast(T.GetStakeRewardsResponse, response)
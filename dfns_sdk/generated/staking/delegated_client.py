@@ -1,10 +1,12 @@
 """Delegated client for the staking domain."""
 
-import json
+from collections.abc import Iterator
 from typing import cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,27 @@ class DelegatedStakingClient:
         Returns:
             T.ListStakesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/staking/stakes",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_STAKES, query_params=query)
         return cast(T.ListStakesResponse, response)
 
-    def create_stake_init(self, body: T.CreateStakeRequest) -> UserActionChallengeResponse:
+    def iter_stakes(
+        self, query: T.ListStakesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListStakesItem]:
+        """
+        Iterate over List Stakes.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListStakesItem]: The items of every page.
+        """
+        return iter_items(self.list_stakes, query, page_size)
+
+    def create_stake_init(self, body: T.CreateStakeRequest) -> PreparedAction:
         """
         Initialize Create Stake.
 
@@ -51,20 +63,15 @@ class DelegatedStakingClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/staking/stakes"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_STAKE, E.CREATE_STAKE.path, body)
 
     def create_stake_complete(
-        self, body: T.CreateStakeRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateStakeRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateStakeResponse:
         """
         Complete Create Stake.
@@ -74,20 +81,19 @@ class DelegatedStakingClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_stake_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateStakeResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_STAKE.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/staking/stakes",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_STAKE, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateStakeResponse, response)
 
@@ -106,17 +112,28 @@ class DelegatedStakingClient:
         Returns:
             T.ListStakeActionsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/staking/stakes/{stakeId}/actions",
-            path_params={"stakeId": stake_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_STAKE_ACTIONS, stake_id, query_params=query)
         return cast(T.ListStakeActionsResponse, response)
 
-    def create_stake_action_init(self, stake_id: str, body: T.CreateStakeActionRequest) -> UserActionChallengeResponse:
+    def iter_stake_actions(
+        self, stake_id: str, query: T.ListStakeActionsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListStakeActionsItem]:
+        """
+        Iterate over List Stake Actions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            stake_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListStakeActionsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_stake_actions(stake_id, q), query, page_size)
+
+    def create_stake_action_init(self, stake_id: str, body: T.CreateStakeActionRequest) -> PreparedAction:
         """
         Initialize Create Stake Action.
 
@@ -127,21 +144,18 @@ class DelegatedStakingClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/staking/stakes/{stakeId}/actions"
-        path = path.replace("{stakeId}", str(stake_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_STAKE_ACTION, E.CREATE_STAKE_ACTION.resolve(stake_id), body
         )
 
     def create_stake_action_complete(
-        self, stake_id: str, body: T.CreateStakeActionRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        stake_id: str,
+        body: T.CreateStakeActionRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateStakeActionResponse:
         """
         Complete Create Stake Action.
@@ -152,20 +166,19 @@ class DelegatedStakingClient:
             stake_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_stake_action_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateStakeActionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_STAKE_ACTION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/staking/stakes/{stakeId}/actions",
-            path_params={"stakeId": stake_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_STAKE_ACTION, stake_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateStakeActionResponse, response)
 
@@ -182,14 +195,7 @@ class DelegatedStakingClient:
         Returns:
             T.GetStakesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/staking/stakes/{stakeId}",
-            path_params={"stakeId": stake_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_STAKES, stake_id, query_params=query)
         return cast(T.GetStakesResponse, response)
 
     def get_stake_rewards(self, stake_id: str) -> T.GetStakeRewardsResponse:
@@ -204,12 +210,5 @@ class DelegatedStakingClient:
         Returns:
             T.GetStakeRewardsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/staking/stakes/{stakeId}/rewards",
-            path_params={"stakeId": stake_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_STAKE_REWARDS, stake_id)
         return cast(T.GetStakeRewardsResponse, response)
@@ -0,0 +1,22 @@
+"""Endpoint registry for the staking domain."""
+
+from ..._internal.endpoint import Endpoint
+
+LIST_STAKES = Endpoint("staking.list_stakes", "GET", "/staking/stakes", response_type="ListStakesResponse")
+CREATE_STAKE = Endpoint(
+    "staking.create_stake", "POST", "/staking/stakes", requires_signature=True, response_type="CreateStakeResponse"
+)
+LIST_STAKE_ACTIONS = Endpoint(
+    "staking.list_stake_actions", "GET", "/staking/stakes/{stakeId}/actions", response_type="ListStakeActionsResponse"
+)
+CREATE_STAKE_ACTION = Endpoint(
+    "staking.create_stake_action",
+    "POST",
+    "/staking/stakes/{stakeId}/actions",
+    requires_signature=True,
+    response_type="CreateStakeActionResponse",
+)
+GET_STAKES = Endpoint("staking.get_stakes", "GET", "/staking/stakes/{stakeId}", response_type="GetStakesResponse")
+GET_STAKE_REWARDS = Endpoint(
+    "staking.get_stake_rewards", "GET", "/staking/stakes/{stakeId}/rewards", response_type="GetStakeRewardsResponse"
+)
@@ -4,11 +4,14 @@ from typing import Any, TypedDict
 
 from typing_extensions import NotRequired
 
+ListStakesItem = dict[str, Any]
+"""Item of a listStakes page."""
+
 
 class ListStakesResponse(TypedDict, total=False):
     """listStakes response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListStakesItem]
     next_page_token: NotRequired[str]
 
 
@@ -31,10 +34,14 @@ class CreateStakeResponse(TypedDict, total=False):
     actions: list[dict[str, Any]]
 
 
+ListStakeActionsItem = dict[str, Any]
+"""Item of a listStakeActions page."""
+
+
 class ListStakeActionsResponse(TypedDict, total=False):
     """listStakeActions response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListStakeActionsItem]
     next_page_token: NotRequired[str]
 
 
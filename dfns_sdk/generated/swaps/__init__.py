@@ -1,7 +1,30 @@
 """Swaps domain module."""
 
-from . import types
-from .client import SwapsClient
-from .delegated_client import DelegatedSwapsClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["SwapsClient", "DelegatedSwapsClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncSwapsClient
+    from .async_delegated_client import AsyncDelegatedSwapsClient
+    from .client import SwapsClient
+    from .delegated_client import DelegatedSwapsClient
+
+_EXPORTS = {
+    "SwapsClient": ".client",
+    "DelegatedSwapsClient": ".delegated_client",
+    "AsyncSwapsClient": ".async_client",
+    "AsyncDelegatedSwapsClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["SwapsClient", "DelegatedSwapsClient", "AsyncSwapsClient", "AsyncDelegatedSwapsClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,108 @@
+"""Async client for the swaps domain."""
+
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncSwapsClient:
+    """Async client for swaps operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_swaps(self, query: T.ListSwapsQuery | None = None) -> T.ListSwapsResponse:
+        """
+        List Swaps.
+
+        List all swaps with pagination
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListSwapsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_SWAPS, query_params=query)
+        return cast(T.ListSwapsResponse, response)
+
+    def aiter_swaps(
+        self, query: T.ListSwapsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListSwapsItem]:
+        """
+        Iterate over List Swaps.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListSwapsItem]: The items of every page.
+        """
+        return aiter_items(self.list_swaps, query, page_size)
+
+    async def create_swap(self, body: dict[str, Any]) -> T.CreateSwapResponse:
+        """
+        Create Swap.
+
+        Create a new swap based on an existing quote. This is the second step of the [Swap flow](https://docs.dfns.co/api-reference/swaps#flow-overview).
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateSwapResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_SWAP, body=body)
+        return cast(T.CreateSwapResponse, response)
+
+    async def request_swap_quote(self, body: dict[str, Any]) -> T.RequestSwapQuoteResponse:
+        """
+        Request Swap Quote.
+
+        Request a quote from a given provider for swapping assets. This is the first step of the [Swap flow](https://docs.dfns.co/api-reference/swaps#flow-overview).
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.RequestSwapQuoteResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.REQUEST_SWAP_QUOTE, body=body)
+        return cast(T.RequestSwapQuoteResponse, response)
+
+    async def get_swap(self, swap_id: str) -> T.GetSwapResponse:
+        """
+        Get Swap.
+
+        Get details of a specific swap by its ID
+
+        Args:
+            swap_id: Id of the swap for which we want to get details.
+
+        Returns:
+            T.GetSwapResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_SWAP, swap_id)
+        return cast(T.GetSwapResponse, response)
+
+    async def get_swap_quote(self, quote_id: str) -> T.GetSwapQuoteResponse:
+        """
+        Get Swap Quote.
+
+        Get details of a specific swap quote by its ID
+
+        Args:
+            quote_id: The ID of the Swap Quote.
+
+        Returns:
+            T.GetSwapQuoteResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_SWAP_QUOTE, quote_id)
+        return cast(T.GetSwapQuoteResponse, response)
@@ -1,8 +1,11 @@
 """Client for the swaps domain."""
 
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,16 +27,26 @@ class SwapsClient:
         Returns:
             T.ListSwapsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/swaps",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_SWAPS, query_params=query)
         return cast(T.ListSwapsResponse, response)
 
+    def iter_swaps(
+        self, query: T.ListSwapsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListSwapsItem]:
+        """
+        Iterate over List Swaps.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListSwapsItem]: The items of every page.
+        """
+        return iter_items(self.list_swaps, query, page_size)
+
     def create_swap(self, body: dict[str, Any]) -> T.CreateSwapResponse:
         """
         Create Swap.
@@ -46,14 +59,7 @@ class SwapsClient:
         Returns:
             T.CreateSwapResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/swaps",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_SWAP, body=body)
         return cast(T.CreateSwapResponse, response)
 
     def request_swap_quote(self, body: dict[str, Any]) -> T.RequestSwapQuoteResponse:
@@ -68,14 +74,7 @@ class SwapsClient:
         Returns:
             T.RequestSwapQuoteResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/swaps/quotes",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.REQUEST_SWAP_QUOTE, body=body)
         return cast(T.RequestSwapQuoteResponse, response)
 
     def get_swap(self, swap_id: str) -> T.GetSwapResponse:
@@ -90,14 +89,7 @@ class SwapsClient:
         Returns:
             T.GetSwapResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/swaps/{swapId}",
-            path_params={"swapId": swap_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_SWAP, swap_id)
         return cast(T.GetSwapResponse, response)
 
     def get_swap_quote(self, quote_id: str) -> T.GetSwapQuoteResponse:
@@ -112,12 +104,5 @@ class SwapsClient:
         Returns:
             T.GetSwapQuoteResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/swaps/quotes/{quoteId}",
-            path_params={"quoteId": quote_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_SWAP_QUOTE, quote_id)
         return cast(T.GetSwapQuoteResponse, response)
@@ -1,10 +1,12 @@
 """Delegated client for the swaps domain."""
 
-import json
+from collections.abc import Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,27 @@ class DelegatedSwapsClient:
         Returns:
             T.ListSwapsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/swaps",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_SWAPS, query_params=query)
         return cast(T.ListSwapsResponse, response)
 
-    def create_swap_init(self, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def iter_swaps(
+        self, query: T.ListSwapsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListSwapsItem]:
+        """
+        Iterate over List Swaps.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListSwapsItem]: The items of every page.
+        """
+        return iter_items(self.list_swaps, query, page_size)
+
+    def create_swap_init(self, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Create Swap.
 
@@ -51,20 +63,15 @@ class DelegatedSwapsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/swaps"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_SWAP, E.CREATE_SWAP.path, body)
 
     def create_swap_complete(
-        self, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateSwapResponse:
         """
         Complete Create Swap.
@@ -74,20 +81,19 @@ class DelegatedSwapsClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_swap_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateSwapResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_SWAP.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/swaps",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_SWAP, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateSwapResponse, response)
 
@@ -103,14 +109,7 @@ class DelegatedSwapsClient:
         Returns:
             T.RequestSwapQuoteResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/swaps/quotes",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.REQUEST_SWAP_QUOTE, body=body)
         return cast(T.RequestSwapQuoteResponse, response)
 
     def get_swap(self, swap_id: str) -> T.GetSwapResponse:
@@ -125,14 +124,7 @@ class DelegatedSwapsClient:
         Returns:
             T.GetSwapResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/swaps/{swapId}",
-            path_params={"swapId": swap_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_SWAP, swap_id)
         return cast(T.GetSwapResponse, response)
 
     def get_swap_quote(self, quote_id: str) -> T.GetSwapQuoteResponse:
@@ -147,12 +139,5 @@ class DelegatedSwapsClient:
         Returns:
             T.GetSwapQuoteResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/swaps/quotes/{quoteId}",
-            path_params={"quoteId": quote_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_SWAP_QUOTE, quote_id)
         return cast(T.GetSwapQuoteResponse, response)
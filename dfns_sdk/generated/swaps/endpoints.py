@@ -0,0 +1,15 @@
+"""Endpoint registry for the swaps domain."""
+
+from ..._internal.endpoint import Endpoint
+
+LIST_SWAPS = Endpoint("swaps.list_swaps", "GET", "/swaps", response_type="ListSwapsResponse")
+CREATE_SWAP = Endpoint(
+    "swaps.create_swap", "POST", "/swaps", requires_signature=True, response_type="CreateSwapResponse"
+)
+REQUEST_SWAP_QUOTE = Endpoint(
+    "swaps.request_swap_quote", "POST", "/swaps/quotes", response_type="RequestSwapQuoteResponse"
+)
+GET_SWAP = Endpoint("swaps.get_swap", "GET", "/swaps/{swapId}", response_type="GetSwapResponse")
+GET_SWAP_QUOTE = Endpoint(
+    "swaps.get_swap_quote", "GET", "/swaps/quotes/{quoteId}", response_type="GetSwapQuoteResponse"
+)
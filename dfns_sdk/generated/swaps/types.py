@@ -4,11 +4,14 @@ from typing import Any, Literal, TypedDict
 
 from typing_extensions import NotRequired
 
+ListSwapsItem = dict[str, Any]
+"""Item of a listSwaps page."""
+
 
 class ListSwapsResponse(TypedDict, total=False):
     """listSwaps response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListSwapsItem]
     next_page_token: NotRequired[str]
 
 
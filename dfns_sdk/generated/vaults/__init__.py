@@ -1,7 +1,30 @@
 """Vaults domain module."""
 
-from . import types
-from .client import VaultsClient
-from .delegated_client import DelegatedVaultsClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["VaultsClient", "DelegatedVaultsClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncVaultsClient
+    from .async_delegated_client import AsyncDelegatedVaultsClient
+    from .client import VaultsClient
+    from .delegated_client import DelegatedVaultsClient
+
+_EXPORTS = {
+    "VaultsClient": ".client",
+    "DelegatedVaultsClient": ".delegated_client",
+    "AsyncVaultsClient": ".async_client",
+    "AsyncDelegatedVaultsClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["VaultsClient", "DelegatedVaultsClient", "AsyncVaultsClient", "AsyncDelegatedVaultsClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,319 @@
+"""Async client for the vaults domain."""
+
+from collections.abc import AsyncIterator
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncVaultsClient:
+    """Async client for vaults operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_vaults(self, query: T.ListVaultsQuery | None = None) -> T.ListVaultsResponse:
+        """
+        List Vaults.
+
+        Retrieves the list of Vaults in your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListVaultsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_VAULTS, query_params=query)
+        return cast(T.ListVaultsResponse, response)
+
+    def aiter_vaults(
+        self, query: T.ListVaultsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListVaultsItem]:
+        """
+        Iterate over List Vaults.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListVaultsItem]: The items of every page.
+        """
+        return aiter_items(self.list_vaults, query, page_size)
+
+    async def create_vault(self, body: T.CreateVaultRequest) -> T.CreateVaultResponse:
+        """
+        Create Vault.
+
+        Creates a new Vault.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateVaultResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_VAULT, body=body)
+        return cast(T.CreateVaultResponse, response)
+
+    async def create_vault_address(
+        self, vault_id: str, body: T.CreateVaultAddressRequest
+    ) -> T.CreateVaultAddressResponse:
+        """
+        Create Vault Address.
+
+        Creates a vault address (managed wallet) on a network that supports vaults.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            T.CreateVaultAddressResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_VAULT_ADDRESS, vault_id, body=body)
+        return cast(T.CreateVaultAddressResponse, response)
+
+    async def list_vault_locks(
+        self, vault_id: str, query: T.ListVaultLocksQuery | None = None
+    ) -> T.ListVaultLocksResponse:
+        """
+        List Vault Locks.
+
+        Lists a vault's locks, active and released.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters.
+
+        Returns:
+            T.ListVaultLocksResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_VAULT_LOCKS, vault_id, query_params=query)
+        return cast(T.ListVaultLocksResponse, response)
+
+    def aiter_vault_locks(
+        self, vault_id: str, query: T.ListVaultLocksQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListVaultLocksItem]:
+        """
+        Iterate over List Vault Locks.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListVaultLocksItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_vault_locks(vault_id, q), query, page_size)
+
+    async def create_vault_lock(self, vault_id: str, body: T.CreateVaultLockRequest) -> T.CreateVaultLockResponse:
+        """
+        Create Vault Lock.
+
+        Locks funds from the vault's available balance for off-chain settlement or escrow.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            T.CreateVaultLockResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_VAULT_LOCK, vault_id, body=body)
+        return cast(T.CreateVaultLockResponse, response)
+
+    async def create_vault_transfer(
+        self, vault_id: str, body: T.CreateVaultTransferRequest
+    ) -> T.CreateVaultTransferResponse:
+        """
+        Create Vault Transfer.
+
+        Creates a transfer out of a vault, reserving the amount and estimated fee from the vault's available balance.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            T.CreateVaultTransferResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_VAULT_TRANSFER, vault_id, body=body)
+        return cast(T.CreateVaultTransferResponse, response)
+
+    async def get_vault_lock(self, vault_id: str, lock_id: str) -> T.GetVaultLockResponse:
+        """
+        Get Vault Lock.
+
+        Retrieves a vault lock by its ID.
+
+        Args:
+            vault_id: Vault id.
+            lock_id: The lock to retrieve.
+
+        Returns:
+            T.GetVaultLockResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_VAULT_LOCK, vault_id, lock_id)
+        return cast(T.GetVaultLockResponse, response)
+
+    async def delete_vault_lock(self, vault_id: str, lock_id: str) -> T.DeleteVaultLockResponse:
+        """
+        Delete Vault Lock.
+
+        Releases a lock, returning the locked funds to the vault's available balance. Owner only.
+
+        Args:
+            vault_id: Vault id.
+            lock_id: Vault lock id.
+
+        Returns:
+            T.DeleteVaultLockResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_VAULT_LOCK, vault_id, lock_id)
+        return cast(T.DeleteVaultLockResponse, response)
+
+    async def get_vault(self, vault_id: str) -> T.GetVaultResponse:
+        """
+        Get Vault.
+
+        Retrieves a Vault by its ID.
+
+        Args:
+            vault_id: The vault to retrieve.
+
+        Returns:
+            T.GetVaultResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_VAULT, vault_id)
+        return cast(T.GetVaultResponse, response)
+
+    async def update_vault(self, vault_id: str, body: T.UpdateVaultRequest) -> T.UpdateVaultResponse:
+        """
+        Update Vault.
+
+        Updates an existing Vault.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            T.UpdateVaultResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UPDATE_VAULT, vault_id, body=body)
+        return cast(T.UpdateVaultResponse, response)
+
+    async def list_vault_assets(
+        self, vault_id: str, query: T.ListVaultAssetsQuery | None = None
+    ) -> T.ListVaultAssetsResponse:
+        """
+        List Vault Assets.
+
+        Lists a vault's assets with balances (available/quarantined/locked) and USD valuation.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters.
+
+        Returns:
+            T.ListVaultAssetsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_VAULT_ASSETS, vault_id, query_params=query)
+        return cast(T.ListVaultAssetsResponse, response)
+
+    async def list_vault_balances(
+        self, vault_id: str, query: T.ListVaultBalancesQuery | None = None
+    ) -> T.ListVaultBalancesResponse:
+        """
+        List Vault Balances.
+
+        Lists a vault's balance entries.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters.
+
+        Returns:
+            T.ListVaultBalancesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_VAULT_BALANCES, vault_id, query_params=query)
+        return cast(T.ListVaultBalancesResponse, response)
+
+    def aiter_vault_balances(
+        self, vault_id: str, query: T.ListVaultBalancesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListVaultBalancesItem]:
+        """
+        Iterate over List Vault Balances.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListVaultBalancesItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_vault_balances(vault_id, q), query, page_size)
+
+    async def release_quarantine(
+        self, vault_id: str, quarantine_id: str, body: T.ReleaseQuarantineRequest
+    ) -> T.ReleaseQuarantineResponse:
+        """
+        Release Quarantine.
+
+        Releases quarantined funds into the available balance.
+
+        Args:
+            vault_id: Vault id.
+            quarantine_id: Vault quarantine id.
+            body: Request body.
+
+        Returns:
+            T.ReleaseQuarantineResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.RELEASE_QUARANTINE, vault_id, quarantine_id, body=body)
+        return cast(T.ReleaseQuarantineResponse, response)
+
+    async def tag_vault(self, vault_id: str, body: T.TagVaultRequest) -> T.TagVaultResponse:
+        """
+        Tag Vault.
+
+        Add tags to a vault.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            T.TagVaultResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.TAG_VAULT, vault_id, body=body)
+        return cast(T.TagVaultResponse, response)
+
+    async def untag_vault(self, vault_id: str, body: T.UntagVaultRequest) -> T.UntagVaultResponse:
+        """
+        Untag Vault.
+
+        Removes the specified tags from a vault.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            T.UntagVaultResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UNTAG_VAULT, vault_id, body=body)
+        return cast(T.UntagVaultResponse, response)
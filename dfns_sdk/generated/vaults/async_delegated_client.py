@@ -0,0 +1,614 @@
+"""Async delegated client for the vaults domain."""
+
+from collections.abc import AsyncIterator
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedVaultsClient:
+    """
+    Async delegated client for vaults operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_vaults(self, query: T.ListVaultsQuery | None = None) -> T.ListVaultsResponse:
+        """
+        List Vaults.
+
+        Retrieves the list of Vaults in your organization.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListVaultsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_VAULTS, query_params=query)
+        return cast(T.ListVaultsResponse, response)
+
+    def aiter_vaults(
+        self, query: T.ListVaultsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListVaultsItem]:
+        """
+        Iterate over List Vaults.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListVaultsItem]: The items of every page.
+        """
+        return aiter_items(self.list_vaults, query, page_size)
+
+    async def create_vault_init(self, body: T.CreateVaultRequest) -> PreparedAction:
+        """
+        Initialize Create Vault.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.CREATE_VAULT, E.CREATE_VAULT.path, body)
+
+    async def create_vault_complete(
+        self,
+        body: T.CreateVaultRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateVaultResponse:
+        """
+        Complete Create Vault.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_vault_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateVaultResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_VAULT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_VAULT, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateVaultResponse, response)
+
+    async def create_vault_address_init(self, vault_id: str, body: T.CreateVaultAddressRequest) -> PreparedAction:
+        """
+        Initialize Create Vault Address.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_VAULT_ADDRESS, E.CREATE_VAULT_ADDRESS.resolve(vault_id), body
+        )
+
+    async def create_vault_address_complete(
+        self,
+        vault_id: str,
+        body: T.CreateVaultAddressRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateVaultAddressResponse:
+        """
+        Complete Create Vault Address.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_vault_address_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateVaultAddressResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_VAULT_ADDRESS.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_VAULT_ADDRESS, vault_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateVaultAddressResponse, response)
+
+    async def list_vault_locks(
+        self, vault_id: str, query: T.ListVaultLocksQuery | None = None
+    ) -> T.ListVaultLocksResponse:
+        """
+        List Vault Locks.
+
+        Lists a vault's locks, active and released.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters.
+
+        Returns:
+            T.ListVaultLocksResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_VAULT_LOCKS, vault_id, query_params=query)
+        return cast(T.ListVaultLocksResponse, response)
+
+    def aiter_vault_locks(
+        self, vault_id: str, query: T.ListVaultLocksQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListVaultLocksItem]:
+        """
+        Iterate over List Vault Locks.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListVaultLocksItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_vault_locks(vault_id, q), query, page_size)
+
+    async def create_vault_lock_init(self, vault_id: str, body: T.CreateVaultLockRequest) -> PreparedAction:
+        """
+        Initialize Create Vault Lock.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_VAULT_LOCK, E.CREATE_VAULT_LOCK.resolve(vault_id), body
+        )
+
+    async def create_vault_lock_complete(
+        self,
+        vault_id: str,
+        body: T.CreateVaultLockRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateVaultLockResponse:
+        """
+        Complete Create Vault Lock.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_vault_lock_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateVaultLockResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_VAULT_LOCK.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_VAULT_LOCK, vault_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateVaultLockResponse, response)
+
+    async def create_vault_transfer_init(self, vault_id: str, body: T.CreateVaultTransferRequest) -> PreparedAction:
+        """
+        Initialize Create Vault Transfer.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_VAULT_TRANSFER, E.CREATE_VAULT_TRANSFER.resolve(vault_id), body
+        )
+
+    async def create_vault_transfer_complete(
+        self,
+        vault_id: str,
+        body: T.CreateVaultTransferRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateVaultTransferResponse:
+        """
+        Complete Create Vault Transfer.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_vault_transfer_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateVaultTransferResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_VAULT_TRANSFER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_VAULT_TRANSFER, vault_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateVaultTransferResponse, response)
+
+    async def get_vault_lock(self, vault_id: str, lock_id: str) -> T.GetVaultLockResponse:
+        """
+        Get Vault Lock.
+
+        Retrieves a vault lock by its ID.
+
+        Args:
+            vault_id: Vault id.
+            lock_id: The lock to retrieve.
+
+        Returns:
+            T.GetVaultLockResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_VAULT_LOCK, vault_id, lock_id)
+        return cast(T.GetVaultLockResponse, response)
+
+    async def delete_vault_lock_init(self, vault_id: str, lock_id: str) -> PreparedAction:
+        """
+        Initialize Delete Vault Lock.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            vault_id: Vault id.
+            lock_id: Vault lock id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_VAULT_LOCK, E.DELETE_VAULT_LOCK.resolve(vault_id, lock_id)
+        )
+
+    async def delete_vault_lock_complete(
+        self,
+        vault_id: str,
+        lock_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.DeleteVaultLockResponse:
+        """
+        Complete Delete Vault Lock.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            vault_id: Vault id.
+            lock_id: Vault lock id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_vault_lock_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeleteVaultLockResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_VAULT_LOCK.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_VAULT_LOCK, vault_id, lock_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeleteVaultLockResponse, response)
+
+    async def get_vault(self, vault_id: str) -> T.GetVaultResponse:
+        """
+        Get Vault.
+
+        Retrieves a Vault by its ID.
+
+        Args:
+            vault_id: The vault to retrieve.
+
+        Returns:
+            T.GetVaultResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_VAULT, vault_id)
+        return cast(T.GetVaultResponse, response)
+
+    async def update_vault_init(self, vault_id: str, body: T.UpdateVaultRequest) -> PreparedAction:
+        """
+        Initialize Update Vault.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_VAULT, E.UPDATE_VAULT.resolve(vault_id), body
+        )
+
+    async def update_vault_complete(
+        self,
+        vault_id: str,
+        body: T.UpdateVaultRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UpdateVaultResponse:
+        """
+        Complete Update Vault.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_vault_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UpdateVaultResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_VAULT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UPDATE_VAULT, vault_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.UpdateVaultResponse, response)
+
+    async def list_vault_assets(
+        self, vault_id: str, query: T.ListVaultAssetsQuery | None = None
+    ) -> T.ListVaultAssetsResponse:
+        """
+        List Vault Assets.
+
+        Lists a vault's assets with balances (available/quarantined/locked) and USD valuation.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters.
+
+        Returns:
+            T.ListVaultAssetsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_VAULT_ASSETS, vault_id, query_params=query)
+        return cast(T.ListVaultAssetsResponse, response)
+
+    async def list_vault_balances(
+        self, vault_id: str, query: T.ListVaultBalancesQuery | None = None
+    ) -> T.ListVaultBalancesResponse:
+        """
+        List Vault Balances.
+
+        Lists a vault's balance entries.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters.
+
+        Returns:
+            T.ListVaultBalancesResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_VAULT_BALANCES, vault_id, query_params=query)
+        return cast(T.ListVaultBalancesResponse, response)
+
+    def aiter_vault_balances(
+        self, vault_id: str, query: T.ListVaultBalancesQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListVaultBalancesItem]:
+        """
+        Iterate over List Vault Balances.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListVaultBalancesItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_vault_balances(vault_id, q), query, page_size)
+
+    async def release_quarantine_init(
+        self, vault_id: str, quarantine_id: str, body: T.ReleaseQuarantineRequest
+    ) -> PreparedAction:
+        """
+        Initialize Release Quarantine.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            vault_id: Vault id.
+            quarantine_id: Vault quarantine id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.RELEASE_QUARANTINE, E.RELEASE_QUARANTINE.resolve(vault_id, quarantine_id), body
+        )
+
+    async def release_quarantine_complete(
+        self,
+        vault_id: str,
+        quarantine_id: str,
+        body: T.ReleaseQuarantineRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.ReleaseQuarantineResponse:
+        """
+        Complete Release Quarantine.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            vault_id: Vault id.
+            quarantine_id: Vault quarantine id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of release_quarantine_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ReleaseQuarantineResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.RELEASE_QUARANTINE.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.RELEASE_QUARANTINE, vault_id, quarantine_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ReleaseQuarantineResponse, response)
+
+    async def tag_vault_init(self, vault_id: str, body: T.TagVaultRequest) -> PreparedAction:
+        """
+        Initialize Tag Vault.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.TAG_VAULT, E.TAG_VAULT.resolve(vault_id), body)
+
+    async def tag_vault_complete(
+        self,
+        vault_id: str,
+        body: T.TagVaultRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.TagVaultResponse:
+        """
+        Complete Tag Vault.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of tag_vault_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.TagVaultResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.TAG_VAULT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.TAG_VAULT, vault_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.TagVaultResponse, response)
+
+    async def untag_vault_init(self, vault_id: str, body: T.UntagVaultRequest) -> PreparedAction:
+        """
+        Initialize Untag Vault.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UNTAG_VAULT, E.UNTAG_VAULT.resolve(vault_id), body
+        )
+
+    async def untag_vault_complete(
+        self,
+        vault_id: str,
+        body: T.UntagVaultRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UntagVaultResponse:
+        """
+        Complete Untag Vault.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            vault_id: Vault id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of untag_vault_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UntagVaultResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UNTAG_VAULT.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UNTAG_VAULT, vault_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.UntagVaultResponse, response)
@@ -1,8 +1,11 @@
 """Client for the vaults domain."""
 
+from collections.abc import Iterator
 from typing import cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,16 +27,26 @@ class VaultsClient:
         Returns:
             T.ListVaultsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_VAULTS, query_params=query)
         return cast(T.ListVaultsResponse, response)
 
+    def iter_vaults(
+        self, query: T.ListVaultsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListVaultsItem]:
+        """
+        Iterate over List Vaults.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListVaultsItem]: The items of every page.
+        """
+        return iter_items(self.list_vaults, query, page_size)
+
     def create_vault(self, body: T.CreateVaultRequest) -> T.CreateVaultResponse:
         """
         Create Vault.
@@ -46,14 +59,7 @@ class VaultsClient:
         Returns:
             T.CreateVaultResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/vaults",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_VAULT, body=body)
         return cast(T.CreateVaultResponse, response)
 
     def create_vault_address(self, vault_id: str, body: T.CreateVaultAddressRequest) -> T.CreateVaultAddressResponse:
@@ -69,14 +75,7 @@ class VaultsClient:
         Returns:
             T.CreateVaultAddressResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/vaults/{vaultId}/addresses",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_VAULT_ADDRESS, vault_id, body=body)
         return cast(T.CreateVaultAddressResponse, response)
 
     def list_vault_locks(self, vault_id: str, query: T.ListVaultLocksQuery | None = None) -> T.ListVaultLocksResponse:
@@ -92,16 +91,27 @@ class VaultsClient:
         Returns:
             T.ListVaultLocksResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults/{vaultId}/locks",
-            path_params={"vaultId": vault_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_VAULT_LOCKS, vault_id, query_params=query)
         return cast(T.ListVaultLocksResponse, response)
 
+    def iter_vault_locks(
+        self, vault_id: str, query: T.ListVaultLocksQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListVaultLocksItem]:
+        """
+        Iterate over List Vault Locks.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListVaultLocksItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_vault_locks(vault_id, q), query, page_size)
+
     def create_vault_lock(self, vault_id: str, body: T.CreateVaultLockRequest) -> T.CreateVaultLockResponse:
         """
         Create Vault Lock.
@@ -115,14 +125,7 @@ class VaultsClient:
         Returns:
             T.CreateVaultLockResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/vaults/{vaultId}/locks",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_VAULT_LOCK, vault_id, body=body)
         return cast(T.CreateVaultLockResponse, response)
 
     def create_vault_transfer(self, vault_id: str, body: T.CreateVaultTransferRequest) -> T.CreateVaultTransferResponse:
@@ -138,14 +141,7 @@ class VaultsClient:
         Returns:
             T.CreateVaultTransferResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/vaults/{vaultId}/transfers",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_VAULT_TRANSFER, vault_id, body=body)
         return cast(T.CreateVaultTransferResponse, response)
 
     def get_vault_lock(self, vault_id: str, lock_id: str) -> T.GetVaultLockResponse:
@@ -161,14 +157,7 @@ class VaultsClient:
         Returns:
             T.GetVaultLockResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults/{vaultId}/locks/{lockId}",
-            path_params={"vaultId": vault_id, "lockId": lock_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_VAULT_LOCK, vault_id, lock_id)
         return cast(T.GetVaultLockResponse, response)
 
     def delete_vault_lock(self, vault_id: str, lock_id: str) -> T.DeleteVaultLockResponse:
@@ -184,14 +173,7 @@ class VaultsClient:
         Returns:
             T.DeleteVaultLockResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/vaults/{vaultId}/locks/{lockId}",
-            path_params={"vaultId": vault_id, "lockId": lock_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_VAULT_LOCK, vault_id, lock_id)
         return cast(T.DeleteVaultLockResponse, response)
 
     def get_vault(self, vault_id: str) -> T.GetVaultResponse:
@@ -206,14 +188,7 @@ class VaultsClient:
         Returns:
             T.GetVaultResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults/{vaultId}",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_VAULT, vault_id)
         return cast(T.GetVaultResponse, response)
 
     def update_vault(self, vault_id: str, body: T.UpdateVaultRequest) -> T.UpdateVaultResponse:
@@ -229,14 +204,7 @@ class VaultsClient:
         Returns:
             T.UpdateVaultResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/vaults/{vaultId}",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UPDATE_VAULT, vault_id, body=body)
         return cast(T.UpdateVaultResponse, response)
 
     def list_vault_assets(
@@ -254,14 +222,7 @@ class VaultsClient:
         Returns:
             T.ListVaultAssetsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults/{vaultId}/assets",
-            path_params={"vaultId": vault_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_VAULT_ASSETS, vault_id, query_params=query)
         return cast(T.ListVaultAssetsResponse, response)
 
     def list_vault_balances(
@@ -279,16 +240,27 @@ class VaultsClient:
         Returns:
             T.ListVaultBalancesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults/{vaultId}/balances",
-            path_params={"vaultId": vault_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_VAULT_BALANCES, vault_id, query_params=query)
         return cast(T.ListVaultBalancesResponse, response)
 
+    def iter_vault_balances(
+        self, vault_id: str, query: T.ListVaultBalancesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListVaultBalancesItem]:
+        """
+        Iterate over List Vault Balances.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListVaultBalancesItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_vault_balances(vault_id, q), query, page_size)
+
     def release_quarantine(
         self, vault_id: str, quarantine_id: str, body: T.ReleaseQuarantineRequest
     ) -> T.ReleaseQuarantineResponse:
@@ -305,14 +277,7 @@ class VaultsClient:
         Returns:
             T.ReleaseQuarantineResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/vaults/{vaultId}/quarantines/{quarantineId}/release",
-            path_params={"vaultId": vault_id, "quarantineId": quarantine_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.RELEASE_QUARANTINE, vault_id, quarantine_id, body=body)
         return cast(T.ReleaseQuarantineResponse, response)
 
     def tag_vault(self, vault_id: str, body: T.TagVaultRequest) -> T.TagVaultResponse:
@@ -328,14 +293,7 @@ class VaultsClient:
         Returns:
             T.TagVaultResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/vaults/{vaultId}/tags",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.TAG_VAULT, vault_id, body=body)
         return cast(T.TagVaultResponse, response)
 
     def untag_vault(self, vault_id: str, body: T.UntagVaultRequest) -> T.UntagVaultResponse:
@@ -351,12 +309,5 @@ class VaultsClient:
         Returns:
             T.UntagVaultResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/vaults/{vaultId}/tags",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UNTAG_VAULT, vault_id, body=body)
         return cast(T.UntagVaultResponse, response)
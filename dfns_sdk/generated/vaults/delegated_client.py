@@ -1,10 +1,12 @@
 """Delegated client for the vaults domain."""
 
-import json
+from collections.abc import Iterator
 from typing import cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,27 @@ class DelegatedVaultsClient:
         Returns:
             T.ListVaultsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_VAULTS, query_params=query)
         return cast(T.ListVaultsResponse, response)
 
-    def create_vault_init(self, body: T.CreateVaultRequest) -> UserActionChallengeResponse:
+    def iter_vaults(
+        self, query: T.ListVaultsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListVaultsItem]:
+        """
+        Iterate over List Vaults.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListVaultsItem]: The items of every page.
+        """
+        return iter_items(self.list_vaults, query, page_size)
+
+    def create_vault_init(self, body: T.CreateVaultRequest) -> PreparedAction:
         """
         Initialize Create Vault.
 
@@ -51,20 +63,15 @@ class DelegatedVaultsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/vaults"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_VAULT, E.CREATE_VAULT.path, body)
 
     def create_vault_complete(
-        self, body: T.CreateVaultRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateVaultRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateVaultResponse:
         """
         Complete Create Vault.
@@ -74,26 +81,23 @@ class DelegatedVaultsClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_vault_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateVaultResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_VAULT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/vaults",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_VAULT, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateVaultResponse, response)
 
-    def create_vault_address_init(
-        self, vault_id: str, body: T.CreateVaultAddressRequest
-    ) -> UserActionChallengeResponse:
+    def create_vault_address_init(self, vault_id: str, body: T.CreateVaultAddressRequest) -> PreparedAction:
         """
         Initialize Create Vault Address.
 
@@ -104,21 +108,18 @@ class DelegatedVaultsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/vaults/{vaultId}/addresses"
-        path = path.replace("{vaultId}", str(vault_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_VAULT_ADDRESS, E.CREATE_VAULT_ADDRESS.resolve(vault_id), body
         )
 
     def create_vault_address_complete(
-        self, vault_id: str, body: T.CreateVaultAddressRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        vault_id: str,
+        body: T.CreateVaultAddressRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateVaultAddressResponse:
         """
         Complete Create Vault Address.
@@ -129,20 +130,19 @@ class DelegatedVaultsClient:
             vault_id: Vault id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_vault_address_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateVaultAddressResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_VAULT_ADDRESS.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/vaults/{vaultId}/addresses",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_VAULT_ADDRESS, vault_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateVaultAddressResponse, response)
 
@@ -159,17 +159,28 @@ class DelegatedVaultsClient:
         Returns:
             T.ListVaultLocksResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults/{vaultId}/locks",
-            path_params={"vaultId": vault_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_VAULT_LOCKS, vault_id, query_params=query)
         return cast(T.ListVaultLocksResponse, response)
 
-    def create_vault_lock_init(self, vault_id: str, body: T.CreateVaultLockRequest) -> UserActionChallengeResponse:
+    def iter_vault_locks(
+        self, vault_id: str, query: T.ListVaultLocksQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListVaultLocksItem]:
+        """
+        Iterate over List Vault Locks.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListVaultLocksItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_vault_locks(vault_id, q), query, page_size)
+
+    def create_vault_lock_init(self, vault_id: str, body: T.CreateVaultLockRequest) -> PreparedAction:
         """
         Initialize Create Vault Lock.
 
@@ -180,21 +191,18 @@ class DelegatedVaultsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/vaults/{vaultId}/locks"
-        path = path.replace("{vaultId}", str(vault_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_VAULT_LOCK, E.CREATE_VAULT_LOCK.resolve(vault_id), body
         )
 
     def create_vault_lock_complete(
-        self, vault_id: str, body: T.CreateVaultLockRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        vault_id: str,
+        body: T.CreateVaultLockRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateVaultLockResponse:
         """
         Complete Create Vault Lock.
@@ -205,26 +213,23 @@ class DelegatedVaultsClient:
             vault_id: Vault id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_vault_lock_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateVaultLockResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_VAULT_LOCK.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/vaults/{vaultId}/locks",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_VAULT_LOCK, vault_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateVaultLockResponse, response)
 
-    def create_vault_transfer_init(
-        self, vault_id: str, body: T.CreateVaultTransferRequest
-    ) -> UserActionChallengeResponse:
+    def create_vault_transfer_init(self, vault_id: str, body: T.CreateVaultTransferRequest) -> PreparedAction:
         """
         Initialize Create Vault Transfer.
 
@@ -235,21 +240,18 @@ class DelegatedVaultsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/vaults/{vaultId}/transfers"
-        path = path.replace("{vaultId}", str(vault_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CREATE_VAULT_TRANSFER, E.CREATE_VAULT_TRANSFER.resolve(vault_id), body
         )
 
     def create_vault_transfer_complete(
-        self, vault_id: str, body: T.CreateVaultTransferRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        vault_id: str,
+        body: T.CreateVaultTransferRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateVaultTransferResponse:
         """
         Complete Create Vault Transfer.
@@ -260,20 +262,19 @@ class DelegatedVaultsClient:
             vault_id: Vault id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_vault_transfer_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateVaultTransferResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_VAULT_TRANSFER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/vaults/{vaultId}/transfers",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_VAULT_TRANSFER, vault_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateVaultTransferResponse, response)
 
@@ -290,17 +291,10 @@ class DelegatedVaultsClient:
         Returns:
             T.GetVaultLockResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults/{vaultId}/locks/{lockId}",
-            path_params={"vaultId": vault_id, "lockId": lock_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_VAULT_LOCK, vault_id, lock_id)
         return cast(T.GetVaultLockResponse, response)
 
-    def delete_vault_lock_init(self, vault_id: str, lock_id: str) -> UserActionChallengeResponse:
+    def delete_vault_lock_init(self, vault_id: str, lock_id: str) -> PreparedAction:
         """
         Initialize Delete Vault Lock.
 
@@ -311,22 +305,18 @@ class DelegatedVaultsClient:
             lock_id: Vault lock id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/vaults/{vaultId}/locks/{lockId}"
-        path = path.replace("{vaultId}", str(vault_id))
-        path = path.replace("{lockId}", str(lock_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_VAULT_LOCK, E.DELETE_VAULT_LOCK.resolve(vault_id, lock_id)
         )
 
     def delete_vault_lock_complete(
-        self, vault_id: str, lock_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        vault_id: str,
+        lock_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.DeleteVaultLockResponse:
         """
         Complete Delete Vault Lock.
@@ -337,20 +327,19 @@ class DelegatedVaultsClient:
             vault_id: Vault id.
             lock_id: Vault lock id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_vault_lock_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeleteVaultLockResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_VAULT_LOCK.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/vaults/{vaultId}/locks/{lockId}",
-            path_params={"vaultId": vault_id, "lockId": lock_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELETE_VAULT_LOCK, vault_id, lock_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeleteVaultLockResponse, response)
 
@@ -366,17 +355,10 @@ class DelegatedVaultsClient:
         Returns:
             T.GetVaultResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults/{vaultId}",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_VAULT, vault_id)
         return cast(T.GetVaultResponse, response)
 
-    def update_vault_init(self, vault_id: str, body: T.UpdateVaultRequest) -> UserActionChallengeResponse:
+    def update_vault_init(self, vault_id: str, body: T.UpdateVaultRequest) -> PreparedAction:
         """
         Initialize Update Vault.
 
@@ -387,21 +369,16 @@ class DelegatedVaultsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/vaults/{vaultId}"
-        path = path.replace("{vaultId}", str(vault_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.UPDATE_VAULT, E.UPDATE_VAULT.resolve(vault_id), body)
 
     def update_vault_complete(
-        self, vault_id: str, body: T.UpdateVaultRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        vault_id: str,
+        body: T.UpdateVaultRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UpdateVaultResponse:
         """
         Complete Update Vault.
@@ -412,20 +389,19 @@ class DelegatedVaultsClient:
             vault_id: Vault id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_vault_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UpdateVaultResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_VAULT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/vaults/{vaultId}",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UPDATE_VAULT, vault_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.UpdateVaultResponse, response)
 
@@ -444,14 +420,7 @@ class DelegatedVaultsClient:
         Returns:
             T.ListVaultAssetsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults/{vaultId}/assets",
-            path_params={"vaultId": vault_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_VAULT_ASSETS, vault_id, query_params=query)
         return cast(T.ListVaultAssetsResponse, response)
 
     def list_vault_balances(
@@ -469,19 +438,30 @@ class DelegatedVaultsClient:
         Returns:
             T.ListVaultBalancesResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/vaults/{vaultId}/balances",
-            path_params={"vaultId": vault_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_VAULT_BALANCES, vault_id, query_params=query)
         return cast(T.ListVaultBalancesResponse, response)
 
+    def iter_vault_balances(
+        self, vault_id: str, query: T.ListVaultBalancesQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListVaultBalancesItem]:
+        """
+        Iterate over List Vault Balances.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            vault_id: Vault id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListVaultBalancesItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_vault_balances(vault_id, q), query, page_size)
+
     def release_quarantine_init(
         self, vault_id: str, quarantine_id: str, body: T.ReleaseQuarantineRequest
-    ) -> UserActionChallengeResponse:
+    ) -> PreparedAction:
         """
         Initialize Release Quarantine.
 
@@ -493,18 +473,10 @@ class DelegatedVaultsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/vaults/{vaultId}/quarantines/{quarantineId}/release"
-        path = path.replace("{vaultId}", str(vault_id))
-        path = path.replace("{quarantineId}", str(quarantine_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.RELEASE_QUARANTINE, E.RELEASE_QUARANTINE.resolve(vault_id, quarantine_id), body
         )
 
     def release_quarantine_complete(
@@ -513,6 +485,7 @@ class DelegatedVaultsClient:
         quarantine_id: str,
         body: T.ReleaseQuarantineRequest,
         signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.ReleaseQuarantineResponse:
         """
         Complete Release Quarantine.
@@ -524,24 +497,23 @@ class DelegatedVaultsClient:
             quarantine_id: Vault quarantine id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of release_quarantine_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ReleaseQuarantineResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.RELEASE_QUARANTINE.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/vaults/{vaultId}/quarantines/{quarantineId}/release",
-            path_params={"vaultId": vault_id, "quarantineId": quarantine_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.RELEASE_QUARANTINE, vault_id, quarantine_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ReleaseQuarantineResponse, response)
 
-    def tag_vault_init(self, vault_id: str, body: T.TagVaultRequest) -> UserActionChallengeResponse:
+    def tag_vault_init(self, vault_id: str, body: T.TagVaultRequest) -> PreparedAction:
         """
         Initialize Tag Vault.
 
@@ -552,21 +524,16 @@ class DelegatedVaultsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/vaults/{vaultId}/tags"
-        path = path.replace("{vaultId}", str(vault_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.TAG_VAULT, E.TAG_VAULT.resolve(vault_id), body)
 
     def tag_vault_complete(
-        self, vault_id: str, body: T.TagVaultRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        vault_id: str,
+        body: T.TagVaultRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.TagVaultResponse:
         """
         Complete Tag Vault.
@@ -577,24 +544,21 @@ class DelegatedVaultsClient:
             vault_id: Vault id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of tag_vault_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.TagVaultResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge, E.TAG_VAULT.operation)
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/vaults/{vaultId}/tags",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.TAG_VAULT, vault_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.TagVaultResponse, response)
 
-    def untag_vault_init(self, vault_id: str, body: T.UntagVaultRequest) -> UserActionChallengeResponse:
+    def untag_vault_init(self, vault_id: str, body: T.UntagVaultRequest) -> PreparedAction:
         """
         Initialize Untag Vault.
 
@@ -605,21 +569,16 @@ class DelegatedVaultsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/vaults/{vaultId}/tags"
-        path = path.replace("{vaultId}", str(vault_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.UNTAG_VAULT, E.UNTAG_VAULT.resolve(vault_id), body)
 
     def untag_vault_complete(
-        self, vault_id: str, body: T.UntagVaultRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        vault_id: str,
+        body: T.UntagVaultRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UntagVaultResponse:
         """
         Complete Untag Vault.
@@ -630,19 +589,18 @@ class DelegatedVaultsClient:
             vault_id: Vault id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of untag_vault_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UntagVaultResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UNTAG_VAULT.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/vaults/{vaultId}/tags",
-            path_params={"vaultId": vault_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UNTAG_VAULT, vault_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.UntagVaultResponse, response)
@@ -0,0 +1,69 @@
+"""Endpoint registry for the vaults domain."""
+
+from ..._internal.endpoint import Endpoint
+
+LIST_VAULTS = Endpoint("vaults.list_vaults", "GET", "/vaults", response_type="ListVaultsResponse")
+CREATE_VAULT = Endpoint(
+    "vaults.create_vault", "POST", "/vaults", requires_signature=True, response_type="CreateVaultResponse"
+)
+CREATE_VAULT_ADDRESS = Endpoint(
+    "vaults.create_vault_address",
+    "POST",
+    "/vaults/{vaultId}/addresses",
+    requires_signature=True,
+    response_type="CreateVaultAddressResponse",
+)
+LIST_VAULT_LOCKS = Endpoint(
+    "vaults.list_vault_locks", "GET", "/vaults/{vaultId}/locks", response_type="ListVaultLocksResponse"
+)
+CREATE_VAULT_LOCK = Endpoint(
+    "vaults.create_vault_lock",
+    "POST",
+    "/vaults/{vaultId}/locks",
+    requires_signature=True,
+    response_type="CreateVaultLockResponse",
+)
+CREATE_VAULT_TRANSFER = Endpoint(
+    "vaults.create_vault_transfer",
+    "POST",
+    "/vaults/{vaultId}/transfers",
+    requires_signature=True,
+    response_type="CreateVaultTransferResponse",
+)
+GET_VAULT_LOCK = Endpoint(
+    "vaults.get_vault_lock", "GET", "/vaults/{vaultId}/locks/{lockId}", response_type="GetVaultLockResponse"
+)
+DELETE_VAULT_LOCK = Endpoint(
+    "vaults.delete_vault_lock",
+    "DELETE",
+    "/vaults/{vaultId}/locks/{lockId}",
+    requires_signature=True,
+    response_type="DeleteVaultLockResponse",
+)
+GET_VAULT = Endpoint("vaults.get_vault", "GET", "/vaults/{vaultId}", response_type="GetVaultResponse")
+UPDATE_VAULT = Endpoint(
+    "vaults.update_vault", "PUT", "/vaults/{vaultId}", requires_signature=True, response_type="UpdateVaultResponse"
+)
+LIST_VAULT_ASSETS = Endpoint(
+    "vaults.list_vault_assets", "GET", "/vaults/{vaultId}/assets", response_type="ListVaultAssetsResponse"
+)
+LIST_VAULT_BALANCES = Endpoint(
+    "vaults.list_vault_balances", "GET", "/vaults/{vaultId}/balances", response_type="ListVaultBalancesResponse"
+)
+RELEASE_QUARANTINE = Endpoint(
+    "vaults.release_quarantine",
+    "POST",
+    "/vaults/{vaultId}/quarantines/{quarantineId}/release",
+    requires_signature=True,
+    response_type="ReleaseQuarantineResponse",
+)
+TAG_VAULT = Endpoint(
+    "vaults.tag_vault", "PUT", "/vaults/{vaultId}/tags", requires_signature=True, response_type="TagVaultResponse"
+)
+UNTAG_VAULT = Endpoint(
+    "vaults.untag_vault",
+    "DELETE",
+    "/vaults/{vaultId}/tags",
+    requires_signature=True,
+    response_type="UntagVaultResponse",
+)
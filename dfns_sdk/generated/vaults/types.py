@@ -4,11 +4,14 @@ from typing import Any, Literal, TypedDict
 
 from typing_extensions import NotRequired
 
+ListVaultsItem = dict[str, Any]
+"""Item of a listVaults page."""
+
 
 class ListVaultsResponse(TypedDict, total=False):
     """listVaults response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListVaultsItem]
     next_page_token: NotRequired[str]
 
 
@@ -114,10 +117,14 @@ class CreateVaultAddressResponse(TypedDict, total=False):
     address: str
 
 
+ListVaultLocksItem = dict[str, Any]
+"""Item of a listVaultLocks page."""
+
+
 class ListVaultLocksResponse(TypedDict, total=False):
     """listVaultLocks response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListVaultLocksItem]
     next_page_token: NotRequired[str]
 
 
@@ -381,10 +388,14 @@ class ListVaultAssetsQuery(TypedDict, total=False):
     network: NotRequired[str]
 
 
+ListVaultBalancesItem = dict[str, Any]
+"""Item of a listVaultBalances page."""
+
+
 class ListVaultBalancesResponse(TypedDict, total=False):
     """listVaultBalances response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListVaultBalancesItem]
     next_page_token: NotRequired[str]
 
 
@@ -1,7 +1,30 @@
 """Wallets domain module."""
 
-from . import types
-from .client import WalletsClient
-from .delegated_client import DelegatedWalletsClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["WalletsClient", "DelegatedWalletsClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncWalletsClient
+    from .async_delegated_client import AsyncDelegatedWalletsClient
+    from .client import WalletsClient
+    from .delegated_client import DelegatedWalletsClient
+
+_EXPORTS = {
+    "WalletsClient": ".client",
+    "DelegatedWalletsClient": ".delegated_client",
+    "AsyncWalletsClient": ".async_client",
+    "AsyncDelegatedWalletsClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["WalletsClient", "DelegatedWalletsClient", "AsyncWalletsClient", "AsyncDelegatedWalletsClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
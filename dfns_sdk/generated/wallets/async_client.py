@@ -0,0 +1,788 @@
+"""Async client for the wallets domain."""
+
+from collections.abc import AsyncIterator, Collection
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items, aiter_streamed_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncWalletsClient:
+    """Async client for wallets operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def abort_transaction(self, wallet_id: str, transaction_id: str) -> T.AbortTransactionResponse:
+        """
+              Abort Transaction.
+
+              Aborts a transaction that is currently in 'Executing' status and has not yet been signed. Sets the transaction status to 'Failed' and removes it from the retry queue.
+
+        This is useful when a transaction is stuck in the execution pipeline (e.g., during construct or sign phase) and you want to abort it without waiting for it to fail on its own.
+
+        Unlike cancel, which creates a replacement on-chain transaction, abort simply marks the transaction as failed without any blockchain interaction.
+
+              Args:
+                  wallet_id: Wallet id.
+                  transaction_id: Transaction id.
+
+              Returns:
+                  T.AbortTransactionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ABORT_TRANSACTION, wallet_id, transaction_id)
+        return cast(T.AbortTransactionResponse, response)
+
+    async def abort_transfer(self, wallet_id: str, transfer_id: str) -> T.AbortTransferResponse:
+        """
+              Abort Transfer.
+
+              Aborts a transfer that is currently in 'Executing' status and has not yet been signed. Sets the transfer status to 'Failed' and removes it from the retry queue.
+
+        This is useful when a transfer is stuck in the execution pipeline (e.g., during construct or sign phase) and you want to abort it without waiting for it to fail on its own.
+
+        Unlike cancel, which creates a replacement on-chain transaction, abort simply marks the transfer as failed without any blockchain interaction.
+
+              Args:
+                  wallet_id: Wallet id.
+                  transfer_id: Transfer id.
+
+              Returns:
+                  T.AbortTransferResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ABORT_TRANSFER, wallet_id, transfer_id)
+        return cast(T.AbortTransferResponse, response)
+
+    async def activate_wallet(self, wallet_id: str, body: dict[str, Any]) -> T.ActivateWalletResponse:
+        """
+            Activate Wallet.
+
+            Activates a wallet by deploying the account contract on-chain, making it ready for transactions.
+
+        This operation is required for wallets on networks where you need to explicitly activate your account on-chain
+        before it can be used for transactions.
+
+        - **Starknet**: Deploys the account contract using the wallet's public key to initialize the account on the blockchain. No additional parameters required.
+        - **Concordium**: Deploys the account using credential deployment information and cryptographic randomness returned by the IDApp.
+        - **Canton**: Registers the wallet on a validator. You must specify the `validatorId` to activate the wallet. Before activation, the wallet cannot be used and its address will not have a prefix.
+
+            Args:
+                wallet_id: Wallet id.
+                body: Request body.
+
+            Returns:
+                T.ActivateWalletResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ACTIVATE_WALLET, wallet_id, body=body)
+        return cast(T.ActivateWalletResponse, response)
+
+    async def list_transactions(
+        self, wallet_id: str, query: T.ListTransactionsQuery | None = None
+    ) -> T.ListTransactionsResponse:
+        """
+        List Transactions.
+
+        Retrieves a list of transactions requests for the specified wallet.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters.
+
+        Returns:
+            T.ListTransactionsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_TRANSACTIONS, wallet_id, query_params=query)
+        return cast(T.ListTransactionsResponse, response)
+
+    def aiter_transactions(
+        self, wallet_id: str, query: T.ListTransactionsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListTransactionsItem]:
+        """
+        Iterate over List Transactions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListTransactionsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_transactions(wallet_id, q), query, page_size)
+
+    async def sign_and_broadcast_transaction(
+        self, wallet_id: str, body: dict[str, Any]
+    ) -> T.SignAndBroadcastTransactionResponse:
+        """
+                Sign and Broadcast Transaction.
+
+                Sign & Broadcast transaction enables communication with any arbitrary smart contract of the target blockchain. You can construct a transaction that performs a complex task and this endpoint will sign the transaction, add the signature and broadcast it to chain. It can be used to call smart contract functions like mint tokens and even deploy new smart contracts.
+
+        | Status      | Definition                                                                                                                                      |
+        |-------------|-------------------------------------------------------------------------------------------------------------------------------------------------|
+        | Pending     | The request is pending approval due to a policy applied to the wallet.                                                                          |
+        | Executing   | The request is approved and is in the process of being executed. note this status is only set for a short time between pending and broadcasted. |
+        | Broadcasted | The transaction has been successfully written to the mempool.                                                                                   |
+        | Confirmed   | The transaction has been confirmed on-chain by our indexing pipeline.                                                                           |
+        | Failed      | Indicates either a system failure to complete the request or the transaction failed on chain.                                                   |
+        | Rejected    | The request has been rejected by a policy approval action.                                                                                      |
+
+
+          <Info>
+          for reading from a "view" function on EVM chains, please use [Read Contract](https://docs.dfns.co/api-reference/networks/call-function) endpoint.
+          </Info>
+
+                Args:
+                    wallet_id: Wallet id.
+                    body: Request body.
+
+                Returns:
+                    T.SignAndBroadcastTransactionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SIGN_AND_BROADCAST_TRANSACTION, wallet_id, body=body)
+        return cast(T.SignAndBroadcastTransactionResponse, response)
+
+    async def cancel_transaction(self, wallet_id: str, transaction_id: str) -> T.CancelTransactionResponse:
+        """
+              Cancel Transaction.
+
+              Cancels an EVM transaction by creating a replacement transaction with the same nonce. The new transaction sends 0 value to the same address, effectively nullifying the original transaction.
+
+        This endpoint works for:
+        - EVM-compatible networks (Ethereum, Polygon, BSC, etc.)
+        - Transactions that are in 'Broadcasted' status (pending inclusion in a block)
+        - Transactions that are in 'Failed' status, but failed off-chain (before being broadcasted to the network)
+
+        The cancellation works by:
+        1. Extracting the nonce from the original transaction's signed data
+        2. Creating a new transaction to the same wallet address with 0 amount
+        3. Using the same nonce to either:
+           - Replace the original transaction in the mempool (if it was broadcasted)
+           - Consume the nonce that was reserved but not used (if the transaction failed off-chain)
+
+        Note: For transactions that were broadcasted on-chain, success is not guaranteed as it depends on network conditions and whether the original transaction has already been mined.
+
+              Args:
+                  wallet_id: Wallet id.
+                  transaction_id: Transaction id.
+
+              Returns:
+                  T.CancelTransactionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CANCEL_TRANSACTION, wallet_id, transaction_id)
+        return cast(T.CancelTransactionResponse, response)
+
+    async def cancel_transfer(self, wallet_id: str, transfer_id: str) -> T.CancelTransferResponse:
+        """
+              Cancel Transfer.
+
+              Cancels an EVM transfer by creating a replacement transaction with the same nonce. The new transaction sends 0 value to the same address, effectively nullifying the original transfer.
+
+        This endpoint works for:
+        - EVM-compatible networks (Ethereum, Polygon, BSC, etc.)
+        - Transfers that are in 'Broadcasted' status (pending inclusion in a block)
+        - Transfers that are in 'Failed' status, but failed off-chain (before being broadcasted to the network)
+
+        The cancellation works by:
+        1. Extracting the nonce from the original transfer's signed data
+        2. Creating a new transaction to the same wallet address with 0 amount
+        3. Using the same nonce to either:
+           - Replace the original transaction in the mempool (if it was broadcasted)
+           - Consume the nonce that was reserved but not used (if the transfer failed off-chain)
+
+        Note: For transfers that were broadcasted on-chain, success is not guaranteed as it depends on network conditions and whether the original transaction has already been mined.
+
+              Args:
+                  wallet_id: Wallet id.
+                  transfer_id: Transfer id.
+
+              Returns:
+                  T.CancelTransferResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CANCEL_TRANSFER, wallet_id, transfer_id)
+        return cast(T.CancelTransferResponse, response)
+
+    async def proxy_a_request_to_the_canton_ledger_api(
+        self, wallet_id: str, body: T.ProxyARequestToTheCantonLedgerApiRequest
+    ) -> dict[str, Any]:
+        """
+        Proxy a request to the Canton Ledger API.
+
+        Proxies a request to the Canton Ledger API associated with this wallet, using the validator's OAuth2 credentials. Restricted to a curated allow-list of read-style resources. Used to satisfy the Canton WalletConnect `canton_ledgerApi` method.
+
+        Args:
+            wallet_id: Wallet id.
+            body: Request body.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.PROXY_A_REQUEST_TO_THE_CANTON_LEDGER_API, wallet_id, body=body)
+        return cast(dict[str, Any], response)
+
+    async def speed_up_transaction(self, wallet_id: str, transaction_id: str) -> T.SpeedUpTransactionResponse:
+        """
+              Speed Up Transaction.
+
+              Speeds up a transaction by creating a replacement transaction with the same parameters but higher gas fees.
+
+        This endpoint only works for:
+        - EVM-compatible networks (Ethereum, Polygon, BSC, etc.)
+        - Transactions that are in 'Broadcasted' status (already submitted to blockchain, but not confirmed yet)
+
+        The speed-up works by:
+        1. Extracting the parameters from the original broadcasted transaction
+        2. Creating a new transaction with the same nonce, recipient, value, and data
+        3. Using higher gas fees (maximum between 10% bump or Fast network fees)
+        4. Replacing the original transaction in the mempool
+
+        Note: Success is not guaranteed as it depends on network conditions and whether the original transaction has already been mined.
+
+              Args:
+                  wallet_id: Wallet id.
+                  transaction_id: Transaction id.
+
+              Returns:
+                  T.SpeedUpTransactionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SPEED_UP_TRANSACTION, wallet_id, transaction_id)
+        return cast(T.SpeedUpTransactionResponse, response)
+
+    async def speed_up_transfer(self, wallet_id: str, transfer_id: str) -> T.SpeedUpTransferResponse:
+        """
+              Speed Up Transfer.
+
+              Speeds up a transfer by creating a replacement transaction with the same parameters but higher gas fees.
+
+        This endpoint only works for:
+        - EVM-compatible networks (Ethereum, Polygon, BSC, etc.)
+        - Transfers that are in 'Broadcasted' status (already submitted to blockchain, but not confirmed yet)
+
+        The speed-up works by:
+        1. Extracting the parameters from the original broadcasted transfer
+        2. Creating a new transaction with the same nonce, recipient, value, and data
+        3. Using higher gas fees (maximum between 10% bump or Fast network fees)
+        4. Replacing the original transaction in the mempool
+
+        Note: Success is not guaranteed as it depends on network conditions and whether the original transaction has already been mined.
+
+              Args:
+                  wallet_id: Wallet id.
+                  transfer_id: Transfer id.
+
+              Returns:
+                  T.SpeedUpTransferResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.SPEED_UP_TRANSFER, wallet_id, transfer_id)
+        return cast(T.SpeedUpTransferResponse, response)
+
+    async def list_wallets(self, query: T.ListWalletsQuery | None = None) -> T.ListWalletsResponse:
+        """
+        List Wallets.
+
+        Retrieves the list of Wallets in your organization. You can filter the results by owner (either by owner id or owner username). Pagination is supported via limit and paginationToken parameters.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListWalletsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_WALLETS, query_params=query)
+        return cast(T.ListWalletsResponse, response)
+
+    def aiter_wallets(
+        self, query: T.ListWalletsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListWalletsItem]:
+        """
+        Iterate over List Wallets.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListWalletsItem]: The items of every page.
+        """
+        return aiter_items(self.list_wallets, query, page_size)
+
+    async def create_wallet(self, body: T.CreateWalletRequest) -> T.CreateWalletResponse:
+        """
+        Create Wallet.
+
+        Creates a new Wallet associated with the given chain (such as Bitcoin or Ethereum ). Returns a new wallet entity.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateWalletResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_WALLET, body=body)
+        return cast(T.CreateWalletResponse, response)
+
+    async def get_transaction(self, wallet_id: str, transaction_id: str) -> T.GetTransactionResponse:
+        """
+        Get Transaction.
+
+        Retrieve information about a specific transaction.
+
+        Args:
+            wallet_id: Wallet id.
+            transaction_id: Transaction id.
+
+        Returns:
+            T.GetTransactionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_TRANSACTION, wallet_id, transaction_id)
+        return cast(T.GetTransactionResponse, response)
+
+    async def get_transfer(self, wallet_id: str, transfer_id: str) -> T.GetTransferResponse:
+        """
+        Get Transfer.
+
+        Retrieves a Wallet Transfer Request by its ID.
+
+        Args:
+            wallet_id: Wallet id.
+            transfer_id: Transfer id.
+
+        Returns:
+            T.GetTransferResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_TRANSFER, wallet_id, transfer_id)
+        return cast(T.GetTransferResponse, response)
+
+    async def get_wallet(self, wallet_id: str) -> T.GetWalletResponse:
+        """
+        Get Wallet.
+
+        Retrieves a Wallet information by its ID.
+
+        Args:
+            wallet_id: The wallet to retrieve.
+
+        Returns:
+            T.GetWalletResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WALLET, wallet_id)
+        return cast(T.GetWalletResponse, response)
+
+    async def update_wallet(self, wallet_id: str, body: T.UpdateWalletRequest) -> T.UpdateWalletResponse:
+        """
+        Update Wallet.
+
+        Updates the name of an existing wallet.
+
+        Args:
+            wallet_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            T.UpdateWalletResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UPDATE_WALLET, wallet_id, body=body)
+        return cast(T.UpdateWalletResponse, response)
+
+    async def get_wallet_assets(
+        self, wallet_id: str, query: T.GetWalletAssetsQuery | None = None
+    ) -> T.GetWalletAssetsResponse:
+        """
+        Get Wallet Assets.
+
+        Retrieves a list of assets owned by the specified wallet.  Return values vary by chain as shown below.
+
+        Args:
+            wallet_id: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.GetWalletAssetsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WALLET_ASSETS, wallet_id, query_params=query)
+        return cast(T.GetWalletAssetsResponse, response)
+
+    async def get_wallet_history(
+        self, wallet_id: str, query: T.GetWalletHistoryQuery | None = None
+    ) -> T.GetWalletHistoryResponse:
+        """
+                Get Wallet History.
+
+                Retrieves a list of historical on chain activities for the specified wallet.
+
+        The list reflects the indexed on-chain activity: it includes confirmed transactions only.
+
+        If you need to list your on-going or failed transactions please use the related endpoints (
+        [List Transfers](https://docs.dfns.co/api-reference/wallets/list-transfers) or
+        [List Transactions](https://docs.dfns.co/api-reference/wallets/list-transactions)
+        depending on the API you are using).
+
+                Args:
+                    wallet_id: Wallet you want to get the history from.
+                    query: Query parameters.
+
+                Returns:
+                    T.GetWalletHistoryResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WALLET_HISTORY, wallet_id, query_params=query)
+        return cast(T.GetWalletHistoryResponse, response)
+
+    def aiter_wallet_history(
+        self, wallet_id: str, query: T.GetWalletHistoryQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.GetWalletHistoryItem]:
+        """
+        Iterate over Get Wallet History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.GetWalletHistoryItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.get_wallet_history(wallet_id, q), query, page_size)
+
+    def astream_wallet_history(
+        self,
+        wallet_id: str,
+        query: T.GetWalletHistoryQuery | None = None,
+        page_size: int | None = None,
+        fields: Collection[str] | None = None,
+    ) -> AsyncIterator[T.GetWalletHistoryItem]:
+        """
+        Stream Get Wallet History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            wallet_id: Wallet you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            AsyncIterator[T.GetWalletHistoryItem]: The decoded items.
+        """
+        return aiter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.GET_WALLET_HISTORY,
+                wallet_id,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
+
+    async def get_wallet_nfts(self, wallet_id: str) -> T.GetWalletNftsResponse:
+        """
+        Get Wallet Nfts.
+
+        Retrieves a list of NFTs owned by the specified Wallet.
+
+        Args:
+            wallet_id: Path parameter.
+
+        Returns:
+            T.GetWalletNftsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WALLET_NFTS, wallet_id)
+        return cast(T.GetWalletNftsResponse, response)
+
+    def astream_wallet_nfts(
+        self, wallet_id: str, fields: Collection[str] | None = None
+    ) -> AsyncIterator[T.GetWalletNftsItem]:
+        """
+        Stream Get Wallet Nfts.
+
+        Yields the nfts as they are decoded, so memory stays proportional to one item rather than the whole response.
+
+        Args:
+            wallet_id: Path parameter.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            AsyncIterator[T.GetWalletNftsItem]: The decoded nfts.
+        """
+        return self._http.stream_items(
+            E.GET_WALLET_NFTS,
+            wallet_id,
+            items_key="nfts",
+            fields=fields,
+        )
+
+    async def import_wallet(self, body: T.ImportWalletRequest) -> T.ImportWalletResponse:
+        """
+                Import Wallet.
+
+                <Warning>
+        This endpoint is not enabled by default. [Contact Dfns](https://support.dfns.co) to have it activated.
+        </Warning>
+
+        Dfns secures private keys by generating them as MPC key shares in our decentralized key management network.  This happens by default when you [create a wallet](https://docs.dfns.co/api-reference/wallets/create-wallet).
+
+        In some circumstances, however, you may need to import an existing wallet (an existing private key) into Dfns infrastructure, instead of creating a brand new wallet with Dfns and transfer funds to it. As an example, you might want to keep an existing wallet if its address is tied to a smart contract which you don't want to re-deploy.
+
+        In such a case, Dfns exposes this wallet import API endpoint, which can be used in conjunction with our [import SDK](https://github.com/dfns/dfns-sdk-ts/tree/m/examples/sdk/import-wallet).   Note this is intended to be used only to migrate wallets when first onboarding onto the Dfns platform.
+
+        <Danger>
+        Dfns can not guarantee the security of imported wallets, as we have no way to control who had access to the private key prior to import.  For this reason, this feature is restricted to Enterprise customers who have signed a contractual addendum limiting our liability for imported keys.  Please contact your sales representative for more information.
+        </Danger>
+
+                Args:
+                    body: Request body.
+
+                Returns:
+                    T.ImportWalletResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.IMPORT_WALLET, body=body)
+        return cast(T.ImportWalletResponse, response)
+
+    async def list_transfers(
+        self, wallet_id: str, query: T.ListTransfersQuery | None = None
+    ) -> T.ListTransfersResponse:
+        """
+        List Transfers.
+
+        Retrieves a list of transfer requests for the specified wallet.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters.
+
+        Returns:
+            T.ListTransfersResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_TRANSFERS, wallet_id, query_params=query)
+        return cast(T.ListTransfersResponse, response)
+
+    def aiter_transfers(
+        self, wallet_id: str, query: T.ListTransfersQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListTransfersItem]:
+        """
+        Iterate over List Transfers.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListTransfersItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_transfers(wallet_id, q), query, page_size)
+
+    async def transfer_asset(self, wallet_id: str, body: dict[str, Any]) -> T.TransferAssetResponse:
+        """
+                Transfer Asset.
+
+                Transfer an asset out of the specified wallet to a destination address.
+        For all fungible token transfers, the transfer amount must be specified in the minimum denomination of that token.
+        For example, use the amount in Satoshi for a Bitcoin transfer, or the amount in Wei for an Ethereum transfer etc.
+
+        See the different options in the Body description below. You can also select your kind of transfers in the payload examples in the different languages.
+
+        <Tip>
+        Binance chains users can use ERC transfers for BEP tokens and Native transfers for BNB.
+        </Tip>
+
+        <Note>
+        Some blockchains may require additional steps before the transfer can be completed, such as creating a destination account (e.g., Stellar). Please refer to the specific blockchain documentation for any prerequisites or additional requirements.
+        </Note>
+
+                Args:
+                    wallet_id: The source wallet id (`wa-...`).
+                    body: Request body.
+
+                Returns:
+                    T.TransferAssetResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.TRANSFER_ASSET, wallet_id, body=body)
+        return cast(T.TransferAssetResponse, response)
+
+    async def tag_wallet(self, wallet_id: str, body: T.TagWalletRequest) -> T.TagWalletResponse:
+        """
+        Tag Wallet.
+
+        Add a [Tag](https://docs.dfns.co/api-reference/wallets/tags) to a wallet.
+
+        Args:
+            wallet_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            T.TagWalletResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.TAG_WALLET, wallet_id, body=body)
+        return cast(T.TagWalletResponse, response)
+
+    async def untag_wallet(self, wallet_id: str, body: T.UntagWalletRequest) -> T.UntagWalletResponse:
+        """
+        Untag Wallet.
+
+        Removes the specified tags from a wallet.
+
+        Args:
+            wallet_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            T.UntagWalletResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UNTAG_WALLET, wallet_id, body=body)
+        return cast(T.UntagWalletResponse, response)
+
+    async def get_offer(self, wallet_id: str, offer_id: str) -> T.GetOfferResponse:
+        """
+        Get Offer.
+
+        Retrieve information about a specific offer received on your wallet.
+
+        Args:
+            wallet_id: Wallet id.
+            offer_id: Offer id.
+
+        Returns:
+            T.GetOfferResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_OFFER, wallet_id, offer_id)
+        return cast(T.GetOfferResponse, response)
+
+    async def list_offers(self, wallet_id: str, query: T.ListOffersQuery | None = None) -> T.ListOffersResponse:
+        """
+        List Offers.
+
+        List all offers received on a specific wallet.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters.
+
+        Returns:
+            T.ListOffersResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_OFFERS, wallet_id, query_params=query)
+        return cast(T.ListOffersResponse, response)
+
+    def aiter_offers(
+        self, wallet_id: str, query: T.ListOffersQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListOffersItem]:
+        """
+        Iterate over List Offers.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListOffersItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_offers(wallet_id, q), query, page_size)
+
+    async def accept_offer(self, wallet_id: str, offer_id: str) -> T.AcceptOfferResponse:
+        """
+        Accept Offer.
+
+        Accept an offer received on your wallet.
+
+        Args:
+            wallet_id: Wallet id.
+            offer_id: Offer id.
+
+        Returns:
+            T.AcceptOfferResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.ACCEPT_OFFER, wallet_id, offer_id)
+        return cast(T.AcceptOfferResponse, response)
+
+    async def reject_offer(self, wallet_id: str, offer_id: str) -> T.RejectOfferResponse:
+        """
+        Reject Offer.
+
+        Reject an offer received on your wallet.
+
+        Args:
+            wallet_id: Wallet id.
+            offer_id: Offer id.
+
+        Returns:
+            T.RejectOfferResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.REJECT_OFFER, wallet_id, offer_id)
+        return cast(T.RejectOfferResponse, response)
+
+    async def list_org_wallet_history(self, query: T.ListOrgWalletHistoryQuery) -> dict[str, Any] | str:
+        """
+        List Org Wallet History.
+
+        Retrieve the transaction history across all wallets within a specified timeframe. The time range is unbounded, but the CSV export is capped at 100,000 rows.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            dict[str, Any] | str: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ORG_WALLET_HISTORY, query_params=query)
+        return cast(dict[str, Any] | str, response)
+
+    def aiter_org_wallet_history(
+        self, query: T.ListOrgWalletHistoryQuery, page_size: int | None = None
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over List Org Wallet History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[Any]: The items of every page.
+        """
+        return aiter_items(self.list_org_wallet_history, query, page_size)
+
+    def astream_org_wallet_history(
+        self, query: T.ListOrgWalletHistoryQuery, page_size: int | None = None, fields: Collection[str] | None = None
+    ) -> AsyncIterator[T.ListOrgWalletHistoryItem]:
+        """
+        Stream List Org Wallet History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            AsyncIterator[T.ListOrgWalletHistoryItem]: The decoded items.
+        """
+        return aiter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.LIST_ORG_WALLET_HISTORY,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
@@ -0,0 +1,1210 @@
+"""Async delegated client for the wallets domain."""
+
+from collections.abc import AsyncIterator, Collection
+from typing import Any, cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items, aiter_streamed_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedWalletsClient:
+    """
+    Async delegated client for wallets operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def abort_transaction_init(self, wallet_id: str, transaction_id: str) -> PreparedAction:
+        """
+        Initialize Abort Transaction.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Wallet id.
+            transaction_id: Transaction id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.ABORT_TRANSACTION, E.ABORT_TRANSACTION.resolve(wallet_id, transaction_id)
+        )
+
+    async def abort_transaction_complete(
+        self,
+        wallet_id: str,
+        transaction_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.AbortTransactionResponse:
+        """
+        Complete Abort Transaction.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Wallet id.
+            transaction_id: Transaction id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of abort_transaction_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.AbortTransactionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ABORT_TRANSACTION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ABORT_TRANSACTION, wallet_id, transaction_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.AbortTransactionResponse, response)
+
+    async def abort_transfer_init(self, wallet_id: str, transfer_id: str) -> PreparedAction:
+        """
+        Initialize Abort Transfer.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Wallet id.
+            transfer_id: Transfer id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.ABORT_TRANSFER, E.ABORT_TRANSFER.resolve(wallet_id, transfer_id)
+        )
+
+    async def abort_transfer_complete(
+        self,
+        wallet_id: str,
+        transfer_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.AbortTransferResponse:
+        """
+        Complete Abort Transfer.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Wallet id.
+            transfer_id: Transfer id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of abort_transfer_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.AbortTransferResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ABORT_TRANSFER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ABORT_TRANSFER, wallet_id, transfer_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.AbortTransferResponse, response)
+
+    async def activate_wallet_init(self, wallet_id: str, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Activate Wallet.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Wallet id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.ACTIVATE_WALLET, E.ACTIVATE_WALLET.resolve(wallet_id), body
+        )
+
+    async def activate_wallet_complete(
+        self,
+        wallet_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.ActivateWalletResponse:
+        """
+        Complete Activate Wallet.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Wallet id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ActivateWalletResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_WALLET.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ACTIVATE_WALLET, wallet_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ActivateWalletResponse, response)
+
+    async def list_transactions(
+        self, wallet_id: str, query: T.ListTransactionsQuery | None = None
+    ) -> T.ListTransactionsResponse:
+        """
+        List Transactions.
+
+        Retrieves a list of transactions requests for the specified wallet.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters.
+
+        Returns:
+            T.ListTransactionsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_TRANSACTIONS, wallet_id, query_params=query)
+        return cast(T.ListTransactionsResponse, response)
+
+    def aiter_transactions(
+        self, wallet_id: str, query: T.ListTransactionsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListTransactionsItem]:
+        """
+        Iterate over List Transactions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListTransactionsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_transactions(wallet_id, q), query, page_size)
+
+    async def sign_and_broadcast_transaction_init(self, wallet_id: str, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Sign and Broadcast Transaction.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Wallet id.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http,
+            E.SIGN_AND_BROADCAST_TRANSACTION,
+            E.SIGN_AND_BROADCAST_TRANSACTION.resolve(wallet_id),
+            body,
+        )
+
+    async def sign_and_broadcast_transaction_complete(
+        self,
+        wallet_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.SignAndBroadcastTransactionResponse:
+        """
+        Complete Sign and Broadcast Transaction.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Wallet id.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of sign_and_broadcast_transaction_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.SignAndBroadcastTransactionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.SIGN_AND_BROADCAST_TRANSACTION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.SIGN_AND_BROADCAST_TRANSACTION, wallet_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.SignAndBroadcastTransactionResponse, response)
+
+    async def cancel_transaction_init(self, wallet_id: str, transaction_id: str) -> PreparedAction:
+        """
+        Initialize Cancel Transaction.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Wallet id.
+            transaction_id: Transaction id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CANCEL_TRANSACTION, E.CANCEL_TRANSACTION.resolve(wallet_id, transaction_id)
+        )
+
+    async def cancel_transaction_complete(
+        self,
+        wallet_id: str,
+        transaction_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CancelTransactionResponse:
+        """
+        Complete Cancel Transaction.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Wallet id.
+            transaction_id: Transaction id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of cancel_transaction_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CancelTransactionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CANCEL_TRANSACTION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CANCEL_TRANSACTION, wallet_id, transaction_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CancelTransactionResponse, response)
+
+    async def cancel_transfer_init(self, wallet_id: str, transfer_id: str) -> PreparedAction:
+        """
+        Initialize Cancel Transfer.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Wallet id.
+            transfer_id: Transfer id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.CANCEL_TRANSFER, E.CANCEL_TRANSFER.resolve(wallet_id, transfer_id)
+        )
+
+    async def cancel_transfer_complete(
+        self,
+        wallet_id: str,
+        transfer_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CancelTransferResponse:
+        """
+        Complete Cancel Transfer.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Wallet id.
+            transfer_id: Transfer id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of cancel_transfer_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CancelTransferResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CANCEL_TRANSFER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CANCEL_TRANSFER, wallet_id, transfer_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CancelTransferResponse, response)
+
+    async def proxy_a_request_to_the_canton_ledger_api(
+        self, wallet_id: str, body: T.ProxyARequestToTheCantonLedgerApiRequest
+    ) -> dict[str, Any]:
+        """
+        Proxy a request to the Canton Ledger API.
+
+        Proxies a request to the Canton Ledger API associated with this wallet, using the validator's OAuth2 credentials. Restricted to a curated allow-list of read-style resources. Used to satisfy the Canton WalletConnect `canton_ledgerApi` method.
+
+        Args:
+            wallet_id: Wallet id.
+            body: Request body.
+
+        Returns:
+            dict[str, Any]: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.PROXY_A_REQUEST_TO_THE_CANTON_LEDGER_API, wallet_id, body=body)
+        return cast(dict[str, Any], response)
+
+    async def speed_up_transaction_init(self, wallet_id: str, transaction_id: str) -> PreparedAction:
+        """
+        Initialize Speed Up Transaction.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Wallet id.
+            transaction_id: Transaction id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.SPEED_UP_TRANSACTION, E.SPEED_UP_TRANSACTION.resolve(wallet_id, transaction_id)
+        )
+
+    async def speed_up_transaction_complete(
+        self,
+        wallet_id: str,
+        transaction_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.SpeedUpTransactionResponse:
+        """
+        Complete Speed Up Transaction.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Wallet id.
+            transaction_id: Transaction id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of speed_up_transaction_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.SpeedUpTransactionResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.SPEED_UP_TRANSACTION.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.SPEED_UP_TRANSACTION, wallet_id, transaction_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.SpeedUpTransactionResponse, response)
+
+    async def speed_up_transfer_init(self, wallet_id: str, transfer_id: str) -> PreparedAction:
+        """
+        Initialize Speed Up Transfer.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Wallet id.
+            transfer_id: Transfer id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.SPEED_UP_TRANSFER, E.SPEED_UP_TRANSFER.resolve(wallet_id, transfer_id)
+        )
+
+    async def speed_up_transfer_complete(
+        self,
+        wallet_id: str,
+        transfer_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.SpeedUpTransferResponse:
+        """
+        Complete Speed Up Transfer.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Wallet id.
+            transfer_id: Transfer id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of speed_up_transfer_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.SpeedUpTransferResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.SPEED_UP_TRANSFER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.SPEED_UP_TRANSFER, wallet_id, transfer_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.SpeedUpTransferResponse, response)
+
+    async def list_wallets(self, query: T.ListWalletsQuery | None = None) -> T.ListWalletsResponse:
+        """
+        List Wallets.
+
+        Retrieves the list of Wallets in your organization. You can filter the results by owner (either by owner id or owner username). Pagination is supported via limit and paginationToken parameters.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListWalletsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_WALLETS, query_params=query)
+        return cast(T.ListWalletsResponse, response)
+
+    def aiter_wallets(
+        self, query: T.ListWalletsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListWalletsItem]:
+        """
+        Iterate over List Wallets.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListWalletsItem]: The items of every page.
+        """
+        return aiter_items(self.list_wallets, query, page_size)
+
+    async def create_wallet_init(self, body: T.CreateWalletRequest) -> PreparedAction:
+        """
+        Initialize Create Wallet.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.CREATE_WALLET, E.CREATE_WALLET.path, body)
+
+    async def create_wallet_complete(
+        self,
+        body: T.CreateWalletRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateWalletResponse:
+        """
+        Complete Create Wallet.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateWalletResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_WALLET.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_WALLET, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateWalletResponse, response)
+
+    async def get_transaction(self, wallet_id: str, transaction_id: str) -> T.GetTransactionResponse:
+        """
+        Get Transaction.
+
+        Retrieve information about a specific transaction.
+
+        Args:
+            wallet_id: Wallet id.
+            transaction_id: Transaction id.
+
+        Returns:
+            T.GetTransactionResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_TRANSACTION, wallet_id, transaction_id)
+        return cast(T.GetTransactionResponse, response)
+
+    async def get_transfer(self, wallet_id: str, transfer_id: str) -> T.GetTransferResponse:
+        """
+        Get Transfer.
+
+        Retrieves a Wallet Transfer Request by its ID.
+
+        Args:
+            wallet_id: Wallet id.
+            transfer_id: Transfer id.
+
+        Returns:
+            T.GetTransferResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_TRANSFER, wallet_id, transfer_id)
+        return cast(T.GetTransferResponse, response)
+
+    async def get_wallet(self, wallet_id: str) -> T.GetWalletResponse:
+        """
+        Get Wallet.
+
+        Retrieves a Wallet information by its ID.
+
+        Args:
+            wallet_id: The wallet to retrieve.
+
+        Returns:
+            T.GetWalletResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WALLET, wallet_id)
+        return cast(T.GetWalletResponse, response)
+
+    async def update_wallet_init(self, wallet_id: str, body: T.UpdateWalletRequest) -> PreparedAction:
+        """
+        Initialize Update Wallet.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_WALLET, E.UPDATE_WALLET.resolve(wallet_id), body
+        )
+
+    async def update_wallet_complete(
+        self,
+        wallet_id: str,
+        body: T.UpdateWalletRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UpdateWalletResponse:
+        """
+        Complete Update Wallet.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UpdateWalletResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_WALLET.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UPDATE_WALLET, wallet_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.UpdateWalletResponse, response)
+
+    async def get_wallet_assets(
+        self, wallet_id: str, query: T.GetWalletAssetsQuery | None = None
+    ) -> T.GetWalletAssetsResponse:
+        """
+        Get Wallet Assets.
+
+        Retrieves a list of assets owned by the specified wallet.  Return values vary by chain as shown below.
+
+        Args:
+            wallet_id: Path parameter.
+            query: Query parameters.
+
+        Returns:
+            T.GetWalletAssetsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WALLET_ASSETS, wallet_id, query_params=query)
+        return cast(T.GetWalletAssetsResponse, response)
+
+    async def get_wallet_history(
+        self, wallet_id: str, query: T.GetWalletHistoryQuery | None = None
+    ) -> T.GetWalletHistoryResponse:
+        """
+                Get Wallet History.
+
+                Retrieves a list of historical on chain activities for the specified wallet.
+
+        The list reflects the indexed on-chain activity: it includes confirmed transactions only.
+
+        If you need to list your on-going or failed transactions please use the related endpoints (
+        [List Transfers](https://docs.dfns.co/api-reference/wallets/list-transfers) or
+        [List Transactions](https://docs.dfns.co/api-reference/wallets/list-transactions)
+        depending on the API you are using).
+
+                Args:
+                    wallet_id: Wallet you want to get the history from.
+                    query: Query parameters.
+
+                Returns:
+                    T.GetWalletHistoryResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WALLET_HISTORY, wallet_id, query_params=query)
+        return cast(T.GetWalletHistoryResponse, response)
+
+    def aiter_wallet_history(
+        self, wallet_id: str, query: T.GetWalletHistoryQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.GetWalletHistoryItem]:
+        """
+        Iterate over Get Wallet History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.GetWalletHistoryItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.get_wallet_history(wallet_id, q), query, page_size)
+
+    def astream_wallet_history(
+        self,
+        wallet_id: str,
+        query: T.GetWalletHistoryQuery | None = None,
+        page_size: int | None = None,
+        fields: Collection[str] | None = None,
+    ) -> AsyncIterator[T.GetWalletHistoryItem]:
+        """
+        Stream Get Wallet History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            wallet_id: Wallet you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            AsyncIterator[T.GetWalletHistoryItem]: The decoded items.
+        """
+        return aiter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.GET_WALLET_HISTORY,
+                wallet_id,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
+
+    async def get_wallet_nfts(self, wallet_id: str) -> T.GetWalletNftsResponse:
+        """
+        Get Wallet Nfts.
+
+        Retrieves a list of NFTs owned by the specified Wallet.
+
+        Args:
+            wallet_id: Path parameter.
+
+        Returns:
+            T.GetWalletNftsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WALLET_NFTS, wallet_id)
+        return cast(T.GetWalletNftsResponse, response)
+
+    def astream_wallet_nfts(
+        self, wallet_id: str, fields: Collection[str] | None = None
+    ) -> AsyncIterator[T.GetWalletNftsItem]:
+        """
+        Stream Get Wallet Nfts.
+
+        Yields the nfts as they are decoded, so memory stays proportional to one item rather than the whole response.
+
+        Args:
+            wallet_id: Path parameter.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            AsyncIterator[T.GetWalletNftsItem]: The decoded nfts.
+        """
+        return self._http.stream_items(
+            E.GET_WALLET_NFTS,
+            wallet_id,
+            items_key="nfts",
+            fields=fields,
+        )
+
+    async def import_wallet_init(self, body: T.ImportWalletRequest) -> PreparedAction:
+        """
+        Initialize Import Wallet.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.IMPORT_WALLET, E.IMPORT_WALLET.path, body)
+
+    async def import_wallet_complete(
+        self,
+        body: T.ImportWalletRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.ImportWalletResponse:
+        """
+        Complete Import Wallet.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of import_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.ImportWalletResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.IMPORT_WALLET.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.IMPORT_WALLET, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.ImportWalletResponse, response)
+
+    async def list_transfers(
+        self, wallet_id: str, query: T.ListTransfersQuery | None = None
+    ) -> T.ListTransfersResponse:
+        """
+        List Transfers.
+
+        Retrieves a list of transfer requests for the specified wallet.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters.
+
+        Returns:
+            T.ListTransfersResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_TRANSFERS, wallet_id, query_params=query)
+        return cast(T.ListTransfersResponse, response)
+
+    def aiter_transfers(
+        self, wallet_id: str, query: T.ListTransfersQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListTransfersItem]:
+        """
+        Iterate over List Transfers.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListTransfersItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_transfers(wallet_id, q), query, page_size)
+
+    async def transfer_asset_init(self, wallet_id: str, body: dict[str, Any]) -> PreparedAction:
+        """
+        Initialize Transfer Asset.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: The source wallet id (`wa-...`).
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.TRANSFER_ASSET, E.TRANSFER_ASSET.resolve(wallet_id), body
+        )
+
+    async def transfer_asset_complete(
+        self,
+        wallet_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.TransferAssetResponse:
+        """
+        Complete Transfer Asset.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: The source wallet id (`wa-...`).
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of transfer_asset_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.TransferAssetResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.TRANSFER_ASSET.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.TRANSFER_ASSET, wallet_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.TransferAssetResponse, response)
+
+    async def tag_wallet_init(self, wallet_id: str, body: T.TagWalletRequest) -> PreparedAction:
+        """
+        Initialize Tag Wallet.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.TAG_WALLET, E.TAG_WALLET.resolve(wallet_id), body
+        )
+
+    async def tag_wallet_complete(
+        self,
+        wallet_id: str,
+        body: T.TagWalletRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.TagWalletResponse:
+        """
+        Complete Tag Wallet.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of tag_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.TagWalletResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.TAG_WALLET.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.TAG_WALLET, wallet_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.TagWalletResponse, response)
+
+    async def untag_wallet_init(self, wallet_id: str, body: T.UntagWalletRequest) -> PreparedAction:
+        """
+        Initialize Untag Wallet.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UNTAG_WALLET, E.UNTAG_WALLET.resolve(wallet_id), body
+        )
+
+    async def untag_wallet_complete(
+        self,
+        wallet_id: str,
+        body: T.UntagWalletRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UntagWalletResponse:
+        """
+        Complete Untag Wallet.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of untag_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UntagWalletResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UNTAG_WALLET.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UNTAG_WALLET, wallet_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.UntagWalletResponse, response)
+
+    async def get_offer(self, wallet_id: str, offer_id: str) -> T.GetOfferResponse:
+        """
+        Get Offer.
+
+        Retrieve information about a specific offer received on your wallet.
+
+        Args:
+            wallet_id: Wallet id.
+            offer_id: Offer id.
+
+        Returns:
+            T.GetOfferResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_OFFER, wallet_id, offer_id)
+        return cast(T.GetOfferResponse, response)
+
+    async def list_offers(self, wallet_id: str, query: T.ListOffersQuery | None = None) -> T.ListOffersResponse:
+        """
+        List Offers.
+
+        List all offers received on a specific wallet.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters.
+
+        Returns:
+            T.ListOffersResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_OFFERS, wallet_id, query_params=query)
+        return cast(T.ListOffersResponse, response)
+
+    def aiter_offers(
+        self, wallet_id: str, query: T.ListOffersQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListOffersItem]:
+        """
+        Iterate over List Offers.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListOffersItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_offers(wallet_id, q), query, page_size)
+
+    async def accept_offer_init(self, wallet_id: str, offer_id: str) -> PreparedAction:
+        """
+        Initialize Accept Offer.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Wallet id.
+            offer_id: Offer id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.ACCEPT_OFFER, E.ACCEPT_OFFER.resolve(wallet_id, offer_id)
+        )
+
+    async def accept_offer_complete(
+        self,
+        wallet_id: str,
+        offer_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.AcceptOfferResponse:
+        """
+        Complete Accept Offer.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Wallet id.
+            offer_id: Offer id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of accept_offer_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.AcceptOfferResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACCEPT_OFFER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.ACCEPT_OFFER, wallet_id, offer_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.AcceptOfferResponse, response)
+
+    async def reject_offer_init(self, wallet_id: str, offer_id: str) -> PreparedAction:
+        """
+        Initialize Reject Offer.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            wallet_id: Wallet id.
+            offer_id: Offer id.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.REJECT_OFFER, E.REJECT_OFFER.resolve(wallet_id, offer_id)
+        )
+
+    async def reject_offer_complete(
+        self,
+        wallet_id: str,
+        offer_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.RejectOfferResponse:
+        """
+        Complete Reject Offer.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            wallet_id: Wallet id.
+            offer_id: Offer id.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of reject_offer_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.RejectOfferResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.REJECT_OFFER.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.REJECT_OFFER, wallet_id, offer_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.RejectOfferResponse, response)
+
+    async def list_org_wallet_history(self, query: T.ListOrgWalletHistoryQuery) -> dict[str, Any] | str:
+        """
+        List Org Wallet History.
+
+        Retrieve the transaction history across all wallets within a specified timeframe. The time range is unbounded, but the CSV export is capped at 100,000 rows.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            dict[str, Any] | str: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_ORG_WALLET_HISTORY, query_params=query)
+        return cast(dict[str, Any] | str, response)
+
+    def aiter_org_wallet_history(
+        self, query: T.ListOrgWalletHistoryQuery, page_size: int | None = None
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over List Org Wallet History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[Any]: The items of every page.
+        """
+        return aiter_items(self.list_org_wallet_history, query, page_size)
+
+    def astream_org_wallet_history(
+        self, query: T.ListOrgWalletHistoryQuery, page_size: int | None = None, fields: Collection[str] | None = None
+    ) -> AsyncIterator[T.ListOrgWalletHistoryItem]:
+        """
+        Stream List Org Wallet History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            AsyncIterator[T.ListOrgWalletHistoryItem]: The decoded items.
+        """
+        return aiter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.LIST_ORG_WALLET_HISTORY,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
@@ -1,8 +1,11 @@
 """Client for the wallets domain."""
 
+from collections.abc import Collection, Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items, iter_streamed_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -29,14 +32,7 @@ class WalletsClient:
               Returns:
                   T.AbortTransactionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/wallets/{walletId}/transactions/{transactionId}/abort",
-            path_params={"walletId": wallet_id, "transactionId": transaction_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ABORT_TRANSACTION, wallet_id, transaction_id)
         return cast(T.AbortTransactionResponse, response)
 
     def abort_transfer(self, wallet_id: str, transfer_id: str) -> T.AbortTransferResponse:
@@ -56,14 +52,7 @@ class WalletsClient:
               Returns:
                   T.AbortTransferResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/wallets/{walletId}/transfers/{transferId}/abort",
-            path_params={"walletId": wallet_id, "transferId": transfer_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ABORT_TRANSFER, wallet_id, transfer_id)
         return cast(T.AbortTransferResponse, response)
 
     def activate_wallet(self, wallet_id: str, body: dict[str, Any]) -> T.ActivateWalletResponse:
@@ -86,14 +75,7 @@ class WalletsClient:
             Returns:
                 T.ActivateWalletResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets/{walletId}/activate",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ACTIVATE_WALLET, wallet_id, body=body)
         return cast(T.ActivateWalletResponse, response)
 
     def list_transactions(
@@ -111,16 +93,27 @@ class WalletsClient:
         Returns:
             T.ListTransactionsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/transactions",
-            path_params={"walletId": wallet_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_TRANSACTIONS, wallet_id, query_params=query)
         return cast(T.ListTransactionsResponse, response)
 
+    def iter_transactions(
+        self, wallet_id: str, query: T.ListTransactionsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListTransactionsItem]:
+        """
+        Iterate over List Transactions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListTransactionsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_transactions(wallet_id, q), query, page_size)
+
     def sign_and_broadcast_transaction(
         self, wallet_id: str, body: dict[str, Any]
     ) -> T.SignAndBroadcastTransactionResponse:
@@ -150,14 +143,7 @@ class WalletsClient:
                 Returns:
                     T.SignAndBroadcastTransactionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets/{walletId}/transactions",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SIGN_AND_BROADCAST_TRANSACTION, wallet_id, body=body)
         return cast(T.SignAndBroadcastTransactionResponse, response)
 
     def cancel_transaction(self, wallet_id: str, transaction_id: str) -> T.CancelTransactionResponse:
@@ -187,14 +173,7 @@ class WalletsClient:
               Returns:
                   T.CancelTransactionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets/{walletId}/transactions/{transactionId}/cancel",
-            path_params={"walletId": wallet_id, "transactionId": transaction_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CANCEL_TRANSACTION, wallet_id, transaction_id)
         return cast(T.CancelTransactionResponse, response)
 
     def cancel_transfer(self, wallet_id: str, transfer_id: str) -> T.CancelTransferResponse:
@@ -224,14 +203,7 @@ class WalletsClient:
               Returns:
                   T.CancelTransferResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets/{walletId}/transfers/{transferId}/cancel",
-            path_params={"walletId": wallet_id, "transferId": transfer_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CANCEL_TRANSFER, wallet_id, transfer_id)
         return cast(T.CancelTransferResponse, response)
 
     def proxy_a_request_to_the_canton_ledger_api(
@@ -249,14 +221,7 @@ class WalletsClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets/{walletId}/canton/ledger-api",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.PROXY_A_REQUEST_TO_THE_CANTON_LEDGER_API, wallet_id, body=body)
         return cast(dict[str, Any], response)
 
     def speed_up_transaction(self, wallet_id: str, transaction_id: str) -> T.SpeedUpTransactionResponse:
@@ -284,14 +249,7 @@ class WalletsClient:
               Returns:
                   T.SpeedUpTransactionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets/{walletId}/transactions/{transactionId}/speed-up",
-            path_params={"walletId": wallet_id, "transactionId": transaction_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SPEED_UP_TRANSACTION, wallet_id, transaction_id)
         return cast(T.SpeedUpTransactionResponse, response)
 
     def speed_up_transfer(self, wallet_id: str, transfer_id: str) -> T.SpeedUpTransferResponse:
@@ -319,14 +277,7 @@ class WalletsClient:
               Returns:
                   T.SpeedUpTransferResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets/{walletId}/transfers/{transferId}/speed-up",
-            path_params={"walletId": wallet_id, "transferId": transfer_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.SPEED_UP_TRANSFER, wallet_id, transfer_id)
         return cast(T.SpeedUpTransferResponse, response)
 
     def list_wallets(self, query: T.ListWalletsQuery | None = None) -> T.ListWalletsResponse:
@@ -341,16 +292,26 @@ class WalletsClient:
         Returns:
             T.ListWalletsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_WALLETS, query_params=query)
         return cast(T.ListWalletsResponse, response)
 
+    def iter_wallets(
+        self, query: T.ListWalletsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListWalletsItem]:
+        """
+        Iterate over List Wallets.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListWalletsItem]: The items of every page.
+        """
+        return iter_items(self.list_wallets, query, page_size)
+
     def create_wallet(self, body: T.CreateWalletRequest) -> T.CreateWalletResponse:
         """
         Create Wallet.
@@ -363,14 +324,7 @@ class WalletsClient:
         Returns:
             T.CreateWalletResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_WALLET, body=body)
         return cast(T.CreateWalletResponse, response)
 
     def get_transaction(self, wallet_id: str, transaction_id: str) -> T.GetTransactionResponse:
@@ -386,14 +340,7 @@ class WalletsClient:
         Returns:
             T.GetTransactionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/transactions/{transactionId}",
-            path_params={"walletId": wallet_id, "transactionId": transaction_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_TRANSACTION, wallet_id, transaction_id)
         return cast(T.GetTransactionResponse, response)
 
     def get_transfer(self, wallet_id: str, transfer_id: str) -> T.GetTransferResponse:
@@ -409,14 +356,7 @@ class WalletsClient:
         Returns:
             T.GetTransferResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/transfers/{transferId}",
-            path_params={"walletId": wallet_id, "transferId": transfer_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_TRANSFER, wallet_id, transfer_id)
         return cast(T.GetTransferResponse, response)
 
     def get_wallet(self, wallet_id: str) -> T.GetWalletResponse:
@@ -431,14 +371,7 @@ class WalletsClient:
         Returns:
             T.GetWalletResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WALLET, wallet_id)
         return cast(T.GetWalletResponse, response)
 
     def update_wallet(self, wallet_id: str, body: T.UpdateWalletRequest) -> T.UpdateWalletResponse:
@@ -454,14 +387,7 @@ class WalletsClient:
         Returns:
             T.UpdateWalletResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/wallets/{walletId}",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UPDATE_WALLET, wallet_id, body=body)
         return cast(T.UpdateWalletResponse, response)
 
     def get_wallet_assets(
@@ -479,14 +405,7 @@ class WalletsClient:
         Returns:
             T.GetWalletAssetsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/assets",
-            path_params={"walletId": wallet_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WALLET_ASSETS, wallet_id, query_params=query)
         return cast(T.GetWalletAssetsResponse, response)
 
     def get_wallet_history(
@@ -511,16 +430,61 @@ class WalletsClient:
                 Returns:
                     T.GetWalletHistoryResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/history",
-            path_params={"walletId": wallet_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WALLET_HISTORY, wallet_id, query_params=query)
         return cast(T.GetWalletHistoryResponse, response)
 
+    def iter_wallet_history(
+        self, wallet_id: str, query: T.GetWalletHistoryQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.GetWalletHistoryItem]:
+        """
+        Iterate over Get Wallet History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.GetWalletHistoryItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.get_wallet_history(wallet_id, q), query, page_size)
+
+    def stream_wallet_history(
+        self,
+        wallet_id: str,
+        query: T.GetWalletHistoryQuery | None = None,
+        page_size: int | None = None,
+        fields: Collection[str] | None = None,
+    ) -> Iterator[T.GetWalletHistoryItem]:
+        """
+        Stream Get Wallet History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            wallet_id: Wallet you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            Iterator[T.GetWalletHistoryItem]: The decoded items.
+        """
+        return iter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.GET_WALLET_HISTORY,
+                wallet_id,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
+
     def get_wallet_nfts(self, wallet_id: str) -> T.GetWalletNftsResponse:
         """
         Get Wallet Nfts.
@@ -533,16 +497,31 @@ class WalletsClient:
         Returns:
             T.GetWalletNftsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/nfts",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WALLET_NFTS, wallet_id)
         return cast(T.GetWalletNftsResponse, response)
 
+    def stream_wallet_nfts(
+        self, wallet_id: str, fields: Collection[str] | None = None
+    ) -> Iterator[T.GetWalletNftsItem]:
+        """
+        Stream Get Wallet Nfts.
+
+        Yields the nfts as they are decoded, so memory stays proportional to one item rather than the whole response.
+
+        Args:
+            wallet_id: Path parameter.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            Iterator[T.GetWalletNftsItem]: The decoded nfts.
+        """
+        return self._http.stream_items(
+            E.GET_WALLET_NFTS,
+            wallet_id,
+            items_key="nfts",
+            fields=fields,
+        )
+
     def import_wallet(self, body: T.ImportWalletRequest) -> T.ImportWalletResponse:
         """
                 Import Wallet.
@@ -567,14 +546,7 @@ class WalletsClient:
                 Returns:
                     T.ImportWalletResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets/import",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.IMPORT_WALLET, body=body)
         return cast(T.ImportWalletResponse, response)
 
     def list_transfers(self, wallet_id: str, query: T.ListTransfersQuery | None = None) -> T.ListTransfersResponse:
@@ -590,16 +562,27 @@ class WalletsClient:
         Returns:
             T.ListTransfersResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/transfers",
-            path_params={"walletId": wallet_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_TRANSFERS, wallet_id, query_params=query)
         return cast(T.ListTransfersResponse, response)
 
+    def iter_transfers(
+        self, wallet_id: str, query: T.ListTransfersQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListTransfersItem]:
+        """
+        Iterate over List Transfers.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListTransfersItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_transfers(wallet_id, q), query, page_size)
+
     def transfer_asset(self, wallet_id: str, body: dict[str, Any]) -> T.TransferAssetResponse:
         """
                 Transfer Asset.
@@ -625,14 +608,7 @@ class WalletsClient:
                 Returns:
                     T.TransferAssetResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets/{walletId}/transfers",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.TRANSFER_ASSET, wallet_id, body=body)
         return cast(T.TransferAssetResponse, response)
 
     def tag_wallet(self, wallet_id: str, body: T.TagWalletRequest) -> T.TagWalletResponse:
@@ -648,14 +624,7 @@ class WalletsClient:
         Returns:
             T.TagWalletResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/wallets/{walletId}/tags",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.TAG_WALLET, wallet_id, body=body)
         return cast(T.TagWalletResponse, response)
 
     def untag_wallet(self, wallet_id: str, body: T.UntagWalletRequest) -> T.UntagWalletResponse:
@@ -671,14 +640,7 @@ class WalletsClient:
         Returns:
             T.UntagWalletResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/wallets/{walletId}/tags",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UNTAG_WALLET, wallet_id, body=body)
         return cast(T.UntagWalletResponse, response)
 
     def get_offer(self, wallet_id: str, offer_id: str) -> T.GetOfferResponse:
@@ -694,14 +656,7 @@ class WalletsClient:
         Returns:
             T.GetOfferResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/offers/{offerId}",
-            path_params={"walletId": wallet_id, "offerId": offer_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_OFFER, wallet_id, offer_id)
         return cast(T.GetOfferResponse, response)
 
     def list_offers(self, wallet_id: str, query: T.ListOffersQuery | None = None) -> T.ListOffersResponse:
@@ -717,16 +672,27 @@ class WalletsClient:
         Returns:
             T.ListOffersResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/offers",
-            path_params={"walletId": wallet_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_OFFERS, wallet_id, query_params=query)
         return cast(T.ListOffersResponse, response)
 
+    def iter_offers(
+        self, wallet_id: str, query: T.ListOffersQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListOffersItem]:
+        """
+        Iterate over List Offers.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListOffersItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_offers(wallet_id, q), query, page_size)
+
     def accept_offer(self, wallet_id: str, offer_id: str) -> T.AcceptOfferResponse:
         """
         Accept Offer.
@@ -740,14 +706,7 @@ class WalletsClient:
         Returns:
             T.AcceptOfferResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/wallets/{walletId}/offers/{offerId}/accept",
-            path_params={"walletId": wallet_id, "offerId": offer_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.ACCEPT_OFFER, wallet_id, offer_id)
         return cast(T.AcceptOfferResponse, response)
 
     def reject_offer(self, wallet_id: str, offer_id: str) -> T.RejectOfferResponse:
@@ -763,14 +722,7 @@ class WalletsClient:
         Returns:
             T.RejectOfferResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/wallets/{walletId}/offers/{offerId}/reject",
-            path_params={"walletId": wallet_id, "offerId": offer_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.REJECT_OFFER, wallet_id, offer_id)
         return cast(T.RejectOfferResponse, response)
 
     def list_org_wallet_history(self, query: T.ListOrgWalletHistoryQuery) -> dict[str, Any] | str:
@@ -785,12 +737,50 @@ class WalletsClient:
         Returns:
             dict[str, Any] | str: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/all/history",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ORG_WALLET_HISTORY, query_params=query)
         return cast(dict[str, Any] | str, response)
+
+    def iter_org_wallet_history(
+        self, query: T.ListOrgWalletHistoryQuery, page_size: int | None = None
+    ) -> Iterator[Any]:
+        """
+        Iterate over List Org Wallet History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[Any]: The items of every page.
+        """
+        return iter_items(self.list_org_wallet_history, query, page_size)
+
+    def stream_org_wallet_history(
+        self, query: T.ListOrgWalletHistoryQuery, page_size: int | None = None, fields: Collection[str] | None = None
+    ) -> Iterator[T.ListOrgWalletHistoryItem]:
+        """
+        Stream List Org Wallet History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            Iterator[T.ListOrgWalletHistoryItem]: The decoded items.
+        """
+        return iter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.LIST_ORG_WALLET_HISTORY,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
@@ -1,10 +1,12 @@
 """Delegated client for the wallets domain."""
 
-import json
+from collections.abc import Collection, Iterator
 from typing import Any, cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items, iter_streamed_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -19,7 +21,7 @@ class DelegatedWalletsClient:
     def __init__(self, http_client: HttpClient):
         self._http = http_client
 
-    def abort_transaction_init(self, wallet_id: str, transaction_id: str) -> UserActionChallengeResponse:
+    def abort_transaction_init(self, wallet_id: str, transaction_id: str) -> PreparedAction:
         """
         Initialize Abort Transaction.
 
@@ -30,22 +32,18 @@ class DelegatedWalletsClient:
             transaction_id: Transaction id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/transactions/{transactionId}/abort"
-        path = path.replace("{walletId}", str(wallet_id))
-        path = path.replace("{transactionId}", str(transaction_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.ABORT_TRANSACTION, E.ABORT_TRANSACTION.resolve(wallet_id, transaction_id)
         )
 
     def abort_transaction_complete(
-        self, wallet_id: str, transaction_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        transaction_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.AbortTransactionResponse:
         """
         Complete Abort Transaction.
@@ -56,24 +54,23 @@ class DelegatedWalletsClient:
             wallet_id: Wallet id.
             transaction_id: Transaction id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of abort_transaction_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.AbortTransactionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ABORT_TRANSACTION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/wallets/{walletId}/transactions/{transactionId}/abort",
-            path_params={"walletId": wallet_id, "transactionId": transaction_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ABORT_TRANSACTION, wallet_id, transaction_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.AbortTransactionResponse, response)
 
-    def abort_transfer_init(self, wallet_id: str, transfer_id: str) -> UserActionChallengeResponse:
+    def abort_transfer_init(self, wallet_id: str, transfer_id: str) -> PreparedAction:
         """
         Initialize Abort Transfer.
 
@@ -84,22 +81,18 @@ class DelegatedWalletsClient:
             transfer_id: Transfer id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/transfers/{transferId}/abort"
-        path = path.replace("{walletId}", str(wallet_id))
-        path = path.replace("{transferId}", str(transfer_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.ABORT_TRANSFER, E.ABORT_TRANSFER.resolve(wallet_id, transfer_id)
         )
 
     def abort_transfer_complete(
-        self, wallet_id: str, transfer_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        transfer_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.AbortTransferResponse:
         """
         Complete Abort Transfer.
@@ -110,24 +103,23 @@ class DelegatedWalletsClient:
             wallet_id: Wallet id.
             transfer_id: Transfer id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of abort_transfer_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.AbortTransferResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ABORT_TRANSFER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/wallets/{walletId}/transfers/{transferId}/abort",
-            path_params={"walletId": wallet_id, "transferId": transfer_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ABORT_TRANSFER, wallet_id, transfer_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.AbortTransferResponse, response)
 
-    def activate_wallet_init(self, wallet_id: str, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def activate_wallet_init(self, wallet_id: str, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Activate Wallet.
 
@@ -138,21 +130,18 @@ class DelegatedWalletsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/activate"
-        path = path.replace("{walletId}", str(wallet_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.ACTIVATE_WALLET, E.ACTIVATE_WALLET.resolve(wallet_id), body
         )
 
     def activate_wallet_complete(
-        self, wallet_id: str, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.ActivateWalletResponse:
         """
         Complete Activate Wallet.
@@ -163,20 +152,19 @@ class DelegatedWalletsClient:
             wallet_id: Wallet id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of activate_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ActivateWalletResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACTIVATE_WALLET.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/wallets/{walletId}/activate",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ACTIVATE_WALLET, wallet_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ActivateWalletResponse, response)
 
@@ -195,17 +183,28 @@ class DelegatedWalletsClient:
         Returns:
             T.ListTransactionsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/transactions",
-            path_params={"walletId": wallet_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_TRANSACTIONS, wallet_id, query_params=query)
         return cast(T.ListTransactionsResponse, response)
 
-    def sign_and_broadcast_transaction_init(self, wallet_id: str, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def iter_transactions(
+        self, wallet_id: str, query: T.ListTransactionsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListTransactionsItem]:
+        """
+        Iterate over List Transactions.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListTransactionsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_transactions(wallet_id, q), query, page_size)
+
+    def sign_and_broadcast_transaction_init(self, wallet_id: str, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Sign and Broadcast Transaction.
 
@@ -216,21 +215,21 @@ class DelegatedWalletsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/transactions"
-        path = path.replace("{walletId}", str(wallet_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
+        return BaseAuthApi.prepare_user_action(
             self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+            E.SIGN_AND_BROADCAST_TRANSACTION,
+            E.SIGN_AND_BROADCAST_TRANSACTION.resolve(wallet_id),
+            body,
         )
 
     def sign_and_broadcast_transaction_complete(
-        self, wallet_id: str, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.SignAndBroadcastTransactionResponse:
         """
         Complete Sign and Broadcast Transaction.
@@ -241,24 +240,23 @@ class DelegatedWalletsClient:
             wallet_id: Wallet id.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of sign_and_broadcast_transaction_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.SignAndBroadcastTransactionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.SIGN_AND_BROADCAST_TRANSACTION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/wallets/{walletId}/transactions",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.SIGN_AND_BROADCAST_TRANSACTION, wallet_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.SignAndBroadcastTransactionResponse, response)
 
-    def cancel_transaction_init(self, wallet_id: str, transaction_id: str) -> UserActionChallengeResponse:
+    def cancel_transaction_init(self, wallet_id: str, transaction_id: str) -> PreparedAction:
         """
         Initialize Cancel Transaction.
 
@@ -269,22 +267,18 @@ class DelegatedWalletsClient:
             transaction_id: Transaction id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/transactions/{transactionId}/cancel"
-        path = path.replace("{walletId}", str(wallet_id))
-        path = path.replace("{transactionId}", str(transaction_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CANCEL_TRANSACTION, E.CANCEL_TRANSACTION.resolve(wallet_id, transaction_id)
         )
 
     def cancel_transaction_complete(
-        self, wallet_id: str, transaction_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        transaction_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CancelTransactionResponse:
         """
         Complete Cancel Transaction.
@@ -295,24 +289,23 @@ class DelegatedWalletsClient:
             wallet_id: Wallet id.
             transaction_id: Transaction id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of cancel_transaction_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CancelTransactionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CANCEL_TRANSACTION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/wallets/{walletId}/transactions/{transactionId}/cancel",
-            path_params={"walletId": wallet_id, "transactionId": transaction_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CANCEL_TRANSACTION, wallet_id, transaction_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CancelTransactionResponse, response)
 
-    def cancel_transfer_init(self, wallet_id: str, transfer_id: str) -> UserActionChallengeResponse:
+    def cancel_transfer_init(self, wallet_id: str, transfer_id: str) -> PreparedAction:
         """
         Initialize Cancel Transfer.
 
@@ -323,22 +316,18 @@ class DelegatedWalletsClient:
             transfer_id: Transfer id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/transfers/{transferId}/cancel"
-        path = path.replace("{walletId}", str(wallet_id))
-        path = path.replace("{transferId}", str(transfer_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.CANCEL_TRANSFER, E.CANCEL_TRANSFER.resolve(wallet_id, transfer_id)
         )
 
     def cancel_transfer_complete(
-        self, wallet_id: str, transfer_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        transfer_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CancelTransferResponse:
         """
         Complete Cancel Transfer.
@@ -349,20 +338,19 @@ class DelegatedWalletsClient:
             wallet_id: Wallet id.
             transfer_id: Transfer id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of cancel_transfer_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CancelTransferResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CANCEL_TRANSFER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/wallets/{walletId}/transfers/{transferId}/cancel",
-            path_params={"walletId": wallet_id, "transferId": transfer_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CANCEL_TRANSFER, wallet_id, transfer_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CancelTransferResponse, response)
 
@@ -381,17 +369,10 @@ class DelegatedWalletsClient:
         Returns:
             dict[str, Any]: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/wallets/{walletId}/canton/ledger-api",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            requires_signature=False,
-        )
+        response = self._http.call(E.PROXY_A_REQUEST_TO_THE_CANTON_LEDGER_API, wallet_id, body=body)
         return cast(dict[str, Any], response)
 
-    def speed_up_transaction_init(self, wallet_id: str, transaction_id: str) -> UserActionChallengeResponse:
+    def speed_up_transaction_init(self, wallet_id: str, transaction_id: str) -> PreparedAction:
         """
         Initialize Speed Up Transaction.
 
@@ -402,22 +383,18 @@ class DelegatedWalletsClient:
             transaction_id: Transaction id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/transactions/{transactionId}/speed-up"
-        path = path.replace("{walletId}", str(wallet_id))
-        path = path.replace("{transactionId}", str(transaction_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.SPEED_UP_TRANSACTION, E.SPEED_UP_TRANSACTION.resolve(wallet_id, transaction_id)
         )
 
     def speed_up_transaction_complete(
-        self, wallet_id: str, transaction_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        transaction_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.SpeedUpTransactionResponse:
         """
         Complete Speed Up Transaction.
@@ -428,24 +405,23 @@ class DelegatedWalletsClient:
             wallet_id: Wallet id.
             transaction_id: Transaction id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of speed_up_transaction_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.SpeedUpTransactionResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.SPEED_UP_TRANSACTION.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/wallets/{walletId}/transactions/{transactionId}/speed-up",
-            path_params={"walletId": wallet_id, "transactionId": transaction_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.SPEED_UP_TRANSACTION, wallet_id, transaction_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.SpeedUpTransactionResponse, response)
 
-    def speed_up_transfer_init(self, wallet_id: str, transfer_id: str) -> UserActionChallengeResponse:
+    def speed_up_transfer_init(self, wallet_id: str, transfer_id: str) -> PreparedAction:
         """
         Initialize Speed Up Transfer.
 
@@ -456,22 +432,18 @@ class DelegatedWalletsClient:
             transfer_id: Transfer id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/transfers/{transferId}/speed-up"
-        path = path.replace("{walletId}", str(wallet_id))
-        path = path.replace("{transferId}", str(transfer_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
+        return BaseAuthApi.prepare_user_action(
+            self._http, E.SPEED_UP_TRANSFER, E.SPEED_UP_TRANSFER.resolve(wallet_id, transfer_id)
         )
 
     def speed_up_transfer_complete(
-        self, wallet_id: str, transfer_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        transfer_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.SpeedUpTransferResponse:
         """
         Complete Speed Up Transfer.
@@ -482,20 +454,19 @@ class DelegatedWalletsClient:
             wallet_id: Wallet id.
             transfer_id: Transfer id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of speed_up_transfer_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.SpeedUpTransferResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.SPEED_UP_TRANSFER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/wallets/{walletId}/transfers/{transferId}/speed-up",
-            path_params={"walletId": wallet_id, "transferId": transfer_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.SPEED_UP_TRANSFER, wallet_id, transfer_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.SpeedUpTransferResponse, response)
 
@@ -511,17 +482,27 @@ class DelegatedWalletsClient:
         Returns:
             T.ListWalletsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_WALLETS, query_params=query)
         return cast(T.ListWalletsResponse, response)
 
-    def create_wallet_init(self, body: T.CreateWalletRequest) -> UserActionChallengeResponse:
+    def iter_wallets(
+        self, query: T.ListWalletsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListWalletsItem]:
+        """
+        Iterate over List Wallets.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListWalletsItem]: The items of every page.
+        """
+        return iter_items(self.list_wallets, query, page_size)
+
+    def create_wallet_init(self, body: T.CreateWalletRequest) -> PreparedAction:
         """
         Initialize Create Wallet.
 
@@ -531,20 +512,15 @@ class DelegatedWalletsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_WALLET, E.CREATE_WALLET.path, body)
 
     def create_wallet_complete(
-        self, body: T.CreateWalletRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateWalletRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateWalletResponse:
         """
         Complete Create Wallet.
@@ -554,20 +530,19 @@ class DelegatedWalletsClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateWalletResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_WALLET.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/wallets",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_WALLET, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateWalletResponse, response)
 
@@ -584,14 +559,7 @@ class DelegatedWalletsClient:
         Returns:
             T.GetTransactionResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/transactions/{transactionId}",
-            path_params={"walletId": wallet_id, "transactionId": transaction_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_TRANSACTION, wallet_id, transaction_id)
         return cast(T.GetTransactionResponse, response)
 
     def get_transfer(self, wallet_id: str, transfer_id: str) -> T.GetTransferResponse:
@@ -607,14 +575,7 @@ class DelegatedWalletsClient:
         Returns:
             T.GetTransferResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/transfers/{transferId}",
-            path_params={"walletId": wallet_id, "transferId": transfer_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_TRANSFER, wallet_id, transfer_id)
         return cast(T.GetTransferResponse, response)
 
     def get_wallet(self, wallet_id: str) -> T.GetWalletResponse:
@@ -629,17 +590,10 @@ class DelegatedWalletsClient:
         Returns:
             T.GetWalletResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WALLET, wallet_id)
         return cast(T.GetWalletResponse, response)
 
-    def update_wallet_init(self, wallet_id: str, body: T.UpdateWalletRequest) -> UserActionChallengeResponse:
+    def update_wallet_init(self, wallet_id: str, body: T.UpdateWalletRequest) -> PreparedAction:
         """
         Initialize Update Wallet.
 
@@ -650,21 +604,16 @@ class DelegatedWalletsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}"
-        path = path.replace("{walletId}", str(wallet_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.UPDATE_WALLET, E.UPDATE_WALLET.resolve(wallet_id), body)
 
     def update_wallet_complete(
-        self, wallet_id: str, body: T.UpdateWalletRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        body: T.UpdateWalletRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UpdateWalletResponse:
         """
         Complete Update Wallet.
@@ -675,20 +624,19 @@ class DelegatedWalletsClient:
             wallet_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UpdateWalletResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_WALLET.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/wallets/{walletId}",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UPDATE_WALLET, wallet_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.UpdateWalletResponse, response)
 
@@ -707,14 +655,7 @@ class DelegatedWalletsClient:
         Returns:
             T.GetWalletAssetsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/assets",
-            path_params={"walletId": wallet_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WALLET_ASSETS, wallet_id, query_params=query)
         return cast(T.GetWalletAssetsResponse, response)
 
     def get_wallet_history(
@@ -739,16 +680,61 @@ class DelegatedWalletsClient:
                 Returns:
                     T.GetWalletHistoryResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/history",
-            path_params={"walletId": wallet_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WALLET_HISTORY, wallet_id, query_params=query)
         return cast(T.GetWalletHistoryResponse, response)
 
+    def iter_wallet_history(
+        self, wallet_id: str, query: T.GetWalletHistoryQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.GetWalletHistoryItem]:
+        """
+        Iterate over Get Wallet History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.GetWalletHistoryItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.get_wallet_history(wallet_id, q), query, page_size)
+
+    def stream_wallet_history(
+        self,
+        wallet_id: str,
+        query: T.GetWalletHistoryQuery | None = None,
+        page_size: int | None = None,
+        fields: Collection[str] | None = None,
+    ) -> Iterator[T.GetWalletHistoryItem]:
+        """
+        Stream Get Wallet History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            wallet_id: Wallet you want to get the history from.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            Iterator[T.GetWalletHistoryItem]: The decoded items.
+        """
+        return iter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.GET_WALLET_HISTORY,
+                wallet_id,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
+
     def get_wallet_nfts(self, wallet_id: str) -> T.GetWalletNftsResponse:
         """
         Get Wallet Nfts.
@@ -761,17 +747,32 @@ class DelegatedWalletsClient:
         Returns:
             T.GetWalletNftsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/nfts",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WALLET_NFTS, wallet_id)
         return cast(T.GetWalletNftsResponse, response)
 
-    def import_wallet_init(self, body: T.ImportWalletRequest) -> UserActionChallengeResponse:
+    def stream_wallet_nfts(
+        self, wallet_id: str, fields: Collection[str] | None = None
+    ) -> Iterator[T.GetWalletNftsItem]:
+        """
+        Stream Get Wallet Nfts.
+
+        Yields the nfts as they are decoded, so memory stays proportional to one item rather than the whole response.
+
+        Args:
+            wallet_id: Path parameter.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            Iterator[T.GetWalletNftsItem]: The decoded nfts.
+        """
+        return self._http.stream_items(
+            E.GET_WALLET_NFTS,
+            wallet_id,
+            items_key="nfts",
+            fields=fields,
+        )
+
+    def import_wallet_init(self, body: T.ImportWalletRequest) -> PreparedAction:
         """
         Initialize Import Wallet.
 
@@ -781,20 +782,15 @@ class DelegatedWalletsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/import"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.IMPORT_WALLET, E.IMPORT_WALLET.path, body)
 
     def import_wallet_complete(
-        self, body: T.ImportWalletRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.ImportWalletRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.ImportWalletResponse:
         """
         Complete Import Wallet.
@@ -804,20 +800,19 @@ class DelegatedWalletsClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of import_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.ImportWalletResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.IMPORT_WALLET.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/wallets/import",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.IMPORT_WALLET, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.ImportWalletResponse, response)
 
@@ -834,17 +829,28 @@ class DelegatedWalletsClient:
         Returns:
             T.ListTransfersResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/transfers",
-            path_params={"walletId": wallet_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_TRANSFERS, wallet_id, query_params=query)
         return cast(T.ListTransfersResponse, response)
 
-    def transfer_asset_init(self, wallet_id: str, body: dict[str, Any]) -> UserActionChallengeResponse:
+    def iter_transfers(
+        self, wallet_id: str, query: T.ListTransfersQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListTransfersItem]:
+        """
+        Iterate over List Transfers.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListTransfersItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_transfers(wallet_id, q), query, page_size)
+
+    def transfer_asset_init(self, wallet_id: str, body: dict[str, Any]) -> PreparedAction:
         """
         Initialize Transfer Asset.
 
@@ -855,21 +861,16 @@ class DelegatedWalletsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/transfers"
-        path = path.replace("{walletId}", str(wallet_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.TRANSFER_ASSET, E.TRANSFER_ASSET.resolve(wallet_id), body)
 
     def transfer_asset_complete(
-        self, wallet_id: str, body: dict[str, Any], signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        body: dict[str, Any],
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.TransferAssetResponse:
         """
         Complete Transfer Asset.
@@ -880,24 +881,23 @@ class DelegatedWalletsClient:
             wallet_id: The source wallet id (`wa-...`).
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of transfer_asset_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.TransferAssetResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.TRANSFER_ASSET.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/wallets/{walletId}/transfers",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.TRANSFER_ASSET, wallet_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.TransferAssetResponse, response)
 
-    def tag_wallet_init(self, wallet_id: str, body: T.TagWalletRequest) -> UserActionChallengeResponse:
+    def tag_wallet_init(self, wallet_id: str, body: T.TagWalletRequest) -> PreparedAction:
         """
         Initialize Tag Wallet.
 
@@ -908,21 +908,16 @@ class DelegatedWalletsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/tags"
-        path = path.replace("{walletId}", str(wallet_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.TAG_WALLET, E.TAG_WALLET.resolve(wallet_id), body)
 
     def tag_wallet_complete(
-        self, wallet_id: str, body: T.TagWalletRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        body: T.TagWalletRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.TagWalletResponse:
         """
         Complete Tag Wallet.
@@ -933,24 +928,23 @@ class DelegatedWalletsClient:
             wallet_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of tag_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.TagWalletResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.TAG_WALLET.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/wallets/{walletId}/tags",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.TAG_WALLET, wallet_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.TagWalletResponse, response)
 
-    def untag_wallet_init(self, wallet_id: str, body: T.UntagWalletRequest) -> UserActionChallengeResponse:
+    def untag_wallet_init(self, wallet_id: str, body: T.UntagWalletRequest) -> PreparedAction:
         """
         Initialize Untag Wallet.
 
@@ -961,21 +955,16 @@ class DelegatedWalletsClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/tags"
-        path = path.replace("{walletId}", str(wallet_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.UNTAG_WALLET, E.UNTAG_WALLET.resolve(wallet_id), body)
 
     def untag_wallet_complete(
-        self, wallet_id: str, body: T.UntagWalletRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        body: T.UntagWalletRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UntagWalletResponse:
         """
         Complete Untag Wallet.
@@ -986,20 +975,19 @@ class DelegatedWalletsClient:
             wallet_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of untag_wallet_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UntagWalletResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UNTAG_WALLET.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/wallets/{walletId}/tags",
-            path_params={"walletId": wallet_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UNTAG_WALLET, wallet_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.UntagWalletResponse, response)
 
@@ -1016,14 +1004,7 @@ class DelegatedWalletsClient:
         Returns:
             T.GetOfferResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/offers/{offerId}",
-            path_params={"walletId": wallet_id, "offerId": offer_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_OFFER, wallet_id, offer_id)
         return cast(T.GetOfferResponse, response)
 
     def list_offers(self, wallet_id: str, query: T.ListOffersQuery | None = None) -> T.ListOffersResponse:
@@ -1039,17 +1020,28 @@ class DelegatedWalletsClient:
         Returns:
             T.ListOffersResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/{walletId}/offers",
-            path_params={"walletId": wallet_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_OFFERS, wallet_id, query_params=query)
         return cast(T.ListOffersResponse, response)
 
-    def accept_offer_init(self, wallet_id: str, offer_id: str) -> UserActionChallengeResponse:
+    def iter_offers(
+        self, wallet_id: str, query: T.ListOffersQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListOffersItem]:
+        """
+        Iterate over List Offers.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            wallet_id: Wallet id.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListOffersItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_offers(wallet_id, q), query, page_size)
+
+    def accept_offer_init(self, wallet_id: str, offer_id: str) -> PreparedAction:
         """
         Initialize Accept Offer.
 
@@ -1060,22 +1052,16 @@ class DelegatedWalletsClient:
             offer_id: Offer id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/offers/{offerId}/accept"
-        path = path.replace("{walletId}", str(wallet_id))
-        path = path.replace("{offerId}", str(offer_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.ACCEPT_OFFER, E.ACCEPT_OFFER.resolve(wallet_id, offer_id))
 
     def accept_offer_complete(
-        self, wallet_id: str, offer_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        offer_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.AcceptOfferResponse:
         """
         Complete Accept Offer.
@@ -1086,24 +1072,23 @@ class DelegatedWalletsClient:
             wallet_id: Wallet id.
             offer_id: Offer id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of accept_offer_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.AcceptOfferResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.ACCEPT_OFFER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/wallets/{walletId}/offers/{offerId}/accept",
-            path_params={"walletId": wallet_id, "offerId": offer_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.ACCEPT_OFFER, wallet_id, offer_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.AcceptOfferResponse, response)
 
-    def reject_offer_init(self, wallet_id: str, offer_id: str) -> UserActionChallengeResponse:
+    def reject_offer_init(self, wallet_id: str, offer_id: str) -> PreparedAction:
         """
         Initialize Reject Offer.
 
@@ -1114,22 +1099,16 @@ class DelegatedWalletsClient:
             offer_id: Offer id.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/wallets/{walletId}/offers/{offerId}/reject"
-        path = path.replace("{walletId}", str(wallet_id))
-        path = path.replace("{offerId}", str(offer_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.REJECT_OFFER, E.REJECT_OFFER.resolve(wallet_id, offer_id))
 
     def reject_offer_complete(
-        self, wallet_id: str, offer_id: str, signed_challenge: SignUserActionChallengeRequest
+        self,
+        wallet_id: str,
+        offer_id: str,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.RejectOfferResponse:
         """
         Complete Reject Offer.
@@ -1140,20 +1119,19 @@ class DelegatedWalletsClient:
             wallet_id: Wallet id.
             offer_id: Offer id.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of reject_offer_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.RejectOfferResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.REJECT_OFFER.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/wallets/{walletId}/offers/{offerId}/reject",
-            path_params={"walletId": wallet_id, "offerId": offer_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.REJECT_OFFER, wallet_id, offer_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.RejectOfferResponse, response)
 
@@ -1169,12 +1147,50 @@ class DelegatedWalletsClient:
         Returns:
             dict[str, Any] | str: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/wallets/all/history",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_ORG_WALLET_HISTORY, query_params=query)
         return cast(dict[str, Any] | str, response)
+
+    def iter_org_wallet_history(
+        self, query: T.ListOrgWalletHistoryQuery, page_size: int | None = None
+    ) -> Iterator[Any]:
+        """
+        Iterate over List Org Wallet History.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[Any]: The items of every page.
+        """
+        return iter_items(self.list_org_wallet_history, query, page_size)
+
+    def stream_org_wallet_history(
+        self, query: T.ListOrgWalletHistoryQuery, page_size: int | None = None, fields: Collection[str] | None = None
+    ) -> Iterator[T.ListOrgWalletHistoryItem]:
+        """
+        Stream List Org Wallet History.
+
+        Yields the items of every page as they are decoded, so memory stays proportional to one
+        item rather than one page.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+            fields: Keys to keep on each item (None keeps every key).
+
+        Returns:
+            Iterator[T.ListOrgWalletHistoryItem]: The decoded items.
+        """
+        return iter_streamed_items(
+            lambda q, metadata: self._http.stream_items(
+                E.LIST_ORG_WALLET_HISTORY,
+                query_params=q,
+                fields=fields,
+                metadata=metadata,
+            ),
+            query,
+            page_size,
+        )
@@ -0,0 +1,134 @@
+"""Endpoint registry for the wallets domain."""
+
+from ..._internal.endpoint import Endpoint
+
+ABORT_TRANSACTION = Endpoint(
+    "wallets.abort_transaction",
+    "PUT",
+    "/wallets/{walletId}/transactions/{transactionId}/abort",
+    requires_signature=True,
+    response_type="AbortTransactionResponse",
+)
+ABORT_TRANSFER = Endpoint(
+    "wallets.abort_transfer",
+    "PUT",
+    "/wallets/{walletId}/transfers/{transferId}/abort",
+    requires_signature=True,
+    response_type="AbortTransferResponse",
+)
+ACTIVATE_WALLET = Endpoint(
+    "wallets.activate_wallet",
+    "POST",
+    "/wallets/{walletId}/activate",
+    requires_signature=True,
+    response_type="ActivateWalletResponse",
+)
+LIST_TRANSACTIONS = Endpoint(
+    "wallets.list_transactions", "GET", "/wallets/{walletId}/transactions", response_type="ListTransactionsResponse"
+)
+SIGN_AND_BROADCAST_TRANSACTION = Endpoint(
+    "wallets.sign_and_broadcast_transaction",
+    "POST",
+    "/wallets/{walletId}/transactions",
+    requires_signature=True,
+    response_type="SignAndBroadcastTransactionResponse",
+)
+CANCEL_TRANSACTION = Endpoint(
+    "wallets.cancel_transaction",
+    "POST",
+    "/wallets/{walletId}/transactions/{transactionId}/cancel",
+    requires_signature=True,
+    response_type="CancelTransactionResponse",
+)
+CANCEL_TRANSFER = Endpoint(
+    "wallets.cancel_transfer",
+    "POST",
+    "/wallets/{walletId}/transfers/{transferId}/cancel",
+    requires_signature=True,
+    response_type="CancelTransferResponse",
+)
+PROXY_A_REQUEST_TO_THE_CANTON_LEDGER_API = Endpoint(
+    "wallets.proxy_a_request_to_the_canton_ledger_api", "POST", "/wallets/{walletId}/canton/ledger-api"
+)
+SPEED_UP_TRANSACTION = Endpoint(
+    "wallets.speed_up_transaction",
+    "POST",
+    "/wallets/{walletId}/transactions/{transactionId}/speed-up",
+    requires_signature=True,
+    response_type="SpeedUpTransactionResponse",
+)
+SPEED_UP_TRANSFER = Endpoint(
+    "wallets.speed_up_transfer",
+    "POST",
+    "/wallets/{walletId}/transfers/{transferId}/speed-up",
+    requires_signature=True,
+    response_type="SpeedUpTransferResponse",
+)
+LIST_WALLETS = Endpoint("wallets.list_wallets", "GET", "/wallets", response_type="ListWalletsResponse")
+CREATE_WALLET = Endpoint(
+    "wallets.create_wallet", "POST", "/wallets", requires_signature=True, response_type="CreateWalletResponse"
+)
+GET_TRANSACTION = Endpoint(
+    "wallets.get_transaction",
+    "GET",
+    "/wallets/{walletId}/transactions/{transactionId}",
+    response_type="GetTransactionResponse",
+)
+GET_TRANSFER = Endpoint(
+    "wallets.get_transfer", "GET", "/wallets/{walletId}/transfers/{transferId}", response_type="GetTransferResponse"
+)
+GET_WALLET = Endpoint("wallets.get_wallet", "GET", "/wallets/{walletId}", response_type="GetWalletResponse")
+UPDATE_WALLET = Endpoint(
+    "wallets.update_wallet", "PUT", "/wallets/{walletId}", requires_signature=True, response_type="UpdateWalletResponse"
+)
+GET_WALLET_ASSETS = Endpoint(
+    "wallets.get_wallet_assets", "GET", "/wallets/{walletId}/assets", response_type="GetWalletAssetsResponse"
+)
+GET_WALLET_HISTORY = Endpoint(
+    "wallets.get_wallet_history", "GET", "/wallets/{walletId}/history", response_type="GetWalletHistoryResponse"
+)
+GET_WALLET_NFTS = Endpoint(
+    "wallets.get_wallet_nfts", "GET", "/wallets/{walletId}/nfts", response_type="GetWalletNftsResponse"
+)
+IMPORT_WALLET = Endpoint(
+    "wallets.import_wallet", "POST", "/wallets/import", requires_signature=True, response_type="ImportWalletResponse"
+)
+LIST_TRANSFERS = Endpoint(
+    "wallets.list_transfers", "GET", "/wallets/{walletId}/transfers", response_type="ListTransfersResponse"
+)
+TRANSFER_ASSET = Endpoint(
+    "wallets.transfer_asset",
+    "POST",
+    "/wallets/{walletId}/transfers",
+    requires_signature=True,
+    response_type="TransferAssetResponse",
+)
+TAG_WALLET = Endpoint(
+    "wallets.tag_wallet", "PUT", "/wallets/{walletId}/tags", requires_signature=True, response_type="TagWalletResponse"
+)
+UNTAG_WALLET = Endpoint(
+    "wallets.untag_wallet",
+    "DELETE",
+    "/wallets/{walletId}/tags",
+    requires_signature=True,
+    response_type="UntagWalletResponse",
+)
+GET_OFFER = Endpoint(
+    "wallets.get_offer", "GET", "/wallets/{walletId}/offers/{offerId}", response_type="GetOfferResponse"
+)
+LIST_OFFERS = Endpoint("wallets.list_offers", "GET", "/wallets/{walletId}/offers", response_type="ListOffersResponse")
+ACCEPT_OFFER = Endpoint(
+    "wallets.accept_offer",
+    "PUT",
+    "/wallets/{walletId}/offers/{offerId}/accept",
+    requires_signature=True,
+    response_type="AcceptOfferResponse",
+)
+REJECT_OFFER = Endpoint(
+    "wallets.reject_offer",
+    "PUT",
+    "/wallets/{walletId}/offers/{offerId}/reject",
+    requires_signature=True,
+    response_type="RejectOfferResponse",
+)
+LIST_ORG_WALLET_HISTORY = Endpoint("wallets.list_org_wallet_history", "GET", "/wallets/all/history")
@@ -305,10 +305,14 @@ class ActivateWalletResponse(TypedDict, total=False):
     details: NotRequired[dict[str, Any]]
 
 
+ListTransactionsItem = dict[str, Any]
+"""Item of a listTransactions page."""
+
+
 class ListTransactionsResponse(TypedDict, total=False):
     """listTransactions response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListTransactionsItem]
     next_page_token: NotRequired[str]
     wallet_id: str
 
@@ -1018,10 +1022,14 @@ class SpeedUpTransferResponse(TypedDict, total=False):
     details: NotRequired[dict[str, Any]]
 
 
+ListWalletsItem = dict[str, Any]
+"""Item of a listWallets page."""
+
+
 class ListWalletsResponse(TypedDict, total=False):
     """listWallets response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListWalletsItem]
     next_page_token: NotRequired[str]
 
 
@@ -1862,10 +1870,14 @@ class GetWalletAssetsQuery(TypedDict, total=False):
     net_worth: NotRequired[Literal["true"]]
 
 
+GetWalletHistoryItem = dict[str, Any]
+"""Item of a getWalletHistory page."""
+
+
 class GetWalletHistoryResponse(TypedDict, total=False):
     """getWalletHistory response."""
 
-    items: list[dict[str, Any]]
+    items: list[GetWalletHistoryItem]
     next_page_token: NotRequired[str]
     wallet_id: str
     network: Literal[
@@ -2028,6 +2040,10 @@ class GetWalletHistoryQuery(TypedDict, total=False):
     contract: NotRequired[str]
 
 
+GetWalletNftsItem = dict[str, Any]
+"""Item of a getWalletNfts response."""
+
+
 class GetWalletNftsResponse(TypedDict, total=False):
     """getWalletNfts response."""
 
@@ -2149,7 +2165,7 @@ class GetWalletNftsResponse(TypedDict, total=False):
         "XrpLedger",
         "XrpLedgerTestnet",
     ]
-    nfts: list[dict[str, Any]]
+    nfts: list[GetWalletNftsItem]
 
 
 class ImportWalletRequest(TypedDict, total=False):
@@ -2413,10 +2429,14 @@ class ImportWalletResponse(TypedDict, total=False):
     validator_id: NotRequired[str]
 
 
+ListTransfersItem = dict[str, Any]
+"""Item of a listTransfers page."""
+
+
 class ListTransfersResponse(TypedDict, total=False):
     """listTransfers response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListTransfersItem]
     next_page_token: NotRequired[str]
     wallet_id: str
 
@@ -2638,10 +2658,14 @@ class GetOfferResponse(TypedDict, total=False):
     date_settled: NotRequired[str]
 
 
+ListOffersItem = dict[str, Any]
+"""Item of a listOffers page."""
+
+
 class ListOffersResponse(TypedDict, total=False):
     """listOffers response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListOffersItem]
     next_page_token: NotRequired[str]
 
 
@@ -2976,6 +3000,10 @@ class RejectOfferResponse(TypedDict, total=False):
     date_settled: NotRequired[str]
 
 
+ListOrgWalletHistoryItem = dict[str, Any]
+"""Item of a listOrgWalletHistory page."""
+
+
 class ListOrgWalletHistoryQuery(TypedDict, total=False):
     """listOrgWalletHistory query parameters."""
 
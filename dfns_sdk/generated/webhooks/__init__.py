@@ -1,7 +1,30 @@
 """Webhooks domain module."""
 
-from . import types
-from .client import WebhooksClient
-from .delegated_client import DelegatedWebhooksClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["WebhooksClient", "DelegatedWebhooksClient", "types"]
+from ..._internal.lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import types
+    from .async_client import AsyncWebhooksClient
+    from .async_delegated_client import AsyncDelegatedWebhooksClient
+    from .client import WebhooksClient
+    from .delegated_client import DelegatedWebhooksClient
+
+_EXPORTS = {
+    "WebhooksClient": ".client",
+    "DelegatedWebhooksClient": ".delegated_client",
+    "AsyncWebhooksClient": ".async_client",
+    "AsyncDelegatedWebhooksClient": ".async_delegated_client",
+    "types": ".types",
+}
+
+__all__ = ["WebhooksClient", "DelegatedWebhooksClient", "AsyncWebhooksClient", "AsyncDelegatedWebhooksClient", "types"]
+
+
+def __getattr__(name: str) -> Any:
+    return load_attribute(__name__, _EXPORTS, name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,185 @@
+"""Async client for the webhooks domain."""
+
+from collections.abc import AsyncIterator
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncWebhooksClient:
+    """Async client for webhooks operations."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_webhooks(self, query: T.ListWebhooksQuery | None = None) -> T.ListWebhooksResponse:
+        """
+        List Webhooks.
+
+        List all webhooks for the authenticated user's organization. The results are paginated.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListWebhooksResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_WEBHOOKS, query_params=query)
+        return cast(T.ListWebhooksResponse, response)
+
+    def aiter_webhooks(
+        self, query: T.ListWebhooksQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListWebhooksItem]:
+        """
+        Iterate over List Webhooks.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListWebhooksItem]: The items of every page.
+        """
+        return aiter_items(self.list_webhooks, query, page_size)
+
+    async def create_webhook(self, body: T.CreateWebhookRequest) -> T.CreateWebhookResponse:
+        """
+        Create Webhook.
+
+        Register a new webhook.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            T.CreateWebhookResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.CREATE_WEBHOOK, body=body)
+        return cast(T.CreateWebhookResponse, response)
+
+    async def get_webhook(self, webhook_id: str) -> T.GetWebhookResponse:
+        """
+        Get Webhook.
+
+        Retrieve information about a specific webhook.
+
+        Args:
+            webhook_id: Path parameter.
+
+        Returns:
+            T.GetWebhookResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WEBHOOK, webhook_id)
+        return cast(T.GetWebhookResponse, response)
+
+    async def update_webhook(self, webhook_id: str, body: T.UpdateWebhookRequest) -> T.UpdateWebhookResponse:
+        """
+        Update Webhook.
+
+        Update the definition of an existing webhook.
+
+        Args:
+            webhook_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            T.UpdateWebhookResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.UPDATE_WEBHOOK, webhook_id, body=body)
+        return cast(T.UpdateWebhookResponse, response)
+
+    async def delete_webhook(self, webhook_id: str) -> T.DeleteWebhookResponse:
+        """
+        Delete Webhook.
+
+        Deletes an existing webhook registration.
+
+        Args:
+            webhook_id: Path parameter.
+
+        Returns:
+            T.DeleteWebhookResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.DELETE_WEBHOOK, webhook_id)
+        return cast(T.DeleteWebhookResponse, response)
+
+    async def ping_webhook(self, webhook_id: str) -> T.PingWebhookResponse:
+        """
+        Ping Webhook.
+
+        This endpoint is meant for webhook setup and troubleshooting. Calling the endpoint will trigger a fake test event that will be pushed to the webhook URL. The fake event will not be saved and not appear in further requests to Webhook Events.
+
+        Args:
+            webhook_id: Path parameter.
+
+        Returns:
+            T.PingWebhookResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.PING_WEBHOOK, webhook_id)
+        return cast(T.PingWebhookResponse, response)
+
+    async def get_webhook_event(self, webhook_id: str, webhook_event_id: str) -> T.GetWebhookEventResponse:
+        """
+                Get Webhook Event.
+
+                Retrieve a specific webhook event details by its ID.
+
+        <Warning>
+        We only keep a trace of those Webhook Events in our system for a **retention period of 31 days**. Past that, they are discarded, so you cannot see them using [List Webhook Events](https://docs.dfns.co/api-reference/webhooks/list-webhook-events) or [Get Webhook Event](https://docs.dfns.co/api-reference/webhooks/get-webhook-event) endpoints.
+        </Warning>
+
+                Args:
+                    webhook_id: Path parameter.
+                    webhook_event_id: Path parameter.
+
+                Returns:
+                    T.GetWebhookEventResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WEBHOOK_EVENT, webhook_id, webhook_event_id)
+        return cast(T.GetWebhookEventResponse, response)
+
+    async def list_webhook_events(
+        self, webhook_id: str, query: T.ListWebhookEventsQuery | None = None
+    ) -> T.ListWebhookEventsResponse:
+        """
+                List Webhook Events.
+
+                Lists all events for a given webhook.
+
+
+        <Warning>
+        We only keep a trace of those Webhook Events in our system for a **retention period of 31 days**. Past that, they are discarded, so you cannot see them using [List Webhook Events](https://docs.dfns.co/api-reference/webhooks/list-webhook-events) or [Get Webhook Event](https://docs.dfns.co/api-reference/webhooks/get-webhook-event) endpoints.
+        </Warning>
+
+                Args:
+                    webhook_id: Path parameter.
+                    query: Query parameters.
+
+                Returns:
+                    T.ListWebhookEventsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_WEBHOOK_EVENTS, webhook_id, query_params=query)
+        return cast(T.ListWebhookEventsResponse, response)
+
+    def aiter_webhook_events(
+        self, webhook_id: str, query: T.ListWebhookEventsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListWebhookEventsItem]:
+        """
+        Iterate over List Webhook Events.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            webhook_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListWebhookEventsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_webhook_events(webhook_id, q), query, page_size)
@@ -0,0 +1,309 @@
+"""Async delegated client for the webhooks domain."""
+
+from collections.abc import AsyncIterator
+from typing import cast
+
+from ..._internal import AsyncHttpClient
+from ..._internal.pagination import aiter_items
+from ...base_auth_api import AsyncBaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
+from . import types as T
+
+
+class AsyncDelegatedWebhooksClient:
+    """
+    Async delegated client for webhooks operations.
+
+    This client separates user action signing into _init() and _complete() method pairs,
+    allowing external systems to handle the signing process.
+    """
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self._http = http_client
+
+    async def list_webhooks(self, query: T.ListWebhooksQuery | None = None) -> T.ListWebhooksResponse:
+        """
+        List Webhooks.
+
+        List all webhooks for the authenticated user's organization. The results are paginated.
+
+        Args:
+            query: Query parameters.
+
+        Returns:
+            T.ListWebhooksResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_WEBHOOKS, query_params=query)
+        return cast(T.ListWebhooksResponse, response)
+
+    def aiter_webhooks(
+        self, query: T.ListWebhooksQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListWebhooksItem]:
+        """
+        Iterate over List Webhooks.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListWebhooksItem]: The items of every page.
+        """
+        return aiter_items(self.list_webhooks, query, page_size)
+
+    async def create_webhook_init(self, body: T.CreateWebhookRequest) -> PreparedAction:
+        """
+        Initialize Create Webhook.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(self._http, E.CREATE_WEBHOOK, E.CREATE_WEBHOOK.path, body)
+
+    async def create_webhook_complete(
+        self,
+        body: T.CreateWebhookRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.CreateWebhookResponse:
+        """
+        Complete Create Webhook.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_webhook_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.CreateWebhookResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_WEBHOOK.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.CREATE_WEBHOOK, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.CreateWebhookResponse, response)
+
+    async def get_webhook(self, webhook_id: str) -> T.GetWebhookResponse:
+        """
+        Get Webhook.
+
+        Retrieve information about a specific webhook.
+
+        Args:
+            webhook_id: Path parameter.
+
+        Returns:
+            T.GetWebhookResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WEBHOOK, webhook_id)
+        return cast(T.GetWebhookResponse, response)
+
+    async def update_webhook_init(self, webhook_id: str, body: T.UpdateWebhookRequest) -> PreparedAction:
+        """
+        Initialize Update Webhook.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            webhook_id: Path parameter.
+            body: Request body.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.UPDATE_WEBHOOK, E.UPDATE_WEBHOOK.resolve(webhook_id), body
+        )
+
+    async def update_webhook_complete(
+        self,
+        webhook_id: str,
+        body: T.UpdateWebhookRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
+    ) -> T.UpdateWebhookResponse:
+        """
+        Complete Update Webhook.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            webhook_id: Path parameter.
+            body: Request body.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_webhook_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.UpdateWebhookResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_WEBHOOK.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.UPDATE_WEBHOOK, webhook_id, body=body, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.UpdateWebhookResponse, response)
+
+    async def delete_webhook_init(self, webhook_id: str) -> PreparedAction:
+        """
+        Initialize Delete Webhook.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            webhook_id: Path parameter.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.DELETE_WEBHOOK, E.DELETE_WEBHOOK.resolve(webhook_id)
+        )
+
+    async def delete_webhook_complete(
+        self, webhook_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.DeleteWebhookResponse:
+        """
+        Complete Delete Webhook.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            webhook_id: Path parameter.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_webhook_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.DeleteWebhookResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_WEBHOOK.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.DELETE_WEBHOOK, webhook_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.DeleteWebhookResponse, response)
+
+    async def ping_webhook_init(self, webhook_id: str) -> PreparedAction:
+        """
+        Initialize Ping Webhook.
+
+        Creates a user action challenge for external signing.
+
+        Args:
+            webhook_id: Path parameter.
+
+        Returns:
+            PreparedAction: The challenge to sign externally, with the prepared request.
+        """  # noqa: E501
+        return await AsyncBaseAuthApi.prepare_user_action(
+            self._http, E.PING_WEBHOOK, E.PING_WEBHOOK.resolve(webhook_id)
+        )
+
+    async def ping_webhook_complete(
+        self, webhook_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
+    ) -> T.PingWebhookResponse:
+        """
+        Complete Ping Webhook.
+
+        Submits the signed challenge and makes the API request.
+
+        Args:
+            webhook_id: Path parameter.
+            signed_challenge: The signed challenge from external signing.
+            prepared: The result of ping_webhook_init(); its payload is sent as is instead of
+                encoding the body again.
+
+        Returns:
+            T.PingWebhookResponse: The API response.
+        """  # noqa: E501
+        user_action_result = await AsyncBaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.PING_WEBHOOK.operation
+        )
+        user_action_token = user_action_result["userAction"]
+
+        response = await self._http.call_with_user_action(
+            E.PING_WEBHOOK, webhook_id, user_action=user_action_token, prepared=prepared
+        )
+        return cast(T.PingWebhookResponse, response)
+
+    async def get_webhook_event(self, webhook_id: str, webhook_event_id: str) -> T.GetWebhookEventResponse:
+        """
+                Get Webhook Event.
+
+                Retrieve a specific webhook event details by its ID.
+
+        <Warning>
+        We only keep a trace of those Webhook Events in our system for a **retention period of 31 days**. Past that, they are discarded, so you cannot see them using [List Webhook Events](https://docs.dfns.co/api-reference/webhooks/list-webhook-events) or [Get Webhook Event](https://docs.dfns.co/api-reference/webhooks/get-webhook-event) endpoints.
+        </Warning>
+
+                Args:
+                    webhook_id: Path parameter.
+                    webhook_event_id: Path parameter.
+
+                Returns:
+                    T.GetWebhookEventResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.GET_WEBHOOK_EVENT, webhook_id, webhook_event_id)
+        return cast(T.GetWebhookEventResponse, response)
+
+    async def list_webhook_events(
+        self, webhook_id: str, query: T.ListWebhookEventsQuery | None = None
+    ) -> T.ListWebhookEventsResponse:
+        """
+                List Webhook Events.
+
+                Lists all events for a given webhook.
+
+
+        <Warning>
+        We only keep a trace of those Webhook Events in our system for a **retention period of 31 days**. Past that, they are discarded, so you cannot see them using [List Webhook Events](https://docs.dfns.co/api-reference/webhooks/list-webhook-events) or [Get Webhook Event](https://docs.dfns.co/api-reference/webhooks/get-webhook-event) endpoints.
+        </Warning>
+
+                Args:
+                    webhook_id: Path parameter.
+                    query: Query parameters.
+
+                Returns:
+                    T.ListWebhookEventsResponse: The API response.
+        """  # noqa: E501
+        response = await self._http.call(E.LIST_WEBHOOK_EVENTS, webhook_id, query_params=query)
+        return cast(T.ListWebhookEventsResponse, response)
+
+    def aiter_webhook_events(
+        self, webhook_id: str, query: T.ListWebhookEventsQuery | None = None, page_size: int | None = None
+    ) -> AsyncIterator[T.ListWebhookEventsItem]:
+        """
+        Iterate over List Webhook Events.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            webhook_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            AsyncIterator[T.ListWebhookEventsItem]: The items of every page.
+        """
+        return aiter_items(lambda q: self.list_webhook_events(webhook_id, q), query, page_size)
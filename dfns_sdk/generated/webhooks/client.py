@@ -1,8 +1,11 @@
 """Client for the webhooks domain."""
 
+from collections.abc import Iterator
 from typing import cast
 
 from ..._internal import HttpClient
+from ..._internal.pagination import iter_items
+from . import endpoints as E
 from . import types as T
 
 
@@ -24,16 +27,26 @@ class WebhooksClient:
         Returns:
             T.ListWebhooksResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/webhooks",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_WEBHOOKS, query_params=query)
         return cast(T.ListWebhooksResponse, response)
 
+    def iter_webhooks(
+        self, query: T.ListWebhooksQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListWebhooksItem]:
+        """
+        Iterate over List Webhooks.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListWebhooksItem]: The items of every page.
+        """
+        return iter_items(self.list_webhooks, query, page_size)
+
     def create_webhook(self, body: T.CreateWebhookRequest) -> T.CreateWebhookResponse:
         """
         Create Webhook.
@@ -46,14 +59,7 @@ class WebhooksClient:
         Returns:
             T.CreateWebhookResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/webhooks",
-            path_params={},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.CREATE_WEBHOOK, body=body)
         return cast(T.CreateWebhookResponse, response)
 
     def get_webhook(self, webhook_id: str) -> T.GetWebhookResponse:
@@ -68,14 +74,7 @@ class WebhooksClient:
         Returns:
             T.GetWebhookResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/webhooks/{webhookId}",
-            path_params={"webhookId": webhook_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WEBHOOK, webhook_id)
         return cast(T.GetWebhookResponse, response)
 
     def update_webhook(self, webhook_id: str, body: T.UpdateWebhookRequest) -> T.UpdateWebhookResponse:
@@ -91,14 +90,7 @@ class WebhooksClient:
         Returns:
             T.UpdateWebhookResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="PUT",
-            path="/webhooks/{webhookId}",
-            path_params={"webhookId": webhook_id},
-            query_params=None,
-            body=body,
-            requires_signature=True,
-        )
+        response = self._http.call(E.UPDATE_WEBHOOK, webhook_id, body=body)
         return cast(T.UpdateWebhookResponse, response)
 
     def delete_webhook(self, webhook_id: str) -> T.DeleteWebhookResponse:
@@ -113,14 +105,7 @@ class WebhooksClient:
         Returns:
             T.DeleteWebhookResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="DELETE",
-            path="/webhooks/{webhookId}",
-            path_params={"webhookId": webhook_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.DELETE_WEBHOOK, webhook_id)
         return cast(T.DeleteWebhookResponse, response)
 
     def ping_webhook(self, webhook_id: str) -> T.PingWebhookResponse:
@@ -135,14 +120,7 @@ class WebhooksClient:
         Returns:
             T.PingWebhookResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="POST",
-            path="/webhooks/{webhookId}/ping",
-            path_params={"webhookId": webhook_id},
-            query_params=None,
-            body=None,
-            requires_signature=True,
-        )
+        response = self._http.call(E.PING_WEBHOOK, webhook_id)
         return cast(T.PingWebhookResponse, response)
 
     def get_webhook_event(self, webhook_id: str, webhook_event_id: str) -> T.GetWebhookEventResponse:
@@ -162,14 +140,7 @@ class WebhooksClient:
                 Returns:
                     T.GetWebhookEventResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/webhooks/{webhookId}/events/{webhookEventId}",
-            path_params={"webhookId": webhook_id, "webhookEventId": webhook_event_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WEBHOOK_EVENT, webhook_id, webhook_event_id)
         return cast(T.GetWebhookEventResponse, response)
 
     def list_webhook_events(
@@ -192,12 +163,23 @@ class WebhooksClient:
                 Returns:
                     T.ListWebhookEventsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/webhooks/{webhookId}/events",
-            path_params={"webhookId": webhook_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_WEBHOOK_EVENTS, webhook_id, query_params=query)
         return cast(T.ListWebhookEventsResponse, response)
+
+    def iter_webhook_events(
+        self, webhook_id: str, query: T.ListWebhookEventsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListWebhookEventsItem]:
+        """
+        Iterate over List Webhook Events.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            webhook_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListWebhookEventsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_webhook_events(webhook_id, q), query, page_size)
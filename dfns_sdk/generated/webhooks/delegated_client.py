@@ -1,10 +1,12 @@
 """Delegated client for the webhooks domain."""
 
-import json
+from collections.abc import Iterator
 from typing import cast
 
 from ..._internal import HttpClient
-from ...base_auth_api import BaseAuthApi, SignUserActionChallengeRequest, UserActionChallengeResponse
+from ..._internal.pagination import iter_items
+from ...base_auth_api import BaseAuthApi, PreparedAction, SignUserActionChallengeRequest
+from . import endpoints as E
 from . import types as T
 
 
@@ -31,17 +33,27 @@ class DelegatedWebhooksClient:
         Returns:
             T.ListWebhooksResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/webhooks",
-            path_params={},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_WEBHOOKS, query_params=query)
         return cast(T.ListWebhooksResponse, response)
 
-    def create_webhook_init(self, body: T.CreateWebhookRequest) -> UserActionChallengeResponse:
+    def iter_webhooks(
+        self, query: T.ListWebhooksQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListWebhooksItem]:
+        """
+        Iterate over List Webhooks.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListWebhooksItem]: The items of every page.
+        """
+        return iter_items(self.list_webhooks, query, page_size)
+
+    def create_webhook_init(self, body: T.CreateWebhookRequest) -> PreparedAction:
         """
         Initialize Create Webhook.
 
@@ -51,20 +63,15 @@ class DelegatedWebhooksClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/webhooks"
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.CREATE_WEBHOOK, E.CREATE_WEBHOOK.path, body)
 
     def create_webhook_complete(
-        self, body: T.CreateWebhookRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        body: T.CreateWebhookRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.CreateWebhookResponse:
         """
         Complete Create Webhook.
@@ -74,20 +81,19 @@ class DelegatedWebhooksClient:
         Args:
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of create_webhook_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.CreateWebhookResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.CREATE_WEBHOOK.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/webhooks",
-            path_params={},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.CREATE_WEBHOOK, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.CreateWebhookResponse, response)
 
@@ -103,17 +109,10 @@ class DelegatedWebhooksClient:
         Returns:
             T.GetWebhookResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/webhooks/{webhookId}",
-            path_params={"webhookId": webhook_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WEBHOOK, webhook_id)
         return cast(T.GetWebhookResponse, response)
 
-    def update_webhook_init(self, webhook_id: str, body: T.UpdateWebhookRequest) -> UserActionChallengeResponse:
+    def update_webhook_init(self, webhook_id: str, body: T.UpdateWebhookRequest) -> PreparedAction:
         """
         Initialize Update Webhook.
 
@@ -124,21 +123,16 @@ class DelegatedWebhooksClient:
             body: Request body.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/webhooks/{webhookId}"
-        path = path.replace("{webhookId}", str(webhook_id))
-        payload = json.dumps(body, separators=(",", ":")) if body else ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="PUT",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.UPDATE_WEBHOOK, E.UPDATE_WEBHOOK.resolve(webhook_id), body)
 
     def update_webhook_complete(
-        self, webhook_id: str, body: T.UpdateWebhookRequest, signed_challenge: SignUserActionChallengeRequest
+        self,
+        webhook_id: str,
+        body: T.UpdateWebhookRequest,
+        signed_challenge: SignUserActionChallengeRequest,
+        prepared: PreparedAction | None = None,
     ) -> T.UpdateWebhookResponse:
         """
         Complete Update Webhook.
@@ -149,24 +143,23 @@ class DelegatedWebhooksClient:
             webhook_id: Path parameter.
             body: Request body.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of update_webhook_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.UpdateWebhookResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.UPDATE_WEBHOOK.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="PUT",
-            path="/webhooks/{webhookId}",
-            path_params={"webhookId": webhook_id},
-            query_params=None,
-            body=body,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.UPDATE_WEBHOOK, webhook_id, body=body, user_action=user_action_token, prepared=prepared
         )
         return cast(T.UpdateWebhookResponse, response)
 
-    def delete_webhook_init(self, webhook_id: str) -> UserActionChallengeResponse:
+    def delete_webhook_init(self, webhook_id: str) -> PreparedAction:
         """
         Initialize Delete Webhook.
 
@@ -176,21 +169,12 @@ class DelegatedWebhooksClient:
             webhook_id: Path parameter.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/webhooks/{webhookId}"
-        path = path.replace("{webhookId}", str(webhook_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="DELETE",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.DELETE_WEBHOOK, E.DELETE_WEBHOOK.resolve(webhook_id))
 
     def delete_webhook_complete(
-        self, webhook_id: str, signed_challenge: SignUserActionChallengeRequest
+        self, webhook_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
     ) -> T.DeleteWebhookResponse:
         """
         Complete Delete Webhook.
@@ -200,24 +184,23 @@ class DelegatedWebhooksClient:
         Args:
             webhook_id: Path parameter.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of delete_webhook_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.DeleteWebhookResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.DELETE_WEBHOOK.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="DELETE",
-            path="/webhooks/{webhookId}",
-            path_params={"webhookId": webhook_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.DELETE_WEBHOOK, webhook_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.DeleteWebhookResponse, response)
 
-    def ping_webhook_init(self, webhook_id: str) -> UserActionChallengeResponse:
+    def ping_webhook_init(self, webhook_id: str) -> PreparedAction:
         """
         Initialize Ping Webhook.
 
@@ -227,21 +210,12 @@ class DelegatedWebhooksClient:
             webhook_id: Path parameter.
 
         Returns:
-            UserActionChallengeResponse: The challenge to sign externally.
+            PreparedAction: The challenge to sign externally, with the prepared request.
         """  # noqa: E501
-        path = "/webhooks/{webhookId}/ping"
-        path = path.replace("{webhookId}", str(webhook_id))
-        payload = ""
-
-        return BaseAuthApi.create_user_action_challenge(
-            self._http,
-            user_action_http_method="POST",
-            user_action_http_path=path,
-            user_action_payload=payload,
-        )
+        return BaseAuthApi.prepare_user_action(self._http, E.PING_WEBHOOK, E.PING_WEBHOOK.resolve(webhook_id))
 
     def ping_webhook_complete(
-        self, webhook_id: str, signed_challenge: SignUserActionChallengeRequest
+        self, webhook_id: str, signed_challenge: SignUserActionChallengeRequest, prepared: PreparedAction | None = None
     ) -> T.PingWebhookResponse:
         """
         Complete Ping Webhook.
@@ -251,20 +225,19 @@ class DelegatedWebhooksClient:
         Args:
             webhook_id: Path parameter.
             signed_challenge: The signed challenge from external signing.
+            prepared: The result of ping_webhook_init(); its payload is sent as is instead of
+                encoding the body again.
 
         Returns:
             T.PingWebhookResponse: The API response.
         """  # noqa: E501
-        user_action_result = BaseAuthApi.sign_user_action_challenge(self._http, signed_challenge)
+        user_action_result = BaseAuthApi.sign_user_action_challenge(
+            self._http, signed_challenge, E.PING_WEBHOOK.operation
+        )
         user_action_token = user_action_result["userAction"]
 
-        response = self._http.request_with_user_action(
-            method="POST",
-            path="/webhooks/{webhookId}/ping",
-            path_params={"webhookId": webhook_id},
-            query_params=None,
-            body=None,
-            user_action=user_action_token,
+        response = self._http.call_with_user_action(
+            E.PING_WEBHOOK, webhook_id, user_action=user_action_token, prepared=prepared
         )
         return cast(T.PingWebhookResponse, response)
 
@@ -285,14 +258,7 @@ class DelegatedWebhooksClient:
                 Returns:
                     T.GetWebhookEventResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/webhooks/{webhookId}/events/{webhookEventId}",
-            path_params={"webhookId": webhook_id, "webhookEventId": webhook_event_id},
-            query_params=None,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.GET_WEBHOOK_EVENT, webhook_id, webhook_event_id)
         return cast(T.GetWebhookEventResponse, response)
 
     def list_webhook_events(
@@ -315,12 +281,23 @@ class DelegatedWebhooksClient:
                 Returns:
                     T.ListWebhookEventsResponse: The API response.
         """  # noqa: E501
-        response = self._http.request(
-            method="GET",
-            path="/webhooks/{webhookId}/events",
-            path_params={"webhookId": webhook_id},
-            query_params=query,
-            body=None,
-            requires_signature=False,
-        )
+        response = self._http.call(E.LIST_WEBHOOK_EVENTS, webhook_id, query_params=query)
         return cast(T.ListWebhookEventsResponse, response)
+
+    def iter_webhook_events(
+        self, webhook_id: str, query: T.ListWebhookEventsQuery | None = None, page_size: int | None = None
+    ) -> Iterator[T.ListWebhookEventsItem]:
+        """
+        Iterate over List Webhook Events.
+
+        Yields the items of every page, fetching the next page while the current one is consumed.
+
+        Args:
+            webhook_id: Path parameter.
+            query: Query parameters of the first page.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Iterator[T.ListWebhookEventsItem]: The items of every page.
+        """
+        return iter_items(lambda q: self.list_webhook_events(webhook_id, q), query, page_size)
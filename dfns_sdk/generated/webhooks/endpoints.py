@@ -0,0 +1,39 @@
+"""Endpoint registry for the webhooks domain."""
+
+from ..._internal.endpoint import Endpoint
+
+LIST_WEBHOOKS = Endpoint("webhooks.list_webhooks", "GET", "/webhooks", response_type="ListWebhooksResponse")
+CREATE_WEBHOOK = Endpoint(
+    "webhooks.create_webhook", "POST", "/webhooks", requires_signature=True, response_type="CreateWebhookResponse"
+)
+GET_WEBHOOK = Endpoint("webhooks.get_webhook", "GET", "/webhooks/{webhookId}", response_type="GetWebhookResponse")
+UPDATE_WEBHOOK = Endpoint(
+    "webhooks.update_webhook",
+    "PUT",
+    "/webhooks/{webhookId}",
+    requires_signature=True,
+    response_type="UpdateWebhookResponse",
+)
+DELETE_WEBHOOK = Endpoint(
+    "webhooks.delete_webhook",
+    "DELETE",
+    "/webhooks/{webhookId}",
+    requires_signature=True,
+    response_type="DeleteWebhookResponse",
+)
+PING_WEBHOOK = Endpoint(
+    "webhooks.ping_webhook",
+    "POST",
+    "/webhooks/{webhookId}/ping",
+    requires_signature=True,
+    response_type="PingWebhookResponse",
+)
+GET_WEBHOOK_EVENT = Endpoint(
+    "webhooks.get_webhook_event",
+    "GET",
+    "/webhooks/{webhookId}/events/{webhookEventId}",
+    response_type="GetWebhookEventResponse",
+)
+LIST_WEBHOOK_EVENTS = Endpoint(
+    "webhooks.list_webhook_events", "GET", "/webhooks/{webhookId}/events", response_type="ListWebhookEventsResponse"
+)
@@ -4,11 +4,14 @@ from typing import Any, Literal, TypedDict
 
 from typing_extensions import NotRequired
 
+ListWebhooksItem = dict[str, Any]
+"""Item of a listWebhooks page."""
+
 
 class ListWebhooksResponse(TypedDict, total=False):
     """listWebhooks response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListWebhooksItem]
     next_page_token: NotRequired[str]
 
 
@@ -362,10 +365,14 @@ class GetWebhookEventResponse(TypedDict, total=False):
     timestamp_sent: int
 
 
+ListWebhookEventsItem = dict[str, Any]
+"""Item of a listWebhookEvents page."""
+
+
 class ListWebhookEventsResponse(TypedDict, total=False):
     """listWebhookEvents response."""
 
-    items: list[dict[str, Any]]
+    items: list[ListWebhookEventsItem]
     next_page_token: NotRequired[str]
 
 
@@ -0,0 +1,385 @@
+"""In-process simulator of the Dfns API for offline load and resilience testing."""
+
+import asyncio
+import base64
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple
+
+import httpx
+
+LatencyDistribution = Callable[[random.Random], float]
+"""Function drawing the simulated server latency of one request, in seconds."""
+
+Handler = Callable[[dict[str, str], httpx.QueryParams, Any], tuple[int, Any]]
+
+NETWORKS = ("EthereumSepolia", "Bitcoin", "Solana", "Polygon", "ArbitrumOne", "Base")
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class _Route(NamedTuple):
+    method: str
+    template: str
+    pattern: "re.Pattern[str]"
+    handler: Handler
+    signed: bool
+
+
+def _route(method: str, template: str, handler: Handler, signed: bool) -> _Route:
+    # The leading group takes the path prefix of the client's base_url (e.g. "/v1"), if any.
+    pattern = re.compile("(/.*?)?" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template))
+    return _Route(method, template, pattern, handler, signed)
+
+
+def constant_latency(seconds: float) -> LatencyDistribution:
+    """Every request takes ``seconds``."""
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyDistribution:
+    """Latencies drawn uniformly between ``low`` and ``high`` seconds."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> LatencyDistribution:
+    """Long-tailed latencies around ``median`` seconds, as commonly seen from real APIs."""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+class DfnsSimulator(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    httpx transport simulating the core routes of the Dfns API, for sync and async clients.
+
+    Covers the user action flow (``/auth/action/init`` and ``/auth/action``), wallets,
+    transfers, key signatures and webhooks, with ``nextPageToken`` paging on every list.
+    Signed routes require a user action token obtained for the same method, path and
+    payload, and each token can be used once, as with the real API.
+
+    All data is generated from ``seed``, so two simulators with the same settings serve
+    the same wallets and, for the same sequence of requests, the same IDs, latencies
+    and injected faults.
+
+    Example:
+        >>> from dfns_sdk import ConnectionConfig, DfnsClient, DfnsClientConfig
+        >>> from dfns_sdk.simulator import DfnsSimulator, lognormal_latency
+        >>> simulator = DfnsSimulator(wallets=5000, latency=lognormal_latency(0.05), server_error_rate=0.01)
+        >>> config = DfnsClientConfig(
+        ...     auth_token="any-token",
+        ...     signer=signer,
+        ...     connection=ConnectionConfig(transport=simulator),
+        ... )
+        >>> client = DfnsClient(config)
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        wallets: int = 100,
+        latency: LatencyDistribution | None = None,
+        rate_limit_rate: float = 0.0,
+        server_error_rate: float = 0.0,
+        retry_after: float | None = 1.0,
+        max_page_size: int = 100,
+    ):
+        """
+        Initialize the simulator.
+
+        Args:
+            seed: Seed of the generated data, latencies and faults.
+            wallets: Number of wallets (each with its signing key) generated up front.
+            latency: Distribution of the simulated server latency (None for no latency).
+            rate_limit_rate: Fraction of requests answered with 429 Too Many Requests.
+            server_error_rate: Fraction of requests answered with a 500, 502 or 503.
+            retry_after: Retry-After header of 429 responses, in seconds (None to omit).
+            max_page_size: Largest page returned by list routes.
+        """
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.server_error_rate = server_error_rate
+        self.retry_after = retry_after
+        self.max_page_size = max_page_size
+        # Requests received per route template, e.g. "POST /wallets/{walletId}/transfers".
+        self.calls: dict[str, int] = {}
+
+        self._lock = threading.Lock()
+        self._data = random.Random(f"{seed}:data")
+        self._faults = random.Random(f"{seed}:faults")
+        self._created = 0
+        self._wallets: dict[str, dict[str, Any]] = {}
+        self._keys: dict[str, dict[str, Any]] = {}
+        self._transfers: dict[str, dict[str, dict[str, Any]]] = {}
+        self._signatures: dict[str, dict[str, dict[str, Any]]] = {}
+        self._webhooks: dict[str, dict[str, Any]] = {}
+        self._challenges: dict[str, tuple[str, str, str]] = {}
+        self._tokens: dict[str, tuple[str, str, str]] = {}
+        for _ in range(wallets):
+            self._new_wallet({"network": self._data.choice(NETWORKS)})
+
+        self._routes = [
+            _route("POST", "/auth/action/init", self._create_challenge, False),
+            _route("POST", "/auth/action", self._sign_challenge, False),
+            _route("GET", "/wallets", self._list_wallets, False),
+            _route("POST", "/wallets", self._create_wallet, True),
+            _route("GET", "/wallets/{walletId}", self._get_wallet, False),
+            _route("GET", "/wallets/{walletId}/transfers", self._list_transfers, False),
+            _route("POST", "/wallets/{walletId}/transfers", self._transfer_asset, True),
+            _route("GET", "/wallets/{walletId}/transfers/{transferId}", self._get_transfer, False),
+            _route("GET", "/keys", self._list_keys, False),
+            _route("GET", "/keys/{keyId}/signatures", self._list_signatures, False),
+            _route("POST", "/keys/{keyId}/signatures", self._generate_signature, True),
+            _route("GET", "/keys/{keyId}/signatures/{signatureId}", self._get_signature, False),
+            _route("GET", "/webhooks", self._list_webhooks, False),
+            _route("POST", "/webhooks", self._create_webhook, True),
+            _route("GET", "/webhooks/{webhookId}", self._get_webhook, False),
+        ]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        delay, response = self._respond(request)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        delay, response = self._respond(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
+
+    def _respond(self, request: httpx.Request) -> tuple[float, httpx.Response]:
+        """Return the simulated latency and the response of a request."""
+        with self._lock:
+            delay = self.latency(self._faults) if self.latency is not None else 0.0
+            status, body, headers = self._dispatch(request)
+        return delay, httpx.Response(status, json=body, headers=headers)
+
+    def _dispatch(self, request: httpx.Request) -> tuple[int, Any, dict[str, str]]:
+        method, path = request.method, request.url.path
+        for route in self._routes:
+            match = route.pattern.fullmatch(path)
+            if match is not None and route.method == method:
+                break
+        else:
+            return 404, _error("NotFound", f"No route for {method} {path}"), {}
+        path = path[len(match.group(1) or "") :]
+
+        name = f"{method} {route.template}"
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.rate_limit_rate and self._faults.random() < self.rate_limit_rate:
+            headers = {"Retry-After": f"{self.retry_after:g}"} if self.retry_after is not None else {}
+            return 429, _error("TooManyRequests", "Rate limit exceeded"), headers
+        if self.server_error_rate and self._faults.random() < self.server_error_rate:
+            status = self._faults.choice((500, 502, 503))
+            return status, _error("InternalServerError", "Simulated server error"), {}
+
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            return 401, _error("Unauthorized", "Missing bearer token"), {}
+        if route.signed:
+            failure = self._check_user_action(request, path)
+            if failure is not None:
+                return 401, failure, {}
+
+        content_type = request.headers.get("Content-Type", "")
+        body = json.loads(request.content) if request.content and "json" in content_type else None
+        status, payload = route.handler(match.groupdict(), request.url.params, body)
+        return status, payload, {}
+
+    def _check_user_action(self, request: httpx.Request, path: str) -> dict[str, Any] | None:
+        """
+        Consume the user action token of a signed request; return an error body if it is not valid.
+
+        ``path`` is the request path without the base_url prefix, as the client signed it.
+        """
+        token = request.headers.get("X-DFNS-USERACTION")
+        action = self._tokens.pop(token, None) if token else None
+        if action is None:
+            return _error("Unauthorized", "Missing, unknown or already used user action token")
+        signed_method, signed_path, payload = action
+        if (signed_method, signed_path) != (request.method, path):
+            return _error("Unauthorized", "User action was signed for another request")
+        is_multipart = request.headers.get("Content-Type", "").startswith("multipart/")
+        if not is_multipart and payload != request.content.decode():
+            return _error("Unauthorized", "User action was signed for another payload")
+        return None
+
+    def _id(self, prefix: str) -> str:
+        return f"{prefix}-{self._data.getrandbits(32):08x}-{self._data.getrandbits(64):016x}"
+
+    def _timestamp(self) -> str:
+        # Creation dates advance one second per created entity, from a fixed epoch.
+        self._created += 1
+        return (EPOCH + timedelta(seconds=self._created)).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+    def _page(self, items: list[dict[str, Any]], query: httpx.QueryParams) -> tuple[int, Any]:
+        try:
+            limit = min(int(query.get("limit", self.max_page_size)), self.max_page_size)
+            offset = int(query.get("paginationToken", "0"))
+        except ValueError:
+            return 400, _error("BadRequest", "Invalid limit or paginationToken")
+        page: dict[str, Any] = {"items": items[offset : offset + limit]}
+        if offset + limit < len(items):
+            page["nextPageToken"] = str(offset + limit)
+        return 200, page
+
+    # User action flow
+
+    def _create_challenge(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        if not isinstance(body, dict) or "userActionHttpPath" not in body:
+            return 400, _error("BadRequest", "Invalid user action challenge request")
+        identifier = self._id("ch")
+        self._challenges[identifier] = (
+            body.get("userActionHttpMethod", ""),
+            body["userActionHttpPath"],
+            body.get("userActionPayload", ""),
+        )
+        challenge = base64.urlsafe_b64encode(self._data.randbytes(32)).rstrip(b"=").decode()
+        return 200, {
+            "challenge": challenge,
+            "challengeIdentifier": identifier,
+            "allowCredentials": {"key": [{"type": "public-key", "id": "cr-simulated"}], "webauthn": []},
+            "supportedCredentialKinds": [{"kind": "Key", "factor": "first", "requiresSecondFactor": False}],
+            "rp": {"id": "dfns.io", "name": "Dfns"},
+            "externalAuthenticationUrl": "",
+        }
+
+    def _sign_challenge(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        identifier = body.get("challengeIdentifier") if isinstance(body, dict) else None
+        action = self._challenges.pop(identifier, None) if isinstance(identifier, str) else None
+        if action is None or not body.get("firstFactor"):
+            return 400, _error("BadRequest", "Unknown challenge or missing first factor")
+        token = self._id("ua")
+        self._tokens[token] = action
+        return 200, {"userAction": token}
+
+    # Wallets and transfers
+
+    def _new_wallet(self, body: dict[str, Any]) -> dict[str, Any]:
+        key = {
+            "id": self._id("key"),
+            "scheme": "ECDSA",
+            "curve": "secp256k1",
+            "publicKey": self._data.randbytes(33).hex(),
+            "status": "Active",
+            "dateCreated": self._timestamp(),
+        }
+        wallet = {
+            "id": self._id("wa"),
+            "network": body.get("network", NETWORKS[0]),
+            "address": "0x" + self._data.randbytes(20).hex(),
+            "name": body.get("name"),
+            "status": "Active",
+            "signingKey": {key_field: key[key_field] for key_field in ("id", "scheme", "curve", "publicKey")},
+            "dateCreated": key["dateCreated"],
+            "custodial": True,
+            "tags": list(body.get("tags", [])),
+        }
+        self._keys[key["id"]] = key
+        self._wallets[wallet["id"]] = wallet
+        return wallet
+
+    def _list_wallets(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        return self._page(list(self._wallets.values()), query)
+
+    def _create_wallet(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        if not isinstance(body, dict) or "network" not in body:
+            return 400, _error("BadRequest", "network is required")
+        return 200, self._new_wallet(body)
+
+    def _get_wallet(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        wallet = self._wallets.get(params["walletId"])
+        return (200, wallet) if wallet is not None else (404, _error("NotFound", "Wallet not found"))
+
+    def _list_transfers(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        if params["walletId"] not in self._wallets:
+            return 404, _error("NotFound", "Wallet not found")
+        return self._page(list(self._transfers.get(params["walletId"], {}).values()), query)
+
+    def _transfer_asset(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        wallet = self._wallets.get(params["walletId"])
+        if wallet is None:
+            return 404, _error("NotFound", "Wallet not found")
+        if not isinstance(body, dict) or "kind" not in body:
+            return 400, _error("BadRequest", "kind is required")
+        transfer = {
+            "id": self._id("xfr"),
+            "walletId": wallet["id"],
+            "network": wallet["network"],
+            "requester": {"userId": "us-simulated"},
+            "requestBody": body,
+            "status": "Pending",
+            "dateRequested": self._timestamp(),
+        }
+        self._transfers.setdefault(wallet["id"], {})[transfer["id"]] = transfer
+        return 200, transfer
+
+    def _get_transfer(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        transfer = self._transfers.get(params["walletId"], {}).get(params["transferId"])
+        return (200, transfer) if transfer is not None else (404, _error("NotFound", "Transfer not found"))
+
+    # Keys and signatures
+
+    def _list_keys(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        return self._page(list(self._keys.values()), query)
+
+    def _list_signatures(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        if params["keyId"] not in self._keys:
+            return 404, _error("NotFound", "Key not found")
+        return self._page(list(self._signatures.get(params["keyId"], {}).values()), query)
+
+    def _generate_signature(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        if params["keyId"] not in self._keys:
+            return 404, _error("NotFound", "Key not found")
+        if not isinstance(body, dict) or "kind" not in body:
+            return 400, _error("BadRequest", "kind is required")
+        r, s = self._data.randbytes(32).hex(), self._data.randbytes(32).hex()
+        signature: dict[str, Any] = {
+            "id": self._id("sig"),
+            "keyId": params["keyId"],
+            "requester": {"userId": "us-simulated"},
+            "requestBody": body,
+            "status": "Signed",
+            "signature": {"r": f"0x{r}", "s": f"0x{s}", "recid": self._data.randrange(2), "encoded": f"0x{r}{s}"},
+            "dateRequested": self._timestamp(),
+        }
+        self._signatures.setdefault(params["keyId"], {})[signature["id"]] = signature
+        return 200, signature
+
+    def _get_signature(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        signature = self._signatures.get(params["keyId"], {}).get(params["signatureId"])
+        return (200, signature) if signature is not None else (404, _error("NotFound", "Signature not found"))
+
+    # Webhooks
+
+    def _list_webhooks(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        return self._page(list(self._webhooks.values()), query)
+
+    def _create_webhook(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        if not isinstance(body, dict) or "url" not in body or "events" not in body:
+            return 400, _error("BadRequest", "url and events are required")
+        webhook: dict[str, Any] = {
+            "id": self._id("wh"),
+            "url": body["url"],
+            "events": body["events"],
+            "description": body.get("description"),
+            "status": body.get("status", "Enabled"),
+            "secret": "whsec-" + self._data.randbytes(16).hex(),
+            "dateCreated": self._timestamp(),
+        }
+        self._webhooks[webhook["id"]] = webhook
+        return 200, webhook
+
+    def _get_webhook(self, params: dict[str, str], query: httpx.QueryParams, body: Any) -> tuple[int, Any]:
+        webhook = self._webhooks.get(params["webhookId"])
+        return (200, webhook) if webhook is not None else (404, _error("NotFound", "Webhook not found"))
+
+
+def _error(code: str, message: str) -> dict[str, Any]:
+    return {"error": code, "message": message}
@@ -0,0 +1,163 @@
+"""Distributed tracing of Dfns API calls."""
+
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class ExchangeSpan(Protocol):
+    """The span of one HTTP exchange, told about the response once it arrives."""
+
+    def response(self, response: "httpx.Response") -> None:
+        """
+        Record a received response.
+
+        Args:
+            response: The response (its body may not be read yet).
+        """
+        ...
+
+
+class Tracing(Protocol):
+    """
+    Protocol for tracing backends.
+
+    Every client operation (e.g. ``wallets.transfer_asset``) is wrapped in ``operation``,
+    and each HTTP exchange it makes, including the user action challenge and signature
+    requests, in ``exchange``. Signing a challenge is wrapped in ``sign``. Paths are
+    always templates (``/wallets/{walletId}``), so span names built from them stay
+    low-cardinality.
+    """
+
+    def operation(self, operation: str, method: str, path: str) -> AbstractContextManager[Any]:
+        """
+        Trace a whole operation, across retries and user action signing.
+
+        Args:
+            operation: The operation name, e.g. ``wallets.transfer_asset``.
+            method: HTTP method of the operation.
+            path: Path template of the operation.
+        """
+        ...
+
+    def exchange(
+        self, request: "httpx.Request", operation: str, path: str, phase: str, attempt: int
+    ) -> AbstractContextManager[ExchangeSpan]:
+        """
+        Trace one HTTP exchange; trace context headers may be added to ``request``.
+
+        Args:
+            request: The request about to be sent.
+            operation: The operation the exchange belongs to.
+            path: Path template of the request.
+            phase: "challenge", "signature" or "request".
+            attempt: The attempt number, starting at 1.
+        """
+        ...
+
+    def sign(self, operation: str) -> AbstractContextManager[Any]:
+        """
+        Trace the signing of a user action challenge.
+
+        Args:
+            operation: The operation the challenge is signed for.
+        """
+        ...
+
+
+class OpenTelemetryTracing:
+    """
+    Tracing backend reporting spans through the OpenTelemetry API.
+
+    Requires the ``opentelemetry-api`` package (``pip install dfns_sdk[opentelemetry]``);
+    spans are exported by whatever OpenTelemetry SDK the application configures.
+
+    Operations become internal spans named by operation (``wallets.transfer_asset``).
+    HTTP exchanges become client spans named ``{method} {path template}``, with the
+    user action challenge and signature requests as children of their operation, and
+    carry the W3C trace context in their headers.
+
+    Example:
+        >>> from dfns_sdk import DfnsClientConfig
+        >>> from dfns_sdk.tracing import OpenTelemetryTracing
+        >>> config = DfnsClientConfig(auth_token="your-token", tracing=OpenTelemetryTracing())
+    """
+
+    def __init__(self, tracer_provider: Any = None, propagate: bool = True):
+        """
+        Initialize the backend.
+
+        Args:
+            tracer_provider: The TracerProvider to use (defaults to the global one).
+            propagate: Inject the trace context into request headers, using the
+                globally configured propagator (W3C ``traceparent`` by default).
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import trace
+            from opentelemetry.propagate import inject
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetryTracing requires opentelemetry-api: pip install dfns_sdk[opentelemetry]"
+            ) from exc
+        self._trace: Any = trace
+        self._tracer: Any = trace.get_tracer("dfns_sdk", tracer_provider=tracer_provider)
+        self._inject: Any = inject if propagate else None
+
+    @contextmanager
+    def operation(self, operation: str, method: str, path: str) -> Iterator[Any]:
+        """Trace a whole operation as an internal span named by operation."""
+        attributes = {"dfns.operation": operation, "http.request.method": method, "url.template": path}
+        with self._tracer.start_as_current_span(
+            operation, kind=self._trace.SpanKind.INTERNAL, attributes=attributes
+        ) as span:
+            yield span
+
+    @contextmanager
+    def exchange(
+        self, request: "httpx.Request", operation: str, path: str, phase: str, attempt: int
+    ) -> Iterator[ExchangeSpan]:
+        """Trace one HTTP exchange as a client span and inject the trace context."""
+        attributes: dict[str, str | int] = {
+            "dfns.operation": operation,
+            "dfns.phase": phase,
+            "http.request.method": request.method,
+            "url.template": path,
+            "server.address": request.url.host,
+        }
+        if attempt > 1:
+            attributes["http.request.resend_count"] = attempt - 1
+        with self._tracer.start_as_current_span(
+            f"{request.method} {path}", kind=self._trace.SpanKind.CLIENT, attributes=attributes
+        ) as span:
+            if self._inject is not None:
+                self._inject(request.headers)
+            yield _OpenTelemetryExchangeSpan(span, self._trace)
+
+    @contextmanager
+    def sign(self, operation: str) -> Iterator[Any]:
+        """Trace the signing of a challenge as an internal span."""
+        with self._tracer.start_as_current_span(
+            "dfns.sign", kind=self._trace.SpanKind.INTERNAL, attributes={"dfns.operation": operation}
+        ) as span:
+            yield span
+
+
+class _OpenTelemetryExchangeSpan:
+    """Records the response of an exchange on its OpenTelemetry span."""
+
+    __slots__ = ("_span", "_trace")
+
+    def __init__(self, span: Any, trace: Any):
+        self._span = span
+        self._trace = trace
+
+    def response(self, response: "httpx.Response") -> None:
+        self._span.set_attribute("http.response.status_code", response.status_code)
+        if response.status_code >= 400:
+            self._span.set_status(self._trace.StatusCode.ERROR)
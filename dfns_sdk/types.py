@@ -1,10 +1,197 @@
 """Base types for the Dfns SDK."""
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
-    from .auth import Signer
+    import httpx
+
+    from .auth import AsyncSigner, Signer
+    from .challenge_store import PendingChallengeStore
+    from .codec import JsonCodec
+    from .tracing import Tracing
+
+T = TypeVar("T")
+
+
+@dataclass
+class ConnectionConfig:
+    """
+    Connection pool, keep-alive, HTTP/2 and timeout settings for the HTTP transport.
+
+    Per-phase timeouts default to ``timeout`` when left as None.
+    """
+
+    max_connections: int | None = 100
+    """Maximum number of concurrent connections (None for no limit)."""
+
+    max_keepalive_connections: int | None = 20
+    """Maximum number of idle connections kept alive in the pool (None for no limit)."""
+
+    keepalive_expiry: float | None = 5.0
+    """Seconds an idle keep-alive connection is kept before being closed."""
+
+    http2: bool = False
+    """Enable HTTP/2 multiplexing (requires the ``http2`` extra)."""
+
+    timeout: float | None = 30.0
+    """Default timeout in seconds for every phase (None to disable)."""
+
+    connect_timeout: float | None = None
+    """Timeout for establishing a connection."""
+
+    read_timeout: float | None = None
+    """Timeout for reading a chunk of the response."""
+
+    write_timeout: float | None = None
+    """Timeout for writing a chunk of the request."""
+
+    pool_timeout: float | None = None
+    """Timeout for acquiring a connection from the pool."""
+
+    transport: "httpx.BaseTransport | httpx.AsyncBaseTransport | None" = None
+    """
+    Custom httpx transport (e.g. ``httpx.MockTransport``); pool settings then belong to it.
+
+    Sync clients need an ``httpx.BaseTransport`` and async clients an ``httpx.AsyncBaseTransport``;
+    the client raises TypeError on construction otherwise.
+    """
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy for transient API failures.
+
+    Idempotent methods are retried on any transport error or retryable status. Other
+    requests (including signed user actions) are only retried when the request provably
+    was not processed: a connection that was never established, or a 429 response.
+    Signed requests always restart from a fresh user action challenge.
+    """
+
+    max_attempts: int = 3
+    """Total number of attempts, including the first one."""
+
+    backoff_initial: float = 0.5
+    """Delay in seconds before the first retry; doubles on every further attempt."""
+
+    backoff_max: float = 30.0
+    """Upper bound in seconds for the exponential backoff delay."""
+
+    jitter: float = 1.0
+    """Fraction of the backoff delay that is randomized (0 disables jitter, 1 is full jitter)."""
+
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    """HTTP status codes considered transient."""
+
+    idempotent_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+    """Methods safe to retry on any transient failure when no user action is involved."""
+
+    respect_retry_after: bool = True
+    """Wait for the delay requested by a Retry-After header instead of the backoff delay."""
+
+    max_retry_after: float = 60.0
+    """Give up instead of retrying when Retry-After asks to wait longer than this."""
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    One stage of a single HTTP exchange, as passed to RequestHooks callbacks.
+
+    Every attempt of every request is reported, including the challenge and signature
+    requests of the user action flow.
+    """
+
+    operation: str
+    """Operation the request belongs to, e.g. "wallets.transfer_asset"."""
+
+    method: str
+    """HTTP method."""
+
+    path: str
+    """Endpoint path template, e.g. "/wallets/{walletId}/transfers"."""
+
+    phase: str
+    """"challenge", "signature" or "request" (see PhaseTiming)."""
+
+    attempt: int
+    """Attempt of the call this exchange belongs to."""
+
+    user_action: bool
+    """Whether the exchange is part of a user action (a signing request or a signed call)."""
+
+    request_bytes: int
+    """Size of the request body."""
+
+    status_code: int | None = None
+    """HTTP status, once a response was received."""
+
+    response_bytes: int | None = None
+    """Size of the response body (from Content-Length for streamed responses)."""
+
+    duration: float | None = None
+    """Seconds from sending the request to receiving the response or error."""
+
+    error: BaseException | None = None
+    """Transport error, for on_error events raised by the network."""
+
+    retry_delay: float | None = None
+    """Seconds before the next attempt, for on_retry events."""
+
+
+RequestHook = Callable[[RequestEvent], None]
+"""Callback receiving a RequestEvent."""
+
+
+@dataclass
+class RequestHooks:
+    """
+    Callbacks around every HTTP exchange of a client.
+
+    Callbacks run synchronously on the thread (or event loop) making the request, so
+    they should be quick. Callbacks can be registered before or after the client is
+    created; with none registered, the hooks cost a few attribute checks per request.
+
+    Example:
+        >>> def log(event: RequestEvent) -> None:
+        ...     print(event.method, event.path, event.status_code, event.duration)
+        >>> hooks = RequestHooks()
+        >>> hooks.register("after_response", log)
+        >>> config = DfnsClientConfig(auth_token="your-token", hooks=hooks)
+    """
+
+    before_request: list[RequestHook] = field(default_factory=list)
+    """Called before each request is sent."""
+
+    after_response: list[RequestHook] = field(default_factory=list)
+    """Called with each response, whatever its status."""
+
+    on_error: list[RequestHook] = field(default_factory=list)
+    """Called on transport errors and on HTTP error statuses (400 and above)."""
+
+    on_retry: list[RequestHook] = field(default_factory=list)
+    """Called when a failed attempt is about to be retried."""
+
+    def register(self, event: str, callback: RequestHook) -> None:
+        """
+        Register a callback.
+
+        Args:
+            event: "before_request", "after_response", "on_error" or "on_retry".
+            callback: The callback.
+
+        Raises:
+            ValueError: If the event name is unknown.
+        """
+        if event not in ("before_request", "after_response", "on_error", "on_retry"):
+            raise ValueError(f"Unknown request hook: {event}")
+        callbacks: list[RequestHook] = getattr(self, event)
+        callbacks.append(callback)
+
+    def __bool__(self) -> bool:
+        return bool(self.before_request or self.after_response or self.on_error or self.on_retry)
 
 
 @dataclass
@@ -17,12 +204,30 @@ class DfnsClientConfig:
     base_url: str = "https://api.dfns.io"
     """Complete transport base URL for the Dfns API, including any path prefix."""
 
-    signer: "Signer | None" = None
-    """Signer for user action requests."""
+    signer: "Signer | AsyncSigner | None" = None
+    """Signer for user action requests (AsyncSigner is only supported by AsyncDfnsClient)."""
 
     headers: dict[str, str] = field(default_factory=dict)
     """Additional headers to include in requests."""
 
+    connection: ConnectionConfig = field(default_factory=ConnectionConfig)
+    """Connection pool, keep-alive, HTTP/2 and timeout settings."""
+
+    retry: RetryPolicy | None = None
+    """Retry policy for transient failures (None disables retries)."""
+
+    json_codec: "JsonCodec | None" = None
+    """JSON codec for request and response bodies (defaults to the standard library)."""
+
+    on_phase: "Callable[[PhaseTiming], None] | None" = None
+    """Hook receiving the timing of every request and signing phase (e.g. a LatencyRecorder)."""
+
+    hooks: RequestHooks = field(default_factory=RequestHooks)
+    """Callbacks around every HTTP exchange (metrics, logging, tracing)."""
+
+    tracing: "Tracing | None" = None
+    """Tracing backend spanning every operation and HTTP exchange (e.g. OpenTelemetryTracing)."""
+
 
 @dataclass
 class DfnsDelegatedClientConfig:
@@ -42,6 +247,86 @@ class DfnsDelegatedClientConfig:
     headers: dict[str, str] = field(default_factory=dict)
     """Additional headers to include in requests."""
 
+    connection: ConnectionConfig = field(default_factory=ConnectionConfig)
+    """Connection pool, keep-alive, HTTP/2 and timeout settings."""
+
+    retry: RetryPolicy | None = None
+    """Retry policy for transient failures (None disables retries)."""
+
+    json_codec: "JsonCodec | None" = None
+    """JSON codec for request and response bodies (defaults to the standard library)."""
+
+    on_phase: "Callable[[PhaseTiming], None] | None" = None
+    """Hook receiving the timing of every request and signing phase (e.g. a LatencyRecorder)."""
+
+    hooks: RequestHooks = field(default_factory=RequestHooks)
+    """Callbacks around every HTTP exchange (metrics, logging, tracing)."""
+
+    tracing: "Tracing | None" = None
+    """Tracing backend spanning every operation and HTTP exchange (e.g. OpenTelemetryTracing)."""
+
+    challenge_store: "PendingChallengeStore | None" = None
+    """Store recording every challenge created by ``*_init``, for ``complete_by_challenge_id``."""
+
+    challenge_ttl: float = 300.0
+    """Seconds a pending challenge is kept in the challenge store."""
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """Outcome of one operation of a batch, in the position it was submitted."""
+
+    index: int
+    """Position of the operation in the submitted batch."""
+
+    value: T | None = None
+    """The operation's return value, if it succeeded."""
+
+    error: Exception | None = None
+    """The exception raised by the operation, if it failed."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class PhaseTiming:
+    """
+    Timing of one phase of a request.
+
+    A signed call goes through the phases "challenge" (``/auth/action/init``), "sign"
+    (the local signer), "signature" (``/auth/action``) and "request" (the call itself).
+    Every retried attempt of a phase is reported separately.
+    """
+
+    operation: str
+    """Operation the phase belongs to, e.g. "wallets.transfer_asset"."""
+
+    phase: str
+    """Phase name: "challenge", "sign", "signature" or "request"."""
+
+    status: str
+    """"ok", or "error" if the phase raised or received an HTTP error status."""
+
+    duration: float
+    """Wall-clock duration in seconds."""
+
+    cpu_time: float | None = None
+    """
+    CPU seconds spent by the signing thread, for the "sign" phase of signers without ``asign``.
+
+    None for signers computing the signature elsewhere, such as PooledKeySigner's worker
+    processes, whose cost only shows in ``duration``.
+    """
+
+    attempt: int = 1
+    """Attempt of the call this phase belongs to."""
+
+    status_code: int | None = None
+    """HTTP status of the response, for phases making a request."""
+
 
 class DfnsError(Exception):
     """Exception raised by Dfns API errors."""
@@ -0,0 +1,114 @@
+"""Tests for the AsyncDfnsClient (read + user-action flows)."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import AsyncDfnsClient
+from dfns_sdk.types import DfnsClientConfig
+
+BASE_URL = "https://api.test.dfns"
+
+
+class _FakeSigner:
+    """Duck-typed Signer for the user-action flow."""
+
+    def sign(self, challenge):  # type: ignore[no-untyped-def]
+        return {"kind": "Key", "credentialAssertion": {"credId": "cr-1", "clientData": "x", "signature": "y"}}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_list_wallets_parses_response() -> None:
+    route = respx.get(f"{BASE_URL}/wallets").mock(
+        return_value=httpx.Response(200, json={"items": [{"id": "wa-1"}], "nextPageToken": None})
+    )
+
+    async with AsyncDfnsClient(DfnsClientConfig(auth_token="test-token", base_url=BASE_URL)) as client:
+        result = await client.wallets.list_wallets()
+
+    assert result["items"][0]["id"] == "wa-1"
+    assert route.calls.last.request.headers["authorization"] == "Bearer test-token"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_create_wallet_runs_user_action_flow() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+    wallet_route = respx.post(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"id": "wa-123"}))
+
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakeSigner())
+    async with AsyncDfnsClient(config) as client:
+        wallet = await client.wallets.create_wallet({"network": "EthereumSepolia"})
+
+    assert wallet["id"] == "wa-123"
+    assert wallet_route.calls.last.request.headers["x-dfns-useraction"] == "ua-token"
+
+
+class _FakeAsyncSigner:
+    """Duck-typed AsyncSigner recording that it was awaited."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def asign(self, challenge):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        return _FakeSigner().sign(challenge)
+
+
+class _SlowSigner:
+    """Sync signer that blocks its thread, like a slow RSA or remote HSM signature."""
+
+    def __init__(self) -> None:
+        self.thread_id = 0
+
+    def sign(self, challenge):  # type: ignore[no-untyped-def]
+        self.thread_id = threading.get_ident()
+        time.sleep(0.2)
+        return _FakeSigner().sign(challenge)
+
+
+def _mock_user_action() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+    respx.post(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"id": "wa-123"}))
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_signer_is_awaited() -> None:
+    _mock_user_action()
+    signer = _FakeAsyncSigner()
+
+    async with AsyncDfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=signer)) as client:
+        await client.wallets.create_wallet({"network": "EthereumSepolia"})
+
+    assert signer.calls == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_sync_signer_does_not_block_event_loop() -> None:
+    _mock_user_action()
+    respx.get(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"items": []}))
+    signer = _SlowSigner()
+
+    async with AsyncDfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=signer)) as client:
+        start = time.perf_counter()
+        create = asyncio.create_task(client.wallets.create_wallet({"network": "EthereumSepolia"}))
+        await asyncio.sleep(0.05)
+        await asyncio.gather(*(client.wallets.list_wallets() for _ in range(20)))
+        reads = time.perf_counter() - start
+        await create
+
+    assert signer.thread_id != threading.get_ident()
+    assert reads < 0.15
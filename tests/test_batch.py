@@ -0,0 +1,98 @@
+"""Tests for concurrent batches of signed operations."""
+
+import json
+import threading
+import time
+from functools import partial
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import AsyncDfnsClient, DfnsClient, DfnsError
+from dfns_sdk.types import DfnsClientConfig
+
+BASE_URL = "https://api.test.dfns"
+
+
+class _FakeSigner:
+    """Duck-typed Signer for the user-action flow."""
+
+    def sign(self, challenge):  # type: ignore[no-untyped-def]
+        return {"kind": "Key", "credentialAssertion": {"credId": "cr-1", "clientData": "x", "signature": "y"}}
+
+
+def _mock_user_action() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+
+
+def _transfer(request: httpx.Request) -> httpx.Response:
+    amount = json.loads(request.content)["amount"]
+    if amount == "bad":
+        return httpx.Response(400, json={"message": "invalid amount"})
+    return httpx.Response(200, json={"id": f"xfr-{amount}"})
+
+
+@respx.mock
+def test_batch_reports_results_in_order_with_per_item_errors() -> None:
+    _mock_user_action()
+    respx.post(f"{BASE_URL}/wallets/wa-1/transfers").mock(side_effect=_transfer)
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakeSigner()))
+
+    amounts = ["1", "2", "bad", "4"]
+    results = client.batch(
+        [partial(client.wallets.transfer_asset, "wa-1", {"kind": "Native", "amount": a}) for a in amounts],
+        max_concurrency=3,
+    )
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.value["id"] for r in results if r.ok] == ["xfr-1", "xfr-2", "xfr-4"]  # type: ignore[index]
+    assert isinstance(results[2].error, DfnsError)
+    assert results[2].error.status_code == 400
+
+
+def test_batch_bounds_concurrency() -> None:
+    lock = threading.Lock()
+    running = peak = 0
+
+    def operation() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL))
+    results = client.batch([operation] * 12, max_concurrency=4)
+
+    assert all(r.ok for r in results)
+    assert 1 < peak <= 4
+
+
+def test_batch_rejects_invalid_concurrency() -> None:
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL))
+
+    with pytest.raises(ValueError):
+        client.batch([], max_concurrency=0)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_batch_runs_signed_operations() -> None:
+    _mock_user_action()
+    route = respx.post(f"{BASE_URL}/wallets/wa-1/transfers").mock(side_effect=_transfer)
+
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakeSigner())
+    async with AsyncDfnsClient(config) as client:
+        results = await client.batch(
+            [partial(client.wallets.transfer_asset, "wa-1", {"kind": "Native", "amount": a}) for a in "12"],
+            max_concurrency=2,
+        )
+
+    assert [r.value["id"] for r in results] == ["xfr-1", "xfr-2"]  # type: ignore[index]
+    assert route.call_count == 2
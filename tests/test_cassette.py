@@ -0,0 +1,101 @@
+"""Tests for the cassette record/replay transports."""
+
+from pathlib import Path
+
+import pytest
+
+from dfns_sdk import AsyncDfnsClient, ConnectionConfig, DfnsClient, DfnsError
+from dfns_sdk.cassette import RecordingTransport, ReplayTransport
+from dfns_sdk.simulator import DfnsSimulator
+from dfns_sdk.types import DfnsClientConfig
+
+
+class _FakeSigner:
+    """Duck-typed Signer for the user-action flow."""
+
+    def sign(self, challenge):  # type: ignore[no-untyped-def]
+        return {"kind": "Key", "credentialAssertion": {"credId": "cr-1", "clientData": "x", "signature": "y"}}
+
+
+def _client(transport) -> DfnsClient:  # type: ignore[no-untyped-def]
+    return DfnsClient(
+        DfnsClientConfig(auth_token="t", signer=_FakeSigner(), connection=ConnectionConfig(transport=transport))
+    )
+
+
+def _record(path: Path) -> tuple[str, list[str], str]:
+    with RecordingTransport(str(path), transport=DfnsSimulator(wallets=5)) as recorder:
+        client = _client(recorder)
+        wallet_ids = [wallet["id"] for wallet in client.wallets.iter_wallets(page_size=2)]
+        transfer = client.wallets.transfer_asset(wallet_ids[0], {"kind": "Native", "to": "0x01", "amount": "1"})
+        client.wallets.get_wallet(wallet_ids[0])
+    return wallet_ids[0], wallet_ids, transfer["id"]
+
+
+@pytest.mark.parametrize("name", ["session.jsonl", "session.jsonl.gz"])
+def test_replays_signed_flow_and_pages_offline(tmp_path: Path, name: str) -> None:
+    wallet_id, wallet_ids, transfer_id = _record(tmp_path / name)
+    replay = ReplayTransport(str(tmp_path / name))
+    client = _client(replay)
+
+    assert [wallet["id"] for wallet in client.wallets.iter_wallets(page_size=2)] == wallet_ids
+    transfer = client.wallets.transfer_asset(wallet_id, {"amount": "1", "to": "0x01", "kind": "Native"})
+    assert transfer["id"] == transfer_id
+    assert client.wallets.get_wallet(wallet_id)["id"] == wallet_id
+    assert replay.remaining == 0
+    with pytest.raises(DfnsError) as error:
+        client.wallets.list_wallets()
+    assert error.value.error_code == "CASSETTE_NO_MATCH"
+
+
+def test_matches_on_path_template_and_repeats(tmp_path: Path) -> None:
+    wallet_id, _, _ = _record(tmp_path / "session.jsonl")
+    client = _client(ReplayTransport(str(tmp_path / "session.jsonl"), repeat=True))
+
+    for _ in range(3):
+        client.wallets.transfer_asset(wallet_id, {"kind": "Native", "to": "0x01", "amount": "1"})
+        assert client.wallets.get_wallet("wa-other")["id"] == wallet_id
+    with pytest.raises(DfnsError):
+        client.wallets.transfer_asset(wallet_id, {"kind": "Native", "to": "0x02", "amount": "1"})
+
+
+def test_matches_on_query_parameters(tmp_path: Path) -> None:
+    path = str(tmp_path / "session.jsonl")
+    with RecordingTransport(path, transport=DfnsSimulator(wallets=5)) as recorder:
+        client = _client(recorder)
+        one = client.wallets.list_wallets({"limit": 1})
+        three = client.wallets.list_wallets({"limit": 3})
+    client = _client(ReplayTransport(path))
+
+    assert client.wallets.list_wallets({"limit": 3}) == three
+    assert client.wallets.list_wallets({"limit": 1}) == one
+
+
+def test_latency_scale(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "session.jsonl"
+    path.write_text(
+        '{"method":"GET","template":"/wallets","body":"","query":"","url":"https://api.dfns.io/wallets",'
+        '"status":200,"headers":[["content-type","application/json"]],"response":{"text":"{\\"items\\":[]}"},'
+        '"elapsed":0.2}\n'
+    )
+    delays: list[float] = []
+    monkeypatch.setattr("dfns_sdk.cassette.time.sleep", delays.append)
+
+    assert _client(ReplayTransport(str(path), latency_scale=0.5)).wallets.list_wallets() == {"items": []}
+    assert delays == [pytest.approx(0.1)]
+
+
+@pytest.mark.asyncio
+async def test_async_record_and_replay(tmp_path: Path) -> None:
+    path = str(tmp_path / "session.jsonl")
+    config = DfnsClientConfig(auth_token="t", signer=_FakeSigner())
+
+    async with RecordingTransport(path, transport=DfnsSimulator(wallets=3)) as recorder:
+        config.connection = ConnectionConfig(transport=recorder)
+        async with AsyncDfnsClient(config) as client:
+            recorded = await client.webhooks.create_webhook({"url": "https://example.com", "events": ["*"]})
+    config.connection = ConnectionConfig(transport=ReplayTransport(path))
+    async with AsyncDfnsClient(config) as client:
+        replayed = await client.webhooks.create_webhook({"url": "https://example.com", "events": ["*"]})
+
+    assert replayed == recorded
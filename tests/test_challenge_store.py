@@ -0,0 +1,143 @@
+"""Tests for pending challenge stores and completion by challenge identifier."""
+
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import AsyncDfnsDelegatedClient, DfnsDelegatedClient, DfnsError
+from dfns_sdk.challenge_store import InMemoryChallengeStore, PendingChallenge, SQLiteChallengeStore
+from dfns_sdk.types import DfnsDelegatedClientConfig, RequestEvent, RequestHooks
+
+BASE_URL = "https://api.test.dfns"
+
+
+def make_entry(identifier: str = "ch-1", ttl: float = 60.0) -> PendingChallenge:
+    return PendingChallenge(identifier, "POST", "/wallets", b'{"network":"EthereumSepolia"}', time.time() + ttl)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> InMemoryChallengeStore | SQLiteChallengeStore:
+    if request.param == "memory":
+        return InMemoryChallengeStore()
+    return SQLiteChallengeStore(str(tmp_path / "challenges.db"))
+
+
+def test_pop_returns_entry_once(store: InMemoryChallengeStore | SQLiteChallengeStore) -> None:
+    entry = make_entry()
+    store.put(entry)
+
+    assert store.pop("ch-1") == entry
+    assert store.pop("ch-1") is None
+
+
+def test_expired_entries_are_evicted(store: InMemoryChallengeStore | SQLiteChallengeStore) -> None:
+    store.put(make_entry("ch-old", ttl=-1))
+    store.put(make_entry("ch-new"))
+
+    assert store.pop("ch-old") is None
+    store.put(make_entry("ch-stale", ttl=-1))
+    assert store.evict_expired() == 1
+    assert store.pop("ch-new") is not None
+
+
+def test_sqlite_store_is_shared_between_connections(tmp_path: Path) -> None:
+    path = str(tmp_path / "challenges.db")
+    creator, completer = SQLiteChallengeStore(path), SQLiteChallengeStore(path)
+    entry = make_entry()
+
+    creator.put(entry)
+
+    assert completer.pop("ch-1") == entry
+    assert creator.pop("ch-1") is None
+    creator.close()
+    completer.close()
+
+
+def make_delegated(store: InMemoryChallengeStore | None) -> DfnsDelegatedClient:
+    config = DfnsDelegatedClientConfig(auth_token="service-account-token", base_url=BASE_URL, challenge_store=store)
+    return DfnsDelegatedClient(config)
+
+
+@respx.mock
+def test_complete_by_challenge_id_on_another_client() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+    wallet_route = respx.post(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"id": "wa-123"}))
+    store = InMemoryChallengeStore()
+
+    make_delegated(store).wallets.create_wallet_init(body={"network": "EthereumSepolia"})
+    wallet = make_delegated(store).complete_by_challenge_id({"challengeIdentifier": "ch-1", "firstFactor": {}})
+
+    assert wallet == {"id": "wa-123"}
+    sent = wallet_route.calls.last.request
+    assert sent.headers["x-dfns-useraction"] == "ua-token"
+    assert sent.content == b'{"network":"EthereumSepolia"}'
+    assert len(store) == 0
+
+
+@respx.mock
+def test_complete_by_challenge_id_reports_the_generated_endpoint() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+    respx.put(f"{BASE_URL}/wallets/wa-9/tags").mock(return_value=httpx.Response(200, json={}))
+    store = InMemoryChallengeStore()
+    events: list[RequestEvent] = []
+    hooks = RequestHooks(after_response=[events.append])
+    config = DfnsDelegatedClientConfig(auth_token="t", base_url=BASE_URL, challenge_store=store, hooks=hooks)
+
+    make_delegated(store).wallets.tag_wallet_init("wa-9", {"tags": ["t"]})
+    DfnsDelegatedClient(config).complete_by_challenge_id({"challengeIdentifier": "ch-1", "firstFactor": {}})
+
+    assert [(e.operation, e.phase, e.path) for e in events] == [
+        ("wallets.tag_wallet", "signature", "/auth/action"),
+        ("wallets.tag_wallet", "request", "/wallets/{walletId}/tags"),
+    ]
+
+
+@respx.mock
+def test_failed_signature_keeps_challenge_pending() -> None:
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(401, json={"error": "bad signature"}))
+    store = InMemoryChallengeStore()
+    store.put(make_entry())
+
+    with pytest.raises(DfnsError):
+        make_delegated(store).complete_by_challenge_id({"challengeIdentifier": "ch-1", "firstFactor": {}})
+
+    assert store.pop("ch-1") is not None
+
+
+def test_complete_by_challenge_id_errors() -> None:
+    with pytest.raises(DfnsError) as missing_store:
+        make_delegated(None).complete_by_challenge_id({"challengeIdentifier": "ch-1"})
+    with pytest.raises(DfnsError) as unknown:
+        make_delegated(InMemoryChallengeStore()).complete_by_challenge_id({"challengeIdentifier": "ch-1"})
+
+    assert missing_store.value.error_code == "CHALLENGE_STORE_REQUIRED"
+    assert unknown.value.error_code == "CHALLENGE_NOT_FOUND"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_complete_by_challenge_id(tmp_path: Path) -> None:
+    respx.put(f"{BASE_URL}/wallets/wa-9/tags").mock(return_value=httpx.Response(200, json={}))
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-2", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+    store = SQLiteChallengeStore(str(tmp_path / "challenges.db"))
+    config = DfnsDelegatedClientConfig(auth_token="t", base_url=BASE_URL, challenge_store=store)
+
+    async with AsyncDfnsDelegatedClient(config) as client:
+        await client.wallets.tag_wallet_init("wa-9", {"tags": ["t"]})
+        result = await client.complete_by_challenge_id({"challengeIdentifier": "ch-2", "firstFactor": {}})
+
+    assert result == {}
+    assert store.pop("ch-2") is None
+    store.close()
@@ -1,14 +1,31 @@
 """Tests for the regular DfnsClient (read + user-action flows)."""
 
+import json
+
 import httpx
+import pytest
 import respx
 
-from dfns_sdk import DfnsClient
-from dfns_sdk.types import DfnsClientConfig
+from dfns_sdk import AsyncDfnsClient, DfnsClient, DfnsError
+from dfns_sdk.types import ConnectionConfig, DfnsClientConfig
 
 BASE_URL = "https://api.test.dfns"
 
 
+class _FakeSigner:
+    """Duck-typed Signer for the user-action flow."""
+
+    def sign(self, challenge):  # type: ignore[no-untyped-def]
+        return {"kind": "Key", "credentialAssertion": {"credId": "cr-1", "clientData": "x", "signature": "y"}}
+
+
+class _FakeAsyncOnlySigner:
+    """Duck-typed AsyncSigner without a sync ``sign`` method."""
+
+    async def asign(self, challenge):  # type: ignore[no-untyped-def]
+        return {}
+
+
 def make_client() -> DfnsClient:
     return DfnsClient(DfnsClientConfig(auth_token="test-token", base_url=BASE_URL))
 
@@ -32,3 +49,50 @@ def test_auth_header_is_sent() -> None:
     make_client().wallets.list_wallets()
 
     assert route.calls.last.request.headers["authorization"] == "Bearer test-token"
+
+
+def test_connection_config_reaches_httpx_client() -> None:
+    connection = ConnectionConfig(max_connections=7, keepalive_expiry=12.0, connect_timeout=2.0, read_timeout=9.0)
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL, connection=connection))
+
+    pool = client._http._client._transport._pool  # type: ignore[attr-defined]
+    assert pool._max_connections == 7
+    assert pool._keepalive_expiry == 12.0
+    timeout = client._http._client.timeout
+    assert (timeout.connect, timeout.read, timeout.write) == (2.0, 9.0, 30.0)
+
+
+def test_transport_must_match_client_kind() -> None:
+    with pytest.raises(TypeError, match="DfnsClient requires a sync transport"):
+        DfnsClient(DfnsClientConfig(auth_token="t", connection=ConnectionConfig(transport=httpx.AsyncHTTPTransport())))
+    with pytest.raises(TypeError, match="AsyncDfnsClient requires an async transport"):
+        AsyncDfnsClient(DfnsClientConfig(auth_token="t", connection=ConnectionConfig(transport=httpx.HTTPTransport())))
+
+
+@respx.mock
+def test_signed_payload_matches_sent_body_bytes() -> None:
+    init = respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua"}))
+    wallet_route = respx.post(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"id": "wa-1"}))
+
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakeSigner())
+    DfnsClient(config).wallets.create_wallet({"network": "EthereumSepolia", "name": "Trésorerie"})
+
+    signed_payload = json.loads(init.calls.last.request.content)["userActionPayload"]
+    assert signed_payload.encode("utf-8") == wallet_route.calls.last.request.content
+
+
+@respx.mock
+def test_async_only_signer_fails_before_creating_a_challenge() -> None:
+    init = respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakeAsyncOnlySigner())
+    with pytest.raises(DfnsError) as error:
+        DfnsClient(config).wallets.create_wallet({"network": "EthereumSepolia"})
+
+    assert error.value.error_code == "SIGNER_NOT_SYNC"
+    assert not init.called
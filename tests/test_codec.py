@@ -0,0 +1,43 @@
+"""Tests for the pluggable JSON codecs."""
+
+import contextlib
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import DfnsClient, DfnsError
+from dfns_sdk.codec import JsonCodec, MsgspecCodec, OrjsonCodec, StdlibJsonCodec
+from dfns_sdk.types import DfnsClientConfig
+
+BASE_URL = "https://api.test.dfns"
+
+
+def _codecs() -> list[JsonCodec]:
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+    for codec_type in (OrjsonCodec, MsgspecCodec):
+        with contextlib.suppress(ImportError):
+            codecs.append(codec_type())
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: type(codec).__name__)
+def test_codecs_emit_identical_compact_json(codec: JsonCodec) -> None:
+    value = {"network": "EthereumSepolia", "name": "café", "tags": ["a", 1, None, True]}
+
+    assert codec.dumps(value) == b'{"network":"EthereumSepolia","name":"caf\xc3\xa9","tags":["a",1,null,true]}'
+    assert codec.loads(codec.dumps(value)) == value
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: type(codec).__name__)
+@respx.mock
+def test_client_uses_configured_codec(codec: JsonCodec) -> None:
+    respx.get(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"items": [{"id": "wa-1"}]}))
+    respx.get(f"{BASE_URL}/wallets/bad").mock(return_value=httpx.Response(502, text="<html>bad gateway</html>"))
+
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL, json_codec=codec))
+
+    assert client.wallets.list_wallets() == {"items": [{"id": "wa-1"}]}
+    with pytest.raises(DfnsError) as excinfo:
+        client.wallets.get_wallet("bad")
+    assert excinfo.value.message == "<html>bad gateway</html>"
@@ -1,9 +1,12 @@
 """Tests for the delegated (externally-signed) client: init/complete flow."""
 
+import json
+
 import httpx
+import pytest
 import respx
 
-from dfns_sdk import DfnsDelegatedClient
+from dfns_sdk import AsyncDfnsDelegatedClient, DfnsDelegatedClient
 from dfns_sdk.types import DfnsDelegatedClientConfig
 
 BASE_URL = "https://api.test.dfns"
@@ -42,3 +45,118 @@ def test_create_wallet_complete_uses_user_action_token() -> None:
     assert wallet["id"] == "wa-123"
     # The actual request must carry the pre-obtained user action token.
     assert wallet_route.calls.last.request.headers["x-dfns-useraction"] == "ua-token"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_delegated_init_and_complete() -> None:
+    init = respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+    wallet_route = respx.post(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"id": "wa-123"}))
+
+    config = DfnsDelegatedClientConfig(auth_token="service-account-token", base_url=BASE_URL)
+    async with AsyncDfnsDelegatedClient(config) as client:
+        challenge = await client.wallets.create_wallet_init(body={"network": "EthereumSepolia"})
+        wallet = await client.wallets.create_wallet_complete(
+            body={"network": "EthereumSepolia"},
+            signed_challenge={"challengeIdentifier": challenge["challengeIdentifier"], "firstFactor": {"kind": "Key"}},
+        )
+
+    assert b'"userActionHttpPath":"/wallets"' in init.calls.last.request.content
+    assert wallet["id"] == "wa-123"
+    assert wallet_route.calls.last.request.headers["x-dfns-useraction"] == "ua-token"
+
+
+def _init_route(request: httpx.Request) -> httpx.Response:
+    path = json.loads(request.content)["userActionHttpPath"]
+    return httpx.Response(200, json={"challengeIdentifier": f"ch-{path}", "challenge": "Y2g"})
+
+
+def _wallet_route(request: httpx.Request) -> httpx.Response:
+    assert request.headers["x-dfns-useraction"] == "ua-token"
+    return httpx.Response(200, json={"id": f"wa-{json.loads(request.content)['name']}"})
+
+
+@respx.mock
+def test_batch_init_and_complete() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(side_effect=_init_route)
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+    respx.post(f"{BASE_URL}/wallets").mock(side_effect=_wallet_route)
+    respx.put(f"{BASE_URL}/wallets/wa-9/tags").mock(return_value=httpx.Response(200, json={}))
+    client = make_delegated()
+
+    operations = [
+        (client.wallets.create_wallet_init, {"body": {"network": "EthereumSepolia", "name": "a"}}),
+        (client.wallets.tag_wallet_init, ("wa-9", {"tags": ["t"]})),
+        (client.wallets.create_wallet_init, {"body": {"network": "EthereumSepolia", "name": "c"}}),
+    ]
+    challenges = client.init_batch(operations, max_concurrency=2)
+
+    identifiers = [c.value["challengeIdentifier"] for c in challenges if c.value]
+    assert identifiers == ["ch-/wallets", "ch-/wallets/wa-9/tags", "ch-/wallets"]
+
+    # The prepared actions carry the challenged payload, so the body is not encoded again.
+    operations[0][1]["body"]["name"] = "changed"
+    signed = [{"challengeIdentifier": i, "firstFactor": {"kind": "Key"}} for i in identifiers[:2]]
+    results = client.complete_batch(operations, [*signed, None], challenges, max_concurrency=2)
+
+    assert results[0].value == {"id": "wa-a"}
+    assert results[1].ok
+    assert isinstance(results[2].error, ValueError)
+
+
+def test_complete_batch_requires_matching_lengths() -> None:
+    client = make_delegated()
+
+    with pytest.raises(ValueError):
+        client.complete_batch([(client.wallets.create_wallet_init, {"body": {}})], [])
+    with pytest.raises(ValueError):
+        client.complete_batch([(client.wallets.create_wallet_init, {"body": {}})], [None], [])
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_batch_init() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(side_effect=_init_route)
+
+    config = DfnsDelegatedClientConfig(auth_token="t", base_url=BASE_URL)
+    async with AsyncDfnsDelegatedClient(config) as client:
+        challenges = await client.init_batch([(client.wallets.tag_wallet_init, (w, {"tags": []})) for w in "xy"])
+
+    identifiers = [c.value["challengeIdentifier"] for c in challenges if c.value]
+    assert identifiers == ["ch-/wallets/x/tags", "ch-/wallets/y/tags"]
+
+
+@respx.mock
+def test_prepared_action_sends_the_challenged_payload() -> None:
+    init = respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+    tag_route = respx.put(f"{BASE_URL}/wallets/wa-9/tags").mock(return_value=httpx.Response(200, json={}))
+    client = make_delegated()
+    body = {"tags": ["café"]}
+
+    prepared = client.wallets.tag_wallet_init("wa-9", body)
+    signed = {"challengeIdentifier": prepared["challengeIdentifier"], "firstFactor": {"kind": "Key"}}
+    client.wallets.tag_wallet_complete("wa-9", body, signed, prepared=prepared)
+
+    assert (prepared.method, prepared.path) == ("PUT", "/wallets/wa-9/tags")
+    assert json.loads(init.calls.last.request.content)["userActionPayload"] == prepared.payload.decode()
+    assert tag_route.calls.last.request.content == prepared.payload
+
+
+@respx.mock
+def test_prepared_action_must_match_the_request() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+    client = make_delegated()
+
+    prepared = client.wallets.tag_wallet_init("wa-9", {"tags": []})
+
+    with pytest.raises(ValueError):
+        client.wallets.tag_wallet_complete("wa-1", {"tags": []}, {"challengeIdentifier": "ch-1"}, prepared=prepared)
@@ -0,0 +1,65 @@
+"""Tests for precompiled endpoints and the request hot path."""
+
+import importlib
+import pkgutil
+
+import httpx
+import pytest
+import respx
+
+import dfns_sdk.generated
+from dfns_sdk import DfnsClient
+from dfns_sdk._internal.endpoint import Endpoint
+from dfns_sdk.types import DfnsClientConfig
+
+BASE_URL = "https://api.test.dfns"
+
+
+def test_resolve_substitutes_params_in_template_order() -> None:
+    endpoint = Endpoint("webhooks.get_webhook_event", "GET", "/webhooks/{webhookId}/events/{webhookEventId}")
+
+    assert endpoint.params == ("webhookId", "webhookEventId")
+    assert endpoint.resolve("wh-1", "ev-2") == "/webhooks/wh-1/events/ev-2"
+
+
+def test_endpoint_rejects_non_relative_path() -> None:
+    with pytest.raises(ValueError):
+        Endpoint("x.y", "GET", "//evil.test/wallets")
+
+
+def test_generated_registries_have_unique_operations() -> None:
+    operations = set()
+    for module in pkgutil.iter_modules(dfns_sdk.generated.__path__):
+        endpoints = importlib.import_module(f"dfns_sdk.generated.{module.name}.endpoints")
+        for value in vars(endpoints).values():
+            if isinstance(value, Endpoint):
+                assert value.operation.startswith(f"{module.name}.")
+                assert value.operation not in operations
+                operations.add(value.operation)
+
+    assert "wallets.transfer_asset" in operations
+
+
+@respx.mock
+def test_legacy_request_and_endpoint_call_hit_same_url() -> None:
+    route = respx.get(f"{BASE_URL}/wallets/wa-1/assets").mock(return_value=httpx.Response(200, json={}))
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL))
+
+    client.wallets.get_wallet_assets("wa-1")
+    client._http.request("GET", "/wallets/{walletId}/assets", path_params={"walletId": "wa-1"})
+
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_replaced_auth_token_is_picked_up() -> None:
+    route = respx.get(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"items": []}))
+    config = DfnsClientConfig(auth_token="old", base_url=BASE_URL)
+    client = DfnsClient(config)
+
+    client.wallets.list_wallets()
+    config.auth_token = "new"
+    client.wallets.list_wallets()
+
+    assert route.calls[0].request.headers["authorization"] == "Bearer old"
+    assert route.calls[1].request.headers["authorization"] == "Bearer new"
@@ -0,0 +1,124 @@
+"""Tests for request lifecycle hooks."""
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import AsyncDfnsClient, DfnsClient, DfnsDelegatedClient, RequestEvent, RequestHooks
+from dfns_sdk.types import DfnsClientConfig, DfnsDelegatedClientConfig, RetryPolicy
+
+BASE_URL = "https://api.test.dfns"
+
+
+class _FakeSigner:
+    """Duck-typed Signer for the user-action flow."""
+
+    def sign(self, challenge):  # type: ignore[no-untyped-def]
+        return {"kind": "Key", "credentialAssertion": {"credId": "cr-1", "clientData": "x", "signature": "y"}}
+
+
+def _mock_user_action() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+
+
+def _recording_hooks() -> tuple[RequestHooks, list[tuple[str, RequestEvent]]]:
+    events: list[tuple[str, RequestEvent]] = []
+    hooks = RequestHooks()
+    for name in ("before_request", "after_response", "on_error", "on_retry"):
+        hooks.register(name, lambda event, name=name: events.append((name, event)))
+    return hooks, events
+
+
+@respx.mock
+def test_signed_call_reports_every_exchange() -> None:
+    _mock_user_action()
+    respx.post(f"{BASE_URL}/wallets/wa-1/transfers").mock(return_value=httpx.Response(200, json={"id": "xfr-1"}))
+    hooks, events = _recording_hooks()
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakeSigner(), hooks=hooks)
+
+    DfnsClient(config).wallets.transfer_asset("wa-1", {"kind": "Native", "amount": "1"})
+
+    assert [(name, event.path, event.phase) for name, event in events] == [
+        ("before_request", "/auth/action/init", "challenge"),
+        ("after_response", "/auth/action/init", "challenge"),
+        ("before_request", "/auth/action", "signature"),
+        ("after_response", "/auth/action", "signature"),
+        ("before_request", "/wallets/{walletId}/transfers", "request"),
+        ("after_response", "/wallets/{walletId}/transfers", "request"),
+    ]
+    request = events[-1][1]
+    assert request.operation == "wallets.transfer_asset"
+    assert (request.method, request.status_code, request.user_action) == ("POST", 200, True)
+    assert request.request_bytes == len(b'{"kind":"Native","amount":"1"}')
+    assert request.response_bytes == len(b'{"id":"xfr-1"}')
+    assert request.duration is not None
+
+
+@respx.mock
+def test_errors_and_retries_are_reported(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("dfns_sdk._internal.http_client.time.sleep", lambda delay: None)
+    respx.get(f"{BASE_URL}/wallets/wa-1").mock(
+        side_effect=[httpx.ConnectError("refused"), httpx.Response(503), httpx.Response(200, json={"id": "wa-1"})]
+    )
+    hooks, events = _recording_hooks()
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, retry=RetryPolicy(), hooks=hooks)
+
+    DfnsClient(config).wallets.get_wallet("wa-1")
+
+    names = [name for name, _ in events]
+    assert names == [
+        "before_request",
+        "on_error",
+        "on_retry",
+        "before_request",
+        "after_response",
+        "on_error",
+        "on_retry",
+        "before_request",
+        "after_response",
+    ]
+    assert isinstance(events[1][1].error, httpx.ConnectError)
+    assert events[5][1].status_code == 503
+    assert events[6][1].retry_delay is not None
+    assert [event.attempt for name, event in events if name == "before_request"] == [1, 2, 3]
+    assert events[-1][1].user_action is False
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_client_reports_exchanges() -> None:
+    respx.get(f"{BASE_URL}/wallets/wa-1").mock(return_value=httpx.Response(200, json={"id": "wa-1"}))
+    hooks, events = _recording_hooks()
+
+    async with AsyncDfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL, hooks=hooks)) as client:
+        await client.wallets.get_wallet("wa-1")
+
+    assert [(name, event.path) for name, event in events] == [
+        ("before_request", "/wallets/{walletId}"),
+        ("after_response", "/wallets/{walletId}"),
+    ]
+
+
+@respx.mock
+def test_delegated_complete_is_a_user_action() -> None:
+    _mock_user_action()
+    respx.put(f"{BASE_URL}/wallets/wa-9/tags").mock(return_value=httpx.Response(200, json={}))
+    hooks, events = _recording_hooks()
+    client = DfnsDelegatedClient(DfnsDelegatedClientConfig(auth_token="t", base_url=BASE_URL, hooks=hooks))
+
+    client.wallets.tag_wallet_complete("wa-9", {"tags": []}, {"challengeIdentifier": "ch-1"})
+
+    request = events[-1][1]
+    assert (request.path, request.operation, request.user_action) == (
+        "/wallets/{walletId}/tags",
+        "wallets.tag_wallet",
+        True,
+    )
+
+
+def test_register_rejects_unknown_events() -> None:
+    with pytest.raises(ValueError):
+        RequestHooks().register("on_success", lambda event: None)
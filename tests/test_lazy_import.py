@@ -0,0 +1,57 @@
+"""Tests that domain modules are only imported when first used."""
+
+import subprocess
+import sys
+import textwrap
+
+from dfns_sdk import DfnsClient, DfnsClientConfig
+
+
+def _run(code: str) -> str:
+    """Run code in a fresh interpreter, so sys.modules reflects only what it imported."""
+    result = subprocess.run([sys.executable, "-c", textwrap.dedent(code)], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_package_import_does_not_load_domains_or_transport() -> None:
+    out = _run(
+        """
+        import sys
+        import dfns_sdk
+        print(sorted(m for m in ("dfns_sdk.generated", "httpx", "cryptography") if m in sys.modules))
+        """
+    )
+
+    assert out == "[]"
+
+
+def test_domain_module_is_imported_on_first_access() -> None:
+    out = _run(
+        """
+        import sys
+        from dfns_sdk import DfnsClient, DfnsClientConfig
+        client = DfnsClient(DfnsClientConfig(auth_token="t"))
+        def domains():
+            return sorted({m.split(".")[2] for m in sys.modules if m.startswith("dfns_sdk.generated.")})
+        before = domains()
+        client.wallets
+        print(before, domains())
+        """
+    )
+
+    assert out == "[] ['wallets']"
+
+
+def test_sub_client_is_built_once() -> None:
+    client = DfnsClient(DfnsClientConfig(auth_token="t"))
+
+    assert client.wallets is client.wallets
+    assert client.wallets._http is client._http
+
+
+def test_lazy_exports_resolve() -> None:
+    import dfns_sdk.generated.wallets as wallets
+
+    assert wallets.WalletsClient.__name__ == "WalletsClient"
+    assert hasattr(wallets.types, "ListWalletsResponse")
+    assert "AsyncDfnsClient" in dir(__import__("dfns_sdk"))
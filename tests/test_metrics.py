@@ -0,0 +1,75 @@
+"""Tests for the request metrics collector."""
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import DfnsClient, DfnsError, MetricsCollector, RequestEvent, RequestHooks
+from dfns_sdk.types import DfnsClientConfig, RetryPolicy
+
+BASE_URL = "https://api.test.dfns"
+
+
+def _client(metrics: MetricsCollector, retry: RetryPolicy | None = None) -> DfnsClient:
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, retry=retry)
+    metrics.install(config.hooks)
+    return DfnsClient(config)
+
+
+@respx.mock
+def test_counts_requests_errors_retries_and_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("dfns_sdk._internal.http_client.time.sleep", lambda delay: None)
+    respx.get(f"{BASE_URL}/wallets/wa-1").mock(
+        side_effect=[httpx.ConnectError("refused"), httpx.Response(503), httpx.Response(200, json={"id": "wa-1"})]
+    )
+    respx.get(f"{BASE_URL}/wallets/wa-2").mock(return_value=httpx.Response(404, json={"message": "no"}))
+    metrics = MetricsCollector()
+    client = _client(metrics, RetryPolicy())
+
+    client.wallets.get_wallet("wa-1")
+    with pytest.raises(DfnsError):
+        client.wallets.get_wallet("wa-2")
+
+    stats = metrics.snapshot()["wallets.get_wallet"]["request"]
+    assert stats["requests"] == {"2xx": 1, "4xx": 1, "5xx": 1, "error": 1}
+    assert (stats["errors"], stats["retries"], stats["count"]) == (3, 2, 4)
+    assert stats["response_bytes"] == len(b'{"id":"wa-1"}') + len(b'{"message":"no"}')
+
+
+@respx.mock
+def test_prometheus_exposition() -> None:
+    respx.get(f"{BASE_URL}/wallets/wa-1").mock(return_value=httpx.Response(200, json={}))
+    metrics = MetricsCollector(buckets=(0.5, 60.0))
+    _client(metrics).wallets.get_wallet("wa-1")
+
+    text = metrics.prometheus()
+
+    labels = 'operation="wallets.get_wallet",phase="request"'
+    assert "# TYPE dfns_sdk_request_duration_seconds histogram\n" in text
+    assert f'dfns_sdk_request_duration_seconds_bucket{{{labels},le="60.0"}} 1\n' in text
+    assert f'dfns_sdk_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1\n' in text
+    assert f"dfns_sdk_request_duration_seconds_count{{{labels}}} 1\n" in text
+    assert f'dfns_sdk_requests_total{{{labels},status_class="2xx"}} 1\n' in text
+    assert f"dfns_sdk_response_bytes_total{{{labels}}} 2\n" in text
+
+
+def test_percentiles_are_interpolated_within_buckets() -> None:
+    hooks = RequestHooks()
+    metrics = MetricsCollector(buckets=(0.1, 0.2, 0.4), percentiles=(50, 99))
+    metrics.install(hooks)
+    for duration in (0.05,) * 50 + (0.3,) * 50:
+        event = RequestEvent("op", "GET", "/x", "request", 1, False, 0, status_code=200, duration=duration)
+        for callback in hooks.after_response:
+            callback(event)
+
+    stats = metrics.snapshot()["op"]["request"]
+
+    assert stats["p50"] == pytest.approx(0.1)
+    assert stats["p99"] == pytest.approx(0.396)
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_rejects_unordered_buckets() -> None:
+    with pytest.raises(ValueError):
+        MetricsCollector(buckets=(1.0, 0.5))
@@ -0,0 +1,84 @@
+"""Tests for the iter_*/aiter_* pagination helpers on list endpoints."""
+
+import contextvars
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import AsyncDfnsClient, DfnsClient
+from dfns_sdk._internal.pagination import iter_items
+from dfns_sdk.types import DfnsClientConfig
+
+BASE_URL = "https://api.test.dfns"
+
+PAGES = {
+    None: {"items": [{"id": "wa-1"}, {"id": "wa-2"}], "nextPageToken": "p2"},
+    "p2": {"items": [{"id": "wa-3"}], "nextPageToken": "p3"},
+    "p3": {"items": [{"id": "wa-4"}]},
+}
+
+
+def _serve_pages(request: httpx.Request) -> httpx.Response:
+    assert request.url.params["limit"] == "2"
+    return httpx.Response(200, json=PAGES[request.url.params.get("paginationToken")])
+
+
+@respx.mock
+def test_iter_wallets_walks_every_page() -> None:
+    route = respx.get(f"{BASE_URL}/wallets").mock(side_effect=_serve_pages)
+
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL))
+    ids = [wallet["id"] for wallet in client.wallets.iter_wallets(page_size=2)]
+
+    assert ids == ["wa-1", "wa-2", "wa-3", "wa-4"]
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_iter_passes_path_params_and_query() -> None:
+    route = respx.get(f"{BASE_URL}/webhooks/wh-1/events").mock(
+        return_value=httpx.Response(200, json={"items": [{"id": "ev-1"}]})
+    )
+
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL))
+    events = list(client.webhooks.iter_webhook_events("wh-1", {"kind": "wallet.created"}))
+
+    assert events == [{"id": "ev-1"}]
+    assert route.calls.last.request.url.params["kind"] == "wallet.created"
+
+
+def test_iter_fetches_pages_in_the_callers_context() -> None:
+    trace_id: contextvars.ContextVar[str | None] = contextvars.ContextVar("trace_id", default=None)
+    seen = []
+
+    def fetch(query):  # type: ignore[no-untyped-def]
+        seen.append(trace_id.get())
+        return PAGES[query.get("paginationToken")]
+
+    trace_id.set("trace-1")
+    assert len(list(iter_items(fetch))) == 4
+    assert seen == ["trace-1", "trace-1", "trace-1"]
+
+
+def test_iter_sends_the_starting_cursor_in_camel_case() -> None:
+    queries = []
+
+    def fetch(query):  # type: ignore[no-untyped-def]
+        queries.append(query)
+        return PAGES[query.get("paginationToken")]
+
+    assert [item["id"] for item in iter_items(fetch, {"pagination_token": "p2"})] == ["wa-3", "wa-4"]
+    assert queries == [{"paginationToken": "p2"}, {"paginationToken": "p3"}]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_aiter_wallets_walks_every_page() -> None:
+    route = respx.get(f"{BASE_URL}/wallets").mock(side_effect=_serve_pages)
+
+    async with AsyncDfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL)) as client:
+        ids = [wallet["id"] async for wallet in client.wallets.aiter_wallets(page_size=2)]
+
+    assert ids == ["wa-1", "wa-2", "wa-3", "wa-4"]
+    assert route.call_count == 3
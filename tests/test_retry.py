@@ -0,0 +1,95 @@
+"""Tests for the transport retry policy."""
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import DfnsClient, DfnsError
+from dfns_sdk._internal.retry import parse_retry_after
+from dfns_sdk.types import DfnsClientConfig, RetryPolicy
+
+BASE_URL = "https://api.test.dfns"
+
+
+class _FakeSigner:
+    """Duck-typed Signer for the user-action flow."""
+
+    def sign(self, challenge):  # type: ignore[no-untyped-def]
+        return {"kind": "Key", "credentialAssertion": {"credId": "cr-1", "clientData": "x", "signature": "y"}}
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    recorded: list[float] = []
+    monkeypatch.setattr("dfns_sdk._internal.http_client.time.sleep", recorded.append)
+    return recorded
+
+
+def make_client(**kwargs) -> DfnsClient:  # type: ignore[no-untyped-def]
+    return DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL, retry=RetryPolicy(), **kwargs))
+
+
+@respx.mock
+def test_get_is_retried_and_honors_retry_after(sleeps: list[float]) -> None:
+    route = respx.get(f"{BASE_URL}/wallets").mock(
+        side_effect=[
+            httpx.Response(503, headers={"Retry-After": "2"}, json={"message": "busy"}),
+            httpx.Response(200, json={"items": []}),
+        ]
+    )
+
+    assert make_client().wallets.list_wallets() == {"items": []}
+    assert route.call_count == 2
+    assert sleeps == [2.0]
+
+
+@respx.mock
+def test_retries_stop_after_max_attempts(sleeps: list[float]) -> None:
+    route = respx.get(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(502, json={"message": "bad gateway"}))
+
+    with pytest.raises(DfnsError) as excinfo:
+        make_client().wallets.list_wallets()
+
+    assert excinfo.value.status_code == 502
+    assert route.call_count == 3
+    assert len(sleeps) == 2
+
+
+@respx.mock
+def test_signed_request_restarts_from_fresh_challenge_on_429(sleeps: list[float]) -> None:
+    init = respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua"}))
+    wallet_route = respx.post(f"{BASE_URL}/wallets").mock(
+        side_effect=[httpx.Response(429, json={"message": "slow down"}), httpx.Response(200, json={"id": "wa-1"})]
+    )
+
+    wallet = make_client(signer=_FakeSigner()).wallets.create_wallet({"network": "EthereumSepolia"})
+
+    assert wallet["id"] == "wa-1"
+    assert wallet_route.call_count == 2
+    assert init.call_count == 2
+
+
+@respx.mock
+def test_signed_request_is_not_retried_on_server_error(sleeps: list[float]) -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua"}))
+    wallet_route = respx.post(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(500, json={"message": "boom"}))
+
+    with pytest.raises(DfnsError):
+        make_client(signer=_FakeSigner()).wallets.create_wallet({"network": "EthereumSepolia"})
+
+    # The mutation may have been applied: it must not be sent twice.
+    assert wallet_route.call_count == 1
+    assert sleeps == []
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
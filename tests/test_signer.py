@@ -1,11 +1,13 @@
-"""Tests for the KeySigner (user-action challenge signing with a private key)."""
+"""Tests for KeySigner and PooledKeySigner (user-action challenge signing with a private key)."""
 
+import asyncio
 import json
 
+import pytest
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec, ed25519
 
-from dfns_sdk.auth import KeySigner, base64url_decode
+from dfns_sdk.auth import KeySigner, PooledKeySigner, base64url_decode
 
 CHALLENGE = {
     "challenge": "dGVzdC1jaGFsbGVuZ2U",
@@ -76,3 +78,20 @@ def test_app_origin_flows_into_client_data() -> None:
     ca = signer.sign(CHALLENGE)["credentialAssertion"]
     client_data = json.loads(base64url_decode(ca["clientData"]))
     assert client_data["origin"] == "https://custom.example"
+
+
+def test_pooled_signer_signs_on_workers() -> None:
+    key = ed25519.Ed25519PrivateKey.generate()
+
+    with PooledKeySigner(credential_id="cr-pool", private_key=_pem(key), max_workers=2) as signer:
+        assertions = [signer.sign(CHALLENGE), asyncio.run(signer.asign(CHALLENGE))]
+
+    for assertion in assertions:
+        ca = assertion["credentialAssertion"]
+        assert ca["credId"] == "cr-pool"
+        key.public_key().verify(base64url_decode(ca["signature"]), base64url_decode(ca["clientData"]))
+
+
+def test_pooled_signer_rejects_invalid_key() -> None:
+    with pytest.raises(ValueError):
+        PooledKeySigner(credential_id="cr-pool", private_key="not a pem")
@@ -0,0 +1,96 @@
+"""Tests for the local Dfns API simulator."""
+
+import pytest
+
+from dfns_sdk import AsyncDfnsClient, ConnectionConfig, DfnsClient, DfnsError
+from dfns_sdk.simulator import DfnsSimulator, constant_latency
+from dfns_sdk.types import DfnsClientConfig, RetryPolicy
+
+
+class _FakeSigner:
+    """Duck-typed Signer for the user-action flow."""
+
+    def sign(self, challenge):  # type: ignore[no-untyped-def]
+        return {"kind": "Key", "credentialAssertion": {"credId": "cr-1", "clientData": "x", "signature": "y"}}
+
+
+def _config(
+    simulator: DfnsSimulator, retry: RetryPolicy | None = None, base_url: str = "https://api.dfns.io"
+) -> DfnsClientConfig:
+    return DfnsClientConfig(
+        auth_token="t",
+        base_url=base_url,
+        signer=_FakeSigner(),
+        retry=retry,
+        connection=ConnectionConfig(transport=simulator),
+    )
+
+
+def test_signed_flows_and_lookups() -> None:
+    simulator = DfnsSimulator(wallets=0)
+    client = DfnsClient(_config(simulator))
+
+    wallet = client.wallets.create_wallet({"network": "EthereumSepolia"})
+    transfer = client.wallets.transfer_asset(wallet["id"], {"kind": "Native", "to": "0x01", "amount": "1"})
+    signature = client.keys.generate_signature(wallet["signingKey"]["id"], {"kind": "Hash", "hash": "0x00"})
+
+    assert client.wallets.get_transfer(wallet["id"], transfer["id"])["status"] == "Pending"
+    assert client.keys.get_signature(signature["keyId"], signature["id"])["status"] == "Signed"
+    assert simulator.calls["POST /auth/action/init"] == 3
+    with pytest.raises(DfnsError) as error:
+        client.wallets.get_wallet("wa-unknown")
+    assert error.value.status_code == 404
+
+
+def test_base_url_with_a_path_prefix() -> None:
+    simulator = DfnsSimulator(wallets=0)
+    client = DfnsClient(_config(simulator, base_url="https://proxy.example.com/dfns/v1"))
+
+    wallet = client.wallets.create_wallet({"network": "EthereumSepolia"})
+
+    assert client.wallets.get_wallet(wallet["id"])["id"] == wallet["id"]
+    assert simulator.calls["POST /wallets"] == 1
+
+
+def test_user_action_tokens_are_single_use() -> None:
+    client = DfnsClient(_config(DfnsSimulator(wallets=0)))
+    http = client._http
+    token = http._get_user_action_token("POST", "/webhooks", '{"url":"https://x","events":["*"]}')
+    body = {"url": "https://x", "events": ["*"]}
+
+    http.request_with_user_action("POST", "/webhooks", body=body, user_action=token)
+    with pytest.raises(DfnsError) as error:
+        http.request_with_user_action("POST", "/webhooks", body=body, user_action=token)
+
+    assert error.value.status_code == 401
+
+
+def test_listing_pages_are_deterministic() -> None:
+    first = [w["id"] for w in DfnsClient(_config(DfnsSimulator(seed=7, wallets=250))).wallets.iter_wallets()]
+    second = [w["id"] for w in DfnsClient(_config(DfnsSimulator(seed=7, wallets=250))).wallets.iter_wallets()]
+
+    assert len(first) == 250
+    assert first == second
+
+
+def test_injected_faults_are_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("dfns_sdk._internal.http_client.time.sleep", lambda delay: None)
+    simulator = DfnsSimulator(wallets=1, rate_limit_rate=0.3, server_error_rate=0.2)
+    client = DfnsClient(_config(simulator, RetryPolicy(max_attempts=10)))
+
+    for _ in range(20):
+        client.wallets.list_wallets()
+
+    assert simulator.calls["GET /wallets"] > 20
+
+
+@pytest.mark.asyncio
+async def test_async_client_with_latency() -> None:
+    simulator = DfnsSimulator(wallets=3, latency=constant_latency(0.001))
+
+    async with AsyncDfnsClient(_config(simulator)) as client:
+        wallets = [wallet async for wallet in client.wallets.aiter_wallets(page_size=2)]
+        webhook = await client.webhooks.create_webhook({"url": "https://example.com", "events": ["*"]})
+
+    assert len(wallets) == 3
+    assert webhook["id"].startswith("wh-")
@@ -0,0 +1,104 @@
+"""Tests for incremental decoding of large list/history responses."""
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import AsyncDfnsClient, DfnsClient, DfnsError
+from dfns_sdk._internal.streaming import JsonItemStream
+from dfns_sdk.types import DfnsClientConfig
+
+BASE_URL = "https://api.test.dfns"
+
+
+def test_item_stream_decodes_across_arbitrary_chunks() -> None:
+    body = json.dumps(
+        {"items": [{"id": f"ev-{i}", "kind": "Transfer", "amount": 1.5 * i} for i in range(20)], "nextPageToken": "p2"}
+    )
+    stream = JsonItemStream(fields=["id", "amount"])
+
+    items = []
+    for start in range(0, len(body), 3):
+        items += stream.feed(body[start : start + 3])
+    items += stream.close()
+
+    assert items == [{"id": f"ev-{i}", "amount": 1.5 * i} for i in range(20)]
+    assert stream.metadata == {"nextPageToken": "p2"}
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "items", "metadata"),
+    [
+        ('{"items":[1.', "5]}", [1.5], {}),
+        ('{"items":[1e', "3]}", [1000.0], {}),
+        ('{"items":[-', "2E-1]}", [-0.2], {}),
+        ('{"x":12.', '5,"items":[]}', [], {"x": 12.5}),
+    ],
+)
+def test_item_stream_waits_for_numbers_split_across_chunks(
+    first: str, second: str, items: list[float], metadata: dict[str, float]
+) -> None:
+    stream = JsonItemStream()
+
+    assert stream.feed(first) + stream.feed(second) + stream.close() == items
+    assert stream.metadata == metadata
+
+
+def test_item_stream_decodes_at_every_chunk_boundary() -> None:
+    body = '{"total":-12.5e+3,"items":[0,1.25,-3e-2,{"n":4E2},true],"nextPageToken":"p2"}'
+
+    for split in range(1, len(body)):
+        stream = JsonItemStream()
+        items = stream.feed(body[:split]) + stream.feed(body[split:]) + stream.close()
+        assert items == [0, 1.25, -3e-2, {"n": 400.0}, True], split
+        assert stream.metadata == {"total": -12500.0, "nextPageToken": "p2"}
+
+
+def test_item_stream_rejects_truncated_body() -> None:
+    stream = JsonItemStream()
+    stream.feed('{"items": [{"id": 1}')
+
+    with pytest.raises(json.JSONDecodeError):
+        stream.close()
+
+
+@respx.mock
+def test_stream_wallet_history_walks_pages_with_projection() -> None:
+    pages = {
+        None: {"walletId": "wa-1", "items": [{"id": "ev-1", "kind": "A"}], "nextPageToken": "p2"},
+        "p2": {"walletId": "wa-1", "items": [{"id": "ev-2", "kind": "B"}]},
+    }
+    respx.get(f"{BASE_URL}/wallets/wa-1/history").mock(
+        side_effect=lambda request: httpx.Response(200, json=pages[request.url.params.get("paginationToken")])
+    )
+
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL))
+    events = list(client.wallets.stream_wallet_history("wa-1", fields=["id"]))
+
+    assert events == [{"id": "ev-1"}, {"id": "ev-2"}]
+
+
+@respx.mock
+def test_stream_surfaces_api_errors() -> None:
+    respx.get(f"{BASE_URL}/wallets/wa-1/nfts").mock(return_value=httpx.Response(404, json={"message": "not found"}))
+
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL))
+    with pytest.raises(DfnsError) as excinfo:
+        list(client.wallets.stream_wallet_nfts("wa-1"))
+
+    assert excinfo.value.status_code == 404
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_astream_wallet_nfts() -> None:
+    respx.get(f"{BASE_URL}/wallets/wa-1/nfts").mock(
+        return_value=httpx.Response(200, json={"walletId": "wa-1", "nfts": [{"tokenId": "1"}, {"tokenId": "2"}]})
+    )
+
+    async with AsyncDfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL)) as client:
+        nfts = [nft async for nft in client.wallets.astream_wallet_nfts("wa-1")]
+
+    assert nfts == [{"tokenId": "1"}, {"tokenId": "2"}]
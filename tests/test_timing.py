@@ -0,0 +1,126 @@
+"""Tests for per-phase timing of requests and user action signing."""
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import AsyncDfnsClient, DfnsClient, DfnsDelegatedClient, DfnsError, LatencyRecorder, PhaseTiming
+from dfns_sdk.types import DfnsClientConfig, DfnsDelegatedClientConfig
+
+BASE_URL = "https://api.test.dfns"
+
+
+class _FakeSigner:
+    """Duck-typed Signer for the user-action flow."""
+
+    def sign(self, challenge):  # type: ignore[no-untyped-def]
+        return {"kind": "Key", "credentialAssertion": {"credId": "cr-1", "clientData": "x", "signature": "y"}}
+
+
+def _mock_user_action() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+
+
+@respx.mock
+def test_signed_call_reports_every_phase() -> None:
+    _mock_user_action()
+    respx.post(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"id": "wa-1"}))
+    timings: list[PhaseTiming] = []
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakeSigner(), on_phase=timings.append)
+
+    DfnsClient(config).wallets.create_wallet({"network": "EthereumSepolia"})
+
+    assert [(t.operation, t.phase, t.status) for t in timings] == [
+        ("wallets.create_wallet", "challenge", "ok"),
+        ("wallets.create_wallet", "sign", "ok"),
+        ("wallets.create_wallet", "signature", "ok"),
+        ("wallets.create_wallet", "request", "ok"),
+    ]
+    assert timings[1].cpu_time is not None
+    assert timings[3].status_code == 200
+
+
+class _FakePooledSigner(_FakeSigner):
+    """Duck-typed signer that, like PooledKeySigner, also signs asynchronously."""
+
+    async def asign(self, challenge):  # type: ignore[no-untyped-def]
+        return self.sign(challenge)
+
+
+@respx.mock
+def test_out_of_thread_signers_report_no_cpu_time() -> None:
+    _mock_user_action()
+    respx.post(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"id": "wa-1"}))
+    timings: list[PhaseTiming] = []
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakePooledSigner(), on_phase=timings.append)
+
+    DfnsClient(config).wallets.create_wallet({"network": "EthereumSepolia"})
+
+    sign = next(t for t in timings if t.phase == "sign")
+    assert sign.cpu_time is None
+
+
+@respx.mock
+def test_http_errors_are_reported_as_failed_phases() -> None:
+    respx.get(f"{BASE_URL}/wallets/wa-1").mock(return_value=httpx.Response(404, json={"message": "not found"}))
+    recorder = LatencyRecorder()
+    client = DfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL, on_phase=recorder))
+
+    with pytest.raises(DfnsError):
+        client.wallets.get_wallet("wa-1")
+
+    stats = recorder.snapshot()["wallets.get_wallet"]["request"]
+    assert (stats["count"], stats["errors"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_sign_phase_measures_executor_cpu_time() -> None:
+    _mock_user_action()
+    respx.post(f"{BASE_URL}/wallets").mock(return_value=httpx.Response(200, json={"id": "wa-1"}))
+    timings: list[PhaseTiming] = []
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakeSigner(), on_phase=timings.append)
+
+    async with AsyncDfnsClient(config) as client:
+        await client.wallets.create_wallet({"network": "EthereumSepolia"})
+
+    sign = next(t for t in timings if t.phase == "sign")
+    assert sign.operation == "wallets.create_wallet"
+    assert sign.cpu_time is not None
+
+
+@respx.mock
+def test_delegated_phases_carry_the_action_operation() -> None:
+    _mock_user_action()
+    respx.put(f"{BASE_URL}/wallets/wa-9/tags").mock(return_value=httpx.Response(200, json={}))
+    timings: list[PhaseTiming] = []
+    config = DfnsDelegatedClientConfig(auth_token="t", base_url=BASE_URL, on_phase=timings.append)
+    client = DfnsDelegatedClient(config)
+
+    prepared = client.wallets.tag_wallet_init("wa-9", {"tags": []})
+    client.wallets.tag_wallet_complete("wa-9", {"tags": []}, {"challengeIdentifier": "ch-1"}, prepared=prepared)
+
+    assert [(t.operation, t.phase) for t in timings] == [
+        ("wallets.tag_wallet", "challenge"),
+        ("wallets.tag_wallet", "signature"),
+        ("wallets.tag_wallet", "request"),
+    ]
+
+
+def test_latency_recorder_percentiles() -> None:
+    recorder = LatencyRecorder(window=100, percentiles=(50, 99))
+    for millis in range(1, 101):
+        recorder(PhaseTiming("op", "sign", "ok", millis / 1000, cpu_time=millis / 2000))
+
+    stats = recorder.snapshot()["op"]["sign"]
+
+    assert stats["count"] == 100
+    assert stats["p50"] == pytest.approx(0.050)
+    assert stats["p99"] == pytest.approx(0.099)
+    assert stats["max"] == pytest.approx(0.100)
+    assert stats["cpu_p50"] == pytest.approx(0.025)
+    recorder.reset()
+    assert recorder.snapshot() == {}
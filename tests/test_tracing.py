@@ -0,0 +1,163 @@
+"""Tests for tracing of operations and HTTP exchanges."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from dfns_sdk import AsyncDfnsClient, DfnsClient, DfnsDelegatedClient, DfnsError
+from dfns_sdk.types import DfnsClientConfig, DfnsDelegatedClientConfig
+
+BASE_URL = "https://api.test.dfns"
+
+
+class _FakeSigner:
+    """Duck-typed Signer for the user-action flow."""
+
+    def sign(self, challenge):  # type: ignore[no-untyped-def]
+        return {"kind": "Key", "credentialAssertion": {"credId": "cr-1", "clientData": "x", "signature": "y"}}
+
+
+class _RecordingSpan:
+    def __init__(self, spans: list[tuple[str, ...]], index: int):
+        self._spans = spans
+        self._index = index
+
+    def response(self, response: httpx.Response) -> None:
+        self._spans[self._index] += (str(response.status_code),)
+
+
+class _RecordingTracing:
+    """Tracing backend recording spans as (depth, name, ...) tuples, in start order."""
+
+    def __init__(self) -> None:
+        self.spans: list[tuple[str, ...]] = []
+        self._depth = 0
+
+    @contextmanager
+    def _span(self, *fields: str) -> Iterator[int]:
+        self.spans.append((str(self._depth), *fields))
+        self._depth += 1
+        try:
+            yield len(self.spans) - 1
+        finally:
+            self._depth -= 1
+
+    @contextmanager
+    def operation(self, operation: str, method: str, path: str) -> Iterator[None]:
+        with self._span(operation, method, path):
+            yield
+
+    @contextmanager
+    def exchange(
+        self, request: httpx.Request, operation: str, path: str, phase: str, attempt: int
+    ) -> Iterator[_RecordingSpan]:
+        request.headers["traceparent"] = "00-trace-span-01"
+        with self._span(f"{request.method} {path}", phase) as index:
+            yield _RecordingSpan(self.spans, index)
+
+    @contextmanager
+    def sign(self, operation: str) -> Iterator[None]:
+        with self._span("dfns.sign"):
+            yield
+
+
+def _mock_user_action() -> None:
+    respx.post(f"{BASE_URL}/auth/action/init").mock(
+        return_value=httpx.Response(200, json={"challengeIdentifier": "ch-1", "challenge": "Y2g"})
+    )
+    respx.post(f"{BASE_URL}/auth/action").mock(return_value=httpx.Response(200, json={"userAction": "ua-token"}))
+
+
+@respx.mock
+def test_signed_call_spans_nest_under_the_operation() -> None:
+    _mock_user_action()
+    route = respx.post(f"{BASE_URL}/wallets/wa-1/transfers").mock(return_value=httpx.Response(200, json={}))
+    tracing = _RecordingTracing()
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakeSigner(), tracing=tracing)
+
+    DfnsClient(config).wallets.transfer_asset("wa-1", {"kind": "Native", "amount": "1"})
+
+    assert tracing.spans == [
+        ("0", "wallets.transfer_asset", "POST", "/wallets/{walletId}/transfers"),
+        ("1", "POST /auth/action/init", "challenge", "200"),
+        ("1", "dfns.sign"),
+        ("1", "POST /auth/action", "signature", "200"),
+        ("1", "POST /wallets/{walletId}/transfers", "request", "200"),
+    ]
+    assert route.calls.last.request.headers["traceparent"] == "00-trace-span-01"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_client_traces_operations() -> None:
+    respx.get(f"{BASE_URL}/wallets/wa-1").mock(return_value=httpx.Response(404, json={"message": "no"}))
+    tracing = _RecordingTracing()
+
+    async with AsyncDfnsClient(DfnsClientConfig(auth_token="t", base_url=BASE_URL, tracing=tracing)) as client:
+        with pytest.raises(DfnsError):
+            await client.wallets.get_wallet("wa-1")
+
+    assert tracing.spans == [
+        ("0", "wallets.get_wallet", "GET", "/wallets/{walletId}"),
+        ("1", "GET /wallets/{walletId}", "request", "404"),
+    ]
+
+
+@respx.mock
+def test_delegated_complete_is_traced_as_its_operation() -> None:
+    _mock_user_action()
+    respx.put(f"{BASE_URL}/wallets/wa-9/tags").mock(return_value=httpx.Response(200, json={}))
+    tracing = _RecordingTracing()
+    client = DfnsDelegatedClient(DfnsDelegatedClientConfig(auth_token="t", base_url=BASE_URL, tracing=tracing))
+
+    client.wallets.tag_wallet_init("wa-9", {"tags": []})
+    client.wallets.tag_wallet_complete("wa-9", {"tags": []}, {"challengeIdentifier": "ch-1"})
+
+    # The challenge and signature requests are exchanges only; the operation span is the request's.
+    assert tracing.spans == [
+        ("0", "POST /auth/action/init", "challenge", "200"),
+        ("0", "POST /auth/action", "signature", "200"),
+        ("0", "wallets.tag_wallet", "PUT", "/wallets/{walletId}/tags"),
+        ("1", "PUT /wallets/{walletId}/tags", "request", "200"),
+    ]
+
+
+@respx.mock
+def test_opentelemetry_spans_and_propagation() -> None:
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from dfns_sdk.tracing import OpenTelemetryTracing
+
+    _mock_user_action()
+    route = respx.post(f"{BASE_URL}/wallets/wa-1/transfers").mock(return_value=httpx.Response(200, json={}))
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracing = OpenTelemetryTracing(tracer_provider=provider)
+    config = DfnsClientConfig(auth_token="t", base_url=BASE_URL, signer=_FakeSigner(), tracing=tracing)
+
+    DfnsClient(config).wallets.transfer_asset("wa-1", {"kind": "Native", "amount": "1"})
+
+    spans: dict[str, Any] = {span.name: span for span in exporter.get_finished_spans()}
+    assert set(spans) == {
+        "wallets.transfer_asset",
+        "POST /auth/action/init",
+        "dfns.sign",
+        "POST /auth/action",
+        "POST /wallets/{walletId}/transfers",
+    }
+    root = spans["wallets.transfer_asset"]
+    for name in ("POST /auth/action/init", "dfns.sign", "POST /auth/action", "POST /wallets/{walletId}/transfers"):
+        assert spans[name].parent.span_id == root.context.span_id
+    request = spans["POST /wallets/{walletId}/transfers"]
+    assert request.attributes["url.template"] == "/wallets/{walletId}/transfers"
+    assert request.attributes["http.response.status_code"] == 200
+    traceparent = route.calls.last.request.headers["traceparent"]
+    assert traceparent.startswith(f"00-{request.context.trace_id:032x}-{request.context.span_id:016x}-")